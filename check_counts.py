@@ -1,10 +1,11 @@
 import json
 import os
 
+from scripts.explain_verbs.vocabulary_db import VIEWS, connect, count
+
 files = [
     'netem_full_list.json',
     'scripts/explain_verbs/static/netem_full_list.json',
-    'netem_verbs.json'
 ]
 
 for file_path in files:
@@ -22,3 +23,10 @@ for file_path in files:
             print(f"Error reading {file_path}: {e}")
     else:
         print(f"File not found: {file_path}")
+
+# Derived sets (e.g. the verbs list) are views of vocabulary.db
+with connect() as conn:
+    print(f"Database: vocabulary.db")
+    print(f"  Table: words, Count: {count('words', conn)}")
+    for view in VIEWS:
+        print(f"  View: {view}, Count: {count(view, conn)}")
@@ -1,27 +1,15 @@
-import json
-
-JSON_PATH = 'scripts/explain_verbs/static/netem_full_list.json'
+from scripts.explain_verbs.vocabulary_db import connect
 
 def check_duplicates():
     try:
-        with open(JSON_PATH, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        key = "5530考研词汇词频排序表"
-        items = data.get(key, [])
-        
-        print(f"Total items: {len(items)}")
-        
-        seen = set()
-        duplicates = []
-        
-        for item in items:
-            word = item.get("单词", "").strip().lower()
-            if word in seen:
-                duplicates.append(word)
-            seen.add(word)
-            
-        print(f"Unique words (lowercase): {len(seen)}")
+        with connect() as conn:
+            total = conn.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+            unique = conn.execute("SELECT COUNT(DISTINCT word_lower) FROM words").fetchone()[0]
+            duplicates = [row[0] for row in conn.execute(
+                "SELECT word_lower FROM words GROUP BY word_lower HAVING COUNT(*) > 1 ORDER BY MIN(rank)")]
+
+        print(f"Total items: {total}")
+        print(f"Unique words (lowercase): {unique}")
         print(f"Duplicates found: {len(duplicates)}")
         if duplicates:
             print("Duplicate words:", duplicates)
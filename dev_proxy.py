@@ -1,12 +1,13 @@
 
 from fastapi import FastAPI, Request, HTTPException, Response
-from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse, JSONResponse, RedirectResponse
 from fastapi.middleware.cors import CORSMiddleware
 import httpx
 import os
 from dotenv import load_dotenv
 
+from scripts.explain_verbs.precompressed_static import PrecompressedStaticFiles
+
 load_dotenv()
 
 app = FastAPI()
@@ -77,15 +78,17 @@ async def get_verb_image(verb: str):
 async def vite_client_silencer():
     return Response(content="console.log('Vite client silencer')", media_type="application/javascript")
 
-# Serve static files from dist
+# Serve static files from dist (with the .br/.gz siblings written by the build scripts)
 # We mount dist to the root after the API routes
-app.mount("/static", StaticFiles(directory="dist/static"), name="static")
+app.mount("/static", PrecompressedStaticFiles(directory="dist/static"), name="static")
 
 @app.get("/{full_path:path}")
 async def serve_index(full_path: str):
     # Try to serve files from dist first
     file_path = os.path.join("dist", full_path)
     if os.path.isfile(file_path):
+        if full_path == "sw.js":
+            return FileResponse(file_path, media_type="application/javascript", headers={"Cache-Control": "no-cache"})
         return FileResponse(file_path)
     # Default to index.html for SPA-like behavior
     return FileResponse("dist/index.html")
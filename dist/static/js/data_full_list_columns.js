@@ -0,0 +1 @@
+window.NETEM_FULL_LIST_COLUMNS = {"format":"netem-columns","version":1,"list":"5530考研词汇词频排序表","count":5530,"source":"34e8d592528365f2","sequence":{"start":1},"frequency":[86015,54093,50252,44609,40452,28550,28481,15599,14916,13810,13733,12004,11942,10015,9006,8258,7050,6895,6608,6542,6455,6378,6253,6132,5932,5808,5643,5481,5362,5333,5332,5193,4929,4834,4812,4554,4126,4065,4062,3908,3882,3795,3761,3396,3372,3364,3351,3272,3190,3133,3121,3066,3043,3014,2960,2954,2924,2923,2891,2794,2791,2693,2672,2670,2572,2552,2548,2528,2496,2493,2477,2475,2454,2437,2425,2396,2394,2376,2373,2332,2321,2281,2258,2241,2205,2178,2168,2152,2149,2125,2070,2033,2016,1932,1929,1925,1918,1912,1908,1862,1845,1842,1823,1810,1778,1727,1722,1714,1669,1667,1659,1637,1617,1606,1597,1585,1575,1571,1554,1539,1538,1528,1524,1511,1511,1504,1500,1492,1479,1465,1446,1430,1424,1424,1422,1402,1345,1332,1303,1271,1267,1254,1246,1246,1245,1234,1234,1218,1217,1204,1201,1199,1197,1194,1190,1184,1177,1172,1170,1167,1166,1151,1146,1145,1138,1128,1116,1115,1103,1090,1084,1078,1077,1070,1047,1044,1044,1040,1031,1013,1011,1009,1003,994,982,982,975,968,958,943,934,928,926,919,899,898,890,885,885,883,880,878,867,866,847,846,846,841,839,833,832,830,822,820,816,813,810,806,801,800,796,794,793,790,790,789,788,786,782,782,780,780,773,773,771,769,769,768,767,765,764,761,756,754,748,746,734,732,731,728,721,715,713,707,707,706,704,700,689,688,687,686,682,682,681,677,676,673,672,671,665,662,660,659,658,657,656,655,649,648,647,644,639,637,632,627,625,623,622,621,620,619,617,615,613,611,610,610,608,607,604,604,603,601,600,598,596,594,593,589,588,587,585,582,582,581,581,581,577,575,571,570,570,567,564,560,559,556,554,553,551,550,549,547,545,542,540,536,535,530,528,528,526,524,523,521,518,518,514,511,511,510,507,505,503,502,501,500,497,496,493,492,491,491,490,490,490,489,489,488,487,485,481,481,481,479,477,476,476,474,474,473,470,469,469,467,463,462,459,459,458,457,457,454,454,454,453,450,448,445,445,445,442,441,441,441,440,440,439,438,435,434,430,429,428,426,425,424,424,422,419,419,418,417,417,417,416,414,412,412,411,411,410,410,410,404,402,402,401,400,400,400,399,397,397,396,396,395,395,395,394,393,393,392,391,391,390,389,389,388,387,387,387,386,386,385,384,384,384,383,382,382,381,381,379,379,378,374,374,374,373,373,371,371,369,366,364,363,362,362,361,360,358,358,357,356,355,355,355,355,355,353,352,352,352,350,350,349,349,348,348,348,347,347,346,345,345,345,344,343,343,342,340,340,338,338,337,334,333,333,333,333,333,332,332,331,331,331,330,329,329,329,328,328,328,327,327,326,325,325,325,323,322,320,319,319,318,317,317,316,316,315,314,314,314,314,312,312,311,311,310,310,310,310,308,308,307,307,307,306,306,305,305,305,305,304,302,302,302,299,299,299,299,298,297,297,297,296,295,294,294,293,293,293,291,290,289,289,287,287,286,286,286,285,285,284,284,284,283,283,283,283,283,281,281,280,279,279,279,278,276,276,275,275,275,275,274,274,274,274,274,273,273,272,272,272,272,271,271,271,270,270,269,268,267,267,267,266,266,265,265,265,264,264,264,264,264,263,262,261,261,261,261,260,260,259,259,259,258,258,258,258,257,257,255,255,254,254,252,252,251,251,248,248,248,247,246,246,245,245,245,244,244,244,244,244,243,243,243,243,243,242,242,241,241,241,241,240,239,238,238,238,237,237,236,236,235,235,235,235,235,233,233,232,232,231,230,230,229,229,229,228,228,228,228,228,227,226,226,226,226,226,226,225,224,224,223,223,222,221,221,221,221,221,220,220,220,220,219,219,219,219,218,218,218,217,217,217,216,216,216,216,216,215,215,215,214,214,214,214,214,214,214,213,212,212,211,211,211,211,211,211,210,210,210,210,210,209,209,209,209,209,208,208,208,207,207,207,207,207,207,206,206,206,204,204,204,204,203,202,202,202,202,201,201,201,200,199,199,198,198,198,198,197,197,197,197,196,195,195,195,195,195,194,194,193,193,192,192,191,191,191,191,190,190,190,190,189,189,189,189,188,188,188,187,187,187,187,187,186,186,186,185,185,184,184,184,184,184,184,184,184,182,182,181,181,181,180,179,179,179,178,178,178,178,177,177,177,177,177,177,177,176,176,175,175,175,174,174,174,174,174,173,173,173,173,173,173,173,173,172,172,172,172,172,171,171,170,170,170,170,169,169,169,169,168,168,168,168,168,167,167,167,167,167,166,166,166,166,166,165,165,164,163,163,163,162,162,162,162,162,162,162,162,161,161,161,161,161,161,160,160,160,159,159,159,159,159,159,158,158,157,157,157,156,156,156,156,155,155,155,155,155,155,155,155,155,154,154,154,154,154,153,153,153,153,153,153,153,152,152,152,152,152,152,151,151,150,150,150,149,149,149,149,148,148,148,148,148,147,147,147,147,147,147,147,147,147,147,147,147,146,146,146,146,146,145,145,145,145,145,144,144,144,144,144,144,144,144,144,143,143,143,143,143,142,142,142,142,141,141,141,141,141,141,141,141,140,140,139,139,139,139,139,139,139,138,138,138,137,137,137,137,137,137,137,136,136,136,136,136,136,136,136,136,136,136,135,135,135,135,135,135,135,134,134,134,134,134,134,134,133,133,133,133,133,133,133,133,132,132,132,132,132,132,132,132,132,132,132,132,131,131,131,131,131,131,131,131,131,131,130,130,130,130,130,130,130,130,130,129,129,129,129,129,129,129,129,128,128,128,128,128,128,128,128,128,128,127,127,127,127,126,126,126,126,126,126,126,126,126,125,125,125,125,125,125,125,125,125,124,124,124,124,124,123,123,123,123,123,122,122,122,122,122,122,122,122,122,122,121,121,121,121,121,121,121,121,121,120,120,120,120,119,119,119,119,119,119,119,118,118,118,118,118,118,118,118,118,118,117,117,117,117,117,117,116,116,116,116,116,116,116,115,115,115,115,115,114,114,114,114,114,114,114,113,113,113,113,113,113,113,113,113,113,113,112,112,112,112,112,111,111,111,111,110,110,110,110,110,110,110,110,110,109,109,109,109,109,109,108,108,108,108,108,108,108,108,107,107,107,106,106,106,106,106,106,106,106,106,106,106,106,106,105,105,105,105,105,105,104,104,104,104,104,104,104,104,104,104,104,104,103,103,103,103,103,103,103,103,103,103,103,103,103,103,103,102,102,102,102,102,102,102,102,102,101,101,101,101,101,101,101,101,101,101,101,101,101,101,101,100,100,100,100,100,100,100,100,99,99,99,99,99,99,99,99,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,98,97,97,97,97,97,97,97,97,97,97,97,97,97,96,96,96,96,96,96,96,96,96,96,96,96,96,96,96,95,95,95,95,95,95,95,95,95,95,94,94,94,94,94,94,94,94,94,94,94,94,94,93,93,93,93,93,93,93,93,93,93,93,93,93,92,92,92,92,92,92,92,92,92,91,91,91,91,91,91,91,91,91,90,90,90,90,90,90,90,90,90,90,90,90,90,90,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,89,88,88,88,88,88,88,88,88,88,87,87,87,87,87,87,87,87,87,87,87,86,86,86,86,86,86,86,86,86,86,85,85,85,85,85,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,83,83,83,83,83,83,83,83,83,82,82,82,82,82,82,81,81,81,81,81,81,81,81,81,81,81,81,80,80,80,80,80,80,80,80,80,80,80,80,80,80,79,79,79,79,79,79,79,79,79,79,78,78,78,78,78,78,78,78,78,78,78,78,78,77,77,77,77,77,77,77,77,77,77,77,77,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,75,75,75,75,75,75,75,75,75,75,75,75,74,74,74,74,74,74,74,74,74,74,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,71,71,71,71,71,71,71,71,71,71,71,71,71,70,70,70,70,70,70,70,70,70,70,70,70,70,70,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,67,67,67,67,67,67,67,67,67,67,67,67,67,67,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,65,65,65,65,65,65,65,65,65,65,65,65,65,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,63,63,63,63,63,63,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,43,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0],"word":["the","be","a","to","of","and","in","have","that","it","for","on","they","you","with","as","their","by","not","he","from","at","will","more","do","we","passage","this","or","can","I","one","but","question","people","what","there","well","about","answer","make","than","his","time","say","work","which","when","should","part","your","use","all","follow","she","who","each","some","other","if","year","write","new","section","its","word","mark","may","take","many","most","read","up","her","only","would","go","hear","give","base","no","so","get","two","student","our","out","just","child","how","find","way","into","because","sheet","man","like","through","woman","school","think","world","choice","change","direction","much","life","long","study","need","first","help","four","job","learn","high","now","good","over","then","minute","after","live","know","line","these","become","author","could","even","also","come","such","mean","letter","see","three","those","end","once","company","conversation","problem","university","human","state","want","must","food","country","choose","any","my","day","less","accord","show","both","social","very","great","thing","information","look","too","business","between","research","before","number","single","own","feel","family","often","old","parent","increase","paragraph","provide","few","home","while","different","point","last","text","correspond","education","place","pay","language","still","keep","where","book","government","college","second","listen","why","system","put","blank","might","result","try","money","ask","seem","speak","news","example","same","important","right","report","believe","computer","public","health","far","young","large","call","city","develop","start","another","centre","idea","during","science","allow","age","leave","every","talk","require","car","statement","society","short","cause","down","technology","grow","sentence","without","hour","back","economic","big","begin","lead","build","early","off","spend","little","bank","hard","cost","class","group","price","effect","comprehension","today","tell","set","something","play","likely","turn","course","buy","understand","offer","service","small","product","experience","suggest","decide","test","scientist","bring","since","however","person","teacher","around","whether","future","reason","view","water","improve","care","benefit","low","program","worker","market","teach","support","among","kind","friend","skill","yet","form","include","move","rather","create","never","century","bad","eat","always","least","face","plan","consider","industry","themselves","process","rate","fact","house","culture","power","share","area","million","lot","sense","lose","against","rise","energy","control","space","case","hold","possible","ability","animal","enough","value","role","week","individual","hand","open","ten","term","away","happen","fall","self","art","decision","interest","drive","issue","produce","complete","under","activity","national","brain","level","able","run","past","win","present","quality","difficult","easy","tend","reduce","five","expect","order","law","environment","paper","mind","kid","economy","percent","sleep","recent","half","close","attention","poor","free","body","measure","office","travel","major","professor","natural","remain","though","next","design","history","nation","real","almost","customer","subject","ago","focus","local","really","certain","ever","success","late","true","name","knowledge","stress","matter","involve","raise","identify","stay","population","risk","medium","lack","strong","fill","patient","rule","until","continue","receive","already","record","employee","sell","note","month","community","demand","personal","instead","challenge","store","check","deal","opportunity","relationship","list","usually","average","although","eye","break","fast","common","condition","behavior","global","within","difference","light","growth","shop","meet","concern","task","scientific","effort","plant","encourage","career","fail","influence","avoid","music","add","policy","item","force","member","explain","translation","side","enjoy","cut","adult","international","training","general","nature","type","doctor","mother","situation","several","save","essay","game","graduate","decade","medical","miss","train","third","interview","stop","financial","reach","professional","sign","earth","project","generation","standard","war","story","rich","later","again","air","night","contain","main","soon","sound","love","account","return","affect","translate","sure","describe","purpose","full","room","appear","impact","period","television","quite","position","attitude","machine","clear","field","pass","below","here","communication","protect","performance","lecture","factor","top","firm","draw","memory","whole","writer","watch","death","white","academic","bear","importance","decline","claim","model","wrong","expert","carry","act","send","accept","potential","degree","resource","pause","opinion","income","amount","disease","stand","political","popular","argue","physical","team","action","material","prove","compare","competition","nothing","perhaps","private","please","head","street","available","current","boy","goal","loss","evidence","together","speed","middle","along","sale","production","grade","visit","content","source","security","pressure","gap","across","let","depend","especially","modern","simply","farm","approach","correct","special","hope","someone","speaker","intelligence","picture","survey","everyone","event","either","step","habit","responsibility","similar","necessary","chance","foreign","apply","father","driver","oil","anything","access","sport","exist","advantage","newspaper","remember","agree","manager","land","solve","function","management","phrase","experiment","structure","everything","sit","seek","message","per","promote","figure","road","limit","sometimes","fear","supply","argument","relate","effective","prevent","pattern","baby","search","itself","response","beyond","regard","reader","serious","near","serve","president","climate","heart","black","traffic","walk","determine","gain","speech","award","prepare","except","publish","digital","suffer","mental","positive","outside","party","dream","increasingly","trade","contribute","drink","therefore","himself","achieve","conflict","trouble","nearly","girl","status","exercise","various","basic","fit","above","occur","refer","die","town","maintain","wait","failure","composition","attend","critical","alone","meeting","tax","feature","express","shift","hundred","simple","successful","thousand","theory","key","image","couple","whose","catch","select","card","cover","earn","farmer","trend","attract","clean","method","promise","desire","lie","healthy","rest","difficulty","network","billion","detail","daily","normal","reward","post","cook","upon","thus","toward","discover","behind","introduce","else","drop","device","court","drug","warm","range","solution","essential","particular","fashion","indicate","accident","slow","six","attach","respect","error","happy","credit","expensive","finish","deep","bill","fire","site","moment","belief","museum","finally","address","concept","crime","damage","negative","size","restaurant","federal","labor","progress","robot","movement","weather","mistake","infer","enter","charge","medicine","engage","executive","wide","variety","race","object","manage","hospital","official","huge","hire","hotel","treat","perform","employer","literature","profit","article","weight","trip","investment","due","aspect","wear","define","balance","enable","consumption","character","crisis","dollar","green","immigrant","contact","cold","reality","department","comment","board","consequence","style","fight","advice","meal","worry","tool","waste","predict","despite","morning","operation","industrial","stage","kill","specific","highly","purchase","director","significant","feeling","replace","yourself","print","shape","thirty","ground","screen","struggle","lay","sea","forget","expand","cross","multiple","wife","intellectual","fund","conduct","direct","ensure","safety","region","tourist","legal","link","reflect","aim","husband","underline","worth","freedom","suppose","reveal","poverty","advance","south","smoke","practical","male","commercial","peer","attack","holiday","limited","push","twenty","police","film","review","attempt","wealth","associate","prefer","title","creative","trust","ill","box","cry","hardly","responsible","track","warn","total","derive","china","textbook","extra","electronic","ignore","survive","bird","heavy","fuel","magazine","summer","complex","danger","piece","option","throughout","library","mention","institution","appeal","background","colleague","intend","strategy","paint","exact","journal","grant","factory","authority","association","tree","arrive","ready","cheap","patent","flight","spread","expense","famous","indeed","establish","observe","chief","safe","nor","foot","debate","agency","educate","compete","wish","staff","adapt","boss","unless","unemployment","fix","scale","possibility","application","participant","union","threat","emotion","western","marriage","capacity","score","obvious","relation","lesson","passenger","represent","mile","regular","adopt","voice","movie","characteristic","join","operate","pollution","discuss","extend","appropriate","match","date","ancient","majority","wonder","forest","unique","finding","gas","separate","audience","station","carbon","female","conclude","employ","conclusion","moral","expression","wall","temperature","principle","acquire","mail","consume","aware","owner","classroom","campus","pain","aid","doubt","ice","cell","confidence","imagine","taste","resident","equal","senior","dinner","innovation","pick","overall","succeed","strike","examine","instruction","cancer","judge","divide","rely","former","instance","release","front","harm","partner","floor","imply","remove","tradition","radio","vocabulary","hunt","clock","assume","invite","collect","campaign","native","interesting","shortage","reform","corporate","powerful","central","efficiency","gender","dangerous","urban","emerge","sort","enhance","round","connect","forward","handle","debt","diet","connection","color","door","hot","personality","eventually","manufacture","ocean","north","chemical","afford","sugar","apple","noise","employment","advocate","mass","contrast","ideal","west","vehicle","inside","respond","seven","gift","artist","double","novel","page","park","largely","cent","analysis","outline","citizen","code","strength","display","advanced","son","sun","whom","budget","smart","manner","explore","estimate","whatever","crop","brand","launch","agriculture","scan","regulation","nurse","expose","being","truth","distance","count","hit","ticket","combine","ban","bit","impossible","nuclear","basis","boost","rain","reserve","dog","productivity","discipline","seat","revolution","prize","primary","previous","attractive","communicate","disaster","stock","quick","fly","heat","candidate","identity","repair","eight","tear","web","press","original","conference","spot","signal","generate","expectation","recession","clothe","facility","directly","ourselves","bus","refuse","burn","decrease","fat","table","sample","gold","obtain","ahead","domestic","airport","obesity","guest","threaten","fair","marry","historical","formal","criminal","familiar","friendly","planet","strange","useful","perfect","genetic","competitive","vast","series","deliver","equipment","visitor","revenue","sector","inform","twice","thank","illness","altogether","welfare","blood","calorie","herself","intelligent","cite","guide","household","pupil","insurance","criticism","exchange","ship","label","differ","commit","admit","objective","contribution","context","complain","fine","church","yield","soil","rent","video","brother","capital","circumstance","illustrate","target","pretty","active","schedule","window","alter","sensitive","gather","requirement","critic","property","eliminate","artificial","engineer","neither","busy","touch","appearance","engineering","teenager","rank","cure","secretary","circle","welcome","switch","complaint","interpret","lawyer","nowadays","priority","military","cope","propose","relative","sex","pull","fresh","crowd","prospect","payment","technical","fish","birth","anxiety","routine","psychology","abroad","feed","talent","fiction","plane","afternoon","shoe","humanity","preserve","explanation","flow","technique","wake","hurt","consist","master","smile","convince","delay","broad","sufficient","mostly","unlike","destroy","meat","wage","vision","wealthy","exhibit","block","blue","blame","proper","invest","tough","star","actual","grammar","peace","otherwise","emphasis","efficient","survival","escape","import","club","red","invention","discovery","agent","dominate","pace","element","impose","vote","yes","narrow","transfer","copy","vary","participate","advise","loan","demonstrate","fundamental","origin","recommend","valuable","addition","contract","description","alcohol","district","dry","evening","breakfast","gene","wave","moreover","capable","ordinary","strengthen","suggestion","cash","secret","quarter","thought","persuade","software","afraid","steal","evolution","corporation","homework","sight","athlete","outcome","surface","apart","pleasure","entry","justice","electricity","notice","final","rarely","privacy","email","cycle","satellite","burden","king","salary","mountain","religious","guarantee","annual","ease","telephone","garden","comfort","request","foundation","lunch","engine","symbol","earthquake","arise","partly","existence","rapid","willing","curiosity","childhood","tie","climb","net","none","widespread","stem","abandon","pound","custom","fee","island","suitable","favor","secure","presence","transport","independent","notion","distinguish","collection","perspective","careful","toy","friendship","throw","ambition","giant","definition","height","reject","disappear","typical","dark","suit","quit","leadership","behave","inspire","youth","violence","monitor","kitchen","phenomenon","physician","actor","extent","jump","proportion","egg","pursue","complicated","bracket","solar","duty","recall","winter","assistant","coffee","overseas","crash","river","weekend","administration","excessive","path","productive","enormous","conservation","urge","concentrate","impression","worldwide","liberal","immediate","retire","bed","daughter","substance","clone","commission","settle","insist","editor","scholar","institute","unusual","rare","fun","nine","client","saving","quiet","cognitive","smell","additional","plastic","officer","wisdom","mobile","mood","symptom","indifferent","neglect","transform","bright","recovery","reputation","fault","inflation","atmosphere","religion","root","severe","deny","assess","extreme","introduction","seldom","tip","minority","relevant","cool","deserve","repeat","politician","pose","chair","beautiful","organic","vital","alternative","cancel","depth","protein","profession","specialist","mere","opposite","possess","recognition","attribute","chain","remote","tomorrow","continent","reduction","everyday","percentage","version","dramatic","stimulate","arrange","faculty","praise","volunteer","stone","chapter","meanwhile","perceive","merely","absorb","belong","weak","affair","undergraduate","assign","mission","joy","highway","publication","poetry","usual","necessity","adjust","announce","exposure","acknowledge","imagination","locate","incentive","victim","airline","confident","preference","approve","borrow","assignment","reliable","asset","constant","leisure","considerable","beauty","massive","council","entire","reverse","document","skim","optimistic","somewhat","skilled","appreciate","entertainment","nobody","satisfaction","recover","apartment","sister","plate","justify","dead","ceremony","elsewhere","procedure","unlikely","strict","stick","observation","convey","virtual","discourage","jam","location","coach","merit","occasion","bottle","implication","inevitable","wind","surprise","independence","aside","bind","capture","satisfy","recruit","skin","retail","sick","grain","eager","proposal","excerpt","brief","fruit","scene","hide","export","exhibition","length","cultivate","border","edge","recycle","treasure","bacteria","selection","sustain","everybody","helpful","instrument","tired","hair","admission","regardless","empty","spring","valley","clothing","nice","universe","pursuit","conscious","laugh","confront","assumption","equality","glass","entitle","prompt","suspect","spirit","hero","wild","muscle","beat","peak","arm","shrink","transition","excellent","delete","racial","puzzle","witness","branch","literary","reference","minister","register","declare","everywhere","invent","maybe","volume","bar","east","resume","adolescent","dance","hill","season","nevertheless","congress","fifty","urgent","category","infant","convenient","battle","vulnerable","committee","band","football","dress","vacation","reasonable","odd","significance","examination","detect","host","estate","initiative","divorce","dispute","accurate","brown","snow","confirm","raw","unit","hang","weigh","elite","trial","evolve","mislead","distinction","automation","craft","plenty","vegetable","curriculum","flexible","cat","royal","highlight","remark","comparison","regulate","contrary","rush","interact","nervous","bag","scheme","alarm","desert","beach","usage","exceptional","internal","evil","surround","bottom","expansion","whereas","license","journey","anticipate","deprive","finance","absence","guideline","route","whenever","solid","tap","myself","seed","protest","submit","musical","journalist","judgment","boom","fairly","stable","contest","illegal","zone","besides","philosophy","modify","rural","god","reluctant","sharp","adequate","milk","mystery","literacy","emergency","bridge","grass","slave","privilege","restore","upset","counterpart","accelerate","era","false","uniform","pair","profitable","prison","breath","barrier","breed","painting","segment","dam","infrastructure","landscape","assist","crucial","fan","rock","devote","permanent","broadcast","desk","greenhouse","visual","electric","luxury","tall","entrance","snack","rat","channel","reply","virtue","injury","remind","trait","counter","evaluate","sacrifice","tone","minor","stuff","sum","cheat","injure","superior","tackle","maximum","tuition","appointment","ingredient","spare","tour","steel","beneath","discount","trace","unfortunately","laboratory","belt","march","tendency","accomplish","ruin","entertain","hall","regret","furniture","ride","terrible","coast","camera","obstacle","finger","interval","constitute","northern","aggressive","influential","radical","abuse","southern","elementary","motor","reporter","commerce","strain","resolve","thrive","excuse","profound","soldier","valid","wood","embrace","lucky","tiny","breathe","prime","camp","flower","flood","village","destruction","bond","weapon","salt","dioxide","gamble","conservative","panel","prejudice","honor","vitamin","transaction","relief","civil","mirror","costly","plus","chip","insert","boat","quote","chairman","latter","trap","bias","photograph","rival","disorder","blind","onto","proud","relieve","tobacco","construct","encounter","overwhelm","sponsor","truck","equip","initial","favorite","instant","minimum","neighbor","neighborhood","principal","proof","file","investigate","package","genuine","concert","helicopter","amateur","exception","incident","permit","core","unexpected","barely","anywhere","fellow","found","occupation","opponent","army","delivery","stretch","alert","keen","theft","ethnic","historian","supreme","restrict","democratic","compensate","thin","anxious","admire","guard","intention","lean","generous","honest","shoulder","inner","resist","sky","artistic","marine","sensible","legislation","owe","theatre","controversy","venture","ray","frequent","modest","personnel","collapse","angry","extensive","resort","assistance","insect","insight","metal","nearby","exciting","freeze","lake","flat","lend","consult","interrupt","dictation","shall","delight","genius","distant","diverse","fortune","victory","feedback","arouse","sad","theme","square","defense","facilitate","soft","combination","shake","sophisticated","monkey","database","convention","enterprise","temporary","dependent","wise","remarkable","horse","quantity","fatal","lobby","calm","contemporary","prevail","trick","cautious","convert","curious","bury","drought","pool","assure","edition","induce","portion","classmate","grand","shed","pride","soccer","sympathy","mechanism","ownership","originate","aircraft","ethic","external","universal","react","representative","substantial","qualification","retain","mouth","poll","via","myth","stability","taxi","slip","pocket","fossil","lady","roll","forum","preparation","luck","scholarship","rail","dean","overlook","defend","dismiss","reinforce","bother","overcome","academy","supermarket","ambitious","roof","thief","accumulate","lonely","gallon","tutor","railway","integrate","exclude","casual","orient","component","dozen","prosperity","badly","diminish","imitate","intense","occupy","distribute","phase","intensive","revise","straight","exceed","glance","implement","chronic","cup","pension","storm","sink","beneficial","load","romantic","shelf","destination","accompany","lock","jury","humor","desirable","motion","storage","commodity","negotiate","compromise","endure","immune","pleasant","celebrate","command","span","norm","hazard","joint","clerk","arrest","dictionary","hate","magic","numerous","shoot","song","knit","reading","philosopher","stranger","obscure","faith","shock","strive","grasp","passion","settlement","sudden","biology","parliament","map","penalty","tooth","yesterday","distract","enemy","abstract","automobile","hungry","motivate","possession","rescue","calculate","lane","lift","assembly","rid","upper","pet","dish","chart","arrival","kingdom","compose","readily","cloud","interfere","poet","soul","alive","exert","pioneer","punish","alike","interference","plain","anger","tiger","menu","pilot","violent","bore","update","cream","ton","bomb","soda","random","output","prolong","approval","extension","surgery","shut","ring","platform","enforce","battery","convenience","silicon","impress","hunger","rice","tragedy","policeman","fatigue","wheat","formation","draft","dominant","verb","epidemic","impulse","shelter","subtle","forth","oblige","spouse","tension","bargain","chicken","comprehensive","limitation","weekly","foster","nutrition","suburb","foreigner","boundary","conform","exploit","gesture","obligation","sweet","absent","deficit","mode","crude","mechanical","govern","evident","explosion","render","layer","melt","caution","transmit","automatic","globe","division","proceed","compel","primitive","steady","territory","gallery","lower","maintenance","corner","pop","somewhere","accuse","neutral","renew","fifteen","harvest","mouse","fox","liquid","ancestor","triumph","folk","guilty","permission","pour","equivalent","ultimate","excess","stream","vice","coal","setback","deadline","spelling","hinder","ear","session","fond","musician","narrative","classic","dislike","semester","province","column","hence","celebrity","prior","forever","machinery","census","fade","addict","anyway","tolerant","architecture","curb","entrepreneur","forecast","controversial","ladder","moon","oppose","subsidy","confusion","enthusiasm","somehow","birthday","inferior","fake","frequency","pile","realistic","therapy","dirty","disturb","biography","outstanding","tower","wedding","painful","confine","assemble","colony","wheel","literally","worthy","crack","panic","upgrade","supplement","till","compound","decorate","rough","scope","advertise","fancy","sympathetic","clever","fashionable","hurry","organism","loyalty","prohibit","alliance","copyright","expertise","leg","spite","suicide","acquisition","pole","democracy","consequently","fame","fulfil","logical","mankind","monetary","nose","combat","motive","variation","harsh","provision","temper","exhaust","holder","linguistic","mine","servant","reflection","bread","golden","precious","accommodation","charm","consistent","distinct","edit","housework","lifetime","shirt","amid","identical","instruct","jacket","sake","virus","wound","beer","refugee","nap","classical","sequence","systematic","horizon","apparent","guidance","passive","creature","fierce","mix","trigger","cue","disable","hostile","integrity","precise","suppress","blow","bone","gate","abundant","appliance","relax","smooth","appetite","currency","laundry","bicycle","skirt","eastern","lion","toilet","guilt","tolerance","parallel","instinct","premium","shuttle","collective","flash","continuous","resistant","variable","visible","withdraw","elaborate","guess","indispensable","sweep","concrete","electrical","governor","incline","mount","straightforward","habitat","spoil","companion","quarrel","sorry","bureau","heritage","mask","coat","countryside","dynamic","format","secondary","coin","deposit","install","tremendous","voluntary","accuracy","silver","shame","patience","ambiguous","suspicious","polite","courage","noble","suspend","undermine","deliberate","operator","substitute","fare","pollute","prominent","thick","enrich","guy","verbal","behalf","tolerate","peculiar","hemisphere","pure","outlook","rear","comparable","cast","mutual","organisation","row","cheer","intensity","nurture","esteem","liberate","tennis","acceptance","consensus","cotton","nerve","persist","undergo","wallet","wash","asleep","fate","chat","forty","impressive","spur","forbid","rational","heel","desperate","twelve","hesitate","index","attain","frighten","appoint","drama","satisfactory","thesis","clue","defeat","oxygen","ball","exclusive","headache","membership","twin","underground","upward","architect","consultant","elevate","plunge","reception","boast","sue","tape","opera","cathedral","greet","knock","mortgage","rubbish","stereotype","decent","seminar","zero","adventure","affection","constitution","definite","drift","endeavor","enlarge","mineral","annoy","bush","poem","scatter","wipe","incredible","mechanic","enthusiastic","flourish","inch","lung","frame","profile","youngster","brick","dictate","organ","piano","twist","wherever","gaze","junior","subway","pyramid","remedy","mature","pump","tropical","chef","junk","pack","interior","liability","bid","rude","criterion","gradual","objection","surname","activate","lawsuit","outlet","tunnel","ignorant","squeeze","click","gentleman","invisible","retreat","chemistry","manipulate","migrate","somebody","clinic","dull","tight","wonderful","accommodate","destructive","chase","steep","deed","lightning","recreation","refine","stamp","prisoner","salesman","summary","monopoly","dose","gross","laughter","trail","discard","absolute","classify","festival","quest","conceive","underestimate","bet","density","prescription","resistance","sir","leap","reproduce","revolutionary","shy","brush","cinema","essence","gun","inhabitant","momentum","stare","wander","extraordinary","polish","slight","frank","misfortune","rob","surgeon","transmission","orbit","reservation","brilliant","gadget","playground","tenant","worthwhile","assert","mysterious","slice","basketball","inherent","sixty","headline","specify","tag","margin","extract","agenda","joke","pessimistic","tune","apology","loud","portray","burst","excitement","geography","prevalent","silence","theoretical","murder","rigorous","waiter","corn","oneself","shadow","tongue","hobby","laptop","potato","pretend","dine","pronunciation","dissolve","speculate","underlie","precede","quota","surplus","drastic","lest","supervise","liable","senator","abolish","foresee","hardship","hormone","recipient","suspicion","lag","hypothesis","revive","undertake","deficiency","enrol","peaceful","realise","resemble","spiritual","fortunate","mild","temptation","wine","cater","donate","grave","historic","incorporate","physicist","prey","stupid","toxic","collar","plot","rainbow","sheer","sing","soar","studio","halt","nursery","expedition","outdoor","circuit","simplify","cooperate","volcano","deem","nowhere","contend","delicate","mathematical","outer","allowance","skip","awkward","vague","cable","emit","manual","prescribe","shell","tale","bell","competent","hat","prestige","silly","split","tailor","indoor","offend","publicity","refrain","cherish","descend","entity","occasional","fourteen","fry","syndrome","whale","pencil","spy","cease","fold","beam","charter","correlate","departure","float","array","engagement","fertile","fool","rocket","alien","devise","exaggerate","inherit","intimate","opt","ours","troop","dilemma","spell","thrill","tribe","blog","deadly","favorable","herd","steam","strip","diagnose","scratch","wet","dip","distress","drill","sculpture","warmth","dump","resign","vigorous","leaf","manifest","pen","alongside","bulk","dig","elect","funny","innocent","input","nonsense","vivid","beef","excel","nonetheless","queue","conquer","contradict","leak","seize","authentic","coordinate","hip","feasible","gloomy","hint","illiterate","iron","lip","painter","stir","bitter","digest","exotic","lazy","obey","butter","carpet","civilian","pin","yellow","pie","retrieve","romance","workshop","cap","likewise","contempt","queen","jet","acquaintance","bay","bite","depict","dimension","precision","shore","superficial","unity","furnish","palace","provoke","grateful","setting","amuse","anybody","cart","comply","demographic","imitation","incidence","invitation","mill","super","cake","stroke","surge","testify","cow","linger","alleviate","downtown","hurricane","patch","tea","misery","lord","rage","elegant","flaw","formulate","moderate","reliance","tide","pledge","snap","undoubtedly","visa","wing","commute","dare","energetic","flag","frontier","illusion","slogan","vessel","compute","episode","indication","starve","steer","superiority","tempt","beside","decisive","occurrence","refrigerator","seemingly","spectator","trivial","awake","faulty","housewife","intervene","luggage","seal","shout","dwell","inspiration","merge","shine","yell","fraud","tedious","crazy","invade","yard","alphabet","heaven","hospitality","pink","backward","legitimate","lure","rigid","offspring","violate","poisonous","silent","thereby","cling","divert","fraction","applicable","bachelor","carrier","hole","initiate","mate","meaning","presumably","reap","brake","calendar","certificate","cousin","dairy","decay","grab","miserable","practitioner","proposition","qualify","sole","spark","sportsman","tissue","toll","verify","compulsory","cyberspace","dawn","kick","mayor","subjective","timely","ward","wrap","altitude","cattle","cottage","drown","empire","ignorance","landlord","precaution","prosperous","tense","versus","allocate","beg","glad","infect","mess","troublesome","delegate","dive","hop","kindergarten","litter","passport","pat","prospective","uncle","blueprint","federation","telescope","cheque","republican","ritual","vanish","petrol","subsequent","bonus","consent","bubble","grip","humble","navy","sociable","ant","betray","handful","imperative","reckon","acute","castle","considerate","dignity","heighten","magnificent","metre","rhythm","throat","tidy","wire","cliff","curve","destiny","dim","paradox","repeatedly","resolution","scream","shade","collaborate","county","deteriorate","equation","orange","postpone","pronounce","thorough","contaminate","creep","diabetes","drunk","dual","empathy","overtime","priest","tire","disastrous","leather","multiply","pigeon","poison","ski","swim","utter","worm","rotate","aggravate","sentiment","tube","loyal","pipe","vaccine","canal","conception","distort","gravity","imaginative","municipal","plausible","sociology","crawl","exit","masculine","restrain","weird","advisable","avenue","barrel","cabin","conceal","eleven","formula","basket","eligible","immense","indulge","log","magnetic","seventy","slim","surpass","bend","charity","clarify","defy","gratitude","morality","paradise","prince","revenge","van","champion","chess","chocolate","dear","deceive","horror","juice","princess","shower","threshold","vocal","autonomy","cloudy","grief","hierarchy","probable","wooden","comparative","cartoon","medal","detach","durable","partial","predator","cruel","mend","progressive","ratio","subscribe","tactic","constrain","dentist","prone","refresh","cooperative","depart","endurance","glimpse","grandmother","probe","scrutiny","shortcoming","subordinate","drag","expenditure","fantasy","grey","insult","persuasion","plug","revelation","terrify","algorithm","boycott","coincide","dealer","disposal","fever","forgive","lawn","lodge","nest","pill","spectrum","turkey","bathroom","chest","foolish","frustrate","lamp","league","tablet","affluent","cabinet","collision","delicious","duck","monument","pear","spider","stack","tame","tent","tomato","helmet","fantastic","metropolitan","restraint","accordingly","drawing","eighty","hi","inertia","lately","lump","ninety","plentiful","revolve","theirs","harmony","breakdown","dash","flee","humorous","kit","magnify","rubber","senate","sixteen","spin","tank","thoughtful","veteran","angle","brave","cafe","compliment","crew","envy","illuminate","metric","molecule","noisy","particle","residence","stain","tangible","chaos","hardware","harness","legend","premise","refusal","technician","toss","turnover","ally","cruise","deputy","diary","faint","gram","idle","lorry","nut","oven","overnight","skyscraper","summit","lens","porter","practise","swell","sword","vacant","violin","weep","courtesy","doom","inhabit","preferable","sketch","bang","chamber","enlighten","mixture","pan","pearl","acre","conspicuous","fragile","gigantic","overturn","propel","sow","stove","vain","bold","clarity","dirt","disclose","embody","inject","loom","spacious","astronaut","confer","conviction","eyesight","fabric","fragment","operational","telegraph","zoo","absurd","anonymous","cheese","descendant","downward","embarrass","probability","scenery","utmost","whichever","bare","confess","coupon","discharge","drain","garbage","handicap","hook","horrible","mad","marathon","optional","orientation","pit","questionnaire","stake","stomach","treaty","virgin","acquaint","ascribe","awful","button","cave","complement","confidential","gear","installation","lively","portable","prayer","renovate","swallow","sweater","trash","whisper","abnormal","bee","bucket","defect","detective","disrupt","identification","loose","pig","pot","poultry","recipe","ridiculous","slide","texture","embryo","vapor","chancellor","deduce","glory","gum","hijack","implicit","renaissance","wholly","ceiling","default","duration","resent","slack","unify","upright","chew","dense","finite","impatient","intuition","boil","bureaucracy","comprehend","framework","hamper","logic","sanction","snake","breast","fiscal","golf","realm","scarcely","tragic","transplant","archive","corridor","dispose","domain","extravagant","flock","hybrid","infinite","intrinsic","masterpiece","vulgar","aviation","gentle","mud","navigation","ribbon","scandal","thread","ache","circulate","cough","deck","diploma","elephant","feminine","garage","hut","imperial","ministry","neck","pant","pest","poster","pronoun","reconcile","tender","premier","hug","nasty","ideology","laser","legacy","entail","nail","broker","crown","lever","likelihood","limb","proclaim","swing","await","comedy","condemn","dust","filter","fluid","incidentally","parade","pave","preliminary","shield","terminate","tow","uneasy","weave","blur","contemplate","discriminate","handsome","insure","intricate","kindness","receipt","uncover","worship","acid","boot","extinct","hamburger","hawk","hydrogen","patrol","picnic","repel","simultaneous","sin","spacecraft","splendid","spokesman","spray","voyage","withstand","beverage","bulb","erect","expire","grace","gulf","layout","librarian","lover","marital","needle","precedent","pub","reckless","spill","stair","ashamed","aunt","bald","bankrupt","choke","cumulative","dubious","eagle","gently","integral","mediate","organise","overtake","pulse","quantify","respective","riot","situate","skate","specification","sweat","transit","tumble","rap","geology","inference","cocaine","graph","monarch","multitude","succession","analogy","despair","forge","hitherto","predecessor","whereby","aboard","beard","bypass","chemist","chunk","drawback","economical","ink","medieval","nod","simplicity","superstition","triple","unfold","accountant","bunch","elder","erase","fearful","glow","holy","inclusive","jar","outward","plague","refute","spontaneous","adhere","aluminum","bleed","catalog","erupt","explosive","fluctuate","fur","gut","heal","irritate","liberty","parcel","sheep","summon","terminal","tremble","tribute","devil","diplomatic","displace","echo","evoke","funeral","mammal","midst","offset","peasant","scold","slump","tail","typewriter","accent","accordance","anniversary","banana","bloom","catastrophe","certify","collide","cord","denial","dormitory","lemon","ounce","pedestrian","sail","salad","scenario","sightseeing","silk","slope","sob","warfare","juvenile","pilgrim","stadium","evade","saturate","token","conscience","continual","diligent","exemplify","hail","numerical","orderly","warrant","comprise","dental","flavor","kilogram","preach","presently","prose","shark","thirteen","vertical","administer","aspire","attorney","classification","declaration","editorial","explicit","fruitful","meantime","nightmare","ornament","perpetual","pregnant","rally","rebel","successive","tin","warehouse","wit","arithmetic","axis","brisk","cage","casualty","certainty","clause","curse","disguise","doorway","faithful","ghost","greedy","illustration","imaginary","marginal","obsession","offensive","petroleum","ponder","port","safeguard","signify","simulate","sphere","thumb","transparent","album","analyse","arbitrary","arrogant","candle","closet","duplicate","evaporate","ferry","gossip","hopeful","immerse","impart","intimidate","neat","omit","prosper","scarce","thunder","timber","accessory","awe","bath","bully","carriage","cube","elevator","fixture","honey","infectious","lamb","merchant","pitch","polar","reassure","sand","scrape","sorrow","ugly","whoever","captive","cosmic","cucumber","grape","eyebrow","heroin","apparatus","coherent","shot","mock","opening","tractor","deploy","dome","lottery","monster","constituent","eighteen","emigrate","hatred","indicative","lounge","ore","pastime","plead","recur","soak","sunrise","susceptible","agony","bizarre","conversely","dedicate","extinguish","fetch","glove","incur","invalid","loosen","orchestra","pottery","quantitative","spectacle","stripe","viewpoint","alternate","attendant","ballet","clash","comic","converge","correspondence","costume","designate","eve","explode","handwriting","invasion","jewelry","layoff","messenger","oral","outbreak","portrait","procession","recognise","southeast","standpoint","string","stroll","stumble","temperament","transistor","verse","void","adverse","amplify","bacon","butterfly","cargo","chill","commonplace","compact","concession","confuse","convict","dwarf","embark","embed","fuss","namely","permeate","resemblance","sometime","staple","suck","terror","tonight","wardrobe","wreck","blouse","bow","cafeteria","cheek","compatible","courtyard","descent","dessert","excursion","expel","fax","fisherman","fleet","graphic","haul","hell","ingenious","kiss","meditation","merchandise","oppress","repetition","rod","rub","script","smash","solemn","solitary","successor","sway","testimony","weed","auction","clip","corrupt","garment","colonial","conductor","cripple","mandate","microscope","reign","verdict","augment","carve","compile","foremost","gasp","hygiene","negligible","penny","soap","statesman","stationary","tentative","uphold","agreeable","anecdote","discourse","dot","flatter","knot","mercy","naive","outset","sacred","sovereign","turbulent","vicious","ample","atom","banquet","bleak","concise","disperse","dividend","documentary","exempt","facet","freight","hover","hum","impair","levy","mainland","northeast","notorious","pamphlet","periodical","perish","purse","shallow","signature","solidarity","toil","allege","bud","contrive","credential","diamond","envelope","erroneous","knee","punch","rectify","robust","selfish","shrug","tick","tile","umbrella","verge","aisle","badge","bean","browse","bump","bundle","carpenter","cloth","coke","custody","daylight","divine","eccentric","elicit","erode","eternal","fog","foul","fracture","graze","handkerchief","liver","marvelous","mentor","miracle","nominate","notable","obedience","ruler","spear","sunshine","surrender","taboo","thirst","vegetation","astronomy","chop","doctrine","indignation","prudent","disposition","perplex","anchor","damn","detector","earnest","feeble","galaxy","hello","irony","mold","prosecute","savage","surveillance","transient","abrupt","affiliate","align","assault","beginning","conjunction","consolidate","counsel","criticise","genre","hers","overhead","overlap","regime","soup","terrific","unite","acclaim","ambulance","auxiliary","ballot","candy","carbohydrate","cluster","coalition","cop","copper","couch","dialect","disturbance","empirical","fasten","glue","groan","novelty","pierce","proficiency","rumor","scare","sober","stall","tomb","tropic","underneath","antique","articulate","bake","blanket","blast","bless","carrot","characterise","clumsy","concede","enclose","envisage","isolate","oriental","pasture","raid","refuge","resolute","rug","sarcastic","scrap","shatter","trumpet","aloud","ape","audio","basement","blend","bound","breeze","cushion","dazzle","deplete","dial","discrepancy","disgust","donkey","drawer","drone","eject","endow","erosion","flush","glitter","goodbye","ignite","industrialise","jewel","kidney","kilometre","lapse","lease","limp","lovely","nationality","nominal","notify","oak","pale","paperback","pavement","pint","pope","rehearse","repay","sack","skeleton","spectacular","statue","stereo","strand","tangle","temple","transcend","utilise","vegetarian","weekday","furnace","textile","canteen","condense","denote","differentiate","grin","harbor","haste","posture","radar","nickname","preside","rip","toast","vacuum","balloon","brochure","directory","doll","doze","flap","flesh","fork","glare","hasty","impetus","lucrative","obedient","ozone","poke","radiate","rein","rot","sigh","singular","smog","snatch","startle","upstairs","aftermath","applaud","appraisal","assurance","barber","bin","bride","bullet","captain","despise","exclaim","feat","fireman","instantaneous","intact","intrude","metaphor","moan","muscular","nuisance","relativity","removal","rifle","sincere","undo","alienate","ascend","ascertain","astonish","banner","baseball","bolt","bowl","congratulation","consecutive","console","crush","deaf","dinosaur","dread","drum","emperor","execute","famine","fence","flame","fore","hammer","homogeneous","intrigue","lap","litre","lofty","magnet","memorandum","mingle","miniature","niece","nourish","outfit","panda","penetrate","pine","postcard","quiz","rag","rebellion","refund","resilient","roar","segregate","sensation","sleeve","slender","slippery","sock","sofa","southwest","swear","swift","thirsty","censorship","slot","affirm","assimilate","frown","lateral","preface","query","splash","stride","torch","butcher","compress","diffuse","discern","goodness","grieve","mute","roast","slum","steward","straw","viable","afterward","angel","blunder","booth","cigar","commend","commonwealth","congratulate","cricket","diversion","ecology","elbow","equity","guild","instrumental","keyboard","latitude","liquor","manuscript","plough","suite","superb","torture","workout","advent","audit","blaze","brutal","bug","bull","conspiracy","endorse","expend","flour","forthcoming","handy","inventory","motel","naval","notebook","palm","relay","sandwich","scent","shrewd","specialise","stance","veto","waist","widow","ambassador","avert","bathe","beloved","biscuit","briefcase","burglar","champagne","conquest","convene","conversion","coward","dizzy","exile","futile","gracious","hatch","heap","heave","hike","hollow","huddle","inland","insulate","intermediate","invaluable","jargon","jungle","layman","locality","noon","odor","okay","optical","optimum","pact","persevere","pharmacy","powder","predominant","presume","protocol","purple","rape","reclaim","repression","ridge","rust","sauce","sibling","slap","stale","strap","submerge","supper","tilt","trademark","trim","typist","venue","versatile","yearly","necklace","thrift","weary","aeroplane","cement","inspect","roundabout","abide","ashore","chimney","claw","correspondent","crab","ditch","indignant","innumerable","irrespective","irrigate","magnitude","maid","memorial","mercury","misunderstand","nucleus","pinch","plea","puppet","republic","reservoir","screw","stern","stiff","swamp","tease","tray","tug","ventilate","vocation","zeal","analytic","apt","benign","canoe","cassette","circular","crisp","crust","curl","curtain","deter","diagram","epic","eradicate","fabulous","fascinate","fibre","formidable","hearing","heroic","inn","kin","murmur","outrage","pray","propaganda","rouse","satire","sneak","stalk","symphony","tuck","whatsoever","whip","wrist","applause","ash","bail","bench","better","bolster","bounce","complicate","conscientious","coronavirus","crane","crystal","culminate","cupboard","dismay","evacuate","feather","fertiliser","feudal","fireplace","fountain","frog","germ","glide","heir","imminent","inhibit","inward","jazz","junction","kidnap","loop","missionary","moist","naked","overcoat","overflow","pardon","pity","plagiarism","plight","portfolio","postman","prototype","punctual","redundant","rotten","scarf","shabby","shave","shipment","sore","spit","steak","storey","sturdy","toe","tumor","turmoil","wary","whistle","wolf","geometry","menace","radius","semiconductor","statute","barn","jurisdiction","nitrogen","scorn","shove","tram","abound","cape","cherry","dock","eminent","ending","epoch","hen","intermittent","jaw","pepper","purify","rhetoric","rope","sideways","swarm","symposium","thermometer","withhold","arrow","baggage","blunt","bruise","buzz","cab","calcium","compass","downstairs","dye","fuse","hostage","jog","knife","loaf","lunar","meadow","packet","plumber","psychiatry","racket","recite","retention","shorthand","sip","stubborn","trolley","amend","ankle","barren","basin","bat","beast","brass","breach","broom","canvas","cashier","chin","chorus","civilisation","clay","compartment","compassion","deer","detain","deviate","diameter","discretion","ego","eloquent","enclosure","farewell","fling","fluent","friction","frost","glacier","glorious","grim","grocer","grope","hinge","honorable","horizontal","horn","humid","kneel","latent","leaflet","linear","millionaire","minus","nickel","noun","orthodox","pad","parameter","patron","petty","pickup","pillar","plural","porch","preclude","pretext","rabbit","rack","rash","remnant","reproach","restless","revolt","ripe","robe","sailor","saint","sceptical","seventeen","shiver","smuggle","sneeze","sour","specimen","spoon","stagnant","stitch","stoop","submarine","subtract","suffice","thrust","torment","torrent","trunk","vicinity","violet","wagon","yawn","fume","parachute","superfluous","turbine","aerial","brow","defer","flare","humiliate","jealous","massacre","monotonous","rejoice","sly","speciality","strawberry","synthesis","throne","vanity","velocity","wedge","allegiance","bronze","chalk","commemorate","dumb","elapse","generator","ham","hedge","idiom","moisture","mortal","orphan","overhaul","plateau","pork","propagate","puff","reciprocal","retrospect","rib","tan","aggregate","anyhow","arch","avail","balcony","barbecue","belly","benevolent","beware","blush","born","bulletin","centimetre","circus","clasp","climax","commence","decree","dilute","disappoint","discreet","dissipate","dynasty","edible","elastic","escalate","escort","exceedingly","excite","exquisite","fairy","feast","fist","fortnight","furious","gauge","gorgeous","greeting","grind","guitar","handbook","headmaster","herald","herb","hoist","hose","humidity","hurl","icon","intelligible","lad","liner","locker","lubricate","marble","mat","me","melody","merry","nineteen","notwithstanding","onion","orchard","oval","overthrow","owl","paradigm","paste","peach","pedal","pendulum","peninsula","petition","pirate","plantation","pond","postage","recede","reed","saddle","salvation","saucer","sausage","scar","scramble","shaft","shear","skilful","slam","solo","spade","sparkle","stagnate","stun","tariff","thermal","timid","twinkle","unload","veil","volleyball","warranty","waterproof","whisky","wholesome","amaze","bait","coil","enquiry","hypocrisy","interface","invert","lumber","madam","adjective","alloy","bearing","bewilder","bloody","centigrade","choir","clap","cloak","comb","debut","dwelling","harden","inhale","mourn","necessitate","obstruct","oxide","panorama","rake","repertoire","rose","spiral","staircase","triangle","adjacent","antenna","approximate","arena","artery","auditorium","autumn","bandage","bark","best","bibliography","blossom","camel","cannon","capsule","cardinal","clergy","clutch","cohesive","configuration","contagious","crow","damp","denounce","deplore","depress","disc","distil","dragon","dusk","emphasise","exterior","fabricate","fellowship","foam","footstep","freelance","goat","goose","gown","gymnasium","hay","intersection","inverse","isle","jolly","judicial","lace","lavatory","lick","maiden","malignant","missile","module","numb","nylon","obstruction","opaque","outing","ox","pathetic","patriotic","pebble","peel","perfume","pneumonia","recollect","retort","royalty","saw","scout","sew","shampoo","shepherd","siren","skull","slaughter","sophomore","spicy","stab","stationery","stipulate","sunset","thereafter","trench","ultraviolet","unanimous","voltage","width","zip","abdomen","agitate","amiable","bribe","composite","comrade","contingent","culprit","giggle","interim","lame","minimise","paddle","pea","physiology","plaster","preposition","radioactive","ruthless","watt","adore","esthetic","anguish","appal","appendix","assassinate","ax","badminton","batch","blackboard","blade","brevity","buffet","cellar","cemetery","coarse","comet","cordial","cosy","darling","deduct","degenerate","dew","discrete","drip","eclipse","electrician","electron","encyclopedia","enquire","equator","forehead","fright","fringe","gang","garlic","generalise","graceful","harassment","henceforth","idiot","inaugurate","intercourse","ivory","kettle","kite","knob","lantern","lid","longitude","lyric","manoeuvre","melon","microphone","militant","mist","mosaic","mosquito","mushroom","mutter","napkin","nephew","noodle","nostalgic","oath","obsolete","overhear","paralyse","passerby","paw","peanut","pillow","porcelain","radiant","redeem","reel","relish","remainder","riddle","salient","sane","seam","shutter","siege","slipper","snobbish","sprout","stagger","static","stool","streamline","summarise","supersonic","swan","symmetry","tempo","temporal","tiresome","trifle","tub","understanding","valve","variance","vase","vest","vibrate","volatile","volt","waterfall","wax","whirl","witch","wool","wrench","wrinkle","according to","accustom","adverb","air conditioning","albeit","analog","apologise","April","archeology","artefact","August","aural","Bible","botany","bowel","bowling","brace","brandy","buffer","cabbage","Catholic","Christ","Christian","Christmas","cigaret","civilise","clockwise","clothes","cock","colonel","communism","concurrent","corrode","cradle","cunning","cylinder","data","daunting","deceit","December","decimal","desolate","despatch","dialog","dove","Easter","ebb","economics","embassy","fable","farther","February","following","fragrant","franchise","Friday","further","gaol","gay","glamor","goods","grease","grown-up","headquarters","him","horsepower","hound","howl","hysterical","ice cream","inflict","influenza","infrared","instalment","Internet","invoke","January","jug","July","June","lash","Latin","leading","left","linen","living","living room","locomotive","magistrate","majesty","March","married","Marxist","mathematics","May","means","media","millimetre","mischief","missing","mistress","mob","mobilise","modernisation","Monday","mug","naughty","normalisation","northwest","November","oar","o'clock","October","odds","ought to","outskirts","overt","owing to","pants","parasite","peep","persecute","physics","pistol","plaintiff","politics","preceding","proceedings","projector","promising","prophet","provided","proximate","qualitative","quarantine","quart","queer","quilt","quiver","razor","rectangle","regarding","remains","reptile","resultant","rim","salute","Saturday","scissors","September","serial","sniff","so-called","socialism","soluble","species","spine","sponge","sprinkle","squirrel","statistics","sting","stocking","strenuous","strife","striking","sulphur","Sunday","surroundings","sympathise","tanker","Thanksgiving","them","thigh","thorn","Thursday","topic","towel","trousers","Tuesday","typhoon","underlying","up-to-date","us","used","vein","velvet","vinegar","waken","Wednesday","well-known","wicked","wink","worse","worst","X-ray","yours","yourselves","zigzag","zoom"],"definition":["这个、这些","是、存在","一、每一","目的、终点","的","和","在…内","有","那","它","为了…、因为…","在…上、持续","他们","你","伴随","作为、既然、随着、就像","他们的","方式、到…为止","不、没有","他","从…、起点","在…位置","将、会","更多的","做","我们","段落、通道","这","或者、否则","能","我","一个","但是","问题","人民、民族","什么","那里","好、井、涌出","关于","回答","制作、使得","比","他的","时间","说、说明","工作","哪个、什么样的","当","应该","部分","你的","使用","一切","跟随","她","谁","每个","一些","其他","如果、是否","年","写","新的","部分、地段","它的","说话、单词","标记","可能、祝","拿走、携带","很多","最多的、大多数的","读","在...上、完成","她的","仅仅","愿意","去","听到","给","基础、基地","否定","因此","得到","二","学生","我们的","出去、外面","只、仅仅","孩子","如何","发现","方式","进入内部","因为","被单、（一）张、纸","男人","喜欢、像","通过、穿过","女人","学校","认为","世界","选择","改变","方向、指令","许多的、非常","生命、人生","长","学习","需要","第一","帮助","四","工作","学习、了解","高的、高","现在","好的、货物","在…上方、结束","然后","分钟、微小的","在…之后","住、生活","知道","排队、线","这些、这些人","成为、适宜","作者","能够","甚至","也","来","这样的","意思是、意味着","信件","看","三","那些","结束","曾经、一次","公司、陪伴","对话","问题","大学","人","陈述、状态","想要","必须","食物","国家","选择","任何","我的","日子","更少","协议、符合","展示、展现","两者","社会的、交际的","非常","巨大的","事情","信息","看","太…、也","商业","在…之间","研究","在…之前","数字","单一的","拥有","感觉","家庭","经常","老的","父母","增加","段落","提供","很少","家","当…时、而、尽管","不同的","点、指","最后的、持续","文本","相符合、相当","教育","放置、地点","支付","语言、风格","仍然","保持","哪里","预定、书籍","政府","大学","第二的、次等的","听","为什么","系统","放","空白的、失色的","可能","结果","尝试","钱","问","似乎","说","新闻","例子","同样的","重要的","正确的、权利","报告","相信","电脑","公众的","健康","远的","年轻的","大的","打电话","城市","发展","开始","另一个","中心、中央","想法","在…期间","科学","允许","年龄","离开","每个","说","需要、要求","车","声明","社会","短","造成","在…下面、情绪低落","技术、工艺","成长、增长","句子、判决","没有","小时","背面、后退","经济上的","大","开始","带领","建造","早期的","关闭、不在原处","花","少、小","银行","困难的","花费","班级","小组","价格","效果","理解","在今天、现今","告诉","设定","某事","玩、扮演、戏剧","很可能的、大概","翻转","课程","购买","理解","提供","服务、公共设施","小的","产品","经历","建议","决定","测试","科学家","带来","自从、因为、既然","但是、然而","人","教师","周围、环绕","是否","未来","理由","景观","水","改进、提高","关心、在意","益处、好处","低的","项目","工人","市场","教","支持","在……之中","仁慈的、种类","朋友","技术","然而","形式、形成","包括","移动","相当的","创造","从不","世纪","坏的","吃","总是","最小的、最少的","面对","计划","考虑","工业、行业","他们自己、他们亲自","过程、进程","比率","事实","房子","文化","力、功率","分享","地区、范围","百万","很、许多","感觉","失去、失败","相对、相反","上升","精力","控制","空间","情况","握着、坚持","可能的","能力","动物","足够","价值","角色","周末","个人的、独特的","手","打开","十","条款、期限","离开","发生","下降、掉落","自我、自己","艺术","决定、决议","兴趣","驾驶、驱使","问题、期刊、发布","生产","完全地","在…之下","活跃、活动","国家的","大脑","水平、等级","有能力的","跑步、运转","过去的","赢","呈现、提出、礼物、现在","质量","困难的","容易的","趋向于、照料","减少","五","预料、期待","订单、命令、顺序","法律、法则","环境、自然环境","纸、试卷","思维、想法","孩子","经济","百分之的","睡眠","近来的","一半","关闭、近","注意","贫穷的、可怜的、糟糕的","自由的","身体","衡量、测量","办公室","旅行","主要的","教授","自然的","保持","尽管","下一个","设计","历史","国家","真的","几乎","顾客","科目","以前","聚焦、焦点","当地的","确实","确定的","从来","成功","晚的","真实","名称、命名","知识","压力","事情、问题、重要","涉及","举起、提出","识别、鉴定","保持、停留","人口","风险","中等的、媒介","缺乏","强壮的、强烈的","填","有耐心的、病人","规则","直到","继续","收到","已经","记录","雇工","卖","笔记","月","社区、共同体","要求","个人的","反而","挑战","存储、商店","检查","处理","机会","关系","清单","通常、平常","平均的","尽管","眼睛","打破","快","普通的","条件、情况","行为","全球的","内部","不同","点亮、轻的","生长","购物","遇见、会见","关心、涉及","任务","科学的、细致严谨的","努力","植物、工厂","鼓励、发展","职业","衰退、破产","影响","避免","音乐","增加","政策","物品、条款","强迫、迫使","成员","解释","翻译","一边","享受","切、砍","大人、成人","国际的","训练","一般的、总的、将军","自然界、性质","类型、输入","医生","妈妈","情况","几个","保存、拯救","论文","游戏","毕业、获学位","十年","医疗的","错过、想念","列车、行列","第三","采访、面试","阻止","财政的","到达、达到","职业的、专业的","标牌","地球、泥土","项目、计划","产生、一代人","标准","战争","故事","丰富的","后来、其后","再次","空气","夜晚","包含","主要的","很快的","声音","爱","账户","回归、返回","影响","解释、翻译、转变","肯定的","描述","目的","满的","房间","出现","冲击","一段时间","电视","相当的","位置","态度","机器","清楚的","田地、场地、领域","经过","在…下面","这里","沟通","保护","表演","讲座","因素、因子","顶端","牢固的","画画","记忆","全部的","作家","观看","死亡","白色的","学术的","携带、承受","重要性","拒绝、下降","索要、声称","模型","错误的","专家、专门的","携带","行为、行动、扮演","发送","接受","潜在的","温度、程度","资源","暂停","意见","收入","数量","疾病","站立","政治的","受欢迎的","论述、争论、争吵","自然科学的、肉体的","团队","行动、行为","材料","证明","比较","比赛","没有","也许","私人的","请、使愉快","前往","街道","可行的","当前、电流、趋向","男孩","目标","丢失","证据","一共","加速","中间的","沿着","销售","生产","年级","参观、访问","内容、目录、满足的","来源","安全","压力","间隙、分歧","穿过","让","依赖","尤其","现代的","仅仅","农场","接近、方法","更正、纠正","特别的","希望","某人","扬声器、说话人","智力","图片","调查、测量","每人","事件","两者之一","步骤","习惯","责任","相似的","必要的","机会","国外的","应用","父亲","驾驶员","油","任何事","进入、存取","体育运动","存在","优势","报纸","记得","同意","经理","着陆、土地","解答","功能","经营、管理","短语","实验","结构","每件事","坐在","寻求","消息","每、经","促进","算计、人物、数字","路","限制","有时","恐惧","供应","争论、论据","讲述、使相互关联","有效的","阻止","模式、图案","宝贝","搜索","它自己","回应","超越","看待","读者、读物","严肃认真的、严重的","近的、亲近的","服务","总统","气候","心","黑色的","交通","走路","决定","获得、增加","演讲、言语","颁奖、奖励","准备","除了……之外","公布、出版","数字的、数码的","遭受","精神的","积极的","外面的","派对","梦想","不断增加地","交易","贡献","喝","因此","他自己、他本人","实现","冲突","麻烦","几乎","女孩","状态","锻炼","各种各样的","基本的、根本的","健康的、适合","在…上面","发生","提及","死","城镇","保持、维持","等待","失败","构成、作品、作词","出席、照看","批评的、关键的","单独的、仅仅","会议","税、对……征税","特征、容貌、以……为特色","表达","转移、转换","百、许多","简单的","成功的","一千","理论","钥匙、关键","形象、肖像","情侣、夫妻","谁的","抓住","选择","卡片、纸牌","覆盖","挣得","农民","趋势","吸引","干净的","方法","承诺","渴望","谎话、说谎","健康的、有益健康的","休息","困难","网络","十亿、万亿","细节","破晓、开始","正常的","回报、报酬","发布、张贴、邮寄","烹饪","在…上面","因此","向、朝向","探索、发现","在…后面","介绍","其他","掉下","装置、方法","法庭、球场","药","温暖","范围","解决方案","重要的","特定的","时尚","表明","事故","慢的","六","附上、附加","尊重","错误","快乐的","信用","贵的","完成","深的","账单","火、开除","景点、站点","时刻","信仰、相信","博物馆","最终地","演说、地址","概念","犯罪","损害","消极的","大小","饭馆","联邦的","劳动力","进步","机器人","运动","天气","错误","推断","进入","收费、索价、充电","医药","吸引、使参加","实行的、经理","广泛的、宽的","多样化、种类","比赛、竞速","目标、物体","管理、设法做到","医院","官方的","大的","雇佣","酒店","对待","演奏、执行","雇主","文学","利润","文章","体重","旅行","投资","预期的、到期的","样子、方面","穿着","定义","平衡","使能够","消费、消耗","性格","危机","美元","绿的、未熟的","移民","联系","冷的","现实、真实的事物","部门","评论","板","后果、结果","风格","打斗","建议","饭","担心","工具","浪费","预测","尽管","早晨","运营、操作","工业的","阶段","杀","具体的、详细的","高度地","购买","指挥者","有意义的、重要的","感受","替代","你自己、你亲自","打印","形状","三十","地面、场所","屏幕","斗争、奋斗","放置、躺、位于、说谎","大海","忘记","扩大","跨过、穿过","多种多样的、倍数","妻子","知识分子、知识的","资金","实施、开展","径直的、直接的","确保","安全","地区","旅行者","法律的、合法的","连接","反射、反映、思考","目标","丈夫","下划线、强调","值得","自由","假设","显露、展现","贫穷","前进、提高","南、南方的","烟","实际的","男性、男性的","商业的","凝视、同伴、贵族","攻击","假日","有限的、有限责任的","推","二十","警察","电影","复习、回顾、评论","试图、企图","财富","联系、结交","偏好","标题","有创造力的","信任","有病的、坏的","盒子","哭泣","几乎不、仅仅","应负责的、可靠的","追踪、足迹、痕迹","警告","总共的","取得","瓷器","课本","额外的","电子的","忽视","幸存","鸟","重的","燃料","杂志","夏天、夏季的","复杂的","危险","（一）件、碎片","选项","遍及、到处","图书馆","提及","机构","呼吁、吸引","背景","同事","想要（做某事）","策略","绘画","确切的、特定的","日记","同意、授予","工厂","权力、权威人士","协会","树、爬上树","到、达到","准备好的","便宜的、不值钱的","专利、专利的","航班","传播","花费","有名的","确实","建立、查实","观察","首领、主要的","安全的","也不","脚、走","讨论","机构","教育","竞争","希望","员工","改编、适应","老板","除非","失业","固定、修理","规模、刻度、天平","可能、可能的事","应用、申请","参与者","一致、联合","威胁","情感","西方的","结婚、结婚仪式","容量、能力、生产力","分数","明显的","关系","课、教训","乘客","代表","英里","定期的、常规的","采用、收养","声音","电影","特征、独有的","参加","运转、动手术","污染","讨论","延伸、延展","恰当的","比赛、匹配","日期","古老的","多数、半数以上","好奇、奇观","森林","独特的","发现、调查结果","气体、天然气","分开","观众","车站","碳、复写纸","女性、雌性","总结","雇佣、采用","总结","道德的","表达、措词","墙壁","温度","原则","获得","邮件","消耗、耗尽","意识的","物主","教室","校园","痛苦","援助","怀疑","冰、使结冰","细胞","信任","想象","口味","居民、居住的","平等的","年长的、资格老的","正餐","革新、新方法","挑","全面的、总体上","成功、接替","击打","检查","指令、教导","癌症","判断","划分","依靠","以前的、前者","例子","释放、解除","前面的","伤害","伙伴","地面","暗示","移除","传统","收音机","词汇","打猎","时钟、计时","假设、揣测","邀请","收集","运动、战役","本地的、天生的","有趣的","不足","改革","公司的、法人的","强有力的","中心的","效率","性别","危险的","城市的","出现","种类、排序","提高","圆的","连接","前进的","处理","债务","饮食","联系","颜色","门","热的","人格","最终","制造、捏造","海洋","北、北方的","化学的","承担得起","糖","苹果","噪音","雇用、工作","主张、倡议","大量","形成对比","理想的、空想的","西、向西","交通工具","在里面","回答、响应","七","礼物","艺术家","双的、使加倍","新颖的、长篇小说","页码","停车、公园","大量地","分(货币单位)","分析","轮廓、提纲","公民","代码、法典","力量","陈列、显示","高级的","儿子、孩子","太阳","谁、哪个人","预算、做预算","聪明的","礼貌、礼仪、方式","探索","估计","无论什么","作物、收成","品牌","发射、使船下水","农业","扫描","规定","护士、护理","暴露","生物、生存","真相","距离","数数","打","票","结合","禁止","一点","不可能的","原子的","基础","往上推、增加","雨","预留","狗","生产力","纪律","座位","革命、旋转","奖","初级的、最初的","先前的","吸引人的、动人的","传达、交流","灾难","股票、库存","迅速的","飞","热","候选人","身份","修理、补救","八","眼泪、撕碎","网","报刊、新闻界","最初的","会议","发现、污点","信号","产生、引起","预期","经济衰退、退后","给穿衣","灵巧、天资","直接地","我们自己、我们亲自","公车","拒绝","燃烧","减少","脂肪","桌子、表格","样品","金子","获得","在…前面","家庭的","机场","肥胖","客人","威胁","公平的","结婚","历史的","正式的、形式的","犯罪活动、罪犯","熟悉的","友好的","行星","奇怪的","有用的","完美的","基因的","竞争的","巨大的、大量的","系列","传递、传输","设备","访问者","财政收入","部分、扇区","通知、告诉","两次","感谢","疾病","总共、完全地","福利","血","卡路里","她自己、她亲自","聪明的","引用","指引、指导","户、家庭的","学生、瞳孔","保险","批评","交换","船舶、装运","标签、加标签于","与……不同","把…交托给、犯（罪）","承认","客观的、目的","贡献","上下文、环境","抱怨","很好","教堂","放弃、屈服、收益","泥土、国土","租","录像","兄弟","首都、大写字母","情况","说明、加插图","目标","漂亮的","活跃的、积极的","日程","窗户","改变","敏感的、易受伤害的","聚集、搜集","要求","批评者","财产、性质、特性","排除、淘汰","人造的","工程师","两个都不","忙碌的","触摸、感动","出现、外表","工程学","青少年","排列、等级","治愈","秘书","圆","欢迎","开关、改变","抱怨、疾病","口译、解释","律师","现今","优先","军事的、军队","处理、应对","提议、提名","亲戚、比较的","性","拉","新鲜的","聚集、挤满","景色、前景","支付","技术的","鱼","出生","焦虑","常规、惯例","心理学","到国外、广为流传","喂食","才华、人才","虚构、小说","飞机","下午","鞋子","人文、人性","保护、保存","解释","流动","技术","醒来","伤害","组成、在于","主人、精通、掌握","笑","使人信服","推迟","宽的","足够的","大部分","不同的、不像","摧毁","肉类","工资、发动","视力、想象","富裕的","展览","块、阻止、街区","蓝色的","责备","正确的、适当的","投资","艰难的","星、恒星","实在的","语法","和平","否则","强调","有效的、能胜任的","幸存","逃跑","进口、进口商品","俱乐部","红色的","发明","发现","代理","支配、占优势","速度、行进","元素、要素","把……强加于","投票、选票","是","狭窄的","转移、传输","复制","改变","参与、分享","劝告、建议","贷款、借出","论证、说明","基础的、根本的","起源","推荐","有价值的、贵重的","加","合同、缩小","描述","酒精","地区","干燥的","傍晚","早饭","基因","招手","而且、此外","有能力的","普通的","加强","建议","现金","秘密","四分之一、季度","思想、想法","说服","软件","害怕的","偷","进化","公司、法人","作业","视野、景象","运动员","结果","表面","相隔、分开","愉快、乐事","进入","公平、审判","电、电学","注意、通知","最终的","罕见地、几乎不","隐私","电子邮件","骑自行车、周期","卫星","负担","君主","薪水","山","宗教的、虔诚的","保障","每年的、全年的","减轻","电话、打电话","花园、园艺","舒适、安慰","请求","基础、地基","午饭","引擎","符号、象征","地震","形成、上升","部分地","存在","快的","情愿的","好奇心","幼年","系","攀爬","网、净的","没有","遍布的","茎、词干","抛弃","英镑、磅","习惯、惠顾","费用","岛","合适的","喜欢、赞同","使安全、争取到","出席、存在","运输","独立的、私营的","概念、见解、打算","区别、使有特色","收藏","观点、判断力","小心的、细致的","玩具","友谊","扔","雄心、志向","巨人、巨大的","定义、清晰度","高度、身高","拒绝","消失","典型的","黑暗的、深色的","适合","退出","领导","表现","激发","青春、年轻人","暴力、狂热","监视器","厨房","现象","医师","男演员","程度、范围","跳","部分、比例","蛋、卵","追求","错综复杂的","括号","太阳能的、太阳的","责任","回忆、召回","冬季","助手","咖啡","外国的、在海外","碰撞","河流","周末","管理、政府","过多的","小道","盛产的、富有成效的","巨大的","保护、保存","催促、敦促","集中","印象","全世界的","不严格的、自由的","立即的","退休","床","女儿","物质","克隆","委员会、委托","解决、定居","坚持","编辑","学者","机构、建立","不平常的","稀少的、稀薄的","快乐","九","顾客、委托人","节省、储蓄金","安静的","认知的","闻","附加的","塑料、可塑的","官员、军官","智慧","移动的","情绪、心情","症状","漠不关心的","忽视、疏忽","改变","明亮的","恢复、重获","名誉","错误","通货膨胀","气氛","宗教、信念","根、根本","严重的","否定","评估","极端","介绍、传入","很少的","末端、小费、提示","少数","相关的","酷、使冷静","值得、应得","重复","政治家","摆姿势、造成、提出","主席、椅子","美好的","器官的、有机物的","重要的","备选的","取消","深度","蛋白质","职业","专家","仅仅的","相反的、对立面","拥有、具有","认出、承认","属性","链","遥远的","明天、来日","洲、大陆","减少、降低","每日的","百分比","版本","戏剧性的","刺激、使兴奋","安排","能力、院系","赞美、表扬","志愿者","石头","章节","与此同时","察觉、理解","仅仅","吸收","属于","弱的","事情、事务","本科的、本科生","分配、指定","任务、使命","欢乐","公路","公布、出版","诗歌","通常的","必要、必然性","调整","宣布","暴露、揭发","承认","想象","指出、位于","刺激、动机","受害者","航线","自信的","偏爱","赞同","借","任务","可靠的","资产、天赋","坚定的、经常的","空闲、悠闲","相当大的","美丽、美人","巨大的、大规模的","理事会","完全的","相反的、倒退的","文档","掠过","乐观的","稍微","有技能的、熟练的","欣赏、感激","招待、娱乐","谁也不、小人物","满意、乐事","恢复","房间、公寓","姐妹","盘子","证明…正当","死去的、麻木的","仪式","在别处","步骤","不太可能","严格的","棍、刺、粘贴","观察、言论","传达、输送","虚拟、实际上的","使泄气","拥堵、果酱","位置","教练","优点、价值、值得","机会、重大活动","瓶子","后果、言下之意","不可避免的","风","惊讶","独立","在旁边","结合、约束、捆绑","捕获、战利品、拍摄、引起注意","满意、使确信","招募、新兵","皮","零售","生病的","谷物","渴望的","提议、求婚","摘录","简短的","水果","场景","隐藏","输出、出口","展览会、陈列","长度","耕作、培养","边界","边、刀口","回收","宝藏","细菌","选择、精选物","支撑、忍受","每人","有帮助的","工具、乐器","疲惫的","头发","允许进入、承认","不顾、不管怎样","空的","春天、跳跃","山谷","衣物","很好的","宇宙","追求、追赶","神志清醒的、意识到的","笑","使面临、勇敢地面对","假定","同等","玻璃、玻璃杯","给……题名、给……权利","敏捷的、提示","怀疑","精神","英雄","野生的","肌肉、体力","击败","最高点","手臂","起皱、减少","过渡、转变","优秀的","删除","种族的","使……困惑","目击、见证","枝、分部","文学的","提及、参考","部长","注册","宣布","到处","发明","可能、大概","容积、音量（一）卷","条、酒吧","东、东方的","重新开始、恢复、简历","青少年","跳舞","小山","季节","然而","代表大会","五十","紧迫的","类别","婴幼儿","方便的","战斗","易受攻击的、脆弱的","委员会","乐队、带子","足球","穿","假期","合理的","奇数的、奇怪的","重要性","考试","查明、发现","主持人","地产、遗产","主动性、进取心","离婚、断绝关系","争论","精确的","褐色的","雪","证实、确认","生的、未经训练的","单元、单位","挂","称重量、有影响","精英","审判、试用","使发展","误导","区分、卓越","自动","工艺","丰富、大量","蔬菜","课程","灵活的","猫","皇家的","使显著、强调","评价、评论","比较","管理、调节","相反的、对方的","冲","互动","紧张的","包、袋","计划、密谋","警报","遗弃、沙漠","海滩","使用、用法","例外的","内部的","邪恶的、坏的","周围","底下","扩张","然而","执照、许可","旅行","预期、先发制人","剥夺","财政","缺席","指导方针、指导原则","路线","无论何时","固体的","提取、利用","我自己、我亲自","种子、播种","抗议","顺从、递交","音乐的、音调优美的","记者","裁判","繁荣","公正地、相当地","稳定的","比赛","不合法的","区域","除了之外、而且","哲学","修改、缓和","乡村的","神、上帝","不情愿的、勉强的","尖的、清晰的","充足的","牛奶","神秘","读写能力","紧急情况","桥","草","奴隶","特权、优先权","恢复、归还","沮丧、难过","同行","加速","时代","错误的","统一的、制服","一对","有利可图的","监狱","呼吸","障碍","养育、繁殖","绘画","段","水坝","基础设施","风景","援助","决定性的","粉丝、扇子","岩石、震动","奉献","永恒的","广播","桌子","温室","看的","电的","奢侈、奢侈品","高","入口","点心、易办到的事","老鼠、卑鄙的人","频道、隧道","回复","美德、优点","损伤","提醒","特征","柜台","评估","牺牲","音调、腔调","较小的、较少的","东西、材料、填满","总和","作弊、欺骗","使受伤、损害","优良的、较……多的","处理、应付","最大的","学费、教学","预约、任命、职位","成分","空闲的","旅行","钢","在…之下","折扣","痕迹、微量","不幸地","实验室","皮带、地带","行进","趋势","完成","毁灭","娱乐","大厅","遗憾、后悔","家具","骑","很糟的、可怕的","海岸、沿岸航行","照相机","障碍","手指","间隔、休息","组成、建立","北方的","好斗的、有侵略性的","有影响的、权势的","根本的、彻底的","滥用、虐待","南方的","初等的、简单的","发动机","报告人","商业、交易","使紧张、拉紧","解决、决定","繁荣","借口","深刻的","士兵","合理的","木头、森林","拥抱、接受","幸运的","极小的","呼吸","最初的、首要的","营地","花朵","洪水、涌进","村","破坏","纽带","武器","盐、腌","二氧化物","赌博、投机","保守","面板","偏见、损害","荣耀","维生素","交易、业务","如释重负","公民的","镜子","昂贵的","加上、正的","薯片、芯片","插入","船","引用","主席","后者","困住","偏见、偏重","照片","竞争","混乱、骚乱","失明的","在上面、到上面","骄傲","缓解、救济","烟草","建造、创立","偶遇","征服","赞助、资助","卡车","装备","起初的","最爱的","时刻、立刻","最低的","邻居","小区、社区","最重要的、负责人","证据","文件","调查","包裹","真的、真诚的","音乐会","直升机","业余爱好者、外行","例外","事件","允许","核心","想不到的","几乎不","在任何地方","同事、同辈","创立、建立","占领、职业","对手","军队、陆军","递送、分娩","伸展、延伸","警报","热忱的","偷窃","民族的","历史学家","最高的、最优的","限制","民主的","补偿","薄的、稀薄的","焦虑的","钦佩、羡慕、欣赏","保卫","意图、打算","倾斜、倚靠、瘦的","慷慨的","诚实的","肩膀","内部的、内心的","抵挡、抵抗","天空","艺术的","海的、船舶的","明智的","立法","欠、归因于","电影院、戏剧","争论","冒险、敢于","光线、射线","常常","谦虚的","员工、人事部门","倒塌","生气的","广泛的","度假村、被迫采取","帮助","昆虫","洞察力","金属","附近的","令人兴奋的","冻结","湖","水平的、公寓","借出","咨询","中断、打断","听写","将要","高兴","天才","远的","多种多样的","命运、财产","胜利","反馈","唤醒、激发","悲伤的","主题","正方形","防卫","促进","软的","结合","摇","世故的、复杂的","猴子","数据库","习俗、会议","企业、事业","临时的","依靠的、取决于……的","有智慧的、英明的","值得注意的","马","数量、数额","致命的、宿命的","游说、门廊","冷静、镇定","同时代的、现代的","流行、占优势","诡计、技巧","谨慎的","转变","好奇的","埋","旱灾","池塘","使确信、担保","版本","引诱、引起","部分","同学","宏伟的","脱去、棚","自豪、自满","足球","同情","机制、方法","所有","发源、开创","航空器","伦理","外部的","普遍的、宇宙的","反应","代表、有代表性的","大量的","资格","保留","嘴","投票","经过","神话","稳定","出租车","滑","口袋","化石","女士","滚动、卷","论坛","准备","运气、好运","奖学金、学问","栏杆、铁轨","院长、主任","俯瞰、忽略","保卫、防守","解散","加强","打扰","克服","学院","超级市场","有雄心的、艰巨的","屋顶","小偷","积累","孤独地","加仑","导师","铁路","整合","不包括","随意的","东方、定位、使适应","组成部分","一打","繁荣","糟糕、严重地、非常","削弱、贬低","模仿、仿造","强烈的、热烈的","占据","分发、分配","阶段","密集的","修改","直接的","超过、越过","一瞥","实施、工具","慢性的、长期的","杯子","养老金","风暴","下沉","有益的","装货、装载","浪漫的、不切实际的","架子","目的地","陪伴、为……伴奏","锁","陪审团","幽默、诙谐","称心的、可取的","动、提议","储存、库房","商品","谈判、协商","妥协","忍受、持久","免疫","愉快的","庆祝","命令","跨度","规范","危险","共同的、关节","职员","逮捕","词典","讨厌","魔法","许多的","射击","歌曲","编织、针织","读物、读数","哲学家","陌生人","不为人知、晦涩难懂","信心、信仰","震惊","努力、斗争","抓住","热情","解决、移民地","突然的","生物学","原谅、国会","地图","处罚","牙齿","昨天","使转向、使分心","敌人","抽象的、摘要","汽车","饥饿的","激发","所有物、财产","拯救","计算","小路、泳道","提起","集合、装配","摆脱","上面的、较高的","宠物","碟子","图表","到达","王国","组成、作曲、撰写","快捷地、乐意地","云","妨碍、介入","诗人","精神、灵魂","活着的","用、运用","先驱","惩罚","与…相似","干涉","平的、朴素的","怒气、使发怒","老虎","菜单","飞行员","暴力的","使厌烦、钻孔","更新","奶油","吨、大量","炸弹","苏打","随机的","产量、输出","延长","赞成","延伸","外科手术","关上","响起","平台","强迫","电池","便利","硅","留下印象","饥饿、渴望","稻、大米","悲剧","警察","疲劳","小麦","形成","草稿、起草","支配的","动词","流行性的、流行病","冲动","庇护所","微妙的、细微的","向前、离开、产生、拿出","强迫","配偶","张力、紧张","廉价货、交易","小鸡","广泛的、全部的","限制","每周的、周刊","培养、培育","营养","市郊","外国人","界限","符合、遵照","开发、利用","手势、姿态","义务","甜的","不在场的、漫不经心的","赤字","模式、状态","粗鲁的、简陋的","机械的","统治、决定","明显的","爆炸","使得、给予","层","融化、溶解","谨慎、警告","传送、发射","自动的","球体、地球","分开、部门","继续进行","迫使","原始的、简单的","稳定的","领土、领域","画廊、长廊","较低的、下级的","维护","角落","流行的、突然出现","在某处","控告","中立的、中性的","更新、补充","十五","收获","鼠","狐狸","液体","祖先","胜利","民间音乐、人们","内疚","允许、许可","倾倒","相同的","终极","过剩、过量","溪流、流淌","恶习、邪恶、缺点","煤","挫折","最后期限","拼写","阻碍","耳朵","会议、阶段","喜欢","音乐家","叙述","传统的、古典的","不喜欢","学期","省","列","因此","名人","优先的、在前的","永远","机械","人口普查","消退、消逝","上瘾","无论如何","宽容的","结构","抑制","企业家","预测","有争议的","梯子","月球、月亮","反对","津贴","混乱","热情","以某种方式","生日","下级、较差的","伪造、假的","频率","堆","现实的","治疗","脏的","打扰","传记","杰出的","塔","婚礼","痛苦的","限制","装配、召集","殖民地","轮子","逐字地、简直","有价值的、值得的","裂缝","惊慌的","升级","补充","直到……为止","化合物","装饰","粗糙的","范围","打广告","幻想、想象","同情的","聪明的","时髦的","匆忙的","有机体","忠诚","禁止","联盟","版权","专业知识","腿","恶意、怨恨","自杀","收购、习得","杆","民主","因此","名声","履行","合理的、符合逻辑的","人类","货币的","鼻子","战斗","动机","变化","严厉的、恶劣的","提供、供给","脾气","耗尽","持有者","语言的","我的、矿","仆人","反射","面包","金色的","宝贵的","住处、和解","魅力","一致的","不同的","编辑","家务","一生","衬衫","在其间","相同的","指导","夹克","缘故、目的","病毒","受伤的","啤酒","难民","小睡","古典的","顺序","系统的、成体系的","地平线","明显的","指导","被动的","生物","凶猛的、激烈的","混合","触发","提示、暗示","失去能力","敌对的","诚实正直、完整","精确的","压制、镇压","吹","骨","门","丰富的","装置、应用","放松","光滑的、顺利的","食欲","货币","洗衣","自行车","裙子","东部的","狮子","厕所","内疚","宽容、容忍","平行的、类似的","本能","保险费、优质的","航天飞机","集体的、共同的","闪","连续的","抵抗的","变量、多变的","可见的","退出、撤退","复杂的、详尽的","猜测","不可缺少的","扫地","具体的、确实的","电的","统治者","倾斜、斜坡","山","坦率的","栖息地","破坏","陪伴","争吵","抱歉","办事处","遗产","面具","外套","农村","动力、动态的","版式、设计","次要的","硬币","存款","安装","巨大的","自愿的","精确度","银","羞愧","耐心","模棱两可的","可疑的","礼貌的","勇气","贵族的","暂停","逐渐削弱","深思熟虑的、故意的","操作人员","代替","车费","污染","突出的","厚的","丰富","家伙","语言的","代表","容忍","独特的、特殊的","半球","纯粹的、纯的","前景","后方、培育","可比较的","投射、铸造","相互的","组织","行、排","欢呼","强度","培育","尊敬","解放","网球","接受","共识","棉花","神经","坚持","经历","钱包","洗","睡着","命运","聊天","四十","印象深刻的","刺激、促进","禁止","理性的","脚后跟","绝望的、不顾一切的","十二","犹豫","索引","达到、获得","害怕、惊吓","任命、安排、约定","戏剧","令人满意的","论文","线索","击败","氧","球","独有的","头痛","会员","双胞胎","地下","向上","建筑师","顾问","举起、提拔","陷入、暴跌","接待、招待会","自夸","起诉","胶带","歌剧","大教堂","打招呼","敲","抵押","垃圾","刻板","体面的","研讨会","零","冒险","喜爱、感情","宪法","明确的","漂移、漂流","努力","扩大","矿物质","令人厌烦的","灌木","诗","分散、散布","擦除","难以置信的","技工","热情的","繁荣","英寸","肺","框架","轮廓、简介","少年","砖","规定、口述","器官","钢琴","扭曲、捻","无论在哪里","凝视","年资较浅的","地铁","金字塔","补救、治疗","成熟的","泵","热带的","厨师","垃圾","打包","内部","责任","出价、投标","粗鲁的","标准","逐渐的","反对","姓","激活","诉讼","出口","隧道","无知的","挤压","点击","绅士","看不见的","撤退","化学","操纵","迁移","某人","诊所","枯燥的","紧的","精彩的","适应、容纳","破坏性的","追逐","陡峭的","行为、事迹","闪电","娱乐","改进","邮票","囚犯","推销员","摘要","垄断","剂量","总的","笑声","小径、踪迹","抛弃、丢弃","绝对的","分类","节日","探索、寻求","怀孕、设想","低估","打赌","密度","处方","抵抗","先生","跳跃","复制","革命的","害羞地","刷子","电影院","本质","枪","居民","势头","盯着","游荡","非凡的","擦亮","轻微的","坦白的、直率的","不幸","抢劫","外科医生","传输","轨道","预定","闪亮的、聪明的、出色的","小玩意儿","操场","房客、租户","值得的","断言","神秘的","部分、薄片","篮球","固有的","六十","头条新闻","指定","标签","利润、边缘","提取","议程、日程","笑话","悲观的","曲调","道歉","大声的","描绘","迸发、爆发","兴奋","地理","普遍的","沉默","理论上的","谋杀","严格的","服务员","玉米","自己","阴影","舌头","兴趣","笔记本电脑","马铃薯","假装","进餐","发音","溶解","推测","构成...的基础、在...之下","先于","配额","盈余、过剩","激烈的","以免","监督","有义务的","参议员","废除","预见","艰难","激素","接受者","怀疑","落后","假设","复苏、唤醒","承担","不足、缺乏","登记","和平的","认识到、体会到","像","精神的","幸运的","温和的","诱惑","酒","迎合","捐赠","坟墓","有历史意义的","合并","物理学家","猎物、捕食","愚蠢","有毒的","衣领","情节","彩虹","纯然的、陡峭的","唱歌","翱翔、高飞","工作室","停止","托儿所","探险队","户外的","电路","简化","合作","火山","认为","无处","竞争、争辩","易碎的、精致的","数学的","外面的","津贴","跳过","笨拙的、令人尴尬的","模糊地","缆、电缆","放射","手册","开处方","壳","故事","钟、铃","有能力的","帽子","声望","愚蠢的","分开、划分","裁缝","室内的","冒犯","宣传","避免、克制","珍爱","下降","实体","偶然的","十四","油炸","综合症","鲸","铅笔","监视、间谍","停止","折叠","光线、发射","宪章","关联","离开","漂浮","系列、序列","订婚","肥沃的","傻瓜","火箭","外星人","设计","夸大","继承","亲密的","选择","我们的","军队","困境","拼写、咒语","激动","部落","博客","致命的","有利的","群","蒸汽","脱衣、剥夺","判断","抓","湿的","蘸","忧虑、悲伤","练习","雕塑","温暖","垃圾场、倾倒","辞职","充满力量的","叶子","显示、显然的","钢笔","在旁边","大部分、体积","挖","选举","有趣的、滑稽的","无辜的","输入","胡说","生动的","牛肉","优于","然而","排队","征服","反驳","泄露","抓住","真实的、真正的","协调、坐标","髋","可行的","阴暗的","暗示","文盲","熨","嘴唇","画家","搅拌","苦的","消化","奇异的、外来的","懒惰的","遵守、服从","黄油","地毯","平民","别针、固定","黄色","馅饼","取回、恢复","浪漫、冒险故事","车间","帽子","同样地","轻蔑","女王","喷射、喷气式飞机","相识的人","海湾","咬","描述、描绘","维度","精确","岸上","肤浅的","统一","提供","宫殿","激怒","感激的","环境、背景","娱乐","任何人","手推车","顺从","人口的","模仿","发生率","邀请","磨","极好的","蛋糕","中风","激增","作证","母牛","徘徊、逗留","减轻","市中心","飓风","补丁、修补","茶","痛苦","主","大怒、狂怒","优雅的","缺陷","规划、制订","温和的、适度的","信赖","潮水、潮流","保证、誓言","猛咬、拍摄、突然的","无疑地","签证","翼","通勤","敢","精力旺盛的、能量的","旗","边境、边界","错觉","口号","船","估计","情节","迹象、指示","挨饿","引导、驾驶","优势","引诱、吸引","在…旁边","决定性的","发生","冰箱","表面上","观众","琐碎的","醒着的、醒来","有缺陷的","家庭主妇","干预","行李","密封","喊叫","居住","灵感","合并","闪耀、照耀","喊叫","欺骗","枯燥的","疯狂的","侵略","院子","字母表","天堂","好客、款待","粉红色","向后的、落后的","合法的","吸引、诱惑","严格的、僵硬的","子孙、后代","违背、侵犯","有毒的","沉默的","从而","紧贴、坚持","转移","小部分、分数","适用的","学士、单身汉","载体","洞","开始","交配、配偶","意义","大概、可能","收获、获得","刹车","日历","证书","堂兄弟姐妹","乳制品","腐烂","抓取、夺取","悲惨的","从业者","命题","合格","鞋底、唯一的","火星、引起","运动员","纸巾","损失、通行费","核实","强制的、义务的","网络空间","黎明","踢","市长","主观的","及时的","病房","包裹","高度","牛","村舍","淹没","帝国","无知","房东","预防","繁荣的","紧张的","对抗","分配","乞求","高兴的","感染","混乱","讨厌的","委托","潜水、跳水","跳跃","幼儿园","垃圾","护照","轻拍","潜在的、预期的","叔","蓝图","联合、联邦","望远镜","支票","共和政体的","仪式","消失","汽油","随后的","奖金","同意","气泡","紧握、紧抓","谦逊的、卑微的","海军","好交际的","蚂蚁","背叛","少数","紧急的、祈使的","估算、认为","严重的、敏锐的","城堡","体贴的","尊严","加强、增加","宏伟的","米","节奏、韵律","喉咙","整洁的","电线","悬崖","曲线","命运","暗淡的","悖论","重复地","解决方案、决心","喊叫","阴影","合作","县","恶化","方程式","橙色的","推迟","发音","彻底的","污染","爬、蔓延","糖尿病","醉酒","双重的","共鸣","超出的时间","牧师","轮胎","灾难性的","皮革","乘","鸽子","毒药","滑雪","游泳","说","虫","轮流","恶化","情绪","管子","忠诚的","管子、烟斗","疫苗","运河","概念","扭曲","重力","富于想象力的","市的","似乎是真的","社会学","爬","退出","阳刚的","抑制","怪异的、古怪的","明智的","大街","桶","机舱、小木屋","隐藏、隐瞒","十一","公式","篮子","合适的","巨大的","迁就、放任","圆木、原木","有吸引力的","七十","苗条的","超越","弯曲","慈善","澄清","反抗、藐视","感激","道德","天堂","王子","报复","先导、货车","冠军","国际象棋","巧克力","亲爱的","欺骗","恐怖","果汁","公主","淋浴","门槛","声音的、声乐作品","自治","多云的","悲痛","等级制度","很可能的","木制的","比较的、比较级","卡通","奖章","分离、派遣","耐用持久的","部分的、偏袒的","食肉动物","残忍的","修补、修理","渐进的、先进的","比率","订阅","策略","限制","牙科医生","俯卧的","提神","合作的","离开","忍耐","瞥见","（外）祖母","探测、探针","监视","缺点","次要的、下级的","拉、拽","开支","幻想","灰色的","侮辱","说服","塞、插头","启示","使恐怖、使害怕","算法","拒绝参加","一致","经销商","处理","发烧","原谅","草坪","小屋、门房","窝","药丸","光谱","火鸡","浴室","胸","愚蠢的","挫败、使灰心","灯","联盟","平板电脑","富裕的","内阁","碰撞","美味的","鸭","纪念碑","梨树","蜘蛛","堆","驯服的、驯养","帐篷","西红柿","头盔","奇异的、极好的","大都市的","克制","相应地、因此","绘图","八十","你好","惯性","最近","块","九十","丰富的","围绕","们的","和谐","崩溃、故障","猛冲","逃跑","幽默的","装备","放大","橡胶","参议院","十六","旋转","坦克、水箱","深思熟虑的","老兵","角","勇敢的","咖啡馆","恭维","全体船员","嫉妒","照明、说明","度量","分子","嘈杂的、吵闹的","粒子","住宅","污点、着色","有形的","混乱","五金器具","利用","传说","前提","拒绝","技术员","投掷、辗转","营业额","伙伴、同盟者","巡航","副手","日记","微弱的","克","无目的","货车","螺母、坚果","烤箱","过夜","摩天大楼","顶点","镜头","搬运工","练习","膨胀、涌","剑","空的","小提琴","哭泣","礼貌","厄运、注定","栖息","更好的","素描、草图","巨响、刘海","室","启发","混合","平底锅","珍珠","英亩","显著的、显眼的","脆弱的","巨大的","掀翻、推翻","推进","播种、母猪","炉子","徒劳的","大胆的","清楚","污垢、泥土","揭露、公开","包含","注入","织布机","宽敞的","宇航员","商讨","定罪","视力","织物","片段","操作的、运作的","电报","动物园","荒唐、可笑的","匿名的","奶酪","后裔、后代","向下","使尴尬、窘迫","可能性","风景","极限、最大限度的","无论哪一个","赤裸的、空的","承认","息票","释放","下水道、排出","垃圾","障碍","钩","可怕的","生气的、着迷的","马拉松","可选的","定位","坑","问卷","桩、赌注","胃","条约","处女","告知","归因于","可怕的","按钮","洞穴","相辅相成、补语","机密的","齿轮","安装","活泼的","轻便的","祈祷","翻新、革新","吞下、燕子","毛衣","垃圾","低声说、窃窃私语","不正常的","蜜蜂","大量、下倾盆大雨","缺陷","侦探","干扰","识别","松的","猪","壶","家禽","食谱","荒谬的","滑","纹理","胚胎","蒸汽","总理","推断","荣耀","树胶、齿龈","劫持","含蓄的、绝对的","文艺复兴","完全地","天花板","默认、违约","持续时间","恨","松弛的、淡季、萧条的","使成为一体","正直的、垂直","咀嚼","浓密的、密集的","有限的","不耐烦的","直觉","煮沸、沸腾","官僚","领悟","框架","妨碍","逻辑","批准、处罚","蛇","乳房","财政的","高尔夫球","领域","几乎不、刚刚","悲惨的","移植","档案、存档","走廊","处理掉、解决","领域","奢侈的","一群","杂种","无限","内在的、固有的","杰作","粗俗的","航空","温和的","泥","导航","缎带","丑闻","线","疼","循环、流通","咳","甲板","文凭","大象","女性的","车库","小屋","帝国的、皇帝","内阁","脖子","裤子","害虫","海报","代词","调和、一致","柔软、投标","总理","拥抱","丑陋的、惹人厌的","意识形态","激光","遗赠物","意味着","钉、钉子","经纪人","王冠","杠杆","可能性","肢体","表明、声明","摇摆、秋千","等候","喜剧","谴责","灰尘","过滤","流体","偶然地、附带地","游行","铺路","初步的","盾","终止","拖","不安的","编织","模糊","沉思、打算","区分、辨别","英俊的","确保","复杂的","善良","收据","揭开","崇拜","酸","靴子、踢","灭绝的","汉堡包","鹰","氢","巡逻","野餐","击退、排斥","同时发生的","犯罪","宇宙飞船","辉煌的","发言人","喷雾","航行","承受","饮料","电灯泡","建立、直立的","期满、终止","优雅","海湾","布局","图书管理员","情人","婚姻的","针","先例","酒吧","鲁莽的","泄漏","楼梯","羞耻的","姑、姨","秃头的、单调的","破产的","窒息、抑制","累积的","可疑的","鹰","温柔地","完整的","调停","组织","赶上","脉搏","量化","各自的","骚乱、暴乱","坐落在、的","滑冰","规格","汗水","运输","暴跌、跌倒","说唱音乐、轻敲","地质学","推理","可卡因","图表","君主","大量、多数","连续","类比","绝望","伪造、建立","迄今","前任","凭借","上船、在船上","胡须","绕开、旁道","化学家","厚块、大片","缺点","经济的","墨水","中世纪的","点头","简单","迷信","三倍的","展开","会计师","束、一群","年长的、长者","抹去","可怕的","光辉","神圣的","在内的、包罗广泛的","罐子","向外的、向外、在外","瘟疫","反驳、驳斥","自然产生的","坚持","铝","流血","目录","爆发","炸药","波动","毛皮","内脏、肠子","治愈","激怒","自由","包裹","羊","召唤","终点、末端","颤抖","贡品、称赞","魔鬼","外交的、老练的","取代","回声","唤起","葬礼","哺乳动物","中间","抵消","农民","斥责","暴跌","尾巴","打字机","口音","符合、一致","周年纪念","香蕉","花","大灾难","证明","碰撞","绳索","否认","集体宿舍","柠檬","盎司","行人","航行、帆","色拉","场景","游览","丝","斜坡、倾斜","呜咽、哭泣","战争","青少年","朝圣者","体育场","逃避","使饱和、使充满","象征、象征性的","良心","不断的","勤奋的","例证","冰雹","数字的","有秩序的、整齐的","保证、授权","包含","牙齿的","风味","公斤","说教、讲道","不久、目前","散文","鲨鱼","十三","垂直的","管理","立志","律师","分类","宣告、声明","社论","明确的","富有成效的","同时","恶梦","装饰","永久的","怀孕的","集会","反抗","连续的","锡","仓库","机智、才智","算术","轴","轻快的、活跃的","笼子","事故","确定","条款","诅咒","伪装","门口","忠实的","鬼魂","贪婪的","插图、说明","虚构的","微小的、边际的","困扰","冒犯的、进攻性的","石油","考虑","港口","保护","表示、意味着","模拟、冒充","球","拇指","透明的","相册","分析","任意的","傲慢的","蜡烛","壁橱","重复","蒸发","渡船","闲话","有希望的","浸","传授","恐吓、威胁","整洁的","省略","成功","稀少的、罕见的","闪电","木材","配件","敬畏","洗澡","欺负","运输、四轮马车","立方","电梯、升降机","固定装置","蜂蜜","传染的","羔羊","商人","球场、投","极性","再保证","沙","擦伤、刮掉","悲伤","丑陋的","任何人、不管谁","俘虏","宇宙的","黄瓜","葡萄","眉毛","海洛因","装置","一致的、连贯的","开枪、发射、拍摄","嘲笑、模仿","开幕","牵引车","部署","圆屋顶","彩票","怪物","成分","十八","移民","仇恨","指示的、陈述语气","休息室","矿","消遣","恳求","重现","浸","日出","易受感染的","极度痛苦","奇异的","相反地","致力于","扑灭","取来","手套","招致","无效的","放松","管弦乐队","陶器","定量的","景象、奇观","条纹","观点","交替","服务员","芭蕾舞","冲突","喜剧演员、滑稽的","会聚、集中","通信","服装","指定","前夕","爆炸","笔迹","侵略","珠宝","临时解雇、操作停止","报信者","口述的","爆发","肖像","队伍","意识到、认可","东南","立场","线、弦、一串","漫步","绊倒、蹒跚","气质","晶体管","诗","空白、无效的、空虚","不利的","扩大","培根、熏肉","蝴蝶","货物","寒冷、寒冷的","平凡的、老生常谈","紧凑的","让步","混淆","罪犯","侏儒","着手","嵌入","大惊小怪","即","渗透","相似","改天、来日","主要的、订书钉","吸","恐惧","今晚","衣柜","残骸、破坏","女衬衫","鞠躬","自助餐厅","脸颊","兼容","院子","下降","甜点","远足","驱逐","传真","渔夫","舰队","图表","拖、拉","地狱","精巧的、有独创性的","亲吻","冥想","商品","压迫","重复","杆","擦","脚本","粉碎、打碎","庄严的","孤独的","接班人","影响、摇摆","证明","杂草","拍卖","修剪、夹子","腐败","衣服","殖民地的","指挥、导体","跛子、削弱","授权","显微镜","统治","裁决","增加","雕刻","编译","最重要的","喘气、喘息","卫生","微不足道的","便士","肥皂","政治家","稳定的","暂时的","维护","愉快的","轶事","讨论、谈话","点缀","奉承","结","仁慈","天真的","开始","神圣的","君主、至高无上的","动荡的、狂暴的","恶毒的","充足的","原子","宴会","萧瑟的、无希望的","简明的","分散","被除数、股息","纪录片","免除","方面","货运","盘旋","哼、嗡嗡声","损害","征收","洲、大陆","东北","臭名昭著的","小册子","期刊","毁灭","钱包","浅的","签署","团结","辛苦","宣称","芽","设计、发明","凭据","钻石","信封","错误的","膝盖","殴打、打洞器、钻孔机","改正","强健的、粗野的","自私的","耸肩","滴答声、蜱虫、一会儿、打勾","瓷砖","伞","边缘","走廊","徽章、象征","豆","浏览","碰撞、肿块","包、束","木匠","布","焦炭","监护、拘留","日光","神圣的、绝妙的","古怪的","引出","侵蚀","永恒的","雾","犯规、肮脏的","断裂","放牧","手帕","肝脏","非凡的","指导","奇迹","提名","显赫的","服从","统治者","矛","阳光","投降","禁忌","口渴、渴望","植物","天文学","砍","学说、教义","愤怒","谨慎的","倾向、安排、性情","使困惑、使复杂化","锚","谴责、该死的","探测器","认真","虚弱的","星系","你好","反讽","模子、模型","起诉","野蛮人、凶猛的","监视","短暂的","突然的、陡峭的","使附属、附属机构","调整、排列","攻击","开始","结合","巩固、统一","建议","批评","类型","她的","在头顶上、在空中","重叠","政权","汤","极好的、可怕的","联合、结合","称赞、欢呼","救护车","助动词、辅助的","投票","糖果","碳水化合物","群","联合","警察","铜","长沙发、睡椅","方言","扰乱","经验主义的","系上","胶水","呻吟","新奇的经验","穿透","熟练","传闻","恐吓、惊吓","清醒","货摊、失速、拖延","坟墓","热带","在下面","古董","善于表达的","烤","毯子","爆炸","保佑","胡萝卜","以…为特征","笨拙的","承认","附上","想像","隔离","东方的","牧场","袭击","避难","坚决的","地毯","讽刺的","废品、报废","粉碎","喇叭、鼓吹","大声地","猿","音频","地下室","混合","跳跃、界限","微风、轻松","垫子","使眼花","耗尽","拨号","差异","厌恶","驴","抽屉","无人驾驶飞机","喷射、驱逐","赋予","侵蚀","冲洗","闪烁","再见","点燃","工业化","珠宝","肾","公里","失效、流逝","租约","跛行、柔软的","可爱的","民族","名义上的","通知","橡木","苍白的、暗淡的","平装书","路面","品脱","罗马教皇","排演、预演","偿还","解雇","骨架","壮观","雕塑","立体声","缕","纠纷、纠缠","庙宇","超越","利用","素食者","工作日","炉子","纺织品","食堂","凝结、浓缩","表示","区分","咧嘴笑","港口","匆忙","姿势","雷达","昵称","主持","撕裂、裂缝","烤、烤面包","真空","气球","手册","目录","玩具娃娃","瞌睡","拍打","肉","叉","瞪着、怒视","匆忙的、轻率的","推动力","获利的","顺从的","臭氧","戳、刺","辐射、放射","控制","腐烂","叹息","非凡的、单数的","烟雾","抢夺、抓住","吃惊","楼上","后果","鼓掌","评估","自信、保险","理发师","垃圾箱","新娘","子弹","船长","轻视","呼喊","功绩、技艺","消防队员","瞬间的","原封不动的","打扰、侵入","隐喻","呻吟、抱怨","肌肉的","麻烦","相对论","除去、搬迁","步枪","真诚的","取消","疏远","上升","确定","使吃惊","旗帜","棒球","螺栓","碗","祝贺","连续的","安慰、控制台","压碎","聋的","恐龙","恐惧","鼓","皇帝","执行","饥荒","栅栏","火焰","船头","锤","同类的","阴谋","重叠部分、轻拍、舐","公升","高的、崇高的","磁铁","备忘录","交往、混合","小型的、小规模的","侄女","滋养","机构、配备","熊猫","穿透","松树","明信片","小测验","破布","叛乱","退款","有弹力的","咆哮、轰鸣","隔离","感觉","袖子","细长的、苗条的","滑的","袜子","沙发","西南","赌咒、发誓","迅速的、雨燕","口渴的","检查制度","槽","肯定","吸收","皱眉","侧面、侧面的","前言","疑问、质问","报道、溅泼的量","跨、步伐","火炬","屠夫","压缩","弥漫","辨别","善良","悲伤","沉默的、哑的","烤","贫民窟","管家、管理","稻草","可行的","后来","天使","大错","电话亭","雪茄烟","推荐","联邦","庆祝、祝贺","板球、蟋蟀","转移","生态","手肘","公平、权益","协会","仪器的、有帮助的","键盘","纬度","酒","手稿","犁","套房","极好的","拷问","锻炼","出现","审计","火焰、燃烧","野蛮的","臭虫、窃听器","公牛","阴谋","支持","花费","面粉","即将到来的","方便的","详细目录、清点","汽车旅馆","海军的","笔记本","棕榈","继电器、接力","三明治","气味","精明的","专门研究、特定范围","立场","否决","腰","寡妇","大使","避免","沐浴","心爱的","饼干","公文包","窃贼","香槟酒","征服","召集","转变","懦夫","晕眩的、困惑","流放","无用的","亲切的、仁慈的","孵化","堆","起伏、举、扔","远足","空的、洞","拥挤、混乱","内陆","隔离","中间体、中等的","无价的","行话","丛林","门外汉","地区","中午","气味","可以、好的","光学的","最佳的","协定","坚持","药房","粉","主要的","假定、推测","协议","紫色","强奸","回收、利用","镇压","脊","生锈","酱汁","兄弟姐妹","掴、侮辱","陈腐的、不新鲜的","皮带","潜入水中、浸没","晚餐","倾斜","商标","修剪、装饰","打字员","审判地、犯罪地点","多才多艺的、通用的","每年的","项链","节俭","疲倦","飞机","水泥","检查","迂回的","遵守","上岸","烟囱","爪","通讯记者","蟹","沟渠、抛弃","愤慨的","无数的","不考虑的","灌溉","大小","侍女","纪念碑","水银","误解","核","捏、一撮","恳求、抗辩、借口","木偶","共和国","水库","螺丝、螺钉","船尾、严厉的","硬的","沼泽","取笑","盘","拖船、拖","通风","职业","热情","分析的","恰当的","良性的","独木舟","盒式磁带","圆形的","脆的","外壳","卷曲","窗帘","阻止","图表","史诗","根除","极好的","吸引住","纤维","强大的","听力、听觉","英勇的","客栈","亲属","低语","愤怒","祈祷","宣传","唤醒、激起","讽刺","溜","茎","交响乐","卷起、藏起","无论什么","鞭子","手腕","鼓掌","灰","保释","长凳","更好的","支持","反弹","复杂的","认真的、负责的","冠状病毒","起重机","水晶","达到高潮、结束","碗橱","沮丧","疏散","羽毛","化肥","封建的","壁炉","喷泉","蛙","细菌、胚芽","滑翔","继承人","逼近的","抑制","内部的、向内、内部","爵士乐","连接","绑架","环","传教士","潮湿的","裸体的","大衣","溢出","原谅","同情","剽窃","困境","投资组合、作品集、文件夹","邮递员","原型","准时的","解雇的","腐烂的","围巾","破旧的","刮、剃","装运、货物","痛处、疼痛的","吐出、吐口水","牛排","楼层","坚固的","脚趾","肿块","混乱","机警的","口哨、汽笛","狼","几何","威胁","半径","半导体","法规","谷仓","管辖权","氮","轻蔑、鄙视","推","有轨电车","充满","披肩、海角","樱桃","码头","著名的","结局","时代","母鸡","断断续续的","下巴","辣椒","涤罪","修辞","绳索","侧身地、斜向一边的","群","讨论会","温度计","保留、扣留","箭","行李","钝的、直率的","擦伤、挫伤","嗡嗡声、电话","驾驶室","钙","指南针","楼下","染色、染料","保险丝、融合","人质","慢跑","刀","块","月亮的","草地","数据包","管道工","精神病学","球拍","背诵","保存、记忆力","速记","抿一口","固执的","手推车","修正","踝","贫瘠的","盆地","蝙蝠","兽","黄铜的","违反","扫帚","帆布","出纳员","下巴","合唱","文明","黏土","间隔、划分","同情","鹿","扣留","偏离","直径","谨慎","自我","雄辩的","围墙、附件","告别","投掷","流利的","摩擦","霜","冰川","辉煌的","可怕的、冷酷的","杂货店","探索","铰链","光荣的、可敬的","水平的、水平线","喇叭","潮湿的","跪","潜在的","传单","线性的","百万富翁","减去","镍","名词","正统的","发射台、衬垫","参数","守护神","小的、琐碎的","加速、小型卡车、拾音器、获得","支柱","复数","门廊","阻止","借口","兔子","行李架","疹子、轻率的","残余","责备","不安宁的","反抗","熟的","长袍","水手","圣人","怀疑的","十七","发抖、哆嗦","走私","喷嚏","酸的","标本","勺子","停滞的","针脚、缝补","弯腰","潜水艇","减去","足够","推力","折磨","激流","树干","邻近","紫色、紫罗兰","货车","呵欠","烟","降落伞","多余的","涡轮","天线","眉毛","推迟","爆发、闪光","使丢脸","嫉妒的","大屠杀","单调的","高兴","狡猾的","专长","草莓","合成","王位","虚荣心","速度","楔子","效忠","青铜","粉笔","纪念","愚蠢的","逝去","发电机","火腿","树篱、篱笆","成语","水分","凡人、致命的","孤儿","彻底检查、革新","高原","猪肉","传播","粉扑、膨胀、一阵","互惠、相互","回顾","肋骨","棕褐色、晒黑","集料","无论如何","拱","利益、有利于","阳台","烧烤","腹部","仁慈的","小心","脸红","出生的","公报","厘米","马戏团","钩、扣子","高潮","开始","法令、颁布","稀释","失望","谨慎的","消散","王朝","可食用的、食品","有弹性的","升级","护送","极度地、非常","刺激、激起","精致的","仙女","宴会","拳头","两星期","狂怒的","测量","华丽的","问候","磨","吉他","手册","校长","先驱","药草","升起、起重机","水管","湿度","用力投掷、丢下","偶像、图标","可理解的","小伙子","班轮","储物柜","润滑","大理石","垫子","我","旋律","愉快的","十九","尽管","洋葱","果园","椭圆","推翻","猫头鹰","范例","粘贴","桃子、桃树","踏板","钟摆","半岛","请愿","海盗","种植园","池塘","邮费","后退","芦苇","鞍","拯救","碟子","香肠","疤痕","争夺","轴","剪","熟练的、巧妙的","满贯","独奏","铁锹、铲","闪耀","停滞不前","震惊","关税","热量的、热的","胆怯的","闪烁","卸下、卸货","面纱","排球","保修期","防水材料","威士忌酒","有益健康的","吃惊、惊讶","饵","圈、线圈","咨询","伪善","接口","颠倒、反转","木材","夫人","形容词","合金","轴承","使迷惑","血腥的","百分度的","唱诗班","击掌、拍手","隐匿、外衣、遮掩","梳子","初次登场","住宅","硬化","吸入","哀悼","迫使","妨碍","氧化物","全景","耙子","全部节目","玫瑰","螺旋","楼梯","三角形","邻近的","天线","接近","竞技场","动脉","礼堂","秋天","绷带","树皮","最、最好的","参考书目","花","骆驼","大炮","胶囊","基本的","神职人员","抓住、离合器","团结的、粘性的","构造","传染性的","乌鸦","潮湿","谴责","谴责","降低","圆盘","蒸馏","龙","黄昏","着重","外部","制造","奖学金、友谊","泡沫","脚步","自由职业者","山羊","鹅","长袍","体育馆","干草","十字路口","相反的、倒数","岛","非常、快乐的","公正的、司法的","花边","厕所","舔","少女","恶性的","导弹","模块","麻木的","尼龙","障碍","不透明的","郊游","牛","可怜的","爱国的","鹅卵石","果皮","香水","肺炎","回忆","反驳","版税","锯","侦察","缝","洗头","牧羊","警报器、汽笛","头骨","屠杀","第二年的","辛辣的","刺、刺伤","文具","规定","日落","其后","沟","紫外线","全体一致的","电压","宽度","拉链、尖啸声","腹部","煽动、晃动","亲切的","贿赂","复合材料","同志","代表团","罪犯","咯咯地笑","临时的","痛的","尽量减少","桨","豌豆","生理学","石膏","介词","放射性的","无情的","瓦特","热爱、爱慕","美学","痛苦","吓坏、惊骇","附录","暗杀","斧子、削减","羽毛球","一批","黑板","叶片","简洁","自助餐","地窖","墓地","粗糙的","彗星","热忱的、诚恳的","相互勾结的、亲切友好的","亲爱的","扣除","退化","露水","不连续的","滴","丧失、形成日或月食","电工","电子","百科全书","询问","赤道","前额","惊恐","边缘","一伙","大蒜","概括","优雅的","骚扰","今后","白痴","开创、开始","性交","象牙","水壶","风筝","旋钮","灯笼","盖子","经度","抒情诗","操纵、策略","甜瓜","麦克风","激进分子","雾","马赛克","蚊子","蘑菇","咕哝、抱怨","餐巾","侄子","面条","怀旧的","誓言","过时的","偷听","瘫痪","过路人","爪子","花生","枕、枕头","瓷","辐射的、发光的","赎回","卷","喜欢、享受","剩余物、廉价出售","谜","突出的、显著的","心智健全的","缝","快门","围攻","拖鞋","势利的","芽","蹒跚","静态的、静电","凳子","简化","概括","超声波","天鹅","匀称","节奏","暂时的","讨厌的","琐事、浪费","浴盆、桶","理解","阀门","变化","花瓶","背心","颤动","不稳定的、挥发物","伏特","瀑布","蜡","旋转、回旋","女巫","羊毛","猛扭、痛苦","皱纹","据所说、根据","习惯","副词","空调","虽然","模拟的","道歉","四月","考古学","人工制品","八月","听觉的","圣经","植物","肠","保龄球","支撑、支架","白兰地酒","缓冲","卷心菜","天主教徒、天主教的","基督","基督徒","圣诞节","香烟","使文明","顺时针方向地","衣服","公鸡","上校","共产主义","同时发生的","腐蚀","摇篮","狡猾的","汽缸、圆筒","数据","令人畏惧的","欺骗","十二月","小数","荒凉的","派遣","对话","鸽子","复活节","退潮、落潮","经济学","大使馆","寓言","更远的、更远地","二月","下列的、接着的","馥郁的","特权、选举权","星期五","更远的、促进","监狱","同性恋的","魅力","货物","油脂","成年人","总部、司令部","他","马力","猎狗","嚎叫","歇斯底里的","冰淇淋","使遭受、折磨","流行性感冒","红外线的","分期付款","因特网","请求、援引","一月","罐","七月","六月","鞭打、抨击、睫毛","拉丁语、拉丁语的","主要的、领导的","左边、向左","亚麻布","生活","客厅","机车","地方法官","威严","三月","已婚的、婚姻的","马克思主义的","数学","五月","手段","传播媒介","毫米","恶作剧","失踪的","情妇","暴民","动员","现代化","星期一","杯","淘气的","正常化","西北","十一月","桨","点钟","十月","可能性","应该","郊区","公开的、明显的","由于","气喘吁吁","寄生虫","偷看、窥视","迫害","物理学","手枪","原告","政治、政治学","在前的","诉讼","放映机","有前途的","先知","提供的","最接近的","质的、定性的","检疫","夸脱","奇怪的、古怪的","被子","颤抖","剃刀","矩形","关于","遗体","爬行动物","结果","边","致敬、敬礼","星期六","剪刀","九月","序列","嗅、闻","所谓的","社会主义","可解决的","种类","脊柱","海绵","洒","松鼠","统计","刺","长筒袜","繁重的、费力的","冲突","显著的","硫","星期日","环境","同情","油轮","感恩节","他们","大腿","刺","星期四","话题","毛巾","裤子","星期二","台风","潜在的","最新的","我们","二手的","静脉","天鹅绒","醋","醒来、唤醒","星期三","众所周知的","邪恶的","眨眼","更坏、更坏的","最坏、最坏的","X射线","你的","你们自己","曲折、之字形","飞驰、急剧上涨"],"variant":{"index":[141,229,275,302,341,433,449,459,472,485,531,739,779,802,834,837,1148,1149,1161,1224,1409,1431,1497,1516,1657,1725,1735,1767,1884,2040,2071,2074,2075,2125,2161,2170,2173,2259,2277,2283,2383,2449,2454,2481,2521,2532,2541,2591,2594,2659,2683,2751,2762,2912,2926,2928,3009,3022,3056,3083,3244,3255,3279,3309,3339,3361,3411,3496,3502,3516,3522,3596,3621,3777,3811,3831,3833,3898,3900,3935,3955,4021,4052,4059,4099,4113,4152,4167,4228,4256,4269,4298,4312,4351,4354,4379,4389,4431,4473,4480,4493,4545,4559,4571,4607,4641,4693,4729,4766,4769,4807,4814,4844,4867,4901,4927,4978,5001,5053,5069,5094,5132,5135,5206,5216,5218,5221,5233,5243,5251,5257,5266,5282,5306,5335,5336,5338,5339,5354,5355,5356,5373,5374,5384,5387,5389,5403,5427,5432,5433,5437,5459,5496,5499],"value":["converzation","center","corse","programme","rize","raize","employe","cheque","behaviour","encorage","storey","exercize","promize","cort","sise","labour","connexion","colour","noize","prise","otherwize","advize","arize","favour","praize","discorage","surprize","tyred","licence","honour","favourite","neighbour","neighbourhood","theater","defence","enterprize","wize","revize","humour","compromize","draught","por","vise","kerb","advertize","expertize","fulfill","dizable","precize","corage","organization","endeavour","florish","supervize","enroll","realize","devize","favourable","seise","likewize","dove","check","meter","tyre","advizable","paradize","gray","premize","cruize","practice","cortesy","instilment, instillment","vapour","organize","mediaeval","aluminium","catalogue","comprize","flavour","disguize","analyze","sunrize","jewellery","recognize","cortyard","merchandize","discorse","concize","marvellous","mould","criticize","rumour","characterize","industrialize","kilometer","utilize","harbour","despize","liter","norish","senzation","plow","flor","specialize","odour","airplane","fiber","fertilizer","story","tumour","bruize","fuze","civilization","honourable","skeptical","erial","centimeter","gage","skillful","whiskey","morn","distill","emphasize","minimize","aesthetic, esthetical, aesthetical","appall","axe","cozy","encyclopaedia","generalize","intercorse","maneuver","paralyze","summarize","analogue","apologize","archaeology","artifact","cigarette","civilize","clockwize","dialogue","dive","franchize","jail","glamour","installment","millimeter","mobilize","modernization","normalization","promizing","sulfur","sympathize"]},"pos":{"values":["other","noun_verb","noun","adj_adv","verb","prep_conj"],"codes":"0120002102030002033202121020212231102131100111000101340233302431211213314030141122122013201200111321122122241121214222222341104101313111201312222112224302311323222132313114123211142123112421121101221422112112444222311422222212413120241131422211124102133111344213111112211013111411221441240322302111411112111022231413432243211420112111122114012111122221222112134122211114322113121123344241221112212212211121122433122232131233323112114141212131210443121122123111122131011121233212111132141414212212421412211211123111122112113121112212233124231111143411141223121111322421111122212121211112114422212212133431124122324123222213113221111211314323114212221102311232134121011412442141211104110412131124341110231234122211141214443432211314130411322132124412412243311111223221110141142141211131212122111020424012114122214242412313121112223122111221122114411423211422312142211112221414212212122211211221114222311231231401121111244122211442223141112244212132211111211112141312113314142223441212122123212112421421222141311113344220112441141021122222222213222422412214214411221131112122412221224143222111122412122212414221142111111412121141112421332223341414112121232312224121211122224212121132212121421011241311121211121111111232111121121233421211221211122114224230111111124322224143222223313332422224342221203112222111444222411111222241321242122243134121211211124222214211311221122231221212121211411412333421231111342132232321112222412412111444142242212211112133242121142312221221322221232111122221211111212224322122111231112123142122422312112221432142442212222211144132112231212323321123234122111422133222113132122223143221222134422312314121132321222222421122223223442111224344322421222324424242223244232223232211133342224221422323312434121111221122114111112211121122411412240314223112122231422141112211111134311131114343212121113223223132121133224122113114221422442212223121124214311111233211201144122102101142221311313243232312221111412423113222111121131142122322211111224214112111421222211131132112414212131221242332133122114131321334111122121212111222313211111211111103421141141222122114131222211333212222111222343443412133134132324221143213312221341224412012332224311243214122222231231124121342142412211222242222423241102211122122221214441422312432124431222344344121241131111312224121312241423411211112123121122421412232212224211342142124211122431422341432112213111212314222412422211122122122221324221222212222411224222343211114222442122121124242111221232422212122142232221222322321113321213114222322121324423113442132111111412413331224212212212324323112231112312213321334221034122122121323222311142234111324122211322221221213323441311321132111322112212114322112333224442114324132432321313211211422211442131123142122414442321121222123224121112241111321122311424121132311211221221312211413211221322224221311231244224334311222412222112112421411222214211221221431112422123221343123214121213123412231313210112221421444223343244222212442434423321441342123112441212231442424333113314241213122113421442321211111111211231111441401211213311141111112143111311122123143144143123312122111334112112412132112114121324243140142222121114144221221131412111311113122224224124032232343242114241123242222134132433314131211113411122113214112114321123311222422223104424131112121321211224232111422242242132432221121242321142422443412132221314211141442131212423332112423211422233413244124422221212224222122232223212432231224242342421212211211121242142224211222223421222221222141223223122231234022143141221132112111422322132212122121122121212321214123242143111421123331411322244413242221312231234222044211211332321211224431113123224121132112424112231222241113232124142133321242121113123311242312232324122211411222122211222411132221111122414241123112141311443432141213212114312321142244122223122312324113313244414314121111222122221132031121231312214212431231314342414242144212421213414222121112122212441222221221211222244223341321421243212244222233221331131122241222112213223222411442132433111411244434431221112122131213411130232222231112422222422122441232334412414223212122124214241222222224221112211342121212411441342311222121213222241212123121422111322121114122112124443123212334321141232323332133422421414122322411221414222321433111212111111212212443111122312422212111221223241122322214122314112414202121341221121211122341121211412231441142434444211232314131221111141212214421124412211122242122224412222112442222244411212141111222111113233214111221122422112214422334213222134444422112311121124211213112322422412412112131122331224232144121111111442411121332122424122122322221231221131124413212321111342121241222222422413311111134132222221322421342114211121414211122322242142432121133342222421222212211214223331221111412434231222114242112131221111114301242141232212123431241233211121222333131221223122311212222221114221312231142131224224111213112111322221422132422212211111122222412223221321233211321313232212312222222421122131312132141121311144112222211132224143134322212212114342112221122412111131121134111221141443422241343212231311222121121232224112232322212211122112224212221111311114412214122123411222412211443111111444442212112232422221112121122132311444242142421212112122213121232242231233211241211411221231242312322124312222121412212332421424121222122322224123112224221112432324222122221122212211222323442121234111123112231121443122231212221422211121154220242222322211211222224311223412224222412121222321312412221010211324222242122121121222211222122242142213222232242351214222242242433121111241221121221323221122113211224220222212224324122423312110011"}};
\ No newline at end of file
@@ -6,6 +6,9 @@
 const LocalAPI = {
     verbsData: null,
     legacyData: null,
+    legacyIndex: null, // Shard index of a sharded legacy build (legacy/index.json)
+    legacyShardLoads: new Map(), // shard number -> load promise
+    legacyRanks: null,
     originalFetch: null,
     DATA_VERSION: 9, // Increment this to force re-import of verbs and legacy data
 
@@ -31,6 +34,122 @@ const LocalAPI = {
         return null;
     },
 
+    /**
+     * Expand the columnar word list (window.NETEM_FULL_LIST_COLUMNS / netem_full_list.columns.json,
+     * see scripts/explain_verbs/word_columns.py) into the shape of netem_full_list.json:
+     * { "5530考研词汇词频排序表": [{ 序号, 词频, 单词, 释义, 其他拼写, pos }, ...] }
+     */
+    decodeWordColumns(columns) {
+        if (columns.version !== 1) throw new Error(`Unsupported word list columns version: ${columns.version}`);
+        const count = columns.count;
+        const sequence = Array.isArray(columns.sequence) ? columns.sequence : null;
+        const start = sequence ? 0 : columns.sequence.start;
+        let frequency = columns.frequency;
+        if (!frequency && columns.frequency_u32) {
+            const bytes = Uint8Array.from(atob(columns.frequency_u32), c => c.charCodeAt(0));
+            const view = new DataView(bytes.buffer);
+            frequency = new Array(count);
+            for (let i = 0; i < count; i++) frequency[i] = view.getUint32(i * 4, true);
+        }
+        const variants = new Map();
+        columns.variant.index.forEach((row, i) => variants.set(row, columns.variant.value[i]));
+        const POS_CODES = '0123456789abcdefghijklmnopqrstuvwxyz';
+        const posValues = columns.pos.values;
+        const codes = columns.pos.codes;
+
+        const list = new Array(count);
+        for (let i = 0; i < count; i++) {
+            list[i] = {
+                "序号": sequence ? sequence[i] : start + i,
+                "词频": frequency[i],
+                "单词": columns.word[i],
+                "释义": columns.definition[i],
+                "其他拼写": variants.has(i) ? variants.get(i) : null,
+                "pos": posValues[POS_CODES.indexOf(codes[i])]
+            };
+        }
+        return { [columns.list]: list };
+    },
+
+    /**
+     * Full word list, decoded from whichever form is available:
+     * inline columnar JS > netem_full_list.columns.json > netem_full_list.json
+     */
+    async loadFullList() {
+        if (window.NETEM_FULL_LIST_COLUMNS) return this.decodeWordColumns(window.NETEM_FULL_LIST_COLUMNS);
+        for (const filename of ['netem_full_list.columns.json', 'netem_full_list.json']) {
+            const response = await this.fetchResource(filename);
+            if (response) {
+                const data = await response.json();
+                return data.format === 'netem-columns' ? this.decodeWordColumns(data) : data;
+            }
+        }
+        return null;
+    },
+
+    /**
+     * Shard of the legacy data that holds a word (see scripts/explain_verbs/legacy_shards.py):
+     * shards cover ranges of the word's 序号, and words outside the list live in the last one
+     */
+    legacyShardFor(word) {
+        const shards = this.legacyIndex.shards;
+        if (!this.legacyRanks && this.verbsData && this.verbsData.length) {
+            this.legacyRanks = new Map();
+            for (const v of this.verbsData) {
+                const rank = parseInt(v['序号'] || v.sequence || 0);
+                for (const spelling of [v['单词'] || v.word, v['其他拼写'] || v.alternative_spelling]) {
+                    const key = (spelling || '').trim().toLowerCase();
+                    if (key && rank && !(this.legacyRanks.get(key) <= rank)) this.legacyRanks.set(key, rank);
+                }
+            }
+        }
+        let key = word.toLowerCase();
+        if (key.endsWith(':verb')) key = key.substring(0, key.length - 5);
+        const rank = this.legacyRanks ? this.legacyRanks.get(key) : undefined;
+        if (!rank) return shards.length - 1;
+        const i = shards.findIndex(shard => shard.ranks[1] === null || rank <= shard.ranks[1]);
+        return i === -1 ? shards.length - 1 : i;
+    },
+
+    /**
+     * Fetch one legacy shard and merge it into legacyData (once; concurrent callers share the load)
+     */
+    loadLegacyShard(i) {
+        if (!this.legacyIndex || !this.legacyIndex.shards[i]) return Promise.resolve();
+        if (!this.legacyShardLoads.has(i)) {
+            const load = (async () => {
+                const resp = await this.fetchResource(this.legacyIndex.shards[i].file);
+                if (!resp) throw new Error(`legacy shard ${i} not found`);
+                const shard = await resp.json();
+                this.legacyData = Object.assign(this.legacyData || {}, shard);
+                console.log(`LocalAPI: Loaded legacy shard ${i} (${Object.keys(shard).length} records).`);
+            })().catch(e => {
+                this.legacyShardLoads.delete(i);
+                console.warn(`LocalAPI: Failed to load legacy shard ${i}`, e);
+            });
+            this.legacyShardLoads.set(i, load);
+        }
+        return this.legacyShardLoads.get(i);
+    },
+
+    async ensureLegacyFor(word) {
+        if (this.legacyIndex) await this.loadLegacyShard(this.legacyShardFor(word));
+    },
+
+    async loadAllLegacy() {
+        if (this.legacyIndex) await Promise.all(this.legacyIndex.shards.map((_, i) => this.loadLegacyShard(i)));
+    },
+
+    /**
+     * Use a sharded legacy build: eagerData holds the index's eager (high-frequency) shards
+     */
+    useLegacyIndex(index, eagerData) {
+        this.legacyIndex = index;
+        this.legacyData = eagerData || {};
+        for (let i = 0; i < (index.eager || 0); i++) this.legacyShardLoads.set(i, Promise.resolve());
+        console.log(`LocalAPI: Loaded ${Object.keys(this.legacyData).length} of ${index.total} legacy records (${index.shards.length - (index.eager || 0)} shards on demand).`);
+    },
+
     /**
      * Initialize the local API by loading data
      */
@@ -45,10 +164,24 @@ const LocalAPI = {
             await this.syncFromBackend();
 
             // Load legacy data for fallback
-            // Priority: Window Global (Inline JS) > Fetch Resource
-            if (window.NETEM_LEGACY_DATA) {
+            // Priority: Sharded inline JS > Window Global (Inline JS) > Shard index > Fetch Resource
+            let legacyIndexResp = null;
+            if (window.NETEM_LEGACY_INDEX) {
+                this.useLegacyIndex(window.NETEM_LEGACY_INDEX, window.NETEM_LEGACY_DATA);
+            } else if (window.NETEM_LEGACY_DATA) {
                 this.legacyData = window.NETEM_LEGACY_DATA;
                 console.log(`LocalAPI: Loaded ${Object.keys(this.legacyData).length} legacy records from inline JS.`);
+            } else if ((legacyIndexResp = await this.fetchResource('legacy/index.json'))) {
+                try {
+                    const index = await legacyIndexResp.json();
+                    this.useLegacyIndex(index, {});
+                    await Promise.all(index.shards.slice(0, index.eager || 0).map((_, i) => {
+                        this.legacyShardLoads.delete(i);
+                        return this.loadLegacyShard(i);
+                    }));
+                } catch (indexErr) {
+                    console.error("LocalAPI: JSON parse error for legacy/index.json", indexErr);
+                }
             } else {
                 const legacyResp = await this.fetchResource('legacy_data.json');
                 if (legacyResp) {
@@ -179,19 +312,11 @@ const LocalAPI = {
                             
                             let rawData = null;
                             
-                            // Priority: Window Global (Inline JS) > Fetch Resource
-                            if (window.NETEM_FULL_LIST) {
-                                console.log("LocalAPI: Using inline NETEM_FULL_LIST.");
-                                rawData = window.NETEM_FULL_LIST;
-                            } else {
-                                try {
-                                    const response = await this.fetchResource('netem_full_list.json');
-                                    if (response) {
-                                        rawData = await response.json();
-                                    }
-                                } catch (fetchErr) {
-                                    console.error("LocalAPI: Failed to fetch netem_full_list", fetchErr);
-                                }
+                            // Priority: Window Global (Inline JS, columnar first) > Fetch Resource
+                            try {
+                                rawData = await this.loadFullList();
+                            } catch (fetchErr) {
+                                console.error("LocalAPI: Failed to load netem_full_list", fetchErr);
                             }
 
                             if (rawData) {
@@ -277,14 +402,9 @@ const LocalAPI = {
 
                 if (!loadedFromDb) {
                     // Fallback to inline JS or fetch
-                    if (window.NETEM_FULL_LIST) {
-                        this.verbsData = window.NETEM_FULL_LIST["5530考研词汇词频排序表"] || [];
-                    } else {
-                        const response = await this.fetchResource('netem_full_list.json');
-                        if (response) {
-                            const rawData = await response.json();
-                            this.verbsData = rawData["5530考研词汇词频排序表"] || [];
-                        }
+                    const rawData = await this.loadFullList();
+                    if (rawData) {
+                        this.verbsData = rawData["5530考研词汇词频排序表"] || [];
                     }
                     
                     // Data Sanitization
@@ -470,15 +590,10 @@ const LocalAPI = {
                         
                         // 2. Fallback to JSON if DB failed or empty
                         if (!this.verbsData || this.verbsData.length === 0) {
-                             if (window.NETEM_FULL_LIST) {
-                                this.verbsData = window.NETEM_FULL_LIST["5530考研词汇词频排序表"] || [];
-                            } else {
-                                const response = await this.fetchResource('netem_full_list.json');
-                                if (response) {
-                                    const rawData = await response.json();
-                                    this.verbsData = rawData["5530考研词汇词频排序表"] || [];
-                                }
-                            }
+                             const rawData = await this.loadFullList();
+                             if (rawData) {
+                                 this.verbsData = rawData["5530考研词汇词频排序表"] || [];
+                             }
                         }
 
                         // Data Sanitization: Filter out invalid entries
@@ -616,6 +731,8 @@ const LocalAPI = {
                         console.warn("LocalAPI: Failed to reload legacy data for export filtering", e);
                     }
                 }
+                // Sharded builds: filtering needs every shard, not just the eager ones
+                await this.loadAllLegacy();
 
                 // Build a normalized map of legacy data for accurate filtering
                 const legacyMap = new Map();
@@ -940,6 +1057,10 @@ const LocalAPI = {
                     }
 
                     // Fallback to memory-loaded legacy data if still not found
+                    // (sharded builds fetch the shard for this word's frequency rank first)
+                    if (!cachedData && this.legacyIndex) {
+                        await this.ensureLegacyFor(key);
+                    }
                     if (!cachedData && this.legacyData) {
                         // Normalize key: try exact, then verb, then with :verb suffix
                         const exactKey = key;
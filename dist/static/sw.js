@@ -1,10 +1,18 @@
 const CACHE_NAME = 'netem-deep-vocab-v2.0.0';
+// Content-hashed data files (netem_full_list, legacy data) are listed in asset-manifest.json,
+// written by the build scripts (see scripts/explain_verbs/asset_build.py). They live in their own
+// cache keyed by hashed URL, so a data update only downloads the files whose content changed.
+// The server stamps the manifest version below when serving this file (app.py), which is what
+// makes the browser reinstall this worker. Requests for a plain data name (dist/index.html,
+// LocalAPI) are answered with the hashed copy the manifest lists for it.
+const ASSET_MANIFEST_VERSION = '';
+const DATA_CACHE_NAME = 'netem-deep-vocab-data';
+const ASSET_MANIFEST_URL = './static/asset-manifest.json';
+const HASHED_ASSET_RE = /\.[0-9a-f]{10}\.(json|js)$/;
 const ASSETS_TO_CACHE = [
     './',
     './index.html',
     './static/manifest.json',
-    './static/netem_full_list.json',
-    './static/legacy_data.json',
     './static/lib/tailwind.min.js',
     './static/lib/marked.min.js',
     './static/lib/dexie.min.js',
@@ -19,31 +27,100 @@ const ASSETS_TO_CACHE = [
     './static/img/icon-192.png',
     './static/img/icon-512.png'
 ];
+// Plain (unhashed) data files index.html loads, precached when there is no asset manifest
+// (or it lists nothing). Only the columnar word list: its JSON forms are LocalAPI fallbacks,
+// cached when first fetched. Cached one by one: a missing file is skipped instead of failing
+// the whole install, e.g. data_legacy_eager.js before the first export.
+const DATA_FALLBACK_ASSETS = [
+    './static/js/data_full_list_columns.js',
+    './static/js/data_legacy_eager.js'
+];
+
+// Manifest entries as {plain, url, precache} absolute URLs; [] when the build has not generated one.
+// Entries marked "precache": false are loaded on demand.
+async function loadAssetManifest() {
+    try {
+        const response = await fetch(ASSET_MANIFEST_URL, { cache: 'no-cache' });
+        if (!response.ok) return [];
+        const manifest = await response.json();
+        return Object.entries(manifest.assets || {}).map(([logical, entry]) => ({
+            plain: new URL('./static/' + logical, self.location).href,
+            url: new URL('./static/' + entry.file, self.location).href,
+            precache: entry.precache !== false
+        }));
+    } catch (e) {
+        console.warn('SW: Asset manifest unavailable', e);
+        return [];
+    }
+}
+
+// Plain data URL -> hashed URL, loaded once per worker start (and again after activation)
+let hashedUrls = null;
+function hashedUrlFor(url) {
+    if (!hashedUrls) {
+        hashedUrls = loadAssetManifest().then((entries) => new Map(entries.map((entry) => [entry.plain, entry.url])));
+    }
+    return hashedUrls.then((map) => map.get(url));
+}
+
+// Only fetch hashed files that are not cached yet: same name means same content
+async function precacheDataAssets() {
+    const urls = (await loadAssetManifest()).filter((entry) => entry.precache).map((entry) => entry.url);
+    if (!urls.length) {
+        const cache = await caches.open(CACHE_NAME);
+        console.log('SW: No asset manifest, pre-caching the plain data files');
+        await Promise.all(DATA_FALLBACK_ASSETS.map((url) =>
+            cache.add(url).catch((e) => console.warn('SW: Data file not cached', url, e))));
+        return;
+    }
+    const cache = await caches.open(DATA_CACHE_NAME);
+    const missing = [];
+    for (const url of urls) {
+        if (!(await cache.match(url))) missing.push(url);
+    }
+    console.log(`SW: ${urls.length - missing.length} data assets unchanged, downloading ${missing.length}`);
+    await cache.addAll(missing);
+}
 
 // Install Event - Caching assets
 self.addEventListener('install', (event) => {
     event.waitUntil(
-        caches.open(CACHE_NAME).then((cache) => {
-            console.log('SW: Pre-caching all static assets');
-            return cache.addAll(ASSETS_TO_CACHE);
-        })
+        Promise.all([
+            caches.open(CACHE_NAME).then((cache) => {
+                console.log('SW: Pre-caching all static assets');
+                return cache.addAll(ASSETS_TO_CACHE);
+            }),
+            precacheDataAssets()
+        ])
     );
     self.skipWaiting();
 });
 
+// Drop hashed data files that the current manifest no longer lists
+async function pruneDataAssets() {
+    hashedUrls = null;
+    const urls = (await loadAssetManifest()).map((entry) => entry.url);
+    if (!urls.length) return;
+    const current = new Set(urls);
+    const cache = await caches.open(DATA_CACHE_NAME);
+    for (const request of await cache.keys()) {
+        if (!current.has(request.url)) await cache.delete(request);
+    }
+}
+
 // Activate Event - Cleaning up old caches
 self.addEventListener('activate', (event) => {
     event.waitUntil(
         caches.keys().then((cacheNames) => {
             return Promise.all(
                 cacheNames.map((cache) => {
-                    if (cache !== CACHE_NAME) {
+                    if (cache !== CACHE_NAME && cache !== DATA_CACHE_NAME) {
                         console.log('SW: Deleting old cache:', cache);
                         return caches.delete(cache);
                     }
                 })
             );
-        })
+        }).then(pruneDataAssets)
     );
     self.clients.claim();
 });
@@ -65,22 +142,25 @@ self.addEventListener('fetch', (event) => {
         return;
     }
 
-    event.respondWith(
-        caches.match(event.request).then((cachedResponse) => {
+    event.respondWith(hashedUrlFor(url.origin + url.pathname).then((hashed) => {
+        const request = hashed ? new Request(hashed) : event.request;
+        return caches.match(request).then((cachedResponse) => {
             if (cachedResponse) {
                 return cachedResponse;
             }
 
-            return fetch(event.request).then((response) => {
+            return fetch(request).then((response) => {
                 // Check if valid response to cache
                 if (!response || response.status !== 200 || response.type !== 'basic') {
                     return response;
                 }
 
-                // Cache static assets dynamically if they weren't in pre-cache
+                // Cache static assets dynamically if they weren't in pre-cache;
+                // on-demand hashed data files go with the other data assets so pruning covers them
                 const responseToCache = response.clone();
-                caches.open(CACHE_NAME).then((cache) => {
-                    cache.put(event.request, responseToCache);
+                const cacheName = HASHED_ASSET_RE.test(new URL(request.url).pathname) ? DATA_CACHE_NAME : CACHE_NAME;
+                caches.open(cacheName).then((cache) => {
+                    cache.put(request, responseToCache);
                 });
 
                 return response;
@@ -90,6 +170,6 @@ self.addEventListener('fetch', (event) => {
                     return caches.match('./index.html');
                 }
             });
-        })
-    );
+        });
+    }));
 });
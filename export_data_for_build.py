@@ -2,6 +2,11 @@ import sqlite3
 import json
 import os
 
+from scripts.explain_verbs.asset_build import STATIC_TARGETS, describe, publish
+from scripts.explain_verbs.content_codec import decode
+from scripts.explain_verbs.legacy_shards import word_ranks, write_shards
+from scripts.explain_verbs.search_index import load_word_list
+
 DB_PATH = 'scripts/explain_verbs/verbs.db'
 JSON_PATH = 'scripts/explain_verbs/static/netem_full_list.json'
 LEGACY_DATA_PATH = 'scripts/explain_verbs/static/legacy_data.json'
@@ -37,7 +42,7 @@ def export_legacy_data():
             
             # New format: Value is an object, not just string
             legacy_data[key] = {
-                "content": row[1],
+                "content": decode(conn, row[1]),
                 "image_url": row[2],
                 "image_dicebear": row[3],
                 "image_pollinations": row[4]
@@ -45,37 +50,21 @@ def export_legacy_data():
             
         print(f"Exporting {len(legacy_data)} records...")
         
-        # Define targets for JSON and JS files
-        json_targets = [
-            'scripts/explain_verbs/static/legacy_data.json',
-            'dist/static/legacy_data.json'
-        ]
-        
-        js_targets = [
-            'scripts/explain_verbs/static/js/data_legacy.js',
-            'dist/static/js/data_legacy.js'
-        ]
-        
-        # 1. Save JSON files
-        for target in json_targets:
-            try:
-                os.makedirs(os.path.dirname(target), exist_ok=True)
-                with open(target, 'w', encoding='utf-8') as f:
-                    json.dump(legacy_data, f, ensure_ascii=False)
-                print(f"Saved JSON to {target}")
-            except Exception as e:
-                print(f"Failed to save JSON to {target}: {e}")
-        
-        # 2. Save JS files (Window Variable Wrapper)
-        js_content = f"window.NETEM_LEGACY_DATA = {json.dumps(legacy_data, ensure_ascii=False)};"
-        for target in js_targets:
+        # Plain legacy_data.json / js/data_legacy.js plus content-hashed, precompressed copies
+        # in each static folder, recorded in its asset-manifest.json. The full files stay for
+        # tools and exports; the app loads the frequency-ranked shards instead (legacy_shards.py)
+        json_bytes = json.dumps(legacy_data, ensure_ascii=False).encode('utf-8')
+        js_bytes = f"window.NETEM_LEGACY_DATA = {json.dumps(legacy_data, ensure_ascii=False)};".encode('utf-8')
+        ranks = word_ranks(load_word_list(JSON_PATH)) if os.path.exists(JSON_PATH) else {}
+        for static_dir in STATIC_TARGETS:
             try:
-                os.makedirs(os.path.dirname(target), exist_ok=True)
-                with open(target, 'w', encoding='utf-8') as f:
-                    f.write(js_content)
-                print(f"Saved JS to {target}")
+                print(f"Saved JSON to {describe(publish(static_dir, 'legacy_data.json', json_bytes, precache=False))}")
+                print(f"Saved JS to {describe(publish(static_dir, 'js/data_legacy.js', js_bytes, precache=False))}")
+                index = write_shards(static_dir, legacy_data, ranks)
+                for shard in index["shards"]:
+                    print(f"Saved shard {shard['file']} ({shard['count']} records, gzip {shard['gzip']} bytes)")
             except Exception as e:
-                print(f"Failed to save JS to {target}: {e}")
+                print(f"Failed to save legacy data to {static_dir}: {e}")
             
         print("Export complete.")
         
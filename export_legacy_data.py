@@ -3,6 +3,8 @@ import sqlite3
 import json
 import os
 
+from scripts.explain_verbs.content_codec import decode
+
 db_path = "scripts/explain_verbs/verbs.db"
 export_path = "dist/static/legacy_data.json"
 
@@ -47,7 +49,7 @@ for row in rows:
     # Skip mode if exists
     if mode_col: idx += 1
     query_key = row[idx]; idx += 1
-    content = row[idx]
+    content = decode(conn, row[idx])
     
     if query_key and content:
         legacy_data[query_key.lower()] = content
@@ -8,19 +8,7 @@ if (!fs.existsSync(jsDir)) {
     fs.mkdirSync(jsDir, { recursive: true });
 }
 
-// Convert netem_full_list.json
-const fullListPath = path.join(staticDir, 'netem_full_list.json');
-const fullListJsPath = path.join(jsDir, 'data_full_list.js');
-try {
-    const data = fs.readFileSync(fullListPath, 'utf8');
-    // Minimal minification: remove newlines/spaces if JSON structure allows, 
-    // but JSON.stringify usually handles it well.
-    const content = `window.NETEM_FULL_LIST = ${data};`;
-    fs.writeFileSync(fullListJsPath, content);
-    console.log(`Converted netem_full_list.json to JS (${(fs.statSync(fullListJsPath).size / 1024 / 1024).toFixed(2)} MB)`);
-} catch (e) {
-    console.error("Failed to convert full list:", e);
-}
+// netem_full_list.json is published as js/data_full_list_columns.js by update_full_list_js.py
 
 // Convert legacy_data.json
 const legacyPath = path.join(staticDir, 'legacy_data.json');
@@ -1,36 +1,22 @@
 import json
 import os
-import nltk
-from nltk.corpus import wordnet as wn
+import time
+
+try:
+    from lexical_features import ensure_features, normalize, pos_category
+except ImportError:
+    from scripts.explain_verbs.lexical_features import ensure_features, normalize, pos_category
 
 # Path to netem_full_list.json
 JSON_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../netem_full_list.json"))
 
-def get_pos_category(word):
-    # Strip spaces and lower case
-    word = word.strip().lower()
-    
-    # Check synsets
-    # If not in WordNet, try to guess or mark as 'other'
-    synsets = wn.synsets(word)
-    if not synsets:
-        return "other"
-        
-    is_noun = bool(wn.synsets(word, pos=wn.NOUN))
-    is_verb = bool(wn.synsets(word, pos=wn.VERB))
-    is_adj = bool(wn.synsets(word, pos=wn.ADJ))
-    is_adv = bool(wn.synsets(word, pos=wn.ADV))
-    
-    if is_noun and is_verb:
-        return "noun_verb"
-    elif is_noun:
-        return "noun"
-    elif is_verb:
-        return "verb"
-    elif is_adj or is_adv:
-        return "adj_adv"
-    else:
-        return "other"
+def get_pos_category(word, features=None):
+    # WordNet synset counts come from the lexical feature cache (lexical_features.db);
+    # words not in WordNet are 'other'
+    word = normalize(word)
+    if features is None:
+        features = ensure_features([word])
+    return pos_category(features.get(word))
 
 def main():
     if not os.path.exists(JSON_PATH):
@@ -47,6 +33,12 @@ def main():
         json.dump(data, f, ensure_ascii=False, indent=2)
     print(f"Backup created at {backup_path}")
 
+    # Features of all words at once: only words missing from the cache hit WordNet
+    start = time.perf_counter()
+    words = [item.get("单词", "") for items in data.values() for item in items]
+    features = ensure_features(words)
+    print(f"Lexical features of {len(features)} words ready in {time.perf_counter() - start:.2f} s")
+
     # Process
     count = 0
     stats = {"noun": 0, "verb": 0, "noun_verb": 0, "other": 0, "adj_adv": 0}
@@ -57,7 +49,7 @@ def main():
         for item in words:
             word = item.get("单词", "")
             if word:
-                pos = get_pos_category(word)
+                pos = get_pos_category(word, features)
                 item["pos"] = pos
                 stats[pos] += 1
                 count += 1
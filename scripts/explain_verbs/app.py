@@ -1,5 +1,4 @@
 from fastapi import FastAPI, Request, HTTPException, Response, UploadFile, File, Body
-from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, FileResponse
 import shutil
@@ -14,6 +13,10 @@ import requests
 import httpx # For async requests
 import logging
 from datetime import datetime, timedelta
+import base64
+import hashlib
+import functools
+import gc
 
 # Filter for /api/image/ access logs
 class EndpointFilter(logging.Filter):
@@ -84,34 +87,57 @@ KNOWN_ADJ_ADV = {
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 try:
     from explain_verbs import get_client, explain_verb
-    from markdown_utils import clean_markdown
+    from markdown_utils import clean_markdown, clean_markdown_bulk
     from settings import settings, AppSettings, CONFIG_FILE
+    from prompt_registry import prompt_hash
+    from html_render import render_html
+    import section_store
+    import content_codec
+    import search_index
+    import word_index
+    import lexicon
+    import word_columns
+    import vocabulary_db
+    import word_query
+    import word_records
+    import word_table
+    import asset_build
+    from precompressed_static import PrecompressedStaticFiles
 except ImportError:
     # If running from root
     from scripts.explain_verbs.explain_verbs import get_client, explain_verb
-    from scripts.explain_verbs.markdown_utils import clean_markdown
+    from scripts.explain_verbs.markdown_utils import clean_markdown, clean_markdown_bulk
     from scripts.explain_verbs.settings import settings, AppSettings
+    from scripts.explain_verbs.prompt_registry import prompt_hash
+    from scripts.explain_verbs.html_render import render_html
+    from scripts.explain_verbs import section_store
+    from scripts.explain_verbs import content_codec
+    from scripts.explain_verbs import search_index
+    from scripts.explain_verbs import word_index
+    from scripts.explain_verbs import lexicon
+    from scripts.explain_verbs import word_columns
+    from scripts.explain_verbs import vocabulary_db
+    from scripts.explain_verbs import word_query
+    from scripts.explain_verbs import word_records
+    from scripts.explain_verbs import word_table
+    from scripts.explain_verbs import asset_build
+    from scripts.explain_verbs.precompressed_static import PrecompressedStaticFiles
 
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global http_client, verbs_data
+    global http_client
     
     # Filter out /api/image/ logs to reduce noise
     logging.getLogger("uvicorn.access").addFilter(EndpointFilter())
     
     http_client = httpx.AsyncClient(timeout=5.0)
     
-    # Pre-load verbs data to memory
-    if os.path.exists(VERBS_JSON_PATH):
-        try:
-            with open(VERBS_JSON_PATH, "r", encoding="utf-8") as f:
-                verbs_data = json.load(f)
-            print("Verbs data pre-loaded into memory.")
-        except Exception as e:
-            print(f"Error loading verbs.json: {e}")
+    # Pre-load verbs data to memory (already done before the fork under PRELOAD_VERBS_DATA=1)
+    if verbs_data is None:
+        preload_verbs_data()
             
     yield
     
@@ -135,6 +161,8 @@ async def vite_client_silencer():
     return Response(content="console.log('Vite client silencer')", media_type="application/javascript")
 
 verbs_data = None
+# (WordQueryEngine, WordRecords) over verbs_data, see get_verbs_engine
+verbs_view = None
 http_client = None
 
 from fastapi.exceptions import RequestValidationError
@@ -156,6 +184,9 @@ def get_settings():
 @app.post("/api/settings")
 def update_settings(new_settings: AppSettings):
     global settings
+    # The settings page doesn't edit the provider pool; keep the configured one
+    if not new_settings.providers:
+        new_settings.providers = settings.providers
     # Update current settings
     settings = new_settings
     # Save to file
@@ -167,6 +198,8 @@ import json
 # Database Setup
 DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "verbs.db")
 VERBS_JSON_PATH = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../netem_full_list.json"))
+# Columnar copy written by update_full_list_js.py (word_columns.py); used when built from the JSON above
+VERBS_COLUMNS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "netem_full_list.columns.json")
 
 def get_db_connection():
     conn = sqlite3.connect(DB_PATH)
@@ -226,6 +259,26 @@ def init_db():
         )
     ''')
     
+    # Explanations split at their #### headings (section_store.py), for projected fetches
+    section_store.ensure_sections_table(conn)
+    
+    # Change counter for the /api/verbs filter bitmaps (word_query.py), bumped by triggers
+    word_query.ensure_state_triggers(conn)
+    
+    # Full-text search over sections and 释义 (search_index.py); triggers keep it in sync
+    search_index.ensure_search_tables(conn)
+    if os.path.exists(VERBS_JSON_PATH):
+        search_index.sync_definitions_file(conn, VERBS_JSON_PATH)
+    
+    # Versioned zlib dictionaries for compressed explanations.content (content_codec.py)
+    content_codec.ensure_dict_table(conn)
+    
+    # image_url predates the CREATE TABLE above; fresh databases need it too
+    try:
+        c.execute("ALTER TABLE explanations ADD COLUMN image_url TEXT")
+    except sqlite3.OperationalError:
+        pass
+    
     # Add new columns for dual storage
     try:
         c.execute("ALTER TABLE explanations ADD COLUMN image_dicebear TEXT")
@@ -237,6 +290,23 @@ def init_db():
     except sqlite3.OperationalError:
         pass
     
+    # Provenance columns: which prompt template / model produced the content
+    try:
+        c.execute("ALTER TABLE explanations ADD COLUMN prompt_hash TEXT")
+    except sqlite3.OperationalError:
+        pass
+        
+    try:
+        c.execute("ALTER TABLE explanations ADD COLUMN model TEXT")
+    except sqlite3.OperationalError:
+        pass
+    
+    # Pre-rendered HTML of content (html_render.py), so clients can skip Markdown parsing
+    try:
+        c.execute("ALTER TABLE explanations ADD COLUMN content_html TEXT")
+    except sqlite3.OperationalError:
+        pass
+    
     # Migrate existing data (if not already migrated)
     # This ensures existing URLs are preserved in specific columns
     try:
@@ -338,15 +408,20 @@ def load_legacy_data_if_needed(force=False):
                          explanations_to_insert.append((item.get('mode', 'single'), item['query_key'].lower(), item['content'], item.get('image_url'), item.get('image_dicebear'), item.get('image_pollinations')))
 
             if explanations_to_insert:
+                cleaned = clean_markdown_bulk(row[2] for row in explanations_to_insert)
+                explanations_to_insert = [row[:2] + (content,) + row[3:] + (render_html(content),) for row, content in zip(explanations_to_insert, cleaned)]
                 print(f"Inserting {len(explanations_to_insert)} legacy records...")
                 c.executemany("""
                     INSERT OR IGNORE INTO explanations 
-                    (mode, query_key, content, image_url, image_dicebear, image_pollinations) 
-                    VALUES (?, ?, ?, ?, ?, ?)
+                    (mode, query_key, content, image_url, image_dicebear, image_pollinations, content_html) 
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                 """, explanations_to_insert)
                 conn.commit()
                 print("Legacy data loaded successfully.")
         
+        # Split whatever has no section rows yet (reloaded legacy rows, an imported backup)
+        section_store.backfill_sections(conn)
+        
         conn.close()
     except Exception as e:
         print(f"Error loading legacy data: {e}")
@@ -366,24 +441,26 @@ def get_cached_result(mode: str, query_key: str):
     print(f"DEBUG DB: Searching cache for mode='{mode}', query_key='{query_key}'")
     try:
         # Fetch all image columns
-        c.execute("SELECT content, image_url, image_dicebear, image_pollinations FROM explanations WHERE mode=? AND query_key=?", (mode, query_key))
+        c.execute("SELECT content, image_url, image_dicebear, image_pollinations, content_html FROM explanations WHERE mode=? AND query_key=?", (mode, query_key))
         result = c.fetchone()
         if not result:
             # Case-insensitive fallback
-            c.execute("SELECT content, image_url, image_dicebear, image_pollinations FROM explanations WHERE mode=? AND LOWER(query_key)=LOWER(?)", (mode, query_key))
+            c.execute("SELECT content, image_url, image_dicebear, image_pollinations, content_html FROM explanations WHERE mode=? AND LOWER(query_key)=LOWER(?)", (mode, query_key))
             result = c.fetchone()
         
         if not result and mode == "single" and ":" not in query_key:
             # Try with :verb suffix if not found and no suffix provided
             query_key_with_suffix = f"{query_key}:verb"
-            c.execute("SELECT content, image_url, image_dicebear, image_pollinations FROM explanations WHERE mode=? AND LOWER(query_key)=LOWER(?)", (mode, query_key_with_suffix))
+            c.execute("SELECT content, image_url, image_dicebear, image_pollinations, content_html FROM explanations WHERE mode=? AND LOWER(query_key)=LOWER(?)", (mode, query_key_with_suffix))
             result = c.fetchone()
     except sqlite3.OperationalError:
         # Fallback
         c.execute("SELECT content, image_url FROM explanations WHERE mode=? AND query_key=?", (mode, query_key))
         row = c.fetchone()
-        result = (row[0], row[1], None, None) if row else None
-        
+        result = (row[0], row[1], None, None, None) if row else None
+    
+    if result:
+        result = (content_codec.decode(conn, result[0]),) + tuple(result[1:4]) + (content_codec.decode(conn, result[4]),)
     conn.close()
     
     if result:
@@ -409,20 +486,21 @@ def get_cached_result(mode: str, query_key: str):
         
         return {
             "content": content, 
-            "image_url": target_img
+            "image_url": target_img,
+            "content_html": result[4]
         }
     print(f"DEBUG DB: No result found for '{query_key}'")
     return None
 
-def save_to_cache(mode: str, query_key: str, content: str, image_url: str = None):
-    # Optimize markdown before saving
-    optimized_content = clean_markdown(content)
+def save_to_cache(mode: str, query_key: str, content: str, image_url: str = None, prompt_hash: str = None, model: str = None):
+    # Callers pass content that already went through clean_markdown
+    optimized_content = content
     
     conn = get_db_connection()
     c = conn.cursor()
     try:
         # Fetch existing data to preserve fields
-        c.execute("SELECT image_url, image_dicebear, image_pollinations FROM explanations WHERE mode=? AND query_key=?", (mode, query_key))
+        c.execute("SELECT image_url, image_dicebear, image_pollinations, prompt_hash, model FROM explanations WHERE mode=? AND query_key=?", (mode, query_key))
         existing = c.fetchone()
         
         current_image_url = image_url
@@ -437,6 +515,10 @@ def save_to_cache(mode: str, query_key: str, content: str, image_url: str = None
             current_dicebear = existing[1]
             current_pollinations = existing[2]
             
+            # Image-only updates keep the provenance of the cached content
+            if prompt_hash is None:
+                prompt_hash, model = existing[3], existing[4]
+            
         # Update specific columns based on new image_url
         if current_image_url:
             if "dicebear.com" in current_image_url:
@@ -446,9 +528,10 @@ def save_to_cache(mode: str, query_key: str, content: str, image_url: str = None
         
         c.execute("""
             INSERT OR REPLACE INTO explanations 
-            (mode, query_key, content, image_url, image_dicebear, image_pollinations) 
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (mode, query_key, optimized_content, current_image_url, current_dicebear, current_pollinations))
+            (mode, query_key, content, image_url, image_dicebear, image_pollinations, prompt_hash, model, content_html) 
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (mode, query_key, content_codec.encode_for_storage(conn, optimized_content), current_image_url, current_dicebear, current_pollinations, prompt_hash, model, content_codec.encode_for_storage(conn, render_html(optimized_content))))
+        section_store.store_sections(conn, mode, query_key, optimized_content)
         
         conn.commit()
     except Exception as e:
@@ -457,27 +540,31 @@ def save_to_cache(mode: str, query_key: str, content: str, image_url: str = None
         conn.close()
 
 def generate_image_url(verb: str):
+    # Memoized per image setting: word lists ask for thousands of these
+    return _generated_image_url(verb, settings.image_provider, bool(settings.pollinations_api_key), settings.pollinations_model)
+
+@functools.lru_cache(maxsize=16384)
+def _generated_image_url(verb: str, image_provider: str, has_api_key: bool, pollinations_model: str):
     import urllib.parse
-    import hashlib
     
     # Check current setting
-    if settings.image_provider == "pollinations":
+    if image_provider == "pollinations":
         prompt_text = f"minimalist vector illustration of action {verb} white background"
         encoded_prompt = urllib.parse.quote(prompt_text)
         # Use stable seed based on verb to allow browser caching
         seed = int(hashlib.md5(verb.encode('utf-8')).hexdigest(), 16) % 1000000
         
-        if settings.pollinations_api_key:
-             return f"https://gen.pollinations.ai/image/{encoded_prompt}?model={settings.pollinations_model}&nologo=true&seed={seed}"
+        if has_api_key:
+             return f"https://gen.pollinations.ai/image/{encoded_prompt}?model={pollinations_model}&nologo=true&seed={seed}"
         else:
-             return f"https://image.pollinations.ai/prompt/{encoded_prompt}?model={settings.pollinations_model}&nologo=true&seed={seed}"
+             return f"https://image.pollinations.ai/prompt/{encoded_prompt}?model={pollinations_model}&nologo=true&seed={seed}"
     else:
         # Default to DiceBear
         return f"https://api.dicebear.com/9.x/icons/svg?seed={verb}"
 
-# Mount static files
+# Mount static files (serves the .br/.gz siblings written by asset_build.py when accepted)
 static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
+app.mount("/static", PrecompressedStaticFiles(directory=static_dir), name="static")
 
 # Templates
 templates_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
@@ -487,16 +574,18 @@ class VerbRequest(BaseModel):
     verbs: str
     mode: str
     refresh: bool = False
-    skip_content: bool = False
+    skip_content: bool = False  # If True (single mode), only cache status / image / provenance per word, see explain_metadata
     strict_cache: bool = False  # If True, do not generate AI content if cache is missing
+    include_html: bool = False  # If True, also return the pre-rendered HTML per word ("html")
+    sections: Optional[str] = None  # e.g. "title,一言蔽之": only these sections (single mode), see section_store.py
 
 @app.get("/", response_class=HTMLResponse)
 async def read_root(request: Request):
-    return templates.TemplateResponse(
-        "index.html", 
-        {"request": request},
-        headers={"Cache-Control": "no-store, no-cache, must-revalidate, max-age=0"}
-    )
+    page = templates.TemplateResponse(request, "index.html")
+    # Data scripts point to their content-hashed copies in static/asset-manifest.json (asset_build.py).
+    # Rendered per request, so neither the build nor sync_from_dev.py rewrites the template
+    html = asset_build.render_references(page.body.decode("utf-8"), asset_build.current_manifest(static_dir))
+    return HTMLResponse(html, headers={"Cache-Control": "no-store, no-cache, must-revalidate, max-age=0"})
 
 @app.get("/index.html", include_in_schema=False)
 async def index_alias():
@@ -510,8 +599,11 @@ async def static_index_alias():
 # Service Worker route at root for correct scope
 @app.get("/sw.js", include_in_schema=False)
 async def service_worker():
-    sw_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "sw.js")
-    return FileResponse(sw_path, media_type="application/javascript")
+    with open(os.path.join(static_dir, "sw.js"), "r", encoding="utf-8") as f:
+        source = f.read()
+    # Stamped here rather than in the file, revalidated on every load: the manifest version is how data updates reach clients
+    source = asset_build.stamp_version(source, asset_build.current_manifest(static_dir))
+    return Response(source, media_type="application/javascript", headers={"Cache-Control": "no-cache"})
 
 # Ebbinghaus Intervals (in minutes)
 EBBINGHAUS_STAGES = [
@@ -675,7 +767,7 @@ async def get_all_status():
         conn.close()
 
 @app.get("/api/export")
-async def export_data(excluded_verbs: str = ""):
+async def export_data(excluded_verbs: str = "", include_html: bool = False):
     try:
         # Create a temporary ZIP file
         temp_dir = tempfile.mkdtemp()
@@ -726,10 +818,25 @@ async def export_data(excluded_verbs: str = ""):
                     
                     c_copy.execute("DROP TABLE legacy_keys_temp")
                     conn_copy.commit()
-                    
-                    # Vacuum to reclaim space
-                    c_copy.execute("VACUUM")
+                
+                if not include_html:
+                    # Rendered HTML can be rebuilt from content (html_render.py --backfill)
+                    try:
+                        c_copy.execute("UPDATE explanations SET content_html = NULL WHERE content_html IS NOT NULL")
+                        conn_copy.commit()
+                    except sqlite3.OperationalError:
+                        pass
+                
+                # Sections are re-split from content when the backup is imported
+                try:
+                    section_store.clear_sections(conn_copy)
                     conn_copy.commit()
+                except sqlite3.OperationalError:
+                    pass
+                
+                # Vacuum to reclaim space
+                c_copy.execute("VACUUM")
+                conn_copy.commit()
                 
                 conn_copy.close()
                 zipf.write(db_copy_path, "verbs.db")
@@ -781,6 +888,8 @@ async def import_data(file: UploadFile = File(...)):
                 # 3. Re-inject legacy data if missing
                 
                 shutil.copy2(os.path.join(temp_dir, "verbs.db"), DB_PATH)
+                # The backup may hold other compression dictionaries under the same versions
+                content_codec.clear_dictionary_cache()
                 
                 # Re-inject legacy data
                 # We call the existing function to fill gaps
@@ -822,6 +931,7 @@ async def clear_all_learning_progress(data: dict = Body(...)):
         # 2. Clear explanations but IMMEDIATELY reload legacy data
         # This ensures that even after a full reset, the base vocabulary is available
         c.execute("DELETE FROM explanations")
+        section_store.clear_sections(conn)
         
         # 3. Clear excluded verbs if requested (part of reset_settings or general reset)
         if reset_settings:
@@ -848,7 +958,7 @@ async def clear_all_learning_progress(data: dict = Body(...)):
             # 2. Clear .env file if exists (check both local and root)
             # NOTE: We NO LONGER delete .env files during reset to protect user's API keys
             # We only clear the keys from memory so they can be re-loaded or changed
-            for key in ["OPENAI_API_KEY", "OPENAI_BASE_URL", "DEFAULT_MODEL", "IMAGE_PROVIDER", "POLLINATIONS_API_KEY", "POLLINATIONS_MODEL"]:
+            for key in ["OPENAI_API_KEY", "OPENAI_API_KEYS", "OPENAI_BASE_URL", "DEFAULT_MODEL", "IMAGE_PROVIDER", "POLLINATIONS_API_KEY", "POLLINATIONS_MODEL"]:
                 if key in os.environ:
                     del os.environ[key]
             
@@ -903,27 +1013,72 @@ async def update_exclude_verb(data: dict):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/sync/all_explanations")
-async def sync_all_explanations():
+async def sync_all_explanations(html: bool = False, sections: str = ""):
     conn = get_db_connection()
     c = conn.cursor()
     try:
-        c.execute("SELECT mode, query_key, content, image_url, created_at FROM explanations")
+        wanted_sections = section_store.parse_sections_param(sections)
+        if wanted_sections:
+            # Projected sync: {"sections": {...}} per row instead of the full content.
+            # Read-only: rows are split when written, older ones at startup and import (load_legacy_data_if_needed)
+            marks = ",".join("?" for _ in wanted_sections)
+            c.execute(f"""
+                SELECT e.mode, e.query_key, e.image_url, e.created_at, s.section, s.content
+                FROM explanations e JOIN explanation_sections s ON s.mode = e.mode AND s.query_key = e.query_key
+                WHERE s.section IN ({marks})
+                ORDER BY e.id, s.position
+            """, wanted_sections)
+            items = {}
+            for mode, query_key, image_url, created_at, section, content in c.fetchall():
+                item = items.setdefault((mode, query_key), {
+                    "mode": mode,
+                    "query_key": query_key,
+                    "image_url": image_url,
+                    "created_at": created_at,
+                    "sections": {}
+                })
+                item["sections"][section] = content
+            return list(items.values())
+        
+        html_column = "content_html" if html else "NULL"
+        c.execute(f"SELECT mode, query_key, content, image_url, created_at, {html_column} FROM explanations")
         rows = c.fetchall()
         
         result = []
         for row in rows:
-            result.append({
+            item = {
                 "mode": row[0],
                 "query_key": row[1],
-                "content": row[2],
+                "content": content_codec.decode(conn, row[2]),
                 "image_url": row[3],
                 "created_at": row[4]
-            })
+            }
+            if html:
+                item["content_html"] = content_codec.decode(conn, row[5])
+            result.append(item)
         
         return result
     finally:
         conn.close()
 
+@app.get("/api/search")
+def search_explanations(q: str = "", page: int = 1, page_size: int = 20):
+    """Ranked full-text search over cached explanations and 释义, with highlighted snippets."""
+    conn = get_db_connection()
+    try:
+        return search_index.search(conn, q, page, page_size, lemmatize=lexicon.lemmatize)
+    finally:
+        conn.close()
+
+@app.get("/api/suggest")
+def suggest_words(prefix: str = "", limit: int = 10):
+    """Autocomplete over the word list and 其他拼写, most frequent first, flagging cached words."""
+    items = word_index.get_prefix_index(VERBS_JSON_PATH).suggest(prefix, limit)
+    cached = cached_single_keys([item["word"].lower() for item in items])
+    for item in items:
+        item["cached"] = item["word"].lower() in cached
+    return {"prefix": prefix, "items": items}
+
 @app.get("/api/checkins", response_model=List[str])
 async def get_checkins():
     conn = get_db_connection()
@@ -999,8 +1154,30 @@ async def clear_learn_batch():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+VERB_FIELDS = word_records.FIELDS
+
+def encode_cursor(sort: str, rank: int) -> str:
+    return base64.urlsafe_b64encode(f"{sort}:{rank}".encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str):
+    """(sort, 序号) of a next_cursor; ValueError if it isn't one."""
+    try:
+        sort, rank = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8").rsplit(":", 1)
+        return sort, int(rank)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
 @app.get("/api/verbs")
-def get_verbs(limit: int = 50, offset: int = 0):
+def get_verbs(request: Request, limit: int = 50, offset: int = 0, filter: str = "", sort: str = "",
+              cursor: str = "", fields: str = ""):
+    """
+    Page of the word list through word_query.WordQueryEngine, e.g.
+    filter=pos:verb|pos:noun_verb,!cached,!excluded&sort=frequency (most frequent first; default: rank order).
+    cursor: the previous page's next_cursor (keyset paging; offset is then relative to it).
+    fields: comma-separated subset of VERB_FIELDS; has_cache / image_url are only looked up when asked for.
+    Answers 304 to a matching If-None-Match: the ETag covers the list, the word state
+    (word_state_version), the image settings and the query.
+    """
     global verbs_data
     try:
         # Use cached verbs data if available, otherwise load it
@@ -1008,9 +1185,8 @@ def get_verbs(limit: int = 50, offset: int = 0):
         if not data:
             if not os.path.exists(VERBS_JSON_PATH):
                 return {"total": 0, "items": [], "error": "Verbs file not found"}
-            with open(VERBS_JSON_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                verbs_data = data # Cache it
+            data = load_verbs_data()
+            verbs_data = data # Cache it
         
         # The key might be slightly different depending on file generation
         key = "5530考研词汇词频排序表 (Verbs Only)"
@@ -1018,73 +1194,46 @@ def get_verbs(limit: int = 50, offset: int = 0):
             # Fallback: check first key
             key = list(data.keys())[0]
         
-        verbs_list = data[key]
-        total = len(verbs_list)
-        paginated = verbs_list[offset : offset + limit]
-        
-        # Enrich with cache status and override POS for prepositions
-        conn = get_db_connection()
-        c = conn.cursor()
-        
-        # Extract verbs to check
-        verb_keys = [v['单词'].strip().lower() for v in paginated if '单词' in v]
-        cached_info = {}
-        
-        if verb_keys:
-            # Optimization: If checking many verbs, fetch all cached keys instead of massive IN clause
-            if len(verb_keys) > 200:
-                try:
-                    c.execute("SELECT query_key, image_url FROM explanations WHERE mode='single'")
-                    rows = c.fetchall()
-                    # Create lookup map
-                    full_cache = {row[0]: row[1] for row in rows}
-                    
-                    for k in verb_keys:
-                        if k in full_cache:
-                            cached_info[k] = {"has_cache": True, "image_url": full_cache[k]}
-                except Exception as e:
-                    print(f"Error checking cache (full fetch): {e}")
-            else:
-                # Use standard IN clause for small batches
-                placeholders = ','.join(['?'] * len(verb_keys))
-                try:
-                    query = f"SELECT query_key, image_url FROM explanations WHERE mode='single' AND query_key IN ({placeholders})"
-                    c.execute(query, verb_keys)
-                    for row in c.fetchall():
-                        cached_info[row[0]] = {"has_cache": True, "image_url": row[1]}
-                except Exception as e:
-                    print(f"Error checking cache (batch): {e}")
-        
-        conn.close()
-        
-        for item in paginated:
-            if '单词' in item:
-                key = item['单词'].strip().lower()
-                
-                # Override POS for prepositions/conjunctions
-                if key in KNOWN_FUNCTION_WORDS:
-                    item['pos'] = 'prep_conj'
-                # Override POS for pronouns -> other
-                elif key in KNOWN_ARTICLES or key in KNOWN_PRONOUNS:
-                    item['pos'] = 'other'
-                # Override POS for common adj/adv -> adj_adv
-                elif key in KNOWN_ADJ_ADV:
-                    item['pos'] = 'adj_adv'
-                    
-                info = cached_info.get(key, {"has_cache": False, "image_url": None})
-                item['has_cache'] = info["has_cache"]
-                # Use cached image or generate one on the fly (stable seed)
-                item['image_url'] = info["image_url"] if info["image_url"] else generate_image_url(key)
-            else:
-                item['has_cache'] = False
-                item['image_url'] = None
+        wanted = [f.strip() for f in fields.split(",") if f.strip()] or list(VERB_FIELDS)
+        unknown = [f for f in wanted if f not in VERB_FIELDS]
+        after = None
+        try:
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)} (expected {', '.join(VERB_FIELDS)})")
+            if cursor:
+                cursor_sort, after = decode_cursor(cursor)
+                if sort and sort != cursor_sort:
+                    raise ValueError("The cursor belongs to another sort order")
+                sort = cursor_sort
+            sort = sort or word_query.DEFAULT_SORT
+            
+            engine, records = get_verbs_engine(data[key])
+            conn = get_db_connection()
+            try:
+                engine.refresh(conn)
+            finally:
+                conn.close()
+            # One state snapshot for the ETag, the filter and the overlay
+            state = engine.state
+            
+            image_settings = (settings.image_provider, bool(settings.pollinations_api_key), settings.pollinations_model) if "image_url" in wanted else ()
+            validator = f"{engine.tag}:{state.version}:{engine.due_count(state=state)}:{image_settings}:{limit}:{offset}:{filter}:{sort}:{cursor}:{','.join(wanted)}"
+            etag = '"' + hashlib.sha256(validator.encode("utf-8")).hexdigest()[:20] + '"'
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+            if etag in [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]:
+                return Response(status_code=304, headers=headers)
+            
+            total, indices, more = engine.page_indices(filter, sort, offset, limit, after=after, state=state)
+        except ValueError as e:
+            return JSONResponse(content={"error": str(e)}, status_code=400)
         
-        return JSONResponse(content={
-            "total": total,
-            "items": paginated,
-            "limit": limit,
-            "offset": offset
-        }, headers={"Cache-Control": "no-store, no-cache, must-revalidate, max-age=0"})
+        # Precomputed records + the cache overlay (query_key -> stored image_url); nothing shared is modified
+        images = records.generated_images(image_settings, generate_image_url) if "image_url" in wanted else None
+        items = records.render(indices, wanted, state.images, images)
+        next_cursor = encode_cursor(sort, records.source[indices[-1]].get('序号')) if more else None
+        body = (f'{{"total":{total},"items":{items},"limit":{limit},"offset":{offset},'
+                f'"next_cursor":{json.dumps(next_cursor)}}}')
+        return Response(content=body.encode("utf-8"), media_type="application/json", headers=headers)
     except Exception as e:
         return JSONResponse(content={"error": str(e)}, status_code=500)
 
@@ -1094,19 +1243,80 @@ async def check_cache(request: Dict[str, List[str]]):
     if not verbs:
         return []
     
-    conn = get_db_connection()
-    c = conn.cursor()
+    # Variant spellings and inflections count as cached when their entry is
+    keys = {verb.strip().lower(): lexicon.normalize_key(verb) for verb in verbs}
+    cached = cached_single_keys(sorted(set(keys.values())))
+    return [verb for verb, key in keys.items() if key in cached]
+
+def effective_pos(item):
+    """The word list's pos with the KNOWN_* overrides (prep_conj, other, adj_adv) applied."""
+    key = item.get('单词', '').strip().lower()
+    if key in KNOWN_FUNCTION_WORDS:
+        return 'prep_conj'
+    elif key in KNOWN_ARTICLES or key in KNOWN_PRONOUNS:
+        return 'other'
+    elif key in KNOWN_ADJ_ADV:
+        return 'adj_adv'
+    return item.get('pos')
+
+def get_verbs_engine(verbs_list):
+    """
+    (filter/sort engine, immutable records) over verbs_list, built once per loaded list.
+    One tuple, swapped atomically, so a request never pairs an engine with another list's records.
+    """
+    global verbs_view
+    view = verbs_view
+    if view is None or view[0].source is not verbs_list:
+        view = (word_query.WordQueryEngine(verbs_list, pos_of=lambda item: effective_pos(item) or 'other'),
+                word_records.WordRecords(verbs_list, pos_of=effective_pos))
+        verbs_view = view
+    return view
+
+def load_verbs_data():
+    """
+    The word list from vocabulary.db; the JSON (or its columnar copy) if the database can't be used.
+    Each list is a compact word_table.WordTable (read-only rows), not a list of dicts.
+    """
     try:
-        placeholders = ','.join(['?'] * len(verbs))
-        # Only return verbs that have an entry in the explanations table
-        c.execute(f"SELECT query_key FROM explanations WHERE mode='single' AND query_key IN ({placeholders})", verbs)
-        cached_verbs = [row[0] for row in c.fetchall()]
-        return cached_verbs
-    finally:
-        conn.close()
+        data = vocabulary_db.load_word_data()
+    except sqlite3.Error as e:
+        print(f"vocabulary.db unavailable ({e}), reading {VERBS_JSON_PATH}")
+        data = word_columns.load_word_data(VERBS_JSON_PATH, VERBS_COLUMNS_PATH)
+    return word_table.compact(data)
+
+def preload_verbs_data():
+    """
+    Load the word list, the engine, the records and the default response fragments.
+    Returns True once they are loaded. Called by the lifespan; with PRELOAD_VERBS_DATA=1 already
+    at import, where everything allocated so far is also moved out of the garbage collector's
+    generations (gc.freeze()), so that a server that imports the app once and forks its workers
+    afterwards shares these pages between them:
+
+        PRELOAD_VERBS_DATA=1 gunicorn --preload -w 4 -k uvicorn.workers.UvicornWorker app:app
+
+    (uvicorn --workers starts each worker by spawning a fresh interpreter, which shares nothing.)
+    """
+    global verbs_data
+    if not os.path.exists(VERBS_JSON_PATH):
+        return False
+    try:
+        verbs_data = load_verbs_data()
+        # Records, sort orders and the default response fragments before the first request
+        _, records = get_verbs_engine(next(iter(verbs_data.values())))
+        records.fragments(word_records.FIELDS)
+        print("Verbs data pre-loaded into memory.")
+    except Exception as e:
+        print(f"Error loading verbs.json: {e}")
+        return False
+    return True
 
 def get_verb_info(word: str):
     global verbs_data
+    # Indexed lookup (spelling or 其他拼写 variant) instead of scanning the list
+    try:
+        return vocabulary_db.lookup(word)
+    except (sqlite3.Error, OSError) as e:
+        print(f"vocabulary.db lookup failed: {e}")
     if not verbs_data:
         return None
     
@@ -1117,6 +1327,57 @@ def get_verb_info(word: str):
                 return item
     return None
 
+def cached_single_keys(keys: List[str]) -> set:
+    """The subset of keys that have a single-mode explanation."""
+    if not keys:
+        return set()
+    conn = get_db_connection()
+    try:
+        placeholders = ','.join(['?'] * len(keys))
+        c = conn.cursor()
+        c.execute(f"SELECT query_key FROM explanations WHERE mode='single' AND query_key IN ({placeholders})", keys)
+        return {row[0] for row in c.fetchall()}
+    finally:
+        conn.close()
+
+def explain_metadata(verbs: List[str]) -> Dict[str, Any]:
+    """/api/explain with skip_content: per word its cache key, cache status, image and provenance."""
+    keys = {verb: lexicon.normalize_key(verb) for verb in verbs}
+    rows = {}
+    wanted = sorted(set(keys.values()))
+    if wanted:
+        conn = get_db_connection()
+        try:
+            placeholders = ','.join(['?'] * len(wanted))
+            c = conn.cursor()
+            c.execute(f"SELECT query_key, image_url, model, created_at FROM explanations WHERE mode='single' AND query_key IN ({placeholders})", wanted)
+            rows = {row[0]: row for row in c.fetchall()}
+        finally:
+            conn.close()
+    images, meta = {}, {}
+    for verb, key in keys.items():
+        row = rows.get(key)
+        images[verb] = row[1] if row and row[1] else generate_image_url(key)
+        meta[verb] = {
+            "key": key,
+            "cached": row is not None,
+            "model": row[2] if row else None,
+            "created_at": row[3] if row else None
+        }
+    response = {"result": "", "images": images, "meta": meta}
+    resolved = {verb: key for verb, key in keys.items() if key != verb.strip().lower()}
+    if resolved:
+        response["resolved"] = resolved
+    return response
+
+def correction_candidates(word: str):
+    """Did-you-mean candidates for a word that is not in the word list (word_index.BKTree), flagged with cache status."""
+    candidates = word_index.did_you_mean(word_index.get_bk_tree(VERBS_JSON_PATH), word)
+    cached = cached_single_keys([candidate["word"].lower() for candidate in candidates])
+    for candidate in candidates:
+        candidate["cached"] = candidate["word"].lower() in cached
+    return candidates
+
 @app.post("/api/explain")
 def explain_verbs_endpoint(request: VerbRequest):
     try:
@@ -1147,27 +1408,64 @@ def explain_verbs_endpoint(request: VerbRequest):
 
         result_text = ""
         
+        if mode == "single" and request.skip_content:
+            # Metadata only: nothing is decoded, rendered or generated
+            return JSONResponse(content=explain_metadata(verbs))
+        
         if mode == "single":
             results = []
             images = {}
+            htmls = {}
+            cached_contents = {}
+            lookup_keys = {}
+            did_you_mean = {}
+            resolved = {}
             for verb in verbs:
-                # Normalize key
-                key = verb.strip().lower()
+                # Normalize key; inflected forms ("went") share their lemma's entry
+                key = lexicon.normalize_key(verb)
+                word = verb
+                if key != verb.strip().lower():
+                    word = key
+                    resolved[verb] = key
                 print(f"DEBUG: Processing verb '{verb}', normalized key '{key}'")
                 cached_data = get_cached_result("single", key)
                 print(f"DEBUG: Cached data for '{key}': {cached_data is not None}")
                 
+                if not cached_data and not refresh:
+                    # Likely a typo of a listed word: offer corrections before paying for a generation
+                    candidates = correction_candidates(key)
+                    if candidates:
+                        did_you_mean[verb] = candidates
+                        nearest = next((candidate["word"].lower() for candidate in candidates if candidate["cached"]), None)
+                        if strict_cache and nearest:
+                            # Strict cache mode never generates, so serve the closest cached word instead
+                            print(f"DEBUG: Resolved '{key}' to cached '{nearest}'")
+                            key = word = nearest
+                            resolved[verb] = nearest
+                            cached_data = get_cached_result("single", key)
+                        else:
+                            # Not in the list: the client picks a candidate instead of generating for the typo
+                            print(f"DEBUG: '{key}' is not in the word list; returning candidates only")
+                            lookup_keys[verb] = key
+                            cached_contents[verb] = None
+                            results.append(None)
+                            continue
+                lookup_keys[verb] = key
+                
                 cached_content = None
                 cached_image = None
+                cached_html = None
                 if cached_data:
                     # In single mode, get_cached_result returns a dict with 'content' and 'image_url' keys
                     # or it returns a tuple/row if directly from DB (legacy)
                     if isinstance(cached_data, dict):
                         cached_content = cached_data.get("content")
                         cached_image = cached_data.get("image_url")
+                        cached_html = cached_data.get("content_html")
                     elif isinstance(cached_data, (list, tuple)):
                         cached_content = cached_data[0]
                         cached_image = cached_data[1]
+                cached_contents[verb] = cached_content
                 
                 # Determine if we need to regenerate content or image
                 need_content = refresh or not cached_content
@@ -1175,10 +1473,11 @@ def explain_verbs_endpoint(request: VerbRequest):
                 
                 new_content = cached_content
                 new_image = cached_image
+                new_prompt_hash = None
                 
                 # Generate Image if needed
                 if need_image:
-                    new_image = generate_image_url(verb)
+                    new_image = generate_image_url(word)
                 
                 # Generate Content if needed
                 if need_content:
@@ -1197,20 +1496,20 @@ def explain_verbs_endpoint(request: VerbRequest):
                               print(f"DEBUG: Error - {error_msg}")
                               return JSONResponse(content={"error": error_msg}, status_code=500)
                     else:
-                        prompt = f"请解析\"{verb}\""
+                        prompt = f"请解析\"{word}\""
                         # Look up POS
-                        verb_info = get_verb_info(verb)
+                        verb_info = get_verb_info(word)
                         pos = verb_info.get("pos") if verb_info else None
                         
                         # Override pos for known prepositions/conjunctions
-                        if verb.strip().lower() in KNOWN_FUNCTION_WORDS:
+                        if word.strip().lower() in KNOWN_FUNCTION_WORDS:
                             pos = "prep_conj" # Use new prompt logic in explain_verbs.py
-                        elif verb.strip().lower() in KNOWN_PRONOUNS or verb.strip().lower() in KNOWN_ARTICLES:
+                        elif word.strip().lower() in KNOWN_PRONOUNS or word.strip().lower() in KNOWN_ARTICLES:
                             pos = "other"
-                        elif verb.strip().lower() in KNOWN_ADJ_ADV:
+                        elif word.strip().lower() in KNOWN_ADJ_ADV:
                             pos = "adj_adv"
                         
-                        print(f"DEBUG: Calling explain_verb for '{verb}' with pos={pos}")
+                        print(f"DEBUG: Calling explain_verb for '{word}' with pos={pos}")
                         raw_res = explain_verb(client, prompt, model=settings.openai_model, pos=pos)
                         if "Error calling API" in raw_res:
                             print(f"DEBUG: API Error for '{verb}': {raw_res}")
@@ -1220,17 +1519,59 @@ def explain_verbs_endpoint(request: VerbRequest):
                                 return JSONResponse(content={"error": raw_res}, status_code=500)
                         else:
                             new_content = clean_markdown(raw_res)
+                            new_prompt_hash = prompt_hash(pos)
                 
-                # Save if anything changed
-                if need_content or need_image:
-                    save_to_cache("single", key, new_content, new_image)
+                # Save if anything changed (strict cache mode may have left nothing to save)
+                if new_content and (need_content or need_image):
+                    save_to_cache("single", key, new_content, new_image,
+                                  prompt_hash=new_prompt_hash, model=settings.openai_model if new_prompt_hash else None)
                 
                 results.append(new_content)
                 if new_image:
                     images[verb] = new_image
+                if request.include_html and new_content:
+                    htmls[verb] = cached_html if new_content == cached_content and cached_html else render_html(new_content)
+                
+            wanted_sections = section_store.parse_sections_param(request.sections)
+            if wanted_sections:
+                # Projected fetch: only the requested sections travel to the client
+                conn = get_db_connection()
+                try:
+                    stored = section_store.fetch_sections(conn, "single", list(lookup_keys.values()), wanted_sections)
+                finally:
+                    conn.close()
+                projected = {}
+                for i, verb in enumerate(verbs):
+                    if not results[i]:
+                        continue
+                    parts = stored.get(lookup_keys[verb])
+                    if parts is None or results[i] != cached_contents.get(verb):
+                        parts = section_store.project(results[i], wanted_sections)
+                    projected[verb] = parts
+                    results[i] = "\n\n".join(parts.values())
+                # content_html covers whole explanations, so it is not sent with a projection
+                htmls = {}
                 
-            result_text = "\n\n---\n\n".join(results)
-            return JSONResponse(content={"result": result_text, "images": images})
+            if not any(results):
+                # Nothing cached and nothing generated: say so instead of an empty explanation
+                response = {"result": None, "content": None, "images": images}
+                if did_you_mean:
+                    response["did_you_mean"] = did_you_mean
+                if resolved:
+                    response["resolved"] = resolved
+                return JSONResponse(content=response)
+            
+            result_text = "\n\n---\n\n".join(result for result in results if result)
+            response = {"result": result_text, "images": images}
+            if request.include_html:
+                response["html"] = htmls
+            if wanted_sections:
+                response["sections"] = projected
+            if did_you_mean:
+                response["did_you_mean"] = did_you_mean
+            if resolved:
+                response["resolved"] = resolved
+            return JSONResponse(content=response)
 
         elif mode == "list":
              # Normalize key: sorted list of lowercase verbs
@@ -1261,7 +1602,7 @@ def explain_verbs_endpoint(request: VerbRequest):
                                 return JSONResponse(content={"error": raw_res}, status_code=500)
                       else:
                            result_text = clean_markdown(raw_res)
-                           save_to_cache("list", key, result_text)
+                           save_to_cache("list", key, result_text, prompt_hash=prompt_hash(None), model=settings.openai_model)
 
         elif mode == "compare":
              # Normalize key: sorted list of lowercase verbs
@@ -1292,7 +1633,7 @@ def explain_verbs_endpoint(request: VerbRequest):
                                 return JSONResponse(content={"error": raw_res}, status_code=500)
                       else:
                            result_text = clean_markdown(raw_res)
-                           save_to_cache("compare", key, result_text)
+                           save_to_cache("compare", key, result_text, prompt_hash=prompt_hash(None), model=settings.openai_model)
         
         else:
             return JSONResponse(content={"error": "Invalid mode selected."}, status_code=400)
@@ -1308,8 +1649,8 @@ def explain_verbs_endpoint(request: VerbRequest):
 async def get_verb_image(verb: str):
     import asyncio
     try:
-        # Normalize key
-        key = verb.strip().lower()
+        # Normalize key (inflected forms use their lemma's image)
+        key = lexicon.normalize_key(verb)
         loop = asyncio.get_event_loop()
         
         # 1. DB Read (in thread pool)
@@ -1349,7 +1690,7 @@ async def get_verb_image(verb: str):
         
         # If no image found, generate new one
         if not image_url:
-            image_url = generate_image_url(verb)
+            image_url = generate_image_url(key)
             
             # 2. DB Write (in thread pool)
             def write_db(k, url, provider):
@@ -1420,6 +1761,12 @@ async def get_verb_image(verb: str):
         # Final fallback
         return RedirectResponse(f"https://api.dicebear.com/9.x/icons/svg?seed={verb}")
 
+if os.environ.get("PRELOAD_VERBS_DATA") == "1" and preload_verbs_data():
+    # Only before a fork: a collection in a worker would otherwise write GC headers on every
+    # shared page. Freezing from the lifespan would just exempt a single process's objects.
+    gc.collect()
+    gc.freeze()
+
 if __name__ == "__main__":
     import uvicorn
     # Using 0.0.0.0 and port 8080 to avoid common localhost/8000 conflicts
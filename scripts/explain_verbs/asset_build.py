@@ -0,0 +1,257 @@
+"""
+Content-hashed, precompressed data assets for the static folders (dev and dist).
+
+The build scripts (update_full_list_js.py, export_data_for_build.py) publish each data
+file through publish(): besides the plain name that existing code reads, it writes
+    js/data_full_list.<hash>.js     (hash = first 10 hex chars of its sha256)
+    js/data_full_list.<hash>.js.gz
+    js/data_full_list.<hash>.js.br  (only when the brotli package is installed)
+and records it in static/asset-manifest.json:
+    {"version": "<hash of all entries>", "assets": {"js/data_full_list_columns.js": {"file": ..., "hash": ..., "size": ..., "gzip": ..., "br": ...}}}
+
+Consumers:
+- sw.js precaches the hashed files listed in the manifest (except "precache": false entries,
+  such as the lazily loaded legacy shards); since their names change with their content, a
+  data update only re-downloads the files that actually changed. Requests for a plain name
+  are answered with its hashed copy.
+- app.py renders the hashed names into index.html (render_references) and the manifest
+  version into sw.js (stamp_version) when serving them, so the build never rewrites a tracked
+  file; the hashed copies and manifests are build output (.gitignore). dist/index.html keeps
+  the plain names, which its service worker maps to the hashed copies.
+- precompressed_static.py serves the .br/.gz siblings to clients that accept them.
+
+    python asset_build.py --static ../../dist/static     # (re)publish the data files already in a static dir
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterable, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST_NAME = "asset-manifest.json"
+HASH_LENGTH = 10
+# Data files that get a hashed copy when the static folder is republished
+DATA_ASSETS = [
+    "netem_full_list.json", "netem_full_list.columns.json", "legacy_data.json",
+    "js/data_full_list_columns.js", "js/data_legacy.js",
+]
+# The one copy of the word list sw.js installs with (index.html loads it); the rest are fetched on demand
+PRECACHED_DATA_ASSETS = {"js/data_full_list_columns.js"}
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+STATIC_DEV = os.path.join(REPO_ROOT, "scripts", "explain_verbs", "static")
+STATIC_DIST = os.path.join(REPO_ROOT, "dist", "static")
+# Static folders the build scripts publish to
+STATIC_TARGETS = [STATIC_DEV, STATIC_DIST]
+# Served with a long immutable Cache-Control: the name changes whenever the content does
+HASHED_NAME_RE = re.compile(r"\.[0-9a-f]{%d}\.[A-Za-z0-9]+$" % HASH_LENGTH)
+
+
+def hashed_name(logical: str, digest: str) -> str:
+    root, ext = os.path.splitext(logical)
+    return f"{root}.{digest[:HASH_LENGTH]}{ext}"
+
+
+def _write(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _remove_stale(static_dir: str, logical: str, keep: str):
+    """Delete older hashed copies (and their .gz/.br) of logical, except keep."""
+    root, ext = os.path.splitext(logical)
+    folder = os.path.join(static_dir, os.path.dirname(logical))
+    pattern = re.compile(re.escape(os.path.basename(root)) + r"\.[0-9a-f]{%d}%s(\.gz|\.br)?$" % (HASH_LENGTH, re.escape(ext)))
+    if not os.path.isdir(folder):
+        return
+    for name in os.listdir(folder):
+        if pattern.match(name) and not name.startswith(os.path.basename(keep)):
+            os.remove(os.path.join(folder, name))
+
+
+def compress_variants(data: bytes) -> Dict[str, bytes]:
+    """gzip (and brotli when available) encodings of data, keyed by file suffix."""
+    variants = {".gz": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(data, quality=11)
+    return variants
+
+
+def load_manifest(static_dir: str) -> Dict:
+    path = os.path.join(static_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {"version": None, "assets": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(static_dir: str, manifest: Dict):
+    assets = manifest["assets"]
+    listing = json.dumps({name: assets[name]["hash"] for name in sorted(assets)}, sort_keys=True)
+    manifest["version"] = hashlib.sha256(listing.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+    _write(os.path.join(static_dir, MANIFEST_NAME), json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"))
+
+
+def publish(static_dir: str, logical: str, data: bytes, keep_plain: bool = True, precache: bool = True) -> Dict:
+    """
+    Write data under its plain name (unless keep_plain is False), a content-hashed copy and
+    its compressed siblings, then record it in the static dir's manifest. Unchanged content
+    rewrites nothing, so mtimes and ETags of the served files stay stable. Entries published
+    with precache=False are fetched on demand instead of at service worker install.
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    name = hashed_name(logical, digest)
+    target = os.path.join(static_dir, name)
+    if keep_plain:
+        plain = os.path.join(static_dir, logical)
+        if not os.path.exists(plain) or os.path.getsize(plain) != len(data) or _file_digest(plain) != digest:
+            _write(plain, data)
+
+    entry = {"file": name, "hash": digest[:HASH_LENGTH], "size": len(data)}
+    if not precache:
+        entry["precache"] = False
+    if not os.path.exists(target):
+        _write(target, data)
+    for suffix, encoded in compress_variants(data).items():
+        if not os.path.exists(target + suffix):
+            _write(target + suffix, encoded)
+        entry["gzip" if suffix == ".gz" else "br"] = os.path.getsize(target + suffix)
+    _remove_stale(static_dir, logical, name)
+
+    manifest = load_manifest(static_dir)
+    manifest["assets"][logical] = entry
+    save_manifest(static_dir, manifest)
+    return entry
+
+
+def unpublish(static_dir: str, logical: str):
+    """Remove logical's hashed copies, plain file and manifest entry (e.g. a shard that no longer exists)."""
+    _remove_stale(static_dir, logical, keep="\0")
+    plain = os.path.join(static_dir, logical)
+    if os.path.exists(plain):
+        os.remove(plain)
+    manifest = load_manifest(static_dir)
+    if manifest["assets"].pop(logical, None) is not None:
+        save_manifest(static_dir, manifest)
+
+
+def _file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+_lock = threading.Lock()
+_manifests: Dict[str, tuple] = {}
+
+
+def current_manifest(static_dir: str) -> Dict:
+    """load_manifest, re-read only when the file changes (for per-request rendering)."""
+    path = os.path.join(static_dir, MANIFEST_NAME)
+    mtime = os.path.getmtime(path) if os.path.exists(path) else 0
+    with _lock:
+        cached = _manifests.get(static_dir)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        manifest = load_manifest(static_dir)
+        _manifests[static_dir] = (mtime, manifest)
+        return manifest
+
+
+def render_references(html: str, manifest: Dict, prefix: str = "static/") -> str:
+    """html with script/link references pointed to the manifest's hashed files."""
+    for logical, entry in manifest["assets"].items():
+        root, ext = os.path.splitext(logical)
+        pattern = re.compile(re.escape(prefix + root) + r"(\.[0-9a-f]{%d})?%s(?=[\"'])" % (HASH_LENGTH, re.escape(ext)))
+        html = pattern.sub(prefix + entry["file"], html)
+    return html
+
+
+def rewrite_references(html_path: str, manifest: Dict, prefix: str = "static/") -> bool:
+    """render_references in place (--html, for a copy served without app.py). Returns True if the file changed."""
+    if not os.path.exists(html_path):
+        return False
+    with open(html_path, "r", encoding="utf-8") as f:
+        html = f.read()
+    updated = render_references(html, manifest, prefix)
+    if updated == html:
+        return False
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(updated)
+    return True
+
+
+SW_VERSION_RE = re.compile(r"const ASSET_MANIFEST_VERSION = '[^']*';")
+
+
+def stamp_version(source: str, manifest: Dict) -> str:
+    """
+    sw.js with the manifest version embedded. The browser only reinstalls a service worker whose
+    bytes changed, so this is what makes it pick up a new manifest after a data update.
+    """
+    return SW_VERSION_RE.sub(f"const ASSET_MANIFEST_VERSION = '{manifest['version'] or ''}';", source)
+
+
+def stamp_service_worker(sw_path: str, manifest: Dict) -> bool:
+    """stamp_version in place (--sw). Returns True if the file changed."""
+    if not os.path.exists(sw_path):
+        return False
+    with open(sw_path, "r", encoding="utf-8") as f:
+        source = f.read()
+    updated = stamp_version(source, manifest)
+    if updated == source:
+        return False
+    with open(sw_path, "w", encoding="utf-8") as f:
+        f.write(updated)
+    return True
+
+
+def finalize(static_dir: str, html_paths: Iterable[str] = (), sw_paths: Iterable[str] = ()):
+    """Rewrite index.html references and the sw.js version stamp against static_dir's manifest."""
+    manifest = load_manifest(static_dir)
+    if not manifest["assets"]:
+        return manifest
+    for path in html_paths:
+        if rewrite_references(path, manifest):
+            print(f"Updated asset references in {path}")
+    for path in sw_paths:
+        if stamp_service_worker(path, manifest):
+            print(f"Stamped {path} with asset manifest {manifest['version']}")
+    return manifest
+
+
+def describe(entry: Dict) -> str:
+    sizes = [f"{entry['size']} bytes", f"gzip {entry['gzip']}"]
+    if "br" in entry:
+        sizes.append(f"br {entry['br']}")
+    return f"{entry['file']} ({', '.join(sizes)})"
+
+
+def republish(static_dir: str, names: Optional[Iterable[str]] = None):
+    for logical in names or DATA_ASSETS:
+        path = os.path.join(static_dir, logical)
+        if not os.path.exists(path):
+            continue
+        with open(path, "rb") as f:
+            print(f"{logical}: {describe(publish(static_dir, logical, f.read(), precache=logical in PRECACHED_DATA_ASSETS))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Publish hashed, precompressed copies of the data files in a static folder.")
+    parser.add_argument("--static", required=True, help="Static folder (contains netem_full_list.json, js/...)")
+    parser.add_argument("--html", action="append", default=[], help="index.html to rewrite in place (repeatable; app.py renders its own)")
+    parser.add_argument("--sw", action="append", default=[], help="sw.js to stamp in place (repeatable; app.py stamps its own)")
+    args = parser.parse_args()
+    if brotli is None:
+        print("brotli not installed: writing gzip siblings only")
+    republish(args.static)
+    finalize(args.static, args.html, args.sw)
@@ -0,0 +1,124 @@
+import json
+import sqlite3
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    from prompt_registry import get_system_prompt, prompt_hash
+    from markdown_utils import clean_markdown
+    from cache_writer import write_explanations, ensure_generation_columns
+    from lexicon import normalize_key
+except ImportError:
+    from scripts.explain_verbs.prompt_registry import get_system_prompt, prompt_hash
+    from scripts.explain_verbs.markdown_utils import clean_markdown
+    from scripts.explain_verbs.cache_writer import write_explanations, ensure_generation_columns
+    from scripts.explain_verbs.lexicon import normalize_key
+
+# Endpoint the OpenAI-compatible batch APIs expect in every request line
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+def make_custom_id(mode: str, query_key: str, template_hash: str = None) -> str:
+    custom_id = f"{mode}:{query_key}"
+    return f"{custom_id}#{template_hash}" if template_hash else custom_id
+
+
+def split_custom_id(custom_id: str) -> Tuple[str, str, Optional[str]]:
+    """'single:run#<prompt hash>' -> ('single', 'run', hash); ids without a mode are treated as single."""
+    custom_id, _, template_hash = custom_id.partition("#")
+    mode, sep, query_key = custom_id.partition(":")
+    if not sep:
+        return "single", custom_id, template_hash or None
+    return mode, query_key, template_hash or None
+
+
+def build_request(word: str, pos: Optional[str], model: str, temperature: float = 0.7) -> Dict[str, Any]:
+    """One batch request line, with the same messages explain_verb() sends, keyed like the online writes."""
+    return {
+        "custom_id": make_custom_id("single", normalize_key(word), prompt_hash(pos)),
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": get_system_prompt(pos)},
+                {"role": "user", "content": f"请解析\"{word.strip()}\""}
+            ],
+            "temperature": temperature
+        }
+    }
+
+
+def write_request_file(path: str, words: Iterable[Tuple[str, Optional[str]]], model: str) -> int:
+    """Writes one request per (word, pos) pair to a JSONL file; returns the line count."""
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for word, pos in words:
+            f.write(json.dumps(build_request(word, pos, model), ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+def read_results(path: str) -> Iterator[Tuple[str, Optional[str], Optional[str], Optional[str]]]:
+    """
+    Yields (custom_id, content, error, model) for each line of a provider results file.
+    Accepts both the batch output shape ({"response": {"body": ...}}) and bare
+    chat completion bodies that carry a custom_id.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield f"line:{line_no}", None, f"Invalid JSON: {e}", None
+                continue
+
+            custom_id = record.get("custom_id") or f"line:{line_no}"
+            if record.get("error"):
+                yield custom_id, None, str(record["error"]), None
+                continue
+
+            response = record.get("response") or {}
+            status = response.get("status_code", 200)
+            body = response.get("body", record)
+            if status != 200:
+                yield custom_id, None, f"HTTP {status}", None
+                continue
+
+            try:
+                content = body["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
+                yield custom_id, None, "No message content", None
+                continue
+
+            if not content or "Error calling API" in content:
+                yield custom_id, None, "Empty or failed completion", None
+                continue
+            yield custom_id, content, None, body.get("model")
+
+
+def ingest_results(conn: sqlite3.Connection, path: str, image_url_for: Callable[[str], str] = None,
+                   chunk_size: int = 500) -> Dict[str, Any]:
+    """
+    Cleans every successful completion in a results file and upserts it into
+    explanations, chunk_size rows per transaction. Returns counts and the failed ids.
+    """
+    ensure_generation_columns(conn)
+    stats = {"saved": 0, "failed": 0, "failed_ids": []}
+    pending = []
+    for custom_id, content, error, model in read_results(path):
+        if error:
+            stats["failed"] += 1
+            stats["failed_ids"].append(custom_id)
+            continue
+        mode, query_key, template_hash = split_custom_id(custom_id)
+        image_url = image_url_for(query_key) if image_url_for and mode == "single" else None
+        pending.append((mode, query_key, clean_markdown(content), image_url, template_hash, model))
+        if len(pending) >= chunk_size:
+            stats["saved"] += write_explanations(conn, pending)
+            pending = []
+    if pending:
+        stats["saved"] += write_explanations(conn, pending)
+    return stats
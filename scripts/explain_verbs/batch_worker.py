@@ -5,7 +5,9 @@ import sqlite3
 import time
 import threading
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import uuid
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from typing import List, Dict, Any
 
 from dotenv import load_dotenv
@@ -18,12 +20,36 @@ try:
     from explain_verbs import get_client, explain_verb
     from markdown_utils import clean_markdown
     from settings import settings, load_settings
+    from cache_writer import CacheWriter
+    from provider_pool import ProviderPool, is_rate_limit_error
+    import work_leases
+    import batch_requests
+    from packed_generation import explain_packed, parse_packed_response, packed_prompt_hash, make_groups as group_by_pos
+    from prompt_registry import prompt_hash
+    from cache_writer import ensure_generation_columns
+    import stale_planner
+    import quality
+    from content_codec import decode
+    import lexicon
+    import vocabulary_db
 except ImportError as e:
     print(f"Error importing modules: {e}")
     sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../"))
     from scripts.explain_verbs.explain_verbs import get_client, explain_verb
     from scripts.explain_verbs.markdown_utils import clean_markdown
     from scripts.explain_verbs.settings import settings, load_settings
+    from scripts.explain_verbs.cache_writer import CacheWriter
+    from scripts.explain_verbs.provider_pool import ProviderPool, is_rate_limit_error
+    from scripts.explain_verbs import work_leases
+    from scripts.explain_verbs import batch_requests
+    from scripts.explain_verbs.packed_generation import explain_packed, parse_packed_response, packed_prompt_hash, make_groups as group_by_pos
+    from scripts.explain_verbs.prompt_registry import prompt_hash
+    from scripts.explain_verbs.cache_writer import ensure_generation_columns
+    from scripts.explain_verbs import stale_planner
+    from scripts.explain_verbs import quality
+    from scripts.explain_verbs.content_codec import decode
+    from scripts.explain_verbs import lexicon
+    from scripts.explain_verbs import vocabulary_db
 
 # Constants (mirrored from app.py)
 DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "verbs.db")
@@ -63,12 +89,12 @@ KNOWN_ADJ_ADV = {
     "good", "bad", "great", "new", "old", "young", "right", "wrong", "own", "same", "different", "able", "possible", "likely", "certain", "sure"
 }
 
-# Database and counter locks for thread safety
-db_lock = threading.Lock()
+# Counter lock for thread safety (DB writes go through the single CacheWriter thread)
 counter_lock = threading.Lock()
 
 def get_db_connection():
-    return sqlite3.connect(DB_PATH)
+    # Several batch processes may share verbs.db, so wait for locks instead of failing
+    return sqlite3.connect(DB_PATH, timeout=30)
 
 def generate_image_url(verb: str):
     import urllib.parse
@@ -89,68 +115,37 @@ def generate_image_url(verb: str):
         # Default to DiceBear
         return f"https://api.dicebear.com/9.x/icons/svg?seed={verb}"
 
-def save_to_cache(mode: str, query_key: str, content: str, image_url: str = None):
-    # Optimize markdown before saving
-    optimized_content = clean_markdown(content)
-    
-    with db_lock:
-        conn = get_db_connection()
-        c = conn.cursor()
-        try:
-            # Fetch existing data to preserve fields
-            c.execute("SELECT image_url, image_dicebear, image_pollinations FROM explanations WHERE mode=? AND query_key=?", (mode, query_key))
-            existing = c.fetchone()
-            
-            current_image_url = image_url
-            current_dicebear = None
-            current_pollinations = None
-            
-            if existing:
-                # Preserve existing if new is None
-                if current_image_url is None:
-                    current_image_url = existing[0]
-                
-                current_dicebear = existing[1]
-                current_pollinations = existing[2]
-                
-            # Update specific columns based on new image_url
-            if current_image_url:
-                if "dicebear.com" in current_image_url:
-                    current_dicebear = current_image_url
-                elif "pollinations.ai" in current_image_url:
-                    current_pollinations = current_image_url
-            
-            c.execute("""
-                INSERT OR REPLACE INTO explanations (mode, query_key, content, image_url, image_dicebear, image_pollinations)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (mode, query_key, optimized_content, current_image_url, current_dicebear, current_pollinations))
-            conn.commit()
-        except Exception as e:
-            print(f"Error saving to cache: {e}")
-        finally:
-            conn.close()
-
 def get_explained_verbs() -> set:
-    with db_lock:
-        conn = get_db_connection()
-        c = conn.cursor()
-        c.execute("SELECT query_key FROM explanations WHERE mode = 'single'")
-        explained = {row[0] for row in c.fetchall()}
-        conn.close()
+    conn = get_db_connection()
+    c = conn.cursor()
+    c.execute("SELECT query_key FROM explanations WHERE mode = 'single'")
+    explained = {row[0] for row in c.fetchall()}
+    conn.close()
     return explained
 
-def process_single_verb(item: Dict[str, Any], client: Any, settings: Any, count_info: Dict[str, int]):
-    verb = item['单词'].strip()
-    verb_lower = verb.lower()
-    
-    # Determine POS
-    pos = item.get('pos')
+def resolve_pos(item: Dict[str, Any]) -> str:
+    """POS from the word list, with the same overrides app.py applies."""
+    verb_lower = item['单词'].strip().lower()
     if verb_lower in KNOWN_FUNCTION_WORDS:
-        pos = "prep_conj"
+        return "prep_conj"
     elif verb_lower in KNOWN_PRONOUNS or verb_lower in KNOWN_ARTICLES:
-        pos = "other"
+        return "other"
     elif verb_lower in KNOWN_ADJ_ADV:
-        pos = "adj_adv"
+        return "adj_adv"
+    return item.get('pos')
+
+def load_verbs_list() -> List[Dict[str, Any]]:
+    if not os.path.exists(VERBS_JSON_PATH) and not os.path.exists(vocabulary_db.DEFAULT_DB_PATH):
+        print(f"Error: {VERBS_JSON_PATH} not found.")
+        return []
+
+    # vocabulary.db (rebuilt from the JSON if it changed), in 序号 order
+    return vocabulary_db.load_items()
+
+def process_single_verb(item: Dict[str, Any], pool: ProviderPool, settings: Any, count_info: Dict[str, int], writer: CacheWriter):
+    verb = item['单词'].strip()
+    verb_lower = lexicon.normalize_key(verb)
+    pos = resolve_pos(item)
     
     # Update progress display
     with counter_lock:
@@ -161,22 +156,28 @@ def process_single_verb(item: Dict[str, Any], client: Any, settings: Any, count_
     
     print(f"[{idx}/{total}] Processing: {verb} (POS: {pos})...")
     
+    slot = pool.acquire()
+    ok = False
+    rate_limited = False
+    model = slot.model or settings.openai_model
     try:
         # Generate AI explanation
         prompt = f"请解析\"{verb}\""
-        raw_res = explain_verb(client, prompt, model=settings.openai_model, pos=pos)
+        raw_res = explain_verb(slot.client, prompt, model=model, pos=pos)
         
         if "Error calling API" in raw_res:
-            print(f"[{idx}/{total}] FAILED: {verb} (AI error)")
+            rate_limited = is_rate_limit_error(raw_res)
+            print(f"[{idx}/{total}] FAILED: {verb} (AI error via {slot.name}{', rate limited' if rate_limited else ''})")
             return False
         
+        ok = True
         content = clean_markdown(raw_res)
         
         # Generate image URL
         image_url = generate_image_url(verb_lower)
         
-        # Save to database
-        save_to_cache("single", verb_lower, content, image_url)
+        # Hand off to the writer thread; only blocks if its queue is full
+        writer.put("single", verb_lower, content, image_url, prompt_hash=prompt_hash(pos), model=model)
         
         print(f"[{idx}/{total}] DONE: {verb}")
         return True
@@ -184,21 +185,167 @@ def process_single_verb(item: Dict[str, Any], client: Any, settings: Any, count_
     except Exception as e:
         print(f"[{idx}/{total}] FAILED: {verb} (Unexpected error: {e})")
         return False
+    finally:
+        pool.release(slot, ok, rate_limited)
 
-def process_all_verbs(max_workers: int = 5, force: bool = False, limit: int = 0):
-    # 1. Load verbs
-    if not os.path.exists(VERBS_JSON_PATH):
-        print(f"Error: {VERBS_JSON_PATH} not found.")
+def make_groups(items: List[Dict[str, Any]], pack: int) -> List[List[Dict[str, Any]]]:
+    """packed_generation.make_groups with app.py's POS overrides."""
+    return group_by_pos(items, pack, resolve_pos)
+
+def process_group(items: List[Dict[str, Any]], pool: ProviderPool, settings: Any, count_info: Dict[str, int], writer: CacheWriter):
+    """
+    Generates a group of same-POS words with one packed request, then retries any word
+    the packed answer missed or got wrong with a normal single-word call.
+    Returns (success_count, failed_keys).
+    """
+    if len(items) == 1:
+        ok = process_single_verb(items[0], pool, settings, count_info, writer)
+        return (1, []) if ok else (0, [lexicon.normalize_key(items[0]['单词'])])
+
+    words = [item['单词'].strip() for item in items]
+    pos = resolve_pos(items[0])
+    print(f"Packing {len(words)} words (POS: {pos}): {', '.join(words)}")
+
+    slot = pool.acquire()
+    ok = False
+    rate_limited = False
+    model = slot.model or settings.openai_model
+    try:
+        raw_res = explain_packed(slot.client, words, model, pos=pos)
+        if "Error calling API" in raw_res:
+            rate_limited = is_rate_limit_error(raw_res)
+            print(f"Packed request failed via {slot.name}: {raw_res[:200]}")
+            results, retry = {}, words
+        else:
+            ok = True
+            results, retry = parse_packed_response(raw_res, words)
+    except Exception as e:
+        print(f"Packed request failed (Unexpected error: {e})")
+        results, retry = {}, words
+    finally:
+        pool.release(slot, ok, rate_limited)
+
+    success = 0
+    template_hash = packed_prompt_hash(pos)
+    for word, content in results.items():
+        verb_lower = lexicon.normalize_key(word)
+        with counter_lock:
+            count_info['started'] += 1
+            idx = count_info['started']
+        writer.put("single", verb_lower, clean_markdown(content), generate_image_url(verb_lower),
+                   prompt_hash=template_hash, model=model)
+        print(f"[{idx}/{count_info['total']}] DONE: {word} (packed)")
+        success += 1
+
+    # Fall back to one call per word for whatever the packed answer didn't cover
+    failed = []
+    items_by_word = {item['单词'].strip(): item for item in items}
+    if retry:
+        print(f"Retrying {len(retry)} word(s) individually: {', '.join(retry)}")
+    for word in retry:
+        if process_single_verb(items_by_word[word], pool, settings, count_info, writer):
+            success += 1
+        else:
+            failed.append(lexicon.normalize_key(word))
+    return success, failed
+
+def build_pool(strategy: str, shard_index: int = 0, shard_count: int = 1):
+    global settings
+    settings = load_settings()
+    pool = ProviderPool.from_settings(settings, strategy=strategy)
+    if not pool:
+        return None
+    pool = pool.shard(shard_index, shard_count).connect(get_client)
+    return pool if pool.slots else None
+
+def start_writer(batch_size: int, flush_interval: float, max_workers: int, after_write=None) -> CacheWriter:
+    # Queue holds a few batches per worker before put() starts applying backpressure
+    writer = CacheWriter(DB_PATH, batch_size=batch_size, flush_interval=flush_interval,
+                         max_queue=max(batch_size * 4, max_workers * 2), after_write=after_write)
+    writer.start()
+    return writer
+
+def stop_writer(writer: CacheWriter):
+    # Always flush what the workers produced, even on Ctrl+C
+    print("Flushing pending writes...")
+    writer.close()
+    print(f"Saved {writer.written} rows in {writer.commits} commits ({writer.failed} failed).")
+
+def run_leased_worker(shard_index: int, shard_count: int, run_id: str, to_process: List[Dict[str, Any]], options: Dict[str, Any]):
+    """
+    One batch process. Words are claimed a few at a time through the generation_leases
+    table, so any number of these (in this run or other terminals) never generate the same word.
+    """
+    owner = f"{os.getpid()}-{shard_index}"
+    max_workers = options['max_workers']
+
+    pool = build_pool(options['strategy'], shard_index, shard_count)
+    if not pool:
+        print(f"[worker {shard_index}] Error: Could not initialize AI client. Check your settings.")
         return
 
-    with open(VERBS_JSON_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    
-    key = "5530考研词汇词频排序表 (Verbs Only)"
-    if key not in data:
-        key = list(data.keys())[0]
-    
-    verbs_list = data[key]
+    conn = get_db_connection()
+    work_leases.ensure_lease_table(conn)
+
+    # Leases use the cache key the writer stores (and after_write marks done): "went" leases "go"
+    items_by_key = {}
+    for item in to_process:
+        items_by_key.setdefault(lexicon.normalize_key(item['单词']), item)
+    keys = list(items_by_key.keys())
+    count_info = {'started': 0, 'total': len(keys), 'success': 0}
+    print(f"[worker {shard_index}] Using {len(pool.slots)} provider(s), {max_workers} threads.")
+
+    writer = start_writer(options['batch_size'], options['flush_interval'], max_workers,
+                          after_write=lambda wconn, rows: work_leases.mark_done(wconn, run_id, [row[1] for row in rows]))
+    in_flight = {}
+    pos = 0
+    swept = False
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                # Keep the threads busy, claiming only what they are about to work on
+                want = max_workers * 2 - len(in_flight)
+                claimed = []
+                if want > 0:
+                    claimed, pos = work_leases.claim(conn, owner, run_id, keys, pos, want * max(1, options['pack']),
+                                                     skip_cached=not options['force'])
+                    for group in make_groups([items_by_key[key] for key in claimed], options['pack']):
+                        future = executor.submit(process_group, group, pool, settings, count_info, writer)
+                        in_flight[future] = [lexicon.normalize_key(item['单词']) for item in group]
+
+                if not in_flight:
+                    if pos >= len(keys) and not swept:
+                        # One more pass to pick up leases that expired under crashed processes
+                        pos = 0
+                        swept = True
+                        continue
+                    break
+
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                failed = []
+                for future in done:
+                    in_flight.pop(future)
+                    success, group_failed = future.result()
+                    count_info['success'] += success
+                    failed.extend(group_failed)
+                if failed:
+                    # Failed words are not retried in this run; the next run picks them up
+                    work_leases.mark_done(conn, run_id, failed)
+                    conn.commit()
+    finally:
+        stop_writer(writer)
+        if in_flight:
+            work_leases.release(conn, owner, [key for group_keys in in_flight.values() for key in group_keys])
+        conn.close()
+
+    print(f"[worker {shard_index}] Generated {count_info['success']} verbs.")
+    print(pool.summary())
+
+def get_pending_verbs(force: bool = False, limit: int = 0) -> List[Dict[str, Any]]:
+    # 1. Load verbs
+    verbs_list = load_verbs_list()
+    if not verbs_list:
+        return []
     total_verbs = len(verbs_list)
     print(f"Found {total_verbs} verbs in total.")
 
@@ -210,51 +357,290 @@ def process_all_verbs(max_workers: int = 5, force: bool = False, limit: int = 0)
         explained_verbs = get_explained_verbs()
         print(f"{len(explained_verbs)} verbs already have explanations.")
         # 3. Filter verbs
-        to_process = [item for item in verbs_list if item['单词'].strip().lower() not in explained_verbs]
+        to_process = [item for item in verbs_list if lexicon.normalize_key(item['单词']) not in explained_verbs]
     
     if limit > 0:
         to_process = to_process[:limit]
         print(f"Limiting to first {limit} verbs.")
 
     print(f"{len(to_process)} verbs need processing.")
+    return to_process
+
+def get_stale_verbs(include_unversioned: bool = False, model: str = None, limit: int = 0, include_packed: bool = False):
+    """Cached words whose prompt (or model) changed since generation, as (item, reason), highest 词频 first."""
+    verbs_list = load_verbs_list()
+    if not verbs_list:
+        return []
+    conn = get_db_connection()
+    try:
+        ensure_generation_columns(conn)
+        stale = stale_planner.plan_stale(conn, verbs_list, resolve_pos, model=model, include_unversioned=include_unversioned,
+                                         include_packed=include_packed)
+    finally:
+        conn.close()
+    if limit > 0:
+        stale = stale[:limit]
+    return stale
+
+def print_stale_plan(include_unversioned: bool = False, model: str = None, limit: int = 0, include_packed: bool = False):
+    """Dry run for --stale: what would be regenerated and why."""
+    stale = get_stale_verbs(include_unversioned, model, limit, include_packed)
+    print(stale_planner.summarize(stale, resolve_pos))
+    conn = get_db_connection()
+    try:
+        unversioned = conn.execute("SELECT COUNT(*) FROM explanations WHERE mode = 'single' AND prompt_hash IS NULL").fetchone()[0]
+    finally:
+        conn.close()
+    if unversioned and not include_unversioned:
+        print(f"{unversioned} cached row(s) have no prompt hash yet; --stamp records the current one, --include-unversioned regenerates them.")
+
+def stamp_unversioned_rows(model: str = None):
+    """Marks rows generated before provenance tracking as produced by the current prompts."""
+    verbs_list = load_verbs_list()
+    conn = get_db_connection()
+    try:
+        ensure_generation_columns(conn)
+        stamped = stale_planner.stamp_unversioned(conn, verbs_list, resolve_pos, model=model)
+    finally:
+        conn.close()
+    print(f"Stamped {stamped} unversioned explanation(s) with the current prompt hashes.")
+
+def audit_cache(limit: int = 0):
+    """Scores every cached single-word explanation; returns (item, content, report) for the failing ones, highest 词频 first."""
+    verbs_list = load_verbs_list()
+    items_by_key = {}
+    for item in verbs_list:
+        items_by_key.setdefault(lexicon.normalize_key(item['单词']), item)
+    conn = get_db_connection()
+    try:
+        rows = [(key, decode(conn, content)) for key, content in conn.execute("SELECT query_key, content FROM explanations WHERE mode = 'single'")]
+    finally:
+        conn.close()
+
+    failing = []
+    for key, content in rows:
+        item = items_by_key.get(key) or {'单词': key}
+        report = quality.score_content(content, resolve_pos(item))
+        if not report['ok']:
+            failing.append((item, content, report))
+    failing.sort(key=lambda entry: entry[0].get('词频') or 0, reverse=True)
+    print(f"Checked {len(rows)} explanations: {len(failing)} failed validation.")
+    return failing[:limit] if limit > 0 else failing
+
+def print_audit(limit: int = 0):
+    failing = audit_cache(limit)
+    missing = {}
+    for _, _, report in failing:
+        for name in report['missing'] + report['empty']:
+            missing[name] = missing.get(name, 0) + 1
+    truncated = sum(1 for _, _, report in failing if report['truncated'])
+    full = sum(1 for _, _, report in failing if quality.needs_full_regeneration(report))
+    print(f"  truncated: {truncated}, untitled: {sum(1 for _, _, r in failing if not r['has_title'])}")
+    for name, count in sorted(missing.items(), key=lambda kv: -kv[1]):
+        print(f"  missing/empty {name}: {count}")
+    print(f"Repair plan: {len(failing) - full} section patch(es), {full} full regeneration(s).")
+    for item, _, report in failing[:20]:
+        print(f"  {item['单词'].strip()}: score {report['score']}, missing {report['missing'] + report['empty']}{', truncated' if report['truncated'] else ''}")
+
+def repair_row(item: Dict[str, Any], content: str, report: Dict[str, Any], pool: ProviderPool, settings: Any,
+               count_info: Dict[str, int], writer: CacheWriter) -> bool:
+    """
+    Fixes one failing row: only the missing sections are generated and spliced in when the
+    rest is intact, otherwise (or if the patch still fails validation) the row is regenerated.
+    """
+    if quality.needs_full_regeneration(report):
+        return process_single_verb(item, pool, settings, count_info, writer)
+
+    verb = item['单词'].strip()
+    pos = resolve_pos(item)
+    sections = report['missing'] + report['empty']
+    with counter_lock:
+        count_info['started'] += 1
+        idx = count_info['started']
+    print(f"[{idx}/{count_info['total']}] Patching {verb}: {', '.join(sections)}")
+
+    slot = pool.acquire()
+    ok = False
+    rate_limited = False
+    try:
+        raw_res = quality.explain_sections(slot.client, verb, sections, slot.model or settings.openai_model, pos=pos)
+        if "Error calling API" in raw_res:
+            rate_limited = is_rate_limit_error(raw_res)
+            print(f"[{idx}/{count_info['total']}] FAILED: {verb} (AI error via {slot.name})")
+            return False
+        ok = True
+        patched = clean_markdown(quality.splice_sections(content, raw_res, sections, pos))
+    finally:
+        pool.release(slot, ok, rate_limited)
+
+    if not quality.score_content(patched, pos)['ok']:
+        print(f"[{idx}/{count_info['total']}] Patch for {verb} still incomplete, regenerating the whole entry.")
+        return process_single_verb(item, pool, settings, count_info, writer)
+    # Keeps the image and the row's prompt provenance; only the text changes
+    writer.put("single", lexicon.normalize_key(verb), patched)
+    print(f"[{idx}/{count_info['total']}] REPAIRED: {verb}")
+    return True
+
+def repair_cache(max_workers: int = 5, limit: int = 0, batch_size: int = 50, flush_interval: float = 2.0, strategy: str = "round_robin"):
+    failing = audit_cache(limit)
+    if not failing:
+        print("Nothing to repair.")
+        return
+    pool = build_pool(strategy)
+    if not pool:
+        print("Error: Could not initialize AI client. Check your settings.")
+        return
+
+    count_info = {'started': 0, 'total': len(failing), 'success': 0}
+    writer = start_writer(batch_size, flush_interval, max_workers)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(repair_row, item, content, report, pool, settings, count_info, writer)
+                       for item, content, report in failing]
+            for future in as_completed(futures):
+                if future.result():
+                    count_info['success'] += 1
+    finally:
+        stop_writer(writer)
+    print(f"Repaired {count_info['success']} of {len(failing)} explanations.")
+    print(pool.summary())
 
+def emit_request_file(path: str, force: bool = False, limit: int = 0, model: str = None):
+    """Writes a provider batch-API JSONL file for every pending word (no API calls)."""
+    to_process = get_pending_verbs(force, limit)
     if not to_process:
-        print("All verbs are already processed!")
+        print("Nothing to emit.")
         return
+    model = model or load_settings().openai_model or "gpt-4o"
+    words = ((item['单词'].strip(), resolve_pos(item)) for item in to_process)
+    count = batch_requests.write_request_file(path, words, model)
+    print(f"Wrote {count} requests for model '{model}' to {path}")
 
-    # 4. Initialize AI client
+def ingest_result_file(path: str):
+    """Loads a provider batch-API results JSONL into verbs.db (no API calls)."""
+    if not os.path.exists(path):
+        print(f"Error: {path} not found.")
+        return
     global settings
     settings = load_settings()
-    client = get_client(api_key=settings.openai_api_key, base_url=settings.openai_base_url)
-    if not client:
+    conn = get_db_connection()
+    try:
+        stats = batch_requests.ingest_results(conn, path, image_url_for=generate_image_url)
+    finally:
+        conn.close()
+    print(f"Ingested {stats['saved']} explanations, {stats['failed']} failed.")
+    if stats['failed_ids']:
+        print("Failed: " + ", ".join(stats['failed_ids'][:50]) + (" ..." if stats['failed'] > 50 else ""))
+
+def process_all_verbs(max_workers: int = 5, force: bool = False, limit: int = 0, batch_size: int = 50, flush_interval: float = 2.0,
+                      strategy: str = "round_robin", processes: int = 1, use_leases: bool = False, run_id: str = None, pack: int = 0,
+                      stale: bool = False, include_unversioned: bool = False, stale_model: str = None, include_packed: bool = False):
+    if stale:
+        # Regenerate only what an outdated prompt/model produced; cached rows must not be skipped
+        to_process = [item for item, _ in get_stale_verbs(include_unversioned, stale_model, limit, include_packed)]
+        print(f"{len(to_process)} stale verbs need regenerating.")
+        force = True
+    else:
+        to_process = get_pending_verbs(force, limit)
+    if not to_process:
+        print("All verbs are already processed!")
+        return
+
+    start_time = time.time()
+    options = {'max_workers': max_workers, 'force': force, 'batch_size': batch_size,
+               'flush_interval': flush_interval, 'strategy': strategy, 'pack': pack}
+
+    if processes > 1 or use_leases:
+        # 4a. Lease-coordinated run, optionally fanned out over several processes
+        run_id = run_id or uuid.uuid4().hex
+        print(f"Starting {processes} process(es) x {max_workers} workers (run {run_id})...")
+        if processes == 1:
+            run_leased_worker(0, 1, run_id, to_process, options)
+        else:
+            procs = [multiprocessing.Process(target=run_leased_worker, args=(i, processes, run_id, to_process, options))
+                     for i in range(processes)]
+            for proc in procs:
+                proc.start()
+            for proc in procs:
+                proc.join()
+        print(f"\nBatch processing complete in {time.time() - start_time:.2f} seconds.")
+        return
+
+    # 4b. Initialize AI clients
+    pool = build_pool(strategy)
+    if not pool:
         print("Error: Could not initialize AI client. Check your settings.")
         return
 
     # 5. Process each verb using ThreadPoolExecutor
-    print(f"Starting concurrent processing with {max_workers} workers...")
+    print(f"Starting concurrent processing with {max_workers} workers across {len(pool.slots)} provider(s)...")
     
     count_info = {'started': 0, 'total': len(to_process), 'success': 0}
-    start_time = time.time()
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(process_single_verb, item, client, settings, count_info): item for item in to_process}
-        
-        for future in as_completed(futures):
-            if future.result():
-                count_info['success'] += 1
+    groups = make_groups(to_process, pack)
+    if pack > 1:
+        print(f"Packing up to {pack} same-POS words per request: {len(groups)} requests for {len(to_process)} words.")
+
+    writer = start_writer(batch_size, flush_interval, max_workers)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(process_group, group, pool, settings, count_info, writer): group for group in groups}
+            
+            for future in as_completed(futures):
+                success, _ = future.result()
+                count_info['success'] += success
+    finally:
+        stop_writer(writer)
 
     end_time = time.time()
     duration = end_time - start_time
     print(f"\nBatch processing complete!")
     print(f"Processed {count_info['success']} verbs in {duration:.2f} seconds.")
     print(f"Average time per verb: {duration/max(1, count_info['success']):.2f} seconds.")
+    print(pool.summary())
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Batch process verb explanations.")
     parser.add_argument("--workers", type=int, default=5, help="Number of concurrent workers")
     parser.add_argument("--force", action="store_true", help="Force regenerate existing explanations")
     parser.add_argument("--limit", type=int, default=0, help="Limit number of verbs to process")
+    parser.add_argument("--batch-size", type=int, default=50, help="Rows per grouped DB commit")
+    parser.add_argument("--flush-interval", type=float, default=2.0, help="Max seconds a finished row waits before commit")
+    parser.add_argument("--strategy", choices=["round_robin", "weighted"], default="round_robin", help="How requests are spread over the provider pool")
+    parser.add_argument("--processes", type=int, default=1, help="Number of worker processes (coordinated through verbs.db leases)")
+    parser.add_argument("--lease", action="store_true", help="Claim words through verbs.db leases even with one process (for runs started in several terminals)")
+    parser.add_argument("--run-id", default=None, help="Shared run id so --force runs in separate terminals don't repeat each other's words")
+    parser.add_argument("--pack", type=int, default=0, help="Generate N same-POS words per request (structured JSON output, single-word fallback)")
+    parser.add_argument("--emit-jsonl", metavar="PATH", help="Write a batch-API request file for pending verbs instead of calling the API")
+    parser.add_argument("--ingest-jsonl", metavar="PATH", help="Import a batch-API results file into verbs.db")
+    parser.add_argument("--model", default=None, help="Model name for --emit-jsonl (default: settings)")
+    parser.add_argument("--plan", action="store_true", help="List cached explanations made with an outdated prompt (no API calls)")
+    parser.add_argument("--stale", action="store_true", help="Regenerate only stale explanations, most frequent words first")
+    parser.add_argument("--include-unversioned", action="store_true", help="Treat rows without a recorded prompt hash as stale")
+    parser.add_argument("--include-packed", action="store_true", help="Treat rows generated from a packed (--pack) answer as stale")
+    parser.add_argument("--stale-model", default=None, help="Also treat rows generated by a different model than this one as stale")
+    parser.add_argument("--stamp", action="store_true", help="Record the current prompt hash on rows generated before hashes were tracked")
+    parser.add_argument("--audit", action="store_true", help="Validate cached explanations against their POS template (no API calls)")
+    parser.add_argument("--repair", action="store_true", help="Regenerate missing sections (or whole entries) of explanations that fail validation")
     
     args = parser.parse_args()
     
-    process_all_verbs(max_workers=args.workers, force=args.force, limit=args.limit)
+    if args.audit:
+        print_audit(args.limit)
+    elif args.repair:
+        repair_cache(max_workers=args.workers, limit=args.limit, batch_size=args.batch_size,
+                     flush_interval=args.flush_interval, strategy=args.strategy)
+    elif args.plan:
+        print_stale_plan(args.include_unversioned, args.stale_model, args.limit, args.include_packed)
+    elif args.stamp:
+        stamp_unversioned_rows(args.model or load_settings().openai_model)
+    elif args.emit_jsonl:
+        emit_request_file(args.emit_jsonl, force=args.force, limit=args.limit, model=args.model)
+    elif args.ingest_jsonl:
+        ingest_result_file(args.ingest_jsonl)
+    else:
+        process_all_verbs(max_workers=args.workers, force=args.force, limit=args.limit, batch_size=args.batch_size,
+                          flush_interval=args.flush_interval, strategy=args.strategy, processes=args.processes,
+                          use_leases=args.lease, run_id=args.run_id, pack=args.pack,
+                          stale=args.stale, include_unversioned=args.include_unversioned, stale_model=args.stale_model,
+                          include_packed=args.include_packed)
@@ -0,0 +1,105 @@
+"""
+Micro-benchmark for markdown_utils.clean_markdown over the cached corpus.
+
+Compares the previous six-pass implementation with the compiled pipeline, reports how
+many rows take the already-clean fast path and how many rows the two disagree on.
+
+    python bench_markdown.py [--db verbs.db] [--legacy static/legacy_data.json] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from markdown_utils import clean_markdown, clean_markdown_bulk, is_clean
+from content_codec import decode
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def legacy_clean_markdown(content: str) -> str:
+    """clean_markdown as it was before the compiled pipeline (kept only for comparison)."""
+    if not content:
+        return ""
+    match = re.search(r"^```(?:markdown)?\s*\n(.*?)\n```$", content, re.DOTALL | re.IGNORECASE)
+    if match:
+        content = match.group(1)
+    header_match = re.search(r"^(#+)\s", content, re.MULTILINE)
+    if header_match:
+        start_index = header_match.start()
+        pre_header_text = content[:start_index].strip()
+        if pre_header_text and len(pre_header_text) < 100:
+            content = content[start_index:]
+    content = re.sub(r"^(#+)([^ \n])", r"\1 \2", content, flags=re.MULTILINE)
+    content = re.sub(r"^(\s*[-*])([^ \n])", r"\1 \2", content, flags=re.MULTILINE)
+    content = re.sub(r"\n{3,}", "\n\n", content)
+    content = re.sub(r"\*\*\s+(.*?)\s+\*\*", r"**\1**", content)
+    return content.strip()
+
+
+def load_corpus(db_path: str, legacy_path: str):
+    rows = []
+    if os.path.exists(db_path):
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = [decode(conn, row[0]) for row in conn.execute("SELECT content FROM explanations") if row[0]]
+        except sqlite3.OperationalError:
+            rows = []
+        finally:
+            conn.close()
+    if not rows and os.path.exists(legacy_path):
+        with open(legacy_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        items = data.get("explanations", data) if isinstance(data, dict) else data
+        if isinstance(items, dict):
+            rows = [v.get("content") if isinstance(v, dict) else v for v in items.values()]
+        else:
+            rows = [item.get("content") for item in items]
+        rows = [row for row in rows if isinstance(row, str) and row]
+    return rows
+
+
+def timed(fn, rows, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Markdown cleaning over the cached explanations.")
+    parser.add_argument("--db", default=os.path.join(BASE_DIR, "verbs.db"))
+    parser.add_argument("--legacy", default=os.path.join(BASE_DIR, "static", "legacy_data.json"))
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = load_corpus(args.db, args.legacy)
+    if not rows:
+        print("No explanations found in the database or legacy data.")
+        return
+    total_chars = sum(len(row) for row in rows)
+    print(f"{len(rows)} rows, {total_chars / 1e6:.2f}M characters")
+
+    cleaned = clean_markdown_bulk(rows)
+    fast = sum(1 for row in rows if is_clean(row))
+    changed = sum(1 for row, new in zip(rows, cleaned) if row.strip() != new)
+    unstable = sum(1 for new in cleaned if clean_markdown(new) != new)
+    differs = sum(1 for row, new in zip(rows, cleaned) if legacy_clean_markdown(row) != new)
+    print(f"fast path: {fast} rows ({fast / len(rows):.1%}), rewritten: {changed}, not idempotent: {unstable}, differs from legacy: {differs}")
+
+    legacy = timed(lambda rs: [legacy_clean_markdown(r) for r in rs], rows, args.repeat)
+    current = timed(clean_markdown_bulk, rows, args.repeat)
+    recleaned = timed(clean_markdown_bulk, cleaned, args.repeat)
+    for label, seconds in (("legacy", legacy), ("compiled", current), ("compiled, clean input", recleaned)):
+        print(f"{label:<22} {seconds * 1000:8.1f} ms  {seconds / len(rows) * 1e6:7.1f} us/row")
+
+
+if __name__ == "__main__":
+    main()
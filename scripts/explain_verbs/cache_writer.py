@@ -0,0 +1,193 @@
+import queue
+import sqlite3
+import threading
+import time
+from typing import Callable, Iterable, List, Optional, Tuple
+
+try:
+    from html_render import render_html
+    from section_store import ensure_sections_table, store_sections
+    from content_codec import encode_for_storage, latest_version
+except ImportError:
+    from scripts.explain_verbs.html_render import render_html
+    from scripts.explain_verbs.section_store import ensure_sections_table, store_sections
+    from scripts.explain_verbs.content_codec import encode_for_storage, latest_version
+
+# Sentinel pushed onto the queue to ask the writer to flush and exit
+_STOP = object()
+
+
+def merge_image_columns(existing: Optional[tuple], image_url: Optional[str]):
+    """
+    Resolves (image_url, image_dicebear, image_pollinations) for an upsert,
+    preserving whatever the existing row already has (same rules as app.save_to_cache).
+    """
+    current_image_url = image_url
+    current_dicebear = None
+    current_pollinations = None
+
+    if existing:
+        # Preserve existing if new is None
+        if current_image_url is None:
+            current_image_url = existing[0]
+
+        current_dicebear = existing[1]
+        current_pollinations = existing[2]
+
+    # Update specific columns based on new image_url
+    if current_image_url:
+        if "dicebear.com" in current_image_url:
+            current_dicebear = current_image_url
+        elif "pollinations.ai" in current_image_url:
+            current_pollinations = current_image_url
+
+    return current_image_url, current_dicebear, current_pollinations
+
+
+def ensure_generation_columns(conn: sqlite3.Connection):
+    """
+    Adds the prompt_hash / model provenance and content_html columns and the
+    explanation_sections table to older databases (same as app.init_db).
+    """
+    for column in ("prompt_hash", "model", "content_html"):
+        try:
+            conn.execute(f"ALTER TABLE explanations ADD COLUMN {column} TEXT")
+        except sqlite3.OperationalError:
+            pass
+    conn.commit()
+    ensure_sections_table(conn)
+
+
+def write_explanations(conn: sqlite3.Connection, rows: Iterable[tuple], after_write: Callable = None) -> int:
+    """
+    Upserts (mode, query_key, content, image_url[, prompt_hash, model]) rows in a single
+    transaction, rendering content_html and rewriting explanation_sections alongside.
+    Content is dictionary-compressed once a compression dictionary has been trained.
+    Missing provenance keeps whatever the existing row recorded.
+    after_write(conn, rows) runs inside the same transaction before the commit.
+    The caller owns the connection; returns the number of rows written.
+    """
+    rows = list(rows)
+    c = conn.cursor()
+    count = 0
+    dict_version = latest_version(conn)
+    try:
+        for row in rows:
+            mode, query_key, content, image_url = row[:4]
+            prompt_hash, model = (row[4], row[5]) if len(row) > 4 else (None, None)
+            c.execute("SELECT image_url, image_dicebear, image_pollinations, prompt_hash, model FROM explanations WHERE mode=? AND query_key=?", (mode, query_key))
+            existing = c.fetchone()
+            current_image_url, current_dicebear, current_pollinations = merge_image_columns(existing, image_url)
+            if existing and prompt_hash is None:
+                prompt_hash, model = existing[3], existing[4]
+
+            c.execute("""
+                INSERT OR REPLACE INTO explanations (mode, query_key, content, image_url, image_dicebear, image_pollinations, prompt_hash, model, content_html)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (mode, query_key, encode_for_storage(conn, content, dict_version), current_image_url, current_dicebear, current_pollinations, prompt_hash, model, encode_for_storage(conn, render_html(content), dict_version)))
+            store_sections(conn, mode, query_key, content)
+            count += 1
+        if after_write:
+            after_write(conn, rows)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return count
+
+
+class CacheWriter(threading.Thread):
+    """
+    Single background writer for the explanations cache.
+
+    Workers call put() and go straight back to the LLM; this thread owns the only
+    SQLite connection and commits queued rows in groups, either when batch_size rows
+    are pending or when flush_interval seconds have passed since the oldest one.
+    The queue is bounded, so put() blocks (backpressure) if the disk falls behind.
+    A group that fails is rolled back and retried row by row, so only the bad rows are lost.
+    """
+
+    def __init__(self, db_path: str, batch_size: int = 50, flush_interval: float = 2.0, max_queue: int = 1000, after_write: Callable = None):
+        super().__init__(name="cache-writer", daemon=True)
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.after_write = after_write
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.written = 0
+        self.failed = 0
+        self.commits = 0
+        self._closed = False
+
+    def put(self, mode: str, query_key: str, content: str, image_url: str = None, prompt_hash: str = None, model: str = None):
+        if self._closed:
+            raise RuntimeError("CacheWriter is closed")
+        self.queue.put((mode, query_key, content, image_url, prompt_hash, model))
+
+    def close(self):
+        """Flushes everything still queued and waits for the writer to exit."""
+        if self._closed:
+            return
+        self._closed = True
+        self.queue.put(_STOP)
+        self.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _flush(self, conn: sqlite3.Connection, pending: List[tuple]):
+        if not pending:
+            return
+        try:
+            self.written += write_explanations(conn, pending, after_write=self.after_write)
+            self.commits += 1
+        except Exception as e:
+            if len(pending) == 1:
+                self.failed += 1
+                print(f"Error saving '{pending[0][1]}' to cache: {e}")
+            else:
+                # The group was rolled back; one bad row must not cost the others' generations
+                print(f"Error saving {len(pending)} rows to cache, retrying one by one: {e}")
+                for row in pending:
+                    self._flush(conn, [row])
+        pending.clear()
+
+    def run(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        ensure_generation_columns(conn)
+        pending = []
+        deadline = None
+        try:
+            while True:
+                timeout = None if not pending else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+
+                if item is _STOP:
+                    # Drain anything that raced in before the sentinel
+                    while True:
+                        try:
+                            extra = self.queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if extra is not _STOP:
+                            pending.append(extra)
+                    self._flush(conn, pending)
+                    break
+
+                if item is not None:
+                    if not pending:
+                        deadline = time.monotonic() + self.flush_interval
+                    pending.append(item)
+
+                if pending and (len(pending) >= self.batch_size or time.monotonic() >= deadline):
+                    self._flush(conn, pending)
+        finally:
+            conn.close()
@@ -0,0 +1,371 @@
+"""
+Dictionary-compressed storage for explanations.content and explanations.content_html.
+
+Every explanation repeats the same headings, field labels and template phrases, so
+rows are deflated against a preset dictionary (zlib zdict) trained on the corpus.
+Dictionaries are versioned in the compression_dicts table and never change once
+written; a compressed value is a BLOB of MAGIC + version + raw deflate data, while
+plain TEXT rows are left as they are. Readers go through decode(), writers through
+encode_for_storage(), which only compresses once a dictionary has been trained.
+
+explanation_sections stays plain: it is the external content of explanation_fts, whose
+triggers and snippet() read it as text. Together with the index it outweighs what
+compression saves. --report on a synthetic 5530-row corpus (~1 KB of Markdown per row):
+
+    explanations (content + content_html)   22.70 MB plain -> 11.35 MB compressed
+    explanation_sections + its key index     7.84 MB (plain either way)
+    explanation_fts_data                    20.76 MB (plain either way)
+    explanation_cjk (CJK pair index)         7.67 MB (plain either way)
+    whole database                          59.69 MB       -> 48.34 MB
+
+The same rows as content alone took 5.95 MB (3.79 MB compressed), so HTML, sections
+and search cost far more space than this module wins back.
+
+    python content_codec.py --train              # train and store a new dictionary version
+    python content_codec.py --compress           # rewrite rows with the latest dictionary
+    python content_codec.py --decompress         # back to plain TEXT
+    python content_codec.py --report             # DB and per-table size / read latency / export size, on a copy
+    python content_codec.py --export-compact PATH
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import re
+import shutil
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Union
+
+# BLOB prefix of a compressed value; the 2 bytes after it are the dictionary version
+MAGIC = b"ZD"
+_HEADER = struct.Struct(">2sH")
+# zlib can only look back 32 KB, so a larger dictionary would never be referenced
+MAX_DICT_SIZE = 32 * 1024
+
+_FRAGMENT_SPLIT = re.compile(r"(?<=[，。：；、！？）)”\]])|(?=[（(“\[])")
+
+_lock = threading.Lock()
+# (database file, version) -> dictionary bytes. A version is never rewritten in place, but the
+# file can be replaced (/api/import restores a backup) and a deleted version number can be
+# reused: clear_dictionary_cache() after either
+_dict_cache: Dict[tuple, bytes] = {}
+
+
+_DICT_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS compression_dicts (
+        version INTEGER PRIMARY KEY AUTOINCREMENT,
+        dictionary BLOB NOT NULL,
+        sample_rows INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+
+def ensure_dict_table(conn: sqlite3.Connection):
+    """
+    The only definition of compression_dicts. AUTOINCREMENT keeps a deleted version number
+    from being handed out again; tables created without it are copied over.
+    """
+    conn.execute(_DICT_SCHEMA)
+    sql = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'compression_dicts'").fetchone()[0]
+    if "AUTOINCREMENT" not in sql.upper():
+        conn.execute(_DICT_SCHEMA.replace("compression_dicts", "compression_dicts_new"))
+        conn.execute("INSERT INTO compression_dicts_new SELECT version, dictionary, sample_rows, created_at FROM compression_dicts")
+        conn.execute("DROP TABLE compression_dicts")
+        conn.execute("ALTER TABLE compression_dicts_new RENAME TO compression_dicts")
+    conn.commit()
+
+
+def _db_file(conn: sqlite3.Connection) -> str:
+    row = conn.execute("PRAGMA database_list").fetchone()
+    return row[2] if row else ""
+
+
+def clear_dictionary_cache(db_file: Optional[str] = None):
+    """Forget cached dictionaries of one database file (all files when None)."""
+    with _lock:
+        if db_file is None:
+            _dict_cache.clear()
+        else:
+            for key in [key for key in _dict_cache if key[0] == db_file]:
+                del _dict_cache[key]
+
+
+def is_compressed(value) -> bool:
+    return isinstance(value, (bytes, bytearray, memoryview)) and bytes(value[:2]) == MAGIC
+
+
+def train_dictionary(samples: Iterable[str], size: int = MAX_DICT_SIZE) -> bytes:
+    """
+    Builds a zdict from the fragments that repeat across rows (headings, "- **词源**：",
+    template sentences), weighted by how many bytes they would save. zlib prefers
+    matches near the end of the dictionary, so the most valuable fragments go last.
+    """
+    counts = Counter()
+    for text in samples:
+        seen = set()
+        for line in (text or "").splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            fragments = [line] if len(line) <= 40 else []
+            fragments += [f.strip() for f in _FRAGMENT_SPLIT.split(line)]
+            for fragment in fragments:
+                if len(fragment) >= 2 and fragment not in seen:
+                    seen.add(fragment)
+                    counts[fragment] += 1
+
+    scored = []
+    for fragment, count in counts.items():
+        if count < 2:
+            continue
+        encoded = (fragment + "\n").encode("utf-8")
+        scored.append((count * len(encoded), encoded))
+    scored.sort(reverse=True)
+
+    picked = []
+    total = 0
+    for _, encoded in scored:
+        if total + len(encoded) > size:
+            continue
+        picked.append(encoded)
+        total += len(encoded)
+    return b"".join(reversed(picked))
+
+
+def store_dictionary(conn: sqlite3.Connection, dictionary: bytes, sample_rows: int = 0) -> int:
+    ensure_dict_table(conn)
+    cursor = conn.execute("INSERT INTO compression_dicts (dictionary, sample_rows) VALUES (?, ?)", (dictionary, sample_rows))
+    conn.commit()
+    # A database file replaced behind our back can still reuse a cached version number
+    with _lock:
+        _dict_cache.pop((_db_file(conn), cursor.lastrowid), None)
+    return cursor.lastrowid
+
+
+def latest_version(conn: sqlite3.Connection) -> Optional[int]:
+    try:
+        row = conn.execute("SELECT MAX(version) FROM compression_dicts").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+def get_dictionary(conn: sqlite3.Connection, version: int) -> bytes:
+    key = (_db_file(conn), version)
+    with _lock:
+        cached = _dict_cache.get(key)
+    if cached is not None:
+        return cached
+    row = conn.execute("SELECT dictionary FROM compression_dicts WHERE version = ?", (version,)).fetchone()
+    if not row:
+        raise ValueError(f"Compression dictionary v{version} is missing from the database")
+    with _lock:
+        _dict_cache[key] = bytes(row[0])
+    return _dict_cache[key]
+
+
+def compress(text: str, dictionary: bytes, version: int) -> bytes:
+    packer = zlib.compressobj(level=9, wbits=-15, zdict=dictionary)
+    return _HEADER.pack(MAGIC, version) + packer.compress(text.encode("utf-8")) + packer.flush()
+
+
+def decompress(value: bytes, dictionary: bytes) -> str:
+    unpacker = zlib.decompressobj(wbits=-15, zdict=dictionary)
+    return (unpacker.decompress(bytes(value[_HEADER.size:])) + unpacker.flush()).decode("utf-8")
+
+
+def decode(conn: sqlite3.Connection, value: Union[str, bytes, None]) -> Optional[str]:
+    """explanations.content as text, whether the row is compressed or not."""
+    if not is_compressed(value):
+        return value
+    _, version = _HEADER.unpack(bytes(value[:_HEADER.size]))
+    return decompress(value, get_dictionary(conn, version))
+
+
+def encode_for_storage(conn: sqlite3.Connection, text: str, version: Optional[int] = None) -> Union[str, bytes]:
+    """Compressed with the latest dictionary if one was trained, otherwise the text unchanged."""
+    if version is None:
+        version = latest_version(conn)
+    if not version or not text:
+        return text
+    return compress(text, get_dictionary(conn, version), version)
+
+
+def _sample_rows(conn: sqlite3.Connection, limit: int) -> List[str]:
+    rows = [decode(conn, row[0]) for row in conn.execute("SELECT content FROM explanations")]
+    if limit and len(rows) > limit:
+        rows = random.Random(0).sample(rows, limit)
+    return rows
+
+
+def train(conn: sqlite3.Connection, sample: int = 2000, size: int = MAX_DICT_SIZE) -> int:
+    """Trains a dictionary on (a sample of) the cached rows and stores it as a new version."""
+    samples = _sample_rows(conn, sample)
+    if not samples:
+        raise ValueError("No explanations to train on")
+    return store_dictionary(conn, train_dictionary(samples, size), len(samples))
+
+
+def recode_all(conn: sqlite3.Connection, version: Optional[int], chunk_size: int = 500) -> int:
+    """Rewrites content and content_html of every row with dictionary `version` (None: plain TEXT). Returns rows rewritten."""
+    columns = ["content"] + [row[1] for row in conn.execute("PRAGMA table_info(explanations)") if row[1] == "content_html"]
+    ids = [row[0] for row in conn.execute("SELECT id FROM explanations")]
+    changed = 0
+    for i in range(0, len(ids), chunk_size):
+        chunk = ids[i:i + chunk_size]
+        marks = ",".join("?" for _ in chunk)
+        updates = []
+        for row_id, *values in conn.execute(f"SELECT id, {', '.join(columns)} FROM explanations WHERE id IN ({marks})", chunk):
+            texts = [decode(conn, value) for value in values]
+            new_values = [encode_for_storage(conn, text, version) if version else text for text in texts]
+            if new_values != values:
+                updates.append((*new_values, row_id))
+        assignments = ", ".join(f"{column} = ?" for column in columns)
+        conn.executemany(f"UPDATE explanations SET {assignments} WHERE id = ?", updates)
+        conn.commit()
+        changed += len(updates)
+    return changed
+
+
+def export_compact(conn: sqlite3.Connection, path: str) -> int:
+    """
+    legacy_data.json's {"word": {...}} shape, gzip-compressed. Whole-file compression
+    beats per-row dictionaries for a one-shot dump, and browsers can read it with
+    DecompressionStream('gzip'). Returns the number of records.
+    """
+    data = {}
+    for query_key, content, image_url, image_dicebear, image_pollinations in conn.execute(
+            "SELECT query_key, content, image_url, image_dicebear, image_pollinations FROM explanations WHERE mode='single'"):
+        if not query_key:
+            continue
+        data[query_key.lower()] = {
+            "content": decode(conn, content),
+            "image_url": image_url,
+            "image_dicebear": image_dicebear,
+            "image_pollinations": image_pollinations
+        }
+    with gzip.open(path, "wt", encoding="utf-8", compresslevel=9) as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    return len(data)
+
+
+def _db_size(path: str) -> int:
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("VACUUM")
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        conn.close()
+    return page_count * page_size
+
+
+def table_sizes(path: str) -> Dict[str, int]:
+    """Bytes per table and index (dbstat), largest first; empty when SQLite lacks dbstat."""
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name ORDER BY 2 DESC").fetchall()
+    except sqlite3.OperationalError:
+        return {}
+    finally:
+        conn.close()
+    return dict(rows)
+
+
+def _read_latency(path: str, keys: List[str]) -> float:
+    """Mean microseconds for a keyed lookup plus decode, over `keys`."""
+    conn = sqlite3.connect(path)
+    try:
+        start = time.perf_counter()
+        for key in keys:
+            row = conn.execute("SELECT content FROM explanations WHERE mode='single' AND query_key=?", (key,)).fetchone()
+            decode(conn, row[0])
+        return (time.perf_counter() - start) / max(1, len(keys)) * 1e6
+    finally:
+        conn.close()
+
+
+def report(db_path: str, sample: int = 2000):
+    """Measures plain vs dictionary-compressed storage on a temporary copy of the database."""
+    with tempfile.TemporaryDirectory() as tmp:
+        plain = os.path.join(tmp, "plain.db")
+        packed = os.path.join(tmp, "packed.db")
+        shutil.copy2(db_path, plain)
+
+        conn = sqlite3.connect(plain)
+        recode_all(conn, None)
+        texts = [row[0] for row in conn.execute("SELECT content FROM explanations")]
+        keys = [row[0] for row in conn.execute("SELECT query_key FROM explanations WHERE mode='single'")]
+        conn.close()
+        if not texts:
+            print("No explanations to measure.")
+            return
+        shutil.copy2(plain, packed)
+
+        conn = sqlite3.connect(packed)
+        start = time.perf_counter()
+        version = train(conn, sample)
+        train_seconds = time.perf_counter() - start
+        recode_all(conn, version)
+        dictionary = get_dictionary(conn, version)
+        export_path = os.path.join(tmp, "legacy_data.json.gz")
+        export_compact(conn, export_path)
+        conn.close()
+
+        raw_bytes = sum(len(t.encode("utf-8")) for t in texts)
+        zlib_bytes = sum(len(zlib.compress(t.encode("utf-8"), 9)) for t in texts)
+        dict_bytes = sum(len(compress(t, dictionary, version)) for t in texts)
+        plain_size, packed_size = _db_size(plain), _db_size(packed)
+        json_size = len(json.dumps({i: t for i, t in enumerate(texts)}, ensure_ascii=False).encode("utf-8"))
+
+        lookup = random.Random(1).sample(keys, min(len(keys), 1000))
+        plain_us, packed_us = _read_latency(plain, lookup), _read_latency(packed, lookup)
+
+        print(f"{len(texts)} rows, dictionary {len(dictionary) / 1024:.1f} KB (trained in {train_seconds:.2f}s)")
+        print(f"content bytes: raw {raw_bytes / 1e6:.2f} MB, zlib {zlib_bytes / 1e6:.2f} MB, zlib+dict {dict_bytes / 1e6:.2f} MB ({dict_bytes / raw_bytes:.1%})")
+        print(f"DB size: {plain_size / 1e6:.2f} MB -> {packed_size / 1e6:.2f} MB")
+        print(f"read latency: {plain_us:.1f} us -> {packed_us:.1f} us per lookup")
+        print(f"export: content JSON {json_size / 1e6:.2f} MB, compact gzip export {os.path.getsize(export_path) / 1e6:.2f} MB")
+        # Only content and content_html are compressed: explanation_sections and the FTS index stay plain
+        plain_tables, packed_tables = table_sizes(plain), table_sizes(packed)
+        for name in sorted(set(plain_tables) | set(packed_tables), key=lambda n: -plain_tables.get(n, 0))[:10]:
+            print(f"  {name:<32} {plain_tables.get(name, 0) / 1e6:8.2f} MB -> {packed_tables.get(name, 0) / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dictionary compression for explanations.content and content_html.")
+    parser.add_argument("--db", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "verbs.db"))
+    parser.add_argument("--train", action="store_true", help="Train and store a new dictionary version")
+    parser.add_argument("--compress", action="store_true", help="Rewrite all rows with the latest dictionary (trains one if needed)")
+    parser.add_argument("--decompress", action="store_true", help="Rewrite all rows as plain TEXT")
+    parser.add_argument("--report", action="store_true", help="Measure DB and per-table size, read latency and export size on a copy")
+    parser.add_argument("--export-compact", metavar="PATH", help="Write a gzip-compressed legacy_data.json")
+    parser.add_argument("--sample", type=int, default=2000, help="Rows sampled for training")
+    args = parser.parse_args()
+
+    if args.report:
+        report(args.db, args.sample)
+    else:
+        conn = sqlite3.connect(args.db, timeout=30)
+        try:
+            ensure_dict_table(conn)
+            if args.train or (args.compress and not latest_version(conn)):
+                print(f"Stored dictionary v{train(conn, args.sample)}.")
+            if args.compress:
+                print(f"Compressed {recode_all(conn, latest_version(conn))} rows.")
+            elif args.decompress:
+                print(f"Decompressed {recode_all(conn, None)} rows.")
+            if args.export_compact:
+                print(f"Exported {export_compact(conn, args.export_compact)} records to {args.export_compact}")
+            if not (args.train or args.compress or args.decompress or args.export_compact):
+                parser.print_help()
+        finally:
+            conn.close()
@@ -1,5 +1,9 @@
 import sqlite3
 import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from content_codec import decode
 
 DB_PATH = os.path.join(os.path.dirname(__file__), 'verbs.db')
 
@@ -13,7 +17,7 @@ def check_verb(verb):
         
         if row:
             print(f"--- START {verb} ---")
-            content = row[0]
+            content = decode(conn, row[0])
             print(content[:500]) # Print first 500 chars
             print(f"REPR: {repr(content[:100])}")
             print("...")
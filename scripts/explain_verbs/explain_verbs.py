@@ -20,11 +20,11 @@ except ImportError:
     pass
 
 try:
-    from prompt import EXPLAIN_VERB_SYSTEM_PROMPT, EXPLAIN_NOUN_SYSTEM_PROMPT, EXPLAIN_CONCEPT_SYSTEM_PROMPT, EXPLAIN_ADJ_ADV_SYSTEM_PROMPT, EXPLAIN_PREP_SYSTEM_PROMPT, EXPLAIN_PREP_CONJ_SYSTEM_PROMPT
+    from prompt_registry import get_system_prompt
 except ImportError:
     # Fallback if running from root
     try:
-        from scripts.explain_verbs.prompt import EXPLAIN_VERB_SYSTEM_PROMPT, EXPLAIN_NOUN_SYSTEM_PROMPT, EXPLAIN_CONCEPT_SYSTEM_PROMPT, EXPLAIN_ADJ_ADV_SYSTEM_PROMPT, EXPLAIN_PREP_SYSTEM_PROMPT, EXPLAIN_PREP_CONJ_SYSTEM_PROMPT
+        from scripts.explain_verbs.prompt_registry import get_system_prompt
     except ImportError:
         print("Error: Could not import prompt module.")
         sys.exit(1)
@@ -70,21 +70,7 @@ def explain_verb(client, user_input, model=None, pos=None):
             model = os.environ.get("DEFAULT_MODEL", "gpt-4o")
 
     # Select prompt based on POS
-    system_prompt = EXPLAIN_VERB_SYSTEM_PROMPT
-    
-    if pos == "noun":
-        system_prompt = EXPLAIN_NOUN_SYSTEM_PROMPT
-    elif pos == "other":
-        system_prompt = EXPLAIN_CONCEPT_SYSTEM_PROMPT
-    elif pos == "adj_adv" or pos == "adj" or pos == "adv":
-        system_prompt = EXPLAIN_ADJ_ADV_SYSTEM_PROMPT
-    elif pos == "prep":
-        system_prompt = EXPLAIN_PREP_SYSTEM_PROMPT
-    elif pos == "prep_conj":
-        system_prompt = EXPLAIN_PREP_CONJ_SYSTEM_PROMPT
-    elif pos == "noun_verb" or pos == "verb_noun":
-        system_prompt = EXPLAIN_VERB_SYSTEM_PROMPT
-    # verb uses default
+    system_prompt = get_system_prompt(pos)
 
     try:
         response = client.chat.completions.create(
@@ -104,7 +90,8 @@ def main():
     parser.add_argument("verbs", nargs="*", help="List of verbs to explain (e.g., make do have)")
     parser.add_argument("--file", "-f", help="Path to a file containing verbs (one per line or JSON)")
     parser.add_argument("--json-file", "-j", help="Path to netem_verbs.json to process top N verbs")
-    parser.add_argument("--limit", "-n", type=int, default=5, help="Number of verbs to process from JSON file")
+    parser.add_argument("--view", help="vocabulary.db view to process top N words from (e.g. verbs, nouns)")
+    parser.add_argument("--limit", "-n", type=int, default=5, help="Number of verbs to process from JSON file or view")
     parser.add_argument("--output", "-o", help="Output file path (Markdown). If not specified, prints to stdout.")
     parser.add_argument("--model", "-m", default=None, help="LLM model to use (default: from .env or gpt-4o)")
     parser.add_argument("--prompt-type", choices=["single", "list", "compare"], default="single", help="Type of prompt to construct")
@@ -153,11 +140,23 @@ def main():
         else:
             print(f"Warning: JSON file {args.json_file} not found.")
 
+    if args.view:
+        try:
+            try:
+                from vocabulary_db import load_items
+            except ImportError:
+                from scripts.explain_verbs.vocabulary_db import load_items
+            for item in load_items(args.view, limit=args.limit):
+                if item['单词'] not in verbs_to_process:
+                    verbs_to_process.append(item['单词'])
+        except Exception as e:
+            print(f"Error reading view {args.view}: {e}")
+
     if not verbs_to_process:
         print("No verbs found or specified.")
         print("Usage examples:")
         print("  python scripts/explain_verbs/explain_verbs.py make do")
-        print("  python scripts/explain_verbs/explain_verbs.py --json-file netem_verbs.json --limit 5")
+        print("  python scripts/explain_verbs/explain_verbs.py --view verbs --limit 5")
         sys.exit(0)
 
     client = get_client()
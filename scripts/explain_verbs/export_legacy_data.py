@@ -5,6 +5,8 @@ import sys
 
 # Add parent directory to path to allow importing settings
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from content_codec import decode
 
 DB_PATH = os.path.join(os.path.dirname(__file__), 'verbs.db')
 DIST_STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'dist', 'static')
@@ -30,7 +32,7 @@ def export_data():
         
         for row in rows:
             query_key = row[0]
-            content = row[1]
+            content = decode(conn, row[1])
             image_url = row[2]
             
             # Prefer specific provider images if available, fallback to generic
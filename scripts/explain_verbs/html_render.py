@@ -0,0 +1,125 @@
+"""
+Server-side HTML for cached explanations (explanations.content_html).
+
+Rendered once from the cleaned Markdown when a row is written, so clients can skip
+marked.parse() on every card flip. Each section is wrapped in
+<section data-section="..."> ("title" for the word heading) to match the per-section
+cards the frontend builds, after the same fixups index.html applies to a card's Markdown
+before marked.parse() (card_fixups), so both paths show the same card. The `markdown` package is optional: without it rows are
+stored without HTML and clients fall back to rendering the Markdown themselves.
+Like content, the HTML is stored through content_codec (compressed once a dictionary exists).
+
+    python html_render.py --backfill [--force]
+"""
+import argparse
+import html
+import os
+import re
+import sqlite3
+from typing import Optional
+
+try:
+    from markdown_utils import iter_sections, section_keys
+    from content_codec import decode, encode_for_storage
+except ImportError:
+    from scripts.explain_verbs.markdown_utils import iter_sections, section_keys
+    from scripts.explain_verbs.content_codec import decode, encode_for_storage
+
+try:
+    import markdown as _markdown
+except ImportError:
+    _markdown = None
+
+HTML_AVAILABLE = _markdown is not None
+
+_EXTENSIONS = ["extra", "sane_lists"]
+# The prompts nest "- *映射*" under numbered items with 3 spaces; marked accepts that,
+# Python-Markdown wants 4
+_SHALLOW_NESTED_ITEM = re.compile(r"^ {2,3}(?=(?:[-*+]|\d+\.) )", re.MULTILINE)
+
+
+_BROKEN_H3 = re.compile(r"(?:^|\n)\s*#\s+#\s+#")
+_SPLIT_H3 = re.compile(r"(?:^|\n)\s*##\s+#")
+_SPLIT_BOLD = re.compile(r"\*\s+\*")
+_PADDED_BOLD = re.compile(r"\*\*\s+(.*?)\s+\*\*")
+_BOLD_AFTER_LETTER = re.compile(r"([a-zA-Z])\*\*")
+_BOLD_BEFORE_LETTER = re.compile(r"\*\*([a-zA-Z])")
+_BOLD = re.compile(r"\*\*([^*]+?)\*\*")
+_LIST_SPACE = re.compile(r"(^|\n)\s*-(?=[^ \t\n])")
+_LIST_AFTER_TEXT = re.compile(r"([^\n])\n\s*- ")
+
+
+def _section_header() -> "re.Pattern":
+    keys = "|".join(re.escape(key) for key in section_keys())
+    return re.compile(r"(^|\n)\s*[*#]*\s*(" + keys + r")[*#：:]*\s*")
+
+
+def card_fixups(chunk: str) -> str:
+    """The Markdown repairs index.html runs on each card before marked.parse(), in the same order."""
+    chunk = _BROKEN_H3.sub("\n###", chunk)
+    chunk = _SPLIT_H3.sub("\n###", chunk)
+    chunk = _SPLIT_BOLD.sub("**", chunk)
+    chunk = _PADDED_BOLD.sub(r"**\1**", chunk)
+    chunk = _BOLD_AFTER_LETTER.sub(r"\1 **", chunk)
+    chunk = _BOLD_BEFORE_LETTER.sub(r"** \1", chunk)
+    chunk = _section_header().sub(r"\1#### \2\n\n", chunk)
+    # index.html swaps these for tokens and restores <strong> after marked, so bold survives inside words
+    chunk = _BOLD.sub(r"<strong>\1</strong>", chunk)
+    chunk = _LIST_SPACE.sub(r"\1- ", chunk)
+    return _LIST_AFTER_TEXT.sub(r"\1\n\n- ", chunk)
+
+
+def _render_chunk(text: str) -> str:
+    text = _SHALLOW_NESTED_ITEM.sub("    ", card_fixups(text))
+    return _markdown.markdown(text, extensions=_EXTENSIONS, output_format="html")
+
+
+def render_html(content: str) -> Optional[str]:
+    """HTML for cleaned Markdown, or None when the markdown package is not installed."""
+    if not HTML_AVAILABLE or not content:
+        return None
+    return "".join(
+        f'<section data-section="{html.escape(name, quote=True)}">{_render_chunk(chunk)}</section>'
+        for name, chunk in iter_sections(content)
+    )
+
+
+def ensure_html_column(conn: sqlite3.Connection):
+    try:
+        conn.execute("ALTER TABLE explanations ADD COLUMN content_html TEXT")
+    except sqlite3.OperationalError:
+        pass
+    conn.commit()
+
+
+def backfill_html(conn: sqlite3.Connection, force: bool = False, chunk_size: int = 500) -> int:
+    """Renders content_html for rows that have none (every row with force). Returns rows updated."""
+    if not HTML_AVAILABLE:
+        raise RuntimeError("The 'markdown' package is required: pip install markdown")
+    ensure_html_column(conn)
+    where = "" if force else " WHERE content_html IS NULL"
+    rows = conn.execute(f"SELECT id, content FROM explanations{where}").fetchall()
+    updated = 0
+    for i in range(0, len(rows), chunk_size):
+        batch = [(encode_for_storage(conn, render_html(decode(conn, content))), row_id) for row_id, content in rows[i:i + chunk_size]]
+        conn.executemany("UPDATE explanations SET content_html = ? WHERE id = ?", batch)
+        conn.commit()
+        updated += len(batch)
+    return updated
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-render explanation HTML into verbs.db.")
+    parser.add_argument("--backfill", action="store_true", help="Render HTML for rows that don't have it yet")
+    parser.add_argument("--force", action="store_true", help="Re-render every row")
+    parser.add_argument("--db", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "verbs.db"))
+    args = parser.parse_args()
+
+    if not (args.backfill or args.force):
+        parser.print_help()
+    else:
+        conn = sqlite3.connect(args.db, timeout=30)
+        try:
+            print(f"Rendered {backfill_html(conn, force=args.force)} explanations.")
+        finally:
+            conn.close()
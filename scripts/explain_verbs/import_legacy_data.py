@@ -1,6 +1,10 @@
 import json
 import sqlite3
 import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from markdown_utils import clean_markdown_bulk
 
 DB_PATH = os.path.join(os.path.dirname(__file__), 'verbs.db')
 LEGACY_DATA_PATH = os.path.join(os.path.dirname(__file__), 'static', 'legacy_data.json')
@@ -24,10 +28,12 @@ def import_data():
     print(f"Importing {len(explanations)} explanations...")
     
     count = 0
-    for item in explanations:
+    cleaned = clean_markdown_bulk(item.get('content') or "" for item in explanations)
+    for item, content in zip(explanations, cleaned):
+        if not content:
+            continue
         mode = item.get('mode')
         query_key = item.get('query_key')
-        content = item.get('content')
         image_url = item.get('image_url')
         created_at = item.get('created_at')
 
@@ -1,9 +1,13 @@
 import sqlite3
 import os
-import json
 import random
 from datetime import datetime, timedelta
 
+try:
+    from vocabulary_db import load_items
+except ImportError:
+    from scripts.explain_verbs.vocabulary_db import load_items
+
 # Database Setup
 DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "verbs.db")
 VERBS_JSON_PATH = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../netem_full_list.json"))
@@ -18,9 +22,7 @@ def inject_test_data():
         print(f"Error: {VERBS_JSON_PATH} not found.")
         return
 
-    with open(VERBS_JSON_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-        all_verbs_list = data.get("5530考研词汇词频排序表", [])
+    all_verbs_list = load_items()
 
     if not all_verbs_list:
         print("Error: No verbs found in JSON.")
@@ -0,0 +1,164 @@
+"""
+Frequency-ranked shards of the legacy explanation export (legacy_data.json).
+
+legacy_data.json holds every cached explanation in one object the PWA had to download and
+parse before anything worked. Here the same {"word": {content, image_*}} records are split
+by the word's rank in netem_full_list.json (序号, most frequent first):
+
+    legacy/shard_0.<hash>.json   ranks    1-500     (loaded eagerly)
+    legacy/shard_1.<hash>.json   ranks  501-1500
+    legacy/shard_2.<hash>.json   ranks 1501-3000
+    legacy/shard_3.<hash>.json   ranks 3001+ and words outside the list
+
+Each shard is published through asset_build (hashed, .gz/.br, in asset-manifest.json; only
+the eager ones are precached by sw.js). legacy/index.json describes the shards:
+
+    {"version": 1, "total": 4873, "eager": 1,
+     "shards": [{"file": "legacy/shard_0.<hash>.json", "ranks": [1, 500], "count": 480, "size": ..., "gzip": ...}, ...]}
+
+js/data_legacy_eager.js inlines the index and the eager shards (window.NETEM_LEGACY_INDEX,
+window.NETEM_LEGACY_DATA) for index.html; LocalAPI fetches the other shards when a word of
+their rank range is looked up.
+
+    python legacy_shards.py --report [--legacy static/legacy_data.json]
+"""
+import argparse
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    from asset_build import load_manifest, publish, unpublish
+    from search_index import load_word_list
+except ImportError:
+    from scripts.explain_verbs.asset_build import load_manifest, publish, unpublish
+    from scripts.explain_verbs.search_index import load_word_list
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_WORDS_PATH = os.path.abspath(os.path.join(BASE_DIR, "../../netem_full_list.json"))
+# Upper rank of every shard but the last, which takes the remaining ranks and unranked words
+DEFAULT_BOUNDS = (500, 1500, 3000)
+EAGER_SHARDS = 1
+INDEX_NAME = "legacy/index.json"
+EAGER_JS_NAME = "js/data_legacy_eager.js"
+
+
+def shard_name(i: int) -> str:
+    return f"legacy/shard_{i}.json"
+
+
+def normalize_key(key: str) -> str:
+    """Same normalization LocalAPI applies to legacy keys: lowercase, no ':verb' suffix."""
+    key = key.strip().lower()
+    return key[:-5] if key.endswith(":verb") else key
+
+
+def word_ranks(items: Sequence[Dict[str, Any]]) -> Dict[str, int]:
+    """Lowercase spelling (and 其他拼写 variant) -> 序号 of its entry; the best rank wins."""
+    ranks: Dict[str, int] = {}
+    for position, item in enumerate(items, 1):
+        rank = item.get('序号') or position
+        for spelling in (item.get('单词'), item.get('其他拼写')):
+            spelling = (spelling or "").strip().lower()
+            if spelling and rank < ranks.get(spelling, rank + 1):
+                ranks[spelling] = rank
+    return ranks
+
+
+def shard_index(rank: Optional[int], bounds: Sequence[int]) -> int:
+    if rank is None:
+        return len(bounds)
+    for i, upper in enumerate(bounds):
+        if rank <= upper:
+            return i
+    return len(bounds)
+
+
+def split(legacy_data: Dict[str, Any], ranks: Dict[str, int], bounds: Sequence[int] = DEFAULT_BOUNDS) -> List[Dict[str, Any]]:
+    """legacy_data split into len(bounds) + 1 dicts, each ordered by rank."""
+    keyed = sorted(legacy_data.items(), key=lambda kv: (ranks.get(normalize_key(kv[0]), float("inf")), kv[0]))
+    shards: List[Dict[str, Any]] = [{} for _ in range(len(bounds) + 1)]
+    for key, value in keyed:
+        shards[shard_index(ranks.get(normalize_key(key)), bounds)][key] = value
+    return shards
+
+
+def _dumps(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def write_shards(static_dir: str, legacy_data: Dict[str, Any], ranks: Dict[str, int],
+                 bounds: Sequence[int] = DEFAULT_BOUNDS, eager: int = EAGER_SHARDS) -> Dict[str, Any]:
+    """Publish the shards, legacy/index.json and js/data_legacy_eager.js into static_dir; returns the index."""
+    shards = split(legacy_data, ranks, bounds)
+    index: Dict[str, Any] = {"version": 1, "total": len(legacy_data), "eager": eager, "shards": []}
+    lower = 1
+    for i, shard in enumerate(shards):
+        entry = publish(static_dir, shard_name(i), _dumps(shard), keep_plain=False, precache=i < eager)
+        upper = bounds[i] if i < len(bounds) else None
+        index["shards"].append({
+            "file": entry["file"],
+            "ranks": [lower, upper],
+            "count": len(shard),
+            "size": entry["size"],
+            "gzip": entry["gzip"],
+        })
+        lower = (upper or 0) + 1
+
+    # Shards left over from a build with more bounds
+    manifest = load_manifest(static_dir)
+    for logical in list(manifest["assets"]):
+        if logical.startswith("legacy/shard_") and logical not in {shard_name(i) for i in range(len(shards))}:
+            unpublish(static_dir, logical)
+
+    publish(static_dir, INDEX_NAME, _dumps(index))
+    eager_data: Dict[str, Any] = {}
+    for shard in shards[:eager]:
+        eager_data.update(shard)
+    eager_js = b"window.NETEM_LEGACY_INDEX = " + _dumps(index) + b";\nwindow.NETEM_LEGACY_DATA = " + _dumps(eager_data) + b";"
+    publish(static_dir, EAGER_JS_NAME, eager_js)
+    return index
+
+
+def report(legacy_path: str, words_path: str = DEFAULT_WORDS_PATH, bounds: Sequence[int] = DEFAULT_BOUNDS):
+    """Shard sizes and parse times against the single legacy_data.json."""
+    with open(legacy_path, "rb") as f:
+        raw = f.read()
+    legacy_data = json.loads(raw)
+    shards = split(legacy_data, word_ranks(load_word_list(words_path)), bounds)
+
+    def parse_ms(data: bytes) -> float:
+        start = time.perf_counter()
+        json.loads(data)
+        return (time.perf_counter() - start) * 1000
+
+    print(f"legacy_data.json: {len(legacy_data)} records, {len(raw) / 1024:.1f} KB, parse {parse_ms(raw):.1f} ms")
+    lower = 1
+    for i, shard in enumerate(shards):
+        data = _dumps(shard)
+        upper = bounds[i] if i < len(bounds) else None
+        label = f"ranks {lower}-{upper}" if upper else f"ranks {lower}+"
+        eager = " (eager)" if i < EAGER_SHARDS else ""
+        print(f"shard {i} {label:<16} {len(shard):>5} records  {len(data) / 1024:8.1f} KB  parse {parse_ms(data):6.1f} ms{eager}")
+        lower = (upper or 0) + 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Frequency-ranked shards of legacy_data.json.")
+    parser.add_argument("--legacy", default=os.path.join(BASE_DIR, "static", "legacy_data.json"))
+    parser.add_argument("--words", default=DEFAULT_WORDS_PATH)
+    parser.add_argument("--report", action="store_true", help="Print shard sizes and parse times")
+    parser.add_argument("--write", metavar="STATIC_DIR", help="Publish the shards into this static folder")
+    args = parser.parse_args()
+
+    if args.write:
+        with open(args.legacy, "r", encoding="utf-8") as f:
+            legacy = json.load(f)
+        index = write_shards(args.write, legacy, word_ranks(load_word_list(args.words)))
+        for shard in index["shards"]:
+            print(f"{shard['file']}: {shard['count']} records, {shard['size']} bytes, gzip {shard['gzip']}")
+    if args.report:
+        report(args.legacy, args.words)
+    if not (args.report or args.write):
+        parser.print_help()
@@ -0,0 +1,175 @@
+"""
+Persistent WordNet features per word (lexical_features.db), so POS tagging doesn't query WordNet each run.
+
+    features(word PRIMARY KEY, noun, verb, adj, adv, lemmas, version)
+        noun/verb/adj/adv = number of WordNet synsets for that POS (adj includes satellites)
+        lemmas            = morphy base forms over all four POS, '|'-joined
+
+add_pos_to_verbs.py (the pos column of netem_full_list.json) and filter_verbs.py --wordnet
+read this table. Only words that are not in it yet (a new or respelled entry in the list) or
+that were extracted by another FEATURE_VERSION are computed, in a multiprocessing pool; NLTK is
+not imported at all when nothing is missing.
+
+    python lexical_features.py --update [--processes 8]
+    python lexical_features.py --stats
+"""
+import argparse
+import multiprocessing
+import os
+import sqlite3
+import time
+from typing import Callable, Dict, Iterable, NamedTuple, Optional
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+DEFAULT_FEATURES_PATH = os.path.join(REPO_ROOT, "lexical_features.db")
+# Bump when extract() changes, so cached rows are recomputed
+FEATURE_VERSION = 1
+# Fewer missing words than this are extracted in-process (a pool costs more than it saves)
+POOL_THRESHOLD = 200
+CHUNK_SIZE = 64
+
+
+class Features(NamedTuple):
+    noun: int
+    verb: int
+    adj: int
+    adv: int
+    lemmas: str
+
+
+_wn = None
+
+
+def _wordnet():
+    global _wn
+    if _wn is None:
+        import nltk
+        from nltk.corpus import wordnet
+        try:
+            nltk.data.find('corpora/wordnet.zip')
+        except LookupError:
+            nltk.download('wordnet')
+            nltk.download('omw-1.4')
+        wordnet.ensure_loaded()
+        _wn = wordnet
+    return _wn
+
+
+def normalize(word: str) -> str:
+    return word.strip().lower()
+
+
+def extract(word: str) -> Features:
+    """Synset counts and base forms of one (normalized) word."""
+    wn = _wordnet()
+    counts = {pos: 0 for pos in ("n", "v", "a", "r")}
+    for synset in wn.synsets(word):
+        pos = "a" if synset.pos() == "s" else synset.pos()
+        counts[pos] += 1
+    lemmas = sorted({base for pos in counts for base in [wn.morphy(word, pos)] if base})
+    return Features(counts["n"], counts["v"], counts["a"], counts["r"], "|".join(lemmas))
+
+
+def _extract_pair(word: str):
+    return word, extract(word)
+
+
+def pos_category(features: Optional[Features]) -> str:
+    """The pos value add_pos_to_verbs.py stores: noun_verb, noun, verb, adj_adv or other."""
+    if features is None:
+        return "other"
+    if features.noun and features.verb:
+        return "noun_verb"
+    elif features.noun:
+        return "noun"
+    elif features.verb:
+        return "verb"
+    elif features.adj or features.adv:
+        return "adj_adv"
+    return "other"
+
+
+def connect(path: str = DEFAULT_FEATURES_PATH) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS features (
+            word TEXT PRIMARY KEY,
+            noun INTEGER NOT NULL,
+            verb INTEGER NOT NULL,
+            adj INTEGER NOT NULL,
+            adv INTEGER NOT NULL,
+            lemmas TEXT NOT NULL,
+            version INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """)
+    return conn
+
+
+def compute(words: Iterable[str], processes: Optional[int] = None,
+            extractor: Callable[[str], Features] = extract) -> Dict[str, Features]:
+    """Features of words; large batches go through a process pool."""
+    words = list(words)
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(words) < POOL_THRESHOLD or extractor is not extract:
+        return {word: extractor(word) for word in words}
+    with multiprocessing.Pool(processes) as pool:
+        return dict(pool.imap_unordered(_extract_pair, words, chunksize=CHUNK_SIZE))
+
+
+def ensure_features(words: Iterable[str], path: str = DEFAULT_FEATURES_PATH, processes: Optional[int] = None,
+                    extractor: Callable[[str], Features] = extract) -> Dict[str, Features]:
+    """Features for every word (normalized keys), computing and storing only the missing ones."""
+    wanted = {normalize(word) for word in words if word and word.strip()}
+    conn = connect(path)
+    try:
+        known: Dict[str, Features] = {}
+        for word, noun, verb, adj, adv, lemmas in conn.execute(
+                "SELECT word, noun, verb, adj, adv, lemmas FROM features WHERE version = ?", (FEATURE_VERSION,)):
+            if word in wanted:
+                known[word] = Features(noun, verb, adj, adv, lemmas)
+        missing = sorted(wanted - known.keys())
+        if missing:
+            fresh = compute(missing, processes, extractor)
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO features (word, noun, verb, adj, adv, lemmas, version) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(word, *features, FEATURE_VERSION) for word, features in fresh.items()])
+            known.update(fresh)
+        return known
+    finally:
+        conn.close()
+
+
+def word_list() -> list:
+    try:
+        from vocabulary_db import load_items
+    except ImportError:
+        from scripts.explain_verbs.vocabulary_db import load_items
+    return [item['单词'] for item in load_items()]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cache WordNet features of the word list.")
+    parser.add_argument("--db", default=DEFAULT_FEATURES_PATH)
+    parser.add_argument("--update", action="store_true", help="Extract features of words not cached yet")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--stats", action="store_true", help="Print cached rows per POS category")
+    args = parser.parse_args()
+
+    if args.update:
+        start = time.perf_counter()
+        features = ensure_features(word_list(), args.db, args.processes)
+        print(f"Features of {len(features)} words up to date in {time.perf_counter() - start:.2f} s")
+    if args.stats:
+        conn = connect(args.db)
+        rows = conn.execute("SELECT noun, verb, adj, adv, lemmas FROM features WHERE version = ?", (FEATURE_VERSION,)).fetchall()
+        conn.close()
+        stats: Dict[str, int] = {}
+        for row in rows:
+            category = pos_category(Features(*row))
+            stats[category] = stats.get(category, 0) + 1
+        print(f"{len(rows)} cached words")
+        for category, n in sorted(stats.items(), key=lambda kv: -kv[1]):
+            print(f"  {category}: {n}")
+    if not (args.update or args.stats):
+        parser.print_help()
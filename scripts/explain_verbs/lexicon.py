@@ -0,0 +1,377 @@
+"""
+Cache-key canonicalization for the word list: inflected forms and variant spellings map
+to the list entry, so "went", "studies", "analyses", "color" or "colours" find the cached
+explanation of "go", "study", "analysis" and "colour" instead of being generated again
+under a new key.
+
+The map is built offline and shipped as static/lemma_map.json
+({"lemmas": {lemma: "form form ..."}, "variants": {entry: "spelling ..."}}), so the server
+never loads NLTK or the 1 MB variant dictionary; at runtime both sections are merged
+into one dict and a lookup is a single probe.
+
+Variant spellings come from each entry's 其他拼写 and from the US/UK groups in
+scripts/spelling-variations/lib/bydictionary.json that contain a list word or one of
+its inflections. Building generates the regular forms of every entry
+from its pos (plurals, -s/-ed/-ing, and -er/-est for the adjectives comparable() accepts)
+plus the irregular forms below; when NLTK with WordNet is installed (as for
+add_pos_to_verbs.py), WordNet's exception lists add the irregular forms it knows and
+morphy() vets the generated ones. Forms that are words of the list themselves, or words
+in their own right (DERIVED_WORDS: "housing" is not "house"), are never mapped away.
+
+    python lexicon.py --build [--no-wordnet]
+    python lexicon.py --lookup went
+"""
+import argparse
+import json
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+try:
+    from search_index import load_word_list
+except ImportError:
+    from scripts.explain_verbs.search_index import load_word_list
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_WORDS_PATH = os.path.abspath(os.path.join(BASE_DIR, "../../netem_full_list.json"))
+LEMMA_MAP_PATH = os.path.join(BASE_DIR, "static", "lemma_map.json")
+VARIANTS_PATH = os.path.abspath(os.path.join(BASE_DIR, "../spelling-variations/lib/bydictionary.json"))
+
+NOUN_POS = {"noun", "noun_verb"}
+VERB_POS = {"verb", "noun_verb"}
+ADJ_POS = {"adj_adv"}
+
+# Irregular verbs: base -> past, past participle (variants separated by "/")
+IRREGULAR_VERBS = {
+    "arise": "arose arisen", "awake": "awoke awoken", "be": "was/were been", "bear": "bore borne/born",
+    "beat": "beat beaten", "become": "became become", "begin": "began begun", "bend": "bent bent",
+    "bet": "bet bet", "bid": "bid bid", "bind": "bound bound", "bite": "bit bitten", "bleed": "bled bled",
+    "blow": "blew blown", "break": "broke broken", "breed": "bred bred", "bring": "brought brought",
+    "broadcast": "broadcast broadcast", "build": "built built", "burn": "burnt/burned burnt/burned",
+    "burst": "burst burst", "buy": "bought bought", "cast": "cast cast", "catch": "caught caught",
+    "choose": "chose chosen", "cling": "clung clung", "come": "came come", "cost": "cost cost",
+    "creep": "crept crept", "cut": "cut cut", "deal": "dealt dealt", "dig": "dug dug", "do": "did done",
+    "draw": "drew drawn", "dream": "dreamt/dreamed dreamt/dreamed", "drink": "drank drunk",
+    "drive": "drove driven", "eat": "ate eaten", "fall": "fell fallen", "feed": "fed fed",
+    "feel": "felt felt", "fight": "fought fought", "find": "found found", "flee": "fled fled",
+    "fly": "flew flown", "forbid": "forbade forbidden", "forecast": "forecast forecast",
+    "forget": "forgot forgotten", "forgive": "forgave forgiven", "freeze": "froze frozen",
+    "get": "got got/gotten", "give": "gave given", "go": "went gone", "grind": "ground ground",
+    "grow": "grew grown", "hang": "hung hung", "have": "had had", "hear": "heard heard",
+    "hide": "hid hidden", "hit": "hit hit", "hold": "held held", "hurt": "hurt hurt", "keep": "kept kept",
+    "kneel": "knelt knelt", "know": "knew known", "lay": "laid laid", "lead": "led led",
+    "lean": "leant/leaned leant/leaned", "leap": "leapt/leaped leapt/leaped", "learn": "learnt/learned learnt/learned",
+    "leave": "left left", "lend": "lent lent", "let": "let let", "lie": "lay lain", "light": "lit lit",
+    "lose": "lost lost", "make": "made made", "mean": "meant meant", "meet": "met met",
+    "mislead": "misled misled", "mistake": "mistook mistaken", "overcome": "overcame overcome",
+    "overtake": "overtook overtaken", "pay": "paid paid", "prove": "proved proven/proved", "put": "put put",
+    "quit": "quit quit", "read": "read read", "ride": "rode ridden", "ring": "rang rung", "rise": "rose risen",
+    "run": "ran run", "say": "said said", "see": "saw seen", "seek": "sought sought", "sell": "sold sold",
+    "send": "sent sent", "set": "set set", "sew": "sewed sewn", "shake": "shook shaken", "shed": "shed shed",
+    "shine": "shone shone", "shoot": "shot shot", "show": "showed shown", "shrink": "shrank shrunk",
+    "shut": "shut shut", "sing": "sang sung", "sink": "sank sunk", "sit": "sat sat", "sleep": "slept slept",
+    "slide": "slid slid", "speak": "spoke spoken", "speed": "sped sped", "spell": "spelt/spelled spelt/spelled",
+    "spend": "spent spent", "spill": "spilt/spilled spilt/spilled", "spin": "spun spun", "split": "split split",
+    "spoil": "spoilt/spoiled spoilt/spoiled", "spread": "spread spread", "spring": "sprang sprung",
+    "stand": "stood stood", "steal": "stole stolen", "stick": "stuck stuck", "sting": "stung stung",
+    "strike": "struck struck", "strive": "strove striven", "swear": "swore sworn", "sweep": "swept swept",
+    "swell": "swelled swollen", "swim": "swam swum", "swing": "swung swung", "take": "took taken",
+    "teach": "taught taught", "tear": "tore torn", "tell": "told told", "think": "thought thought",
+    "throw": "threw thrown", "thrust": "thrust thrust", "tread": "trod trodden", "undergo": "underwent undergone",
+    "understand": "understood understood", "undertake": "undertook undertaken", "upset": "upset upset",
+    "wake": "woke woken", "wear": "wore worn", "weave": "wove woven", "weep": "wept wept", "win": "won won",
+    "wind": "wound wound", "withdraw": "withdrew withdrawn", "withstand": "withstood withstood",
+    "write": "wrote written",
+}
+IRREGULAR_FORMS = {
+    # Nouns
+    "man": "men", "woman": "women", "child": "children", "foot": "feet", "tooth": "teeth", "mouse": "mice",
+    "goose": "geese", "person": "people", "ox": "oxen", "phenomenon": "phenomena", "criterion": "criteria",
+    "datum": "data", "medium": "media", "bacterium": "bacteria", "curriculum": "curricula",
+    "index": "indices", "appendix": "appendices", "stimulus": "stimuli", "nucleus": "nuclei",
+    "fungus": "fungi", "radius": "radii", "focus": "foci", "syllabus": "syllabi", "alga": "algae",
+    "formula": "formulae", "antenna": "antennae",
+    # Comparison
+    "good": "better best", "well": "better best", "bad": "worse worst", "ill": "worse worst",
+    "far": "farther/further farthest/furthest", "little": "less least", "many": "more most", "much": "more most",
+    "old": "elder eldest",
+    # Auxiliaries
+    "be": "am is are", "have": "has",
+}
+
+# adj_adv entries that take no -er/-est: adverbs, determiners, prepositions and absolutes
+NOT_COMPARABLE = set("""
+    all any away below beyond both but by dual each false fluent hence just less lest liable loyal
+    many maybe most much nearby next not on once only quite some such though through too twice
+    very viable yet
+""".split())
+
+# Dictionary words of their own that look like a regular form of a list entry; mapping
+# them would answer "housing" with the explanation of "house"
+DERIVED_WORDS = set("""
+    aged booking boxing building catering ceiling clothing coating contented crossing dogged
+    dressing easterner filling flooring gathering gifted heading housing icing landing lighting
+    lining listing lodging longing mining northerner offering packaging parking proceeding ragged
+    roofing ruling savings seating shipping siding sitting southerner sporting staging standing
+    tiling timing topping tubing wedding westerner wiring wording
+""".split())
+
+_SIBILANT = re.compile(r"(s|x|z|ch|sh)$")
+_CONSONANT_Y = re.compile(r"[^aeiou]y$")
+_CVC = re.compile(r"(?:^|[^aeiou])[aeiou]([^aeiouwxy])$")
+
+
+def _plural(word: str) -> List[str]:
+    if word.endswith("sis"):
+        return [word[:-3] + "ses"]
+    if _CONSONANT_Y.search(word):
+        return [word[:-1] + "ies"]
+    if word.endswith("fe"):
+        return [word + "s", word[:-2] + "ves"]
+    if word.endswith("f") and not word.endswith("ff"):
+        return [word + "s", word[:-1] + "ves"]
+    if _SIBILANT.search(word):
+        return [word + "es"]
+    if word.endswith("o"):
+        return [word + "s", word + "es"]
+    return [word + "s"]
+
+
+def _suffixed(word: str, suffix: str) -> List[str]:
+    """word + a vowel suffix (-ed, -ing, -er, -est) with the usual spelling changes."""
+    if word.endswith("e"):
+        if suffix != "ing":
+            return [word[:-1] + suffix]
+        if word.endswith("ie"):
+            return [word[:-2] + "ying"]
+        if word.endswith(("ee", "ye", "oe")):
+            return [word + suffix]
+        return [word[:-1] + suffix]
+    if _CONSONANT_Y.search(word) and suffix != "ing":
+        return [word[:-1] + "i" + suffix]
+    forms = [word + suffix]
+    match = _CVC.search(word)
+    if match:
+        # stop -> stopped is certain for one syllable; for longer words it depends on stress, so keep both
+        doubled = word + match.group(1) + suffix
+        forms = [doubled] if len(re.findall(r"[aeiou]+", word)) == 1 else forms + [doubled]
+    if word.endswith("c"):
+        forms.append(word + "k" + suffix)
+    return forms
+
+
+def comparable(word: str, definition: Optional[str] = None) -> bool:
+    """
+    Whether an adj_adv entry takes -er/-est: one syllable, or two ending in -y/-ow/-le
+    ("happy", "narrow", "simple"); -ly words only when 释义 reads as an adjective (…的).
+    """
+    if word in NOT_COMPARABLE:
+        return False
+    if word.endswith("ly") and "的" not in (definition or ""):
+        return False
+    syllables = len(re.findall(r"[aeiouy]+", word))
+    if syllables > 1 and word.endswith("e") and not word.endswith("le"):
+        syllables -= 1
+    return syllables == 1 or (syllables == 2 and word.endswith(("y", "ow", "le")))
+
+
+def irregular_forms(word: str) -> Set[str]:
+    forms: Set[str] = set()
+    for table in (IRREGULAR_VERBS, IRREGULAR_FORMS):
+        for part in table.get(word, "").split():
+            forms.update(part.split("/"))
+    return forms
+
+
+def generate_forms(word: str, pos: Optional[str], definition: Optional[str] = None) -> Set[str]:
+    """Regular and irregular inflections of word for its pos category (definition: its 释义, see comparable)."""
+    forms: Set[str] = set()
+    if pos in NOUN_POS or pos is None:
+        forms.update(_plural(word))
+    if pos in VERB_POS or pos is None:
+        forms.update(_plural(word))  # third person singular follows the plural rules
+        forms.update(_suffixed(word, "ed"))
+        forms.update(_suffixed(word, "ing"))
+    if pos in ADJ_POS and comparable(word, definition):
+        forms.update(_suffixed(word, "er"))
+        forms.update(_suffixed(word, "est"))
+    forms.update(irregular_forms(word))
+    forms.discard(word)
+    return forms - DERIVED_WORDS
+
+
+def _wordnet():
+    try:
+        from nltk.corpus import wordnet as wn
+        wn.ensure_loaded()
+        return wn
+    except Exception:
+        return None
+
+
+def build_lemma_map(items: Sequence[Dict[str, Any]], use_wordnet: bool = True) -> Dict[str, List[str]]:
+    """{lemma: sorted forms}. A form claimed by several entries goes to the most frequent one."""
+    entries = sorted((item for item in items if item.get('单词')), key=lambda item: -(item.get('词频') or 0))
+    listed = {item['单词'].strip().lower() for item in entries}
+    wn = _wordnet() if use_wordnet else None
+    wordnet_pos = {"noun": ["n"], "verb": ["v"], "noun_verb": ["n", "v"], "adj_adv": ["a", "r"]}
+
+    irregular_from_wordnet: Dict[str, Set[str]] = {}
+    if wn is not None:
+        # WordNet's *.exc exception lists: inflected form -> base forms
+        for pos_code, exceptions in wn._exception_map.items():
+            for form, bases in exceptions.items():
+                for base in bases:
+                    irregular_from_wordnet.setdefault(base, set()).add(form)
+
+    owner: Dict[str, str] = {}
+    for item in entries:
+        lemma = item['单词'].strip().lower()
+        if " " in lemma or not lemma.isalpha():
+            continue
+        pos = item.get('pos')
+        forms = generate_forms(lemma, pos, item.get('释义'))
+        if wn is not None:
+            # Keep generated forms WordNet reduces back to this lemma, plus its irregulars
+            codes = wordnet_pos.get(pos, ["n", "v", "a", "r"])
+            vetted = {form for form in forms if any(wn.morphy(form, code) == lemma for code in codes)}
+            forms = (vetted | irregular_forms(lemma) | irregular_from_wordnet.get(lemma, set())) - DERIVED_WORDS
+        for form in forms:
+            if form not in listed and form not in owner:
+                owner[form] = lemma
+
+    lemmas: Dict[str, List[str]] = {}
+    for form, lemma in owner.items():
+        lemmas.setdefault(lemma, []).append(form)
+    return {lemma: sorted(forms) for lemma, forms in sorted(lemmas.items())}
+
+
+def build_variant_map(items: Sequence[Dict[str, Any]], lemmas: Dict[str, List[str]],
+                      variant_groups: Iterable[Iterable[str]] = ()) -> Dict[str, List[str]]:
+    """
+    {entry: sorted variant spellings}. A spelling group (其他拼写 pairs, bydictionary rows)
+    maps to the most frequent list word in it, or to the lemma of an inflected form in it
+    ("colours" -> "colour" brings its US spelling "colors" along). A spelling that is an
+    inflection of an entry's own 其他拼写 goes to that entry rather than to a lemma-map target
+    ("analyzes" -> "analyze", the 其他拼写 of "analyse", even though "analyses" of the same
+    group is the plural of "analysis"). List words and forms already claimed by the lemma map are never remapped.
+    """
+    entries = sorted((item for item in items if item.get('单词')), key=lambda item: -(item.get('词频') or 0))
+    rank = {item['单词'].strip().lower(): i for i, item in reversed(list(enumerate(entries)))}
+    forms = {form: lemma for lemma, group in lemmas.items() for form in group}
+
+    # Each entry's 其他拼写, then its inflections -> the entry ("promizing" stays promising's, not promize's)
+    own_forms: Dict[str, str] = {}
+    for item in entries:
+        variant = (item.get('其他拼写') or "").strip().lower()
+        if variant.isalpha():
+            own_forms.setdefault(variant, item['单词'].strip().lower())
+    for item in entries:
+        variant = (item.get('其他拼写') or "").strip().lower()
+        if variant.isalpha():
+            for form in generate_forms(variant, item.get('pos'), item.get('释义')):
+                own_forms.setdefault(form, item['单词'].strip().lower())
+
+    groups = [[item['单词'], item['其他拼写']] for item in entries if item.get('其他拼写')]
+    groups.extend(variant_groups)
+    owner: Dict[str, str] = {}
+    for group in groups:
+        spellings = {spelling.strip().lower() for spelling in group if spelling and spelling.strip()}
+        targets = [spelling if spelling in rank else forms.get(spelling) or own_forms[spelling]
+                   for spelling in spellings if spelling in rank or spelling in forms or spelling in own_forms]
+        if not targets:
+            continue
+        canonical = min(targets, key=lambda word: rank.get(word, len(rank)))
+        for spelling in spellings:
+            if spelling != canonical and spelling not in rank and spelling not in forms and spelling not in owner:
+                # A list word spelled in the group wins; a lemma-map target only if the spelling has no entry of its own
+                owner[spelling] = canonical if canonical in spellings else own_forms.get(spelling, canonical)
+
+    variants: Dict[str, List[str]] = {}
+    for spelling, canonical in owner.items():
+        variants.setdefault(canonical, []).append(spelling)
+    return {canonical: sorted(spellings) for canonical, spellings in sorted(variants.items())}
+
+
+def load_variant_groups(path: str = VARIANTS_PATH) -> List[List[str]]:
+    """Spelling groups from bydictionary.json ({word: "UK1|UK2|UK3|UK4|US1|US2|US3|US4|UKUS"})."""
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return [[word] + joined.split("|") for word, joined in data.items()]
+
+
+def write_lemma_map(lemmas: Dict[str, List[str]], path: str = LEMMA_MAP_PATH, source: str = "rules",
+                    variants: Optional[Dict[str, List[str]]] = None):
+    payload = {
+        "version": 2,
+        "source": source,
+        "lemmas": {lemma: " ".join(forms) for lemma, forms in lemmas.items()},
+        "variants": {entry: " ".join(spellings) for entry, spellings in (variants or {}).items()}
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+_lock = threading.Lock()
+_maps: Dict[str, tuple] = {}
+
+
+def get_key_map(path: str = LEMMA_MAP_PATH) -> Dict[str, str]:
+    """{inflected form or variant spelling: list word} from the shipped data file, reloaded when it changes."""
+    mtime = os.path.getmtime(path) if os.path.exists(path) else 0
+    with _lock:
+        cached = _maps.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        forms: Dict[str, str] = {}
+        if mtime:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for section in ("lemmas", "variants"):
+                for entry, joined in data.get(section, {}).items():
+                    for form in joined.split():
+                        forms[form] = entry
+        _maps[path] = (mtime, forms)
+        return forms
+
+
+def lemmatize(word: str) -> Optional[str]:
+    """The list entry word is an inflection or variant spelling of, or None (unknown, or a list word itself)."""
+    return get_key_map().get((word or "").strip().lower())
+
+
+def normalize_key(word: str) -> str:
+    """Cache key for a single word: lowercased, with inflections and variant spellings mapped to the list entry."""
+    key = (word or "").strip().lower()
+    return get_key_map().get(key, key)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or query the inflection / variant spelling -> entry map.")
+    parser.add_argument("--words", default=DEFAULT_WORDS_PATH)
+    parser.add_argument("--variants", default=VARIANTS_PATH, help="bydictionary.json of the spelling-variations package")
+    parser.add_argument("--out", default=LEMMA_MAP_PATH)
+    parser.add_argument("--build", action="store_true", help="Regenerate the lemma map from the word list")
+    parser.add_argument("--no-wordnet", action="store_true", help="Use only the built-in rules even if NLTK is installed")
+    parser.add_argument("--lookup", help="Print the lemma for a word")
+    args = parser.parse_args()
+
+    if args.build:
+        use_wordnet = not args.no_wordnet and _wordnet() is not None
+        if not args.no_wordnet and not use_wordnet:
+            print("NLTK/WordNet not available, building from the built-in rules only.")
+        items = load_word_list(args.words)
+        lemmas = build_lemma_map(items, use_wordnet)
+        variants = build_variant_map(items, lemmas, load_variant_groups(args.variants))
+        write_lemma_map(lemmas, args.out, "wordnet" if use_wordnet else "rules", variants)
+        print(f"Wrote {sum(len(forms) for forms in lemmas.values())} forms of {len(lemmas)} lemmas and "
+              f"{sum(len(spellings) for spellings in variants.values())} variant spellings of {len(variants)} entries "
+              f"to {args.out} ({os.path.getsize(args.out) / 1024:.0f} KB)")
+    if args.lookup:
+        print(get_key_map(args.out).get(args.lookup.strip().lower()) or f"{args.lookup}: no lemma")
+    if not (args.build or args.lookup):
+        parser.print_help()
@@ -1,44 +1,155 @@
 import re
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+# Section names the old prompts produced (see test_regex.py); the current ones come from prompt.py
+LEGACY_SECTION_KEYS = ['三维理解', '本质动作', '关键洞察', '深度解析', '应用场景', '错误纠正', '对比分析', '本质', '场景比喻']
+
+# POS values with their own system prompt (None is the verb prompt)
+_PROMPT_POS = (None, "noun", "adj_adv", "prep", "prep_conj", "other")
+
+# Matches ```markdown\n ... \n``` or ```\n ... \n``` around the whole answer,
+# optionally after one short line of filler ("好的，解析如下：")
+_CODE_BLOCK = re.compile(r"^\s*(?:[^\n`]{1,100}\n\s*)?```(?:markdown)?\s*\n(.*?)\n```\s*$", re.DOTALL | re.IGNORECASE)
+_FIRST_HEADER = re.compile(r"^#+\s", re.MULTILINE)
+# "##Title" -> "## Title" (a run of #'s on its own is left alone)
+_HEADER_SPACE = re.compile(r"^(#+)([^ #\n])")
+# "## # Title" -> "### Title", the damage the old "^(#+)([^ \n])" rule did to every header
+_HEADER_SPLIT = re.compile(r"^(#+)((?:[ \t]+#+)+)(?=[ \t]+\S)")
+# "-item" -> "- item"; "---" rules and "**bold**" lines are not list items
+_LIST_SPACE = re.compile(r"^([ \t]*)(-(?![-\s])|\*(?![*\s])(?!.*\*))")
+# One **...** pair at a time, so "**a** and **b**" is never read as "** and **"
+_BOLD = re.compile(r"\*\*([^*\n]+)\*\*")
+_SECTION_HEADING = re.compile(r"^####\s+(.+?)\s*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=None)
+def section_keys() -> tuple:
+    """Every section heading the prompts ask for plus the legacy ones, longest first."""
+    try:
+        from quality import expected_sections
+    except ImportError:
+        from scripts.explain_verbs.quality import expected_sections
+    keys = set(LEGACY_SECTION_KEYS)
+    for pos in _PROMPT_POS:
+        keys.update(expected_sections(pos)[0])
+    return tuple(sorted(keys, key=len, reverse=True))
+
+
+@lru_cache(maxsize=None)
+def _section_line() -> "re.Pattern":
+    # A whole line that is only a (decorated) section name: "## # # 三维理解", "**场景比喻：**", "* *本质动作"
+    key_pattern = "|".join(re.escape(key) for key in section_keys())
+    return re.compile(r"^[ \t]*(?:[*#][ \t]*)*(" + key_pattern + r")(?:[ \t*#：:])*$")
+
+
+@lru_cache(maxsize=None)
+def _dirty() -> "re.Pattern":
+    """
+    Anything clean_markdown would change; content without a match skips the full pass.
+    Searched over "\n" + text + "\n" so every branch can start on a literal instead of ^/$.
+    """
+    key_pattern = "|".join(re.escape(key) for key in section_keys())
+    return re.compile(
+        r"\n[ \t]*\n[ \t]*\n|\n[ \t]+\n"
+        r"|\n#+[^ #\n]|\n#+(?:[ \t]+#+)+[ \t]"
+        r"|\n[ \t]*-(?![-\s])|\n[ \t]*\*(?![*\s])(?![^\n]*\*)"
+        r"|\*\*[ \t][^*\n]*\*\*|\*\*[^*\n]*[ \t]\*\*"
+        r"|\n(?!#### (?:" + key_pattern + r")\n)[ \t]*(?:[*#][ \t]*)*(?:" + key_pattern + r")[ \t*#：:]*\n"
+    )
+
+
+def _strip_bold(match: "re.Match") -> str:
+    inner = match.group(1).strip()
+    return f"**{inner}**" if inner else match.group(0)
+
+
+def is_clean(content: str) -> bool:
+    """True when clean_markdown(content) would only strip surrounding whitespace."""
+    text = content.strip()
+    return text.startswith("#") and not _dirty().search("\n" + text + "\n")
+
 
 def clean_markdown(content: str) -> str:
     """
     Cleans and optimizes Markdown content generated by AI.
+    Already-clean content (most of the cache) returns after a single regex search.
     """
     if not content:
         return ""
+    if is_clean(content):
+        return content.strip()
 
     # 1. Remove Markdown code block wrappers
-    # Matches ```markdown\n ... \n``` or ```\n ... \n```
-    code_block_pattern = r"^```(?:markdown)?\s*\n(.*?)\n```$"
-    match = re.search(code_block_pattern, content, re.DOTALL | re.IGNORECASE)
+    match = _CODE_BLOCK.search(content)
     if match:
         content = match.group(1)
 
-    # 2. Remove leading conversational filler (simple heuristic)
+    # 2. One pass over the lines: header/list spacing, section headings, bold spacing
+    # and at most one blank line in a row. Fenced code inside the answer is left as is.
+    section_line = _section_line()
+    lines = []
+    blank = False
+    in_fence = False
+    for line in content.split("\n"):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence:
+            if not line.strip():
+                if blank:
+                    continue
+                blank = True
+                lines.append("")
+                continue
+            section = section_line.match(line)
+            if section:
+                line = f"#### {section.group(1)}"
+            else:
+                if line.startswith("#"):
+                    line = _HEADER_SPLIT.sub(lambda m: m.group(1) + m.group(2).replace(" ", "").replace("\t", ""), line)
+                    line = _HEADER_SPACE.sub(r"\1 \2", line)
+                line = _LIST_SPACE.sub(lambda m: m.group(1) + m.group(2) + " ", line)
+                if "**" in line:
+                    line = _BOLD.sub(_strip_bold, line)
+        blank = False
+        lines.append(line)
+    content = "\n".join(lines)
+
+    # 3. Remove leading conversational filler (simple heuristic)
     # If the text starts with something like "Here is the analysis..." and then has a header
-    # We look for the first header `###` or `##` or `#`
-    header_match = re.search(r"^(#+)\s", content, re.MULTILINE)
+    # (checked after step 2, which may have turned a bold section name into one)
+    header_match = _FIRST_HEADER.search(content)
     if header_match:
         start_index = header_match.start()
-        # If there's text before the first header, check if it looks like filler
         pre_header_text = content[:start_index].strip()
         if pre_header_text and len(pre_header_text) < 100: # Arbitrary length check
              # If it's short, it's likely "Here is your analysis:"
              content = content[start_index:]
-    
-    # 3. Ensure proper spacing for headers
-    # Ensure space after #
-    content = re.sub(r"^(#+)([^ \n])", r"\1 \2", content, flags=re.MULTILINE)
-    
-    # 4. Ensure proper spacing for list items
-    # Ensure space after - or * or 1.
-    content = re.sub(r"^(\s*[-*])([^ \n])", r"\1 \2", content, flags=re.MULTILINE)
-    
-    # 5. Fix multiple consecutive blank lines (max 2)
-    content = re.sub(r"\n{3,}", "\n\n", content)
-
-    # 6. Ensure bold syntax is correct (basic check)
-    # ** text** -> **text**
-    content = re.sub(r"\*\*\s+(.*?)\s+\*\*", r"**\1**", content)
 
     return content.strip()
+
+
+def clean_markdown_bulk(contents: Iterable[str]) -> List[str]:
+    """clean_markdown for many rows (imports, legacy reloads, migrations)."""
+    section_keys()
+    return [clean_markdown(content) for content in contents]
+
+
+def iter_sections(content: str) -> List[Tuple[str, str]]:
+    """
+    Splits cleaned Markdown into (section name, markdown) pairs at its "#### " headings,
+    heading included. Text before the first one (the word title) is named "title".
+    """
+    parts = []
+    start = 0
+    name = "title"
+    for match in _SECTION_HEADING.finditer(content or ""):
+        chunk = content[start:match.start()].strip()
+        if chunk:
+            parts.append((name, chunk))
+        name = match.group(1).strip("*：: ")
+        start = match.start()
+    chunk = (content or "")[start:].strip()
+    if chunk:
+        parts.append((name, chunk))
+    return parts
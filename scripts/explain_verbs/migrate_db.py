@@ -4,7 +4,8 @@ import sys
 
 # Ensure we can import the explain_verbs logic
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from markdown_utils import clean_markdown
+from markdown_utils import clean_markdown_bulk
+from content_codec import decode, encode_for_storage, latest_version
 
 DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "verbs.db")
 
@@ -16,20 +17,19 @@ def migrate_db():
     try:
         # Get all records
         c.execute("SELECT id, content, query_key FROM explanations")
-        rows = c.fetchall()
+        rows = [(record_id, decode(conn, content), key) for record_id, content, key in c.fetchall()]
+        dict_version = latest_version(conn)
         
         print(f"Found {len(rows)} records to process.")
         
         updated_count = 0
-        for row in rows:
+        cleaned = clean_markdown_bulk(row[1] for row in rows)
+        for row, new_content in zip(rows, cleaned):
             record_id, content, key = row
             
-            # Clean content
-            new_content = clean_markdown(content)
-            
             # Check if content actually changed (optional, but good for logging)
             if new_content != content:
-                c.execute("UPDATE explanations SET content = ? WHERE id = ?", (new_content, record_id))
+                c.execute("UPDATE explanations SET content = ? WHERE id = ?", (encode_for_storage(conn, new_content, dict_version), record_id))
                 updated_count += 1
                 print(f"Updated record {record_id} (Key: {key})")
         
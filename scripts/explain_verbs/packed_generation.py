@@ -0,0 +1,117 @@
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from prompt_registry import get_system_prompt, template_hash
+except ImportError:
+    from scripts.explain_verbs.prompt_registry import get_system_prompt, template_hash
+
+# Appended to the POS system prompt when several words share one request
+PACKED_INSTRUCTION = """
+
+## 📦 批量输出要求
+本次会一次性给出多个单词。请对**每一个**单词都按照上面的框架和 Markdown 格式完整解析，不得省略或合并。
+最终只输出一个 JSON 对象：
+- 键：输入中的单词（小写，与输入完全一致）
+- 值：该单词完整的 Markdown 解析（字符串）
+不要输出 JSON 以外的任何文字，也不要用代码块包裹。
+"""
+
+# A packed answer shorter than this is treated as truncated / placeholder
+MIN_CONTENT_CHARS = 80
+
+_FENCE_PATTERN = re.compile(r"^```(?:json)?\s*\n(.*?)\n```\s*$", re.DOTALL | re.IGNORECASE)
+
+
+def make_groups(items: List[Dict[str, Any]], pack: int,
+                pos_of: Callable[[Dict[str, Any]], Optional[str]] = lambda item: item.get('pos')) -> List[List[Dict[str, Any]]]:
+    """Chunks words into groups of up to `pack` sharing a POS (and so a system prompt), keeping list order."""
+    if pack <= 1:
+        return [[item] for item in items]
+    by_pos = {}
+    for idx, item in enumerate(items):
+        by_pos.setdefault(pos_of(item), []).append((idx, item))
+    groups = []
+    for pos_items in by_pos.values():
+        for i in range(0, len(pos_items), pack):
+            groups.append(pos_items[i:i + pack])
+    groups.sort(key=lambda group: group[0][0])
+    return [[item for _, item in group] for group in groups]
+
+
+def packed_prompt_hash(pos: Optional[str] = None) -> str:
+    """prompt_hash of the packed system prompt, recorded on rows generated from a packed answer."""
+    return template_hash(get_system_prompt(pos) + PACKED_INSTRUCTION)
+
+
+def build_packed_messages(words: List[str], pos: Optional[str]) -> List[Dict[str, str]]:
+    listed = "\n".join(f"- {w}" for w in words)
+    return [
+        {"role": "system", "content": get_system_prompt(pos) + PACKED_INSTRUCTION},
+        {"role": "user", "content": f"请逐个解析以下 {len(words)} 个单词：\n{listed}"}
+    ]
+
+
+def validate_entry(word: str, content) -> bool:
+    """Minimal shape check for one word's Markdown inside a packed answer."""
+    if not isinstance(content, str):
+        return False
+    text = content.strip()
+    return len(text) >= MIN_CONTENT_CHARS and "#" in text and word.lower() in text.lower()
+
+
+def parse_packed_response(raw: str, words: List[str]) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Splits a packed JSON answer into {word: markdown}. Returns the valid entries
+    and the words that are missing or failed validation (to be retried one by one).
+    """
+    text = (raw or "").strip()
+    match = _FENCE_PATTERN.match(text)
+    if match:
+        text = match.group(1)
+    elif not text.startswith("{") and "{" in text:
+        # Some models still add a sentence before the object
+        text = text[text.index("{"):text.rindex("}") + 1]
+
+    try:
+        data = json.loads(text)
+    except (json.JSONDecodeError, ValueError):
+        return {}, list(words)
+    if not isinstance(data, dict):
+        return {}, list(words)
+
+    by_lower = {str(k).strip().lower(): v for k, v in data.items()}
+    results = {}
+    failed = []
+    for word in words:
+        content = by_lower.get(word.lower())
+        if validate_entry(word, content):
+            results[word] = content.strip()
+        else:
+            failed.append(word)
+    return results, failed
+
+
+def explain_packed(client, words: List[str], model: str, pos: Optional[str] = None, temperature: float = 0.7) -> str:
+    """
+    One chat completion for several words of the same POS. Asks for JSON mode and
+    retries without it for providers that reject response_format.
+    Errors are returned as text, like explain_verb().
+    """
+    messages = build_packed_messages(words, pos)
+    try:
+        try:
+            response = client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                response_format={"type": "json_object"}
+            )
+        except Exception as e:
+            if "response_format" not in str(e) and "json_object" not in str(e):
+                raise
+            response = client.chat.completions.create(model=model, messages=messages, temperature=temperature)
+        return response.choices[0].message.content
+    except Exception as e:
+        return f"Error calling API: {e}"
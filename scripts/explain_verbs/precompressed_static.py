@@ -0,0 +1,60 @@
+"""
+StaticFiles that serve the .br/.gz siblings written by asset_build.py.
+
+A request for static/js/data_full_list.<hash>.js with "Accept-Encoding: br" gets the
+.br file as-is with Content-Encoding: br, so nothing is compressed per request.
+Content-hashed names are sent with a one-year immutable Cache-Control.
+"""
+import mimetypes
+import stat
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+
+try:
+    from asset_build import HASHED_NAME_RE
+except ImportError:
+    from scripts.explain_verbs.asset_build import HASHED_NAME_RE
+
+# Preference order when the client accepts several
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+
+def accepted_encodings(header: str):
+    """Codings listed in an Accept-Encoding header, minus those with q=0."""
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    async def get_response(self, path: str, scope):
+        request_headers = Headers(scope=scope)
+        response = None
+        if scope["method"] in ("GET", "HEAD") and not path.endswith((".gz", ".br")):
+            accepted = accepted_encodings(request_headers.get("accept-encoding", ""))
+            for coding, suffix in ENCODINGS:
+                if coding not in accepted:
+                    continue
+                full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+                if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                    continue
+                media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+                response = FileResponse(full_path, stat_result=stat_result, media_type=media_type, headers={"Content-Encoding": coding})
+                if self.is_not_modified(response.headers, request_headers):
+                    response = NotModifiedResponse(response.headers)
+                break
+        if response is None:
+            response = await super().get_response(path, scope)
+        response.headers["Vary"] = "Accept-Encoding"
+        if HASHED_NAME_RE.search(path):
+            response.headers["Cache-Control"] = IMMUTABLE
+        return response
@@ -0,0 +1,39 @@
+try:
+    from prompt import EXPLAIN_VERB_SYSTEM_PROMPT, EXPLAIN_NOUN_SYSTEM_PROMPT, EXPLAIN_CONCEPT_SYSTEM_PROMPT, EXPLAIN_ADJ_ADV_SYSTEM_PROMPT, EXPLAIN_PREP_SYSTEM_PROMPT, EXPLAIN_PREP_CONJ_SYSTEM_PROMPT
+except ImportError:
+    # Fallback if running from root
+    from scripts.explain_verbs.prompt import EXPLAIN_VERB_SYSTEM_PROMPT, EXPLAIN_NOUN_SYSTEM_PROMPT, EXPLAIN_CONCEPT_SYSTEM_PROMPT, EXPLAIN_ADJ_ADV_SYSTEM_PROMPT, EXPLAIN_PREP_SYSTEM_PROMPT, EXPLAIN_PREP_CONJ_SYSTEM_PROMPT
+
+
+def get_system_prompt(pos: str = None) -> str:
+    """
+    Selects the system prompt for a word's POS (verb prompt is the default).
+    Kept outside prompt.py because that file is regenerated by the append/overwrite scripts.
+    """
+    if pos == "noun":
+        return EXPLAIN_NOUN_SYSTEM_PROMPT
+    elif pos == "other":
+        return EXPLAIN_CONCEPT_SYSTEM_PROMPT
+    elif pos == "adj_adv" or pos == "adj" or pos == "adv":
+        return EXPLAIN_ADJ_ADV_SYSTEM_PROMPT
+    elif pos == "prep":
+        return EXPLAIN_PREP_SYSTEM_PROMPT
+    elif pos == "prep_conj":
+        return EXPLAIN_PREP_CONJ_SYSTEM_PROMPT
+    # verb, noun_verb / verb_noun and unknown POS use the verb prompt
+    return EXPLAIN_VERB_SYSTEM_PROMPT
+
+
+def template_hash(template: str) -> str:
+    """Short, stable fingerprint of a system prompt (trailing whitespace ignored)."""
+    import hashlib
+    text = "\n".join(line.rstrip() for line in template.strip().splitlines())
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def prompt_hash(pos: str = None) -> str:
+    """
+    Short, stable fingerprint of the system prompt template used for a POS.
+    Stored with every generated row so prompt edits can be traced to the rows they affect.
+    """
+    return template_hash(get_system_prompt(pos))
@@ -0,0 +1,153 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+# Strategies accepted by ProviderPool
+ROUND_ROBIN = "round_robin"
+WEIGHTED = "weighted"
+
+
+def is_rate_limit_error(message: str) -> bool:
+    """explain_verb() returns errors as text; spot the provider's 429 responses."""
+    text = message.lower()
+    return "429" in text or "rate limit" in text or "ratelimit" in text or "too many requests" in text
+
+
+class ProviderSlot:
+    """One credential/base URL pair plus what we have observed about its limits."""
+
+    def __init__(self, name: str, api_key: str, base_url: str = "", model: str = "", weight: float = 1.0, rpm: int = 0):
+        self.name = name
+        self.api_key = api_key
+        self.base_url = base_url
+        self.model = model
+        self.weight = max(float(weight or 1.0), 0.01)
+        self.rpm = int(rpm or 0)
+        self.client = None
+
+        # Observed state (guarded by the pool lock)
+        self.effective_weight = self.weight
+        self.in_flight = 0
+        self.success = 0
+        self.failed = 0
+        self.rate_limited = 0
+        self.limit_streak = 0
+        self.cooldown_until = 0.0
+        self.next_slot_at = 0.0
+
+    def ready_at(self) -> float:
+        return max(self.cooldown_until, self.next_slot_at)
+
+
+class ProviderPool:
+    """
+    Hands out LLM clients across several API keys / providers.
+
+    round_robin cycles through the usable slots; weighted sends the next request to the
+    slot with the least in-flight work per unit of effective weight. Rate-limit errors
+    put a slot on exponential cooldown and halve its effective weight, successes slowly
+    restore it, so traffic drifts towards the keys with the most headroom.
+    """
+
+    def __init__(self, slots: List[ProviderSlot], strategy: str = ROUND_ROBIN):
+        if not slots:
+            raise ValueError("ProviderPool needs at least one provider")
+        if strategy not in (ROUND_ROBIN, WEIGHTED):
+            raise ValueError(f"Unknown provider strategy: {strategy}")
+        self.slots = slots
+        self.strategy = strategy
+        self._lock = threading.Condition()
+        self._cursor = 0
+
+    @classmethod
+    def from_settings(cls, settings: Any, strategy: str = ROUND_ROBIN) -> Optional["ProviderPool"]:
+        """
+        Builds the pool from settings.providers (config.json / OPENAI_API_KEYS),
+        falling back to the single openai_api_key. Returns None if no key is configured.
+        """
+        slots = []
+        seen = set()
+        entries: List[Dict[str, Any]] = list(getattr(settings, "providers", None) or [])
+        if settings.openai_api_key:
+            entries.insert(0, {"api_key": settings.openai_api_key})
+
+        for i, entry in enumerate(entries):
+            api_key = (entry.get("api_key") or "").strip()
+            base_url = (entry.get("base_url") or settings.openai_base_url or "").strip()
+            if not api_key or (api_key, base_url) in seen:
+                continue
+            seen.add((api_key, base_url))
+            slots.append(ProviderSlot(
+                name=entry.get("name") or f"key{i + 1}-{api_key[-4:]}",
+                api_key=api_key,
+                base_url=base_url,
+                model=entry.get("model") or settings.openai_model,
+                weight=entry.get("weight", 1.0),
+                rpm=entry.get("rpm", 0),
+            ))
+
+        if not slots:
+            return None
+        return cls(slots, strategy=strategy)
+
+    def shard(self, index: int, count: int) -> "ProviderPool":
+        """Gives process `index` of `count` its own subset of keys when there are enough to go round."""
+        if count <= 1 or len(self.slots) < count:
+            return self
+        return ProviderPool(self.slots[index::count], strategy=self.strategy)
+
+    def connect(self, client_factory):
+        """Creates one client per slot, e.g. connect(get_client)."""
+        for slot in self.slots:
+            slot.client = client_factory(api_key=slot.api_key, base_url=slot.base_url or None)
+        self.slots = [slot for slot in self.slots if slot.client is not None]
+        return self
+
+    def _pick(self, now: float) -> Optional[ProviderSlot]:
+        usable = [slot for slot in self.slots if slot.ready_at() <= now]
+        if not usable:
+            return None
+        if self.strategy == WEIGHTED:
+            return min(usable, key=lambda slot: (slot.in_flight + 1) / slot.effective_weight)
+        for _ in range(len(self.slots)):
+            slot = self.slots[self._cursor % len(self.slots)]
+            self._cursor += 1
+            if slot in usable:
+                return slot
+        return usable[0]
+
+    def acquire(self) -> ProviderSlot:
+        """Blocks until a slot is out of cooldown and under its rpm pacing."""
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                slot = self._pick(now)
+                if slot:
+                    slot.in_flight += 1
+                    if slot.rpm:
+                        slot.next_slot_at = now + 60.0 / slot.rpm
+                    return slot
+                wait = min(s.ready_at() for s in self.slots) - now
+                self._lock.wait(timeout=max(wait, 0.05))
+
+    def release(self, slot: ProviderSlot, ok: bool, rate_limited: bool = False):
+        with self._lock:
+            slot.in_flight -= 1
+            if ok:
+                slot.success += 1
+                slot.limit_streak = 0
+                slot.effective_weight = min(slot.weight, slot.effective_weight * 1.1 + 0.01)
+            else:
+                slot.failed += 1
+                if rate_limited:
+                    slot.rate_limited += 1
+                    slot.limit_streak += 1
+                    slot.effective_weight = max(slot.weight * 0.05, slot.effective_weight / 2)
+                    slot.cooldown_until = time.monotonic() + min(60.0, 2.0 ** slot.limit_streak)
+            self._lock.notify_all()
+
+    def summary(self) -> str:
+        lines = []
+        for slot in self.slots:
+            lines.append(f"  {slot.name}: {slot.success} ok, {slot.failed} failed ({slot.rate_limited} rate-limited), weight {slot.effective_weight:.2f}/{slot.weight:.2f}")
+        return "\n".join(lines)
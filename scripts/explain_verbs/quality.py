@@ -0,0 +1,176 @@
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from prompt_registry import get_system_prompt
+except ImportError:
+    from scripts.explain_verbs.prompt_registry import get_system_prompt
+
+# At most this many missing sections are patched in place; beyond that the row is regenerated
+SECTION_REPAIR_MAX = 2
+
+_FORMAT_BLOCK = re.compile(r"```markdown\s*\n(.*?)\n```", re.DOTALL)
+_FORMAT_SECTION = re.compile(r"^####\s+(.+?)\s*$", re.MULTILINE)
+_FRAMEWORK_ITEM = re.compile(r"^###\s*\d+\.\s*\*\*(.+?)\s*(?:\(|（|\*\*)", re.MULTILINE)
+# Section headings as models actually write them: "#### 视觉本源", "### **视觉本源：**", "**视觉本源**"
+_CONTENT_HEADING = re.compile(r"^[ \t]*(?:#{1,6}[ \t]*|\*\*)(.+?)[ \t]*$", re.MULTILINE)
+_HEADING_STRIP = "#*：: \t"
+# A row ending on one of these was almost certainly cut off mid-sentence
+_DANGLING_ENDINGS = tuple("，,、：:；;（(-—“\"")
+_TRAILING_HEADING = re.compile(r"^[ \t]*#{1,6}[ \t]")
+
+
+@lru_cache(maxsize=None)
+def expected_sections(pos: str = None) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    (ordered section names, optional names) taken from the output-format block of the
+    POS system prompt, so edits to prompt.py are picked up without touching this file.
+    Sections the framework marks "仅当..." (e.g. 词性转换) are optional.
+    """
+    prompt = get_system_prompt(pos)
+    block = _FORMAT_BLOCK.search(prompt)
+    names = tuple(_FORMAT_SECTION.findall(block.group(1) if block else prompt))
+    optional = set()
+    for match in _FRAMEWORK_ITEM.finditer(prompt):
+        line_end = prompt.find("\n", match.start())
+        if "仅当" in prompt[match.start():line_end if line_end != -1 else None]:
+            optional.add(match.group(1).strip("* "))
+    return names, tuple(name for name in names if name in optional)
+
+
+def _match_section(text: str, names: Tuple[str, ...]) -> Optional[str]:
+    text = text.strip(_HEADING_STRIP)
+    for name in names:
+        if text == name or (text.startswith(name) and len(text) - len(name) <= 12):
+            return name
+    return None
+
+
+def split_sections(content: str, pos: str = None) -> Tuple[str, List[List[Any]]]:
+    """
+    Splits an explanation into its preamble (title line etc.) and [name, heading, body]
+    blocks for every expected section heading found, in document order.
+    """
+    names, _ = expected_sections(pos)
+    content = content or ""
+    blocks = []
+    preamble_end = len(content)
+    last = None
+    for match in _CONTENT_HEADING.finditer(content):
+        name = _match_section(match.group(1), names)
+        if not name:
+            continue
+        if last is None:
+            preamble_end = match.start()
+        else:
+            last[2] = content[last[3]:match.start()]
+        last = [name, match.group(0).strip(), "", match.end()]
+        blocks.append(last)
+    if last is not None:
+        last[2] = content[last[3]:]
+    return content[:preamble_end], [block[:3] for block in blocks]
+
+
+def is_truncated(content: str) -> bool:
+    """
+    True when the text stops mid-way: inside a code block, inside bold on its last line,
+    on a heading with nothing under it, or on a dangling punctuation mark. A stray "**"
+    earlier in the row is just content.
+    """
+    text = (content or "").rstrip()
+    if not text:
+        return True
+    last_line = text.rsplit("\n", 1)[-1]
+    if text.count("```") % 2 or last_line.count("**") % 2 or _TRAILING_HEADING.match(last_line):
+        return True
+    return text.endswith(_DANGLING_ENDINGS)
+
+
+def score_content(content: str, pos: str = None) -> Dict[str, Any]:
+    """
+    Checks one explanation against its POS template. `score` is the share of required
+    sections present with a body; `ok` also requires a title and no sign of truncation.
+    """
+    names, optional = expected_sections(pos)
+    required = [name for name in names if name not in optional]
+    preamble, blocks = split_sections(content, pos)
+    bodies = {}
+    for name, _, body in blocks:
+        bodies[name] = bodies.get(name, "") + body.strip()
+
+    missing = [name for name in required if name not in bodies]
+    empty = [name for name in required if name in bodies and not bodies[name]]
+    truncated = is_truncated(content)
+    has_title = bool(re.search(r"^#{1,3}\s+\S", preamble, re.MULTILINE))
+    score = (len(required) - len(missing) - len(empty)) / len(required) if required else 1.0
+    return {
+        "score": round(score, 3),
+        "ok": not missing and not empty and not truncated and has_title,
+        "missing": missing,
+        "empty": empty,
+        "truncated": truncated,
+        "has_title": has_title,
+    }
+
+
+def needs_full_regeneration(report: Dict[str, Any]) -> bool:
+    """Section repair only works on an otherwise intact row with a few sections absent."""
+    gaps = len(report["missing"]) + len(report["empty"])
+    return report["truncated"] or not report["has_title"] or gaps == 0 or gaps > SECTION_REPAIR_MAX
+
+
+def build_section_messages(word: str, sections: List[str], pos: str = None) -> List[Dict[str, str]]:
+    listed = "\n".join(f"#### {name}" for name in sections)
+    return [
+        {"role": "system", "content": get_system_prompt(pos)},
+        {"role": "user", "content": f"请解析\"{word}\"。\n本次只需输出以下小节，标题和格式与输出格式要求完全一致，不要输出单词标题或其他小节：\n{listed}"}
+    ]
+
+
+def explain_sections(client, word: str, sections: List[str], model: str, pos: str = None, temperature: float = 0.7) -> str:
+    """Asks for just the listed sections of one word. Errors are returned as text, like explain_verb()."""
+    try:
+        response = client.chat.completions.create(
+            model=model,
+            messages=build_section_messages(word, sections, pos),
+            temperature=temperature
+        )
+        return response.choices[0].message.content
+    except Exception as e:
+        return f"Error calling API: {e}"
+
+
+def splice_sections(content: str, generated: str, sections: List[str], pos: str = None) -> str:
+    """
+    Puts the requested sections from `generated` into `content`: empty sections are
+    replaced, missing ones are inserted where the template order says they belong.
+    Sections the model did not return are left as they were.
+    """
+    names, _ = expected_sections(pos)
+    order = {name: i for i, name in enumerate(names)}
+    _, new_blocks = split_sections(generated, pos)
+    replacements = {name: body for name, _, body in new_blocks if name in sections and body.strip()}
+    if not replacements:
+        return content
+
+    preamble, blocks = split_sections(content, pos)
+    for block in blocks:
+        if block[0] in replacements and not block[2].strip():
+            block[2] = "\n" + replacements.pop(block[0]).strip("\n") + "\n\n"
+
+    for name, body in sorted(replacements.items(), key=lambda item: order[item[0]]):
+        at = 0
+        for i, block in enumerate(blocks):
+            if order[block[0]] < order[name]:
+                at = i + 1
+        blocks.insert(at, [name, f"#### {name}", "\n" + body.strip("\n") + "\n\n"])
+
+    if preamble and not preamble.endswith("\n"):
+        preamble += "\n"
+    parts = [preamble.rstrip("\n") + "\n\n" if preamble.strip() else ""]
+    for _, heading, body in blocks:
+        parts.append(heading + (body if body.startswith("\n") else "\n" + body))
+        if not parts[-1].endswith("\n\n"):
+            parts[-1] = parts[-1].rstrip("\n") + "\n\n"
+    return "".join(parts).strip()
@@ -0,0 +1,437 @@
+"""
+Full-text search over cached explanations and the word list's 释义 (SQLite FTS5).
+
+Two external-content FTS5 tables with the trigram tokenizer, so Chinese terms and
+English substrings both match without a segmenter:
+
+    explanation_fts  over explanation_sections (every mode: single, list, compare)
+    definition_fts   over word_definitions (单词 / 释义 / 词频 from netem_full_list.json)
+
+Trigrams need three characters, and most Chinese words have two, so a third, contentless
+table indexes the CJK characters and character pairs of every section:
+
+    explanation_cjk  terms from section_store.cjk_terms, kept in step by section_store
+
+One- and two-character CJK terms are matched there; other short terms (e.g. "up") and
+the small definitions table fall back to substring scans.
+
+Triggers on the source tables keep the trigram indexes in sync with every writer, so nothing
+else has to know about them. explanation_sections is indexed rather than explanations
+because its text is never compressed (content_codec.py). Both indexes are keyed by an
+explicit INTEGER PRIMARY KEY (content_rowid), which VACUUM leaves alone. word_definitions
+is only re-synced when the word list's sha256 changes (search_meta).
+
+    python search_index.py --rebuild
+    python search_index.py --query 放弃 [--page 2]
+    python search_index.py --bench
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    from section_store import CJK_INDEX, ensure_sections_table, has_cjk_index, is_cjk, rebuild_cjk_index
+except ImportError:
+    from scripts.explain_verbs.section_store import CJK_INDEX, ensure_sections_table, has_cjk_index, is_cjk, rebuild_cjk_index
+
+# Trigram tokens: a MATCH needs at least this many characters per term
+MIN_MATCH_CHARS = 3
+MAX_PAGE_SIZE = 100
+# A hit in 释义 is a more direct answer than a mention somewhere in an explanation
+DEFINITION_WEIGHT = 2.0
+SNIPPET_TOKENS = 16
+HIGHLIGHT = ("<mark>", "</mark>")
+
+_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS word_definitions (
+        id INTEGER PRIMARY KEY,
+        word TEXT NOT NULL UNIQUE,
+        definition TEXT,
+        frequency INTEGER
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS search_meta (key TEXT PRIMARY KEY, value TEXT)
+    ''',
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS explanation_fts USING fts5(
+        mode UNINDEXED, query_key UNINDEXED, section UNINDEXED, content,
+        content='explanation_sections', content_rowid='id', tokenize='trigram'
+    )
+    ''',
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS definition_fts USING fts5(
+        word, definition,
+        content='word_definitions', content_rowid='id', tokenize='trigram'
+    )
+    ''',
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS explanation_cjk USING fts5(
+        terms, content='', tokenize='unicode61', detail=none
+    )
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS explanation_sections_ai AFTER INSERT ON explanation_sections BEGIN
+        INSERT INTO explanation_fts (rowid, mode, query_key, section, content)
+        VALUES (new.id, new.mode, new.query_key, new.section, new.content);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS explanation_sections_ad AFTER DELETE ON explanation_sections BEGIN
+        INSERT INTO explanation_fts (explanation_fts, rowid, mode, query_key, section, content)
+        VALUES ('delete', old.id, old.mode, old.query_key, old.section, old.content);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS explanation_sections_au AFTER UPDATE ON explanation_sections BEGIN
+        INSERT INTO explanation_fts (explanation_fts, rowid, mode, query_key, section, content)
+        VALUES ('delete', old.id, old.mode, old.query_key, old.section, old.content);
+        INSERT INTO explanation_fts (rowid, mode, query_key, section, content)
+        VALUES (new.id, new.mode, new.query_key, new.section, new.content);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS word_definitions_ai AFTER INSERT ON word_definitions BEGIN
+        INSERT INTO definition_fts (rowid, word, definition) VALUES (new.id, new.word, new.definition);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS word_definitions_ad AFTER DELETE ON word_definitions BEGIN
+        INSERT INTO definition_fts (definition_fts, rowid, word, definition) VALUES ('delete', old.id, old.word, old.definition);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS word_definitions_au AFTER UPDATE ON word_definitions BEGIN
+        INSERT INTO definition_fts (definition_fts, rowid, word, definition) VALUES ('delete', old.id, old.word, old.definition);
+        INSERT INTO definition_fts (rowid, word, definition) VALUES (new.id, new.word, new.definition);
+    END
+    ''',
+]
+
+
+def fts_available(conn: sqlite3.Connection) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'explanation_fts'").fetchone() is not None
+
+
+def _stale_explanation_index(conn: sqlite3.Connection) -> bool:
+    """explanation_fts from before content_rowid='id', or its triggers were dropped with an old sections table."""
+    sql = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'explanation_fts'").fetchone()
+    trigger = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'explanation_sections_ai'").fetchone()
+    return sql is not None and ("content_rowid='id'" not in sql[0] or trigger is None)
+
+
+def ensure_search_tables(conn: sqlite3.Connection) -> bool:
+    """
+    Creates word_definitions, the FTS tables and their triggers. Indexes created here
+    for the first time (or recreated because their schema changed) are rebuilt from
+    existing rows. Returns False when this SQLite build has no FTS5 (search then falls
+    back to LIKE scans).
+    """
+    try:
+        ensure_sections_table(conn)
+        if _stale_explanation_index(conn):
+            conn.execute("DROP TABLE explanation_fts")
+        created = not fts_available(conn)
+        cjk_created = not has_cjk_index(conn)
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        conn.commit()
+    except sqlite3.OperationalError as e:
+        conn.rollback()
+        if "fts5" not in str(e) and "tokenize" not in str(e):
+            raise
+        print(f"FTS5 unavailable, search falls back to LIKE scans: {e}")
+        for statement in _SCHEMA[:2]:
+            conn.execute(statement)
+        conn.commit()
+        return False
+    if created:
+        rebuild(conn)
+    elif cjk_created:
+        rebuild_cjk_index(conn)
+        conn.commit()
+    return True
+
+
+def rebuild(conn: sqlite3.Connection):
+    """Re-reads every index from its source table (if they drift)."""
+    conn.execute("INSERT INTO explanation_fts (explanation_fts) VALUES ('rebuild')")
+    conn.execute("INSERT INTO definition_fts (definition_fts) VALUES ('rebuild')")
+    rebuild_cjk_index(conn)
+    conn.commit()
+
+
+def sync_definitions(conn: sqlite3.Connection, items: Iterable[Dict[str, Any]]) -> int:
+    """Upserts 单词/释义/词频 from the word list; unchanged rows are not rewritten. Returns rows changed."""
+    rows = [(item['单词'].strip(), item.get('释义') or "", item.get('词频') or 0) for item in items if item.get('单词')]
+    cursor = conn.executemany('''
+        INSERT INTO word_definitions (word, definition, frequency) VALUES (?, ?, ?)
+        ON CONFLICT(word) DO UPDATE SET definition = excluded.definition, frequency = excluded.frequency
+        WHERE definition IS NOT excluded.definition OR frequency IS NOT excluded.frequency
+    ''', rows)
+    conn.commit()
+    # rowcount, unlike total_changes, leaves out the FTS writes made by the triggers
+    return cursor.rowcount
+
+
+def _sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def sync_definitions_file(conn: sqlite3.Connection, path: str, force: bool = False) -> Optional[int]:
+    """
+    sync_definitions from the word list at `path`, skipped (None) while its sha256 matches
+    the one recorded by the last sync, so startup does not parse the JSON every time.
+    """
+    digest = _sha256(path)
+    row = conn.execute("SELECT value FROM search_meta WHERE key = 'definitions_sha256'").fetchone()
+    if not force and row and row[0] == digest:
+        return None
+    changed = sync_definitions(conn, load_word_list(path))
+    conn.execute("INSERT OR REPLACE INTO search_meta (key, value) VALUES ('definitions_sha256', ?)", (digest,))
+    conn.commit()
+    return changed
+
+
+def _quoted(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def match_expression(query: str, lemmatize: Optional[Callable[[str], Optional[str]]] = None) -> Optional[str]:
+    """
+    User input -> an FTS5 expression that ANDs each whitespace-separated term as a
+    quoted string, or None when a term is too short for trigram matching.
+    With lemmatize, an inflected term also matches its lemma ("went" OR "go").
+    """
+    terms = query.split()
+    if not terms or any(len(term) < MIN_MATCH_CHARS for term in terms):
+        return None
+    parts = []
+    for term in terms:
+        lemma = lemmatize(term) if lemmatize else None
+        parts.append(f"({_quoted(term)} OR {_quoted(lemma)})" if lemma and len(lemma) >= MIN_MATCH_CHARS else _quoted(term))
+    return " ".join(parts)
+
+
+def cjk_match_expression(query: str) -> Optional[str]:
+    """
+    The terms of query too short for trigrams, as an explanation_cjk expression. None when
+    there are none, or when one of them is not CJK (then only a substring scan can answer).
+    """
+    short = [term for term in query.split() if len(term) < MIN_MATCH_CHARS]
+    if not short or not all(is_cjk(term) for term in short):
+        return None
+    return " ".join(_quoted(term) for term in short)
+
+
+def _explanation_hits(conn: sqlite3.Connection, expression: Optional[str], cjk_expression: Optional[str],
+                      terms: List[str], wanted: int) -> Dict[tuple, dict]:
+    """
+    Best-ranked section per (mode, query_key), stopping once `wanted` explanations are found.
+    FTS5 sorts by rank itself and reads the unindexed columns only for rows we consume.
+    Short CJK terms (cjk_expression) are matched in explanation_cjk, joined with the
+    trigram match of the longer terms if there are any (the two bm25 scores are added).
+    Without either expression (short non-CJK terms) it is an unranked substring scan in table order.
+    """
+    if cjk_expression and expression:
+        cursor = conn.execute(f"""
+            SELECT s.id, s.mode, s.query_key, s.section, {CJK_INDEX}.rank + explanation_fts.rank AS score
+            FROM {CJK_INDEX} JOIN explanation_fts ON explanation_fts.rowid = {CJK_INDEX}.rowid
+            JOIN explanation_sections s ON s.id = {CJK_INDEX}.rowid
+            WHERE {CJK_INDEX} MATCH ? AND explanation_fts MATCH ? ORDER BY score
+        """, (cjk_expression, expression))
+    elif cjk_expression:
+        # Joined to the sections: the contentless index cannot return columns
+        cursor = conn.execute(f"""
+            SELECT s.id, s.mode, s.query_key, s.section, {CJK_INDEX}.rank
+            FROM {CJK_INDEX} JOIN explanation_sections s ON s.id = {CJK_INDEX}.rowid
+            WHERE {CJK_INDEX} MATCH ? ORDER BY {CJK_INDEX}.rank
+        """, (cjk_expression,))
+    elif expression:
+        cursor = conn.execute(
+            "SELECT rowid, mode, query_key, section, rank FROM explanation_fts WHERE explanation_fts MATCH ? ORDER BY rank",
+            (expression,))
+    else:
+        # lower() only where it matters: CJK terms have no case and skip the copy
+        where = " AND ".join("instr(lower(content), ?) > 0" if term.isascii() else "instr(content, ?) > 0" for term in terms)
+        cursor = conn.execute(
+            f"SELECT rowid, mode, query_key, section, 0.0 FROM explanation_sections WHERE {where}",
+            [term.lower() for term in terms])
+
+    hits: Dict[tuple, dict] = {}
+    for rowid, mode, query_key, section, rank in cursor:
+        key = (mode, query_key.lower())
+        if key not in hits:
+            if len(hits) >= wanted:
+                break
+            hits[key] = {"rank": rank, "rowid": rowid, "section": section, "query_key": query_key}
+    cursor.close()
+    return hits
+
+
+def _definition_hits(conn: sqlite3.Connection, expression: Optional[str], terms: List[str]) -> Dict[tuple, dict]:
+    """Every matching word (the table is small), keyed like single-mode explanations."""
+    if expression:
+        cursor = conn.execute(
+            "SELECT rowid, word, bm25(definition_fts) FROM definition_fts WHERE definition_fts MATCH ?", (expression,))
+    else:
+        where = " AND ".join("(instr(lower(word), ?) > 0 OR instr(definition, ?) > 0)" for _ in terms)
+        cursor = conn.execute(
+            f"SELECT id, word, -1.0 FROM word_definitions WHERE {where}",
+            [p for term in terms for p in (term.lower(), term)])
+    return {("single", word.lower()): {"rank": rank * DEFINITION_WEIGHT, "rowid": rowid, "word": word} for rowid, word, rank in cursor}
+
+
+def _like_snippet(text: str, terms: List[str]) -> str:
+    lowered = text.lower()
+    start = min((lowered.find(t.lower()) for t in terms if t.lower() in lowered), default=0)
+    begin = max(0, start - 20)
+    snippet = text[begin:start + 40].replace("\n", " ")
+    for term in terms:
+        index = snippet.lower().find(term.lower())
+        if index >= 0:
+            snippet = snippet[:index] + HIGHLIGHT[0] + snippet[index:index + len(term)] + HIGHLIGHT[1] + snippet[index + len(term):]
+    return ("..." if begin else "") + snippet + "..."
+
+
+def _snippets(conn: sqlite3.Connection, expression: Optional[str], terms: List[str], table: str, rowids: List[int]) -> Dict[int, str]:
+    if not rowids:
+        return {}
+    marks = ",".join("?" for _ in rowids)
+    if expression:
+        if table == "explanation_fts":
+            sql = f"SELECT rowid, snippet(explanation_fts, 3, ?, ?, '...', ?) FROM explanation_fts WHERE explanation_fts MATCH ? AND rowid IN ({marks})"
+            params = [*HIGHLIGHT, SNIPPET_TOKENS, expression, *rowids]
+        else:
+            sql = f"SELECT rowid, highlight(definition_fts, 1, ?, ?) FROM definition_fts WHERE definition_fts MATCH ? AND rowid IN ({marks})"
+            params = [*HIGHLIGHT, expression, *rowids]
+        return dict(conn.execute(sql, params))
+    if table == "explanation_fts":
+        sql = f"SELECT rowid, content FROM explanation_sections WHERE rowid IN ({marks})"
+    else:
+        sql = f"SELECT id, definition FROM word_definitions WHERE id IN ({marks})"
+    return {rowid: _like_snippet(text or "", terms) for rowid, text in conn.execute(sql, rowids)}
+
+
+def search(conn: sqlite3.Connection, query: str, page: int = 1, page_size: int = 20,
+           lemmatize: Optional[Callable[[str], Optional[str]]] = None) -> Dict[str, Any]:
+    """
+    Ranked search over explanations and 释义, one result per (mode, query_key).
+    Lower score is better (bm25, 释义 hits weighted up); ties go to the more frequent word.
+    lemmatize (lexicon.lemmatize) lets inflected terms match their lemma.
+    Only as many explanations as the requested page needs are ranked, so instead of
+    a total the response says whether there is a next page.
+    """
+    query = (query or "").strip()
+    page = max(1, page)
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+    result = {"query": query, "page": page, "page_size": page_size, "has_more": False, "results": []}
+    terms = query.split()
+    if not terms:
+        return result
+
+    expression = cjk_expression = None
+    if fts_available(conn):
+        cjk_expression = cjk_match_expression(query) if has_cjk_index(conn) else None
+        long_terms = " ".join(term for term in terms if len(term) >= MIN_MATCH_CHARS)
+        expression = match_expression(long_terms if cjk_expression else query, lemmatize)
+    wanted = page * page_size + 1
+    explanation_hits = _explanation_hits(conn, expression, cjk_expression, terms, wanted)
+    # Trigram-only matching where short CJK terms have no index: 释义 (small enough to scan) and snippets
+    trigram_expression = None if cjk_expression else expression
+    definition_hits = _definition_hits(conn, trigram_expression, terms)
+
+    keys = set(explanation_hits) | set(definition_hits)
+    words = {}
+    if keys:
+        bases = sorted({key[1].split(":")[0] for key in keys})
+        marks = ",".join("?" for _ in bases)
+        words = {word.lower(): (frequency or 0, definition) for word, frequency, definition in conn.execute(
+            f"SELECT word, frequency, definition FROM word_definitions WHERE lower(word) IN ({marks})", bases)}
+
+    def score(key):
+        rank = min(hits[key]["rank"] for hits in (explanation_hits, definition_hits) if key in hits)
+        return (rank, -words.get(key[1].split(":")[0], (0, None))[0], key)
+
+    ordered = sorted(keys, key=score)[:wanted]
+    visible = ordered[(page - 1) * page_size:page * page_size]
+    result["has_more"] = len(ordered) > page * page_size
+
+    # Snippets only for the visible page
+    snippets = _snippets(conn, trigram_expression, terms, "explanation_fts",
+                         [explanation_hits[key]["rowid"] for key in visible if key in explanation_hits])
+    definition_snippets = _snippets(conn, trigram_expression, terms, "definition_fts",
+                                    [definition_hits[key]["rowid"] for key in visible if key in definition_hits])
+
+    for key in visible:
+        mode, lowered = key
+        explanation = explanation_hits.get(key)
+        definition = definition_hits.get(key)
+        word_info = words.get(lowered.split(":")[0])
+        result["results"].append({
+            "mode": mode,
+            "query_key": explanation["query_key"] if explanation else lowered,
+            "score": score(key)[0],
+            "section": explanation["section"] if explanation else None,
+            "snippet": snippets.get(explanation["rowid"]) if explanation else None,
+            "definition": definition_snippets.get(definition["rowid"]) if definition else (word_info[1] if word_info else None),
+            "cached": explanation is not None
+        })
+    return result
+
+
+def load_word_list(path: str) -> List[Dict[str, Any]]:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    key = "5530考研词汇词频排序表"
+    if key not in data:
+        key = list(data.keys())[0]
+    return data[key]
+
+
+def bench(conn: sqlite3.Connection, queries: List[str], repeat: int = 20):
+    for query in queries:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            found = search(conn, query)
+            best = min(best, time.perf_counter() - start)
+        more = "+" if found["has_more"] else ""
+        print(f"{query!r:<16} {len(found['results']):>3}{more:<1} hits  {best * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Full-text search over cached explanations and definitions.")
+    parser.add_argument("--db", default=os.path.join(base_dir, "verbs.db"))
+    parser.add_argument("--words", default=os.path.abspath(os.path.join(base_dir, "../../netem_full_list.json")))
+    parser.add_argument("--rebuild", action="store_true", help="Reload definitions and rebuild both FTS indexes")
+    parser.add_argument("--query", help="Run a search and print the results")
+    parser.add_argument("--page", type=int, default=1)
+    parser.add_argument("--bench", action="store_true", help="Time a set of typical queries")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db, timeout=30)
+    try:
+        if not ensure_search_tables(conn) and (args.rebuild or args.bench):
+            print("This SQLite build has no FTS5.")
+        if args.rebuild:
+            if os.path.exists(args.words):
+                print(f"Synced {sync_definitions_file(conn, args.words, force=True)} definitions.")
+            if fts_available(conn):
+                rebuild(conn)
+                print("Rebuilt explanation_fts, definition_fts and explanation_cjk.")
+        if args.query:
+            print(json.dumps(search(conn, args.query, args.page), ensure_ascii=False, indent=2))
+        if args.bench:
+            bench(conn, ["放弃", "放弃控制", "abandon", "the ship", "词源", "give up"])
+        if not (args.rebuild or args.query or args.bench):
+            parser.print_help()
+    finally:
+        conn.close()
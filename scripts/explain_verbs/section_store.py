@@ -0,0 +1,200 @@
+"""
+Per-section copy of every explanation (explanation_sections), so clients can fetch
+just the parts a card shows (e.g. 一言蔽之) instead of the whole Markdown blob.
+
+Rows are rewritten whenever an explanation is written; existing databases are filled with
+
+    python section_store.py --backfill [--force]
+
+explanation_cjk (created by search_index.ensure_search_tables) indexes the distinct CJK
+characters and character pairs of each section, so one- and two-character Chinese terms
+are answered by FTS5 too (the trigram index needs three). FTS5 has no such tokenizer and
+a trigger cannot compute the terms, so the functions here keep it in step with the rows
+they write. The index is contentless and section ids are AUTOINCREMENT, so an entry left
+behind by a raw DELETE can only point at a missing row, never at another one.
+"""
+import argparse
+import os
+import re
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Sequence
+
+try:
+    from markdown_utils import iter_sections
+    from content_codec import decode
+except ImportError:
+    from scripts.explain_verbs.markdown_utils import iter_sections
+    from scripts.explain_verbs.content_codec import decode
+
+
+_SECTIONS_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS explanation_sections (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        mode TEXT NOT NULL,
+        query_key TEXT NOT NULL,
+        section TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        content TEXT NOT NULL,
+        UNIQUE (mode, query_key, section)
+    )
+'''
+CJK_INDEX = "explanation_cjk"
+_CJK_RUN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+
+
+def ensure_sections_table(conn: sqlite3.Connection):
+    """
+    Creates explanation_sections. Its explicit id (the FTS content_rowid, search_index.py)
+    survives VACUUM and is never handed out twice; older tables are copied over keeping
+    their rowids.
+    """
+    conn.execute(_SECTIONS_SCHEMA)
+    sql = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'explanation_sections'").fetchone()[0]
+    if "AUTOINCREMENT" not in sql.upper():
+        conn.execute(_SECTIONS_SCHEMA.replace("explanation_sections", "explanation_sections_new"))
+        conn.execute("""
+            INSERT INTO explanation_sections_new (id, mode, query_key, section, position, content)
+            SELECT rowid, mode, query_key, section, position, content FROM explanation_sections
+        """)
+        # Dropping the old table drops its FTS triggers too; ensure_search_tables recreates them
+        conn.execute("DROP TABLE explanation_sections")
+        conn.execute("ALTER TABLE explanation_sections_new RENAME TO explanation_sections")
+    conn.commit()
+
+
+def cjk_terms(text: str) -> str:
+    """The distinct CJK characters and adjacent pairs of text, space-separated (explanation_cjk's tokens)."""
+    terms: Dict[str, None] = {}
+    for run in _CJK_RUN.findall(text or ""):
+        for i, char in enumerate(run):
+            terms[char] = None
+            if i + 1 < len(run):
+                terms[run[i:i + 2]] = None
+    return " ".join(terms)
+
+
+def is_cjk(text: str) -> bool:
+    """True when text is made of CJK characters only (so it can be an explanation_cjk token)."""
+    return bool(_CJK_RUN.fullmatch(text or ""))
+
+
+def has_cjk_index(conn: sqlite3.Connection) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (CJK_INDEX,)).fetchone() is not None
+
+
+def rebuild_cjk_index(conn: sqlite3.Connection) -> int:
+    """Re-reads explanation_cjk from every section. Does not commit. Returns sections indexed."""
+    conn.execute(f"INSERT INTO {CJK_INDEX} ({CJK_INDEX}) VALUES ('delete-all')")
+    rows = conn.execute("SELECT id, content FROM explanation_sections").fetchall()
+    conn.executemany(f"INSERT INTO {CJK_INDEX} (rowid, terms) VALUES (?, ?)", [(row_id, cjk_terms(text)) for row_id, text in rows])
+    return len(rows)
+
+
+def parse_sections_param(value) -> Optional[List[str]]:
+    """'一言蔽之, title' or a list -> ['一言蔽之', 'title']; empty means no projection."""
+    if not value:
+        return None
+    names = value.split(",") if isinstance(value, str) else value
+    names = [name.strip() for name in names if name and name.strip()]
+    return names or None
+
+
+def merged_sections(content: str) -> Dict[str, str]:
+    """{section: markdown} in document order; a repeated heading is appended to the first one."""
+    merged: Dict[str, str] = {}
+    for section, text in iter_sections(content):
+        merged[section] = merged[section] + "\n\n" + text if section in merged else text
+    return merged
+
+
+def store_sections(conn: sqlite3.Connection, mode: str, query_key: str, content: str):
+    """Replaces the section rows of one explanation. Does not commit (runs in the caller's write)."""
+    indexed = has_cjk_index(conn)
+    if indexed:
+        # A contentless index only forgets a row when given the terms it was indexed with
+        old = conn.execute("SELECT id, content FROM explanation_sections WHERE mode = ? AND query_key = ?", (mode, query_key)).fetchall()
+        conn.executemany(f"INSERT INTO {CJK_INDEX} ({CJK_INDEX}, rowid, terms) VALUES ('delete', ?, ?)",
+                         [(row_id, cjk_terms(text)) for row_id, text in old])
+    conn.execute("DELETE FROM explanation_sections WHERE mode = ? AND query_key = ?", (mode, query_key))
+    for position, (section, text) in enumerate(merged_sections(content).items()):
+        cursor = conn.execute(
+            "INSERT INTO explanation_sections (mode, query_key, section, position, content) VALUES (?, ?, ?, ?, ?)",
+            (mode, query_key, section, position, text))
+        if indexed:
+            conn.execute(f"INSERT INTO {CJK_INDEX} (rowid, terms) VALUES (?, ?)", (cursor.lastrowid, cjk_terms(text)))
+
+
+def clear_sections(conn: sqlite3.Connection):
+    """Deletes every section row and its explanation_cjk entries. Does not commit."""
+    conn.execute("DELETE FROM explanation_sections")
+    if has_cjk_index(conn):
+        conn.execute(f"INSERT INTO {CJK_INDEX} ({CJK_INDEX}) VALUES ('delete-all')")
+
+
+def store_rows(conn: sqlite3.Connection, rows: Iterable[tuple]):
+    """store_sections for (mode, query_key, content, ...) rows, e.g. a CacheWriter batch."""
+    for row in rows:
+        store_sections(conn, row[0], row[1], row[2])
+
+
+def backfill_sections(conn: sqlite3.Connection, force: bool = False, chunk_size: int = 500) -> int:
+    """Splits explanations that have no section rows yet (all of them with force). Returns rows processed."""
+    ensure_sections_table(conn)
+    if force:
+        sql = "SELECT mode, query_key, content FROM explanations"
+    else:
+        sql = """
+            SELECT e.mode, e.query_key, e.content FROM explanations e
+            WHERE NOT EXISTS (SELECT 1 FROM explanation_sections s WHERE s.mode = e.mode AND s.query_key = e.query_key)
+        """
+    rows = [(mode, query_key, decode(conn, content)) for mode, query_key, content in conn.execute(sql).fetchall()]
+    for i in range(0, len(rows), chunk_size):
+        try:
+            store_rows(conn, rows[i:i + chunk_size])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return len(rows)
+
+
+def fetch_sections(conn: sqlite3.Connection, mode: str, keys: Sequence[str], sections: Sequence[str]) -> Dict[str, Dict[str, str]]:
+    """{query_key: {section: markdown}} for the requested keys and sections, in document order."""
+    result: Dict[str, Dict[str, str]] = {}
+    if not keys or not sections:
+        return result
+    section_marks = ",".join("?" for _ in sections)
+    for i in range(0, len(keys), 500):
+        chunk = list(keys[i:i + 500])
+        key_marks = ",".join("?" for _ in chunk)
+        cursor = conn.execute(f"""
+            SELECT query_key, section, content FROM explanation_sections
+            WHERE mode = ? AND query_key IN ({key_marks}) AND section IN ({section_marks})
+            ORDER BY query_key, position
+        """, [mode, *chunk, *sections])
+        for query_key, section, content in cursor:
+            result.setdefault(query_key, {})[section] = content
+    return result
+
+
+def project(content: str, sections: Sequence[str]) -> Dict[str, str]:
+    """The same projection computed from Markdown in memory (rows written before the table existed)."""
+    wanted = set(sections)
+    return {section: text for section, text in merged_sections(content).items() if section in wanted}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Split cached explanations into explanation_sections.")
+    parser.add_argument("--backfill", action="store_true", help="Split rows that have no sections yet")
+    parser.add_argument("--force", action="store_true", help="Re-split every row")
+    parser.add_argument("--db", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "verbs.db"))
+    args = parser.parse_args()
+
+    if not (args.backfill or args.force):
+        parser.print_help()
+    else:
+        conn = sqlite3.connect(args.db, timeout=30)
+        try:
+            print(f"Split {backfill_sections(conn, force=args.force)} explanations into sections.")
+        finally:
+            conn.close()
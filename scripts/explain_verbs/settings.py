@@ -1,5 +1,6 @@
 import os
 import json
+from typing import Any, Dict, List
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
@@ -8,7 +9,7 @@ def find_and_load_dotenv():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     # List of possible keys to clear before reloading
     keys_to_clear = [
-        "OPENAI_API_KEY", "OPENAI_BASE_URL", "DEFAULT_MODEL", 
+        "OPENAI_API_KEY", "OPENAI_API_KEYS", "OPENAI_BASE_URL", "DEFAULT_MODEL", 
         "IMAGE_PROVIDER", "POLLINATIONS_API_KEY", "POLLINATIONS_MODEL"
     ]
     
@@ -41,11 +42,28 @@ find_and_load_dotenv()
 
 CONFIG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
 
+def parse_env_providers(raw: str) -> List[Dict[str, Any]]:
+    """
+    Parses OPENAI_API_KEYS: comma-separated keys, each optionally "key|base_url".
+    Keys without a base URL use OPENAI_BASE_URL.
+    """
+    providers = []
+    for entry in raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        api_key, _, base_url = entry.partition("|")
+        providers.append({"api_key": api_key.strip(), "base_url": base_url.strip()})
+    return providers
+
 class AppSettings(BaseModel):
     # LLM Settings
     openai_api_key: str = ""
     openai_base_url: str = ""
     openai_model: str = ""
+    # Extra credentials for batch generation, e.g.
+    # [{"api_key": "...", "base_url": "...", "model": "...", "weight": 2, "rpm": 60}]
+    providers: List[Dict[str, Any]] = []
     
     # Image Settings
     image_provider: str = "dicebear" # "dicebear" or "pollinations"
@@ -66,6 +84,8 @@ class AppSettings(BaseModel):
             data['pollinations_api_key'] = os.environ.get("POLLINATIONS_API_KEY", "")
         if 'pollinations_model' not in data:
             data['pollinations_model'] = os.environ.get("POLLINATIONS_MODEL", "flux")
+        if 'providers' not in data:
+            data['providers'] = parse_env_providers(os.environ.get("OPENAI_API_KEYS", ""))
         
         super().__init__(**data)
 
@@ -0,0 +1,91 @@
+import sqlite3
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from prompt_registry import prompt_hash
+    from packed_generation import packed_prompt_hash
+    from lexicon import normalize_key
+except ImportError:
+    from scripts.explain_verbs.prompt_registry import prompt_hash
+    from scripts.explain_verbs.packed_generation import packed_prompt_hash
+    from scripts.explain_verbs.lexicon import normalize_key
+
+# Reasons a cached explanation is considered stale
+PROMPT_CHANGED = "prompt_changed"
+MODEL_CHANGED = "model_changed"
+UNVERSIONED = "unversioned"
+PACKED = "packed"
+
+
+def load_provenance(conn: sqlite3.Connection) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """{query_key: (prompt_hash, model)} for every cached single-word explanation."""
+    c = conn.cursor()
+    c.execute("SELECT query_key, prompt_hash, model FROM explanations WHERE mode = 'single'")
+    return {row[0]: (row[1], row[2]) for row in c.fetchall()}
+
+
+def plan_stale(conn: sqlite3.Connection, items: List[Dict[str, Any]], resolve_pos: Callable[[Dict[str, Any]], Optional[str]],
+               model: str = None, include_unversioned: bool = False, include_packed: bool = False) -> List[Tuple[Dict[str, Any], str]]:
+    """
+    Returns (item, reason) for every cached word whose explanation no longer matches the
+    current prompt for its POS (or `model`, when given), highest 词频 first.
+
+    Words without a cached row are not stale, just pending. Rows written before hashes
+    were recorded only count with include_unversioned; otherwise stamp them first.
+    Rows from a current packed prompt are up to date unless include_packed asks for
+    them to be redone one word per request.
+    """
+    provenance = load_provenance(conn)
+    current = {}
+    stale = []
+    for item in items:
+        key = normalize_key(item['单词'])
+        if key not in provenance:
+            continue
+        row_hash, row_model = provenance[key]
+        pos = resolve_pos(item)
+        if pos not in current:
+            current[pos] = (prompt_hash(pos), packed_prompt_hash(pos))
+        packed_hash = current[pos][1]
+
+        if row_hash is None:
+            if include_unversioned:
+                stale.append((item, UNVERSIONED))
+        elif row_hash == packed_hash and include_packed:
+            stale.append((item, PACKED))
+        elif row_hash not in current[pos]:
+            stale.append((item, PROMPT_CHANGED))
+        elif model and row_model and row_model != model:
+            stale.append((item, MODEL_CHANGED))
+
+    stale.sort(key=lambda entry: entry[0].get('词频') or 0, reverse=True)
+    return stale
+
+
+def summarize(stale: List[Tuple[Dict[str, Any], str]], resolve_pos: Callable[[Dict[str, Any]], Optional[str]]) -> str:
+    if not stale:
+        return "No stale explanations."
+    counts = Counter((resolve_pos(item) or "default", reason) for item, reason in stale)
+    lines = [f"{len(stale)} stale explanation(s):"]
+    for (pos, reason), count in sorted(counts.items()):
+        lines.append(f"  {pos:<10} {reason:<15} {count}")
+    top = ", ".join(item['单词'].strip() for item, _ in stale[:20])
+    lines.append(f"Most frequent: {top}{' ...' if len(stale) > 20 else ''}")
+    return "\n".join(lines)
+
+
+def stamp_unversioned(conn: sqlite3.Connection, items: List[Dict[str, Any]], resolve_pos: Callable[[Dict[str, Any]], Optional[str]],
+                      model: str = None) -> int:
+    """
+    Records the current prompt hash on rows that predate provenance tracking, treating
+    them as produced by today's prompts. Returns the number of rows stamped.
+    """
+    rows = [(prompt_hash(resolve_pos(item)), model, normalize_key(item['单词'])) for item in items]
+    c = conn.cursor()
+    c.executemany("""
+        UPDATE explanations SET prompt_hash = ?, model = COALESCE(model, ?)
+        WHERE mode = 'single' AND query_key = ? AND prompt_hash IS NULL
+    """, rows)
+    conn.commit()
+    return c.rowcount
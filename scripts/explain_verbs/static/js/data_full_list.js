@@ -1 +0,0 @@
-window.NETEM_FULL_LIST = {"5530考研词汇词频排序表": [{"序号": 1, "词频": 86015, "单词": "the", "释义": "这个、这些", "其他拼写": null, "pos": "other"}, {"序号": 2, "词频": 54093, "单词": "be", "释义": "是、存在", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3, "词频": 50252, "单词": "a", "释义": "一、每一", "其他拼写": null, "pos": "noun"}, {"序号": 4, "词频": 44609, "单词": "to", "释义": "目的、终点", "其他拼写": null, "pos": "other"}, {"序号": 5, "词频": 40452, "单词": "of", "释义": "的", "其他拼写": null, "pos": "other"}, {"序号": 6, "词频": 28550, "单词": "and", "释义": "和", "其他拼写": null, "pos": "other"}, {"序号": 7, "词频": 28481, "单词": "in", "释义": "在…内", "其他拼写": null, "pos": "noun"}, {"序号": 8, "词频": 15599, "单词": "have", "释义": "有", "其他拼写": null, "pos": "noun_verb"}, {"序号": 9, "词频": 14916, "单词": "that", "释义": "那", "其他拼写": null, "pos": "other"}, {"序号": 10, "词频": 13810, "单词": "it", "释义": "它", "其他拼写": null, "pos": "noun"}, {"序号": 11, "词频": 13733, "单词": "for", "释义": "为了…、因为…", "其他拼写": null, "pos": "other"}, {"序号": 12, "词频": 12004, "单词": "on", "释义": "在…上、持续", "其他拼写": null, "pos": "adj_adv"}, {"序号": 13, "词频": 11942, "单词": "they", "释义": "他们", "其他拼写": null, "pos": "other"}, {"序号": 14, "词频": 10015, "单词": "you", "释义": "你", "其他拼写": null, "pos": "other"}, {"序号": 15, "词频": 9006, "单词": "with", "释义": "伴随", "其他拼写": null, "pos": "other"}, {"序号": 16, "词频": 8258, "单词": "as", "释义": "作为、既然、随着、就像", "其他拼写": null, "pos": "noun"}, {"序号": 17, "词频": 7050, "单词": "their", "释义": "他们的", "其他拼写": null, "pos": "other"}, {"序号": 18, "词频": 6895, "单词": "by", "释义": "方式、到…为止", "其他拼写": null, "pos": "adj_adv"}, {"序号": 19, "词频": 6608, "单词": "not", "释义": "不、没有", "其他拼写": null, "pos": "adj_adv"}, {"序号": 20, "词频": 6542, "单词": "he", "释义": "他", "其他拼写": null, "pos": "noun"}, {"序号": 21, "词频": 6455, "单词": "from", "释义": "从…、起点", "其他拼写": null, "pos": "other"}, {"序号": 22, "词频": 6378, "单词": "at", "释义": "在…位置", "其他拼写": null, "pos": "noun"}, {"序号": 23, "词频": 6253, "单词": "will", "释义": "将、会", "其他拼写": null, "pos": "noun_verb"}, {"序号": 24, "词频": 6132, "单词": "more", "释义": "更多的", "其他拼写": null, "pos": "noun"}, {"序号": 25, "词频": 5932, "单词": "do", "释义": "做", "其他拼写": null, "pos": "noun_verb"}, {"序号": 26, "词频": 5808, "单词": "we", "释义": "我们", "其他拼写": null, "pos": "other"}, {"序号": 27, "词频": 5643, "单词": "passage", "释义": "段落、通道", "其他拼写": null, "pos": "noun"}, {"序号": 28, "词频": 5481, "单词": "this", "释义": "这", "其他拼写": null, "pos": "other"}, {"序号": 29, "词频": 5362, "单词": "or", "释义": "或者、否则", "其他拼写": null, "pos": "noun"}, {"序号": 30, "词频": 5333, "单词": "can", "释义": "能", "其他拼写": null, "pos": "noun_verb"}, {"序号": 31, "词频": 5332, "单词": "I", "释义": "我", "其他拼写": null, "pos": "noun"}, {"序号": 32, "词频": 5193, "单词": "one", "释义": "一个", "其他拼写": null, "pos": "noun"}, {"序号": 33, "词频": 4929, "单词": "but", "释义": "但是", "其他拼写": null, "pos": "adj_adv"}, {"序号": 34, "词频": 4834, "单词": "question", "释义": "问题", "其他拼写": null, "pos": "noun_verb"}, {"序号": 35, "词频": 4812, "单词": "people", "释义": "人民、民族", "其他拼写": null, "pos": "noun_verb"}, {"序号": 36, "词频": 4554, "单词": "what", "释义": "什么", "其他拼写": null, "pos": "other"}, {"序号": 37, "词频": 4126, "单词": "there", "释义": "那里", "其他拼写": null, "pos": "noun"}, {"序号": 38, "词频": 4065, "单词": "well", "释义": "好、井、涌出", "其他拼写": null, "pos": "noun_verb"}, {"序号": 39, "词频": 4062, "单词": "about", "释义": "关于", "其他拼写": null, "pos": "adj_adv"}, {"序号": 40, "词频": 3908, "单词": "answer", "释义": "回答", "其他拼写": null, "pos": "noun_verb"}, {"序号": 41, "词频": 3882, "单词": "make", "释义": "制作、使得", "其他拼写": null, "pos": "noun_verb"}, {"序号": 42, "词频": 3795, "单词": "than", "释义": "比", "其他拼写": null, "pos": "other"}, {"序号": 43, "词频": 3761, "单词": "his", "释义": "他的", "其他拼写": null, "pos": "other"}, {"序号": 44, "词频": 3396, "单词": "time", "释义": "时间", "其他拼写": null, "pos": "noun_verb"}, {"序号": 45, "词频": 3372, "单词": "say", "释义": "说、说明", "其他拼写": null, "pos": "noun_verb"}, {"序号": 46, "词频": 3364, "单词": "work", "释义": "工作", "其他拼写": null, "pos": "noun_verb"}, {"序号": 47, "词频": 3351, "单词": "which", "释义": "哪个、什么样的", "其他拼写": null, "pos": "other"}, {"序号": 48, "词频": 3272, "单词": "when", "释义": "当", "其他拼写": null, "pos": "other"}, {"序号": 49, "词频": 3190, "单词": "should", "释义": "应该", "其他拼写": null, "pos": "other"}, {"序号": 50, "词频": 3133, "单词": "part", "释义": "部分", "其他拼写": null, "pos": "noun_verb"}, {"序号": 51, "词频": 3121, "单词": "your", "释义": "你的", "其他拼写": null, "pos": "other"}, {"序号": 52, "词频": 3066, "单词": "use", "释义": "使用", "其他拼写": null, "pos": "noun_verb"}, {"序号": 53, "词频": 3043, "单词": "all", "释义": "一切", "其他拼写": null, "pos": "adj_adv"}, {"序号": 54, "词频": 3014, "单词": "follow", "释义": "跟随", "其他拼写": null, "pos": "verb"}, {"序号": 55, "词频": 2960, "单词": "she", "释义": "她", "其他拼写": null, "pos": "other"}, {"序号": 56, "词频": 2954, "单词": "who", "释义": "谁", "其他拼写": null, "pos": "noun"}, {"序号": 57, "词频": 2924, "单词": "each", "释义": "每个", "其他拼写": null, "pos": "adj_adv"}, {"序号": 58, "词频": 2923, "单词": "some", "释义": "一些", "其他拼写": null, "pos": "adj_adv"}, {"序号": 59, "词频": 2891, "单词": "other", "释义": "其他", "其他拼写": null, "pos": "adj_adv"}, {"序号": 60, "词频": 2794, "单词": "if", "释义": "如果、是否", "其他拼写": null, "pos": "other"}, {"序号": 61, "词频": 2791, "单词": "year", "释义": "年", "其他拼写": null, "pos": "noun"}, {"序号": 62, "词频": 2693, "单词": "write", "释义": "写", "其他拼写": null, "pos": "verb"}, {"序号": 63, "词频": 2672, "单词": "new", "释义": "新的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 64, "词频": 2670, "单词": "section", "释义": "部分、地段", "其他拼写": null, "pos": "noun_verb"}, {"序号": 65, "词频": 2572, "单词": "its", "释义": "它的", "其他拼写": null, "pos": "noun"}, {"序号": 66, "词频": 2552, "单词": "word", "释义": "说话、单词", "其他拼写": null, "pos": "noun_verb"}, {"序号": 67, "词频": 2548, "单词": "mark", "释义": "标记", "其他拼写": null, "pos": "noun_verb"}, {"序号": 68, "词频": 2528, "单词": "may", "释义": "可能、祝", "其他拼写": null, "pos": "noun"}, {"序号": 69, "词频": 2496, "单词": "take", "释义": "拿走、携带", "其他拼写": null, "pos": "noun_verb"}, {"序号": 70, "词频": 2493, "单词": "many", "释义": "很多", "其他拼写": null, "pos": "adj_adv"}, {"序号": 71, "词频": 2477, "单词": "most", "释义": "最多的、大多数的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 72, "词频": 2475, "单词": "read", "释义": "读", "其他拼写": null, "pos": "noun_verb"}, {"序号": 73, "词频": 2454, "单词": "up", "释义": "在...上、完成", "其他拼写": null, "pos": "verb"}, {"序号": 74, "词频": 2437, "单词": "her", "释义": "她的", "其他拼写": null, "pos": "other"}, {"序号": 75, "词频": 2425, "单词": "only", "释义": "仅仅", "其他拼写": null, "pos": "adj_adv"}, {"序号": 76, "词频": 2396, "单词": "would", "释义": "愿意", "其他拼写": null, "pos": "other"}, {"序号": 77, "词频": 2394, "单词": "go", "释义": "去", "其他拼写": null, "pos": "noun_verb"}, {"序号": 78, "词频": 2376, "单词": "hear", "释义": "听到", "其他拼写": null, "pos": "verb"}, {"序号": 79, "词频": 2373, "单词": "give", "释义": "给", "其他拼写": null, "pos": "noun_verb"}, {"序号": 80, "词频": 2332, "单词": "base", "释义": "基础、基地", "其他拼写": null, "pos": "noun_verb"}, {"序号": 81, "词频": 2321, "单词": "no", "释义": "否定", "其他拼写": null, "pos": "noun"}, {"序号": 82, "词频": 2281, "单词": "so", "释义": "因此", "其他拼写": null, "pos": "noun"}, {"序号": 83, "词频": 2258, "单词": "get", "释义": "得到", "其他拼写": null, "pos": "noun_verb"}, {"序号": 84, "词频": 2241, "单词": "two", "释义": "二", "其他拼写": null, "pos": "noun"}, {"序号": 85, "词频": 2205, "单词": "student", "释义": "学生", "其他拼写": null, "pos": "noun"}, {"序号": 86, "词频": 2178, "单词": "our", "释义": "我们的", "其他拼写": null, "pos": "other"}, {"序号": 87, "词频": 2168, "单词": "out", "释义": "出去、外面", "其他拼写": null, "pos": "noun_verb"}, {"序号": 88, "词频": 2152, "单词": "just", "释义": "只、仅仅", "其他拼写": null, "pos": "adj_adv"}, {"序号": 89, "词频": 2149, "单词": "child", "释义": "孩子", "其他拼写": null, "pos": "noun"}, {"序号": 90, "词频": 2125, "单词": "how", "释义": "如何", "其他拼写": null, "pos": "other"}, {"序号": 91, "词频": 2070, "单词": "find", "释义": "发现", "其他拼写": null, "pos": "noun_verb"}, {"序号": 92, "词频": 2033, "单词": "way", "释义": "方式", "其他拼写": null, "pos": "noun"}, {"序号": 93, "词频": 2016, "单词": "into", "释义": "进入内部", "其他拼写": null, "pos": "other"}, {"序号": 94, "词频": 1932, "单词": "because", "释义": "因为", "其他拼写": null, "pos": "other"}, {"序号": 95, "词频": 1929, "单词": "sheet", "释义": "被单、（一）张、纸", "其他拼写": null, "pos": "noun_verb"}, {"序号": 96, "词频": 1925, "单词": "man", "释义": "男人", "其他拼写": null, "pos": "noun_verb"}, {"序号": 97, "词频": 1918, "单词": "like", "释义": "喜欢、像", "其他拼写": null, "pos": "noun_verb"}, {"序号": 98, "词频": 1912, "单词": "through", "释义": "通过、穿过", "其他拼写": null, "pos": "adj_adv"}, {"序号": 99, "词频": 1908, "单词": "woman", "释义": "女人", "其他拼写": null, "pos": "noun"}, {"序号": 100, "词频": 1862, "单词": "school", "释义": "学校", "其他拼写": null, "pos": "noun_verb"}, {"序号": 101, "词频": 1845, "单词": "think", "释义": "认为", "其他拼写": null, "pos": "noun_verb"}, {"序号": 102, "词频": 1842, "单词": "world", "释义": "世界", "其他拼写": null, "pos": "noun"}, {"序号": 103, "词频": 1823, "单词": "choice", "释义": "选择", "其他拼写": null, "pos": "noun"}, {"序号": 104, "词频": 1810, "单词": "change", "释义": "改变", "其他拼写": null, "pos": "noun_verb"}, {"序号": 105, "词频": 1778, "单词": "direction", "释义": "方向、指令", "其他拼写": null, "pos": "noun"}, {"序号": 106, "词频": 1727, "单词": "much", "释义": "许多的、非常", "其他拼写": null, "pos": "noun"}, {"序号": 107, "词频": 1722, "单词": "life", "释义": "生命、人生", "其他拼写": null, "pos": "noun"}, {"序号": 108, "词频": 1714, "单词": "long", "释义": "长", "其他拼写": null, "pos": "verb"}, {"序号": 109, "词频": 1669, "单词": "study", "释义": "学习", "其他拼写": null, "pos": "noun_verb"}, {"序号": 110, "词频": 1667, "单词": "need", "释义": "需要", "其他拼写": null, "pos": "noun_verb"}, {"序号": 111, "词频": 1659, "单词": "first", "释义": "第一", "其他拼写": null, "pos": "noun"}, {"序号": 112, "词频": 1637, "单词": "help", "释义": "帮助", "其他拼写": null, "pos": "noun_verb"}, {"序号": 113, "词频": 1617, "单词": "four", "释义": "四", "其他拼写": null, "pos": "noun"}, {"序号": 114, "词频": 1606, "单词": "job", "释义": "工作", "其他拼写": null, "pos": "noun_verb"}, {"序号": 115, "词频": 1597, "单词": "learn", "释义": "学习、了解", "其他拼写": null, "pos": "verb"}, {"序号": 116, "词频": 1585, "单词": "high", "释义": "高的、高", "其他拼写": null, "pos": "noun"}, {"序号": 117, "词频": 1575, "单词": "now", "释义": "现在", "其他拼写": null, "pos": "noun"}, {"序号": 118, "词频": 1571, "单词": "good", "释义": "好的、货物", "其他拼写": null, "pos": "noun"}, {"序号": 119, "词频": 1554, "单词": "over", "释义": "在…上方、结束", "其他拼写": null, "pos": "noun"}, {"序号": 120, "词频": 1539, "单词": "then", "释义": "然后", "其他拼写": null, "pos": "noun"}, {"序号": 121, "词频": 1538, "单词": "minute", "释义": "分钟、微小的", "其他拼写": null, "pos": "noun"}, {"序号": 122, "词频": 1528, "单词": "after", "释义": "在…之后", "其他拼写": null, "pos": "adj_adv"}, {"序号": 123, "词频": 1524, "单词": "live", "释义": "住、生活", "其他拼写": null, "pos": "verb"}, {"序号": 124, "词频": 1511, "单词": "know", "释义": "知道", "其他拼写": null, "pos": "noun_verb"}, {"序号": 125, "词频": 1511, "单词": "line", "释义": "排队、线", "其他拼写": null, "pos": "noun_verb"}, {"序号": 126, "词频": 1504, "单词": "these", "释义": "这些、这些人", "其他拼写": null, "pos": "other"}, {"序号": 127, "词频": 1500, "单词": "become", "释义": "成为、适宜", "其他拼写": null, "pos": "verb"}, {"序号": 128, "词频": 1492, "单词": "author", "释义": "作者", "其他拼写": null, "pos": "noun_verb"}, {"序号": 129, "词频": 1479, "单词": "could", "释义": "能够", "其他拼写": null, "pos": "other"}, {"序号": 130, "词频": 1465, "单词": "even", "释义": "甚至", "其他拼写": null, "pos": "noun_verb"}, {"序号": 131, "词频": 1446, "单词": "also", "释义": "也", "其他拼写": null, "pos": "adj_adv"}, {"序号": 132, "词频": 1430, "单词": "come", "释义": "来", "其他拼写": null, "pos": "noun_verb"}, {"序号": 133, "词频": 1424, "单词": "such", "释义": "这样的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 134, "词频": 1424, "单词": "mean", "释义": "意思是、意味着", "其他拼写": null, "pos": "noun_verb"}, {"序号": 135, "词频": 1422, "单词": "letter", "释义": "信件", "其他拼写": null, "pos": "noun_verb"}, {"序号": 136, "词频": 1402, "单词": "see", "释义": "看", "其他拼写": null, "pos": "noun_verb"}, {"序号": 137, "词频": 1345, "单词": "three", "释义": "三", "其他拼写": null, "pos": "noun"}, {"序号": 138, "词频": 1332, "单词": "those", "释义": "那些", "其他拼写": null, "pos": "other"}, {"序号": 139, "词频": 1303, "单词": "end", "释义": "结束", "其他拼写": null, "pos": "noun_verb"}, {"序号": 140, "词频": 1271, "单词": "once", "释义": "曾经、一次", "其他拼写": null, "pos": "adj_adv"}, {"序号": 141, "词频": 1267, "单词": "company", "释义": "公司、陪伴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 142, "词频": 1254, "单词": "conversation", "释义": "对话", "其他拼写": "converzation", "pos": "noun"}, {"序号": 143, "词频": 1246, "单词": "problem", "释义": "问题", "其他拼写": null, "pos": "noun"}, {"序号": 144, "词频": 1246, "单词": "university", "释义": "大学", "其他拼写": null, "pos": "noun"}, {"序号": 145, "词频": 1245, "单词": "human", "释义": "人", "其他拼写": null, "pos": "noun"}, {"序号": 146, "词频": 1234, "单词": "state", "释义": "陈述、状态", "其他拼写": null, "pos": "noun_verb"}, {"序号": 147, "词频": 1234, "单词": "want", "释义": "想要", "其他拼写": null, "pos": "noun_verb"}, {"序号": 148, "词频": 1218, "单词": "must", "释义": "必须", "其他拼写": null, "pos": "noun"}, {"序号": 149, "词频": 1217, "单词": "food", "释义": "食物", "其他拼写": null, "pos": "noun"}, {"序号": 150, "词频": 1204, "单词": "country", "释义": "国家", "其他拼写": null, "pos": "noun"}, {"序号": 151, "词频": 1201, "单词": "choose", "释义": "选择", "其他拼写": null, "pos": "verb"}, {"序号": 152, "词频": 1199, "单词": "any", "释义": "任何", "其他拼写": null, "pos": "adj_adv"}, {"序号": 153, "词频": 1197, "单词": "my", "释义": "我的", "其他拼写": null, "pos": "other"}, {"序号": 154, "词频": 1194, "单词": "day", "释义": "日子", "其他拼写": null, "pos": "noun"}, {"序号": 155, "词频": 1190, "单词": "less", "释义": "更少", "其他拼写": null, "pos": "adj_adv"}, {"序号": 156, "词频": 1184, "单词": "accord", "释义": "协议、符合", "其他拼写": null, "pos": "noun_verb"}, {"序号": 157, "词频": 1177, "单词": "show", "释义": "展示、展现", "其他拼写": null, "pos": "noun_verb"}, {"序号": 158, "词频": 1172, "单词": "both", "释义": "两者", "其他拼写": null, "pos": "adj_adv"}, {"序号": 159, "词频": 1170, "单词": "social", "释义": "社会的、交际的", "其他拼写": null, "pos": "noun"}, {"序号": 160, "词频": 1167, "单词": "very", "释义": "非常", "其他拼写": null, "pos": "adj_adv"}, {"序号": 161, "词频": 1166, "单词": "great", "释义": "巨大的", "其他拼写": null, "pos": "noun"}, {"序号": 162, "词频": 1151, "单词": "thing", "释义": "事情", "其他拼写": null, "pos": "noun"}, {"序号": 163, "词频": 1146, "单词": "information", "释义": "信息", "其他拼写": null, "pos": "noun"}, {"序号": 164, "词频": 1145, "单词": "look", "释义": "看", "其他拼写": null, "pos": "noun_verb"}, {"序号": 165, "词频": 1138, "单词": "too", "释义": "太…、也", "其他拼写": null, "pos": "adj_adv"}, {"序号": 166, "词频": 1128, "单词": "business", "释义": "商业", "其他拼写": null, "pos": "noun"}, {"序号": 167, "词频": 1116, "单词": "between", "释义": "在…之间", "其他拼写": null, "pos": "adj_adv"}, {"序号": 168, "词频": 1115, "单词": "research", "释义": "研究", "其他拼写": null, "pos": "noun_verb"}, {"序号": 169, "词频": 1103, "单词": "before", "释义": "在…之前", "其他拼写": null, "pos": "adj_adv"}, {"序号": 170, "词频": 1090, "单词": "number", "释义": "数字", "其他拼写": null, "pos": "noun_verb"}, {"序号": 171, "词频": 1084, "单词": "single", "释义": "单一的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 172, "词频": 1078, "单词": "own", "释义": "拥有", "其他拼写": null, "pos": "verb"}, {"序号": 173, "词频": 1077, "单词": "feel", "释义": "感觉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 174, "词频": 1070, "单词": "family", "释义": "家庭", "其他拼写": null, "pos": "noun"}, {"序号": 175, "词频": 1047, "单词": "often", "释义": "经常", "其他拼写": null, "pos": "adj_adv"}, {"序号": 176, "词频": 1044, "单词": "old", "释义": "老的", "其他拼写": null, "pos": "noun"}, {"序号": 177, "词频": 1044, "单词": "parent", "释义": "父母", "其他拼写": null, "pos": "noun_verb"}, {"序号": 178, "词频": 1040, "单词": "increase", "释义": "增加", "其他拼写": null, "pos": "noun_verb"}, {"序号": 179, "词频": 1031, "单词": "paragraph", "释义": "段落", "其他拼写": null, "pos": "noun_verb"}, {"序号": 180, "词频": 1013, "单词": "provide", "释义": "提供", "其他拼写": null, "pos": "verb"}, {"序号": 181, "词频": 1011, "单词": "few", "释义": "很少", "其他拼写": null, "pos": "noun"}, {"序号": 182, "词频": 1009, "单词": "home", "释义": "家", "其他拼写": null, "pos": "noun_verb"}, {"序号": 183, "词频": 1003, "单词": "while", "释义": "当…时、而、尽管", "其他拼写": null, "pos": "noun"}, {"序号": 184, "词频": 994, "单词": "different", "释义": "不同的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 185, "词频": 982, "单词": "point", "释义": "点、指", "其他拼写": null, "pos": "noun_verb"}, {"序号": 186, "词频": 982, "单词": "last", "释义": "最后的、持续", "其他拼写": null, "pos": "noun_verb"}, {"序号": 187, "词频": 975, "单词": "text", "释义": "文本", "其他拼写": null, "pos": "noun"}, {"序号": 188, "词频": 968, "单词": "correspond", "释义": "相符合、相当", "其他拼写": null, "pos": "verb"}, {"序号": 189, "词频": 958, "单词": "education", "释义": "教育", "其他拼写": null, "pos": "noun"}, {"序号": 190, "词频": 943, "单词": "place", "释义": "放置、地点", "其他拼写": null, "pos": "noun_verb"}, {"序号": 191, "词频": 934, "单词": "pay", "释义": "支付", "其他拼写": null, "pos": "noun_verb"}, {"序号": 192, "词频": 928, "单词": "language", "释义": "语言、风格", "其他拼写": null, "pos": "noun"}, {"序号": 193, "词频": 926, "单词": "still", "释义": "仍然", "其他拼写": null, "pos": "noun_verb"}, {"序号": 194, "词频": 919, "单词": "keep", "释义": "保持", "其他拼写": null, "pos": "noun_verb"}, {"序号": 195, "词频": 899, "单词": "where", "释义": "哪里", "其他拼写": null, "pos": "other"}, {"序号": 196, "词频": 898, "单词": "book", "释义": "预定、书籍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 197, "词频": 890, "单词": "government", "释义": "政府", "其他拼写": null, "pos": "noun"}, {"序号": 198, "词频": 885, "单词": "college", "释义": "大学", "其他拼写": null, "pos": "noun"}, {"序号": 199, "词频": 885, "单词": "second", "释义": "第二的、次等的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 200, "词频": 883, "单词": "listen", "释义": "听", "其他拼写": null, "pos": "verb"}, {"序号": 201, "词频": 880, "单词": "why", "释义": "为什么", "其他拼写": null, "pos": "noun"}, {"序号": 202, "词频": 878, "单词": "system", "释义": "系统", "其他拼写": null, "pos": "noun"}, {"序号": 203, "词频": 867, "单词": "put", "释义": "放", "其他拼写": null, "pos": "noun_verb"}, {"序号": 204, "词频": 866, "单词": "blank", "释义": "空白的、失色的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 205, "词频": 847, "单词": "might", "释义": "可能", "其他拼写": null, "pos": "noun"}, {"序号": 206, "词频": 846, "单词": "result", "释义": "结果", "其他拼写": null, "pos": "noun_verb"}, {"序号": 207, "词频": 846, "单词": "try", "释义": "尝试", "其他拼写": null, "pos": "noun_verb"}, {"序号": 208, "词频": 841, "单词": "money", "释义": "钱", "其他拼写": null, "pos": "noun"}, {"序号": 209, "词频": 839, "单词": "ask", "释义": "问", "其他拼写": null, "pos": "verb"}, {"序号": 210, "词频": 833, "单词": "seem", "释义": "似乎", "其他拼写": null, "pos": "verb"}, {"序号": 211, "词频": 832, "单词": "speak", "释义": "说", "其他拼写": null, "pos": "verb"}, {"序号": 212, "词频": 830, "单词": "news", "释义": "新闻", "其他拼写": null, "pos": "noun"}, {"序号": 213, "词频": 822, "单词": "example", "释义": "例子", "其他拼写": null, "pos": "noun"}, {"序号": 214, "词频": 820, "单词": "same", "释义": "同样的", "其他拼写": null, "pos": "noun"}, {"序号": 215, "词频": 816, "单词": "important", "释义": "重要的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 216, "词频": 813, "单词": "right", "释义": "正确的、权利", "其他拼写": null, "pos": "noun_verb"}, {"序号": 217, "词频": 810, "单词": "report", "释义": "报告", "其他拼写": null, "pos": "noun_verb"}, {"序号": 218, "词频": 806, "单词": "believe", "释义": "相信", "其他拼写": null, "pos": "verb"}, {"序号": 219, "词频": 801, "单词": "computer", "释义": "电脑", "其他拼写": null, "pos": "noun"}, {"序号": 220, "词频": 800, "单词": "public", "释义": "公众的", "其他拼写": null, "pos": "noun"}, {"序号": 221, "词频": 796, "单词": "health", "释义": "健康", "其他拼写": null, "pos": "noun"}, {"序号": 222, "词频": 794, "单词": "far", "释义": "远的", "其他拼写": null, "pos": "noun"}, {"序号": 223, "词频": 793, "单词": "young", "释义": "年轻的", "其他拼写": null, "pos": "noun"}, {"序号": 224, "词频": 790, "单词": "large", "释义": "大的", "其他拼写": null, "pos": "noun"}, {"序号": 225, "词频": 790, "单词": "call", "释义": "打电话", "其他拼写": null, "pos": "noun_verb"}, {"序号": 226, "词频": 789, "单词": "city", "释义": "城市", "其他拼写": null, "pos": "noun"}, {"序号": 227, "词频": 788, "单词": "develop", "释义": "发展", "其他拼写": null, "pos": "verb"}, {"序号": 228, "词频": 786, "单词": "start", "释义": "开始", "其他拼写": null, "pos": "noun_verb"}, {"序号": 229, "词频": 782, "单词": "another", "释义": "另一个", "其他拼写": null, "pos": "adj_adv"}, {"序号": 230, "词频": 782, "单词": "centre", "释义": "中心、中央", "其他拼写": "center", "pos": "noun_verb"}, {"序号": 231, "词频": 780, "单词": "idea", "释义": "想法", "其他拼写": null, "pos": "noun"}, {"序号": 232, "词频": 780, "单词": "during", "释义": "在…期间", "其他拼写": null, "pos": "other"}, {"序号": 233, "词频": 773, "单词": "science", "释义": "科学", "其他拼写": null, "pos": "noun"}, {"序号": 234, "词频": 773, "单词": "allow", "释义": "允许", "其他拼写": null, "pos": "verb"}, {"序号": 235, "词频": 771, "单词": "age", "释义": "年龄", "其他拼写": null, "pos": "noun_verb"}, {"序号": 236, "词频": 769, "单词": "leave", "释义": "离开", "其他拼写": null, "pos": "noun_verb"}, {"序号": 237, "词频": 769, "单词": "every", "释义": "每个", "其他拼写": null, "pos": "adj_adv"}, {"序号": 238, "词频": 768, "单词": "talk", "释义": "说", "其他拼写": null, "pos": "noun_verb"}, {"序号": 239, "词频": 767, "单词": "require", "释义": "需要、要求", "其他拼写": null, "pos": "verb"}, {"序号": 240, "词频": 765, "单词": "car", "释义": "车", "其他拼写": null, "pos": "noun"}, {"序号": 241, "词频": 764, "单词": "statement", "释义": "声明", "其他拼写": null, "pos": "noun"}, {"序号": 242, "词频": 761, "单词": "society", "释义": "社会", "其他拼写": null, "pos": "noun"}, {"序号": 243, "词频": 756, "单词": "short", "释义": "短", "其他拼写": null, "pos": "noun_verb"}, {"序号": 244, "词频": 754, "单词": "cause", "释义": "造成", "其他拼写": null, "pos": "noun_verb"}, {"序号": 245, "词频": 748, "单词": "down", "释义": "在…下面、情绪低落", "其他拼写": null, "pos": "noun_verb"}, {"序号": 246, "词频": 746, "单词": "technology", "释义": "技术、工艺", "其他拼写": null, "pos": "noun"}, {"序号": 247, "词频": 734, "单词": "grow", "释义": "成长、增长", "其他拼写": null, "pos": "verb"}, {"序号": 248, "词频": 732, "单词": "sentence", "释义": "句子、判决", "其他拼写": null, "pos": "noun_verb"}, {"序号": 249, "词频": 731, "单词": "without", "释义": "没有", "其他拼写": null, "pos": "other"}, {"序号": 250, "词频": 728, "单词": "hour", "释义": "小时", "其他拼写": null, "pos": "noun"}, {"序号": 251, "词频": 721, "单词": "back", "释义": "背面、后退", "其他拼写": null, "pos": "noun_verb"}, {"序号": 252, "词频": 715, "单词": "economic", "释义": "经济上的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 253, "词频": 713, "单词": "big", "释义": "大", "其他拼写": null, "pos": "adj_adv"}, {"序号": 254, "词频": 707, "单词": "begin", "释义": "开始", "其他拼写": null, "pos": "noun_verb"}, {"序号": 255, "词频": 707, "单词": "lead", "释义": "带领", "其他拼写": null, "pos": "noun_verb"}, {"序号": 256, "词频": 706, "单词": "build", "释义": "建造", "其他拼写": null, "pos": "noun_verb"}, {"序号": 257, "词频": 704, "单词": "early", "释义": "早期的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 258, "词频": 700, "单词": "off", "释义": "关闭、不在原处", "其他拼写": null, "pos": "verb"}, {"序号": 259, "词频": 689, "单词": "spend", "释义": "花", "其他拼写": null, "pos": "verb"}, {"序号": 260, "词频": 688, "单词": "little", "释义": "少、小", "其他拼写": null, "pos": "noun"}, {"序号": 261, "词频": 687, "单词": "bank", "释义": "银行", "其他拼写": null, "pos": "noun_verb"}, {"序号": 262, "词频": 686, "单词": "hard", "释义": "困难的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 263, "词频": 682, "单词": "cost", "释义": "花费", "其他拼写": null, "pos": "noun_verb"}, {"序号": 264, "词频": 682, "单词": "class", "释义": "班级", "其他拼写": null, "pos": "noun_verb"}, {"序号": 265, "词频": 681, "单词": "group", "释义": "小组", "其他拼写": null, "pos": "noun_verb"}, {"序号": 266, "词频": 677, "单词": "price", "释义": "价格", "其他拼写": null, "pos": "noun_verb"}, {"序号": 267, "词频": 676, "单词": "effect", "释义": "效果", "其他拼写": null, "pos": "noun_verb"}, {"序号": 268, "词频": 673, "单词": "comprehension", "释义": "理解", "其他拼写": null, "pos": "noun"}, {"序号": 269, "词频": 672, "单词": "today", "释义": "在今天、现今", "其他拼写": null, "pos": "noun"}, {"序号": 270, "词频": 671, "单词": "tell", "释义": "告诉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 271, "词频": 665, "单词": "set", "释义": "设定", "其他拼写": null, "pos": "noun_verb"}, {"序号": 272, "词频": 662, "单词": "something", "释义": "某事", "其他拼写": null, "pos": "other"}, {"序号": 273, "词频": 660, "单词": "play", "释义": "玩、扮演、戏剧", "其他拼写": null, "pos": "noun_verb"}, {"序号": 274, "词频": 659, "单词": "likely", "释义": "很可能的、大概", "其他拼写": null, "pos": "adj_adv"}, {"序号": 275, "词频": 658, "单词": "turn", "释义": "翻转", "其他拼写": null, "pos": "noun_verb"}, {"序号": 276, "词频": 657, "单词": "course", "释义": "课程", "其他拼写": "corse", "pos": "noun_verb"}, {"序号": 277, "词频": 656, "单词": "buy", "释义": "购买", "其他拼写": null, "pos": "noun_verb"}, {"序号": 278, "词频": 655, "单词": "understand", "释义": "理解", "其他拼写": null, "pos": "verb"}, {"序号": 279, "词频": 649, "单词": "offer", "释义": "提供", "其他拼写": null, "pos": "noun_verb"}, {"序号": 280, "词频": 648, "单词": "service", "释义": "服务、公共设施", "其他拼写": null, "pos": "noun_verb"}, {"序号": 281, "词频": 647, "单词": "small", "释义": "小的", "其他拼写": null, "pos": "noun"}, {"序号": 282, "词频": 644, "单词": "product", "释义": "产品", "其他拼写": null, "pos": "noun"}, {"序号": 283, "词频": 639, "单词": "experience", "释义": "经历", "其他拼写": null, "pos": "noun_verb"}, {"序号": 284, "词频": 637, "单词": "suggest", "释义": "建议", "其他拼写": null, "pos": "verb"}, {"序号": 285, "词频": 632, "单词": "decide", "释义": "决定", "其他拼写": null, "pos": "verb"}, {"序号": 286, "词频": 627, "单词": "test", "释义": "测试", "其他拼写": null, "pos": "noun_verb"}, {"序号": 287, "词频": 625, "单词": "scientist", "释义": "科学家", "其他拼写": null, "pos": "noun"}, {"序号": 288, "词频": 623, "单词": "bring", "释义": "带来", "其他拼写": null, "pos": "verb"}, {"序号": 289, "词频": 622, "单词": "since", "释义": "自从、因为、既然", "其他拼写": null, "pos": "other"}, {"序号": 290, "词频": 621, "单词": "however", "释义": "但是、然而", "其他拼写": null, "pos": "adj_adv"}, {"序号": 291, "词频": 620, "单词": "person", "释义": "人", "其他拼写": null, "pos": "noun"}, {"序号": 292, "词频": 619, "单词": "teacher", "释义": "教师", "其他拼写": null, "pos": "noun"}, {"序号": 293, "词频": 617, "单词": "around", "释义": "周围、环绕", "其他拼写": null, "pos": "adj_adv"}, {"序号": 294, "词频": 615, "单词": "whether", "释义": "是否", "其他拼写": null, "pos": "other"}, {"序号": 295, "词频": 613, "单词": "future", "释义": "未来", "其他拼写": null, "pos": "noun"}, {"序号": 296, "词频": 611, "单词": "reason", "释义": "理由", "其他拼写": null, "pos": "noun_verb"}, {"序号": 297, "词频": 610, "单词": "view", "释义": "景观", "其他拼写": null, "pos": "noun_verb"}, {"序号": 298, "词频": 610, "单词": "water", "释义": "水", "其他拼写": null, "pos": "noun_verb"}, {"序号": 299, "词频": 608, "单词": "improve", "释义": "改进、提高", "其他拼写": null, "pos": "verb"}, {"序号": 300, "词频": 607, "单词": "care", "释义": "关心、在意", "其他拼写": null, "pos": "noun_verb"}, {"序号": 301, "词频": 604, "单词": "benefit", "释义": "益处、好处", "其他拼写": null, "pos": "noun_verb"}, {"序号": 302, "词频": 604, "单词": "low", "释义": "低的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 303, "词频": 603, "单词": "program", "释义": "项目", "其他拼写": "programme", "pos": "noun_verb"}, {"序号": 304, "词频": 601, "单词": "worker", "释义": "工人", "其他拼写": null, "pos": "noun"}, {"序号": 305, "词频": 600, "单词": "market", "释义": "市场", "其他拼写": null, "pos": "noun_verb"}, {"序号": 306, "词频": 598, "单词": "teach", "释义": "教", "其他拼写": null, "pos": "noun_verb"}, {"序号": 307, "词频": 596, "单词": "support", "释义": "支持", "其他拼写": null, "pos": "noun_verb"}, {"序号": 308, "词频": 594, "单词": "among", "释义": "在……之中", "其他拼写": null, "pos": "other"}, {"序号": 309, "词频": 593, "单词": "kind", "释义": "仁慈的、种类", "其他拼写": null, "pos": "noun"}, {"序号": 310, "词频": 589, "单词": "friend", "释义": "朋友", "其他拼写": null, "pos": "noun"}, {"序号": 311, "词频": 588, "单词": "skill", "释义": "技术", "其他拼写": null, "pos": "noun"}, {"序号": 312, "词频": 587, "单词": "yet", "释义": "然而", "其他拼写": null, "pos": "adj_adv"}, {"序号": 313, "词频": 585, "单词": "form", "释义": "形式、形成", "其他拼写": null, "pos": "noun_verb"}, {"序号": 314, "词频": 582, "单词": "include", "释义": "包括", "其他拼写": null, "pos": "verb"}, {"序号": 315, "词频": 582, "单词": "move", "释义": "移动", "其他拼写": null, "pos": "noun_verb"}, {"序号": 316, "词频": 581, "单词": "rather", "释义": "相当的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 317, "词频": 581, "单词": "create", "释义": "创造", "其他拼写": null, "pos": "verb"}, {"序号": 318, "词频": 581, "单词": "never", "释义": "从不", "其他拼写": null, "pos": "adj_adv"}, {"序号": 319, "词频": 577, "单词": "century", "释义": "世纪", "其他拼写": null, "pos": "noun"}, {"序号": 320, "词频": 575, "单词": "bad", "释义": "坏的", "其他拼写": null, "pos": "noun"}, {"序号": 321, "词频": 571, "单词": "eat", "释义": "吃", "其他拼写": null, "pos": "verb"}, {"序号": 322, "词频": 570, "单词": "always", "释义": "总是", "其他拼写": null, "pos": "adj_adv"}, {"序号": 323, "词频": 570, "单词": "least", "释义": "最小的、最少的", "其他拼写": null, "pos": "noun"}, {"序号": 324, "词频": 567, "单词": "face", "释义": "面对", "其他拼写": null, "pos": "noun_verb"}, {"序号": 325, "词频": 564, "单词": "plan", "释义": "计划", "其他拼写": null, "pos": "noun_verb"}, {"序号": 326, "词频": 560, "单词": "consider", "释义": "考虑", "其他拼写": null, "pos": "verb"}, {"序号": 327, "词频": 559, "单词": "industry", "释义": "工业、行业", "其他拼写": null, "pos": "noun"}, {"序号": 328, "词频": 556, "单词": "themselves", "释义": "他们自己、他们亲自", "其他拼写": null, "pos": "other"}, {"序号": 329, "词频": 554, "单词": "process", "释义": "过程、进程", "其他拼写": null, "pos": "noun_verb"}, {"序号": 330, "词频": 553, "单词": "rate", "释义": "比率", "其他拼写": null, "pos": "noun_verb"}, {"序号": 331, "词频": 551, "单词": "fact", "释义": "事实", "其他拼写": null, "pos": "noun"}, {"序号": 332, "词频": 550, "单词": "house", "释义": "房子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 333, "词频": 549, "单词": "culture", "释义": "文化", "其他拼写": null, "pos": "noun_verb"}, {"序号": 334, "词频": 547, "单词": "power", "释义": "力、功率", "其他拼写": null, "pos": "noun_verb"}, {"序号": 335, "词频": 545, "单词": "share", "释义": "分享", "其他拼写": null, "pos": "noun_verb"}, {"序号": 336, "词频": 542, "单词": "area", "释义": "地区、范围", "其他拼写": null, "pos": "noun"}, {"序号": 337, "词频": 540, "单词": "million", "释义": "百万", "其他拼写": null, "pos": "noun"}, {"序号": 338, "词频": 536, "单词": "lot", "释义": "很、许多", "其他拼写": null, "pos": "noun_verb"}, {"序号": 339, "词频": 535, "单词": "sense", "释义": "感觉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 340, "词频": 530, "单词": "lose", "释义": "失去、失败", "其他拼写": null, "pos": "verb"}, {"序号": 341, "词频": 528, "单词": "against", "释义": "相对、相反", "其他拼写": null, "pos": "other"}, {"序号": 342, "词频": 528, "单词": "rise", "释义": "上升", "其他拼写": "rize", "pos": "noun_verb"}, {"序号": 343, "词频": 526, "单词": "energy", "释义": "精力", "其他拼写": null, "pos": "noun"}, {"序号": 344, "词频": 524, "单词": "control", "释义": "控制", "其他拼写": null, "pos": "noun_verb"}, {"序号": 345, "词频": 523, "单词": "space", "释义": "空间", "其他拼写": null, "pos": "noun_verb"}, {"序号": 346, "词频": 521, "单词": "case", "释义": "情况", "其他拼写": null, "pos": "noun_verb"}, {"序号": 347, "词频": 518, "单词": "hold", "释义": "握着、坚持", "其他拼写": null, "pos": "noun_verb"}, {"序号": 348, "词频": 518, "单词": "possible", "释义": "可能的", "其他拼写": null, "pos": "noun"}, {"序号": 349, "词频": 514, "单词": "ability", "释义": "能力", "其他拼写": null, "pos": "noun"}, {"序号": 350, "词频": 511, "单词": "animal", "释义": "动物", "其他拼写": null, "pos": "noun"}, {"序号": 351, "词频": 511, "单词": "enough", "释义": "足够", "其他拼写": null, "pos": "noun"}, {"序号": 352, "词频": 510, "单词": "value", "释义": "价值", "其他拼写": null, "pos": "noun_verb"}, {"序号": 353, "词频": 507, "单词": "role", "释义": "角色", "其他拼写": null, "pos": "noun"}, {"序号": 354, "词频": 505, "单词": "week", "释义": "周末", "其他拼写": null, "pos": "noun"}, {"序号": 355, "词频": 503, "单词": "individual", "释义": "个人的、独特的", "其他拼写": null, "pos": "noun"}, {"序号": 356, "词频": 502, "单词": "hand", "释义": "手", "其他拼写": null, "pos": "noun_verb"}, {"序号": 357, "词频": 501, "单词": "open", "释义": "打开", "其他拼写": null, "pos": "noun_verb"}, {"序号": 358, "词频": 500, "单词": "ten", "释义": "十", "其他拼写": null, "pos": "noun"}, {"序号": 359, "词频": 497, "单词": "term", "释义": "条款、期限", "其他拼写": null, "pos": "noun_verb"}, {"序号": 360, "词频": 496, "单词": "away", "释义": "离开", "其他拼写": null, "pos": "adj_adv"}, {"序号": 361, "词频": 493, "单词": "happen", "释义": "发生", "其他拼写": null, "pos": "verb"}, {"序号": 362, "词频": 492, "单词": "fall", "释义": "下降、掉落", "其他拼写": null, "pos": "noun_verb"}, {"序号": 363, "词频": 491, "单词": "self", "释义": "自我、自己", "其他拼写": null, "pos": "noun"}, {"序号": 364, "词频": 491, "单词": "art", "释义": "艺术", "其他拼写": null, "pos": "noun"}, {"序号": 365, "词频": 490, "单词": "decision", "释义": "决定、决议", "其他拼写": null, "pos": "noun"}, {"序号": 366, "词频": 490, "单词": "interest", "释义": "兴趣", "其他拼写": null, "pos": "noun_verb"}, {"序号": 367, "词频": 490, "单词": "drive", "释义": "驾驶、驱使", "其他拼写": null, "pos": "noun_verb"}, {"序号": 368, "词频": 489, "单词": "issue", "释义": "问题、期刊、发布", "其他拼写": null, "pos": "noun_verb"}, {"序号": 369, "词频": 489, "单词": "produce", "释义": "生产", "其他拼写": null, "pos": "noun_verb"}, {"序号": 370, "词频": 488, "单词": "complete", "释义": "完全地", "其他拼写": null, "pos": "verb"}, {"序号": 371, "词频": 487, "单词": "under", "释义": "在…之下", "其他拼写": null, "pos": "adj_adv"}, {"序号": 372, "词频": 485, "单词": "activity", "释义": "活跃、活动", "其他拼写": null, "pos": "noun"}, {"序号": 373, "词频": 481, "单词": "national", "释义": "国家的", "其他拼写": null, "pos": "noun"}, {"序号": 374, "词频": 481, "单词": "brain", "释义": "大脑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 375, "词频": 481, "单词": "level", "释义": "水平、等级", "其他拼写": null, "pos": "noun_verb"}, {"序号": 376, "词频": 479, "单词": "able", "释义": "有能力的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 377, "词频": 477, "单词": "run", "释义": "跑步、运转", "其他拼写": null, "pos": "noun_verb"}, {"序号": 378, "词频": 476, "单词": "past", "释义": "过去的", "其他拼写": null, "pos": "noun"}, {"序号": 379, "词频": 476, "单词": "win", "释义": "赢", "其他拼写": null, "pos": "noun_verb"}, {"序号": 380, "词频": 474, "单词": "present", "释义": "呈现、提出、礼物、现在", "其他拼写": null, "pos": "noun_verb"}, {"序号": 381, "词频": 474, "单词": "quality", "释义": "质量", "其他拼写": null, "pos": "noun"}, {"序号": 382, "词频": 473, "单词": "difficult", "释义": "困难的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 383, "词频": 470, "单词": "easy", "释义": "容易的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 384, "词频": 469, "单词": "tend", "释义": "趋向于、照料", "其他拼写": null, "pos": "verb"}, {"序号": 385, "词频": 469, "单词": "reduce", "释义": "减少", "其他拼写": null, "pos": "verb"}, {"序号": 386, "词频": 467, "单词": "five", "释义": "五", "其他拼写": null, "pos": "noun"}, {"序号": 387, "词频": 463, "单词": "expect", "释义": "预料、期待", "其他拼写": null, "pos": "verb"}, {"序号": 388, "词频": 462, "单词": "order", "释义": "订单、命令、顺序", "其他拼写": null, "pos": "noun_verb"}, {"序号": 389, "词频": 459, "单词": "law", "释义": "法律、法则", "其他拼写": null, "pos": "noun"}, {"序号": 390, "词频": 459, "单词": "environment", "释义": "环境、自然环境", "其他拼写": null, "pos": "noun"}, {"序号": 391, "词频": 458, "单词": "paper", "释义": "纸、试卷", "其他拼写": null, "pos": "noun_verb"}, {"序号": 392, "词频": 457, "单词": "mind", "释义": "思维、想法", "其他拼写": null, "pos": "noun_verb"}, {"序号": 393, "词频": 457, "单词": "kid", "释义": "孩子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 394, "词频": 454, "单词": "economy", "释义": "经济", "其他拼写": null, "pos": "noun"}, {"序号": 395, "词频": 454, "单词": "percent", "释义": "百分之的", "其他拼写": null, "pos": "noun"}, {"序号": 396, "词频": 454, "单词": "sleep", "释义": "睡眠", "其他拼写": null, "pos": "noun_verb"}, {"序号": 397, "词频": 453, "单词": "recent", "释义": "近来的", "其他拼写": null, "pos": "noun"}, {"序号": 398, "词频": 450, "单词": "half", "释义": "一半", "其他拼写": null, "pos": "noun"}, {"序号": 399, "词频": 448, "单词": "close", "释义": "关闭、近", "其他拼写": null, "pos": "noun_verb"}, {"序号": 400, "词频": 445, "单词": "attention", "释义": "注意", "其他拼写": null, "pos": "noun"}, {"序号": 401, "词频": 445, "单词": "poor", "释义": "贫穷的、可怜的、糟糕的", "其他拼写": null, "pos": "noun"}, {"序号": 402, "词频": 445, "单词": "free", "释义": "自由的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 403, "词频": 442, "单词": "body", "释义": "身体", "其他拼写": null, "pos": "noun_verb"}, {"序号": 404, "词频": 441, "单词": "measure", "释义": "衡量、测量", "其他拼写": null, "pos": "noun_verb"}, {"序号": 405, "词频": 441, "单词": "office", "释义": "办公室", "其他拼写": null, "pos": "noun"}, {"序号": 406, "词频": 441, "单词": "travel", "释义": "旅行", "其他拼写": null, "pos": "noun_verb"}, {"序号": 407, "词频": 440, "单词": "major", "释义": "主要的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 408, "词频": 440, "单词": "professor", "释义": "教授", "其他拼写": null, "pos": "noun"}, {"序号": 409, "词频": 439, "单词": "natural", "释义": "自然的", "其他拼写": null, "pos": "noun"}, {"序号": 410, "词频": 438, "单词": "remain", "释义": "保持", "其他拼写": null, "pos": "verb"}, {"序号": 411, "词频": 435, "单词": "though", "释义": "尽管", "其他拼写": null, "pos": "adj_adv"}, {"序号": 412, "词频": 434, "单词": "next", "释义": "下一个", "其他拼写": null, "pos": "adj_adv"}, {"序号": 413, "词频": 430, "单词": "design", "释义": "设计", "其他拼写": null, "pos": "noun_verb"}, {"序号": 414, "词频": 429, "单词": "history", "释义": "历史", "其他拼写": null, "pos": "noun"}, {"序号": 415, "词频": 428, "单词": "nation", "释义": "国家", "其他拼写": null, "pos": "noun"}, {"序号": 416, "词频": 426, "单词": "real", "释义": "真的", "其他拼写": null, "pos": "noun"}, {"序号": 417, "词频": 425, "单词": "almost", "释义": "几乎", "其他拼写": null, "pos": "adj_adv"}, {"序号": 418, "词频": 424, "单词": "customer", "释义": "顾客", "其他拼写": null, "pos": "noun"}, {"序号": 419, "词频": 424, "单词": "subject", "释义": "科目", "其他拼写": null, "pos": "noun_verb"}, {"序号": 420, "词频": 422, "单词": "ago", "释义": "以前", "其他拼写": null, "pos": "adj_adv"}, {"序号": 421, "词频": 419, "单词": "focus", "释义": "聚焦、焦点", "其他拼写": null, "pos": "noun_verb"}, {"序号": 422, "词频": 419, "单词": "local", "释义": "当地的", "其他拼写": null, "pos": "noun"}, {"序号": 423, "词频": 418, "单词": "really", "释义": "确实", "其他拼写": null, "pos": "adj_adv"}, {"序号": 424, "词频": 417, "单词": "certain", "释义": "确定的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 425, "词频": 417, "单词": "ever", "释义": "从来", "其他拼写": null, "pos": "adj_adv"}, {"序号": 426, "词频": 417, "单词": "success", "释义": "成功", "其他拼写": null, "pos": "noun"}, {"序号": 427, "词频": 416, "单词": "late", "释义": "晚的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 428, "词频": 414, "单词": "true", "释义": "真实", "其他拼写": null, "pos": "noun_verb"}, {"序号": 429, "词频": 412, "单词": "name", "释义": "名称、命名", "其他拼写": null, "pos": "noun_verb"}, {"序号": 430, "词频": 412, "单词": "knowledge", "释义": "知识", "其他拼写": null, "pos": "noun"}, {"序号": 431, "词频": 411, "单词": "stress", "释义": "压力", "其他拼写": null, "pos": "noun_verb"}, {"序号": 432, "词频": 411, "单词": "matter", "释义": "事情、问题、重要", "其他拼写": null, "pos": "noun_verb"}, {"序号": 433, "词频": 410, "单词": "involve", "释义": "涉及", "其他拼写": null, "pos": "verb"}, {"序号": 434, "词频": 410, "单词": "raise", "释义": "举起、提出", "其他拼写": "raize", "pos": "noun_verb"}, {"序号": 435, "词频": 410, "单词": "identify", "释义": "识别、鉴定", "其他拼写": null, "pos": "verb"}, {"序号": 436, "词频": 404, "单词": "stay", "释义": "保持、停留", "其他拼写": null, "pos": "noun_verb"}, {"序号": 437, "词频": 402, "单词": "population", "释义": "人口", "其他拼写": null, "pos": "noun"}, {"序号": 438, "词频": 402, "单词": "risk", "释义": "风险", "其他拼写": null, "pos": "noun_verb"}, {"序号": 439, "词频": 401, "单词": "medium", "释义": "中等的、媒介", "其他拼写": null, "pos": "noun"}, {"序号": 440, "词频": 400, "单词": "lack", "释义": "缺乏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 441, "词频": 400, "单词": "strong", "释义": "强壮的、强烈的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 442, "词频": 400, "单词": "fill", "释义": "填", "其他拼写": null, "pos": "noun_verb"}, {"序号": 443, "词频": 399, "单词": "patient", "释义": "有耐心的、病人", "其他拼写": null, "pos": "noun"}, {"序号": 444, "词频": 397, "单词": "rule", "释义": "规则", "其他拼写": null, "pos": "noun_verb"}, {"序号": 445, "词频": 397, "单词": "until", "释义": "直到", "其他拼写": null, "pos": "other"}, {"序号": 446, "词频": 396, "单词": "continue", "释义": "继续", "其他拼写": null, "pos": "verb"}, {"序号": 447, "词频": 396, "单词": "receive", "释义": "收到", "其他拼写": null, "pos": "verb"}, {"序号": 448, "词频": 395, "单词": "already", "释义": "已经", "其他拼写": null, "pos": "adj_adv"}, {"序号": 449, "词频": 395, "单词": "record", "释义": "记录", "其他拼写": null, "pos": "noun_verb"}, {"序号": 450, "词频": 395, "单词": "employee", "释义": "雇工", "其他拼写": "employe", "pos": "noun"}, {"序号": 451, "词频": 394, "单词": "sell", "释义": "卖", "其他拼写": null, "pos": "noun_verb"}, {"序号": 452, "词频": 393, "单词": "note", "释义": "笔记", "其他拼写": null, "pos": "noun_verb"}, {"序号": 453, "词频": 393, "单词": "month", "释义": "月", "其他拼写": null, "pos": "noun"}, {"序号": 454, "词频": 392, "单词": "community", "释义": "社区、共同体", "其他拼写": null, "pos": "noun"}, {"序号": 455, "词频": 391, "单词": "demand", "释义": "要求", "其他拼写": null, "pos": "noun_verb"}, {"序号": 456, "词频": 391, "单词": "personal", "释义": "个人的", "其他拼写": null, "pos": "noun"}, {"序号": 457, "词频": 390, "单词": "instead", "释义": "反而", "其他拼写": null, "pos": "adj_adv"}, {"序号": 458, "词频": 389, "单词": "challenge", "释义": "挑战", "其他拼写": null, "pos": "noun_verb"}, {"序号": 459, "词频": 389, "单词": "store", "释义": "存储、商店", "其他拼写": null, "pos": "noun_verb"}, {"序号": 460, "词频": 388, "单词": "check", "释义": "检查", "其他拼写": "cheque", "pos": "noun_verb"}, {"序号": 461, "词频": 387, "单词": "deal", "释义": "处理", "其他拼写": null, "pos": "noun_verb"}, {"序号": 462, "词频": 387, "单词": "opportunity", "释义": "机会", "其他拼写": null, "pos": "noun"}, {"序号": 463, "词频": 387, "单词": "relationship", "释义": "关系", "其他拼写": null, "pos": "noun"}, {"序号": 464, "词频": 386, "单词": "list", "释义": "清单", "其他拼写": null, "pos": "noun_verb"}, {"序号": 465, "词频": 386, "单词": "usually", "释义": "通常、平常", "其他拼写": null, "pos": "adj_adv"}, {"序号": 466, "词频": 385, "单词": "average", "释义": "平均的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 467, "词频": 384, "单词": "although", "释义": "尽管", "其他拼写": null, "pos": "other"}, {"序号": 468, "词频": 384, "单词": "eye", "释义": "眼睛", "其他拼写": null, "pos": "noun_verb"}, {"序号": 469, "词频": 384, "单词": "break", "释义": "打破", "其他拼写": null, "pos": "noun_verb"}, {"序号": 470, "词频": 383, "单词": "fast", "释义": "快", "其他拼写": null, "pos": "noun_verb"}, {"序号": 471, "词频": 382, "单词": "common", "释义": "普通的", "其他拼写": null, "pos": "noun"}, {"序号": 472, "词频": 382, "单词": "condition", "释义": "条件、情况", "其他拼写": null, "pos": "noun_verb"}, {"序号": 473, "词频": 381, "单词": "behavior", "释义": "行为", "其他拼写": "behaviour", "pos": "noun"}, {"序号": 474, "词频": 381, "单词": "global", "释义": "全球的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 475, "词频": 379, "单词": "within", "释义": "内部", "其他拼写": null, "pos": "adj_adv"}, {"序号": 476, "词频": 379, "单词": "difference", "释义": "不同", "其他拼写": null, "pos": "noun"}, {"序号": 477, "词频": 378, "单词": "light", "释义": "点亮、轻的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 478, "词频": 374, "单词": "growth", "释义": "生长", "其他拼写": null, "pos": "noun"}, {"序号": 479, "词频": 374, "单词": "shop", "释义": "购物", "其他拼写": null, "pos": "noun_verb"}, {"序号": 480, "词频": 374, "单词": "meet", "释义": "遇见、会见", "其他拼写": null, "pos": "noun_verb"}, {"序号": 481, "词频": 373, "单词": "concern", "释义": "关心、涉及", "其他拼写": null, "pos": "noun_verb"}, {"序号": 482, "词频": 373, "单词": "task", "释义": "任务", "其他拼写": null, "pos": "noun_verb"}, {"序号": 483, "词频": 371, "单词": "scientific", "释义": "科学的、细致严谨的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 484, "词频": 371, "单词": "effort", "释义": "努力", "其他拼写": null, "pos": "noun"}, {"序号": 485, "词频": 369, "单词": "plant", "释义": "植物、工厂", "其他拼写": null, "pos": "noun_verb"}, {"序号": 486, "词频": 366, "单词": "encourage", "释义": "鼓励、发展", "其他拼写": "encorage", "pos": "verb"}, {"序号": 487, "词频": 364, "单词": "career", "释义": "职业", "其他拼写": null, "pos": "noun_verb"}, {"序号": 488, "词频": 363, "单词": "fail", "释义": "衰退、破产", "其他拼写": null, "pos": "verb"}, {"序号": 489, "词频": 362, "单词": "influence", "释义": "影响", "其他拼写": null, "pos": "noun_verb"}, {"序号": 490, "词频": 362, "单词": "avoid", "释义": "避免", "其他拼写": null, "pos": "verb"}, {"序号": 491, "词频": 361, "单词": "music", "释义": "音乐", "其他拼写": null, "pos": "noun"}, {"序号": 492, "词频": 360, "单词": "add", "释义": "增加", "其他拼写": null, "pos": "noun_verb"}, {"序号": 493, "词频": 358, "单词": "policy", "释义": "政策", "其他拼写": null, "pos": "noun"}, {"序号": 494, "词频": 358, "单词": "item", "释义": "物品、条款", "其他拼写": null, "pos": "noun"}, {"序号": 495, "词频": 357, "单词": "force", "释义": "强迫、迫使", "其他拼写": null, "pos": "noun_verb"}, {"序号": 496, "词频": 356, "单词": "member", "释义": "成员", "其他拼写": null, "pos": "noun"}, {"序号": 497, "词频": 355, "单词": "explain", "释义": "解释", "其他拼写": null, "pos": "verb"}, {"序号": 498, "词频": 355, "单词": "translation", "释义": "翻译", "其他拼写": null, "pos": "noun"}, {"序号": 499, "词频": 355, "单词": "side", "释义": "一边", "其他拼写": null, "pos": "noun_verb"}, {"序号": 500, "词频": 355, "单词": "enjoy", "释义": "享受", "其他拼写": null, "pos": "verb"}, {"序号": 501, "词频": 355, "单词": "cut", "释义": "切、砍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 502, "词频": 353, "单词": "adult", "释义": "大人、成人", "其他拼写": null, "pos": "noun"}, {"序号": 503, "词频": 352, "单词": "international", "释义": "国际的", "其他拼写": null, "pos": "noun"}, {"序号": 504, "词频": 352, "单词": "training", "释义": "训练", "其他拼写": null, "pos": "noun_verb"}, {"序号": 505, "词频": 352, "单词": "general", "释义": "一般的、总的、将军", "其他拼写": null, "pos": "noun_verb"}, {"序号": 506, "词频": 350, "单词": "nature", "释义": "自然界、性质", "其他拼写": null, "pos": "noun"}, {"序号": 507, "词频": 350, "单词": "type", "释义": "类型、输入", "其他拼写": null, "pos": "noun_verb"}, {"序号": 508, "词频": 349, "单词": "doctor", "释义": "医生", "其他拼写": null, "pos": "noun_verb"}, {"序号": 509, "词频": 349, "单词": "mother", "释义": "妈妈", "其他拼写": null, "pos": "noun_verb"}, {"序号": 510, "词频": 348, "单词": "situation", "释义": "情况", "其他拼写": null, "pos": "noun"}, {"序号": 511, "词频": 348, "单词": "several", "释义": "几个", "其他拼写": null, "pos": "adj_adv"}, {"序号": 512, "词频": 348, "单词": "save", "释义": "保存、拯救", "其他拼写": null, "pos": "noun_verb"}, {"序号": 513, "词频": 347, "单词": "essay", "释义": "论文", "其他拼写": null, "pos": "noun_verb"}, {"序号": 514, "词频": 347, "单词": "game", "释义": "游戏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 515, "词频": 346, "单词": "graduate", "释义": "毕业、获学位", "其他拼写": null, "pos": "noun_verb"}, {"序号": 516, "词频": 345, "单词": "decade", "释义": "十年", "其他拼写": null, "pos": "noun"}, {"序号": 517, "词频": 345, "单词": "medical", "释义": "医疗的", "其他拼写": null, "pos": "noun"}, {"序号": 518, "词频": 345, "单词": "miss", "释义": "错过、想念", "其他拼写": null, "pos": "noun_verb"}, {"序号": 519, "词频": 344, "单词": "train", "释义": "列车、行列", "其他拼写": null, "pos": "noun_verb"}, {"序号": 520, "词频": 343, "单词": "third", "释义": "第三", "其他拼写": null, "pos": "noun"}, {"序号": 521, "词频": 343, "单词": "interview", "释义": "采访、面试", "其他拼写": null, "pos": "noun_verb"}, {"序号": 522, "词频": 342, "单词": "stop", "释义": "阻止", "其他拼写": null, "pos": "noun_verb"}, {"序号": 523, "词频": 340, "单词": "financial", "释义": "财政的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 524, "词频": 340, "单词": "reach", "释义": "到达、达到", "其他拼写": null, "pos": "noun_verb"}, {"序号": 525, "词频": 338, "单词": "professional", "释义": "职业的、专业的", "其他拼写": null, "pos": "noun"}, {"序号": 526, "词频": 338, "单词": "sign", "释义": "标牌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 527, "词频": 337, "单词": "earth", "释义": "地球、泥土", "其他拼写": null, "pos": "noun_verb"}, {"序号": 528, "词频": 334, "单词": "project", "释义": "项目、计划", "其他拼写": null, "pos": "noun_verb"}, {"序号": 529, "词频": 333, "单词": "generation", "释义": "产生、一代人", "其他拼写": null, "pos": "noun"}, {"序号": 530, "词频": 333, "单词": "standard", "释义": "标准", "其他拼写": null, "pos": "noun"}, {"序号": 531, "词频": 333, "单词": "war", "释义": "战争", "其他拼写": null, "pos": "noun_verb"}, {"序号": 532, "词频": 333, "单词": "story", "释义": "故事", "其他拼写": "storey", "pos": "noun"}, {"序号": 533, "词频": 333, "单词": "rich", "释义": "丰富的", "其他拼写": null, "pos": "noun"}, {"序号": 534, "词频": 332, "单词": "later", "释义": "后来、其后", "其他拼写": null, "pos": "adj_adv"}, {"序号": 535, "词频": 332, "单词": "again", "释义": "再次", "其他拼写": null, "pos": "adj_adv"}, {"序号": 536, "词频": 331, "单词": "air", "释义": "空气", "其他拼写": null, "pos": "noun_verb"}, {"序号": 537, "词频": 331, "单词": "night", "释义": "夜晚", "其他拼写": null, "pos": "noun"}, {"序号": 538, "词频": 331, "单词": "contain", "释义": "包含", "其他拼写": null, "pos": "verb"}, {"序号": 539, "词频": 330, "单词": "main", "释义": "主要的", "其他拼写": null, "pos": "noun"}, {"序号": 540, "词频": 329, "单词": "soon", "释义": "很快的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 541, "词频": 329, "单词": "sound", "释义": "声音", "其他拼写": null, "pos": "noun_verb"}, {"序号": 542, "词频": 329, "单词": "love", "释义": "爱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 543, "词频": 328, "单词": "account", "释义": "账户", "其他拼写": null, "pos": "noun_verb"}, {"序号": 544, "词频": 328, "单词": "return", "释义": "回归、返回", "其他拼写": null, "pos": "noun_verb"}, {"序号": 545, "词频": 328, "单词": "affect", "释义": "影响", "其他拼写": null, "pos": "noun_verb"}, {"序号": 546, "词频": 327, "单词": "translate", "释义": "解释、翻译、转变", "其他拼写": null, "pos": "verb"}, {"序号": 547, "词频": 327, "单词": "sure", "释义": "肯定的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 548, "词频": 326, "单词": "describe", "释义": "描述", "其他拼写": null, "pos": "verb"}, {"序号": 549, "词频": 325, "单词": "purpose", "释义": "目的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 550, "词频": 325, "单词": "full", "释义": "满的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 551, "词频": 325, "单词": "room", "释义": "房间", "其他拼写": null, "pos": "noun_verb"}, {"序号": 552, "词频": 323, "单词": "appear", "释义": "出现", "其他拼写": null, "pos": "verb"}, {"序号": 553, "词频": 322, "单词": "impact", "释义": "冲击", "其他拼写": null, "pos": "noun_verb"}, {"序号": 554, "词频": 320, "单词": "period", "释义": "一段时间", "其他拼写": null, "pos": "noun"}, {"序号": 555, "词频": 319, "单词": "television", "释义": "电视", "其他拼写": null, "pos": "noun"}, {"序号": 556, "词频": 319, "单词": "quite", "释义": "相当的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 557, "词频": 318, "单词": "position", "释义": "位置", "其他拼写": null, "pos": "noun_verb"}, {"序号": 558, "词频": 317, "单词": "attitude", "释义": "态度", "其他拼写": null, "pos": "noun"}, {"序号": 559, "词频": 317, "单词": "machine", "释义": "机器", "其他拼写": null, "pos": "noun_verb"}, {"序号": 560, "词频": 316, "单词": "clear", "释义": "清楚的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 561, "词频": 316, "单词": "field", "释义": "田地、场地、领域", "其他拼写": null, "pos": "noun_verb"}, {"序号": 562, "词频": 315, "单词": "pass", "释义": "经过", "其他拼写": null, "pos": "noun_verb"}, {"序号": 563, "词频": 314, "单词": "below", "释义": "在…下面", "其他拼写": null, "pos": "adj_adv"}, {"序号": 564, "词频": 314, "单词": "here", "释义": "这里", "其他拼写": null, "pos": "noun"}, {"序号": 565, "词频": 314, "单词": "communication", "释义": "沟通", "其他拼写": null, "pos": "noun"}, {"序号": 566, "词频": 314, "单词": "protect", "释义": "保护", "其他拼写": null, "pos": "verb"}, {"序号": 567, "词频": 312, "单词": "performance", "释义": "表演", "其他拼写": null, "pos": "noun"}, {"序号": 568, "词频": 312, "单词": "lecture", "释义": "讲座", "其他拼写": null, "pos": "noun_verb"}, {"序号": 569, "词频": 311, "单词": "factor", "释义": "因素、因子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 570, "词频": 311, "单词": "top", "释义": "顶端", "其他拼写": null, "pos": "noun_verb"}, {"序号": 571, "词频": 310, "单词": "firm", "释义": "牢固的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 572, "词频": 310, "单词": "draw", "释义": "画画", "其他拼写": null, "pos": "noun_verb"}, {"序号": 573, "词频": 310, "单词": "memory", "释义": "记忆", "其他拼写": null, "pos": "noun"}, {"序号": 574, "词频": 310, "单词": "whole", "释义": "全部的", "其他拼写": null, "pos": "noun"}, {"序号": 575, "词频": 308, "单词": "writer", "释义": "作家", "其他拼写": null, "pos": "noun"}, {"序号": 576, "词频": 308, "单词": "watch", "释义": "观看", "其他拼写": null, "pos": "noun_verb"}, {"序号": 577, "词频": 307, "单词": "death", "释义": "死亡", "其他拼写": null, "pos": "noun"}, {"序号": 578, "词频": 307, "单词": "white", "释义": "白色的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 579, "词频": 307, "单词": "academic", "释义": "学术的", "其他拼写": null, "pos": "noun"}, {"序号": 580, "词频": 306, "单词": "bear", "释义": "携带、承受", "其他拼写": null, "pos": "noun_verb"}, {"序号": 581, "词频": 306, "单词": "importance", "释义": "重要性", "其他拼写": null, "pos": "noun"}, {"序号": 582, "词频": 305, "单词": "decline", "释义": "拒绝、下降", "其他拼写": null, "pos": "noun_verb"}, {"序号": 583, "词频": 305, "单词": "claim", "释义": "索要、声称", "其他拼写": null, "pos": "noun_verb"}, {"序号": 584, "词频": 305, "单词": "model", "释义": "模型", "其他拼写": null, "pos": "noun_verb"}, {"序号": 585, "词频": 305, "单词": "wrong", "释义": "错误的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 586, "词频": 304, "单词": "expert", "释义": "专家、专门的", "其他拼写": null, "pos": "noun"}, {"序号": 587, "词频": 302, "单词": "carry", "释义": "携带", "其他拼写": null, "pos": "noun_verb"}, {"序号": 588, "词频": 302, "单词": "act", "释义": "行为、行动、扮演", "其他拼写": null, "pos": "noun_verb"}, {"序号": 589, "词频": 302, "单词": "send", "释义": "发送", "其他拼写": null, "pos": "verb"}, {"序号": 590, "词频": 299, "单词": "accept", "释义": "接受", "其他拼写": null, "pos": "verb"}, {"序号": 591, "词频": 299, "单词": "potential", "释义": "潜在的", "其他拼写": null, "pos": "noun"}, {"序号": 592, "词频": 299, "单词": "degree", "释义": "温度、程度", "其他拼写": null, "pos": "noun"}, {"序号": 593, "词频": 299, "单词": "resource", "释义": "资源", "其他拼写": null, "pos": "noun"}, {"序号": 594, "词频": 298, "单词": "pause", "释义": "暂停", "其他拼写": null, "pos": "noun_verb"}, {"序号": 595, "词频": 297, "单词": "opinion", "释义": "意见", "其他拼写": null, "pos": "noun"}, {"序号": 596, "词频": 297, "单词": "income", "释义": "收入", "其他拼写": null, "pos": "noun"}, {"序号": 597, "词频": 297, "单词": "amount", "释义": "数量", "其他拼写": null, "pos": "noun_verb"}, {"序号": 598, "词频": 296, "单词": "disease", "释义": "疾病", "其他拼写": null, "pos": "noun"}, {"序号": 599, "词频": 295, "单词": "stand", "释义": "站立", "其他拼写": null, "pos": "noun_verb"}, {"序号": 600, "词频": 294, "单词": "political", "释义": "政治的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 601, "词频": 294, "单词": "popular", "释义": "受欢迎的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 602, "词频": 293, "单词": "argue", "释义": "论述、争论、争吵", "其他拼写": null, "pos": "verb"}, {"序号": 603, "词频": 293, "单词": "physical", "释义": "自然科学的、肉体的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 604, "词频": 293, "单词": "team", "释义": "团队", "其他拼写": null, "pos": "noun_verb"}, {"序号": 605, "词频": 291, "单词": "action", "释义": "行动、行为", "其他拼写": null, "pos": "noun_verb"}, {"序号": 606, "词频": 290, "单词": "material", "释义": "材料", "其他拼写": null, "pos": "noun"}, {"序号": 607, "词频": 289, "单词": "prove", "释义": "证明", "其他拼写": null, "pos": "verb"}, {"序号": 608, "词频": 289, "单词": "compare", "释义": "比较", "其他拼写": null, "pos": "noun_verb"}, {"序号": 609, "词频": 287, "单词": "competition", "释义": "比赛", "其他拼写": null, "pos": "noun"}, {"序号": 610, "词频": 287, "单词": "nothing", "释义": "没有", "其他拼写": null, "pos": "noun"}, {"序号": 611, "词频": 286, "单词": "perhaps", "释义": "也许", "其他拼写": null, "pos": "adj_adv"}, {"序号": 612, "词频": 286, "单词": "private", "释义": "私人的", "其他拼写": null, "pos": "noun"}, {"序号": 613, "词频": 286, "单词": "please", "释义": "请、使愉快", "其他拼写": null, "pos": "verb"}, {"序号": 614, "词频": 285, "单词": "head", "释义": "前往", "其他拼写": null, "pos": "noun_verb"}, {"序号": 615, "词频": 285, "单词": "street", "释义": "街道", "其他拼写": null, "pos": "noun"}, {"序号": 616, "词频": 284, "单词": "available", "释义": "可行的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 617, "词频": 284, "单词": "current", "释义": "当前、电流、趋向", "其他拼写": null, "pos": "noun"}, {"序号": 618, "词频": 284, "单词": "boy", "释义": "男孩", "其他拼写": null, "pos": "noun"}, {"序号": 619, "词频": 283, "单词": "goal", "释义": "目标", "其他拼写": null, "pos": "noun"}, {"序号": 620, "词频": 283, "单词": "loss", "释义": "丢失", "其他拼写": null, "pos": "noun"}, {"序号": 621, "词频": 283, "单词": "evidence", "释义": "证据", "其他拼写": null, "pos": "noun_verb"}, {"序号": 622, "词频": 283, "单词": "together", "释义": "一共", "其他拼写": null, "pos": "adj_adv"}, {"序号": 623, "词频": 283, "单词": "speed", "释义": "加速", "其他拼写": null, "pos": "noun_verb"}, {"序号": 624, "词频": 281, "单词": "middle", "释义": "中间的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 625, "词频": 281, "单词": "along", "释义": "沿着", "其他拼写": null, "pos": "adj_adv"}, {"序号": 626, "词频": 280, "单词": "sale", "释义": "销售", "其他拼写": null, "pos": "noun"}, {"序号": 627, "词频": 279, "单词": "production", "释义": "生产", "其他拼写": null, "pos": "noun"}, {"序号": 628, "词频": 279, "单词": "grade", "释义": "年级", "其他拼写": null, "pos": "noun_verb"}, {"序号": 629, "词频": 279, "单词": "visit", "释义": "参观、访问", "其他拼写": null, "pos": "noun_verb"}, {"序号": 630, "词频": 278, "单词": "content", "释义": "内容、目录、满足的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 631, "词频": 276, "单词": "source", "释义": "来源", "其他拼写": null, "pos": "noun_verb"}, {"序号": 632, "词频": 276, "单词": "security", "释义": "安全", "其他拼写": null, "pos": "noun"}, {"序号": 633, "词频": 275, "单词": "pressure", "释义": "压力", "其他拼写": null, "pos": "noun_verb"}, {"序号": 634, "词频": 275, "单词": "gap", "释义": "间隙、分歧", "其他拼写": null, "pos": "noun_verb"}, {"序号": 635, "词频": 275, "单词": "across", "释义": "穿过", "其他拼写": null, "pos": "adj_adv"}, {"序号": 636, "词频": 275, "单词": "let", "释义": "让", "其他拼写": null, "pos": "noun_verb"}, {"序号": 637, "词频": 274, "单词": "depend", "释义": "依赖", "其他拼写": null, "pos": "verb"}, {"序号": 638, "词频": 274, "单词": "especially", "释义": "尤其", "其他拼写": null, "pos": "adj_adv"}, {"序号": 639, "词频": 274, "单词": "modern", "释义": "现代的", "其他拼写": null, "pos": "noun"}, {"序号": 640, "词频": 274, "单词": "simply", "释义": "仅仅", "其他拼写": null, "pos": "adj_adv"}, {"序号": 641, "词频": 274, "单词": "farm", "释义": "农场", "其他拼写": null, "pos": "noun_verb"}, {"序号": 642, "词频": 273, "单词": "approach", "释义": "接近、方法", "其他拼写": null, "pos": "noun_verb"}, {"序号": 643, "词频": 273, "单词": "correct", "释义": "更正、纠正", "其他拼写": null, "pos": "verb"}, {"序号": 644, "词频": 272, "单词": "special", "释义": "特别的", "其他拼写": null, "pos": "noun"}, {"序号": 645, "词频": 272, "单词": "hope", "释义": "希望", "其他拼写": null, "pos": "noun_verb"}, {"序号": 646, "词频": 272, "单词": "someone", "释义": "某人", "其他拼写": null, "pos": "noun"}, {"序号": 647, "词频": 272, "单词": "speaker", "释义": "扬声器、说话人", "其他拼写": null, "pos": "noun"}, {"序号": 648, "词频": 271, "单词": "intelligence", "释义": "智力", "其他拼写": null, "pos": "noun"}, {"序号": 649, "词频": 271, "单词": "picture", "释义": "图片", "其他拼写": null, "pos": "noun_verb"}, {"序号": 650, "词频": 271, "单词": "survey", "释义": "调查、测量", "其他拼写": null, "pos": "noun_verb"}, {"序号": 651, "词频": 270, "单词": "everyone", "释义": "每人", "其他拼写": null, "pos": "other"}, {"序号": 652, "词频": 270, "单词": "event", "释义": "事件", "其他拼写": null, "pos": "noun"}, {"序号": 653, "词频": 269, "单词": "either", "释义": "两者之一", "其他拼写": null, "pos": "adj_adv"}, {"序号": 654, "词频": 268, "单词": "step", "释义": "步骤", "其他拼写": null, "pos": "noun_verb"}, {"序号": 655, "词频": 267, "单词": "habit", "释义": "习惯", "其他拼写": null, "pos": "noun_verb"}, {"序号": 656, "词频": 267, "单词": "responsibility", "释义": "责任", "其他拼写": null, "pos": "noun"}, {"序号": 657, "词频": 267, "单词": "similar", "释义": "相似的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 658, "词频": 266, "单词": "necessary", "释义": "必要的", "其他拼写": null, "pos": "noun"}, {"序号": 659, "词频": 266, "单词": "chance", "释义": "机会", "其他拼写": null, "pos": "noun_verb"}, {"序号": 660, "词频": 265, "单词": "foreign", "释义": "国外的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 661, "词频": 265, "单词": "apply", "释义": "应用", "其他拼写": null, "pos": "verb"}, {"序号": 662, "词频": 265, "单词": "father", "释义": "父亲", "其他拼写": null, "pos": "noun_verb"}, {"序号": 663, "词频": 264, "单词": "driver", "释义": "驾驶员", "其他拼写": null, "pos": "noun"}, {"序号": 664, "词频": 264, "单词": "oil", "释义": "油", "其他拼写": null, "pos": "noun_verb"}, {"序号": 665, "词频": 264, "单词": "anything", "释义": "任何事", "其他拼写": null, "pos": "other"}, {"序号": 666, "词频": 264, "单词": "access", "释义": "进入、存取", "其他拼写": null, "pos": "noun_verb"}, {"序号": 667, "词频": 264, "单词": "sport", "释义": "体育运动", "其他拼写": null, "pos": "noun_verb"}, {"序号": 668, "词频": 263, "单词": "exist", "释义": "存在", "其他拼写": null, "pos": "verb"}, {"序号": 669, "词频": 262, "单词": "advantage", "释义": "优势", "其他拼写": null, "pos": "noun_verb"}, {"序号": 670, "词频": 261, "单词": "newspaper", "释义": "报纸", "其他拼写": null, "pos": "noun"}, {"序号": 671, "词频": 261, "单词": "remember", "释义": "记得", "其他拼写": null, "pos": "verb"}, {"序号": 672, "词频": 261, "单词": "agree", "释义": "同意", "其他拼写": null, "pos": "verb"}, {"序号": 673, "词频": 261, "单词": "manager", "释义": "经理", "其他拼写": null, "pos": "noun"}, {"序号": 674, "词频": 260, "单词": "land", "释义": "着陆、土地", "其他拼写": null, "pos": "noun_verb"}, {"序号": 675, "词频": 260, "单词": "solve", "释义": "解答", "其他拼写": null, "pos": "verb"}, {"序号": 676, "词频": 259, "单词": "function", "释义": "功能", "其他拼写": null, "pos": "noun_verb"}, {"序号": 677, "词频": 259, "单词": "management", "释义": "经营、管理", "其他拼写": null, "pos": "noun"}, {"序号": 678, "词频": 259, "单词": "phrase", "释义": "短语", "其他拼写": null, "pos": "noun_verb"}, {"序号": 679, "词频": 258, "单词": "experiment", "释义": "实验", "其他拼写": null, "pos": "noun_verb"}, {"序号": 680, "词频": 258, "单词": "structure", "释义": "结构", "其他拼写": null, "pos": "noun_verb"}, {"序号": 681, "词频": 258, "单词": "everything", "释义": "每件事", "其他拼写": null, "pos": "other"}, {"序号": 682, "词频": 258, "单词": "sit", "释义": "坐在", "其他拼写": null, "pos": "verb"}, {"序号": 683, "词频": 257, "单词": "seek", "释义": "寻求", "其他拼写": null, "pos": "noun_verb"}, {"序号": 684, "词频": 257, "单词": "message", "释义": "消息", "其他拼写": null, "pos": "noun_verb"}, {"序号": 685, "词频": 255, "单词": "per", "释义": "每、经", "其他拼写": null, "pos": "other"}, {"序号": 686, "词频": 255, "单词": "promote", "释义": "促进", "其他拼写": null, "pos": "verb"}, {"序号": 687, "词频": 254, "单词": "figure", "释义": "算计、人物、数字", "其他拼写": null, "pos": "noun_verb"}, {"序号": 688, "词频": 254, "单词": "road", "释义": "路", "其他拼写": null, "pos": "noun"}, {"序号": 689, "词频": 252, "单词": "limit", "释义": "限制", "其他拼写": null, "pos": "noun_verb"}, {"序号": 690, "词频": 252, "单词": "sometimes", "释义": "有时", "其他拼写": null, "pos": "adj_adv"}, {"序号": 691, "词频": 251, "单词": "fear", "释义": "恐惧", "其他拼写": null, "pos": "noun_verb"}, {"序号": 692, "词频": 251, "单词": "supply", "释义": "供应", "其他拼写": null, "pos": "noun_verb"}, {"序号": 693, "词频": 248, "单词": "argument", "释义": "争论、论据", "其他拼写": null, "pos": "noun"}, {"序号": 694, "词频": 248, "单词": "relate", "释义": "讲述、使相互关联", "其他拼写": null, "pos": "verb"}, {"序号": 695, "词频": 248, "单词": "effective", "释义": "有效的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 696, "词频": 247, "单词": "prevent", "释义": "阻止", "其他拼写": null, "pos": "verb"}, {"序号": 697, "词频": 246, "单词": "pattern", "释义": "模式、图案", "其他拼写": null, "pos": "noun_verb"}, {"序号": 698, "词频": 246, "单词": "baby", "释义": "宝贝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 699, "词频": 245, "单词": "search", "释义": "搜索", "其他拼写": null, "pos": "noun_verb"}, {"序号": 700, "词频": 245, "单词": "itself", "释义": "它自己", "其他拼写": null, "pos": "other"}, {"序号": 701, "词频": 245, "单词": "response", "释义": "回应", "其他拼写": null, "pos": "noun"}, {"序号": 702, "词频": 244, "单词": "beyond", "释义": "超越", "其他拼写": null, "pos": "adj_adv"}, {"序号": 703, "词频": 244, "单词": "regard", "释义": "看待", "其他拼写": null, "pos": "noun_verb"}, {"序号": 704, "词频": 244, "单词": "reader", "释义": "读者、读物", "其他拼写": null, "pos": "noun"}, {"序号": 705, "词频": 244, "单词": "serious", "释义": "严肃认真的、严重的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 706, "词频": 244, "单词": "near", "释义": "近的、亲近的", "其他拼写": null, "pos": "verb"}, {"序号": 707, "词频": 243, "单词": "serve", "释义": "服务", "其他拼写": null, "pos": "noun_verb"}, {"序号": 708, "词频": 243, "单词": "president", "释义": "总统", "其他拼写": null, "pos": "noun"}, {"序号": 709, "词频": 243, "单词": "climate", "释义": "气候", "其他拼写": null, "pos": "noun"}, {"序号": 710, "词频": 243, "单词": "heart", "释义": "心", "其他拼写": null, "pos": "noun"}, {"序号": 711, "词频": 243, "单词": "black", "释义": "黑色的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 712, "词频": 242, "单词": "traffic", "释义": "交通", "其他拼写": null, "pos": "noun_verb"}, {"序号": 713, "词频": 242, "单词": "walk", "释义": "走路", "其他拼写": null, "pos": "noun_verb"}, {"序号": 714, "词频": 241, "单词": "determine", "释义": "决定", "其他拼写": null, "pos": "verb"}, {"序号": 715, "词频": 241, "单词": "gain", "释义": "获得、增加", "其他拼写": null, "pos": "noun_verb"}, {"序号": 716, "词频": 241, "单词": "speech", "释义": "演讲、言语", "其他拼写": null, "pos": "noun"}, {"序号": 717, "词频": 241, "单词": "award", "释义": "颁奖、奖励", "其他拼写": null, "pos": "noun_verb"}, {"序号": 718, "词频": 240, "单词": "prepare", "释义": "准备", "其他拼写": null, "pos": "verb"}, {"序号": 719, "词频": 239, "单词": "except", "释义": "除了……之外", "其他拼写": null, "pos": "verb"}, {"序号": 720, "词频": 238, "单词": "publish", "释义": "公布、出版", "其他拼写": null, "pos": "verb"}, {"序号": 721, "词频": 238, "单词": "digital", "释义": "数字的、数码的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 722, "词频": 238, "单词": "suffer", "释义": "遭受", "其他拼写": null, "pos": "verb"}, {"序号": 723, "词频": 237, "单词": "mental", "释义": "精神的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 724, "词频": 237, "单词": "positive", "释义": "积极的", "其他拼写": null, "pos": "noun"}, {"序号": 725, "词频": 236, "单词": "outside", "释义": "外面的", "其他拼写": null, "pos": "noun"}, {"序号": 726, "词频": 236, "单词": "party", "释义": "派对", "其他拼写": null, "pos": "noun_verb"}, {"序号": 727, "词频": 235, "单词": "dream", "释义": "梦想", "其他拼写": null, "pos": "noun_verb"}, {"序号": 728, "词频": 235, "单词": "increasingly", "释义": "不断增加地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 729, "词频": 235, "单词": "trade", "释义": "交易", "其他拼写": null, "pos": "noun_verb"}, {"序号": 730, "词频": 235, "单词": "contribute", "释义": "贡献", "其他拼写": null, "pos": "verb"}, {"序号": 731, "词频": 235, "单词": "drink", "释义": "喝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 732, "词频": 233, "单词": "therefore", "释义": "因此", "其他拼写": null, "pos": "adj_adv"}, {"序号": 733, "词频": 233, "单词": "himself", "释义": "他自己、他本人", "其他拼写": null, "pos": "other"}, {"序号": 734, "词频": 232, "单词": "achieve", "释义": "实现", "其他拼写": null, "pos": "verb"}, {"序号": 735, "词频": 232, "单词": "conflict", "释义": "冲突", "其他拼写": null, "pos": "noun_verb"}, {"序号": 736, "词频": 231, "单词": "trouble", "释义": "麻烦", "其他拼写": null, "pos": "noun_verb"}, {"序号": 737, "词频": 230, "单词": "nearly", "释义": "几乎", "其他拼写": null, "pos": "adj_adv"}, {"序号": 738, "词频": 230, "单词": "girl", "释义": "女孩", "其他拼写": null, "pos": "noun"}, {"序号": 739, "词频": 229, "单词": "status", "释义": "状态", "其他拼写": null, "pos": "noun"}, {"序号": 740, "词频": 229, "单词": "exercise", "释义": "锻炼", "其他拼写": "exercize", "pos": "noun_verb"}, {"序号": 741, "词频": 229, "单词": "various", "释义": "各种各样的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 742, "词频": 228, "单词": "basic", "释义": "基本的、根本的", "其他拼写": null, "pos": "noun"}, {"序号": 743, "词频": 228, "单词": "fit", "释义": "健康的、适合", "其他拼写": null, "pos": "noun_verb"}, {"序号": 744, "词频": 228, "单词": "above", "释义": "在…上面", "其他拼写": null, "pos": "noun"}, {"序号": 745, "词频": 228, "单词": "occur", "释义": "发生", "其他拼写": null, "pos": "verb"}, {"序号": 746, "词频": 228, "单词": "refer", "释义": "提及", "其他拼写": null, "pos": "verb"}, {"序号": 747, "词频": 227, "单词": "die", "释义": "死", "其他拼写": null, "pos": "noun_verb"}, {"序号": 748, "词频": 226, "单词": "town", "释义": "城镇", "其他拼写": null, "pos": "noun"}, {"序号": 749, "词频": 226, "单词": "maintain", "释义": "保持、维持", "其他拼写": null, "pos": "verb"}, {"序号": 750, "词频": 226, "单词": "wait", "释义": "等待", "其他拼写": null, "pos": "noun_verb"}, {"序号": 751, "词频": 226, "单词": "failure", "释义": "失败", "其他拼写": null, "pos": "noun"}, {"序号": 752, "词频": 226, "单词": "composition", "释义": "构成、作品、作词", "其他拼写": null, "pos": "noun"}, {"序号": 753, "词频": 226, "单词": "attend", "释义": "出席、照看", "其他拼写": null, "pos": "verb"}, {"序号": 754, "词频": 225, "单词": "critical", "释义": "批评的、关键的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 755, "词频": 224, "单词": "alone", "释义": "单独的、仅仅", "其他拼写": null, "pos": "adj_adv"}, {"序号": 756, "词频": 224, "单词": "meeting", "释义": "会议", "其他拼写": null, "pos": "noun_verb"}, {"序号": 757, "词频": 223, "单词": "tax", "释义": "税、对……征税", "其他拼写": null, "pos": "noun_verb"}, {"序号": 758, "词频": 223, "单词": "feature", "释义": "特征、容貌、以……为特色", "其他拼写": null, "pos": "noun_verb"}, {"序号": 759, "词频": 222, "单词": "express", "释义": "表达", "其他拼写": null, "pos": "noun_verb"}, {"序号": 760, "词频": 221, "单词": "shift", "释义": "转移、转换", "其他拼写": null, "pos": "noun_verb"}, {"序号": 761, "词频": 221, "单词": "hundred", "释义": "百、许多", "其他拼写": null, "pos": "noun"}, {"序号": 762, "词频": 221, "单词": "simple", "释义": "简单的", "其他拼写": null, "pos": "noun"}, {"序号": 763, "词频": 221, "单词": "successful", "释义": "成功的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 764, "词频": 221, "单词": "thousand", "释义": "一千", "其他拼写": null, "pos": "noun"}, {"序号": 765, "词频": 220, "单词": "theory", "释义": "理论", "其他拼写": null, "pos": "noun"}, {"序号": 766, "词频": 220, "单词": "key", "释义": "钥匙、关键", "其他拼写": null, "pos": "noun_verb"}, {"序号": 767, "词频": 220, "单词": "image", "释义": "形象、肖像", "其他拼写": null, "pos": "noun_verb"}, {"序号": 768, "词频": 220, "单词": "couple", "释义": "情侣、夫妻", "其他拼写": null, "pos": "noun_verb"}, {"序号": 769, "词频": 219, "单词": "whose", "释义": "谁的", "其他拼写": null, "pos": "other"}, {"序号": 770, "词频": 219, "单词": "catch", "释义": "抓住", "其他拼写": null, "pos": "noun_verb"}, {"序号": 771, "词频": 219, "单词": "select", "释义": "选择", "其他拼写": null, "pos": "verb"}, {"序号": 772, "词频": 219, "单词": "card", "释义": "卡片、纸牌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 773, "词频": 218, "单词": "cover", "释义": "覆盖", "其他拼写": null, "pos": "noun_verb"}, {"序号": 774, "词频": 218, "单词": "earn", "释义": "挣得", "其他拼写": null, "pos": "verb"}, {"序号": 775, "词频": 218, "单词": "farmer", "释义": "农民", "其他拼写": null, "pos": "noun"}, {"序号": 776, "词频": 217, "单词": "trend", "释义": "趋势", "其他拼写": null, "pos": "noun_verb"}, {"序号": 777, "词频": 217, "单词": "attract", "释义": "吸引", "其他拼写": null, "pos": "verb"}, {"序号": 778, "词频": 217, "单词": "clean", "释义": "干净的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 779, "词频": 216, "单词": "method", "释义": "方法", "其他拼写": null, "pos": "noun"}, {"序号": 780, "词频": 216, "单词": "promise", "释义": "承诺", "其他拼写": "promize", "pos": "noun_verb"}, {"序号": 781, "词频": 216, "单词": "desire", "释义": "渴望", "其他拼写": null, "pos": "noun_verb"}, {"序号": 782, "词频": 216, "单词": "lie", "释义": "谎话、说谎", "其他拼写": null, "pos": "noun_verb"}, {"序号": 783, "词频": 216, "单词": "healthy", "释义": "健康的、有益健康的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 784, "词频": 215, "单词": "rest", "释义": "休息", "其他拼写": null, "pos": "noun_verb"}, {"序号": 785, "词频": 215, "单词": "difficulty", "释义": "困难", "其他拼写": null, "pos": "noun"}, {"序号": 786, "词频": 215, "单词": "network", "释义": "网络", "其他拼写": null, "pos": "noun_verb"}, {"序号": 787, "词频": 214, "单词": "billion", "释义": "十亿、万亿", "其他拼写": null, "pos": "noun"}, {"序号": 788, "词频": 214, "单词": "detail", "释义": "细节", "其他拼写": null, "pos": "noun_verb"}, {"序号": 789, "词频": 214, "单词": "daily", "释义": "破晓、开始", "其他拼写": null, "pos": "noun"}, {"序号": 790, "词频": 214, "单词": "normal", "释义": "正常的", "其他拼写": null, "pos": "noun"}, {"序号": 791, "词频": 214, "单词": "reward", "释义": "回报、报酬", "其他拼写": null, "pos": "noun_verb"}, {"序号": 792, "词频": 214, "单词": "post", "释义": "发布、张贴、邮寄", "其他拼写": null, "pos": "noun_verb"}, {"序号": 793, "词频": 214, "单词": "cook", "释义": "烹饪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 794, "词频": 213, "单词": "upon", "释义": "在…上面", "其他拼写": null, "pos": "other"}, {"序号": 795, "词频": 212, "单词": "thus", "释义": "因此", "其他拼写": null, "pos": "noun"}, {"序号": 796, "词频": 212, "单词": "toward", "释义": "向、朝向", "其他拼写": null, "pos": "other"}, {"序号": 797, "词频": 211, "单词": "discover", "释义": "探索、发现", "其他拼写": null, "pos": "verb"}, {"序号": 798, "词频": 211, "单词": "behind", "释义": "在…后面", "其他拼写": null, "pos": "noun"}, {"序号": 799, "词频": 211, "单词": "introduce", "释义": "介绍", "其他拼写": null, "pos": "verb"}, {"序号": 800, "词频": 211, "单词": "else", "释义": "其他", "其他拼写": null, "pos": "other"}, {"序号": 801, "词频": 211, "单词": "drop", "释义": "掉下", "其他拼写": null, "pos": "noun_verb"}, {"序号": 802, "词频": 211, "单词": "device", "释义": "装置、方法", "其他拼写": null, "pos": "noun"}, {"序号": 803, "词频": 210, "单词": "court", "释义": "法庭、球场", "其他拼写": "cort", "pos": "noun_verb"}, {"序号": 804, "词频": 210, "单词": "drug", "释义": "药", "其他拼写": null, "pos": "noun_verb"}, {"序号": 805, "词频": 210, "单词": "warm", "释义": "温暖", "其他拼写": null, "pos": "verb"}, {"序号": 806, "词频": 210, "单词": "range", "释义": "范围", "其他拼写": null, "pos": "noun_verb"}, {"序号": 807, "词频": 210, "单词": "solution", "释义": "解决方案", "其他拼写": null, "pos": "noun"}, {"序号": 808, "词频": 209, "单词": "essential", "释义": "重要的", "其他拼写": null, "pos": "noun"}, {"序号": 809, "词频": 209, "单词": "particular", "释义": "特定的", "其他拼写": null, "pos": "noun"}, {"序号": 810, "词频": 209, "单词": "fashion", "释义": "时尚", "其他拼写": null, "pos": "noun_verb"}, {"序号": 811, "词频": 209, "单词": "indicate", "释义": "表明", "其他拼写": null, "pos": "verb"}, {"序号": 812, "词频": 209, "单词": "accident", "释义": "事故", "其他拼写": null, "pos": "noun"}, {"序号": 813, "词频": 208, "单词": "slow", "释义": "慢的", "其他拼写": null, "pos": "verb"}, {"序号": 814, "词频": 208, "单词": "six", "释义": "六", "其他拼写": null, "pos": "noun"}, {"序号": 815, "词频": 208, "单词": "attach", "释义": "附上、附加", "其他拼写": null, "pos": "verb"}, {"序号": 816, "词频": 207, "单词": "respect", "释义": "尊重", "其他拼写": null, "pos": "noun_verb"}, {"序号": 817, "词频": 207, "单词": "error", "释义": "错误", "其他拼写": null, "pos": "noun"}, {"序号": 818, "词频": 207, "单词": "happy", "释义": "快乐的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 819, "词频": 207, "单词": "credit", "释义": "信用", "其他拼写": null, "pos": "noun_verb"}, {"序号": 820, "词频": 207, "单词": "expensive", "释义": "贵的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 821, "词频": 207, "单词": "finish", "释义": "完成", "其他拼写": null, "pos": "noun_verb"}, {"序号": 822, "词频": 206, "单词": "deep", "释义": "深的", "其他拼写": null, "pos": "noun"}, {"序号": 823, "词频": 206, "单词": "bill", "释义": "账单", "其他拼写": null, "pos": "noun_verb"}, {"序号": 824, "词频": 206, "单词": "fire", "释义": "火、开除", "其他拼写": null, "pos": "noun_verb"}, {"序号": 825, "词频": 204, "单词": "site", "释义": "景点、站点", "其他拼写": null, "pos": "noun_verb"}, {"序号": 826, "词频": 204, "单词": "moment", "释义": "时刻", "其他拼写": null, "pos": "noun"}, {"序号": 827, "词频": 204, "单词": "belief", "释义": "信仰、相信", "其他拼写": null, "pos": "noun"}, {"序号": 828, "词频": 204, "单词": "museum", "释义": "博物馆", "其他拼写": null, "pos": "noun"}, {"序号": 829, "词频": 203, "单词": "finally", "释义": "最终地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 830, "词频": 202, "单词": "address", "释义": "演说、地址", "其他拼写": null, "pos": "noun_verb"}, {"序号": 831, "词频": 202, "单词": "concept", "释义": "概念", "其他拼写": null, "pos": "noun"}, {"序号": 832, "词频": 202, "单词": "crime", "释义": "犯罪", "其他拼写": null, "pos": "noun"}, {"序号": 833, "词频": 202, "单词": "damage", "释义": "损害", "其他拼写": null, "pos": "noun_verb"}, {"序号": 834, "词频": 201, "单词": "negative", "释义": "消极的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 835, "词频": 201, "单词": "size", "释义": "大小", "其他拼写": "sise", "pos": "noun_verb"}, {"序号": 836, "词频": 201, "单词": "restaurant", "释义": "饭馆", "其他拼写": null, "pos": "noun"}, {"序号": 837, "词频": 200, "单词": "federal", "释义": "联邦的", "其他拼写": null, "pos": "noun"}, {"序号": 838, "词频": 199, "单词": "labor", "释义": "劳动力", "其他拼写": "labour", "pos": "noun_verb"}, {"序号": 839, "词频": 199, "单词": "progress", "释义": "进步", "其他拼写": null, "pos": "noun_verb"}, {"序号": 840, "词频": 198, "单词": "robot", "释义": "机器人", "其他拼写": null, "pos": "noun"}, {"序号": 841, "词频": 198, "单词": "movement", "释义": "运动", "其他拼写": null, "pos": "noun"}, {"序号": 842, "词频": 198, "单词": "weather", "释义": "天气", "其他拼写": null, "pos": "noun_verb"}, {"序号": 843, "词频": 198, "单词": "mistake", "释义": "错误", "其他拼写": null, "pos": "noun_verb"}, {"序号": 844, "词频": 197, "单词": "infer", "释义": "推断", "其他拼写": null, "pos": "verb"}, {"序号": 845, "词频": 197, "单词": "enter", "释义": "进入", "其他拼写": null, "pos": "verb"}, {"序号": 846, "词频": 197, "单词": "charge", "释义": "收费、索价、充电", "其他拼写": null, "pos": "noun_verb"}, {"序号": 847, "词频": 197, "单词": "medicine", "释义": "医药", "其他拼写": null, "pos": "noun_verb"}, {"序号": 848, "词频": 196, "单词": "engage", "释义": "吸引、使参加", "其他拼写": null, "pos": "verb"}, {"序号": 849, "词频": 195, "单词": "executive", "释义": "实行的、经理", "其他拼写": null, "pos": "noun"}, {"序号": 850, "词频": 195, "单词": "wide", "释义": "广泛的、宽的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 851, "词频": 195, "单词": "variety", "释义": "多样化、种类", "其他拼写": null, "pos": "noun"}, {"序号": 852, "词频": 195, "单词": "race", "释义": "比赛、竞速", "其他拼写": null, "pos": "noun_verb"}, {"序号": 853, "词频": 195, "单词": "object", "释义": "目标、物体", "其他拼写": null, "pos": "noun_verb"}, {"序号": 854, "词频": 194, "单词": "manage", "释义": "管理、设法做到", "其他拼写": null, "pos": "verb"}, {"序号": 855, "词频": 194, "单词": "hospital", "释义": "医院", "其他拼写": null, "pos": "noun"}, {"序号": 856, "词频": 193, "单词": "official", "释义": "官方的", "其他拼写": null, "pos": "noun"}, {"序号": 857, "词频": 193, "单词": "huge", "释义": "大的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 858, "词频": 192, "单词": "hire", "释义": "雇佣", "其他拼写": null, "pos": "noun_verb"}, {"序号": 859, "词频": 192, "单词": "hotel", "释义": "酒店", "其他拼写": null, "pos": "noun"}, {"序号": 860, "词频": 191, "单词": "treat", "释义": "对待", "其他拼写": null, "pos": "noun_verb"}, {"序号": 861, "词频": 191, "单词": "perform", "释义": "演奏、执行", "其他拼写": null, "pos": "verb"}, {"序号": 862, "词频": 191, "单词": "employer", "释义": "雇主", "其他拼写": null, "pos": "noun"}, {"序号": 863, "词频": 191, "单词": "literature", "释义": "文学", "其他拼写": null, "pos": "noun"}, {"序号": 864, "词频": 190, "单词": "profit", "释义": "利润", "其他拼写": null, "pos": "noun_verb"}, {"序号": 865, "词频": 190, "单词": "article", "释义": "文章", "其他拼写": null, "pos": "noun_verb"}, {"序号": 866, "词频": 190, "单词": "weight", "释义": "体重", "其他拼写": null, "pos": "noun_verb"}, {"序号": 867, "词频": 190, "单词": "trip", "释义": "旅行", "其他拼写": null, "pos": "noun_verb"}, {"序号": 868, "词频": 189, "单词": "investment", "释义": "投资", "其他拼写": null, "pos": "noun"}, {"序号": 869, "词频": 189, "单词": "due", "释义": "预期的、到期的", "其他拼写": null, "pos": "noun"}, {"序号": 870, "词频": 189, "单词": "aspect", "释义": "样子、方面", "其他拼写": null, "pos": "noun"}, {"序号": 871, "词频": 189, "单词": "wear", "释义": "穿着", "其他拼写": null, "pos": "noun_verb"}, {"序号": 872, "词频": 188, "单词": "define", "释义": "定义", "其他拼写": null, "pos": "verb"}, {"序号": 873, "词频": 188, "单词": "balance", "释义": "平衡", "其他拼写": null, "pos": "noun_verb"}, {"序号": 874, "词频": 188, "单词": "enable", "释义": "使能够", "其他拼写": null, "pos": "verb"}, {"序号": 875, "词频": 187, "单词": "consumption", "释义": "消费、消耗", "其他拼写": null, "pos": "noun"}, {"序号": 876, "词频": 187, "单词": "character", "释义": "性格", "其他拼写": null, "pos": "noun_verb"}, {"序号": 877, "词频": 187, "单词": "crisis", "释义": "危机", "其他拼写": null, "pos": "noun"}, {"序号": 878, "词频": 187, "单词": "dollar", "释义": "美元", "其他拼写": null, "pos": "noun"}, {"序号": 879, "词频": 187, "单词": "green", "释义": "绿的、未熟的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 880, "词频": 186, "单词": "immigrant", "释义": "移民", "其他拼写": null, "pos": "noun"}, {"序号": 881, "词频": 186, "单词": "contact", "释义": "联系", "其他拼写": null, "pos": "noun_verb"}, {"序号": 882, "词频": 186, "单词": "cold", "释义": "冷的", "其他拼写": null, "pos": "noun"}, {"序号": 883, "词频": 185, "单词": "reality", "释义": "现实、真实的事物", "其他拼写": null, "pos": "noun"}, {"序号": 884, "词频": 185, "单词": "department", "释义": "部门", "其他拼写": null, "pos": "noun"}, {"序号": 885, "词频": 184, "单词": "comment", "释义": "评论", "其他拼写": null, "pos": "noun_verb"}, {"序号": 886, "词频": 184, "单词": "board", "释义": "板", "其他拼写": null, "pos": "noun_verb"}, {"序号": 887, "词频": 184, "单词": "consequence", "释义": "后果、结果", "其他拼写": null, "pos": "noun"}, {"序号": 888, "词频": 184, "单词": "style", "释义": "风格", "其他拼写": null, "pos": "noun_verb"}, {"序号": 889, "词频": 184, "单词": "fight", "释义": "打斗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 890, "词频": 184, "单词": "advice", "释义": "建议", "其他拼写": null, "pos": "noun"}, {"序号": 891, "词频": 184, "单词": "meal", "释义": "饭", "其他拼写": null, "pos": "noun"}, {"序号": 892, "词频": 184, "单词": "worry", "释义": "担心", "其他拼写": null, "pos": "noun_verb"}, {"序号": 893, "词频": 182, "单词": "tool", "释义": "工具", "其他拼写": null, "pos": "noun_verb"}, {"序号": 894, "词频": 182, "单词": "waste", "释义": "浪费", "其他拼写": null, "pos": "noun_verb"}, {"序号": 895, "词频": 181, "单词": "predict", "释义": "预测", "其他拼写": null, "pos": "verb"}, {"序号": 896, "词频": 181, "单词": "despite", "释义": "尽管", "其他拼写": null, "pos": "noun"}, {"序号": 897, "词频": 181, "单词": "morning", "释义": "早晨", "其他拼写": null, "pos": "noun"}, {"序号": 898, "词频": 180, "单词": "operation", "释义": "运营、操作", "其他拼写": null, "pos": "noun"}, {"序号": 899, "词频": 179, "单词": "industrial", "释义": "工业的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 900, "词频": 179, "单词": "stage", "释义": "阶段", "其他拼写": null, "pos": "noun_verb"}, {"序号": 901, "词频": 179, "单词": "kill", "释义": "杀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 902, "词频": 178, "单词": "specific", "释义": "具体的、详细的", "其他拼写": null, "pos": "noun"}, {"序号": 903, "词频": 178, "单词": "highly", "释义": "高度地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 904, "词频": 178, "单词": "purchase", "释义": "购买", "其他拼写": null, "pos": "noun_verb"}, {"序号": 905, "词频": 178, "单词": "director", "释义": "指挥者", "其他拼写": null, "pos": "noun"}, {"序号": 906, "词频": 177, "单词": "significant", "释义": "有意义的、重要的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 907, "词频": 177, "单词": "feeling", "释义": "感受", "其他拼写": null, "pos": "noun_verb"}, {"序号": 908, "词频": 177, "单词": "replace", "释义": "替代", "其他拼写": null, "pos": "verb"}, {"序号": 909, "词频": 177, "单词": "yourself", "释义": "你自己、你亲自", "其他拼写": null, "pos": "other"}, {"序号": 910, "词频": 177, "单词": "print", "释义": "打印", "其他拼写": null, "pos": "noun_verb"}, {"序号": 911, "词频": 177, "单词": "shape", "释义": "形状", "其他拼写": null, "pos": "noun_verb"}, {"序号": 912, "词频": 177, "单词": "thirty", "释义": "三十", "其他拼写": null, "pos": "noun"}, {"序号": 913, "词频": 176, "单词": "ground", "释义": "地面、场所", "其他拼写": null, "pos": "noun_verb"}, {"序号": 914, "词频": 176, "单词": "screen", "释义": "屏幕", "其他拼写": null, "pos": "noun_verb"}, {"序号": 915, "词频": 175, "单词": "struggle", "释义": "斗争、奋斗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 916, "词频": 175, "单词": "lay", "释义": "放置、躺、位于、说谎", "其他拼写": null, "pos": "noun_verb"}, {"序号": 917, "词频": 175, "单词": "sea", "释义": "大海", "其他拼写": null, "pos": "noun"}, {"序号": 918, "词频": 174, "单词": "forget", "释义": "忘记", "其他拼写": null, "pos": "verb"}, {"序号": 919, "词频": 174, "单词": "expand", "释义": "扩大", "其他拼写": null, "pos": "verb"}, {"序号": 920, "词频": 174, "单词": "cross", "释义": "跨过、穿过", "其他拼写": null, "pos": "noun_verb"}, {"序号": 921, "词频": 174, "单词": "multiple", "释义": "多种多样的、倍数", "其他拼写": null, "pos": "noun"}, {"序号": 922, "词频": 174, "单词": "wife", "释义": "妻子", "其他拼写": null, "pos": "noun"}, {"序号": 923, "词频": 173, "单词": "intellectual", "释义": "知识分子、知识的", "其他拼写": null, "pos": "noun"}, {"序号": 924, "词频": 173, "单词": "fund", "释义": "资金", "其他拼写": null, "pos": "noun_verb"}, {"序号": 925, "词频": 173, "单词": "conduct", "释义": "实施、开展", "其他拼写": null, "pos": "noun_verb"}, {"序号": 926, "词频": 173, "单词": "direct", "释义": "径直的、直接的", "其他拼写": null, "pos": "verb"}, {"序号": 927, "词频": 173, "单词": "ensure", "释义": "确保", "其他拼写": null, "pos": "verb"}, {"序号": 928, "词频": 173, "单词": "safety", "释义": "安全", "其他拼写": null, "pos": "noun"}, {"序号": 929, "词频": 173, "单词": "region", "释义": "地区", "其他拼写": null, "pos": "noun"}, {"序号": 930, "词频": 173, "单词": "tourist", "释义": "旅行者", "其他拼写": null, "pos": "noun"}, {"序号": 931, "词频": 172, "单词": "legal", "释义": "法律的、合法的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 932, "词频": 172, "单词": "link", "释义": "连接", "其他拼写": null, "pos": "noun_verb"}, {"序号": 933, "词频": 172, "单词": "reflect", "释义": "反射、反映、思考", "其他拼写": null, "pos": "verb"}, {"序号": 934, "词频": 172, "单词": "aim", "释义": "目标", "其他拼写": null, "pos": "noun_verb"}, {"序号": 935, "词频": 172, "单词": "husband", "释义": "丈夫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 936, "词频": 171, "单词": "underline", "释义": "下划线、强调", "其他拼写": null, "pos": "noun_verb"}, {"序号": 937, "词频": 171, "单词": "worth", "释义": "值得", "其他拼写": null, "pos": "noun"}, {"序号": 938, "词频": 170, "单词": "freedom", "释义": "自由", "其他拼写": null, "pos": "noun"}, {"序号": 939, "词频": 170, "单词": "suppose", "释义": "假设", "其他拼写": null, "pos": "verb"}, {"序号": 940, "词频": 170, "单词": "reveal", "释义": "显露、展现", "其他拼写": null, "pos": "verb"}, {"序号": 941, "词频": 170, "单词": "poverty", "释义": "贫穷", "其他拼写": null, "pos": "noun"}, {"序号": 942, "词频": 169, "单词": "advance", "释义": "前进、提高", "其他拼写": null, "pos": "noun_verb"}, {"序号": 943, "词频": 169, "单词": "south", "释义": "南、南方的", "其他拼写": null, "pos": "noun"}, {"序号": 944, "词频": 169, "单词": "smoke", "释义": "烟", "其他拼写": null, "pos": "noun_verb"}, {"序号": 945, "词频": 169, "单词": "practical", "释义": "实际的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 946, "词频": 168, "单词": "male", "释义": "男性、男性的", "其他拼写": null, "pos": "noun"}, {"序号": 947, "词频": 168, "单词": "commercial", "释义": "商业的", "其他拼写": null, "pos": "noun"}, {"序号": 948, "词频": 168, "单词": "peer", "释义": "凝视、同伴、贵族", "其他拼写": null, "pos": "noun_verb"}, {"序号": 949, "词频": 168, "单词": "attack", "释义": "攻击", "其他拼写": null, "pos": "noun_verb"}, {"序号": 950, "词频": 168, "单词": "holiday", "释义": "假日", "其他拼写": null, "pos": "noun_verb"}, {"序号": 951, "词频": 167, "单词": "limited", "释义": "有限的、有限责任的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 952, "词频": 167, "单词": "push", "释义": "推", "其他拼写": null, "pos": "noun_verb"}, {"序号": 953, "词频": 167, "单词": "twenty", "释义": "二十", "其他拼写": null, "pos": "noun"}, {"序号": 954, "词频": 167, "单词": "police", "释义": "警察", "其他拼写": null, "pos": "noun_verb"}, {"序号": 955, "词频": 167, "单词": "film", "释义": "电影", "其他拼写": null, "pos": "noun_verb"}, {"序号": 956, "词频": 166, "单词": "review", "释义": "复习、回顾、评论", "其他拼写": null, "pos": "noun_verb"}, {"序号": 957, "词频": 166, "单词": "attempt", "释义": "试图、企图", "其他拼写": null, "pos": "noun_verb"}, {"序号": 958, "词频": 166, "单词": "wealth", "释义": "财富", "其他拼写": null, "pos": "noun"}, {"序号": 959, "词频": 166, "单词": "associate", "释义": "联系、结交", "其他拼写": null, "pos": "noun_verb"}, {"序号": 960, "词频": 166, "单词": "prefer", "释义": "偏好", "其他拼写": null, "pos": "verb"}, {"序号": 961, "词频": 165, "单词": "title", "释义": "标题", "其他拼写": null, "pos": "noun_verb"}, {"序号": 962, "词频": 165, "单词": "creative", "释义": "有创造力的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 963, "词频": 164, "单词": "trust", "释义": "信任", "其他拼写": null, "pos": "noun_verb"}, {"序号": 964, "词频": 163, "单词": "ill", "释义": "有病的、坏的", "其他拼写": null, "pos": "noun"}, {"序号": 965, "词频": 163, "单词": "box", "释义": "盒子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 966, "词频": 163, "单词": "cry", "释义": "哭泣", "其他拼写": null, "pos": "noun_verb"}, {"序号": 967, "词频": 162, "单词": "hardly", "释义": "几乎不、仅仅", "其他拼写": null, "pos": "adj_adv"}, {"序号": 968, "词频": 162, "单词": "responsible", "释义": "应负责的、可靠的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 969, "词频": 162, "单词": "track", "释义": "追踪、足迹、痕迹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 970, "词频": 162, "单词": "warn", "释义": "警告", "其他拼写": null, "pos": "verb"}, {"序号": 971, "词频": 162, "单词": "total", "释义": "总共的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 972, "词频": 162, "单词": "derive", "释义": "取得", "其他拼写": null, "pos": "verb"}, {"序号": 973, "词频": 162, "单词": "china", "释义": "瓷器", "其他拼写": null, "pos": "noun"}, {"序号": 974, "词频": 162, "单词": "textbook", "释义": "课本", "其他拼写": null, "pos": "noun"}, {"序号": 975, "词频": 161, "单词": "extra", "释义": "额外的", "其他拼写": null, "pos": "noun"}, {"序号": 976, "词频": 161, "单词": "electronic", "释义": "电子的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 977, "词频": 161, "单词": "ignore", "释义": "忽视", "其他拼写": null, "pos": "verb"}, {"序号": 978, "词频": 161, "单词": "survive", "释义": "幸存", "其他拼写": null, "pos": "verb"}, {"序号": 979, "词频": 161, "单词": "bird", "释义": "鸟", "其他拼写": null, "pos": "noun_verb"}, {"序号": 980, "词频": 161, "单词": "heavy", "释义": "重的", "其他拼写": null, "pos": "noun"}, {"序号": 981, "词频": 160, "单词": "fuel", "释义": "燃料", "其他拼写": null, "pos": "noun_verb"}, {"序号": 982, "词频": 160, "单词": "magazine", "释义": "杂志", "其他拼写": null, "pos": "noun"}, {"序号": 983, "词频": 160, "单词": "summer", "释义": "夏天、夏季的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 984, "词频": 159, "单词": "complex", "释义": "复杂的", "其他拼写": null, "pos": "noun"}, {"序号": 985, "词频": 159, "单词": "danger", "释义": "危险", "其他拼写": null, "pos": "noun"}, {"序号": 986, "词频": 159, "单词": "piece", "释义": "（一）件、碎片", "其他拼写": null, "pos": "noun_verb"}, {"序号": 987, "词频": 159, "单词": "option", "释义": "选项", "其他拼写": null, "pos": "noun"}, {"序号": 988, "词频": 159, "单词": "throughout", "释义": "遍及、到处", "其他拼写": null, "pos": "adj_adv"}, {"序号": 989, "词频": 159, "单词": "library", "释义": "图书馆", "其他拼写": null, "pos": "noun"}, {"序号": 990, "词频": 158, "单词": "mention", "释义": "提及", "其他拼写": null, "pos": "noun_verb"}, {"序号": 991, "词频": 158, "单词": "institution", "释义": "机构", "其他拼写": null, "pos": "noun"}, {"序号": 992, "词频": 157, "单词": "appeal", "释义": "呼吁、吸引", "其他拼写": null, "pos": "noun_verb"}, {"序号": 993, "词频": 157, "单词": "background", "释义": "背景", "其他拼写": null, "pos": "noun_verb"}, {"序号": 994, "词频": 157, "单词": "colleague", "释义": "同事", "其他拼写": null, "pos": "noun"}, {"序号": 995, "词频": 156, "单词": "intend", "释义": "想要（做某事）", "其他拼写": null, "pos": "verb"}, {"序号": 996, "词频": 156, "单词": "strategy", "释义": "策略", "其他拼写": null, "pos": "noun"}, {"序号": 997, "词频": 156, "单词": "paint", "释义": "绘画", "其他拼写": null, "pos": "noun_verb"}, {"序号": 998, "词频": 156, "单词": "exact", "释义": "确切的、特定的", "其他拼写": null, "pos": "verb"}, {"序号": 999, "词频": 155, "单词": "journal", "释义": "日记", "其他拼写": null, "pos": "noun"}, {"序号": 1000, "词频": 155, "单词": "grant", "释义": "同意、授予", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1001, "词频": 155, "单词": "factory", "释义": "工厂", "其他拼写": null, "pos": "noun"}, {"序号": 1002, "词频": 155, "单词": "authority", "释义": "权力、权威人士", "其他拼写": null, "pos": "noun"}, {"序号": 1003, "词频": 155, "单词": "association", "释义": "协会", "其他拼写": null, "pos": "noun"}, {"序号": 1004, "词频": 155, "单词": "tree", "释义": "树、爬上树", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1005, "词频": 155, "单词": "arrive", "释义": "到、达到", "其他拼写": null, "pos": "verb"}, {"序号": 1006, "词频": 155, "单词": "ready", "释义": "准备好的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1007, "词频": 155, "单词": "cheap", "释义": "便宜的、不值钱的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1008, "词频": 154, "单词": "patent", "释义": "专利、专利的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1009, "词频": 154, "单词": "flight", "释义": "航班", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1010, "词频": 154, "单词": "spread", "释义": "传播", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1011, "词频": 154, "单词": "expense", "释义": "花费", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1012, "词频": 154, "单词": "famous", "释义": "有名的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1013, "词频": 153, "单词": "indeed", "释义": "确实", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1014, "词频": 153, "单词": "establish", "释义": "建立、查实", "其他拼写": null, "pos": "verb"}, {"序号": 1015, "词频": 153, "单词": "observe", "释义": "观察", "其他拼写": null, "pos": "verb"}, {"序号": 1016, "词频": 153, "单词": "chief", "释义": "首领、主要的", "其他拼写": null, "pos": "noun"}, {"序号": 1017, "词频": 153, "单词": "safe", "释义": "安全的", "其他拼写": null, "pos": "noun"}, {"序号": 1018, "词频": 153, "单词": "nor", "释义": "也不", "其他拼写": null, "pos": "other"}, {"序号": 1019, "词频": 153, "单词": "foot", "释义": "脚、走", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1020, "词频": 152, "单词": "debate", "释义": "讨论", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1021, "词频": 152, "单词": "agency", "释义": "机构", "其他拼写": null, "pos": "noun"}, {"序号": 1022, "词频": 152, "单词": "educate", "释义": "教育", "其他拼写": null, "pos": "verb"}, {"序号": 1023, "词频": 152, "单词": "compete", "释义": "竞争", "其他拼写": null, "pos": "verb"}, {"序号": 1024, "词频": 152, "单词": "wish", "释义": "希望", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1025, "词频": 152, "单词": "staff", "释义": "员工", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1026, "词频": 151, "单词": "adapt", "释义": "改编、适应", "其他拼写": null, "pos": "verb"}, {"序号": 1027, "词频": 151, "单词": "boss", "释义": "老板", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1028, "词频": 150, "单词": "unless", "释义": "除非", "其他拼写": null, "pos": "other"}, {"序号": 1029, "词频": 150, "单词": "unemployment", "释义": "失业", "其他拼写": null, "pos": "noun"}, {"序号": 1030, "词频": 150, "单词": "fix", "释义": "固定、修理", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1031, "词频": 149, "单词": "scale", "释义": "规模、刻度、天平", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1032, "词频": 149, "单词": "possibility", "释义": "可能、可能的事", "其他拼写": null, "pos": "noun"}, {"序号": 1033, "词频": 149, "单词": "application", "释义": "应用、申请", "其他拼写": null, "pos": "noun"}, {"序号": 1034, "词频": 149, "单词": "participant", "释义": "参与者", "其他拼写": null, "pos": "noun"}, {"序号": 1035, "词频": 148, "单词": "union", "释义": "一致、联合", "其他拼写": null, "pos": "noun"}, {"序号": 1036, "词频": 148, "单词": "threat", "释义": "威胁", "其他拼写": null, "pos": "noun"}, {"序号": 1037, "词频": 148, "单词": "emotion", "释义": "情感", "其他拼写": null, "pos": "noun"}, {"序号": 1038, "词频": 148, "单词": "western", "释义": "西方的", "其他拼写": null, "pos": "noun"}, {"序号": 1039, "词频": 148, "单词": "marriage", "释义": "结婚、结婚仪式", "其他拼写": null, "pos": "noun"}, {"序号": 1040, "词频": 147, "单词": "capacity", "释义": "容量、能力、生产力", "其他拼写": null, "pos": "noun"}, {"序号": 1041, "词频": 147, "单词": "score", "释义": "分数", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1042, "词频": 147, "单词": "obvious", "释义": "明显的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1043, "词频": 147, "单词": "relation", "释义": "关系", "其他拼写": null, "pos": "noun"}, {"序号": 1044, "词频": 147, "单词": "lesson", "释义": "课、教训", "其他拼写": null, "pos": "noun"}, {"序号": 1045, "词频": 147, "单词": "passenger", "释义": "乘客", "其他拼写": null, "pos": "noun"}, {"序号": 1046, "词频": 147, "单词": "represent", "释义": "代表", "其他拼写": null, "pos": "verb"}, {"序号": 1047, "词频": 147, "单词": "mile", "释义": "英里", "其他拼写": null, "pos": "noun"}, {"序号": 1048, "词频": 147, "单词": "regular", "释义": "定期的、常规的", "其他拼写": null, "pos": "noun"}, {"序号": 1049, "词频": 147, "单词": "adopt", "释义": "采用、收养", "其他拼写": null, "pos": "verb"}, {"序号": 1050, "词频": 147, "单词": "voice", "释义": "声音", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1051, "词频": 147, "单词": "movie", "释义": "电影", "其他拼写": null, "pos": "noun"}, {"序号": 1052, "词频": 146, "单词": "characteristic", "释义": "特征、独有的", "其他拼写": null, "pos": "noun"}, {"序号": 1053, "词频": 146, "单词": "join", "释义": "参加", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1054, "词频": 146, "单词": "operate", "释义": "运转、动手术", "其他拼写": null, "pos": "verb"}, {"序号": 1055, "词频": 146, "单词": "pollution", "释义": "污染", "其他拼写": null, "pos": "noun"}, {"序号": 1056, "词频": 146, "单词": "discuss", "释义": "讨论", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1057, "词频": 145, "单词": "extend", "释义": "延伸、延展", "其他拼写": null, "pos": "verb"}, {"序号": 1058, "词频": 145, "单词": "appropriate", "释义": "恰当的", "其他拼写": null, "pos": "verb"}, {"序号": 1059, "词频": 145, "单词": "match", "释义": "比赛、匹配", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1060, "词频": 145, "单词": "date", "释义": "日期", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1061, "词频": 145, "单词": "ancient", "释义": "古老的", "其他拼写": null, "pos": "noun"}, {"序号": 1062, "词频": 144, "单词": "majority", "释义": "多数、半数以上", "其他拼写": null, "pos": "noun"}, {"序号": 1063, "词频": 144, "单词": "wonder", "释义": "好奇、奇观", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1064, "词频": 144, "单词": "forest", "释义": "森林", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1065, "词频": 144, "单词": "unique", "释义": "独特的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1066, "词频": 144, "单词": "finding", "释义": "发现、调查结果", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1067, "词频": 144, "单词": "gas", "释义": "气体、天然气", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1068, "词频": 144, "单词": "separate", "释义": "分开", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1069, "词频": 144, "单词": "audience", "释义": "观众", "其他拼写": null, "pos": "noun"}, {"序号": 1070, "词频": 144, "单词": "station", "释义": "车站", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1071, "词频": 143, "单词": "carbon", "释义": "碳、复写纸", "其他拼写": null, "pos": "noun"}, {"序号": 1072, "词频": 143, "单词": "female", "释义": "女性、雌性", "其他拼写": null, "pos": "noun"}, {"序号": 1073, "词频": 143, "单词": "conclude", "释义": "总结", "其他拼写": null, "pos": "verb"}, {"序号": 1074, "词频": 143, "单词": "employ", "释义": "雇佣、采用", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1075, "词频": 143, "单词": "conclusion", "释义": "总结", "其他拼写": null, "pos": "noun"}, {"序号": 1076, "词频": 142, "单词": "moral", "释义": "道德的", "其他拼写": null, "pos": "noun"}, {"序号": 1077, "词频": 142, "单词": "expression", "释义": "表达、措词", "其他拼写": null, "pos": "noun"}, {"序号": 1078, "词频": 142, "单词": "wall", "释义": "墙壁", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1079, "词频": 142, "单词": "temperature", "释义": "温度", "其他拼写": null, "pos": "noun"}, {"序号": 1080, "词频": 141, "单词": "principle", "释义": "原则", "其他拼写": null, "pos": "noun"}, {"序号": 1081, "词频": 141, "单词": "acquire", "释义": "获得", "其他拼写": null, "pos": "verb"}, {"序号": 1082, "词频": 141, "单词": "mail", "释义": "邮件", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1083, "词频": 141, "单词": "consume", "释义": "消耗、耗尽", "其他拼写": null, "pos": "verb"}, {"序号": 1084, "词频": 141, "单词": "aware", "释义": "意识的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1085, "词频": 141, "单词": "owner", "释义": "物主", "其他拼写": null, "pos": "noun"}, {"序号": 1086, "词频": 141, "单词": "classroom", "释义": "教室", "其他拼写": null, "pos": "noun"}, {"序号": 1087, "词频": 141, "单词": "campus", "释义": "校园", "其他拼写": null, "pos": "noun"}, {"序号": 1088, "词频": 140, "单词": "pain", "释义": "痛苦", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1089, "词频": 140, "单词": "aid", "释义": "援助", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1090, "词频": 139, "单词": "doubt", "释义": "怀疑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1091, "词频": 139, "单词": "ice", "释义": "冰、使结冰", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1092, "词频": 139, "单词": "cell", "释义": "细胞", "其他拼写": null, "pos": "noun"}, {"序号": 1093, "词频": 139, "单词": "confidence", "释义": "信任", "其他拼写": null, "pos": "noun"}, {"序号": 1094, "词频": 139, "单词": "imagine", "释义": "想象", "其他拼写": null, "pos": "verb"}, {"序号": 1095, "词频": 139, "单词": "taste", "释义": "口味", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1096, "词频": 139, "单词": "resident", "释义": "居民、居住的", "其他拼写": null, "pos": "noun"}, {"序号": 1097, "词频": 138, "单词": "equal", "释义": "平等的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1098, "词频": 138, "单词": "senior", "释义": "年长的、资格老的", "其他拼写": null, "pos": "noun"}, {"序号": 1099, "词频": 138, "单词": "dinner", "释义": "正餐", "其他拼写": null, "pos": "noun"}, {"序号": 1100, "词频": 137, "单词": "innovation", "释义": "革新、新方法", "其他拼写": null, "pos": "noun"}, {"序号": 1101, "词频": 137, "单词": "pick", "释义": "挑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1102, "词频": 137, "单词": "overall", "释义": "全面的、总体上", "其他拼写": null, "pos": "noun"}, {"序号": 1103, "词频": 137, "单词": "succeed", "释义": "成功、接替", "其他拼写": null, "pos": "verb"}, {"序号": 1104, "词频": 137, "单词": "strike", "释义": "击打", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1105, "词频": 137, "单词": "examine", "释义": "检查", "其他拼写": null, "pos": "verb"}, {"序号": 1106, "词频": 137, "单词": "instruction", "释义": "指令、教导", "其他拼写": null, "pos": "noun"}, {"序号": 1107, "词频": 136, "单词": "cancer", "释义": "癌症", "其他拼写": null, "pos": "noun"}, {"序号": 1108, "词频": 136, "单词": "judge", "释义": "判断", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1109, "词频": 136, "单词": "divide", "释义": "划分", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1110, "词频": 136, "单词": "rely", "释义": "依靠", "其他拼写": null, "pos": "verb"}, {"序号": 1111, "词频": 136, "单词": "former", "释义": "以前的、前者", "其他拼写": null, "pos": "noun"}, {"序号": 1112, "词频": 136, "单词": "instance", "释义": "例子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1113, "词频": 136, "单词": "release", "释义": "释放、解除", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1114, "词频": 136, "单词": "front", "释义": "前面的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1115, "词频": 136, "单词": "harm", "释义": "伤害", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1116, "词频": 136, "单词": "partner", "释义": "伙伴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1117, "词频": 136, "单词": "floor", "释义": "地面", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1118, "词频": 135, "单词": "imply", "释义": "暗示", "其他拼写": null, "pos": "verb"}, {"序号": 1119, "词频": 135, "单词": "remove", "释义": "移除", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1120, "词频": 135, "单词": "tradition", "释义": "传统", "其他拼写": null, "pos": "noun"}, {"序号": 1121, "词频": 135, "单词": "radio", "释义": "收音机", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1122, "词频": 135, "单词": "vocabulary", "释义": "词汇", "其他拼写": null, "pos": "noun"}, {"序号": 1123, "词频": 135, "单词": "hunt", "释义": "打猎", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1124, "词频": 135, "单词": "clock", "释义": "时钟、计时", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1125, "词频": 134, "单词": "assume", "释义": "假设、揣测", "其他拼写": null, "pos": "verb"}, {"序号": 1126, "词频": 134, "单词": "invite", "释义": "邀请", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1127, "词频": 134, "单词": "collect", "释义": "收集", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1128, "词频": 134, "单词": "campaign", "释义": "运动、战役", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1129, "词频": 134, "单词": "native", "释义": "本地的、天生的", "其他拼写": null, "pos": "noun"}, {"序号": 1130, "词频": 134, "单词": "interesting", "释义": "有趣的", "其他拼写": null, "pos": "verb"}, {"序号": 1131, "词频": 134, "单词": "shortage", "释义": "不足", "其他拼写": null, "pos": "noun"}, {"序号": 1132, "词频": 133, "单词": "reform", "释义": "改革", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1133, "词频": 133, "单词": "corporate", "释义": "公司的、法人的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1134, "词频": 133, "单词": "powerful", "释义": "强有力的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1135, "词频": 133, "单词": "central", "释义": "中心的", "其他拼写": null, "pos": "noun"}, {"序号": 1136, "词频": 133, "单词": "efficiency", "释义": "效率", "其他拼写": null, "pos": "noun"}, {"序号": 1137, "词频": 133, "单词": "gender", "释义": "性别", "其他拼写": null, "pos": "noun"}, {"序号": 1138, "词频": 133, "单词": "dangerous", "释义": "危险的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1139, "词频": 133, "单词": "urban", "释义": "城市的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1140, "词频": 132, "单词": "emerge", "释义": "出现", "其他拼写": null, "pos": "verb"}, {"序号": 1141, "词频": 132, "单词": "sort", "释义": "种类、排序", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1142, "词频": 132, "单词": "enhance", "释义": "提高", "其他拼写": null, "pos": "verb"}, {"序号": 1143, "词频": 132, "单词": "round", "释义": "圆的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1144, "词频": 132, "单词": "connect", "释义": "连接", "其他拼写": null, "pos": "verb"}, {"序号": 1145, "词频": 132, "单词": "forward", "释义": "前进的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1146, "词频": 132, "单词": "handle", "释义": "处理", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1147, "词频": 132, "单词": "debt", "释义": "债务", "其他拼写": null, "pos": "noun"}, {"序号": 1148, "词频": 132, "单词": "diet", "释义": "饮食", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1149, "词频": 132, "单词": "connection", "释义": "联系", "其他拼写": "connexion", "pos": "noun"}, {"序号": 1150, "词频": 132, "单词": "color", "释义": "颜色", "其他拼写": "colour", "pos": "noun_verb"}, {"序号": 1151, "词频": 132, "单词": "door", "释义": "门", "其他拼写": null, "pos": "noun"}, {"序号": 1152, "词频": 131, "单词": "hot", "释义": "热的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1153, "词频": 131, "单词": "personality", "释义": "人格", "其他拼写": null, "pos": "noun"}, {"序号": 1154, "词频": 131, "单词": "eventually", "释义": "最终", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1155, "词频": 131, "单词": "manufacture", "释义": "制造、捏造", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1156, "词频": 131, "单词": "ocean", "释义": "海洋", "其他拼写": null, "pos": "noun"}, {"序号": 1157, "词频": 131, "单词": "north", "释义": "北、北方的", "其他拼写": null, "pos": "noun"}, {"序号": 1158, "词频": 131, "单词": "chemical", "释义": "化学的", "其他拼写": null, "pos": "noun"}, {"序号": 1159, "词频": 131, "单词": "afford", "释义": "承担得起", "其他拼写": null, "pos": "verb"}, {"序号": 1160, "词频": 131, "单词": "sugar", "释义": "糖", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1161, "词频": 131, "单词": "apple", "释义": "苹果", "其他拼写": null, "pos": "noun"}, {"序号": 1162, "词频": 130, "单词": "noise", "释义": "噪音", "其他拼写": "noize", "pos": "noun_verb"}, {"序号": 1163, "词频": 130, "单词": "employment", "释义": "雇用、工作", "其他拼写": null, "pos": "noun"}, {"序号": 1164, "词频": 130, "单词": "advocate", "释义": "主张、倡议", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1165, "词频": 130, "单词": "mass", "释义": "大量", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1166, "词频": 130, "单词": "contrast", "释义": "形成对比", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1167, "词频": 130, "单词": "ideal", "释义": "理想的、空想的", "其他拼写": null, "pos": "noun"}, {"序号": 1168, "词频": 130, "单词": "west", "释义": "西、向西", "其他拼写": null, "pos": "noun"}, {"序号": 1169, "词频": 130, "单词": "vehicle", "释义": "交通工具", "其他拼写": null, "pos": "noun"}, {"序号": 1170, "词频": 130, "单词": "inside", "释义": "在里面", "其他拼写": null, "pos": "noun"}, {"序号": 1171, "词频": 129, "单词": "respond", "释义": "回答、响应", "其他拼写": null, "pos": "verb"}, {"序号": 1172, "词频": 129, "单词": "seven", "释义": "七", "其他拼写": null, "pos": "noun"}, {"序号": 1173, "词频": 129, "单词": "gift", "释义": "礼物", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1174, "词频": 129, "单词": "artist", "释义": "艺术家", "其他拼写": null, "pos": "noun"}, {"序号": 1175, "词频": 129, "单词": "double", "释义": "双的、使加倍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1176, "词频": 129, "单词": "novel", "释义": "新颖的、长篇小说", "其他拼写": null, "pos": "noun"}, {"序号": 1177, "词频": 129, "单词": "page", "释义": "页码", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1178, "词频": 129, "单词": "park", "释义": "停车、公园", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1179, "词频": 128, "单词": "largely", "释义": "大量地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1180, "词频": 128, "单词": "cent", "释义": "分(货币单位)", "其他拼写": null, "pos": "noun"}, {"序号": 1181, "词频": 128, "单词": "analysis", "释义": "分析", "其他拼写": null, "pos": "noun"}, {"序号": 1182, "词频": 128, "单词": "outline", "释义": "轮廓、提纲", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1183, "词频": 128, "单词": "citizen", "释义": "公民", "其他拼写": null, "pos": "noun"}, {"序号": 1184, "词频": 128, "单词": "code", "释义": "代码、法典", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1185, "词频": 128, "单词": "strength", "释义": "力量", "其他拼写": null, "pos": "noun"}, {"序号": 1186, "词频": 128, "单词": "display", "释义": "陈列、显示", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1187, "词频": 128, "单词": "advanced", "释义": "高级的", "其他拼写": null, "pos": "verb"}, {"序号": 1188, "词频": 128, "单词": "son", "释义": "儿子、孩子", "其他拼写": null, "pos": "noun"}, {"序号": 1189, "词频": 127, "单词": "sun", "释义": "太阳", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1190, "词频": 127, "单词": "whom", "释义": "谁、哪个人", "其他拼写": null, "pos": "other"}, {"序号": 1191, "词频": 127, "单词": "budget", "释义": "预算、做预算", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1192, "词频": 127, "单词": "smart", "释义": "聪明的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1193, "词频": 126, "单词": "manner", "释义": "礼貌、礼仪、方式", "其他拼写": null, "pos": "noun"}, {"序号": 1194, "词频": 126, "单词": "explore", "释义": "探索", "其他拼写": null, "pos": "verb"}, {"序号": 1195, "词频": 126, "单词": "estimate", "释义": "估计", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1196, "词频": 126, "单词": "whatever", "释义": "无论什么", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1197, "词频": 126, "单词": "crop", "释义": "作物、收成", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1198, "词频": 126, "单词": "brand", "释义": "品牌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1199, "词频": 126, "单词": "launch", "释义": "发射、使船下水", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1200, "词频": 126, "单词": "agriculture", "释义": "农业", "其他拼写": null, "pos": "noun"}, {"序号": 1201, "词频": 126, "单词": "scan", "释义": "扫描", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1202, "词频": 125, "单词": "regulation", "释义": "规定", "其他拼写": null, "pos": "noun"}, {"序号": 1203, "词频": 125, "单词": "nurse", "释义": "护士、护理", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1204, "词频": 125, "单词": "expose", "释义": "暴露", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1205, "词频": 125, "单词": "being", "释义": "生物、生存", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1206, "词频": 125, "单词": "truth", "释义": "真相", "其他拼写": null, "pos": "noun"}, {"序号": 1207, "词频": 125, "单词": "distance", "释义": "距离", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1208, "词频": 125, "单词": "count", "释义": "数数", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1209, "词频": 125, "单词": "hit", "释义": "打", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1210, "词频": 125, "单词": "ticket", "释义": "票", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1211, "词频": 124, "单词": "combine", "释义": "结合", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1212, "词频": 124, "单词": "ban", "释义": "禁止", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1213, "词频": 124, "单词": "bit", "释义": "一点", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1214, "词频": 124, "单词": "impossible", "释义": "不可能的", "其他拼写": null, "pos": "noun"}, {"序号": 1215, "词频": 124, "单词": "nuclear", "释义": "原子的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1216, "词频": 123, "单词": "basis", "释义": "基础", "其他拼写": null, "pos": "noun"}, {"序号": 1217, "词频": 123, "单词": "boost", "释义": "往上推、增加", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1218, "词频": 123, "单词": "rain", "释义": "雨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1219, "词频": 123, "单词": "reserve", "释义": "预留", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1220, "词频": 123, "单词": "dog", "释义": "狗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1221, "词频": 122, "单词": "productivity", "释义": "生产力", "其他拼写": null, "pos": "noun"}, {"序号": 1222, "词频": 122, "单词": "discipline", "释义": "纪律", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1223, "词频": 122, "单词": "seat", "释义": "座位", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1224, "词频": 122, "单词": "revolution", "释义": "革命、旋转", "其他拼写": null, "pos": "noun"}, {"序号": 1225, "词频": 122, "单词": "prize", "释义": "奖", "其他拼写": "prise", "pos": "noun_verb"}, {"序号": 1226, "词频": 122, "单词": "primary", "释义": "初级的、最初的", "其他拼写": null, "pos": "noun"}, {"序号": 1227, "词频": 122, "单词": "previous", "释义": "先前的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1228, "词频": 122, "单词": "attractive", "释义": "吸引人的、动人的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1229, "词频": 122, "单词": "communicate", "释义": "传达、交流", "其他拼写": null, "pos": "verb"}, {"序号": 1230, "词频": 122, "单词": "disaster", "释义": "灾难", "其他拼写": null, "pos": "noun"}, {"序号": 1231, "词频": 121, "单词": "stock", "释义": "股票、库存", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1232, "词频": 121, "单词": "quick", "释义": "迅速的", "其他拼写": null, "pos": "noun"}, {"序号": 1233, "词频": 121, "单词": "fly", "释义": "飞", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1234, "词频": 121, "单词": "heat", "释义": "热", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1235, "词频": 121, "单词": "candidate", "释义": "候选人", "其他拼写": null, "pos": "noun"}, {"序号": 1236, "词频": 121, "单词": "identity", "释义": "身份", "其他拼写": null, "pos": "noun"}, {"序号": 1237, "词频": 121, "单词": "repair", "释义": "修理、补救", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1238, "词频": 121, "单词": "eight", "释义": "八", "其他拼写": null, "pos": "noun"}, {"序号": 1239, "词频": 121, "单词": "tear", "释义": "眼泪、撕碎", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1240, "词频": 120, "单词": "web", "释义": "网", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1241, "词频": 120, "单词": "press", "释义": "报刊、新闻界", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1242, "词频": 120, "单词": "original", "释义": "最初的", "其他拼写": null, "pos": "noun"}, {"序号": 1243, "词频": 120, "单词": "conference", "释义": "会议", "其他拼写": null, "pos": "noun"}, {"序号": 1244, "词频": 119, "单词": "spot", "释义": "发现、污点", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1245, "词频": 119, "单词": "signal", "释义": "信号", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1246, "词频": 119, "单词": "generate", "释义": "产生、引起", "其他拼写": null, "pos": "verb"}, {"序号": 1247, "词频": 119, "单词": "expectation", "释义": "预期", "其他拼写": null, "pos": "noun"}, {"序号": 1248, "词频": 119, "单词": "recession", "释义": "经济衰退、退后", "其他拼写": null, "pos": "noun"}, {"序号": 1249, "词频": 119, "单词": "clothe", "释义": "给穿衣", "其他拼写": null, "pos": "verb"}, {"序号": 1250, "词频": 119, "单词": "facility", "释义": "灵巧、天资", "其他拼写": null, "pos": "noun"}, {"序号": 1251, "词频": 118, "单词": "directly", "释义": "直接地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1252, "词频": 118, "单词": "ourselves", "释义": "我们自己、我们亲自", "其他拼写": null, "pos": "other"}, {"序号": 1253, "词频": 118, "单词": "bus", "释义": "公车", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1254, "词频": 118, "单词": "refuse", "释义": "拒绝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1255, "词频": 118, "单词": "burn", "释义": "燃烧", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1256, "词频": 118, "单词": "decrease", "释义": "减少", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1257, "词频": 118, "单词": "fat", "释义": "脂肪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1258, "词频": 118, "单词": "table", "释义": "桌子、表格", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1259, "词频": 118, "单词": "sample", "释义": "样品", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1260, "词频": 118, "单词": "gold", "释义": "金子", "其他拼写": null, "pos": "noun"}, {"序号": 1261, "词频": 117, "单词": "obtain", "释义": "获得", "其他拼写": null, "pos": "verb"}, {"序号": 1262, "词频": 117, "单词": "ahead", "释义": "在…前面", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1263, "词频": 117, "单词": "domestic", "释义": "家庭的", "其他拼写": null, "pos": "noun"}, {"序号": 1264, "词频": 117, "单词": "airport", "释义": "机场", "其他拼写": null, "pos": "noun"}, {"序号": 1265, "词频": 117, "单词": "obesity", "释义": "肥胖", "其他拼写": null, "pos": "noun"}, {"序号": 1266, "词频": 117, "单词": "guest", "释义": "客人", "其他拼写": null, "pos": "noun"}, {"序号": 1267, "词频": 116, "单词": "threaten", "释义": "威胁", "其他拼写": null, "pos": "verb"}, {"序号": 1268, "词频": 116, "单词": "fair", "释义": "公平的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1269, "词频": 116, "单词": "marry", "释义": "结婚", "其他拼写": null, "pos": "verb"}, {"序号": 1270, "词频": 116, "单词": "historical", "释义": "历史的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1271, "词频": 116, "单词": "formal", "释义": "正式的、形式的", "其他拼写": null, "pos": "noun"}, {"序号": 1272, "词频": 116, "单词": "criminal", "释义": "犯罪活动、罪犯", "其他拼写": null, "pos": "noun"}, {"序号": 1273, "词频": 116, "单词": "familiar", "释义": "熟悉的", "其他拼写": null, "pos": "noun"}, {"序号": 1274, "词频": 115, "单词": "friendly", "释义": "友好的", "其他拼写": null, "pos": "noun"}, {"序号": 1275, "词频": 115, "单词": "planet", "释义": "行星", "其他拼写": null, "pos": "noun"}, {"序号": 1276, "词频": 115, "单词": "strange", "释义": "奇怪的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1277, "词频": 115, "单词": "useful", "释义": "有用的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1278, "词频": 115, "单词": "perfect", "释义": "完美的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1279, "词频": 114, "单词": "genetic", "释义": "基因的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1280, "词频": 114, "单词": "competitive", "释义": "竞争的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1281, "词频": 114, "单词": "vast", "释义": "巨大的、大量的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1282, "词频": 114, "单词": "series", "释义": "系列", "其他拼写": null, "pos": "noun"}, {"序号": 1283, "词频": 114, "单词": "deliver", "释义": "传递、传输", "其他拼写": null, "pos": "verb"}, {"序号": 1284, "词频": 114, "单词": "equipment", "释义": "设备", "其他拼写": null, "pos": "noun"}, {"序号": 1285, "词频": 114, "单词": "visitor", "释义": "访问者", "其他拼写": null, "pos": "noun"}, {"序号": 1286, "词频": 113, "单词": "revenue", "释义": "财政收入", "其他拼写": null, "pos": "noun"}, {"序号": 1287, "词频": 113, "单词": "sector", "释义": "部分、扇区", "其他拼写": null, "pos": "noun"}, {"序号": 1288, "词频": 113, "单词": "inform", "释义": "通知、告诉", "其他拼写": null, "pos": "verb"}, {"序号": 1289, "词频": 113, "单词": "twice", "释义": "两次", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1290, "词频": 113, "单词": "thank", "释义": "感谢", "其他拼写": null, "pos": "verb"}, {"序号": 1291, "词频": 113, "单词": "illness", "释义": "疾病", "其他拼写": null, "pos": "noun"}, {"序号": 1292, "词频": 113, "单词": "altogether", "释义": "总共、完全地", "其他拼写": null, "pos": "noun"}, {"序号": 1293, "词频": 113, "单词": "welfare", "释义": "福利", "其他拼写": null, "pos": "noun"}, {"序号": 1294, "词频": 113, "单词": "blood", "释义": "血", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1295, "词频": 113, "单词": "calorie", "释义": "卡路里", "其他拼写": null, "pos": "noun"}, {"序号": 1296, "词频": 113, "单词": "herself", "释义": "她自己、她亲自", "其他拼写": null, "pos": "other"}, {"序号": 1297, "词频": 112, "单词": "intelligent", "释义": "聪明的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1298, "词频": 112, "单词": "cite", "释义": "引用", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1299, "词频": 112, "单词": "guide", "释义": "指引、指导", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1300, "词频": 112, "单词": "household", "释义": "户、家庭的", "其他拼写": null, "pos": "noun"}, {"序号": 1301, "词频": 112, "单词": "pupil", "释义": "学生、瞳孔", "其他拼写": null, "pos": "noun"}, {"序号": 1302, "词频": 111, "单词": "insurance", "释义": "保险", "其他拼写": null, "pos": "noun"}, {"序号": 1303, "词频": 111, "单词": "criticism", "释义": "批评", "其他拼写": null, "pos": "noun"}, {"序号": 1304, "词频": 111, "单词": "exchange", "释义": "交换", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1305, "词频": 111, "单词": "ship", "释义": "船舶、装运", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1306, "词频": 110, "单词": "label", "释义": "标签、加标签于", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1307, "词频": 110, "单词": "differ", "释义": "与……不同", "其他拼写": null, "pos": "verb"}, {"序号": 1308, "词频": 110, "单词": "commit", "释义": "把…交托给、犯（罪）", "其他拼写": null, "pos": "verb"}, {"序号": 1309, "词频": 110, "单词": "admit", "释义": "承认", "其他拼写": null, "pos": "verb"}, {"序号": 1310, "词频": 110, "单词": "objective", "释义": "客观的、目的", "其他拼写": null, "pos": "noun"}, {"序号": 1311, "词频": 110, "单词": "contribution", "释义": "贡献", "其他拼写": null, "pos": "noun"}, {"序号": 1312, "词频": 110, "单词": "context", "释义": "上下文、环境", "其他拼写": null, "pos": "noun"}, {"序号": 1313, "词频": 110, "单词": "complain", "释义": "抱怨", "其他拼写": null, "pos": "verb"}, {"序号": 1314, "词频": 110, "单词": "fine", "释义": "很好", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1315, "词频": 109, "单词": "church", "释义": "教堂", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1316, "词频": 109, "单词": "yield", "释义": "放弃、屈服、收益", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1317, "词频": 109, "单词": "soil", "释义": "泥土、国土", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1318, "词频": 109, "单词": "rent", "释义": "租", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1319, "词频": 109, "单词": "video", "释义": "录像", "其他拼写": null, "pos": "noun"}, {"序号": 1320, "词频": 109, "单词": "brother", "释义": "兄弟", "其他拼写": null, "pos": "noun"}, {"序号": 1321, "词频": 108, "单词": "capital", "释义": "首都、大写字母", "其他拼写": null, "pos": "noun"}, {"序号": 1322, "词频": 108, "单词": "circumstance", "释义": "情况", "其他拼写": null, "pos": "noun"}, {"序号": 1323, "词频": 108, "单词": "illustrate", "释义": "说明、加插图", "其他拼写": null, "pos": "verb"}, {"序号": 1324, "词频": 108, "单词": "target", "释义": "目标", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1325, "词频": 108, "单词": "pretty", "释义": "漂亮的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1326, "词频": 108, "单词": "active", "释义": "活跃的、积极的", "其他拼写": null, "pos": "noun"}, {"序号": 1327, "词频": 108, "单词": "schedule", "释义": "日程", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1328, "词频": 108, "单词": "window", "释义": "窗户", "其他拼写": null, "pos": "noun"}, {"序号": 1329, "词频": 107, "单词": "alter", "释义": "改变", "其他拼写": null, "pos": "verb"}, {"序号": 1330, "词频": 107, "单词": "sensitive", "释义": "敏感的、易受伤害的", "其他拼写": null, "pos": "noun"}, {"序号": 1331, "词频": 107, "单词": "gather", "释义": "聚集、搜集", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1332, "词频": 106, "单词": "requirement", "释义": "要求", "其他拼写": null, "pos": "noun"}, {"序号": 1333, "词频": 106, "单词": "critic", "释义": "批评者", "其他拼写": null, "pos": "noun"}, {"序号": 1334, "词频": 106, "单词": "property", "释义": "财产、性质、特性", "其他拼写": null, "pos": "noun"}, {"序号": 1335, "词频": 106, "单词": "eliminate", "释义": "排除、淘汰", "其他拼写": null, "pos": "verb"}, {"序号": 1336, "词频": 106, "单词": "artificial", "释义": "人造的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1337, "词频": 106, "单词": "engineer", "释义": "工程师", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1338, "词频": 106, "单词": "neither", "释义": "两个都不", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1339, "词频": 106, "单词": "busy", "释义": "忙碌的", "其他拼写": null, "pos": "verb"}, {"序号": 1340, "词频": 106, "单词": "touch", "释义": "触摸、感动", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1341, "词频": 106, "单词": "appearance", "释义": "出现、外表", "其他拼写": null, "pos": "noun"}, {"序号": 1342, "词频": 106, "单词": "engineering", "释义": "工程学", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1343, "词频": 106, "单词": "teenager", "释义": "青少年", "其他拼写": null, "pos": "noun"}, {"序号": 1344, "词频": 106, "单词": "rank", "释义": "排列、等级", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1345, "词频": 105, "单词": "cure", "释义": "治愈", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1346, "词频": 105, "单词": "secretary", "释义": "秘书", "其他拼写": null, "pos": "noun"}, {"序号": 1347, "词频": 105, "单词": "circle", "释义": "圆", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1348, "词频": 105, "单词": "welcome", "释义": "欢迎", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1349, "词频": 105, "单词": "switch", "释义": "开关、改变", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1350, "词频": 105, "单词": "complaint", "释义": "抱怨、疾病", "其他拼写": null, "pos": "noun"}, {"序号": 1351, "词频": 104, "单词": "interpret", "释义": "口译、解释", "其他拼写": null, "pos": "verb"}, {"序号": 1352, "词频": 104, "单词": "lawyer", "释义": "律师", "其他拼写": null, "pos": "noun"}, {"序号": 1353, "词频": 104, "单词": "nowadays", "释义": "现今", "其他拼写": null, "pos": "noun"}, {"序号": 1354, "词频": 104, "单词": "priority", "释义": "优先", "其他拼写": null, "pos": "noun"}, {"序号": 1355, "词频": 104, "单词": "military", "释义": "军事的、军队", "其他拼写": null, "pos": "noun"}, {"序号": 1356, "词频": 104, "单词": "cope", "释义": "处理、应对", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1357, "词频": 104, "单词": "propose", "释义": "提议、提名", "其他拼写": null, "pos": "verb"}, {"序号": 1358, "词频": 104, "单词": "relative", "释义": "亲戚、比较的", "其他拼写": null, "pos": "noun"}, {"序号": 1359, "词频": 104, "单词": "sex", "释义": "性", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1360, "词频": 104, "单词": "pull", "释义": "拉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1361, "词频": 104, "单词": "fresh", "释义": "新鲜的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1362, "词频": 104, "单词": "crowd", "释义": "聚集、挤满", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1363, "词频": 103, "单词": "prospect", "释义": "景色、前景", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1364, "词频": 103, "单词": "payment", "释义": "支付", "其他拼写": null, "pos": "noun"}, {"序号": 1365, "词频": 103, "单词": "technical", "释义": "技术的", "其他拼写": null, "pos": "noun"}, {"序号": 1366, "词频": 103, "单词": "fish", "释义": "鱼", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1367, "词频": 103, "单词": "birth", "释义": "出生", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1368, "词频": 103, "单词": "anxiety", "释义": "焦虑", "其他拼写": null, "pos": "noun"}, {"序号": 1369, "词频": 103, "单词": "routine", "释义": "常规、惯例", "其他拼写": null, "pos": "noun"}, {"序号": 1370, "词频": 103, "单词": "psychology", "释义": "心理学", "其他拼写": null, "pos": "noun"}, {"序号": 1371, "词频": 103, "单词": "abroad", "释义": "到国外、广为流传", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1372, "词频": 103, "单词": "feed", "释义": "喂食", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1373, "词频": 103, "单词": "talent", "释义": "才华、人才", "其他拼写": null, "pos": "noun"}, {"序号": 1374, "词频": 103, "单词": "fiction", "释义": "虚构、小说", "其他拼写": null, "pos": "noun"}, {"序号": 1375, "词频": 103, "单词": "plane", "释义": "飞机", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1376, "词频": 103, "单词": "afternoon", "释义": "下午", "其他拼写": null, "pos": "noun"}, {"序号": 1377, "词频": 103, "单词": "shoe", "释义": "鞋子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1378, "词频": 102, "单词": "humanity", "释义": "人文、人性", "其他拼写": null, "pos": "noun"}, {"序号": 1379, "词频": 102, "单词": "preserve", "释义": "保护、保存", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1380, "词频": 102, "单词": "explanation", "释义": "解释", "其他拼写": null, "pos": "noun"}, {"序号": 1381, "词频": 102, "单词": "flow", "释义": "流动", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1382, "词频": 102, "单词": "technique", "释义": "技术", "其他拼写": null, "pos": "noun"}, {"序号": 1383, "词频": 102, "单词": "wake", "释义": "醒来", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1384, "词频": 102, "单词": "hurt", "释义": "伤害", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1385, "词频": 102, "单词": "consist", "释义": "组成、在于", "其他拼写": null, "pos": "verb"}, {"序号": 1386, "词频": 102, "单词": "master", "释义": "主人、精通、掌握", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1387, "词频": 101, "单词": "smile", "释义": "笑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1388, "词频": 101, "单词": "convince", "释义": "使人信服", "其他拼写": null, "pos": "verb"}, {"序号": 1389, "词频": 101, "单词": "delay", "释义": "推迟", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1390, "词频": 101, "单词": "broad", "释义": "宽的", "其他拼写": null, "pos": "noun"}, {"序号": 1391, "词频": 101, "单词": "sufficient", "释义": "足够的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1392, "词频": 101, "单词": "mostly", "释义": "大部分", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1393, "词频": 101, "单词": "unlike", "释义": "不同的、不像", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1394, "词频": 101, "单词": "destroy", "释义": "摧毁", "其他拼写": null, "pos": "verb"}, {"序号": 1395, "词频": 101, "单词": "meat", "释义": "肉类", "其他拼写": null, "pos": "noun"}, {"序号": 1396, "词频": 101, "单词": "wage", "释义": "工资、发动", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1397, "词频": 101, "单词": "vision", "释义": "视力、想象", "其他拼写": null, "pos": "noun"}, {"序号": 1398, "词频": 101, "单词": "wealthy", "释义": "富裕的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1399, "词频": 101, "单词": "exhibit", "释义": "展览", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1400, "词频": 101, "单词": "block", "释义": "块、阻止、街区", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1401, "词频": 101, "单词": "blue", "释义": "蓝色的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1402, "词频": 100, "单词": "blame", "释义": "责备", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1403, "词频": 100, "单词": "proper", "释义": "正确的、适当的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1404, "词频": 100, "单词": "invest", "释义": "投资", "其他拼写": null, "pos": "verb"}, {"序号": 1405, "词频": 100, "单词": "tough", "释义": "艰难的", "其他拼写": null, "pos": "noun"}, {"序号": 1406, "词频": 100, "单词": "star", "释义": "星、恒星", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1407, "词频": 100, "单词": "actual", "释义": "实在的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1408, "词频": 100, "单词": "grammar", "释义": "语法", "其他拼写": null, "pos": "noun"}, {"序号": 1409, "词频": 100, "单词": "peace", "释义": "和平", "其他拼写": null, "pos": "noun"}, {"序号": 1410, "词频": 99, "单词": "otherwise", "释义": "否则", "其他拼写": "otherwize", "pos": "adj_adv"}, {"序号": 1411, "词频": 99, "单词": "emphasis", "释义": "强调", "其他拼写": null, "pos": "noun"}, {"序号": 1412, "词频": 99, "单词": "efficient", "释义": "有效的、能胜任的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1413, "词频": 99, "单词": "survival", "释义": "幸存", "其他拼写": null, "pos": "noun"}, {"序号": 1414, "词频": 99, "单词": "escape", "释义": "逃跑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1415, "词频": 99, "单词": "import", "释义": "进口、进口商品", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1416, "词频": 99, "单词": "club", "释义": "俱乐部", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1417, "词频": 99, "单词": "red", "释义": "红色的", "其他拼写": null, "pos": "noun"}, {"序号": 1418, "词频": 98, "单词": "invention", "释义": "发明", "其他拼写": null, "pos": "noun"}, {"序号": 1419, "词频": 98, "单词": "discovery", "释义": "发现", "其他拼写": null, "pos": "noun"}, {"序号": 1420, "词频": 98, "单词": "agent", "释义": "代理", "其他拼写": null, "pos": "noun"}, {"序号": 1421, "词频": 98, "单词": "dominate", "释义": "支配、占优势", "其他拼写": null, "pos": "verb"}, {"序号": 1422, "词频": 98, "单词": "pace", "释义": "速度、行进", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1423, "词频": 98, "单词": "element", "释义": "元素、要素", "其他拼写": null, "pos": "noun"}, {"序号": 1424, "词频": 98, "单词": "impose", "释义": "把……强加于", "其他拼写": null, "pos": "verb"}, {"序号": 1425, "词频": 98, "单词": "vote", "释义": "投票、选票", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1426, "词频": 98, "单词": "yes", "释义": "是", "其他拼写": null, "pos": "noun"}, {"序号": 1427, "词频": 98, "单词": "narrow", "释义": "狭窄的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1428, "词频": 98, "单词": "transfer", "释义": "转移、传输", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1429, "词频": 98, "单词": "copy", "释义": "复制", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1430, "词频": 98, "单词": "vary", "释义": "改变", "其他拼写": null, "pos": "verb"}, {"序号": 1431, "词频": 98, "单词": "participate", "释义": "参与、分享", "其他拼写": null, "pos": "verb"}, {"序号": 1432, "词频": 98, "单词": "advise", "释义": "劝告、建议", "其他拼写": "advize", "pos": "verb"}, {"序号": 1433, "词频": 98, "单词": "loan", "释义": "贷款、借出", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1434, "词频": 97, "单词": "demonstrate", "释义": "论证、说明", "其他拼写": null, "pos": "verb"}, {"序号": 1435, "词频": 97, "单词": "fundamental", "释义": "基础的、根本的", "其他拼写": null, "pos": "noun"}, {"序号": 1436, "词频": 97, "单词": "origin", "释义": "起源", "其他拼写": null, "pos": "noun"}, {"序号": 1437, "词频": 97, "单词": "recommend", "释义": "推荐", "其他拼写": null, "pos": "verb"}, {"序号": 1438, "词频": 97, "单词": "valuable", "释义": "有价值的、贵重的", "其他拼写": null, "pos": "noun"}, {"序号": 1439, "词频": 97, "单词": "addition", "释义": "加", "其他拼写": null, "pos": "noun"}, {"序号": 1440, "词频": 97, "单词": "contract", "释义": "合同、缩小", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1441, "词频": 97, "单词": "description", "释义": "描述", "其他拼写": null, "pos": "noun"}, {"序号": 1442, "词频": 97, "单词": "alcohol", "释义": "酒精", "其他拼写": null, "pos": "noun"}, {"序号": 1443, "词频": 97, "单词": "district", "释义": "地区", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1444, "词频": 97, "单词": "dry", "释义": "干燥的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1445, "词频": 97, "单词": "evening", "释义": "傍晚", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1446, "词频": 97, "单词": "breakfast", "释义": "早饭", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1447, "词频": 96, "单词": "gene", "释义": "基因", "其他拼写": null, "pos": "noun"}, {"序号": 1448, "词频": 96, "单词": "wave", "释义": "招手", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1449, "词频": 96, "单词": "moreover", "释义": "而且、此外", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1450, "词频": 96, "单词": "capable", "释义": "有能力的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1451, "词频": 96, "单词": "ordinary", "释义": "普通的", "其他拼写": null, "pos": "noun"}, {"序号": 1452, "词频": 96, "单词": "strengthen", "释义": "加强", "其他拼写": null, "pos": "verb"}, {"序号": 1453, "词频": 96, "单词": "suggestion", "释义": "建议", "其他拼写": null, "pos": "noun"}, {"序号": 1454, "词频": 96, "单词": "cash", "释义": "现金", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1455, "词频": 96, "单词": "secret", "释义": "秘密", "其他拼写": null, "pos": "noun"}, {"序号": 1456, "词频": 96, "单词": "quarter", "释义": "四分之一、季度", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1457, "词频": 96, "单词": "thought", "释义": "思想、想法", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1458, "词频": 96, "单词": "persuade", "释义": "说服", "其他拼写": null, "pos": "verb"}, {"序号": 1459, "词频": 96, "单词": "software", "释义": "软件", "其他拼写": null, "pos": "noun"}, {"序号": 1460, "词频": 96, "单词": "afraid", "释义": "害怕的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1461, "词频": 96, "单词": "steal", "释义": "偷", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1462, "词频": 95, "单词": "evolution", "释义": "进化", "其他拼写": null, "pos": "noun"}, {"序号": 1463, "词频": 95, "单词": "corporation", "释义": "公司、法人", "其他拼写": null, "pos": "noun"}, {"序号": 1464, "词频": 95, "单词": "homework", "释义": "作业", "其他拼写": null, "pos": "noun"}, {"序号": 1465, "词频": 95, "单词": "sight", "释义": "视野、景象", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1466, "词频": 95, "单词": "athlete", "释义": "运动员", "其他拼写": null, "pos": "noun"}, {"序号": 1467, "词频": 95, "单词": "outcome", "释义": "结果", "其他拼写": null, "pos": "noun"}, {"序号": 1468, "词频": 95, "单词": "surface", "释义": "表面", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1469, "词频": 95, "单词": "apart", "释义": "相隔、分开", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1470, "词频": 95, "单词": "pleasure", "释义": "愉快、乐事", "其他拼写": null, "pos": "noun"}, {"序号": 1471, "词频": 95, "单词": "entry", "释义": "进入", "其他拼写": null, "pos": "noun"}, {"序号": 1472, "词频": 94, "单词": "justice", "释义": "公平、审判", "其他拼写": null, "pos": "noun"}, {"序号": 1473, "词频": 94, "单词": "electricity", "释义": "电、电学", "其他拼写": null, "pos": "noun"}, {"序号": 1474, "词频": 94, "单词": "notice", "释义": "注意、通知", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1475, "词频": 94, "单词": "final", "释义": "最终的", "其他拼写": null, "pos": "noun"}, {"序号": 1476, "词频": 94, "单词": "rarely", "释义": "罕见地、几乎不", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1477, "词频": 94, "单词": "privacy", "释义": "隐私", "其他拼写": null, "pos": "noun"}, {"序号": 1478, "词频": 94, "单词": "email", "释义": "电子邮件", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1479, "词频": 94, "单词": "cycle", "释义": "骑自行车、周期", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1480, "词频": 94, "单词": "satellite", "释义": "卫星", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1481, "词频": 94, "单词": "burden", "释义": "负担", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1482, "词频": 94, "单词": "king", "释义": "君主", "其他拼写": null, "pos": "noun"}, {"序号": 1483, "词频": 94, "单词": "salary", "释义": "薪水", "其他拼写": null, "pos": "noun"}, {"序号": 1484, "词频": 94, "单词": "mountain", "释义": "山", "其他拼写": null, "pos": "noun"}, {"序号": 1485, "词频": 93, "单词": "religious", "释义": "宗教的、虔诚的", "其他拼写": null, "pos": "noun"}, {"序号": 1486, "词频": 93, "单词": "guarantee", "释义": "保障", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1487, "词频": 93, "单词": "annual", "释义": "每年的、全年的", "其他拼写": null, "pos": "noun"}, {"序号": 1488, "词频": 93, "单词": "ease", "释义": "减轻", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1489, "词频": 93, "单词": "telephone", "释义": "电话、打电话", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1490, "词频": 93, "单词": "garden", "释义": "花园、园艺", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1491, "词频": 93, "单词": "comfort", "释义": "舒适、安慰", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1492, "词频": 93, "单词": "request", "释义": "请求", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1493, "词频": 93, "单词": "foundation", "释义": "基础、地基", "其他拼写": null, "pos": "noun"}, {"序号": 1494, "词频": 93, "单词": "lunch", "释义": "午饭", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1495, "词频": 93, "单词": "engine", "释义": "引擎", "其他拼写": null, "pos": "noun"}, {"序号": 1496, "词频": 93, "单词": "symbol", "释义": "符号、象征", "其他拼写": null, "pos": "noun"}, {"序号": 1497, "词频": 93, "单词": "earthquake", "释义": "地震", "其他拼写": null, "pos": "noun"}, {"序号": 1498, "词频": 92, "单词": "arise", "释义": "形成、上升", "其他拼写": "arize", "pos": "verb"}, {"序号": 1499, "词频": 92, "单词": "partly", "释义": "部分地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1500, "词频": 92, "单词": "existence", "释义": "存在", "其他拼写": null, "pos": "noun"}, {"序号": 1501, "词频": 92, "单词": "rapid", "释义": "快的", "其他拼写": null, "pos": "noun"}, {"序号": 1502, "词频": 92, "单词": "willing", "释义": "情愿的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1503, "词频": 92, "单词": "curiosity", "释义": "好奇心", "其他拼写": null, "pos": "noun"}, {"序号": 1504, "词频": 92, "单词": "childhood", "释义": "幼年", "其他拼写": null, "pos": "noun"}, {"序号": 1505, "词频": 92, "单词": "tie", "释义": "系", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1506, "词频": 92, "单词": "climb", "释义": "攀爬", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1507, "词频": 91, "单词": "net", "释义": "网、净的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1508, "词频": 91, "单词": "none", "释义": "没有", "其他拼写": null, "pos": "noun"}, {"序号": 1509, "词频": 91, "单词": "widespread", "释义": "遍布的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1510, "词频": 91, "单词": "stem", "释义": "茎、词干", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1511, "词频": 91, "单词": "abandon", "释义": "抛弃", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1512, "词频": 91, "单词": "pound", "释义": "英镑、磅", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1513, "词频": 91, "单词": "custom", "释义": "习惯、惠顾", "其他拼写": null, "pos": "noun"}, {"序号": 1514, "词频": 91, "单词": "fee", "释义": "费用", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1515, "词频": 91, "单词": "island", "释义": "岛", "其他拼写": null, "pos": "noun"}, {"序号": 1516, "词频": 90, "单词": "suitable", "释义": "合适的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1517, "词频": 90, "单词": "favor", "释义": "喜欢、赞同", "其他拼写": "favour", "pos": "noun_verb"}, {"序号": 1518, "词频": 90, "单词": "secure", "释义": "使安全、争取到", "其他拼写": null, "pos": "verb"}, {"序号": 1519, "词频": 90, "单词": "presence", "释义": "出席、存在", "其他拼写": null, "pos": "noun"}, {"序号": 1520, "词频": 90, "单词": "transport", "释义": "运输", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1521, "词频": 90, "单词": "independent", "释义": "独立的、私营的", "其他拼写": null, "pos": "noun"}, {"序号": 1522, "词频": 90, "单词": "notion", "释义": "概念、见解、打算", "其他拼写": null, "pos": "noun"}, {"序号": 1523, "词频": 90, "单词": "distinguish", "释义": "区别、使有特色", "其他拼写": null, "pos": "verb"}, {"序号": 1524, "词频": 90, "单词": "collection", "释义": "收藏", "其他拼写": null, "pos": "noun"}, {"序号": 1525, "词频": 90, "单词": "perspective", "释义": "观点、判断力", "其他拼写": null, "pos": "noun"}, {"序号": 1526, "词频": 90, "单词": "careful", "释义": "小心的、细致的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1527, "词频": 90, "单词": "toy", "释义": "玩具", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1528, "词频": 90, "单词": "friendship", "释义": "友谊", "其他拼写": null, "pos": "noun"}, {"序号": 1529, "词频": 90, "单词": "throw", "释义": "扔", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1530, "词频": 89, "单词": "ambition", "释义": "雄心、志向", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1531, "词频": 89, "单词": "giant", "释义": "巨人、巨大的", "其他拼写": null, "pos": "noun"}, {"序号": 1532, "词频": 89, "单词": "definition", "释义": "定义、清晰度", "其他拼写": null, "pos": "noun"}, {"序号": 1533, "词频": 89, "单词": "height", "释义": "高度、身高", "其他拼写": null, "pos": "noun"}, {"序号": 1534, "词频": 89, "单词": "reject", "释义": "拒绝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1535, "词频": 89, "单词": "disappear", "释义": "消失", "其他拼写": null, "pos": "verb"}, {"序号": 1536, "词频": 89, "单词": "typical", "释义": "典型的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1537, "词频": 89, "单词": "dark", "释义": "黑暗的、深色的", "其他拼写": null, "pos": "noun"}, {"序号": 1538, "词频": 89, "单词": "suit", "释义": "适合", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1539, "词频": 89, "单词": "quit", "释义": "退出", "其他拼写": null, "pos": "verb"}, {"序号": 1540, "词频": 89, "单词": "leadership", "释义": "领导", "其他拼写": null, "pos": "noun"}, {"序号": 1541, "词频": 89, "单词": "behave", "释义": "表现", "其他拼写": null, "pos": "verb"}, {"序号": 1542, "词频": 89, "单词": "inspire", "释义": "激发", "其他拼写": null, "pos": "verb"}, {"序号": 1543, "词频": 89, "单词": "youth", "释义": "青春、年轻人", "其他拼写": null, "pos": "noun"}, {"序号": 1544, "词频": 89, "单词": "violence", "释义": "暴力、狂热", "其他拼写": null, "pos": "noun"}, {"序号": 1545, "词频": 89, "单词": "monitor", "释义": "监视器", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1546, "词频": 89, "单词": "kitchen", "释义": "厨房", "其他拼写": null, "pos": "noun"}, {"序号": 1547, "词频": 88, "单词": "phenomenon", "释义": "现象", "其他拼写": null, "pos": "noun"}, {"序号": 1548, "词频": 88, "单词": "physician", "释义": "医师", "其他拼写": null, "pos": "noun"}, {"序号": 1549, "词频": 88, "单词": "actor", "释义": "男演员", "其他拼写": null, "pos": "noun"}, {"序号": 1550, "词频": 88, "单词": "extent", "释义": "程度、范围", "其他拼写": null, "pos": "noun"}, {"序号": 1551, "词频": 88, "单词": "jump", "释义": "跳", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1552, "词频": 88, "单词": "proportion", "释义": "部分、比例", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1553, "词频": 88, "单词": "egg", "释义": "蛋、卵", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1554, "词频": 88, "单词": "pursue", "释义": "追求", "其他拼写": null, "pos": "verb"}, {"序号": 1555, "词频": 88, "单词": "complicated", "释义": "错综复杂的", "其他拼写": null, "pos": "verb"}, {"序号": 1556, "词频": 87, "单词": "bracket", "释义": "括号", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1557, "词频": 87, "单词": "solar", "释义": "太阳能的、太阳的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1558, "词频": 87, "单词": "duty", "释义": "责任", "其他拼写": null, "pos": "noun"}, {"序号": 1559, "词频": 87, "单词": "recall", "释义": "回忆、召回", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1560, "词频": 87, "单词": "winter", "释义": "冬季", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1561, "词频": 87, "单词": "assistant", "释义": "助手", "其他拼写": null, "pos": "noun"}, {"序号": 1562, "词频": 87, "单词": "coffee", "释义": "咖啡", "其他拼写": null, "pos": "noun"}, {"序号": 1563, "词频": 87, "单词": "overseas", "释义": "外国的、在海外", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1564, "词频": 87, "单词": "crash", "释义": "碰撞", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1565, "词频": 87, "单词": "river", "释义": "河流", "其他拼写": null, "pos": "noun"}, {"序号": 1566, "词频": 87, "单词": "weekend", "释义": "周末", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1567, "词频": 86, "单词": "administration", "释义": "管理、政府", "其他拼写": null, "pos": "noun"}, {"序号": 1568, "词频": 86, "单词": "excessive", "释义": "过多的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1569, "词频": 86, "单词": "path", "释义": "小道", "其他拼写": null, "pos": "noun"}, {"序号": 1570, "词频": 86, "单词": "productive", "释义": "盛产的、富有成效的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1571, "词频": 86, "单词": "enormous", "释义": "巨大的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1572, "词频": 86, "单词": "conservation", "释义": "保护、保存", "其他拼写": null, "pos": "noun"}, {"序号": 1573, "词频": 86, "单词": "urge", "释义": "催促、敦促", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1574, "词频": 86, "单词": "concentrate", "释义": "集中", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1575, "词频": 86, "单词": "impression", "释义": "印象", "其他拼写": null, "pos": "noun"}, {"序号": 1576, "词频": 86, "单词": "worldwide", "释义": "全世界的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1577, "词频": 85, "单词": "liberal", "释义": "不严格的、自由的", "其他拼写": null, "pos": "noun"}, {"序号": 1578, "词频": 85, "单词": "immediate", "释义": "立即的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1579, "词频": 85, "单词": "retire", "释义": "退休", "其他拼写": null, "pos": "verb"}, {"序号": 1580, "词频": 85, "单词": "bed", "释义": "床", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1581, "词频": 85, "单词": "daughter", "释义": "女儿", "其他拼写": null, "pos": "noun"}, {"序号": 1582, "词频": 84, "单词": "substance", "释义": "物质", "其他拼写": null, "pos": "noun"}, {"序号": 1583, "词频": 84, "单词": "clone", "释义": "克隆", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1584, "词频": 84, "单词": "commission", "释义": "委员会、委托", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1585, "词频": 84, "单词": "settle", "释义": "解决、定居", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1586, "词频": 84, "单词": "insist", "释义": "坚持", "其他拼写": null, "pos": "verb"}, {"序号": 1587, "词频": 84, "单词": "editor", "释义": "编辑", "其他拼写": null, "pos": "noun"}, {"序号": 1588, "词频": 84, "单词": "scholar", "释义": "学者", "其他拼写": null, "pos": "noun"}, {"序号": 1589, "词频": 84, "单词": "institute", "释义": "机构、建立", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1590, "词频": 84, "单词": "unusual", "释义": "不平常的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1591, "词频": 84, "单词": "rare", "释义": "稀少的、稀薄的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1592, "词频": 84, "单词": "fun", "释义": "快乐", "其他拼写": null, "pos": "noun"}, {"序号": 1593, "词频": 84, "单词": "nine", "释义": "九", "其他拼写": null, "pos": "noun"}, {"序号": 1594, "词频": 84, "单词": "client", "释义": "顾客、委托人", "其他拼写": null, "pos": "noun"}, {"序号": 1595, "词频": 84, "单词": "saving", "释义": "节省、储蓄金", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1596, "词频": 84, "单词": "quiet", "释义": "安静的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1597, "词频": 84, "单词": "cognitive", "释义": "认知的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1598, "词频": 83, "单词": "smell", "释义": "闻", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1599, "词频": 83, "单词": "additional", "释义": "附加的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1600, "词频": 83, "单词": "plastic", "释义": "塑料、可塑的", "其他拼写": null, "pos": "noun"}, {"序号": 1601, "词频": 83, "单词": "officer", "释义": "官员、军官", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1602, "词频": 83, "单词": "wisdom", "释义": "智慧", "其他拼写": null, "pos": "noun"}, {"序号": 1603, "词频": 83, "单词": "mobile", "释义": "移动的", "其他拼写": null, "pos": "noun"}, {"序号": 1604, "词频": 83, "单词": "mood", "释义": "情绪、心情", "其他拼写": null, "pos": "noun"}, {"序号": 1605, "词频": 83, "单词": "symptom", "释义": "症状", "其他拼写": null, "pos": "noun"}, {"序号": 1606, "词频": 83, "单词": "indifferent", "释义": "漠不关心的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1607, "词频": 82, "单词": "neglect", "释义": "忽视、疏忽", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1608, "词频": 82, "单词": "transform", "释义": "改变", "其他拼写": null, "pos": "verb"}, {"序号": 1609, "词频": 82, "单词": "bright", "释义": "明亮的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1610, "词频": 82, "单词": "recovery", "释义": "恢复、重获", "其他拼写": null, "pos": "noun"}, {"序号": 1611, "词频": 82, "单词": "reputation", "释义": "名誉", "其他拼写": null, "pos": "noun"}, {"序号": 1612, "词频": 82, "单词": "fault", "释义": "错误", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1613, "词频": 81, "单词": "inflation", "释义": "通货膨胀", "其他拼写": null, "pos": "noun"}, {"序号": 1614, "词频": 81, "单词": "atmosphere", "释义": "气氛", "其他拼写": null, "pos": "noun"}, {"序号": 1615, "词频": 81, "单词": "religion", "释义": "宗教、信念", "其他拼写": null, "pos": "noun"}, {"序号": 1616, "词频": 81, "单词": "root", "释义": "根、根本", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1617, "词频": 81, "单词": "severe", "释义": "严重的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1618, "词频": 81, "单词": "deny", "释义": "否定", "其他拼写": null, "pos": "verb"}, {"序号": 1619, "词频": 81, "单词": "assess", "释义": "评估", "其他拼写": null, "pos": "verb"}, {"序号": 1620, "词频": 81, "单词": "extreme", "释义": "极端", "其他拼写": null, "pos": "noun"}, {"序号": 1621, "词频": 81, "单词": "introduction", "释义": "介绍、传入", "其他拼写": null, "pos": "noun"}, {"序号": 1622, "词频": 81, "单词": "seldom", "释义": "很少的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1623, "词频": 81, "单词": "tip", "释义": "末端、小费、提示", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1624, "词频": 81, "单词": "minority", "释义": "少数", "其他拼写": null, "pos": "noun"}, {"序号": 1625, "词频": 80, "单词": "relevant", "释义": "相关的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1626, "词频": 80, "单词": "cool", "释义": "酷、使冷静", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1627, "词频": 80, "单词": "deserve", "释义": "值得、应得", "其他拼写": null, "pos": "verb"}, {"序号": 1628, "词频": 80, "单词": "repeat", "释义": "重复", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1629, "词频": 80, "单词": "politician", "释义": "政治家", "其他拼写": null, "pos": "noun"}, {"序号": 1630, "词频": 80, "单词": "pose", "释义": "摆姿势、造成、提出", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1631, "词频": 80, "单词": "chair", "释义": "主席、椅子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1632, "词频": 80, "单词": "beautiful", "释义": "美好的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1633, "词频": 80, "单词": "organic", "释义": "器官的、有机物的", "其他拼写": null, "pos": "noun"}, {"序号": 1634, "词频": 80, "单词": "vital", "释义": "重要的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1635, "词频": 80, "单词": "alternative", "释义": "备选的", "其他拼写": null, "pos": "noun"}, {"序号": 1636, "词频": 80, "单词": "cancel", "释义": "取消", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1637, "词频": 80, "单词": "depth", "释义": "深度", "其他拼写": null, "pos": "noun"}, {"序号": 1638, "词频": 80, "单词": "protein", "释义": "蛋白质", "其他拼写": null, "pos": "noun"}, {"序号": 1639, "词频": 79, "单词": "profession", "释义": "职业", "其他拼写": null, "pos": "noun"}, {"序号": 1640, "词频": 79, "单词": "specialist", "释义": "专家", "其他拼写": null, "pos": "noun"}, {"序号": 1641, "词频": 79, "单词": "mere", "释义": "仅仅的", "其他拼写": null, "pos": "noun"}, {"序号": 1642, "词频": 79, "单词": "opposite", "释义": "相反的、对立面", "其他拼写": null, "pos": "noun"}, {"序号": 1643, "词频": 79, "单词": "possess", "释义": "拥有、具有", "其他拼写": null, "pos": "verb"}, {"序号": 1644, "词频": 79, "单词": "recognition", "释义": "认出、承认", "其他拼写": null, "pos": "noun"}, {"序号": 1645, "词频": 79, "单词": "attribute", "释义": "属性", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1646, "词频": 79, "单词": "chain", "释义": "链", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1647, "词频": 79, "单词": "remote", "释义": "遥远的", "其他拼写": null, "pos": "noun"}, {"序号": 1648, "词频": 79, "单词": "tomorrow", "释义": "明天、来日", "其他拼写": null, "pos": "noun"}, {"序号": 1649, "词频": 78, "单词": "continent", "释义": "洲、大陆", "其他拼写": null, "pos": "noun"}, {"序号": 1650, "词频": 78, "单词": "reduction", "释义": "减少、降低", "其他拼写": null, "pos": "noun"}, {"序号": 1651, "词频": 78, "单词": "everyday", "释义": "每日的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1652, "词频": 78, "单词": "percentage", "释义": "百分比", "其他拼写": null, "pos": "noun"}, {"序号": 1653, "词频": 78, "单词": "version", "释义": "版本", "其他拼写": null, "pos": "noun"}, {"序号": 1654, "词频": 78, "单词": "dramatic", "释义": "戏剧性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1655, "词频": 78, "单词": "stimulate", "释义": "刺激、使兴奋", "其他拼写": null, "pos": "verb"}, {"序号": 1656, "词频": 78, "单词": "arrange", "释义": "安排", "其他拼写": null, "pos": "verb"}, {"序号": 1657, "词频": 78, "单词": "faculty", "释义": "能力、院系", "其他拼写": null, "pos": "noun"}, {"序号": 1658, "词频": 78, "单词": "praise", "释义": "赞美、表扬", "其他拼写": "praize", "pos": "noun_verb"}, {"序号": 1659, "词频": 78, "单词": "volunteer", "释义": "志愿者", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1660, "词频": 78, "单词": "stone", "释义": "石头", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1661, "词频": 78, "单词": "chapter", "释义": "章节", "其他拼写": null, "pos": "noun"}, {"序号": 1662, "词频": 77, "单词": "meanwhile", "释义": "与此同时", "其他拼写": null, "pos": "noun"}, {"序号": 1663, "词频": 77, "单词": "perceive", "释义": "察觉、理解", "其他拼写": null, "pos": "verb"}, {"序号": 1664, "词频": 77, "单词": "merely", "释义": "仅仅", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1665, "词频": 77, "单词": "absorb", "释义": "吸收", "其他拼写": null, "pos": "verb"}, {"序号": 1666, "词频": 77, "单词": "belong", "释义": "属于", "其他拼写": null, "pos": "verb"}, {"序号": 1667, "词频": 77, "单词": "weak", "释义": "弱的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1668, "词频": 77, "单词": "affair", "释义": "事情、事务", "其他拼写": null, "pos": "noun"}, {"序号": 1669, "词频": 77, "单词": "undergraduate", "释义": "本科的、本科生", "其他拼写": null, "pos": "noun"}, {"序号": 1670, "词频": 77, "单词": "assign", "释义": "分配、指定", "其他拼写": null, "pos": "verb"}, {"序号": 1671, "词频": 77, "单词": "mission", "释义": "任务、使命", "其他拼写": null, "pos": "noun"}, {"序号": 1672, "词频": 77, "单词": "joy", "释义": "欢乐", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1673, "词频": 77, "单词": "highway", "释义": "公路", "其他拼写": null, "pos": "noun"}, {"序号": 1674, "词频": 76, "单词": "publication", "释义": "公布、出版", "其他拼写": null, "pos": "noun"}, {"序号": 1675, "词频": 76, "单词": "poetry", "释义": "诗歌", "其他拼写": null, "pos": "noun"}, {"序号": 1676, "词频": 76, "单词": "usual", "释义": "通常的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1677, "词频": 76, "单词": "necessity", "释义": "必要、必然性", "其他拼写": null, "pos": "noun"}, {"序号": 1678, "词频": 76, "单词": "adjust", "释义": "调整", "其他拼写": null, "pos": "verb"}, {"序号": 1679, "词频": 76, "单词": "announce", "释义": "宣布", "其他拼写": null, "pos": "verb"}, {"序号": 1680, "词频": 76, "单词": "exposure", "释义": "暴露、揭发", "其他拼写": null, "pos": "noun"}, {"序号": 1681, "词频": 76, "单词": "acknowledge", "释义": "承认", "其他拼写": null, "pos": "verb"}, {"序号": 1682, "词频": 76, "单词": "imagination", "释义": "想象", "其他拼写": null, "pos": "noun"}, {"序号": 1683, "词频": 76, "单词": "locate", "释义": "指出、位于", "其他拼写": null, "pos": "verb"}, {"序号": 1684, "词频": 76, "单词": "incentive", "释义": "刺激、动机", "其他拼写": null, "pos": "noun"}, {"序号": 1685, "词频": 76, "单词": "victim", "释义": "受害者", "其他拼写": null, "pos": "noun"}, {"序号": 1686, "词频": 76, "单词": "airline", "释义": "航线", "其他拼写": null, "pos": "noun"}, {"序号": 1687, "词频": 76, "单词": "confident", "释义": "自信的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1688, "词频": 76, "单词": "preference", "释义": "偏爱", "其他拼写": null, "pos": "noun"}, {"序号": 1689, "词频": 76, "单词": "approve", "释义": "赞同", "其他拼写": null, "pos": "verb"}, {"序号": 1690, "词频": 76, "单词": "borrow", "释义": "借", "其他拼写": null, "pos": "verb"}, {"序号": 1691, "词频": 76, "单词": "assignment", "释义": "任务", "其他拼写": null, "pos": "noun"}, {"序号": 1692, "词频": 75, "单词": "reliable", "释义": "可靠的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1693, "词频": 75, "单词": "asset", "释义": "资产、天赋", "其他拼写": null, "pos": "noun"}, {"序号": 1694, "词频": 75, "单词": "constant", "释义": "坚定的、经常的", "其他拼写": null, "pos": "noun"}, {"序号": 1695, "词频": 75, "单词": "leisure", "释义": "空闲、悠闲", "其他拼写": null, "pos": "noun"}, {"序号": 1696, "词频": 75, "单词": "considerable", "释义": "相当大的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1697, "词频": 75, "单词": "beauty", "释义": "美丽、美人", "其他拼写": null, "pos": "noun"}, {"序号": 1698, "词频": 75, "单词": "massive", "释义": "巨大的、大规模的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1699, "词频": 75, "单词": "council", "释义": "理事会", "其他拼写": null, "pos": "noun"}, {"序号": 1700, "词频": 75, "单词": "entire", "释义": "完全的", "其他拼写": null, "pos": "noun"}, {"序号": 1701, "词频": 75, "单词": "reverse", "释义": "相反的、倒退的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1702, "词频": 75, "单词": "document", "释义": "文档", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1703, "词频": 75, "单词": "skim", "释义": "掠过", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1704, "词频": 74, "单词": "optimistic", "释义": "乐观的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1705, "词频": 74, "单词": "somewhat", "释义": "稍微", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1706, "词频": 74, "单词": "skilled", "释义": "有技能的、熟练的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1707, "词频": 74, "单词": "appreciate", "释义": "欣赏、感激", "其他拼写": null, "pos": "verb"}, {"序号": 1708, "词频": 74, "单词": "entertainment", "释义": "招待、娱乐", "其他拼写": null, "pos": "noun"}, {"序号": 1709, "词频": 74, "单词": "nobody", "释义": "谁也不、小人物", "其他拼写": null, "pos": "noun"}, {"序号": 1710, "词频": 74, "单词": "satisfaction", "释义": "满意、乐事", "其他拼写": null, "pos": "noun"}, {"序号": 1711, "词频": 74, "单词": "recover", "释义": "恢复", "其他拼写": null, "pos": "verb"}, {"序号": 1712, "词频": 74, "单词": "apartment", "释义": "房间、公寓", "其他拼写": null, "pos": "noun"}, {"序号": 1713, "词频": 74, "单词": "sister", "释义": "姐妹", "其他拼写": null, "pos": "noun"}, {"序号": 1714, "词频": 73, "单词": "plate", "释义": "盘子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1715, "词频": 73, "单词": "justify", "释义": "证明…正当", "其他拼写": null, "pos": "verb"}, {"序号": 1716, "词频": 73, "单词": "dead", "释义": "死去的、麻木的", "其他拼写": null, "pos": "noun"}, {"序号": 1717, "词频": 73, "单词": "ceremony", "释义": "仪式", "其他拼写": null, "pos": "noun"}, {"序号": 1718, "词频": 73, "单词": "elsewhere", "释义": "在别处", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1719, "词频": 73, "单词": "procedure", "释义": "步骤", "其他拼写": null, "pos": "noun"}, {"序号": 1720, "词频": 73, "单词": "unlikely", "释义": "不太可能", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1721, "词频": 73, "单词": "strict", "释义": "严格的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1722, "词频": 73, "单词": "stick", "释义": "棍、刺、粘贴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1723, "词频": 73, "单词": "observation", "释义": "观察、言论", "其他拼写": null, "pos": "noun"}, {"序号": 1724, "词频": 73, "单词": "convey", "释义": "传达、输送", "其他拼写": null, "pos": "verb"}, {"序号": 1725, "词频": 73, "单词": "virtual", "释义": "虚拟、实际上的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1726, "词频": 73, "单词": "discourage", "释义": "使泄气", "其他拼写": "discorage", "pos": "verb"}, {"序号": 1727, "词频": 73, "单词": "jam", "释义": "拥堵、果酱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1728, "词频": 73, "单词": "location", "释义": "位置", "其他拼写": null, "pos": "noun"}, {"序号": 1729, "词频": 73, "单词": "coach", "释义": "教练", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1730, "词频": 73, "单词": "merit", "释义": "优点、价值、值得", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1731, "词频": 73, "单词": "occasion", "释义": "机会、重大活动", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1732, "词频": 73, "单词": "bottle", "释义": "瓶子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1733, "词频": 72, "单词": "implication", "释义": "后果、言下之意", "其他拼写": null, "pos": "noun"}, {"序号": 1734, "词频": 72, "单词": "inevitable", "释义": "不可避免的", "其他拼写": null, "pos": "noun"}, {"序号": 1735, "词频": 72, "单词": "wind", "释义": "风", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1736, "词频": 72, "单词": "surprise", "释义": "惊讶", "其他拼写": "surprize", "pos": "noun_verb"}, {"序号": 1737, "词频": 72, "单词": "independence", "释义": "独立", "其他拼写": null, "pos": "noun"}, {"序号": 1738, "词频": 72, "单词": "aside", "释义": "在旁边", "其他拼写": null, "pos": "noun"}, {"序号": 1739, "词频": 72, "单词": "bind", "释义": "结合、约束、捆绑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1740, "词频": 72, "单词": "capture", "释义": "捕获、战利品、拍摄、引起注意", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1741, "词频": 72, "单词": "satisfy", "释义": "满意、使确信", "其他拼写": null, "pos": "verb"}, {"序号": 1742, "词频": 72, "单词": "recruit", "释义": "招募、新兵", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1743, "词频": 72, "单词": "skin", "释义": "皮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1744, "词频": 72, "单词": "retail", "释义": "零售", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1745, "词频": 72, "单词": "sick", "释义": "生病的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1746, "词频": 72, "单词": "grain", "释义": "谷物", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1747, "词频": 72, "单词": "eager", "释义": "渴望的", "其他拼写": null, "pos": "noun"}, {"序号": 1748, "词频": 72, "单词": "proposal", "释义": "提议、求婚", "其他拼写": null, "pos": "noun"}, {"序号": 1749, "词频": 72, "单词": "excerpt", "释义": "摘录", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1750, "词频": 71, "单词": "brief", "释义": "简短的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1751, "词频": 71, "单词": "fruit", "释义": "水果", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1752, "词频": 71, "单词": "scene", "释义": "场景", "其他拼写": null, "pos": "noun"}, {"序号": 1753, "词频": 71, "单词": "hide", "释义": "隐藏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1754, "词频": 71, "单词": "export", "释义": "输出、出口", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1755, "词频": 71, "单词": "exhibition", "释义": "展览会、陈列", "其他拼写": null, "pos": "noun"}, {"序号": 1756, "词频": 71, "单词": "length", "释义": "长度", "其他拼写": null, "pos": "noun"}, {"序号": 1757, "词频": 71, "单词": "cultivate", "释义": "耕作、培养", "其他拼写": null, "pos": "verb"}, {"序号": 1758, "词频": 71, "单词": "border", "释义": "边界", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1759, "词频": 71, "单词": "edge", "释义": "边、刀口", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1760, "词频": 71, "单词": "recycle", "释义": "回收", "其他拼写": null, "pos": "verb"}, {"序号": 1761, "词频": 71, "单词": "treasure", "释义": "宝藏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1762, "词频": 71, "单词": "bacteria", "释义": "细菌", "其他拼写": null, "pos": "noun"}, {"序号": 1763, "词频": 70, "单词": "selection", "释义": "选择、精选物", "其他拼写": null, "pos": "noun"}, {"序号": 1764, "词频": 70, "单词": "sustain", "释义": "支撑、忍受", "其他拼写": null, "pos": "verb"}, {"序号": 1765, "词频": 70, "单词": "everybody", "释义": "每人", "其他拼写": null, "pos": "other"}, {"序号": 1766, "词频": 70, "单词": "helpful", "释义": "有帮助的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1767, "词频": 70, "单词": "instrument", "释义": "工具、乐器", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1768, "词频": 70, "单词": "tired", "释义": "疲惫的", "其他拼写": "tyred", "pos": "verb"}, {"序号": 1769, "词频": 70, "单词": "hair", "释义": "头发", "其他拼写": null, "pos": "noun"}, {"序号": 1770, "词频": 70, "单词": "admission", "释义": "允许进入、承认", "其他拼写": null, "pos": "noun"}, {"序号": 1771, "词频": 70, "单词": "regardless", "释义": "不顾、不管怎样", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1772, "词频": 70, "单词": "empty", "释义": "空的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1773, "词频": 70, "单词": "spring", "释义": "春天、跳跃", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1774, "词频": 70, "单词": "valley", "释义": "山谷", "其他拼写": null, "pos": "noun"}, {"序号": 1775, "词频": 70, "单词": "clothing", "释义": "衣物", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1776, "词频": 70, "单词": "nice", "释义": "很好的", "其他拼写": null, "pos": "noun"}, {"序号": 1777, "词频": 69, "单词": "universe", "释义": "宇宙", "其他拼写": null, "pos": "noun"}, {"序号": 1778, "词频": 69, "单词": "pursuit", "释义": "追求、追赶", "其他拼写": null, "pos": "noun"}, {"序号": 1779, "词频": 69, "单词": "conscious", "释义": "神志清醒的、意识到的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1780, "词频": 69, "单词": "laugh", "释义": "笑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1781, "词频": 69, "单词": "confront", "释义": "使面临、勇敢地面对", "其他拼写": null, "pos": "verb"}, {"序号": 1782, "词频": 69, "单词": "assumption", "释义": "假定", "其他拼写": null, "pos": "noun"}, {"序号": 1783, "词频": 69, "单词": "equality", "释义": "同等", "其他拼写": null, "pos": "noun"}, {"序号": 1784, "词频": 69, "单词": "glass", "释义": "玻璃、玻璃杯", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1785, "词频": 69, "单词": "entitle", "释义": "给……题名、给……权利", "其他拼写": null, "pos": "verb"}, {"序号": 1786, "词频": 69, "单词": "prompt", "释义": "敏捷的、提示", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1787, "词频": 69, "单词": "suspect", "释义": "怀疑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1788, "词频": 69, "单词": "spirit", "释义": "精神", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1789, "词频": 69, "单词": "hero", "释义": "英雄", "其他拼写": null, "pos": "noun"}, {"序号": 1790, "词频": 69, "单词": "wild", "释义": "野生的", "其他拼写": null, "pos": "noun"}, {"序号": 1791, "词频": 69, "单词": "muscle", "释义": "肌肉、体力", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1792, "词频": 69, "单词": "beat", "释义": "击败", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1793, "词频": 69, "单词": "peak", "释义": "最高点", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1794, "词频": 69, "单词": "arm", "释义": "手臂", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1795, "词频": 69, "单词": "shrink", "释义": "起皱、减少", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1796, "词频": 69, "单词": "transition", "释义": "过渡、转变", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1797, "词频": 69, "单词": "excellent", "释义": "优秀的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1798, "词频": 69, "单词": "delete", "释义": "删除", "其他拼写": null, "pos": "verb"}, {"序号": 1799, "词频": 69, "单词": "racial", "释义": "种族的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1800, "词频": 68, "单词": "puzzle", "释义": "使……困惑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1801, "词频": 68, "单词": "witness", "释义": "目击、见证", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1802, "词频": 68, "单词": "branch", "释义": "枝、分部", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1803, "词频": 68, "单词": "literary", "释义": "文学的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1804, "词频": 68, "单词": "reference", "释义": "提及、参考", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1805, "词频": 68, "单词": "minister", "释义": "部长", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1806, "词频": 68, "单词": "register", "释义": "注册", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1807, "词频": 68, "单词": "declare", "释义": "宣布", "其他拼写": null, "pos": "verb"}, {"序号": 1808, "词频": 68, "单词": "everywhere", "释义": "到处", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1809, "词频": 68, "单词": "invent", "释义": "发明", "其他拼写": null, "pos": "verb"}, {"序号": 1810, "词频": 68, "单词": "maybe", "释义": "可能、大概", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1811, "词频": 68, "单词": "volume", "释义": "容积、音量（一）卷", "其他拼写": null, "pos": "noun"}, {"序号": 1812, "词频": 68, "单词": "bar", "释义": "条、酒吧", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1813, "词频": 68, "单词": "east", "释义": "东、东方的", "其他拼写": null, "pos": "noun"}, {"序号": 1814, "词频": 68, "单词": "resume", "释义": "重新开始、恢复、简历", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1815, "词频": 68, "单词": "adolescent", "释义": "青少年", "其他拼写": null, "pos": "noun"}, {"序号": 1816, "词频": 68, "单词": "dance", "释义": "跳舞", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1817, "词频": 68, "单词": "hill", "释义": "小山", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1818, "词频": 68, "单词": "season", "释义": "季节", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1819, "词频": 67, "单词": "nevertheless", "释义": "然而", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1820, "词频": 67, "单词": "congress", "释义": "代表大会", "其他拼写": null, "pos": "noun"}, {"序号": 1821, "词频": 67, "单词": "fifty", "释义": "五十", "其他拼写": null, "pos": "noun"}, {"序号": 1822, "词频": 67, "单词": "urgent", "释义": "紧迫的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1823, "词频": 67, "单词": "category", "释义": "类别", "其他拼写": null, "pos": "noun"}, {"序号": 1824, "词频": 67, "单词": "infant", "释义": "婴幼儿", "其他拼写": null, "pos": "noun"}, {"序号": 1825, "词频": 67, "单词": "convenient", "释义": "方便的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1826, "词频": 67, "单词": "battle", "释义": "战斗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1827, "词频": 67, "单词": "vulnerable", "释义": "易受攻击的、脆弱的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1828, "词频": 67, "单词": "committee", "释义": "委员会", "其他拼写": null, "pos": "noun"}, {"序号": 1829, "词频": 67, "单词": "band", "释义": "乐队、带子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1830, "词频": 67, "单词": "football", "释义": "足球", "其他拼写": null, "pos": "noun"}, {"序号": 1831, "词频": 67, "单词": "dress", "释义": "穿", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1832, "词频": 67, "单词": "vacation", "释义": "假期", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1833, "词频": 66, "单词": "reasonable", "释义": "合理的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1834, "词频": 66, "单词": "odd", "释义": "奇数的、奇怪的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1835, "词频": 66, "单词": "significance", "释义": "重要性", "其他拼写": null, "pos": "noun"}, {"序号": 1836, "词频": 66, "单词": "examination", "释义": "考试", "其他拼写": null, "pos": "noun"}, {"序号": 1837, "词频": 66, "单词": "detect", "释义": "查明、发现", "其他拼写": null, "pos": "verb"}, {"序号": 1838, "词频": 66, "单词": "host", "释义": "主持人", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1839, "词频": 66, "单词": "estate", "释义": "地产、遗产", "其他拼写": null, "pos": "noun"}, {"序号": 1840, "词频": 66, "单词": "initiative", "释义": "主动性、进取心", "其他拼写": null, "pos": "noun"}, {"序号": 1841, "词频": 66, "单词": "divorce", "释义": "离婚、断绝关系", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1842, "词频": 66, "单词": "dispute", "释义": "争论", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1843, "词频": 66, "单词": "accurate", "释义": "精确的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1844, "词频": 66, "单词": "brown", "释义": "褐色的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1845, "词频": 66, "单词": "snow", "释义": "雪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1846, "词频": 66, "单词": "confirm", "释义": "证实、确认", "其他拼写": null, "pos": "verb"}, {"序号": 1847, "词频": 66, "单词": "raw", "释义": "生的、未经训练的", "其他拼写": null, "pos": "noun"}, {"序号": 1848, "词频": 66, "单词": "unit", "释义": "单元、单位", "其他拼写": null, "pos": "noun"}, {"序号": 1849, "词频": 66, "单词": "hang", "释义": "挂", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1850, "词频": 65, "单词": "weigh", "释义": "称重量、有影响", "其他拼写": null, "pos": "verb"}, {"序号": 1851, "词频": 65, "单词": "elite", "释义": "精英", "其他拼写": null, "pos": "noun"}, {"序号": 1852, "词频": 65, "单词": "trial", "释义": "审判、试用", "其他拼写": null, "pos": "noun"}, {"序号": 1853, "词频": 65, "单词": "evolve", "释义": "使发展", "其他拼写": null, "pos": "verb"}, {"序号": 1854, "词频": 65, "单词": "mislead", "释义": "误导", "其他拼写": null, "pos": "verb"}, {"序号": 1855, "词频": 65, "单词": "distinction", "释义": "区分、卓越", "其他拼写": null, "pos": "noun"}, {"序号": 1856, "词频": 65, "单词": "automation", "释义": "自动", "其他拼写": null, "pos": "noun"}, {"序号": 1857, "词频": 65, "单词": "craft", "释义": "工艺", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1858, "词频": 65, "单词": "plenty", "释义": "丰富、大量", "其他拼写": null, "pos": "noun"}, {"序号": 1859, "词频": 65, "单词": "vegetable", "释义": "蔬菜", "其他拼写": null, "pos": "noun"}, {"序号": 1860, "词频": 65, "单词": "curriculum", "释义": "课程", "其他拼写": null, "pos": "noun"}, {"序号": 1861, "词频": 65, "单词": "flexible", "释义": "灵活的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1862, "词频": 65, "单词": "cat", "释义": "猫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1863, "词频": 64, "单词": "royal", "释义": "皇家的", "其他拼写": null, "pos": "noun"}, {"序号": 1864, "词频": 64, "单词": "highlight", "释义": "使显著、强调", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1865, "词频": 64, "单词": "remark", "释义": "评价、评论", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1866, "词频": 64, "单词": "comparison", "释义": "比较", "其他拼写": null, "pos": "noun"}, {"序号": 1867, "词频": 64, "单词": "regulate", "释义": "管理、调节", "其他拼写": null, "pos": "verb"}, {"序号": 1868, "词频": 64, "单词": "contrary", "释义": "相反的、对方的", "其他拼写": null, "pos": "noun"}, {"序号": 1869, "词频": 64, "单词": "rush", "释义": "冲", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1870, "词频": 64, "单词": "interact", "释义": "互动", "其他拼写": null, "pos": "verb"}, {"序号": 1871, "词频": 64, "单词": "nervous", "释义": "紧张的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1872, "词频": 64, "单词": "bag", "释义": "包、袋", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1873, "词频": 64, "单词": "scheme", "释义": "计划、密谋", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1874, "词频": 64, "单词": "alarm", "释义": "警报", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1875, "词频": 64, "单词": "desert", "释义": "遗弃、沙漠", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1876, "词频": 64, "单词": "beach", "释义": "海滩", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1877, "词频": 64, "单词": "usage", "释义": "使用、用法", "其他拼写": null, "pos": "noun"}, {"序号": 1878, "词频": 63, "单词": "exceptional", "释义": "例外的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1879, "词频": 63, "单词": "internal", "释义": "内部的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1880, "词频": 63, "单词": "evil", "释义": "邪恶的、坏的", "其他拼写": null, "pos": "noun"}, {"序号": 1881, "词频": 63, "单词": "surround", "释义": "周围", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1882, "词频": 63, "单词": "bottom", "释义": "底下", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1883, "词频": 63, "单词": "expansion", "释义": "扩张", "其他拼写": null, "pos": "noun"}, {"序号": 1884, "词频": 62, "单词": "whereas", "释义": "然而", "其他拼写": null, "pos": "other"}, {"序号": 1885, "词频": 62, "单词": "license", "释义": "执照、许可", "其他拼写": "licence", "pos": "noun_verb"}, {"序号": 1886, "词频": 62, "单词": "journey", "释义": "旅行", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1887, "词频": 62, "单词": "anticipate", "释义": "预期、先发制人", "其他拼写": null, "pos": "verb"}, {"序号": 1888, "词频": 62, "单词": "deprive", "释义": "剥夺", "其他拼写": null, "pos": "verb"}, {"序号": 1889, "词频": 62, "单词": "finance", "释义": "财政", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1890, "词频": 62, "单词": "absence", "释义": "缺席", "其他拼写": null, "pos": "noun"}, {"序号": 1891, "词频": 62, "单词": "guideline", "释义": "指导方针、指导原则", "其他拼写": null, "pos": "noun"}, {"序号": 1892, "词频": 62, "单词": "route", "释义": "路线", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1893, "词频": 62, "单词": "whenever", "释义": "无论何时", "其他拼写": null, "pos": "other"}, {"序号": 1894, "词频": 62, "单词": "solid", "释义": "固体的", "其他拼写": null, "pos": "noun"}, {"序号": 1895, "词频": 62, "单词": "tap", "释义": "提取、利用", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1896, "词频": 62, "单词": "myself", "释义": "我自己、我亲自", "其他拼写": null, "pos": "other"}, {"序号": 1897, "词频": 62, "单词": "seed", "释义": "种子、播种", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1898, "词频": 62, "单词": "protest", "释义": "抗议", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1899, "词频": 62, "单词": "submit", "释义": "顺从、递交", "其他拼写": null, "pos": "verb"}, {"序号": 1900, "词频": 62, "单词": "musical", "释义": "音乐的、音调优美的", "其他拼写": null, "pos": "noun"}, {"序号": 1901, "词频": 61, "单词": "journalist", "释义": "记者", "其他拼写": null, "pos": "noun"}, {"序号": 1902, "词频": 61, "单词": "judgment", "释义": "裁判", "其他拼写": null, "pos": "noun"}, {"序号": 1903, "词频": 61, "单词": "boom", "释义": "繁荣", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1904, "词频": 61, "单词": "fairly", "释义": "公正地、相当地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1905, "词频": 61, "单词": "stable", "释义": "稳定的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1906, "词频": 61, "单词": "contest", "释义": "比赛", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1907, "词频": 61, "单词": "illegal", "释义": "不合法的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1908, "词频": 61, "单词": "zone", "释义": "区域", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1909, "词频": 61, "单词": "besides", "释义": "除了之外、而且", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1910, "词频": 61, "单词": "philosophy", "释义": "哲学", "其他拼写": null, "pos": "noun"}, {"序号": 1911, "词频": 61, "单词": "modify", "释义": "修改、缓和", "其他拼写": null, "pos": "verb"}, {"序号": 1912, "词频": 61, "单词": "rural", "释义": "乡村的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1913, "词频": 61, "单词": "god", "释义": "神、上帝", "其他拼写": null, "pos": "noun"}, {"序号": 1914, "词频": 61, "单词": "reluctant", "释义": "不情愿的、勉强的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1915, "词频": 61, "单词": "sharp", "释义": "尖的、清晰的", "其他拼写": null, "pos": "noun"}, {"序号": 1916, "词频": 61, "单词": "adequate", "释义": "充足的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1917, "词频": 61, "单词": "milk", "释义": "牛奶", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1918, "词频": 61, "单词": "mystery", "释义": "神秘", "其他拼写": null, "pos": "noun"}, {"序号": 1919, "词频": 61, "单词": "literacy", "释义": "读写能力", "其他拼写": null, "pos": "noun"}, {"序号": 1920, "词频": 61, "单词": "emergency", "释义": "紧急情况", "其他拼写": null, "pos": "noun"}, {"序号": 1921, "词频": 61, "单词": "bridge", "释义": "桥", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1922, "词频": 61, "单词": "grass", "释义": "草", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1923, "词频": 60, "单词": "slave", "释义": "奴隶", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1924, "词频": 60, "单词": "privilege", "释义": "特权、优先权", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1925, "词频": 60, "单词": "restore", "释义": "恢复、归还", "其他拼写": null, "pos": "verb"}, {"序号": 1926, "词频": 60, "单词": "upset", "释义": "沮丧、难过", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1927, "词频": 60, "单词": "counterpart", "释义": "同行", "其他拼写": null, "pos": "noun"}, {"序号": 1928, "词频": 60, "单词": "accelerate", "释义": "加速", "其他拼写": null, "pos": "verb"}, {"序号": 1929, "词频": 60, "单词": "era", "释义": "时代", "其他拼写": null, "pos": "noun"}, {"序号": 1930, "词频": 60, "单词": "false", "释义": "错误的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1931, "词频": 60, "单词": "uniform", "释义": "统一的、制服", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1932, "词频": 60, "单词": "pair", "释义": "一对", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1933, "词频": 60, "单词": "profitable", "释义": "有利可图的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1934, "词频": 60, "单词": "prison", "释义": "监狱", "其他拼写": null, "pos": "noun"}, {"序号": 1935, "词频": 60, "单词": "breath", "释义": "呼吸", "其他拼写": null, "pos": "noun"}, {"序号": 1936, "词频": 60, "单词": "barrier", "释义": "障碍", "其他拼写": null, "pos": "noun"}, {"序号": 1937, "词频": 60, "单词": "breed", "释义": "养育、繁殖", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1938, "词频": 60, "单词": "painting", "释义": "绘画", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1939, "词频": 59, "单词": "segment", "释义": "段", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1940, "词频": 59, "单词": "dam", "释义": "水坝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1941, "词频": 59, "单词": "infrastructure", "释义": "基础设施", "其他拼写": null, "pos": "noun"}, {"序号": 1942, "词频": 59, "单词": "landscape", "释义": "风景", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1943, "词频": 59, "单词": "assist", "释义": "援助", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1944, "词频": 59, "单词": "crucial", "释义": "决定性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1945, "词频": 59, "单词": "fan", "释义": "粉丝、扇子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1946, "词频": 59, "单词": "rock", "释义": "岩石、震动", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1947, "词频": 59, "单词": "devote", "释义": "奉献", "其他拼写": null, "pos": "verb"}, {"序号": 1948, "词频": 59, "单词": "permanent", "释义": "永恒的", "其他拼写": null, "pos": "noun"}, {"序号": 1949, "词频": 59, "单词": "broadcast", "释义": "广播", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1950, "词频": 59, "单词": "desk", "释义": "桌子", "其他拼写": null, "pos": "noun"}, {"序号": 1951, "词频": 59, "单词": "greenhouse", "释义": "温室", "其他拼写": null, "pos": "noun"}, {"序号": 1952, "词频": 59, "单词": "visual", "释义": "看的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1953, "词频": 59, "单词": "electric", "释义": "电的", "其他拼写": null, "pos": "noun"}, {"序号": 1954, "词频": 59, "单词": "luxury", "释义": "奢侈、奢侈品", "其他拼写": null, "pos": "noun"}, {"序号": 1955, "词频": 59, "单词": "tall", "释义": "高", "其他拼写": null, "pos": "noun"}, {"序号": 1956, "词频": 59, "单词": "entrance", "释义": "入口", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1957, "词频": 59, "单词": "snack", "释义": "点心、易办到的事", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1958, "词频": 58, "单词": "rat", "释义": "老鼠、卑鄙的人", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1959, "词频": 58, "单词": "channel", "释义": "频道、隧道", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1960, "词频": 58, "单词": "reply", "释义": "回复", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1961, "词频": 58, "单词": "virtue", "释义": "美德、优点", "其他拼写": null, "pos": "noun"}, {"序号": 1962, "词频": 58, "单词": "injury", "释义": "损伤", "其他拼写": null, "pos": "noun"}, {"序号": 1963, "词频": 58, "单词": "remind", "释义": "提醒", "其他拼写": null, "pos": "verb"}, {"序号": 1964, "词频": 58, "单词": "trait", "释义": "特征", "其他拼写": null, "pos": "noun"}, {"序号": 1965, "词频": 58, "单词": "counter", "释义": "柜台", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1966, "词频": 58, "单词": "evaluate", "释义": "评估", "其他拼写": null, "pos": "verb"}, {"序号": 1967, "词频": 58, "单词": "sacrifice", "释义": "牺牲", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1968, "词频": 58, "单词": "tone", "释义": "音调、腔调", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1969, "词频": 58, "单词": "minor", "释义": "较小的、较少的", "其他拼写": null, "pos": "noun"}, {"序号": 1970, "词频": 58, "单词": "stuff", "释义": "东西、材料、填满", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1971, "词频": 58, "单词": "sum", "释义": "总和", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1972, "词频": 58, "单词": "cheat", "释义": "作弊、欺骗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1973, "词频": 58, "单词": "injure", "释义": "使受伤、损害", "其他拼写": null, "pos": "verb"}, {"序号": 1974, "词频": 58, "单词": "superior", "释义": "优良的、较……多的", "其他拼写": null, "pos": "noun"}, {"序号": 1975, "词频": 58, "单词": "tackle", "释义": "处理、应付", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1976, "词频": 58, "单词": "maximum", "释义": "最大的", "其他拼写": null, "pos": "noun"}, {"序号": 1977, "词频": 58, "单词": "tuition", "释义": "学费、教学", "其他拼写": null, "pos": "noun"}, {"序号": 1978, "词频": 58, "单词": "appointment", "释义": "预约、任命、职位", "其他拼写": null, "pos": "noun"}, {"序号": 1979, "词频": 58, "单词": "ingredient", "释义": "成分", "其他拼写": null, "pos": "noun"}, {"序号": 1980, "词频": 58, "单词": "spare", "释义": "空闲的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1981, "词频": 58, "单词": "tour", "释义": "旅行", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1982, "词频": 58, "单词": "steel", "释义": "钢", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1983, "词频": 58, "单词": "beneath", "释义": "在…之下", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1984, "词频": 58, "单词": "discount", "释义": "折扣", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1985, "词频": 57, "单词": "trace", "释义": "痕迹、微量", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1986, "词频": 57, "单词": "unfortunately", "释义": "不幸地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1987, "词频": 57, "单词": "laboratory", "释义": "实验室", "其他拼写": null, "pos": "noun"}, {"序号": 1988, "词频": 57, "单词": "belt", "释义": "皮带、地带", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1989, "词频": 57, "单词": "march", "释义": "行进", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1990, "词频": 57, "单词": "tendency", "释义": "趋势", "其他拼写": null, "pos": "noun"}, {"序号": 1991, "词频": 57, "单词": "accomplish", "释义": "完成", "其他拼写": null, "pos": "verb"}, {"序号": 1992, "词频": 57, "单词": "ruin", "释义": "毁灭", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1993, "词频": 57, "单词": "entertain", "释义": "娱乐", "其他拼写": null, "pos": "verb"}, {"序号": 1994, "词频": 57, "单词": "hall", "释义": "大厅", "其他拼写": null, "pos": "noun"}, {"序号": 1995, "词频": 57, "单词": "regret", "释义": "遗憾、后悔", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1996, "词频": 57, "单词": "furniture", "释义": "家具", "其他拼写": null, "pos": "noun"}, {"序号": 1997, "词频": 57, "单词": "ride", "释义": "骑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 1998, "词频": 57, "单词": "terrible", "释义": "很糟的、可怕的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 1999, "词频": 57, "单词": "coast", "释义": "海岸、沿岸航行", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2000, "词频": 57, "单词": "camera", "释义": "照相机", "其他拼写": null, "pos": "noun"}, {"序号": 2001, "词频": 57, "单词": "obstacle", "释义": "障碍", "其他拼写": null, "pos": "noun"}, {"序号": 2002, "词频": 57, "单词": "finger", "释义": "手指", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2003, "词频": 57, "单词": "interval", "释义": "间隔、休息", "其他拼写": null, "pos": "noun"}, {"序号": 2004, "词频": 56, "单词": "constitute", "释义": "组成、建立", "其他拼写": null, "pos": "verb"}, {"序号": 2005, "词频": 56, "单词": "northern", "释义": "北方的", "其他拼写": null, "pos": "noun"}, {"序号": 2006, "词频": 56, "单词": "aggressive", "释义": "好斗的、有侵略性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2007, "词频": 56, "单词": "influential", "释义": "有影响的、权势的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2008, "词频": 56, "单词": "radical", "释义": "根本的、彻底的", "其他拼写": null, "pos": "noun"}, {"序号": 2009, "词频": 56, "单词": "abuse", "释义": "滥用、虐待", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2010, "词频": 56, "单词": "southern", "释义": "南方的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2011, "词频": 56, "单词": "elementary", "释义": "初等的、简单的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2012, "词频": 56, "单词": "motor", "释义": "发动机", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2013, "词频": 56, "单词": "reporter", "释义": "报告人", "其他拼写": null, "pos": "noun"}, {"序号": 2014, "词频": 56, "单词": "commerce", "释义": "商业、交易", "其他拼写": null, "pos": "noun"}, {"序号": 2015, "词频": 56, "单词": "strain", "释义": "使紧张、拉紧", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2016, "词频": 56, "单词": "resolve", "释义": "解决、决定", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2017, "词频": 56, "单词": "thrive", "释义": "繁荣", "其他拼写": null, "pos": "verb"}, {"序号": 2018, "词频": 56, "单词": "excuse", "释义": "借口", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2019, "词频": 56, "单词": "profound", "释义": "深刻的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2020, "词频": 56, "单词": "soldier", "释义": "士兵", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2021, "词频": 56, "单词": "valid", "释义": "合理的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2022, "词频": 56, "单词": "wood", "释义": "木头、森林", "其他拼写": null, "pos": "noun"}, {"序号": 2023, "词频": 56, "单词": "embrace", "释义": "拥抱、接受", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2024, "词频": 56, "单词": "lucky", "释义": "幸运的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2025, "词频": 56, "单词": "tiny", "释义": "极小的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2026, "词频": 56, "单词": "breathe", "释义": "呼吸", "其他拼写": null, "pos": "verb"}, {"序号": 2027, "词频": 56, "单词": "prime", "释义": "最初的、首要的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2028, "词频": 56, "单词": "camp", "释义": "营地", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2029, "词频": 56, "单词": "flower", "释义": "花朵", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2030, "词频": 56, "单词": "flood", "释义": "洪水、涌进", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2031, "词频": 56, "单词": "village", "释义": "村", "其他拼写": null, "pos": "noun"}, {"序号": 2032, "词频": 56, "单词": "destruction", "释义": "破坏", "其他拼写": null, "pos": "noun"}, {"序号": 2033, "词频": 56, "单词": "bond", "释义": "纽带", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2034, "词频": 56, "单词": "weapon", "释义": "武器", "其他拼写": null, "pos": "noun"}, {"序号": 2035, "词频": 56, "单词": "salt", "释义": "盐、腌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2036, "词频": 55, "单词": "dioxide", "释义": "二氧化物", "其他拼写": null, "pos": "noun"}, {"序号": 2037, "词频": 55, "单词": "gamble", "释义": "赌博、投机", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2038, "词频": 55, "单词": "conservative", "释义": "保守", "其他拼写": null, "pos": "noun"}, {"序号": 2039, "词频": 55, "单词": "panel", "释义": "面板", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2040, "词频": 55, "单词": "prejudice", "释义": "偏见、损害", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2041, "词频": 55, "单词": "honor", "释义": "荣耀", "其他拼写": "honour", "pos": "noun_verb"}, {"序号": 2042, "词频": 55, "单词": "vitamin", "释义": "维生素", "其他拼写": null, "pos": "noun"}, {"序号": 2043, "词频": 55, "单词": "transaction", "释义": "交易、业务", "其他拼写": null, "pos": "noun"}, {"序号": 2044, "词频": 55, "单词": "relief", "释义": "如释重负", "其他拼写": null, "pos": "noun"}, {"序号": 2045, "词频": 55, "单词": "civil", "释义": "公民的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2046, "词频": 55, "单词": "mirror", "释义": "镜子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2047, "词频": 55, "单词": "costly", "释义": "昂贵的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2048, "词频": 55, "单词": "plus", "释义": "加上、正的", "其他拼写": null, "pos": "noun"}, {"序号": 2049, "词频": 55, "单词": "chip", "释义": "薯片、芯片", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2050, "词频": 55, "单词": "insert", "释义": "插入", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2051, "词频": 55, "单词": "boat", "释义": "船", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2052, "词频": 54, "单词": "quote", "释义": "引用", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2053, "词频": 54, "单词": "chairman", "释义": "主席", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2054, "词频": 54, "单词": "latter", "释义": "后者", "其他拼写": null, "pos": "noun"}, {"序号": 2055, "词频": 54, "单词": "trap", "释义": "困住", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2056, "词频": 54, "单词": "bias", "释义": "偏见、偏重", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2057, "词频": 54, "单词": "photograph", "释义": "照片", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2058, "词频": 54, "单词": "rival", "释义": "竞争", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2059, "词频": 54, "单词": "disorder", "释义": "混乱、骚乱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2060, "词频": 54, "单词": "blind", "释义": "失明的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2061, "词频": 54, "单词": "onto", "释义": "在上面、到上面", "其他拼写": null, "pos": "other"}, {"序号": 2062, "词频": 54, "单词": "proud", "释义": "骄傲", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2063, "词频": 54, "单词": "relieve", "释义": "缓解、救济", "其他拼写": null, "pos": "verb"}, {"序号": 2064, "词频": 54, "单词": "tobacco", "释义": "烟草", "其他拼写": null, "pos": "noun"}, {"序号": 2065, "词频": 54, "单词": "construct", "释义": "建造、创立", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2066, "词频": 54, "单词": "encounter", "释义": "偶遇", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2067, "词频": 54, "单词": "overwhelm", "释义": "征服", "其他拼写": null, "pos": "verb"}, {"序号": 2068, "词频": 54, "单词": "sponsor", "释义": "赞助、资助", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2069, "词频": 54, "单词": "truck", "释义": "卡车", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2070, "词频": 54, "单词": "equip", "释义": "装备", "其他拼写": null, "pos": "verb"}, {"序号": 2071, "词频": 54, "单词": "initial", "释义": "起初的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2072, "词频": 54, "单词": "favorite", "释义": "最爱的", "其他拼写": "favourite", "pos": "noun"}, {"序号": 2073, "词频": 54, "单词": "instant", "释义": "时刻、立刻", "其他拼写": null, "pos": "noun"}, {"序号": 2074, "词频": 54, "单词": "minimum", "释义": "最低的", "其他拼写": null, "pos": "noun"}, {"序号": 2075, "词频": 54, "单词": "neighbor", "释义": "邻居", "其他拼写": "neighbour", "pos": "noun_verb"}, {"序号": 2076, "词频": 54, "单词": "neighborhood", "释义": "小区、社区", "其他拼写": "neighbourhood", "pos": "noun"}, {"序号": 2077, "词频": 54, "单词": "principal", "释义": "最重要的、负责人", "其他拼写": null, "pos": "noun"}, {"序号": 2078, "词频": 54, "单词": "proof", "释义": "证据", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2079, "词频": 54, "单词": "file", "释义": "文件", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2080, "词频": 54, "单词": "investigate", "释义": "调查", "其他拼写": null, "pos": "verb"}, {"序号": 2081, "词频": 54, "单词": "package", "释义": "包裹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2082, "词频": 54, "单词": "genuine", "释义": "真的、真诚的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2083, "词频": 54, "单词": "concert", "释义": "音乐会", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2084, "词频": 53, "单词": "helicopter", "释义": "直升机", "其他拼写": null, "pos": "noun"}, {"序号": 2085, "词频": 53, "单词": "amateur", "释义": "业余爱好者、外行", "其他拼写": null, "pos": "noun"}, {"序号": 2086, "词频": 53, "单词": "exception", "释义": "例外", "其他拼写": null, "pos": "noun"}, {"序号": 2087, "词频": 53, "单词": "incident", "释义": "事件", "其他拼写": null, "pos": "noun"}, {"序号": 2088, "词频": 53, "单词": "permit", "释义": "允许", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2089, "词频": 53, "单词": "core", "释义": "核心", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2090, "词频": 53, "单词": "unexpected", "释义": "想不到的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2091, "词频": 53, "单词": "barely", "释义": "几乎不", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2092, "词频": 53, "单词": "anywhere", "释义": "在任何地方", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2093, "词频": 53, "单词": "fellow", "释义": "同事、同辈", "其他拼写": null, "pos": "noun"}, {"序号": 2094, "词频": 53, "单词": "found", "释义": "创立、建立", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2095, "词频": 53, "单词": "occupation", "释义": "占领、职业", "其他拼写": null, "pos": "noun"}, {"序号": 2096, "词频": 53, "单词": "opponent", "释义": "对手", "其他拼写": null, "pos": "noun"}, {"序号": 2097, "词频": 53, "单词": "army", "释义": "军队、陆军", "其他拼写": null, "pos": "noun"}, {"序号": 2098, "词频": 53, "单词": "delivery", "释义": "递送、分娩", "其他拼写": null, "pos": "noun"}, {"序号": 2099, "词频": 53, "单词": "stretch", "释义": "伸展、延伸", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2100, "词频": 53, "单词": "alert", "释义": "警报", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2101, "词频": 53, "单词": "keen", "释义": "热忱的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2102, "词频": 53, "单词": "theft", "释义": "偷窃", "其他拼写": null, "pos": "noun"}, {"序号": 2103, "词频": 53, "单词": "ethnic", "释义": "民族的", "其他拼写": null, "pos": "noun"}, {"序号": 2104, "词频": 52, "单词": "historian", "释义": "历史学家", "其他拼写": null, "pos": "noun"}, {"序号": 2105, "词频": 52, "单词": "supreme", "释义": "最高的、最优的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2106, "词频": 52, "单词": "restrict", "释义": "限制", "其他拼写": null, "pos": "verb"}, {"序号": 2107, "词频": 52, "单词": "democratic", "释义": "民主的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2108, "词频": 52, "单词": "compensate", "释义": "补偿", "其他拼写": null, "pos": "verb"}, {"序号": 2109, "词频": 52, "单词": "thin", "释义": "薄的、稀薄的", "其他拼写": null, "pos": "verb"}, {"序号": 2110, "词频": 52, "单词": "anxious", "释义": "焦虑的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2111, "词频": 52, "单词": "admire", "释义": "钦佩、羡慕、欣赏", "其他拼写": null, "pos": "verb"}, {"序号": 2112, "词频": 52, "单词": "guard", "释义": "保卫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2113, "词频": 52, "单词": "intention", "释义": "意图、打算", "其他拼写": null, "pos": "noun"}, {"序号": 2114, "词频": 52, "单词": "lean", "释义": "倾斜、倚靠、瘦的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2115, "词频": 52, "单词": "generous", "释义": "慷慨的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2116, "词频": 52, "单词": "honest", "释义": "诚实的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2117, "词频": 52, "单词": "shoulder", "释义": "肩膀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2118, "词频": 52, "单词": "inner", "释义": "内部的、内心的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2119, "词频": 52, "单词": "resist", "释义": "抵挡、抵抗", "其他拼写": null, "pos": "verb"}, {"序号": 2120, "词频": 52, "单词": "sky", "释义": "天空", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2121, "词频": 52, "单词": "artistic", "释义": "艺术的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2122, "词频": 52, "单词": "marine", "释义": "海的、船舶的", "其他拼写": null, "pos": "noun"}, {"序号": 2123, "词频": 52, "单词": "sensible", "释义": "明智的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2124, "词频": 51, "单词": "legislation", "释义": "立法", "其他拼写": null, "pos": "noun"}, {"序号": 2125, "词频": 51, "单词": "owe", "释义": "欠、归因于", "其他拼写": null, "pos": "verb"}, {"序号": 2126, "词频": 51, "单词": "theatre", "释义": "电影院、戏剧", "其他拼写": "theater", "pos": "noun"}, {"序号": 2127, "词频": 51, "单词": "controversy", "释义": "争论", "其他拼写": null, "pos": "noun"}, {"序号": 2128, "词频": 51, "单词": "venture", "释义": "冒险、敢于", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2129, "词频": 51, "单词": "ray", "释义": "光线、射线", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2130, "词频": 51, "单词": "frequent", "释义": "常常", "其他拼写": null, "pos": "verb"}, {"序号": 2131, "词频": 51, "单词": "modest", "释义": "谦虚的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2132, "词频": 51, "单词": "personnel", "释义": "员工、人事部门", "其他拼写": null, "pos": "noun"}, {"序号": 2133, "词频": 51, "单词": "collapse", "释义": "倒塌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2134, "词频": 51, "单词": "angry", "释义": "生气的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2135, "词频": 51, "单词": "extensive", "释义": "广泛的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2136, "词频": 51, "单词": "resort", "释义": "度假村、被迫采取", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2137, "词频": 51, "单词": "assistance", "释义": "帮助", "其他拼写": null, "pos": "noun"}, {"序号": 2138, "词频": 51, "单词": "insect", "释义": "昆虫", "其他拼写": null, "pos": "noun"}, {"序号": 2139, "词频": 51, "单词": "insight", "释义": "洞察力", "其他拼写": null, "pos": "noun"}, {"序号": 2140, "词频": 51, "单词": "metal", "释义": "金属", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2141, "词频": 51, "单词": "nearby", "释义": "附近的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2142, "词频": 51, "单词": "exciting", "释义": "令人兴奋的", "其他拼写": null, "pos": "verb"}, {"序号": 2143, "词频": 51, "单词": "freeze", "释义": "冻结", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2144, "词频": 51, "单词": "lake", "释义": "湖", "其他拼写": null, "pos": "noun"}, {"序号": 2145, "词频": 51, "单词": "flat", "释义": "水平的、公寓", "其他拼写": null, "pos": "noun"}, {"序号": 2146, "词频": 51, "单词": "lend", "释义": "借出", "其他拼写": null, "pos": "verb"}, {"序号": 2147, "词频": 51, "单词": "consult", "释义": "咨询", "其他拼写": null, "pos": "verb"}, {"序号": 2148, "词频": 51, "单词": "interrupt", "释义": "中断、打断", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2149, "词频": 51, "单词": "dictation", "释义": "听写", "其他拼写": null, "pos": "noun"}, {"序号": 2150, "词频": 50, "单词": "shall", "释义": "将要", "其他拼写": null, "pos": "other"}, {"序号": 2151, "词频": 50, "单词": "delight", "释义": "高兴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2152, "词频": 50, "单词": "genius", "释义": "天才", "其他拼写": null, "pos": "noun"}, {"序号": 2153, "词频": 50, "单词": "distant", "释义": "远的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2154, "词频": 50, "单词": "diverse", "释义": "多种多样的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2155, "词频": 50, "单词": "fortune", "释义": "命运、财产", "其他拼写": null, "pos": "noun"}, {"序号": 2156, "词频": 50, "单词": "victory", "释义": "胜利", "其他拼写": null, "pos": "noun"}, {"序号": 2157, "词频": 50, "单词": "feedback", "释义": "反馈", "其他拼写": null, "pos": "noun"}, {"序号": 2158, "词频": 50, "单词": "arouse", "释义": "唤醒、激发", "其他拼写": null, "pos": "verb"}, {"序号": 2159, "词频": 50, "单词": "sad", "释义": "悲伤的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2160, "词频": 50, "单词": "theme", "释义": "主题", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2161, "词频": 50, "单词": "square", "释义": "正方形", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2162, "词频": 50, "单词": "defense", "释义": "防卫", "其他拼写": "defence", "pos": "noun"}, {"序号": 2163, "词频": 50, "单词": "facilitate", "释义": "促进", "其他拼写": null, "pos": "verb"}, {"序号": 2164, "词频": 50, "单词": "soft", "释义": "软的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2165, "词频": 50, "单词": "combination", "释义": "结合", "其他拼写": null, "pos": "noun"}, {"序号": 2166, "词频": 50, "单词": "shake", "释义": "摇", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2167, "词频": 50, "单词": "sophisticated", "释义": "世故的、复杂的", "其他拼写": null, "pos": "verb"}, {"序号": 2168, "词频": 49, "单词": "monkey", "释义": "猴子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2169, "词频": 49, "单词": "database", "释义": "数据库", "其他拼写": null, "pos": "noun"}, {"序号": 2170, "词频": 49, "单词": "convention", "释义": "习俗、会议", "其他拼写": null, "pos": "noun"}, {"序号": 2171, "词频": 49, "单词": "enterprise", "释义": "企业、事业", "其他拼写": "enterprize", "pos": "noun"}, {"序号": 2172, "词频": 49, "单词": "temporary", "释义": "临时的", "其他拼写": null, "pos": "noun"}, {"序号": 2173, "词频": 49, "单词": "dependent", "释义": "依靠的、取决于……的", "其他拼写": null, "pos": "noun"}, {"序号": 2174, "词频": 49, "单词": "wise", "释义": "有智慧的、英明的", "其他拼写": "wize", "pos": "noun"}, {"序号": 2175, "词频": 49, "单词": "remarkable", "释义": "值得注意的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2176, "词频": 49, "单词": "horse", "释义": "马", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2177, "词频": 49, "单词": "quantity", "释义": "数量、数额", "其他拼写": null, "pos": "noun"}, {"序号": 2178, "词频": 49, "单词": "fatal", "释义": "致命的、宿命的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2179, "词频": 49, "单词": "lobby", "释义": "游说、门廊", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2180, "词频": 49, "单词": "calm", "释义": "冷静、镇定", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2181, "词频": 49, "单词": "contemporary", "释义": "同时代的、现代的", "其他拼写": null, "pos": "noun"}, {"序号": 2182, "词频": 49, "单词": "prevail", "释义": "流行、占优势", "其他拼写": null, "pos": "verb"}, {"序号": 2183, "词频": 49, "单词": "trick", "释义": "诡计、技巧", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2184, "词频": 49, "单词": "cautious", "释义": "谨慎的", "其他拼写": null, "pos": "noun"}, {"序号": 2185, "词频": 49, "单词": "convert", "释义": "转变", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2186, "词频": 49, "单词": "curious", "释义": "好奇的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2187, "词频": 49, "单词": "bury", "释义": "埋", "其他拼写": null, "pos": "verb"}, {"序号": 2188, "词频": 49, "单词": "drought", "释义": "旱灾", "其他拼写": null, "pos": "noun"}, {"序号": 2189, "词频": 49, "单词": "pool", "释义": "池塘", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2190, "词频": 49, "单词": "assure", "释义": "使确信、担保", "其他拼写": null, "pos": "verb"}, {"序号": 2191, "词频": 49, "单词": "edition", "释义": "版本", "其他拼写": null, "pos": "noun"}, {"序号": 2192, "词频": 49, "单词": "induce", "释义": "引诱、引起", "其他拼写": null, "pos": "verb"}, {"序号": 2193, "词频": 49, "单词": "portion", "释义": "部分", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2194, "词频": 49, "单词": "classmate", "释义": "同学", "其他拼写": null, "pos": "noun"}, {"序号": 2195, "词频": 49, "单词": "grand", "释义": "宏伟的", "其他拼写": null, "pos": "noun"}, {"序号": 2196, "词频": 49, "单词": "shed", "释义": "脱去、棚", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2197, "词频": 48, "单词": "pride", "释义": "自豪、自满", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2198, "词频": 48, "单词": "soccer", "释义": "足球", "其他拼写": null, "pos": "noun"}, {"序号": 2199, "词频": 48, "单词": "sympathy", "释义": "同情", "其他拼写": null, "pos": "noun"}, {"序号": 2200, "词频": 48, "单词": "mechanism", "释义": "机制、方法", "其他拼写": null, "pos": "noun"}, {"序号": 2201, "词频": 48, "单词": "ownership", "释义": "所有", "其他拼写": null, "pos": "noun"}, {"序号": 2202, "词频": 48, "单词": "originate", "释义": "发源、开创", "其他拼写": null, "pos": "verb"}, {"序号": 2203, "词频": 48, "单词": "aircraft", "释义": "航空器", "其他拼写": null, "pos": "noun"}, {"序号": 2204, "词频": 48, "单词": "ethic", "释义": "伦理", "其他拼写": null, "pos": "noun"}, {"序号": 2205, "词频": 48, "单词": "external", "释义": "外部的", "其他拼写": null, "pos": "noun"}, {"序号": 2206, "词频": 48, "单词": "universal", "释义": "普遍的、宇宙的", "其他拼写": null, "pos": "noun"}, {"序号": 2207, "词频": 48, "单词": "react", "释义": "反应", "其他拼写": null, "pos": "verb"}, {"序号": 2208, "词频": 48, "单词": "representative", "释义": "代表、有代表性的", "其他拼写": null, "pos": "noun"}, {"序号": 2209, "词频": 48, "单词": "substantial", "释义": "大量的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2210, "词频": 48, "单词": "qualification", "释义": "资格", "其他拼写": null, "pos": "noun"}, {"序号": 2211, "词频": 48, "单词": "retain", "释义": "保留", "其他拼写": null, "pos": "verb"}, {"序号": 2212, "词频": 48, "单词": "mouth", "释义": "嘴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2213, "词频": 48, "单词": "poll", "释义": "投票", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2214, "词频": 48, "单词": "via", "释义": "经过", "其他拼写": null, "pos": "other"}, {"序号": 2215, "词频": 48, "单词": "myth", "释义": "神话", "其他拼写": null, "pos": "noun"}, {"序号": 2216, "词频": 48, "单词": "stability", "释义": "稳定", "其他拼写": null, "pos": "noun"}, {"序号": 2217, "词频": 48, "单词": "taxi", "释义": "出租车", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2218, "词频": 48, "单词": "slip", "释义": "滑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2219, "词频": 48, "单词": "pocket", "释义": "口袋", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2220, "词频": 48, "单词": "fossil", "释义": "化石", "其他拼写": null, "pos": "noun"}, {"序号": 2221, "词频": 48, "单词": "lady", "释义": "女士", "其他拼写": null, "pos": "noun"}, {"序号": 2222, "词频": 48, "单词": "roll", "释义": "滚动、卷", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2223, "词频": 48, "单词": "forum", "释义": "论坛", "其他拼写": null, "pos": "noun"}, {"序号": 2224, "词频": 48, "单词": "preparation", "释义": "准备", "其他拼写": null, "pos": "noun"}, {"序号": 2225, "词频": 48, "单词": "luck", "释义": "运气、好运", "其他拼写": null, "pos": "noun"}, {"序号": 2226, "词频": 48, "单词": "scholarship", "释义": "奖学金、学问", "其他拼写": null, "pos": "noun"}, {"序号": 2227, "词频": 47, "单词": "rail", "释义": "栏杆、铁轨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2228, "词频": 47, "单词": "dean", "释义": "院长、主任", "其他拼写": null, "pos": "noun"}, {"序号": 2229, "词频": 47, "单词": "overlook", "释义": "俯瞰、忽略", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2230, "词频": 47, "单词": "defend", "释义": "保卫、防守", "其他拼写": null, "pos": "verb"}, {"序号": 2231, "词频": 47, "单词": "dismiss", "释义": "解散", "其他拼写": null, "pos": "verb"}, {"序号": 2232, "词频": 47, "单词": "reinforce", "释义": "加强", "其他拼写": null, "pos": "verb"}, {"序号": 2233, "词频": 47, "单词": "bother", "释义": "打扰", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2234, "词频": 47, "单词": "overcome", "释义": "克服", "其他拼写": null, "pos": "verb"}, {"序号": 2235, "词频": 47, "单词": "academy", "释义": "学院", "其他拼写": null, "pos": "noun"}, {"序号": 2236, "词频": 47, "单词": "supermarket", "释义": "超级市场", "其他拼写": null, "pos": "noun"}, {"序号": 2237, "词频": 47, "单词": "ambitious", "释义": "有雄心的、艰巨的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2238, "词频": 47, "单词": "roof", "释义": "屋顶", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2239, "词频": 47, "单词": "thief", "释义": "小偷", "其他拼写": null, "pos": "noun"}, {"序号": 2240, "词频": 47, "单词": "accumulate", "释义": "积累", "其他拼写": null, "pos": "verb"}, {"序号": 2241, "词频": 47, "单词": "lonely", "释义": "孤独地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2242, "词频": 47, "单词": "gallon", "释义": "加仑", "其他拼写": null, "pos": "noun"}, {"序号": 2243, "词频": 47, "单词": "tutor", "释义": "导师", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2244, "词频": 46, "单词": "railway", "释义": "铁路", "其他拼写": null, "pos": "noun"}, {"序号": 2245, "词频": 46, "单词": "integrate", "释义": "整合", "其他拼写": null, "pos": "verb"}, {"序号": 2246, "词频": 46, "单词": "exclude", "释义": "不包括", "其他拼写": null, "pos": "verb"}, {"序号": 2247, "词频": 46, "单词": "casual", "释义": "随意的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2248, "词频": 46, "单词": "orient", "释义": "东方、定位、使适应", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2249, "词频": 46, "单词": "component", "释义": "组成部分", "其他拼写": null, "pos": "noun"}, {"序号": 2250, "词频": 46, "单词": "dozen", "释义": "一打", "其他拼写": null, "pos": "noun"}, {"序号": 2251, "词频": 46, "单词": "prosperity", "释义": "繁荣", "其他拼写": null, "pos": "noun"}, {"序号": 2252, "词频": 46, "单词": "badly", "释义": "糟糕、严重地、非常", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2253, "词频": 46, "单词": "diminish", "释义": "削弱、贬低", "其他拼写": null, "pos": "verb"}, {"序号": 2254, "词频": 46, "单词": "imitate", "释义": "模仿、仿造", "其他拼写": null, "pos": "verb"}, {"序号": 2255, "词频": 46, "单词": "intense", "释义": "强烈的、热烈的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2256, "词频": 46, "单词": "occupy", "释义": "占据", "其他拼写": null, "pos": "verb"}, {"序号": 2257, "词频": 46, "单词": "distribute", "释义": "分发、分配", "其他拼写": null, "pos": "verb"}, {"序号": 2258, "词频": 46, "单词": "phase", "释义": "阶段", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2259, "词频": 46, "单词": "intensive", "释义": "密集的", "其他拼写": null, "pos": "noun"}, {"序号": 2260, "词频": 46, "单词": "revise", "释义": "修改", "其他拼写": "revize", "pos": "noun_verb"}, {"序号": 2261, "词频": 46, "单词": "straight", "释义": "直接的", "其他拼写": null, "pos": "noun"}, {"序号": 2262, "词频": 46, "单词": "exceed", "释义": "超过、越过", "其他拼写": null, "pos": "verb"}, {"序号": 2263, "词频": 46, "单词": "glance", "释义": "一瞥", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2264, "词频": 46, "单词": "implement", "释义": "实施、工具", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2265, "词频": 46, "单词": "chronic", "释义": "慢性的、长期的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2266, "词频": 46, "单词": "cup", "释义": "杯子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2267, "词频": 46, "单词": "pension", "释义": "养老金", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2268, "词频": 46, "单词": "storm", "释义": "风暴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2269, "词频": 46, "单词": "sink", "释义": "下沉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2270, "词频": 46, "单词": "beneficial", "释义": "有益的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2271, "词频": 46, "单词": "load", "释义": "装货、装载", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2272, "词频": 46, "单词": "romantic", "释义": "浪漫的、不切实际的", "其他拼写": null, "pos": "noun"}, {"序号": 2273, "词频": 46, "单词": "shelf", "释义": "架子", "其他拼写": null, "pos": "noun"}, {"序号": 2274, "词频": 46, "单词": "destination", "释义": "目的地", "其他拼写": null, "pos": "noun"}, {"序号": 2275, "词频": 46, "单词": "accompany", "释义": "陪伴、为……伴奏", "其他拼写": null, "pos": "verb"}, {"序号": 2276, "词频": 46, "单词": "lock", "释义": "锁", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2277, "词频": 45, "单词": "jury", "释义": "陪审团", "其他拼写": null, "pos": "noun"}, {"序号": 2278, "词频": 45, "单词": "humor", "释义": "幽默、诙谐", "其他拼写": "humour", "pos": "noun_verb"}, {"序号": 2279, "词频": 45, "单词": "desirable", "释义": "称心的、可取的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2280, "词频": 45, "单词": "motion", "释义": "动、提议", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2281, "词频": 45, "单词": "storage", "释义": "储存、库房", "其他拼写": null, "pos": "noun"}, {"序号": 2282, "词频": 45, "单词": "commodity", "释义": "商品", "其他拼写": null, "pos": "noun"}, {"序号": 2283, "词频": 45, "单词": "negotiate", "释义": "谈判、协商", "其他拼写": null, "pos": "verb"}, {"序号": 2284, "词频": 45, "单词": "compromise", "释义": "妥协", "其他拼写": "compromize", "pos": "noun_verb"}, {"序号": 2285, "词频": 45, "单词": "endure", "释义": "忍受、持久", "其他拼写": null, "pos": "verb"}, {"序号": 2286, "词频": 45, "单词": "immune", "释义": "免疫", "其他拼写": null, "pos": "noun"}, {"序号": 2287, "词频": 45, "单词": "pleasant", "释义": "愉快的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2288, "词频": 45, "单词": "celebrate", "释义": "庆祝", "其他拼写": null, "pos": "verb"}, {"序号": 2289, "词频": 45, "单词": "command", "释义": "命令", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2290, "词频": 45, "单词": "span", "释义": "跨度", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2291, "词频": 45, "单词": "norm", "释义": "规范", "其他拼写": null, "pos": "noun"}, {"序号": 2292, "词频": 45, "单词": "hazard", "释义": "危险", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2293, "词频": 45, "单词": "joint", "释义": "共同的、关节", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2294, "词频": 45, "单词": "clerk", "释义": "职员", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2295, "词频": 45, "单词": "arrest", "释义": "逮捕", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2296, "词频": 45, "单词": "dictionary", "释义": "词典", "其他拼写": null, "pos": "noun"}, {"序号": 2297, "词频": 45, "单词": "hate", "释义": "讨厌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2298, "词频": 45, "单词": "magic", "释义": "魔法", "其他拼写": null, "pos": "noun"}, {"序号": 2299, "词频": 45, "单词": "numerous", "释义": "许多的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2300, "词频": 45, "单词": "shoot", "释义": "射击", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2301, "词频": 45, "单词": "song", "释义": "歌曲", "其他拼写": null, "pos": "noun"}, {"序号": 2302, "词频": 45, "单词": "knit", "释义": "编织、针织", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2303, "词频": 45, "单词": "reading", "释义": "读物、读数", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2304, "词频": 44, "单词": "philosopher", "释义": "哲学家", "其他拼写": null, "pos": "noun"}, {"序号": 2305, "词频": 44, "单词": "stranger", "释义": "陌生人", "其他拼写": null, "pos": "noun"}, {"序号": 2306, "词频": 44, "单词": "obscure", "释义": "不为人知、晦涩难懂", "其他拼写": null, "pos": "verb"}, {"序号": 2307, "词频": 44, "单词": "faith", "释义": "信心、信仰", "其他拼写": null, "pos": "noun"}, {"序号": 2308, "词频": 44, "单词": "shock", "释义": "震惊", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2309, "词频": 44, "单词": "strive", "释义": "努力、斗争", "其他拼写": null, "pos": "verb"}, {"序号": 2310, "词频": 44, "单词": "grasp", "释义": "抓住", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2311, "词频": 44, "单词": "passion", "释义": "热情", "其他拼写": null, "pos": "noun"}, {"序号": 2312, "词频": 44, "单词": "settlement", "释义": "解决、移民地", "其他拼写": null, "pos": "noun"}, {"序号": 2313, "词频": 44, "单词": "sudden", "释义": "突然的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2314, "词频": 44, "单词": "biology", "释义": "生物学", "其他拼写": null, "pos": "noun"}, {"序号": 2315, "词频": 44, "单词": "parliament", "释义": "原谅、国会", "其他拼写": null, "pos": "noun"}, {"序号": 2316, "词频": 44, "单词": "map", "释义": "地图", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2317, "词频": 44, "单词": "penalty", "释义": "处罚", "其他拼写": null, "pos": "noun"}, {"序号": 2318, "词频": 44, "单词": "tooth", "释义": "牙齿", "其他拼写": null, "pos": "noun"}, {"序号": 2319, "词频": 44, "单词": "yesterday", "释义": "昨天", "其他拼写": null, "pos": "noun"}, {"序号": 2320, "词频": 44, "单词": "distract", "释义": "使转向、使分心", "其他拼写": null, "pos": "verb"}, {"序号": 2321, "词频": 44, "单词": "enemy", "释义": "敌人", "其他拼写": null, "pos": "noun"}, {"序号": 2322, "词频": 44, "单词": "abstract", "释义": "抽象的、摘要", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2323, "词频": 44, "单词": "automobile", "释义": "汽车", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2324, "词频": 44, "单词": "hungry", "释义": "饥饿的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2325, "词频": 44, "单词": "motivate", "释义": "激发", "其他拼写": null, "pos": "verb"}, {"序号": 2326, "词频": 44, "单词": "possession", "释义": "所有物、财产", "其他拼写": null, "pos": "noun"}, {"序号": 2327, "词频": 44, "单词": "rescue", "释义": "拯救", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2328, "词频": 44, "单词": "calculate", "释义": "计算", "其他拼写": null, "pos": "verb"}, {"序号": 2329, "词频": 44, "单词": "lane", "释义": "小路、泳道", "其他拼写": null, "pos": "noun"}, {"序号": 2330, "词频": 44, "单词": "lift", "释义": "提起", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2331, "词频": 44, "单词": "assembly", "释义": "集合、装配", "其他拼写": null, "pos": "noun"}, {"序号": 2332, "词频": 44, "单词": "rid", "释义": "摆脱", "其他拼写": null, "pos": "verb"}, {"序号": 2333, "词频": 44, "单词": "upper", "释义": "上面的、较高的", "其他拼写": null, "pos": "noun"}, {"序号": 2334, "词频": 44, "单词": "pet", "释义": "宠物", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2335, "词频": 44, "单词": "dish", "释义": "碟子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2336, "词频": 43, "单词": "chart", "释义": "图表", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2337, "词频": 43, "单词": "arrival", "释义": "到达", "其他拼写": null, "pos": "noun"}, {"序号": 2338, "词频": 43, "单词": "kingdom", "释义": "王国", "其他拼写": null, "pos": "noun"}, {"序号": 2339, "词频": 43, "单词": "compose", "释义": "组成、作曲、撰写", "其他拼写": null, "pos": "verb"}, {"序号": 2340, "词频": 43, "单词": "readily", "释义": "快捷地、乐意地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2341, "词频": 43, "单词": "cloud", "释义": "云", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2342, "词频": 43, "单词": "interfere", "释义": "妨碍、介入", "其他拼写": null, "pos": "verb"}, {"序号": 2343, "词频": 43, "单词": "poet", "释义": "诗人", "其他拼写": null, "pos": "noun"}, {"序号": 2344, "词频": 43, "单词": "soul", "释义": "精神、灵魂", "其他拼写": null, "pos": "noun"}, {"序号": 2345, "词频": 43, "单词": "alive", "释义": "活着的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2346, "词频": 43, "单词": "exert", "释义": "用、运用", "其他拼写": null, "pos": "verb"}, {"序号": 2347, "词频": 43, "单词": "pioneer", "释义": "先驱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2348, "词频": 43, "单词": "punish", "释义": "惩罚", "其他拼写": null, "pos": "verb"}, {"序号": 2349, "词频": 43, "单词": "alike", "释义": "与…相似", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2350, "词频": 43, "单词": "interference", "释义": "干涉", "其他拼写": null, "pos": "noun"}, {"序号": 2351, "词频": 43, "单词": "plain", "释义": "平的、朴素的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2352, "词频": 43, "单词": "anger", "释义": "怒气、使发怒", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2353, "词频": 43, "单词": "tiger", "释义": "老虎", "其他拼写": null, "pos": "noun"}, {"序号": 2354, "词频": 43, "单词": "menu", "释义": "菜单", "其他拼写": null, "pos": "noun"}, {"序号": 2355, "词频": 43, "单词": "pilot", "释义": "飞行员", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2356, "词频": 43, "单词": "violent", "释义": "暴力的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2357, "词频": 43, "单词": "bore", "释义": "使厌烦、钻孔", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2358, "词频": 43, "单词": "update", "释义": "更新", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2359, "词频": 43, "单词": "cream", "释义": "奶油", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2360, "词频": 43, "单词": "ton", "释义": "吨、大量", "其他拼写": null, "pos": "noun"}, {"序号": 2361, "词频": 43, "单词": "bomb", "释义": "炸弹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2362, "词频": 43, "单词": "soda", "释义": "苏打", "其他拼写": null, "pos": "noun"}, {"序号": 2363, "词频": 42, "单词": "random", "释义": "随机的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2364, "词频": 42, "单词": "output", "释义": "产量、输出", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2365, "词频": 42, "单词": "prolong", "释义": "延长", "其他拼写": null, "pos": "verb"}, {"序号": 2366, "词频": 42, "单词": "approval", "释义": "赞成", "其他拼写": null, "pos": "noun"}, {"序号": 2367, "词频": 42, "单词": "extension", "释义": "延伸", "其他拼写": null, "pos": "noun"}, {"序号": 2368, "词频": 42, "单词": "surgery", "释义": "外科手术", "其他拼写": null, "pos": "noun"}, {"序号": 2369, "词频": 42, "单词": "shut", "释义": "关上", "其他拼写": null, "pos": "verb"}, {"序号": 2370, "词频": 42, "单词": "ring", "释义": "响起", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2371, "词频": 42, "单词": "platform", "释义": "平台", "其他拼写": null, "pos": "noun"}, {"序号": 2372, "词频": 42, "单词": "enforce", "释义": "强迫", "其他拼写": null, "pos": "verb"}, {"序号": 2373, "词频": 42, "单词": "battery", "释义": "电池", "其他拼写": null, "pos": "noun"}, {"序号": 2374, "词频": 42, "单词": "convenience", "释义": "便利", "其他拼写": null, "pos": "noun"}, {"序号": 2375, "词频": 42, "单词": "silicon", "释义": "硅", "其他拼写": null, "pos": "noun"}, {"序号": 2376, "词频": 42, "单词": "impress", "释义": "留下印象", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2377, "词频": 42, "单词": "hunger", "释义": "饥饿、渴望", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2378, "词频": 42, "单词": "rice", "释义": "稻、大米", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2379, "词频": 42, "单词": "tragedy", "释义": "悲剧", "其他拼写": null, "pos": "noun"}, {"序号": 2380, "词频": 42, "单词": "policeman", "释义": "警察", "其他拼写": null, "pos": "noun"}, {"序号": 2381, "词频": 42, "单词": "fatigue", "释义": "疲劳", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2382, "词频": 42, "单词": "wheat", "释义": "小麦", "其他拼写": null, "pos": "noun"}, {"序号": 2383, "词频": 41, "单词": "formation", "释义": "形成", "其他拼写": null, "pos": "noun"}, {"序号": 2384, "词频": 41, "单词": "draft", "释义": "草稿、起草", "其他拼写": "draught", "pos": "noun_verb"}, {"序号": 2385, "词频": 41, "单词": "dominant", "释义": "支配的", "其他拼写": null, "pos": "noun"}, {"序号": 2386, "词频": 41, "单词": "verb", "释义": "动词", "其他拼写": null, "pos": "noun"}, {"序号": 2387, "词频": 41, "单词": "epidemic", "释义": "流行性的、流行病", "其他拼写": null, "pos": "noun"}, {"序号": 2388, "词频": 41, "单词": "impulse", "释义": "冲动", "其他拼写": null, "pos": "noun"}, {"序号": 2389, "词频": 41, "单词": "shelter", "释义": "庇护所", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2390, "词频": 41, "单词": "subtle", "释义": "微妙的、细微的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2391, "词频": 41, "单词": "forth", "释义": "向前、离开、产生、拿出", "其他拼写": null, "pos": "noun"}, {"序号": 2392, "词频": 41, "单词": "oblige", "释义": "强迫", "其他拼写": null, "pos": "verb"}, {"序号": 2393, "词频": 41, "单词": "spouse", "释义": "配偶", "其他拼写": null, "pos": "noun"}, {"序号": 2394, "词频": 41, "单词": "tension", "释义": "张力、紧张", "其他拼写": null, "pos": "noun"}, {"序号": 2395, "词频": 41, "单词": "bargain", "释义": "廉价货、交易", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2396, "词频": 41, "单词": "chicken", "释义": "小鸡", "其他拼写": null, "pos": "noun"}, {"序号": 2397, "词频": 41, "单词": "comprehensive", "释义": "广泛的、全部的", "其他拼写": null, "pos": "noun"}, {"序号": 2398, "词频": 41, "单词": "limitation", "释义": "限制", "其他拼写": null, "pos": "noun"}, {"序号": 2399, "词频": 41, "单词": "weekly", "释义": "每周的、周刊", "其他拼写": null, "pos": "noun"}, {"序号": 2400, "词频": 41, "单词": "foster", "释义": "培养、培育", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2401, "词频": 41, "单词": "nutrition", "释义": "营养", "其他拼写": null, "pos": "noun"}, {"序号": 2402, "词频": 41, "单词": "suburb", "释义": "市郊", "其他拼写": null, "pos": "noun"}, {"序号": 2403, "词频": 41, "单词": "foreigner", "释义": "外国人", "其他拼写": null, "pos": "noun"}, {"序号": 2404, "词频": 41, "单词": "boundary", "释义": "界限", "其他拼写": null, "pos": "noun"}, {"序号": 2405, "词频": 41, "单词": "conform", "释义": "符合、遵照", "其他拼写": null, "pos": "verb"}, {"序号": 2406, "词频": 41, "单词": "exploit", "释义": "开发、利用", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2407, "词频": 41, "单词": "gesture", "释义": "手势、姿态", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2408, "词频": 41, "单词": "obligation", "释义": "义务", "其他拼写": null, "pos": "noun"}, {"序号": 2409, "词频": 41, "单词": "sweet", "释义": "甜的", "其他拼写": null, "pos": "noun"}, {"序号": 2410, "词频": 41, "单词": "absent", "释义": "不在场的、漫不经心的", "其他拼写": null, "pos": "verb"}, {"序号": 2411, "词频": 41, "单词": "deficit", "释义": "赤字", "其他拼写": null, "pos": "noun"}, {"序号": 2412, "词频": 40, "单词": "mode", "释义": "模式、状态", "其他拼写": null, "pos": "noun"}, {"序号": 2413, "词频": 40, "单词": "crude", "释义": "粗鲁的、简陋的", "其他拼写": null, "pos": "noun"}, {"序号": 2414, "词频": 40, "单词": "mechanical", "释义": "机械的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2415, "词频": 40, "单词": "govern", "释义": "统治、决定", "其他拼写": null, "pos": "verb"}, {"序号": 2416, "词频": 40, "单词": "evident", "释义": "明显的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2417, "词频": 40, "单词": "explosion", "释义": "爆炸", "其他拼写": null, "pos": "noun"}, {"序号": 2418, "词频": 40, "单词": "render", "释义": "使得、给予", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2419, "词频": 40, "单词": "layer", "释义": "层", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2420, "词频": 40, "单词": "melt", "释义": "融化、溶解", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2421, "词频": 40, "单词": "caution", "释义": "谨慎、警告", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2422, "词频": 40, "单词": "transmit", "释义": "传送、发射", "其他拼写": null, "pos": "verb"}, {"序号": 2423, "词频": 40, "单词": "automatic", "释义": "自动的", "其他拼写": null, "pos": "noun"}, {"序号": 2424, "词频": 40, "单词": "globe", "释义": "球体、地球", "其他拼写": null, "pos": "noun"}, {"序号": 2425, "词频": 40, "单词": "division", "释义": "分开、部门", "其他拼写": null, "pos": "noun"}, {"序号": 2426, "词频": 40, "单词": "proceed", "释义": "继续进行", "其他拼写": null, "pos": "verb"}, {"序号": 2427, "词频": 40, "单词": "compel", "释义": "迫使", "其他拼写": null, "pos": "verb"}, {"序号": 2428, "词频": 40, "单词": "primitive", "释义": "原始的、简单的", "其他拼写": null, "pos": "noun"}, {"序号": 2429, "词频": 40, "单词": "steady", "释义": "稳定的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2430, "词频": 40, "单词": "territory", "释义": "领土、领域", "其他拼写": null, "pos": "noun"}, {"序号": 2431, "词频": 40, "单词": "gallery", "释义": "画廊、长廊", "其他拼写": null, "pos": "noun"}, {"序号": 2432, "词频": 40, "单词": "lower", "释义": "较低的、下级的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2433, "词频": 40, "单词": "maintenance", "释义": "维护", "其他拼写": null, "pos": "noun"}, {"序号": 2434, "词频": 40, "单词": "corner", "释义": "角落", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2435, "词频": 40, "单词": "pop", "释义": "流行的、突然出现", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2436, "词频": 40, "单词": "somewhere", "释义": "在某处", "其他拼写": null, "pos": "noun"}, {"序号": 2437, "词频": 40, "单词": "accuse", "释义": "控告", "其他拼写": null, "pos": "verb"}, {"序号": 2438, "词频": 40, "单词": "neutral", "释义": "中立的、中性的", "其他拼写": null, "pos": "noun"}, {"序号": 2439, "词频": 40, "单词": "renew", "释义": "更新、补充", "其他拼写": null, "pos": "verb"}, {"序号": 2440, "词频": 40, "单词": "fifteen", "释义": "十五", "其他拼写": null, "pos": "noun"}, {"序号": 2441, "词频": 40, "单词": "harvest", "释义": "收获", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2442, "词频": 40, "单词": "mouse", "释义": "鼠", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2443, "词频": 40, "单词": "fox", "释义": "狐狸", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2444, "词频": 40, "单词": "liquid", "释义": "液体", "其他拼写": null, "pos": "noun"}, {"序号": 2445, "词频": 39, "单词": "ancestor", "释义": "祖先", "其他拼写": null, "pos": "noun"}, {"序号": 2446, "词频": 39, "单词": "triumph", "释义": "胜利", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2447, "词频": 39, "单词": "folk", "释义": "民间音乐、人们", "其他拼写": null, "pos": "noun"}, {"序号": 2448, "词频": 39, "单词": "guilty", "释义": "内疚", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2449, "词频": 39, "单词": "permission", "释义": "允许、许可", "其他拼写": null, "pos": "noun"}, {"序号": 2450, "词频": 39, "单词": "pour", "释义": "倾倒", "其他拼写": "por", "pos": "verb"}, {"序号": 2451, "词频": 39, "单词": "equivalent", "释义": "相同的", "其他拼写": null, "pos": "noun"}, {"序号": 2452, "词频": 39, "单词": "ultimate", "释义": "终极", "其他拼写": null, "pos": "noun"}, {"序号": 2453, "词频": 39, "单词": "excess", "释义": "过剩、过量", "其他拼写": null, "pos": "noun"}, {"序号": 2454, "词频": 39, "单词": "stream", "释义": "溪流、流淌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2455, "词频": 39, "单词": "vice", "释义": "恶习、邪恶、缺点", "其他拼写": "vise", "pos": "noun"}, {"序号": 2456, "词频": 39, "单词": "coal", "释义": "煤", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2457, "词频": 39, "单词": "setback", "释义": "挫折", "其他拼写": null, "pos": "noun"}, {"序号": 2458, "词频": 39, "单词": "deadline", "释义": "最后期限", "其他拼写": null, "pos": "noun"}, {"序号": 2459, "词频": 39, "单词": "spelling", "释义": "拼写", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2460, "词频": 39, "单词": "hinder", "释义": "阻碍", "其他拼写": null, "pos": "verb"}, {"序号": 2461, "词频": 39, "单词": "ear", "释义": "耳朵", "其他拼写": null, "pos": "noun"}, {"序号": 2462, "词频": 39, "单词": "session", "释义": "会议、阶段", "其他拼写": null, "pos": "noun"}, {"序号": 2463, "词频": 39, "单词": "fond", "释义": "喜欢", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2464, "词频": 39, "单词": "musician", "释义": "音乐家", "其他拼写": null, "pos": "noun"}, {"序号": 2465, "词频": 39, "单词": "narrative", "释义": "叙述", "其他拼写": null, "pos": "noun"}, {"序号": 2466, "词频": 39, "单词": "classic", "释义": "传统的、古典的", "其他拼写": null, "pos": "noun"}, {"序号": 2467, "词频": 39, "单词": "dislike", "释义": "不喜欢", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2468, "词频": 39, "单词": "semester", "释义": "学期", "其他拼写": null, "pos": "noun"}, {"序号": 2469, "词频": 38, "单词": "province", "释义": "省", "其他拼写": null, "pos": "noun"}, {"序号": 2470, "词频": 38, "单词": "column", "释义": "列", "其他拼写": null, "pos": "noun"}, {"序号": 2471, "词频": 38, "单词": "hence", "释义": "因此", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2472, "词频": 38, "单词": "celebrity", "释义": "名人", "其他拼写": null, "pos": "noun"}, {"序号": 2473, "词频": 38, "单词": "prior", "释义": "优先的、在前的", "其他拼写": null, "pos": "noun"}, {"序号": 2474, "词频": 38, "单词": "forever", "释义": "永远", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2475, "词频": 38, "单词": "machinery", "释义": "机械", "其他拼写": null, "pos": "noun"}, {"序号": 2476, "词频": 38, "单词": "census", "释义": "人口普查", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2477, "词频": 38, "单词": "fade", "释义": "消退、消逝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2478, "词频": 38, "单词": "addict", "释义": "上瘾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2479, "词频": 38, "单词": "anyway", "释义": "无论如何", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2480, "词频": 38, "单词": "tolerant", "释义": "宽容的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2481, "词频": 38, "单词": "architecture", "释义": "结构", "其他拼写": null, "pos": "noun"}, {"序号": 2482, "词频": 38, "单词": "curb", "释义": "抑制", "其他拼写": "kerb", "pos": "noun_verb"}, {"序号": 2483, "词频": 38, "单词": "entrepreneur", "释义": "企业家", "其他拼写": null, "pos": "noun"}, {"序号": 2484, "词频": 38, "单词": "forecast", "释义": "预测", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2485, "词频": 38, "单词": "controversial", "释义": "有争议的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2486, "词频": 38, "单词": "ladder", "释义": "梯子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2487, "词频": 38, "单词": "moon", "释义": "月球、月亮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2488, "词频": 38, "单词": "oppose", "释义": "反对", "其他拼写": null, "pos": "verb"}, {"序号": 2489, "词频": 38, "单词": "subsidy", "释义": "津贴", "其他拼写": null, "pos": "noun"}, {"序号": 2490, "词频": 38, "单词": "confusion", "释义": "混乱", "其他拼写": null, "pos": "noun"}, {"序号": 2491, "词频": 38, "单词": "enthusiasm", "释义": "热情", "其他拼写": null, "pos": "noun"}, {"序号": 2492, "词频": 38, "单词": "somehow", "释义": "以某种方式", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2493, "词频": 38, "单词": "birthday", "释义": "生日", "其他拼写": null, "pos": "noun"}, {"序号": 2494, "词频": 38, "单词": "inferior", "释义": "下级、较差的", "其他拼写": null, "pos": "noun"}, {"序号": 2495, "词频": 38, "单词": "fake", "释义": "伪造、假的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2496, "词频": 38, "单词": "frequency", "释义": "频率", "其他拼写": null, "pos": "noun"}, {"序号": 2497, "词频": 38, "单词": "pile", "释义": "堆", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2498, "词频": 38, "单词": "realistic", "释义": "现实的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2499, "词频": 38, "单词": "therapy", "释义": "治疗", "其他拼写": null, "pos": "noun"}, {"序号": 2500, "词频": 38, "单词": "dirty", "释义": "脏的", "其他拼写": null, "pos": "verb"}, {"序号": 2501, "词频": 38, "单词": "disturb", "释义": "打扰", "其他拼写": null, "pos": "verb"}, {"序号": 2502, "词频": 38, "单词": "biography", "释义": "传记", "其他拼写": null, "pos": "noun"}, {"序号": 2503, "词频": 38, "单词": "outstanding", "释义": "杰出的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2504, "词频": 38, "单词": "tower", "释义": "塔", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2505, "词频": 38, "单词": "wedding", "释义": "婚礼", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2506, "词频": 37, "单词": "painful", "释义": "痛苦的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2507, "词频": 37, "单词": "confine", "释义": "限制", "其他拼写": null, "pos": "verb"}, {"序号": 2508, "词频": 37, "单词": "assemble", "释义": "装配、召集", "其他拼写": null, "pos": "verb"}, {"序号": 2509, "词频": 37, "单词": "colony", "释义": "殖民地", "其他拼写": null, "pos": "noun"}, {"序号": 2510, "词频": 37, "单词": "wheel", "释义": "轮子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2511, "词频": 37, "单词": "literally", "释义": "逐字地、简直", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2512, "词频": 37, "单词": "worthy", "释义": "有价值的、值得的", "其他拼写": null, "pos": "noun"}, {"序号": 2513, "词频": 37, "单词": "crack", "释义": "裂缝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2514, "词频": 37, "单词": "panic", "释义": "惊慌的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2515, "词频": 37, "单词": "upgrade", "释义": "升级", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2516, "词频": 37, "单词": "supplement", "释义": "补充", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2517, "词频": 37, "单词": "till", "释义": "直到……为止", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2518, "词频": 37, "单词": "compound", "释义": "化合物", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2519, "词频": 37, "单词": "decorate", "释义": "装饰", "其他拼写": null, "pos": "verb"}, {"序号": 2520, "词频": 37, "单词": "rough", "释义": "粗糙的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2521, "词频": 37, "单词": "scope", "释义": "范围", "其他拼写": null, "pos": "noun"}, {"序号": 2522, "词频": 37, "单词": "advertise", "释义": "打广告", "其他拼写": "advertize", "pos": "verb"}, {"序号": 2523, "词频": 37, "单词": "fancy", "释义": "幻想、想象", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2524, "词频": 37, "单词": "sympathetic", "释义": "同情的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2525, "词频": 37, "单词": "clever", "释义": "聪明的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2526, "词频": 37, "单词": "fashionable", "释义": "时髦的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2527, "词频": 37, "单词": "hurry", "释义": "匆忙的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2528, "词频": 37, "单词": "organism", "释义": "有机体", "其他拼写": null, "pos": "noun"}, {"序号": 2529, "词频": 37, "单词": "loyalty", "释义": "忠诚", "其他拼写": null, "pos": "noun"}, {"序号": 2530, "词频": 37, "单词": "prohibit", "释义": "禁止", "其他拼写": null, "pos": "verb"}, {"序号": 2531, "词频": 37, "单词": "alliance", "释义": "联盟", "其他拼写": null, "pos": "noun"}, {"序号": 2532, "词频": 37, "单词": "copyright", "释义": "版权", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2533, "词频": 37, "单词": "expertise", "释义": "专业知识", "其他拼写": "expertize", "pos": "noun"}, {"序号": 2534, "词频": 37, "单词": "leg", "释义": "腿", "其他拼写": null, "pos": "noun"}, {"序号": 2535, "词频": 37, "单词": "spite", "释义": "恶意、怨恨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2536, "词频": 36, "单词": "suicide", "释义": "自杀", "其他拼写": null, "pos": "noun"}, {"序号": 2537, "词频": 36, "单词": "acquisition", "释义": "收购、习得", "其他拼写": null, "pos": "noun"}, {"序号": 2538, "词频": 36, "单词": "pole", "释义": "杆", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2539, "词频": 36, "单词": "democracy", "释义": "民主", "其他拼写": null, "pos": "noun"}, {"序号": 2540, "词频": 36, "单词": "consequently", "释义": "因此", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2541, "词频": 36, "单词": "fame", "释义": "名声", "其他拼写": null, "pos": "noun"}, {"序号": 2542, "词频": 36, "单词": "fulfil", "释义": "履行", "其他拼写": "fulfill", "pos": "verb"}, {"序号": 2543, "词频": 36, "单词": "logical", "释义": "合理的、符合逻辑的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2544, "词频": 36, "单词": "mankind", "释义": "人类", "其他拼写": null, "pos": "noun"}, {"序号": 2545, "词频": 36, "单词": "monetary", "释义": "货币的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2546, "词频": 36, "单词": "nose", "释义": "鼻子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2547, "词频": 36, "单词": "combat", "释义": "战斗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2548, "词频": 36, "单词": "motive", "释义": "动机", "其他拼写": null, "pos": "noun"}, {"序号": 2549, "词频": 36, "单词": "variation", "释义": "变化", "其他拼写": null, "pos": "noun"}, {"序号": 2550, "词频": 36, "单词": "harsh", "释义": "严厉的、恶劣的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2551, "词频": 36, "单词": "provision", "释义": "提供、供给", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2552, "词频": 36, "单词": "temper", "释义": "脾气", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2553, "词频": 36, "单词": "exhaust", "释义": "耗尽", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2554, "词频": 36, "单词": "holder", "释义": "持有者", "其他拼写": null, "pos": "noun"}, {"序号": 2555, "词频": 36, "单词": "linguistic", "释义": "语言的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2556, "词频": 36, "单词": "mine", "释义": "我的、矿", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2557, "词频": 36, "单词": "servant", "释义": "仆人", "其他拼写": null, "pos": "noun"}, {"序号": 2558, "词频": 36, "单词": "reflection", "释义": "反射", "其他拼写": null, "pos": "noun"}, {"序号": 2559, "词频": 36, "单词": "bread", "释义": "面包", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2560, "词频": 36, "单词": "golden", "释义": "金色的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2561, "词频": 36, "单词": "precious", "释义": "宝贵的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2562, "词频": 36, "单词": "accommodation", "释义": "住处、和解", "其他拼写": null, "pos": "noun"}, {"序号": 2563, "词频": 36, "单词": "charm", "释义": "魅力", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2564, "词频": 36, "单词": "consistent", "释义": "一致的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2565, "词频": 36, "单词": "distinct", "释义": "不同的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2566, "词频": 36, "单词": "edit", "释义": "编辑", "其他拼写": null, "pos": "verb"}, {"序号": 2567, "词频": 36, "单词": "housework", "释义": "家务", "其他拼写": null, "pos": "noun"}, {"序号": 2568, "词频": 36, "单词": "lifetime", "释义": "一生", "其他拼写": null, "pos": "noun"}, {"序号": 2569, "词频": 36, "单词": "shirt", "释义": "衬衫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2570, "词频": 36, "单词": "amid", "释义": "在其间", "其他拼写": null, "pos": "other"}, {"序号": 2571, "词频": 36, "单词": "identical", "释义": "相同的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2572, "词频": 36, "单词": "instruct", "释义": "指导", "其他拼写": null, "pos": "verb"}, {"序号": 2573, "词频": 36, "单词": "jacket", "释义": "夹克", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2574, "词频": 36, "单词": "sake", "释义": "缘故、目的", "其他拼写": null, "pos": "noun"}, {"序号": 2575, "词频": 36, "单词": "virus", "释义": "病毒", "其他拼写": null, "pos": "noun"}, {"序号": 2576, "词频": 36, "单词": "wound", "释义": "受伤的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2577, "词频": 36, "单词": "beer", "释义": "啤酒", "其他拼写": null, "pos": "noun"}, {"序号": 2578, "词频": 36, "单词": "refugee", "释义": "难民", "其他拼写": null, "pos": "noun"}, {"序号": 2579, "词频": 36, "单词": "nap", "释义": "小睡", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2580, "词频": 35, "单词": "classical", "释义": "古典的", "其他拼写": null, "pos": "noun"}, {"序号": 2581, "词频": 35, "单词": "sequence", "释义": "顺序", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2582, "词频": 35, "单词": "systematic", "释义": "系统的、成体系的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2583, "词频": 35, "单词": "horizon", "释义": "地平线", "其他拼写": null, "pos": "noun"}, {"序号": 2584, "词频": 35, "单词": "apparent", "释义": "明显的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2585, "词频": 35, "单词": "guidance", "释义": "指导", "其他拼写": null, "pos": "noun"}, {"序号": 2586, "词频": 35, "单词": "passive", "释义": "被动的", "其他拼写": null, "pos": "noun"}, {"序号": 2587, "词频": 35, "单词": "creature", "释义": "生物", "其他拼写": null, "pos": "noun"}, {"序号": 2588, "词频": 35, "单词": "fierce", "释义": "凶猛的、激烈的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2589, "词频": 35, "单词": "mix", "释义": "混合", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2590, "词频": 35, "单词": "trigger", "释义": "触发", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2591, "词频": 35, "单词": "cue", "释义": "提示、暗示", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2592, "词频": 35, "单词": "disable", "释义": "失去能力", "其他拼写": "dizable", "pos": "verb"}, {"序号": 2593, "词频": 35, "单词": "hostile", "释义": "敌对的", "其他拼写": null, "pos": "noun"}, {"序号": 2594, "词频": 35, "单词": "integrity", "释义": "诚实正直、完整", "其他拼写": null, "pos": "noun"}, {"序号": 2595, "词频": 35, "单词": "precise", "释义": "精确的", "其他拼写": "precize", "pos": "adj_adv"}, {"序号": 2596, "词频": 35, "单词": "suppress", "释义": "压制、镇压", "其他拼写": null, "pos": "verb"}, {"序号": 2597, "词频": 35, "单词": "blow", "释义": "吹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2598, "词频": 35, "单词": "bone", "释义": "骨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2599, "词频": 35, "单词": "gate", "释义": "门", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2600, "词频": 35, "单词": "abundant", "释义": "丰富的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2601, "词频": 35, "单词": "appliance", "释义": "装置、应用", "其他拼写": null, "pos": "noun"}, {"序号": 2602, "词频": 35, "单词": "relax", "释义": "放松", "其他拼写": null, "pos": "verb"}, {"序号": 2603, "词频": 35, "单词": "smooth", "释义": "光滑的、顺利的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2604, "词频": 35, "单词": "appetite", "释义": "食欲", "其他拼写": null, "pos": "noun"}, {"序号": 2605, "词频": 35, "单词": "currency", "释义": "货币", "其他拼写": null, "pos": "noun"}, {"序号": 2606, "词频": 35, "单词": "laundry", "释义": "洗衣", "其他拼写": null, "pos": "noun"}, {"序号": 2607, "词频": 35, "单词": "bicycle", "释义": "自行车", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2608, "词频": 35, "单词": "skirt", "释义": "裙子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2609, "词频": 35, "单词": "eastern", "释义": "东部的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2610, "词频": 35, "单词": "lion", "释义": "狮子", "其他拼写": null, "pos": "noun"}, {"序号": 2611, "词频": 35, "单词": "toilet", "释义": "厕所", "其他拼写": null, "pos": "noun"}, {"序号": 2612, "词频": 34, "单词": "guilt", "释义": "内疚", "其他拼写": null, "pos": "noun"}, {"序号": 2613, "词频": 34, "单词": "tolerance", "释义": "宽容、容忍", "其他拼写": null, "pos": "noun"}, {"序号": 2614, "词频": 34, "单词": "parallel", "释义": "平行的、类似的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2615, "词频": 34, "单词": "instinct", "释义": "本能", "其他拼写": null, "pos": "noun"}, {"序号": 2616, "词频": 34, "单词": "premium", "释义": "保险费、优质的", "其他拼写": null, "pos": "noun"}, {"序号": 2617, "词频": 34, "单词": "shuttle", "释义": "航天飞机", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2618, "词频": 34, "单词": "collective", "释义": "集体的、共同的", "其他拼写": null, "pos": "noun"}, {"序号": 2619, "词频": 34, "单词": "flash", "释义": "闪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2620, "词频": 34, "单词": "continuous", "释义": "连续的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2621, "词频": 34, "单词": "resistant", "释义": "抵抗的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2622, "词频": 34, "单词": "variable", "释义": "变量、多变的", "其他拼写": null, "pos": "noun"}, {"序号": 2623, "词频": 34, "单词": "visible", "释义": "可见的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2624, "词频": 34, "单词": "withdraw", "释义": "退出、撤退", "其他拼写": null, "pos": "verb"}, {"序号": 2625, "词频": 34, "单词": "elaborate", "释义": "复杂的、详尽的", "其他拼写": null, "pos": "verb"}, {"序号": 2626, "词频": 34, "单词": "guess", "释义": "猜测", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2627, "词频": 34, "单词": "indispensable", "释义": "不可缺少的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2628, "词频": 34, "单词": "sweep", "释义": "扫地", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2629, "词频": 34, "单词": "concrete", "释义": "具体的、确实的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2630, "词频": 34, "单词": "electrical", "释义": "电的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2631, "词频": 34, "单词": "governor", "释义": "统治者", "其他拼写": null, "pos": "noun"}, {"序号": 2632, "词频": 34, "单词": "incline", "释义": "倾斜、斜坡", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2633, "词频": 34, "单词": "mount", "释义": "山", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2634, "词频": 34, "单词": "straightforward", "释义": "坦率的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2635, "词频": 34, "单词": "habitat", "释义": "栖息地", "其他拼写": null, "pos": "noun"}, {"序号": 2636, "词频": 34, "单词": "spoil", "释义": "破坏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2637, "词频": 34, "单词": "companion", "释义": "陪伴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2638, "词频": 34, "单词": "quarrel", "释义": "争吵", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2639, "词频": 34, "单词": "sorry", "释义": "抱歉", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2640, "词频": 34, "单词": "bureau", "释义": "办事处", "其他拼写": null, "pos": "noun"}, {"序号": 2641, "词频": 34, "单词": "heritage", "释义": "遗产", "其他拼写": null, "pos": "noun"}, {"序号": 2642, "词频": 34, "单词": "mask", "释义": "面具", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2643, "词频": 34, "单词": "coat", "释义": "外套", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2644, "词频": 34, "单词": "countryside", "释义": "农村", "其他拼写": null, "pos": "noun"}, {"序号": 2645, "词频": 34, "单词": "dynamic", "释义": "动力、动态的", "其他拼写": null, "pos": "noun"}, {"序号": 2646, "词频": 34, "单词": "format", "释义": "版式、设计", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2647, "词频": 34, "单词": "secondary", "释义": "次要的", "其他拼写": null, "pos": "noun"}, {"序号": 2648, "词频": 34, "单词": "coin", "释义": "硬币", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2649, "词频": 34, "单词": "deposit", "释义": "存款", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2650, "词频": 34, "单词": "install", "释义": "安装", "其他拼写": null, "pos": "verb"}, {"序号": 2651, "词频": 34, "单词": "tremendous", "释义": "巨大的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2652, "词频": 33, "单词": "voluntary", "释义": "自愿的", "其他拼写": null, "pos": "noun"}, {"序号": 2653, "词频": 33, "单词": "accuracy", "释义": "精确度", "其他拼写": null, "pos": "noun"}, {"序号": 2654, "词频": 33, "单词": "silver", "释义": "银", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2655, "词频": 33, "单词": "shame", "释义": "羞愧", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2656, "词频": 33, "单词": "patience", "释义": "耐心", "其他拼写": null, "pos": "noun"}, {"序号": 2657, "词频": 33, "单词": "ambiguous", "释义": "模棱两可的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2658, "词频": 33, "单词": "suspicious", "释义": "可疑的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2659, "词频": 33, "单词": "polite", "释义": "礼貌的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2660, "词频": 33, "单词": "courage", "释义": "勇气", "其他拼写": "corage", "pos": "noun"}, {"序号": 2661, "词频": 33, "单词": "noble", "释义": "贵族的", "其他拼写": null, "pos": "noun"}, {"序号": 2662, "词频": 33, "单词": "suspend", "释义": "暂停", "其他拼写": null, "pos": "verb"}, {"序号": 2663, "词频": 33, "单词": "undermine", "释义": "逐渐削弱", "其他拼写": null, "pos": "verb"}, {"序号": 2664, "词频": 33, "单词": "deliberate", "释义": "深思熟虑的、故意的", "其他拼写": null, "pos": "verb"}, {"序号": 2665, "词频": 33, "单词": "operator", "释义": "操作人员", "其他拼写": null, "pos": "noun"}, {"序号": 2666, "词频": 33, "单词": "substitute", "释义": "代替", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2667, "词频": 33, "单词": "fare", "释义": "车费", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2668, "词频": 33, "单词": "pollute", "释义": "污染", "其他拼写": null, "pos": "verb"}, {"序号": 2669, "词频": 33, "单词": "prominent", "释义": "突出的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2670, "词频": 33, "单词": "thick", "释义": "厚的", "其他拼写": null, "pos": "noun"}, {"序号": 2671, "词频": 33, "单词": "enrich", "释义": "丰富", "其他拼写": null, "pos": "verb"}, {"序号": 2672, "词频": 33, "单词": "guy", "释义": "家伙", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2673, "词频": 32, "单词": "verbal", "释义": "语言的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2674, "词频": 32, "单词": "behalf", "释义": "代表", "其他拼写": null, "pos": "noun"}, {"序号": 2675, "词频": 32, "单词": "tolerate", "释义": "容忍", "其他拼写": null, "pos": "verb"}, {"序号": 2676, "词频": 32, "单词": "peculiar", "释义": "独特的、特殊的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2677, "词频": 32, "单词": "hemisphere", "释义": "半球", "其他拼写": null, "pos": "noun"}, {"序号": 2678, "词频": 32, "单词": "pure", "释义": "纯粹的、纯的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2679, "词频": 32, "单词": "outlook", "释义": "前景", "其他拼写": null, "pos": "noun"}, {"序号": 2680, "词频": 32, "单词": "rear", "释义": "后方、培育", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2681, "词频": 32, "单词": "comparable", "释义": "可比较的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2682, "词频": 32, "单词": "cast", "释义": "投射、铸造", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2683, "词频": 32, "单词": "mutual", "释义": "相互的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2684, "词频": 32, "单词": "organisation", "释义": "组织", "其他拼写": "organization", "pos": "noun"}, {"序号": 2685, "词频": 32, "单词": "row", "释义": "行、排", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2686, "词频": 32, "单词": "cheer", "释义": "欢呼", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2687, "词频": 32, "单词": "intensity", "释义": "强度", "其他拼写": null, "pos": "noun"}, {"序号": 2688, "词频": 32, "单词": "nurture", "释义": "培育", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2689, "词频": 32, "单词": "esteem", "释义": "尊敬", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2690, "词频": 32, "单词": "liberate", "释义": "解放", "其他拼写": null, "pos": "verb"}, {"序号": 2691, "词频": 32, "单词": "tennis", "释义": "网球", "其他拼写": null, "pos": "noun"}, {"序号": 2692, "词频": 32, "单词": "acceptance", "释义": "接受", "其他拼写": null, "pos": "noun"}, {"序号": 2693, "词频": 32, "单词": "consensus", "释义": "共识", "其他拼写": null, "pos": "noun"}, {"序号": 2694, "词频": 32, "单词": "cotton", "释义": "棉花", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2695, "词频": 32, "单词": "nerve", "释义": "神经", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2696, "词频": 32, "单词": "persist", "释义": "坚持", "其他拼写": null, "pos": "verb"}, {"序号": 2697, "词频": 32, "单词": "undergo", "释义": "经历", "其他拼写": null, "pos": "verb"}, {"序号": 2698, "词频": 32, "单词": "wallet", "释义": "钱包", "其他拼写": null, "pos": "noun"}, {"序号": 2699, "词频": 32, "单词": "wash", "释义": "洗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2700, "词频": 32, "单词": "asleep", "释义": "睡着", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2701, "词频": 32, "单词": "fate", "释义": "命运", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2702, "词频": 32, "单词": "chat", "释义": "聊天", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2703, "词频": 32, "单词": "forty", "释义": "四十", "其他拼写": null, "pos": "noun"}, {"序号": 2704, "词频": 32, "单词": "impressive", "释义": "印象深刻的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2705, "词频": 32, "单词": "spur", "释义": "刺激、促进", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2706, "词频": 32, "单词": "forbid", "释义": "禁止", "其他拼写": null, "pos": "verb"}, {"序号": 2707, "词频": 32, "单词": "rational", "释义": "理性的", "其他拼写": null, "pos": "noun"}, {"序号": 2708, "词频": 32, "单词": "heel", "释义": "脚后跟", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2709, "词频": 31, "单词": "desperate", "释义": "绝望的、不顾一切的", "其他拼写": null, "pos": "noun"}, {"序号": 2710, "词频": 31, "单词": "twelve", "释义": "十二", "其他拼写": null, "pos": "noun"}, {"序号": 2711, "词频": 31, "单词": "hesitate", "释义": "犹豫", "其他拼写": null, "pos": "verb"}, {"序号": 2712, "词频": 31, "单词": "index", "释义": "索引", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2713, "词频": 31, "单词": "attain", "释义": "达到、获得", "其他拼写": null, "pos": "verb"}, {"序号": 2714, "词频": 31, "单词": "frighten", "释义": "害怕、惊吓", "其他拼写": null, "pos": "verb"}, {"序号": 2715, "词频": 31, "单词": "appoint", "释义": "任命、安排、约定", "其他拼写": null, "pos": "verb"}, {"序号": 2716, "词频": 31, "单词": "drama", "释义": "戏剧", "其他拼写": null, "pos": "noun"}, {"序号": 2717, "词频": 31, "单词": "satisfactory", "释义": "令人满意的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2718, "词频": 31, "单词": "thesis", "释义": "论文", "其他拼写": null, "pos": "noun"}, {"序号": 2719, "词频": 31, "单词": "clue", "释义": "线索", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2720, "词频": 31, "单词": "defeat", "释义": "击败", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2721, "词频": 31, "单词": "oxygen", "释义": "氧", "其他拼写": null, "pos": "noun"}, {"序号": 2722, "词频": 31, "单词": "ball", "释义": "球", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2723, "词频": 31, "单词": "exclusive", "释义": "独有的", "其他拼写": null, "pos": "noun"}, {"序号": 2724, "词频": 31, "单词": "headache", "释义": "头痛", "其他拼写": null, "pos": "noun"}, {"序号": 2725, "词频": 31, "单词": "membership", "释义": "会员", "其他拼写": null, "pos": "noun"}, {"序号": 2726, "词频": 31, "单词": "twin", "释义": "双胞胎", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2727, "词频": 31, "单词": "underground", "释义": "地下", "其他拼写": null, "pos": "noun"}, {"序号": 2728, "词频": 31, "单词": "upward", "释义": "向上", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2729, "词频": 31, "单词": "architect", "释义": "建筑师", "其他拼写": null, "pos": "noun"}, {"序号": 2730, "词频": 31, "单词": "consultant", "释义": "顾问", "其他拼写": null, "pos": "noun"}, {"序号": 2731, "词频": 31, "单词": "elevate", "释义": "举起、提拔", "其他拼写": null, "pos": "verb"}, {"序号": 2732, "词频": 31, "单词": "plunge", "释义": "陷入、暴跌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2733, "词频": 31, "单词": "reception", "释义": "接待、招待会", "其他拼写": null, "pos": "noun"}, {"序号": 2734, "词频": 31, "单词": "boast", "释义": "自夸", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2735, "词频": 31, "单词": "sue", "释义": "起诉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2736, "词频": 31, "单词": "tape", "释义": "胶带", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2737, "词频": 31, "单词": "opera", "释义": "歌剧", "其他拼写": null, "pos": "noun"}, {"序号": 2738, "词频": 31, "单词": "cathedral", "释义": "大教堂", "其他拼写": null, "pos": "noun"}, {"序号": 2739, "词频": 31, "单词": "greet", "释义": "打招呼", "其他拼写": null, "pos": "verb"}, {"序号": 2740, "词频": 31, "单词": "knock", "释义": "敲", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2741, "词频": 31, "单词": "mortgage", "释义": "抵押", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2742, "词频": 31, "单词": "rubbish", "释义": "垃圾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2743, "词频": 31, "单词": "stereotype", "释义": "刻板", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2744, "词频": 31, "单词": "decent", "释义": "体面的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2745, "词频": 31, "单词": "seminar", "释义": "研讨会", "其他拼写": null, "pos": "noun"}, {"序号": 2746, "词频": 31, "单词": "zero", "释义": "零", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2747, "词频": 31, "单词": "adventure", "释义": "冒险", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2748, "词频": 31, "单词": "affection", "释义": "喜爱、感情", "其他拼写": null, "pos": "noun"}, {"序号": 2749, "词频": 30, "单词": "constitution", "释义": "宪法", "其他拼写": null, "pos": "noun"}, {"序号": 2750, "词频": 30, "单词": "definite", "释义": "明确的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2751, "词频": 30, "单词": "drift", "释义": "漂移、漂流", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2752, "词频": 30, "单词": "endeavor", "释义": "努力", "其他拼写": "endeavour", "pos": "noun_verb"}, {"序号": 2753, "词频": 30, "单词": "enlarge", "释义": "扩大", "其他拼写": null, "pos": "verb"}, {"序号": 2754, "词频": 30, "单词": "mineral", "释义": "矿物质", "其他拼写": null, "pos": "noun"}, {"序号": 2755, "词频": 30, "单词": "annoy", "释义": "令人厌烦的", "其他拼写": null, "pos": "verb"}, {"序号": 2756, "词频": 30, "单词": "bush", "释义": "灌木", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2757, "词频": 30, "单词": "poem", "释义": "诗", "其他拼写": null, "pos": "noun"}, {"序号": 2758, "词频": 30, "单词": "scatter", "释义": "分散、散布", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2759, "词频": 30, "单词": "wipe", "释义": "擦除", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2760, "词频": 30, "单词": "incredible", "释义": "难以置信的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2761, "词频": 30, "单词": "mechanic", "释义": "技工", "其他拼写": null, "pos": "noun"}, {"序号": 2762, "词频": 30, "单词": "enthusiastic", "释义": "热情的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2763, "词频": 30, "单词": "flourish", "释义": "繁荣", "其他拼写": "florish", "pos": "noun_verb"}, {"序号": 2764, "词频": 30, "单词": "inch", "释义": "英寸", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2765, "词频": 30, "单词": "lung", "释义": "肺", "其他拼写": null, "pos": "noun"}, {"序号": 2766, "词频": 30, "单词": "frame", "释义": "框架", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2767, "词频": 30, "单词": "profile", "释义": "轮廓、简介", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2768, "词频": 30, "单词": "youngster", "释义": "少年", "其他拼写": null, "pos": "noun"}, {"序号": 2769, "词频": 30, "单词": "brick", "释义": "砖", "其他拼写": null, "pos": "noun"}, {"序号": 2770, "词频": 30, "单词": "dictate", "释义": "规定、口述", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2771, "词频": 30, "单词": "organ", "释义": "器官", "其他拼写": null, "pos": "noun"}, {"序号": 2772, "词频": 30, "单词": "piano", "释义": "钢琴", "其他拼写": null, "pos": "noun"}, {"序号": 2773, "词频": 30, "单词": "twist", "释义": "扭曲、捻", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2774, "词频": 30, "单词": "wherever", "释义": "无论在哪里", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2775, "词频": 30, "单词": "gaze", "释义": "凝视", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2776, "词频": 30, "单词": "junior", "释义": "年资较浅的", "其他拼写": null, "pos": "noun"}, {"序号": 2777, "词频": 30, "单词": "subway", "释义": "地铁", "其他拼写": null, "pos": "noun"}, {"序号": 2778, "词频": 30, "单词": "pyramid", "释义": "金字塔", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2779, "词频": 30, "单词": "remedy", "释义": "补救、治疗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2780, "词频": 30, "单词": "mature", "释义": "成熟的", "其他拼写": null, "pos": "verb"}, {"序号": 2781, "词频": 30, "单词": "pump", "释义": "泵", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2782, "词频": 30, "单词": "tropical", "释义": "热带的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2783, "词频": 30, "单词": "chef", "释义": "厨师", "其他拼写": null, "pos": "noun"}, {"序号": 2784, "词频": 30, "单词": "junk", "释义": "垃圾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2785, "词频": 30, "单词": "pack", "释义": "打包", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2786, "词频": 29, "单词": "interior", "释义": "内部", "其他拼写": null, "pos": "noun"}, {"序号": 2787, "词频": 29, "单词": "liability", "释义": "责任", "其他拼写": null, "pos": "noun"}, {"序号": 2788, "词频": 29, "单词": "bid", "释义": "出价、投标", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2789, "词频": 29, "单词": "rude", "释义": "粗鲁的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2790, "词频": 29, "单词": "criterion", "释义": "标准", "其他拼写": null, "pos": "noun"}, {"序号": 2791, "词频": 29, "单词": "gradual", "释义": "逐渐的", "其他拼写": null, "pos": "noun"}, {"序号": 2792, "词频": 29, "单词": "objection", "释义": "反对", "其他拼写": null, "pos": "noun"}, {"序号": 2793, "词频": 29, "单词": "surname", "释义": "姓", "其他拼写": null, "pos": "noun"}, {"序号": 2794, "词频": 29, "单词": "activate", "释义": "激活", "其他拼写": null, "pos": "verb"}, {"序号": 2795, "词频": 29, "单词": "lawsuit", "释义": "诉讼", "其他拼写": null, "pos": "noun"}, {"序号": 2796, "词频": 29, "单词": "outlet", "释义": "出口", "其他拼写": null, "pos": "noun"}, {"序号": 2797, "词频": 29, "单词": "tunnel", "释义": "隧道", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2798, "词频": 29, "单词": "ignorant", "释义": "无知的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2799, "词频": 29, "单词": "squeeze", "释义": "挤压", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2800, "词频": 29, "单词": "click", "释义": "点击", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2801, "词频": 29, "单词": "gentleman", "释义": "绅士", "其他拼写": null, "pos": "noun"}, {"序号": 2802, "词频": 29, "单词": "invisible", "释义": "看不见的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2803, "词频": 29, "单词": "retreat", "释义": "撤退", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2804, "词频": 29, "单词": "chemistry", "释义": "化学", "其他拼写": null, "pos": "noun"}, {"序号": 2805, "词频": 29, "单词": "manipulate", "释义": "操纵", "其他拼写": null, "pos": "verb"}, {"序号": 2806, "词频": 29, "单词": "migrate", "释义": "迁移", "其他拼写": null, "pos": "verb"}, {"序号": 2807, "词频": 29, "单词": "somebody", "释义": "某人", "其他拼写": null, "pos": "noun"}, {"序号": 2808, "词频": 29, "单词": "clinic", "释义": "诊所", "其他拼写": null, "pos": "noun"}, {"序号": 2809, "词频": 29, "单词": "dull", "释义": "枯燥的", "其他拼写": null, "pos": "verb"}, {"序号": 2810, "词频": 29, "单词": "tight", "释义": "紧的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2811, "词频": 29, "单词": "wonderful", "释义": "精彩的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2812, "词频": 29, "单词": "accommodate", "释义": "适应、容纳", "其他拼写": null, "pos": "verb"}, {"序号": 2813, "词频": 29, "单词": "destructive", "释义": "破坏性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2814, "词频": 29, "单词": "chase", "释义": "追逐", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2815, "词频": 29, "单词": "steep", "释义": "陡峭的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2816, "词频": 29, "单词": "deed", "释义": "行为、事迹", "其他拼写": null, "pos": "noun"}, {"序号": 2817, "词频": 29, "单词": "lightning", "释义": "闪电", "其他拼写": null, "pos": "noun"}, {"序号": 2818, "词频": 29, "单词": "recreation", "释义": "娱乐", "其他拼写": null, "pos": "noun"}, {"序号": 2819, "词频": 29, "单词": "refine", "释义": "改进", "其他拼写": null, "pos": "verb"}, {"序号": 2820, "词频": 29, "单词": "stamp", "释义": "邮票", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2821, "词频": 29, "单词": "prisoner", "释义": "囚犯", "其他拼写": null, "pos": "noun"}, {"序号": 2822, "词频": 29, "单词": "salesman", "释义": "推销员", "其他拼写": null, "pos": "noun"}, {"序号": 2823, "词频": 29, "单词": "summary", "释义": "摘要", "其他拼写": null, "pos": "noun"}, {"序号": 2824, "词频": 28, "单词": "monopoly", "释义": "垄断", "其他拼写": null, "pos": "noun"}, {"序号": 2825, "词频": 28, "单词": "dose", "释义": "剂量", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2826, "词频": 28, "单词": "gross", "释义": "总的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2827, "词频": 28, "单词": "laughter", "释义": "笑声", "其他拼写": null, "pos": "noun"}, {"序号": 2828, "词频": 28, "单词": "trail", "释义": "小径、踪迹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2829, "词频": 28, "单词": "discard", "释义": "抛弃、丢弃", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2830, "词频": 28, "单词": "absolute", "释义": "绝对的", "其他拼写": null, "pos": "noun"}, {"序号": 2831, "词频": 28, "单词": "classify", "释义": "分类", "其他拼写": null, "pos": "verb"}, {"序号": 2832, "词频": 28, "单词": "festival", "释义": "节日", "其他拼写": null, "pos": "noun"}, {"序号": 2833, "词频": 28, "单词": "quest", "释义": "探索、寻求", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2834, "词频": 28, "单词": "conceive", "释义": "怀孕、设想", "其他拼写": null, "pos": "verb"}, {"序号": 2835, "词频": 28, "单词": "underestimate", "释义": "低估", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2836, "词频": 28, "单词": "bet", "释义": "打赌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2837, "词频": 28, "单词": "density", "释义": "密度", "其他拼写": null, "pos": "noun"}, {"序号": 2838, "词频": 28, "单词": "prescription", "释义": "处方", "其他拼写": null, "pos": "noun"}, {"序号": 2839, "词频": 28, "单词": "resistance", "释义": "抵抗", "其他拼写": null, "pos": "noun"}, {"序号": 2840, "词频": 28, "单词": "sir", "释义": "先生", "其他拼写": null, "pos": "noun"}, {"序号": 2841, "词频": 28, "单词": "leap", "释义": "跳跃", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2842, "词频": 28, "单词": "reproduce", "释义": "复制", "其他拼写": null, "pos": "verb"}, {"序号": 2843, "词频": 28, "单词": "revolutionary", "释义": "革命的", "其他拼写": null, "pos": "noun"}, {"序号": 2844, "词频": 28, "单词": "shy", "释义": "害羞地", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2845, "词频": 28, "单词": "brush", "释义": "刷子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2846, "词频": 28, "单词": "cinema", "释义": "电影院", "其他拼写": null, "pos": "noun"}, {"序号": 2847, "词频": 28, "单词": "essence", "释义": "本质", "其他拼写": null, "pos": "noun"}, {"序号": 2848, "词频": 28, "单词": "gun", "释义": "枪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2849, "词频": 28, "单词": "inhabitant", "释义": "居民", "其他拼写": null, "pos": "noun"}, {"序号": 2850, "词频": 28, "单词": "momentum", "释义": "势头", "其他拼写": null, "pos": "noun"}, {"序号": 2851, "词频": 28, "单词": "stare", "释义": "盯着", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2852, "词频": 28, "单词": "wander", "释义": "游荡", "其他拼写": null, "pos": "verb"}, {"序号": 2853, "词频": 28, "单词": "extraordinary", "释义": "非凡的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2854, "词频": 28, "单词": "polish", "释义": "擦亮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2855, "词频": 28, "单词": "slight", "释义": "轻微的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2856, "词频": 28, "单词": "frank", "释义": "坦白的、直率的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2857, "词频": 28, "单词": "misfortune", "释义": "不幸", "其他拼写": null, "pos": "noun"}, {"序号": 2858, "词频": 28, "单词": "rob", "释义": "抢劫", "其他拼写": null, "pos": "verb"}, {"序号": 2859, "词频": 28, "单词": "surgeon", "释义": "外科医生", "其他拼写": null, "pos": "noun"}, {"序号": 2860, "词频": 28, "单词": "transmission", "释义": "传输", "其他拼写": null, "pos": "noun"}, {"序号": 2861, "词频": 28, "单词": "orbit", "释义": "轨道", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2862, "词频": 28, "单词": "reservation", "释义": "预定", "其他拼写": null, "pos": "noun"}, {"序号": 2863, "词频": 28, "单词": "brilliant", "释义": "闪亮的、聪明的、出色的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2864, "词频": 28, "单词": "gadget", "释义": "小玩意儿", "其他拼写": null, "pos": "noun"}, {"序号": 2865, "词频": 28, "单词": "playground", "释义": "操场", "其他拼写": null, "pos": "noun"}, {"序号": 2866, "词频": 28, "单词": "tenant", "释义": "房客、租户", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2867, "词频": 27, "单词": "worthwhile", "释义": "值得的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2868, "词频": 27, "单词": "assert", "释义": "断言", "其他拼写": null, "pos": "verb"}, {"序号": 2869, "词频": 27, "单词": "mysterious", "释义": "神秘的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2870, "词频": 27, "单词": "slice", "释义": "部分、薄片", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2871, "词频": 27, "单词": "basketball", "释义": "篮球", "其他拼写": null, "pos": "noun"}, {"序号": 2872, "词频": 27, "单词": "inherent", "释义": "固有的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2873, "词频": 27, "单词": "sixty", "释义": "六十", "其他拼写": null, "pos": "noun"}, {"序号": 2874, "词频": 27, "单词": "headline", "释义": "头条新闻", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2875, "词频": 27, "单词": "specify", "释义": "指定", "其他拼写": null, "pos": "verb"}, {"序号": 2876, "词频": 27, "单词": "tag", "释义": "标签", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2877, "词频": 27, "单词": "margin", "释义": "利润、边缘", "其他拼写": null, "pos": "noun"}, {"序号": 2878, "词频": 27, "单词": "extract", "释义": "提取", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2879, "词频": 27, "单词": "agenda", "释义": "议程、日程", "其他拼写": null, "pos": "noun"}, {"序号": 2880, "词频": 27, "单词": "joke", "释义": "笑话", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2881, "词频": 27, "单词": "pessimistic", "释义": "悲观的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2882, "词频": 27, "单词": "tune", "释义": "曲调", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2883, "词频": 27, "单词": "apology", "释义": "道歉", "其他拼写": null, "pos": "noun"}, {"序号": 2884, "词频": 27, "单词": "loud", "释义": "大声的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2885, "词频": 27, "单词": "portray", "释义": "描绘", "其他拼写": null, "pos": "verb"}, {"序号": 2886, "词频": 27, "单词": "burst", "释义": "迸发、爆发", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2887, "词频": 27, "单词": "excitement", "释义": "兴奋", "其他拼写": null, "pos": "noun"}, {"序号": 2888, "词频": 27, "单词": "geography", "释义": "地理", "其他拼写": null, "pos": "noun"}, {"序号": 2889, "词频": 27, "单词": "prevalent", "释义": "普遍的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2890, "词频": 27, "单词": "silence", "释义": "沉默", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2891, "词频": 27, "单词": "theoretical", "释义": "理论上的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2892, "词频": 27, "单词": "murder", "释义": "谋杀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2893, "词频": 27, "单词": "rigorous", "释义": "严格的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2894, "词频": 27, "单词": "waiter", "释义": "服务员", "其他拼写": null, "pos": "noun"}, {"序号": 2895, "词频": 27, "单词": "corn", "释义": "玉米", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2896, "词频": 27, "单词": "oneself", "释义": "自己", "其他拼写": null, "pos": "other"}, {"序号": 2897, "词频": 27, "单词": "shadow", "释义": "阴影", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2898, "词频": 27, "单词": "tongue", "释义": "舌头", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2899, "词频": 27, "单词": "hobby", "释义": "兴趣", "其他拼写": null, "pos": "noun"}, {"序号": 2900, "词频": 27, "单词": "laptop", "释义": "笔记本电脑", "其他拼写": null, "pos": "noun"}, {"序号": 2901, "词频": 27, "单词": "potato", "释义": "马铃薯", "其他拼写": null, "pos": "noun"}, {"序号": 2902, "词频": 27, "单词": "pretend", "释义": "假装", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2903, "词频": 27, "单词": "dine", "释义": "进餐", "其他拼写": null, "pos": "verb"}, {"序号": 2904, "词频": 27, "单词": "pronunciation", "释义": "发音", "其他拼写": null, "pos": "noun"}, {"序号": 2905, "词频": 26, "单词": "dissolve", "释义": "溶解", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2906, "词频": 26, "单词": "speculate", "释义": "推测", "其他拼写": null, "pos": "verb"}, {"序号": 2907, "词频": 26, "单词": "underlie", "释义": "构成...的基础、在...之下", "其他拼写": null, "pos": "verb"}, {"序号": 2908, "词频": 26, "单词": "precede", "释义": "先于", "其他拼写": null, "pos": "verb"}, {"序号": 2909, "词频": 26, "单词": "quota", "释义": "配额", "其他拼写": null, "pos": "noun"}, {"序号": 2910, "词频": 26, "单词": "surplus", "释义": "盈余、过剩", "其他拼写": null, "pos": "noun"}, {"序号": 2911, "词频": 26, "单词": "drastic", "释义": "激烈的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2912, "词频": 26, "单词": "lest", "释义": "以免", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2913, "词频": 26, "单词": "supervise", "释义": "监督", "其他拼写": "supervize", "pos": "verb"}, {"序号": 2914, "词频": 26, "单词": "liable", "释义": "有义务的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2915, "词频": 26, "单词": "senator", "释义": "参议员", "其他拼写": null, "pos": "noun"}, {"序号": 2916, "词频": 26, "单词": "abolish", "释义": "废除", "其他拼写": null, "pos": "verb"}, {"序号": 2917, "词频": 26, "单词": "foresee", "释义": "预见", "其他拼写": null, "pos": "verb"}, {"序号": 2918, "词频": 26, "单词": "hardship", "释义": "艰难", "其他拼写": null, "pos": "noun"}, {"序号": 2919, "词频": 26, "单词": "hormone", "释义": "激素", "其他拼写": null, "pos": "noun"}, {"序号": 2920, "词频": 26, "单词": "recipient", "释义": "接受者", "其他拼写": null, "pos": "noun"}, {"序号": 2921, "词频": 26, "单词": "suspicion", "释义": "怀疑", "其他拼写": null, "pos": "noun"}, {"序号": 2922, "词频": 26, "单词": "lag", "释义": "落后", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2923, "词频": 26, "单词": "hypothesis", "释义": "假设", "其他拼写": null, "pos": "noun"}, {"序号": 2924, "词频": 26, "单词": "revive", "释义": "复苏、唤醒", "其他拼写": null, "pos": "verb"}, {"序号": 2925, "词频": 26, "单词": "undertake", "释义": "承担", "其他拼写": null, "pos": "verb"}, {"序号": 2926, "词频": 26, "单词": "deficiency", "释义": "不足、缺乏", "其他拼写": null, "pos": "noun"}, {"序号": 2927, "词频": 26, "单词": "enrol", "释义": "登记", "其他拼写": "enroll", "pos": "verb"}, {"序号": 2928, "词频": 26, "单词": "peaceful", "释义": "和平的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2929, "词频": 26, "单词": "realise", "释义": "认识到、体会到", "其他拼写": "realize", "pos": "verb"}, {"序号": 2930, "词频": 26, "单词": "resemble", "释义": "像", "其他拼写": null, "pos": "verb"}, {"序号": 2931, "词频": 26, "单词": "spiritual", "释义": "精神的", "其他拼写": null, "pos": "noun"}, {"序号": 2932, "词频": 26, "单词": "fortunate", "释义": "幸运的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2933, "词频": 26, "单词": "mild", "释义": "温和的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2934, "词频": 26, "单词": "temptation", "释义": "诱惑", "其他拼写": null, "pos": "noun"}, {"序号": 2935, "词频": 26, "单词": "wine", "释义": "酒", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2936, "词频": 26, "单词": "cater", "释义": "迎合", "其他拼写": null, "pos": "verb"}, {"序号": 2937, "词频": 26, "单词": "donate", "释义": "捐赠", "其他拼写": null, "pos": "verb"}, {"序号": 2938, "词频": 26, "单词": "grave", "释义": "坟墓", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2939, "词频": 26, "单词": "historic", "释义": "有历史意义的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2940, "词频": 26, "单词": "incorporate", "释义": "合并", "其他拼写": null, "pos": "verb"}, {"序号": 2941, "词频": 26, "单词": "physicist", "释义": "物理学家", "其他拼写": null, "pos": "noun"}, {"序号": 2942, "词频": 26, "单词": "prey", "释义": "猎物、捕食", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2943, "词频": 26, "单词": "stupid", "释义": "愚蠢", "其他拼写": null, "pos": "noun"}, {"序号": 2944, "词频": 26, "单词": "toxic", "释义": "有毒的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2945, "词频": 26, "单词": "collar", "释义": "衣领", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2946, "词频": 26, "单词": "plot", "释义": "情节", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2947, "词频": 26, "单词": "rainbow", "释义": "彩虹", "其他拼写": null, "pos": "noun"}, {"序号": 2948, "词频": 26, "单词": "sheer", "释义": "纯然的、陡峭的", "其他拼写": null, "pos": "verb"}, {"序号": 2949, "词频": 26, "单词": "sing", "释义": "唱歌", "其他拼写": null, "pos": "verb"}, {"序号": 2950, "词频": 26, "单词": "soar", "释义": "翱翔、高飞", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2951, "词频": 26, "单词": "studio", "释义": "工作室", "其他拼写": null, "pos": "noun"}, {"序号": 2952, "词频": 26, "单词": "halt", "释义": "停止", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2953, "词频": 26, "单词": "nursery", "释义": "托儿所", "其他拼写": null, "pos": "noun"}, {"序号": 2954, "词频": 26, "单词": "expedition", "释义": "探险队", "其他拼写": null, "pos": "noun"}, {"序号": 2955, "词频": 26, "单词": "outdoor", "释义": "户外的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2956, "词频": 25, "单词": "circuit", "释义": "电路", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2957, "词频": 25, "单词": "simplify", "释义": "简化", "其他拼写": null, "pos": "verb"}, {"序号": 2958, "词频": 25, "单词": "cooperate", "释义": "合作", "其他拼写": null, "pos": "verb"}, {"序号": 2959, "词频": 25, "单词": "volcano", "释义": "火山", "其他拼写": null, "pos": "noun"}, {"序号": 2960, "词频": 25, "单词": "deem", "释义": "认为", "其他拼写": null, "pos": "verb"}, {"序号": 2961, "词频": 25, "单词": "nowhere", "释义": "无处", "其他拼写": null, "pos": "noun"}, {"序号": 2962, "词频": 25, "单词": "contend", "释义": "竞争、争辩", "其他拼写": null, "pos": "verb"}, {"序号": 2963, "词频": 25, "单词": "delicate", "释义": "易碎的、精致的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2964, "词频": 25, "单词": "mathematical", "释义": "数学的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2965, "词频": 25, "单词": "outer", "释义": "外面的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2966, "词频": 25, "单词": "allowance", "释义": "津贴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2967, "词频": 25, "单词": "skip", "释义": "跳过", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2968, "词频": 25, "单词": "awkward", "释义": "笨拙的、令人尴尬的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2969, "词频": 25, "单词": "vague", "释义": "模糊地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2970, "词频": 25, "单词": "cable", "释义": "缆、电缆", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2971, "词频": 25, "单词": "emit", "释义": "放射", "其他拼写": null, "pos": "verb"}, {"序号": 2972, "词频": 25, "单词": "manual", "释义": "手册", "其他拼写": null, "pos": "noun"}, {"序号": 2973, "词频": 25, "单词": "prescribe", "释义": "开处方", "其他拼写": null, "pos": "verb"}, {"序号": 2974, "词频": 25, "单词": "shell", "释义": "壳", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2975, "词频": 25, "单词": "tale", "释义": "故事", "其他拼写": null, "pos": "noun"}, {"序号": 2976, "词频": 25, "单词": "bell", "释义": "钟、铃", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2977, "词频": 25, "单词": "competent", "释义": "有能力的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2978, "词频": 25, "单词": "hat", "释义": "帽子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2979, "词频": 25, "单词": "prestige", "释义": "声望", "其他拼写": null, "pos": "noun"}, {"序号": 2980, "词频": 25, "单词": "silly", "释义": "愚蠢的", "其他拼写": null, "pos": "noun"}, {"序号": 2981, "词频": 25, "单词": "split", "释义": "分开、划分", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2982, "词频": 25, "单词": "tailor", "释义": "裁缝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2983, "词频": 25, "单词": "indoor", "释义": "室内的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2984, "词频": 25, "单词": "offend", "释义": "冒犯", "其他拼写": null, "pos": "verb"}, {"序号": 2985, "词频": 25, "单词": "publicity", "释义": "宣传", "其他拼写": null, "pos": "noun"}, {"序号": 2986, "词频": 25, "单词": "refrain", "释义": "避免、克制", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2987, "词频": 25, "单词": "cherish", "释义": "珍爱", "其他拼写": null, "pos": "verb"}, {"序号": 2988, "词频": 25, "单词": "descend", "释义": "下降", "其他拼写": null, "pos": "verb"}, {"序号": 2989, "词频": 25, "单词": "entity", "释义": "实体", "其他拼写": null, "pos": "noun"}, {"序号": 2990, "词频": 25, "单词": "occasional", "释义": "偶然的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 2991, "词频": 25, "单词": "fourteen", "释义": "十四", "其他拼写": null, "pos": "noun"}, {"序号": 2992, "词频": 25, "单词": "fry", "释义": "油炸", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2993, "词频": 25, "单词": "syndrome", "释义": "综合症", "其他拼写": null, "pos": "noun"}, {"序号": 2994, "词频": 25, "单词": "whale", "释义": "鲸", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2995, "词频": 24, "单词": "pencil", "释义": "铅笔", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2996, "词频": 24, "单词": "spy", "释义": "监视、间谍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2997, "词频": 24, "单词": "cease", "释义": "停止", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2998, "词频": 24, "单词": "fold", "释义": "折叠", "其他拼写": null, "pos": "noun_verb"}, {"序号": 2999, "词频": 24, "单词": "beam", "释义": "光线、发射", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3000, "词频": 24, "单词": "charter", "释义": "宪章", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3001, "词频": 24, "单词": "correlate", "释义": "关联", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3002, "词频": 24, "单词": "departure", "释义": "离开", "其他拼写": null, "pos": "noun"}, {"序号": 3003, "词频": 24, "单词": "float", "释义": "漂浮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3004, "词频": 24, "单词": "array", "释义": "系列、序列", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3005, "词频": 24, "单词": "engagement", "释义": "订婚", "其他拼写": null, "pos": "noun"}, {"序号": 3006, "词频": 24, "单词": "fertile", "释义": "肥沃的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3007, "词频": 24, "单词": "fool", "释义": "傻瓜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3008, "词频": 24, "单词": "rocket", "释义": "火箭", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3009, "词频": 24, "单词": "alien", "释义": "外星人", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3010, "词频": 24, "单词": "devise", "释义": "设计", "其他拼写": "devize", "pos": "noun_verb"}, {"序号": 3011, "词频": 24, "单词": "exaggerate", "释义": "夸大", "其他拼写": null, "pos": "verb"}, {"序号": 3012, "词频": 24, "单词": "inherit", "释义": "继承", "其他拼写": null, "pos": "verb"}, {"序号": 3013, "词频": 24, "单词": "intimate", "释义": "亲密的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3014, "词频": 24, "单词": "opt", "释义": "选择", "其他拼写": null, "pos": "verb"}, {"序号": 3015, "词频": 24, "单词": "ours", "释义": "我们的", "其他拼写": null, "pos": "other"}, {"序号": 3016, "词频": 24, "单词": "troop", "释义": "军队", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3017, "词频": 24, "单词": "dilemma", "释义": "困境", "其他拼写": null, "pos": "noun"}, {"序号": 3018, "词频": 24, "单词": "spell", "释义": "拼写、咒语", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3019, "词频": 24, "单词": "thrill", "释义": "激动", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3020, "词频": 24, "单词": "tribe", "释义": "部落", "其他拼写": null, "pos": "noun"}, {"序号": 3021, "词频": 24, "单词": "blog", "释义": "博客", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3022, "词频": 24, "单词": "deadly", "释义": "致命的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3023, "词频": 24, "单词": "favorable", "释义": "有利的", "其他拼写": "favourable", "pos": "adj_adv"}, {"序号": 3024, "词频": 24, "单词": "herd", "释义": "群", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3025, "词频": 24, "单词": "steam", "释义": "蒸汽", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3026, "词频": 24, "单词": "strip", "释义": "脱衣、剥夺", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3027, "词频": 24, "单词": "diagnose", "释义": "判断", "其他拼写": null, "pos": "verb"}, {"序号": 3028, "词频": 24, "单词": "scratch", "释义": "抓", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3029, "词频": 24, "单词": "wet", "释义": "湿的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3030, "词频": 24, "单词": "dip", "释义": "蘸", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3031, "词频": 24, "单词": "distress", "释义": "忧虑、悲伤", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3032, "词频": 24, "单词": "drill", "释义": "练习", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3033, "词频": 24, "单词": "sculpture", "释义": "雕塑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3034, "词频": 24, "单词": "warmth", "释义": "温暖", "其他拼写": null, "pos": "noun"}, {"序号": 3035, "词频": 24, "单词": "dump", "释义": "垃圾场、倾倒", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3036, "词频": 24, "单词": "resign", "释义": "辞职", "其他拼写": null, "pos": "verb"}, {"序号": 3037, "词频": 24, "单词": "vigorous", "释义": "充满力量的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3038, "词频": 23, "单词": "leaf", "释义": "叶子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3039, "词频": 23, "单词": "manifest", "释义": "显示、显然的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3040, "词频": 23, "单词": "pen", "释义": "钢笔", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3041, "词频": 23, "单词": "alongside", "释义": "在旁边", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3042, "词频": 23, "单词": "bulk", "释义": "大部分、体积", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3043, "词频": 23, "单词": "dig", "释义": "挖", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3044, "词频": 23, "单词": "elect", "释义": "选举", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3045, "词频": 23, "单词": "funny", "释义": "有趣的、滑稽的", "其他拼写": null, "pos": "noun"}, {"序号": 3046, "词频": 23, "单词": "innocent", "释义": "无辜的", "其他拼写": null, "pos": "noun"}, {"序号": 3047, "词频": 23, "单词": "input", "释义": "输入", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3048, "词频": 23, "单词": "nonsense", "释义": "胡说", "其他拼写": null, "pos": "noun"}, {"序号": 3049, "词频": 23, "单词": "vivid", "释义": "生动的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3050, "词频": 23, "单词": "beef", "释义": "牛肉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3051, "词频": 23, "单词": "excel", "释义": "优于", "其他拼写": null, "pos": "verb"}, {"序号": 3052, "词频": 23, "单词": "nonetheless", "释义": "然而", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3053, "词频": 23, "单词": "queue", "释义": "排队", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3054, "词频": 23, "单词": "conquer", "释义": "征服", "其他拼写": null, "pos": "verb"}, {"序号": 3055, "词频": 23, "单词": "contradict", "释义": "反驳", "其他拼写": null, "pos": "verb"}, {"序号": 3056, "词频": 23, "单词": "leak", "释义": "泄露", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3057, "词频": 23, "单词": "seize", "释义": "抓住", "其他拼写": "seise", "pos": "verb"}, {"序号": 3058, "词频": 23, "单词": "authentic", "释义": "真实的、真正的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3059, "词频": 23, "单词": "coordinate", "释义": "协调、坐标", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3060, "词频": 23, "单词": "hip", "释义": "髋", "其他拼写": null, "pos": "noun"}, {"序号": 3061, "词频": 23, "单词": "feasible", "释义": "可行的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3062, "词频": 23, "单词": "gloomy", "释义": "阴暗的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3063, "词频": 23, "单词": "hint", "释义": "暗示", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3064, "词频": 23, "单词": "illiterate", "释义": "文盲", "其他拼写": null, "pos": "noun"}, {"序号": 3065, "词频": 23, "单词": "iron", "释义": "熨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3066, "词频": 23, "单词": "lip", "释义": "嘴唇", "其他拼写": null, "pos": "noun"}, {"序号": 3067, "词频": 23, "单词": "painter", "释义": "画家", "其他拼写": null, "pos": "noun"}, {"序号": 3068, "词频": 23, "单词": "stir", "释义": "搅拌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3069, "词频": 23, "单词": "bitter", "释义": "苦的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3070, "词频": 23, "单词": "digest", "释义": "消化", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3071, "词频": 23, "单词": "exotic", "释义": "奇异的、外来的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3072, "词频": 23, "单词": "lazy", "释义": "懒惰的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3073, "词频": 23, "单词": "obey", "释义": "遵守、服从", "其他拼写": null, "pos": "verb"}, {"序号": 3074, "词频": 23, "单词": "butter", "释义": "黄油", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3075, "词频": 23, "单词": "carpet", "释义": "地毯", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3076, "词频": 23, "单词": "civilian", "释义": "平民", "其他拼写": null, "pos": "noun"}, {"序号": 3077, "词频": 23, "单词": "pin", "释义": "别针、固定", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3078, "词频": 23, "单词": "yellow", "释义": "黄色", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3079, "词频": 23, "单词": "pie", "释义": "馅饼", "其他拼写": null, "pos": "noun"}, {"序号": 3080, "词频": 23, "单词": "retrieve", "释义": "取回、恢复", "其他拼写": null, "pos": "verb"}, {"序号": 3081, "词频": 23, "单词": "romance", "释义": "浪漫、冒险故事", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3082, "词频": 23, "单词": "workshop", "释义": "车间", "其他拼写": null, "pos": "noun"}, {"序号": 3083, "词频": 22, "单词": "cap", "释义": "帽子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3084, "词频": 22, "单词": "likewise", "释义": "同样地", "其他拼写": "likewize", "pos": "adj_adv"}, {"序号": 3085, "词频": 22, "单词": "contempt", "释义": "轻蔑", "其他拼写": null, "pos": "noun"}, {"序号": 3086, "词频": 22, "单词": "queen", "释义": "女王", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3087, "词频": 22, "单词": "jet", "释义": "喷射、喷气式飞机", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3088, "词频": 22, "单词": "acquaintance", "释义": "相识的人", "其他拼写": null, "pos": "noun"}, {"序号": 3089, "词频": 22, "单词": "bay", "释义": "海湾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3090, "词频": 22, "单词": "bite", "释义": "咬", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3091, "词频": 22, "单词": "depict", "释义": "描述、描绘", "其他拼写": null, "pos": "verb"}, {"序号": 3092, "词频": 22, "单词": "dimension", "释义": "维度", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3093, "词频": 22, "单词": "precision", "释义": "精确", "其他拼写": null, "pos": "noun"}, {"序号": 3094, "词频": 22, "单词": "shore", "释义": "岸上", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3095, "词频": 22, "单词": "superficial", "释义": "肤浅的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3096, "词频": 22, "单词": "unity", "释义": "统一", "其他拼写": null, "pos": "noun"}, {"序号": 3097, "词频": 22, "单词": "furnish", "释义": "提供", "其他拼写": null, "pos": "verb"}, {"序号": 3098, "词频": 22, "单词": "palace", "释义": "宫殿", "其他拼写": null, "pos": "noun"}, {"序号": 3099, "词频": 22, "单词": "provoke", "释义": "激怒", "其他拼写": null, "pos": "verb"}, {"序号": 3100, "词频": 22, "单词": "grateful", "释义": "感激的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3101, "词频": 22, "单词": "setting", "释义": "环境、背景", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3102, "词频": 22, "单词": "amuse", "释义": "娱乐", "其他拼写": null, "pos": "verb"}, {"序号": 3103, "词频": 22, "单词": "anybody", "释义": "任何人", "其他拼写": null, "pos": "other"}, {"序号": 3104, "词频": 22, "单词": "cart", "释义": "手推车", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3105, "词频": 22, "单词": "comply", "释义": "顺从", "其他拼写": null, "pos": "verb"}, {"序号": 3106, "词频": 22, "单词": "demographic", "释义": "人口的", "其他拼写": null, "pos": "noun"}, {"序号": 3107, "词频": 22, "单词": "imitation", "释义": "模仿", "其他拼写": null, "pos": "noun"}, {"序号": 3108, "词频": 22, "单词": "incidence", "释义": "发生率", "其他拼写": null, "pos": "noun"}, {"序号": 3109, "词频": 22, "单词": "invitation", "释义": "邀请", "其他拼写": null, "pos": "noun"}, {"序号": 3110, "词频": 22, "单词": "mill", "释义": "磨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3111, "词频": 22, "单词": "super", "释义": "极好的", "其他拼写": null, "pos": "noun"}, {"序号": 3112, "词频": 22, "单词": "cake", "释义": "蛋糕", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3113, "词频": 22, "单词": "stroke", "释义": "中风", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3114, "词频": 22, "单词": "surge", "释义": "激增", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3115, "词频": 22, "单词": "testify", "释义": "作证", "其他拼写": null, "pos": "verb"}, {"序号": 3116, "词频": 22, "单词": "cow", "释义": "母牛", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3117, "词频": 22, "单词": "linger", "释义": "徘徊、逗留", "其他拼写": null, "pos": "verb"}, {"序号": 3118, "词频": 22, "单词": "alleviate", "释义": "减轻", "其他拼写": null, "pos": "verb"}, {"序号": 3119, "词频": 22, "单词": "downtown", "释义": "市中心", "其他拼写": null, "pos": "noun"}, {"序号": 3120, "词频": 22, "单词": "hurricane", "释义": "飓风", "其他拼写": null, "pos": "noun"}, {"序号": 3121, "词频": 22, "单词": "patch", "释义": "补丁、修补", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3122, "词频": 22, "单词": "tea", "释义": "茶", "其他拼写": null, "pos": "noun"}, {"序号": 3123, "词频": 21, "单词": "misery", "释义": "痛苦", "其他拼写": null, "pos": "noun"}, {"序号": 3124, "词频": 21, "单词": "lord", "释义": "主", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3125, "词频": 21, "单词": "rage", "释义": "大怒、狂怒", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3126, "词频": 21, "单词": "elegant", "释义": "优雅的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3127, "词频": 21, "单词": "flaw", "释义": "缺陷", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3128, "词频": 21, "单词": "formulate", "释义": "规划、制订", "其他拼写": null, "pos": "verb"}, {"序号": 3129, "词频": 21, "单词": "moderate", "释义": "温和的、适度的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3130, "词频": 21, "单词": "reliance", "释义": "信赖", "其他拼写": null, "pos": "noun"}, {"序号": 3131, "词频": 21, "单词": "tide", "释义": "潮水、潮流", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3132, "词频": 21, "单词": "pledge", "释义": "保证、誓言", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3133, "词频": 21, "单词": "snap", "释义": "猛咬、拍摄、突然的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3134, "词频": 21, "单词": "undoubtedly", "释义": "无疑地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3135, "词频": 21, "单词": "visa", "释义": "签证", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3136, "词频": 21, "单词": "wing", "释义": "翼", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3137, "词频": 21, "单词": "commute", "释义": "通勤", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3138, "词频": 21, "单词": "dare", "释义": "敢", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3139, "词频": 21, "单词": "energetic", "释义": "精力旺盛的、能量的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3140, "词频": 21, "单词": "flag", "释义": "旗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3141, "词频": 21, "单词": "frontier", "释义": "边境、边界", "其他拼写": null, "pos": "noun"}, {"序号": 3142, "词频": 21, "单词": "illusion", "释义": "错觉", "其他拼写": null, "pos": "noun"}, {"序号": 3143, "词频": 21, "单词": "slogan", "释义": "口号", "其他拼写": null, "pos": "noun"}, {"序号": 3144, "词频": 21, "单词": "vessel", "释义": "船", "其他拼写": null, "pos": "noun"}, {"序号": 3145, "词频": 21, "单词": "compute", "释义": "估计", "其他拼写": null, "pos": "verb"}, {"序号": 3146, "词频": 21, "单词": "episode", "释义": "情节", "其他拼写": null, "pos": "noun"}, {"序号": 3147, "词频": 21, "单词": "indication", "释义": "迹象、指示", "其他拼写": null, "pos": "noun"}, {"序号": 3148, "词频": 21, "单词": "starve", "释义": "挨饿", "其他拼写": null, "pos": "verb"}, {"序号": 3149, "词频": 21, "单词": "steer", "释义": "引导、驾驶", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3150, "词频": 21, "单词": "superiority", "释义": "优势", "其他拼写": null, "pos": "noun"}, {"序号": 3151, "词频": 21, "单词": "tempt", "释义": "引诱、吸引", "其他拼写": null, "pos": "verb"}, {"序号": 3152, "词频": 21, "单词": "beside", "释义": "在…旁边", "其他拼写": null, "pos": "other"}, {"序号": 3153, "词频": 21, "单词": "decisive", "释义": "决定性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3154, "词频": 21, "单词": "occurrence", "释义": "发生", "其他拼写": null, "pos": "noun"}, {"序号": 3155, "词频": 21, "单词": "refrigerator", "释义": "冰箱", "其他拼写": null, "pos": "noun"}, {"序号": 3156, "词频": 21, "单词": "seemingly", "释义": "表面上", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3157, "词频": 21, "单词": "spectator", "释义": "观众", "其他拼写": null, "pos": "noun"}, {"序号": 3158, "词频": 21, "单词": "trivial", "释义": "琐碎的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3159, "词频": 21, "单词": "awake", "释义": "醒着的、醒来", "其他拼写": null, "pos": "verb"}, {"序号": 3160, "词频": 21, "单词": "faulty", "释义": "有缺陷的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3161, "词频": 21, "单词": "housewife", "释义": "家庭主妇", "其他拼写": null, "pos": "noun"}, {"序号": 3162, "词频": 21, "单词": "intervene", "释义": "干预", "其他拼写": null, "pos": "verb"}, {"序号": 3163, "词频": 21, "单词": "luggage", "释义": "行李", "其他拼写": null, "pos": "noun"}, {"序号": 3164, "词频": 21, "单词": "seal", "释义": "密封", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3165, "词频": 21, "单词": "shout", "释义": "喊叫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3166, "词频": 21, "单词": "dwell", "释义": "居住", "其他拼写": null, "pos": "verb"}, {"序号": 3167, "词频": 21, "单词": "inspiration", "释义": "灵感", "其他拼写": null, "pos": "noun"}, {"序号": 3168, "词频": 21, "单词": "merge", "释义": "合并", "其他拼写": null, "pos": "verb"}, {"序号": 3169, "词频": 21, "单词": "shine", "释义": "闪耀、照耀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3170, "词频": 21, "单词": "yell", "释义": "喊叫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3171, "词频": 21, "单词": "fraud", "释义": "欺骗", "其他拼写": null, "pos": "noun"}, {"序号": 3172, "词频": 21, "单词": "tedious", "释义": "枯燥的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3173, "词频": 21, "单词": "crazy", "释义": "疯狂的", "其他拼写": null, "pos": "noun"}, {"序号": 3174, "词频": 21, "单词": "invade", "释义": "侵略", "其他拼写": null, "pos": "verb"}, {"序号": 3175, "词频": 21, "单词": "yard", "释义": "院子", "其他拼写": null, "pos": "noun"}, {"序号": 3176, "词频": 20, "单词": "alphabet", "释义": "字母表", "其他拼写": null, "pos": "noun"}, {"序号": 3177, "词频": 20, "单词": "heaven", "释义": "天堂", "其他拼写": null, "pos": "noun"}, {"序号": 3178, "词频": 20, "单词": "hospitality", "释义": "好客、款待", "其他拼写": null, "pos": "noun"}, {"序号": 3179, "词频": 20, "单词": "pink", "释义": "粉红色", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3180, "词频": 20, "单词": "backward", "释义": "向后的、落后的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3181, "词频": 20, "单词": "legitimate", "释义": "合法的", "其他拼写": null, "pos": "verb"}, {"序号": 3182, "词频": 20, "单词": "lure", "释义": "吸引、诱惑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3183, "词频": 20, "单词": "rigid", "释义": "严格的、僵硬的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3184, "词频": 20, "单词": "offspring", "释义": "子孙、后代", "其他拼写": null, "pos": "noun"}, {"序号": 3185, "词频": 20, "单词": "violate", "释义": "违背、侵犯", "其他拼写": null, "pos": "verb"}, {"序号": 3186, "词频": 20, "单词": "poisonous", "释义": "有毒的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3187, "词频": 20, "单词": "silent", "释义": "沉默的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3188, "词频": 20, "单词": "thereby", "释义": "从而", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3189, "词频": 20, "单词": "cling", "释义": "紧贴、坚持", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3190, "词频": 20, "单词": "divert", "释义": "转移", "其他拼写": null, "pos": "verb"}, {"序号": 3191, "词频": 20, "单词": "fraction", "释义": "小部分、分数", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3192, "词频": 20, "单词": "applicable", "释义": "适用的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3193, "词频": 20, "单词": "bachelor", "释义": "学士、单身汉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3194, "词频": 20, "单词": "carrier", "释义": "载体", "其他拼写": null, "pos": "noun"}, {"序号": 3195, "词频": 20, "单词": "hole", "释义": "洞", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3196, "词频": 20, "单词": "initiate", "释义": "开始", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3197, "词频": 20, "单词": "mate", "释义": "交配、配偶", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3198, "词频": 20, "单词": "meaning", "释义": "意义", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3199, "词频": 20, "单词": "presumably", "释义": "大概、可能", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3200, "词频": 20, "单词": "reap", "释义": "收获、获得", "其他拼写": null, "pos": "verb"}, {"序号": 3201, "词频": 20, "单词": "brake", "释义": "刹车", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3202, "词频": 20, "单词": "calendar", "释义": "日历", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3203, "词频": 20, "单词": "certificate", "释义": "证书", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3204, "词频": 20, "单词": "cousin", "释义": "堂兄弟姐妹", "其他拼写": null, "pos": "noun"}, {"序号": 3205, "词频": 20, "单词": "dairy", "释义": "乳制品", "其他拼写": null, "pos": "noun"}, {"序号": 3206, "词频": 20, "单词": "decay", "释义": "腐烂", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3207, "词频": 20, "单词": "grab", "释义": "抓取、夺取", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3208, "词频": 20, "单词": "miserable", "释义": "悲惨的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3209, "词频": 20, "单词": "practitioner", "释义": "从业者", "其他拼写": null, "pos": "noun"}, {"序号": 3210, "词频": 20, "单词": "proposition", "释义": "命题", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3211, "词频": 20, "单词": "qualify", "释义": "合格", "其他拼写": null, "pos": "verb"}, {"序号": 3212, "词频": 20, "单词": "sole", "释义": "鞋底、唯一的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3213, "词频": 20, "单词": "spark", "释义": "火星、引起", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3214, "词频": 20, "单词": "sportsman", "释义": "运动员", "其他拼写": null, "pos": "noun"}, {"序号": 3215, "词频": 20, "单词": "tissue", "释义": "纸巾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3216, "词频": 20, "单词": "toll", "释义": "损失、通行费", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3217, "词频": 20, "单词": "verify", "释义": "核实", "其他拼写": null, "pos": "verb"}, {"序号": 3218, "词频": 20, "单词": "compulsory", "释义": "强制的、义务的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3219, "词频": 20, "单词": "cyberspace", "释义": "网络空间", "其他拼写": null, "pos": "noun"}, {"序号": 3220, "词频": 20, "单词": "dawn", "释义": "黎明", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3221, "词频": 20, "单词": "kick", "释义": "踢", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3222, "词频": 20, "单词": "mayor", "释义": "市长", "其他拼写": null, "pos": "noun"}, {"序号": 3223, "词频": 20, "单词": "subjective", "释义": "主观的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3224, "词频": 20, "单词": "timely", "释义": "及时的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3225, "词频": 20, "单词": "ward", "释义": "病房", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3226, "词频": 20, "单词": "wrap", "释义": "包裹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3227, "词频": 20, "单词": "altitude", "释义": "高度", "其他拼写": null, "pos": "noun"}, {"序号": 3228, "词频": 20, "单词": "cattle", "释义": "牛", "其他拼写": null, "pos": "noun"}, {"序号": 3229, "词频": 20, "单词": "cottage", "释义": "村舍", "其他拼写": null, "pos": "noun"}, {"序号": 3230, "词频": 20, "单词": "drown", "释义": "淹没", "其他拼写": null, "pos": "verb"}, {"序号": 3231, "词频": 20, "单词": "empire", "释义": "帝国", "其他拼写": null, "pos": "noun"}, {"序号": 3232, "词频": 20, "单词": "ignorance", "释义": "无知", "其他拼写": null, "pos": "noun"}, {"序号": 3233, "词频": 20, "单词": "landlord", "释义": "房东", "其他拼写": null, "pos": "noun"}, {"序号": 3234, "词频": 20, "单词": "precaution", "释义": "预防", "其他拼写": null, "pos": "noun"}, {"序号": 3235, "词频": 20, "单词": "prosperous", "释义": "繁荣的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3236, "词频": 20, "单词": "tense", "释义": "紧张的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3237, "词频": 20, "单词": "versus", "释义": "对抗", "其他拼写": null, "pos": "other"}, {"序号": 3238, "词频": 20, "单词": "allocate", "释义": "分配", "其他拼写": null, "pos": "verb"}, {"序号": 3239, "词频": 20, "单词": "beg", "释义": "乞求", "其他拼写": null, "pos": "verb"}, {"序号": 3240, "词频": 20, "单词": "glad", "释义": "高兴的", "其他拼写": null, "pos": "noun"}, {"序号": 3241, "词频": 20, "单词": "infect", "释义": "感染", "其他拼写": null, "pos": "verb"}, {"序号": 3242, "词频": 20, "单词": "mess", "释义": "混乱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3243, "词频": 20, "单词": "troublesome", "释义": "讨厌的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3244, "词频": 20, "单词": "delegate", "释义": "委托", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3245, "词频": 20, "单词": "dive", "释义": "潜水、跳水", "其他拼写": "dove", "pos": "noun_verb"}, {"序号": 3246, "词频": 20, "单词": "hop", "释义": "跳跃", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3247, "词频": 20, "单词": "kindergarten", "释义": "幼儿园", "其他拼写": null, "pos": "noun"}, {"序号": 3248, "词频": 20, "单词": "litter", "释义": "垃圾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3249, "词频": 20, "单词": "passport", "释义": "护照", "其他拼写": null, "pos": "noun"}, {"序号": 3250, "词频": 20, "单词": "pat", "释义": "轻拍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3251, "词频": 20, "单词": "prospective", "释义": "潜在的、预期的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3252, "词频": 20, "单词": "uncle", "释义": "叔", "其他拼写": null, "pos": "noun"}, {"序号": 3253, "词频": 19, "单词": "blueprint", "释义": "蓝图", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3254, "词频": 19, "单词": "federation", "释义": "联合、联邦", "其他拼写": null, "pos": "noun"}, {"序号": 3255, "词频": 19, "单词": "telescope", "释义": "望远镜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3256, "词频": 19, "单词": "cheque", "释义": "支票", "其他拼写": "check", "pos": "noun_verb"}, {"序号": 3257, "词频": 19, "单词": "republican", "释义": "共和政体的", "其他拼写": null, "pos": "noun"}, {"序号": 3258, "词频": 19, "单词": "ritual", "释义": "仪式", "其他拼写": null, "pos": "noun"}, {"序号": 3259, "词频": 19, "单词": "vanish", "释义": "消失", "其他拼写": null, "pos": "verb"}, {"序号": 3260, "词频": 19, "单词": "petrol", "释义": "汽油", "其他拼写": null, "pos": "noun"}, {"序号": 3261, "词频": 19, "单词": "subsequent", "释义": "随后的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3262, "词频": 19, "单词": "bonus", "释义": "奖金", "其他拼写": null, "pos": "noun"}, {"序号": 3263, "词频": 19, "单词": "consent", "释义": "同意", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3264, "词频": 19, "单词": "bubble", "释义": "气泡", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3265, "词频": 19, "单词": "grip", "释义": "紧握、紧抓", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3266, "词频": 19, "单词": "humble", "释义": "谦逊的、卑微的", "其他拼写": null, "pos": "verb"}, {"序号": 3267, "词频": 19, "单词": "navy", "释义": "海军", "其他拼写": null, "pos": "noun"}, {"序号": 3268, "词频": 19, "单词": "sociable", "释义": "好交际的", "其他拼写": null, "pos": "noun"}, {"序号": 3269, "词频": 19, "单词": "ant", "释义": "蚂蚁", "其他拼写": null, "pos": "noun"}, {"序号": 3270, "词频": 19, "单词": "betray", "释义": "背叛", "其他拼写": null, "pos": "verb"}, {"序号": 3271, "词频": 19, "单词": "handful", "释义": "少数", "其他拼写": null, "pos": "noun"}, {"序号": 3272, "词频": 19, "单词": "imperative", "释义": "紧急的、祈使的", "其他拼写": null, "pos": "noun"}, {"序号": 3273, "词频": 19, "单词": "reckon", "释义": "估算、认为", "其他拼写": null, "pos": "verb"}, {"序号": 3274, "词频": 19, "单词": "acute", "释义": "严重的、敏锐的", "其他拼写": null, "pos": "noun"}, {"序号": 3275, "词频": 19, "单词": "castle", "释义": "城堡", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3276, "词频": 19, "单词": "considerate", "释义": "体贴的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3277, "词频": 19, "单词": "dignity", "释义": "尊严", "其他拼写": null, "pos": "noun"}, {"序号": 3278, "词频": 19, "单词": "heighten", "释义": "加强、增加", "其他拼写": null, "pos": "verb"}, {"序号": 3279, "词频": 19, "单词": "magnificent", "释义": "宏伟的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3280, "词频": 19, "单词": "metre", "释义": "米", "其他拼写": "meter", "pos": "noun"}, {"序号": 3281, "词频": 19, "单词": "rhythm", "释义": "节奏、韵律", "其他拼写": null, "pos": "noun"}, {"序号": 3282, "词频": 19, "单词": "throat", "释义": "喉咙", "其他拼写": null, "pos": "noun"}, {"序号": 3283, "词频": 19, "单词": "tidy", "释义": "整洁的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3284, "词频": 19, "单词": "wire", "释义": "电线", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3285, "词频": 19, "单词": "cliff", "释义": "悬崖", "其他拼写": null, "pos": "noun"}, {"序号": 3286, "词频": 19, "单词": "curve", "释义": "曲线", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3287, "词频": 19, "单词": "destiny", "释义": "命运", "其他拼写": null, "pos": "noun"}, {"序号": 3288, "词频": 19, "单词": "dim", "释义": "暗淡的", "其他拼写": null, "pos": "verb"}, {"序号": 3289, "词频": 19, "单词": "paradox", "释义": "悖论", "其他拼写": null, "pos": "noun"}, {"序号": 3290, "词频": 19, "单词": "repeatedly", "释义": "重复地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3291, "词频": 19, "单词": "resolution", "释义": "解决方案、决心", "其他拼写": null, "pos": "noun"}, {"序号": 3292, "词频": 19, "单词": "scream", "释义": "喊叫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3293, "词频": 19, "单词": "shade", "释义": "阴影", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3294, "词频": 19, "单词": "collaborate", "释义": "合作", "其他拼写": null, "pos": "verb"}, {"序号": 3295, "词频": 19, "单词": "county", "释义": "县", "其他拼写": null, "pos": "noun"}, {"序号": 3296, "词频": 19, "单词": "deteriorate", "释义": "恶化", "其他拼写": null, "pos": "verb"}, {"序号": 3297, "词频": 19, "单词": "equation", "释义": "方程式", "其他拼写": null, "pos": "noun"}, {"序号": 3298, "词频": 19, "单词": "orange", "释义": "橙色的", "其他拼写": null, "pos": "noun"}, {"序号": 3299, "词频": 19, "单词": "postpone", "释义": "推迟", "其他拼写": null, "pos": "verb"}, {"序号": 3300, "词频": 19, "单词": "pronounce", "释义": "发音", "其他拼写": null, "pos": "verb"}, {"序号": 3301, "词频": 19, "单词": "thorough", "释义": "彻底的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3302, "词频": 19, "单词": "contaminate", "释义": "污染", "其他拼写": null, "pos": "verb"}, {"序号": 3303, "词频": 19, "单词": "creep", "释义": "爬、蔓延", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3304, "词频": 19, "单词": "diabetes", "释义": "糖尿病", "其他拼写": null, "pos": "noun"}, {"序号": 3305, "词频": 19, "单词": "drunk", "释义": "醉酒", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3306, "词频": 19, "单词": "dual", "释义": "双重的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3307, "词频": 19, "单词": "empathy", "释义": "共鸣", "其他拼写": null, "pos": "noun"}, {"序号": 3308, "词频": 19, "单词": "overtime", "释义": "超出的时间", "其他拼写": null, "pos": "noun"}, {"序号": 3309, "词频": 19, "单词": "priest", "释义": "牧师", "其他拼写": null, "pos": "noun"}, {"序号": 3310, "词频": 19, "单词": "tire", "释义": "轮胎", "其他拼写": "tyre", "pos": "noun_verb"}, {"序号": 3311, "词频": 19, "单词": "disastrous", "释义": "灾难性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3312, "词频": 19, "单词": "leather", "释义": "皮革", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3313, "词频": 19, "单词": "multiply", "释义": "乘", "其他拼写": null, "pos": "verb"}, {"序号": 3314, "词频": 19, "单词": "pigeon", "释义": "鸽子", "其他拼写": null, "pos": "noun"}, {"序号": 3315, "词频": 19, "单词": "poison", "释义": "毒药", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3316, "词频": 19, "单词": "ski", "释义": "滑雪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3317, "词频": 19, "单词": "swim", "释义": "游泳", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3318, "词频": 19, "单词": "utter", "释义": "说", "其他拼写": null, "pos": "verb"}, {"序号": 3319, "词频": 18, "单词": "worm", "释义": "虫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3320, "词频": 18, "单词": "rotate", "释义": "轮流", "其他拼写": null, "pos": "verb"}, {"序号": 3321, "词频": 18, "单词": "aggravate", "释义": "恶化", "其他拼写": null, "pos": "verb"}, {"序号": 3322, "词频": 18, "单词": "sentiment", "释义": "情绪", "其他拼写": null, "pos": "noun"}, {"序号": 3323, "词频": 18, "单词": "tube", "释义": "管子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3324, "词频": 18, "单词": "loyal", "释义": "忠诚的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3325, "词频": 18, "单词": "pipe", "释义": "管子、烟斗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3326, "词频": 18, "单词": "vaccine", "释义": "疫苗", "其他拼写": null, "pos": "noun"}, {"序号": 3327, "词频": 18, "单词": "canal", "释义": "运河", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3328, "词频": 18, "单词": "conception", "释义": "概念", "其他拼写": null, "pos": "noun"}, {"序号": 3329, "词频": 18, "单词": "distort", "释义": "扭曲", "其他拼写": null, "pos": "verb"}, {"序号": 3330, "词频": 18, "单词": "gravity", "释义": "重力", "其他拼写": null, "pos": "noun"}, {"序号": 3331, "词频": 18, "单词": "imaginative", "释义": "富于想象力的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3332, "词频": 18, "单词": "municipal", "释义": "市的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3333, "词频": 18, "单词": "plausible", "释义": "似乎是真的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3334, "词频": 18, "单词": "sociology", "释义": "社会学", "其他拼写": null, "pos": "noun"}, {"序号": 3335, "词频": 18, "单词": "crawl", "释义": "爬", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3336, "词频": 18, "单词": "exit", "释义": "退出", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3337, "词频": 18, "单词": "masculine", "释义": "阳刚的", "其他拼写": null, "pos": "noun"}, {"序号": 3338, "词频": 18, "单词": "restrain", "释义": "抑制", "其他拼写": null, "pos": "verb"}, {"序号": 3339, "词频": 18, "单词": "weird", "释义": "怪异的、古怪的", "其他拼写": null, "pos": "noun"}, {"序号": 3340, "词频": 18, "单词": "advisable", "释义": "明智的", "其他拼写": "advizable", "pos": "adj_adv"}, {"序号": 3341, "词频": 18, "单词": "avenue", "释义": "大街", "其他拼写": null, "pos": "noun"}, {"序号": 3342, "词频": 18, "单词": "barrel", "释义": "桶", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3343, "词频": 18, "单词": "cabin", "释义": "机舱、小木屋", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3344, "词频": 18, "单词": "conceal", "释义": "隐藏、隐瞒", "其他拼写": null, "pos": "verb"}, {"序号": 3345, "词频": 18, "单词": "eleven", "释义": "十一", "其他拼写": null, "pos": "noun"}, {"序号": 3346, "词频": 18, "单词": "formula", "释义": "公式", "其他拼写": null, "pos": "noun"}, {"序号": 3347, "词频": 18, "单词": "basket", "释义": "篮子", "其他拼写": null, "pos": "noun"}, {"序号": 3348, "词频": 18, "单词": "eligible", "释义": "合适的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3349, "词频": 18, "单词": "immense", "释义": "巨大的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3350, "词频": 18, "单词": "indulge", "释义": "迁就、放任", "其他拼写": null, "pos": "verb"}, {"序号": 3351, "词频": 18, "单词": "log", "释义": "圆木、原木", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3352, "词频": 18, "单词": "magnetic", "释义": "有吸引力的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3353, "词频": 18, "单词": "seventy", "释义": "七十", "其他拼写": null, "pos": "noun"}, {"序号": 3354, "词频": 18, "单词": "slim", "释义": "苗条的", "其他拼写": null, "pos": "verb"}, {"序号": 3355, "词频": 18, "单词": "surpass", "释义": "超越", "其他拼写": null, "pos": "verb"}, {"序号": 3356, "词频": 18, "单词": "bend", "释义": "弯曲", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3357, "词频": 18, "单词": "charity", "释义": "慈善", "其他拼写": null, "pos": "noun"}, {"序号": 3358, "词频": 18, "单词": "clarify", "释义": "澄清", "其他拼写": null, "pos": "verb"}, {"序号": 3359, "词频": 18, "单词": "defy", "释义": "反抗、藐视", "其他拼写": null, "pos": "verb"}, {"序号": 3360, "词频": 18, "单词": "gratitude", "释义": "感激", "其他拼写": null, "pos": "noun"}, {"序号": 3361, "词频": 18, "单词": "morality", "释义": "道德", "其他拼写": null, "pos": "noun"}, {"序号": 3362, "词频": 18, "单词": "paradise", "释义": "天堂", "其他拼写": "paradize", "pos": "noun"}, {"序号": 3363, "词频": 18, "单词": "prince", "释义": "王子", "其他拼写": null, "pos": "noun"}, {"序号": 3364, "词频": 18, "单词": "revenge", "释义": "报复", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3365, "词频": 18, "单词": "van", "释义": "先导、货车", "其他拼写": null, "pos": "noun"}, {"序号": 3366, "词频": 18, "单词": "champion", "释义": "冠军", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3367, "词频": 18, "单词": "chess", "释义": "国际象棋", "其他拼写": null, "pos": "noun"}, {"序号": 3368, "词频": 18, "单词": "chocolate", "释义": "巧克力", "其他拼写": null, "pos": "noun"}, {"序号": 3369, "词频": 18, "单词": "dear", "释义": "亲爱的", "其他拼写": null, "pos": "noun"}, {"序号": 3370, "词频": 18, "单词": "deceive", "释义": "欺骗", "其他拼写": null, "pos": "verb"}, {"序号": 3371, "词频": 18, "单词": "horror", "释义": "恐怖", "其他拼写": null, "pos": "noun"}, {"序号": 3372, "词频": 18, "单词": "juice", "释义": "果汁", "其他拼写": null, "pos": "noun"}, {"序号": 3373, "词频": 18, "单词": "princess", "释义": "公主", "其他拼写": null, "pos": "noun"}, {"序号": 3374, "词频": 18, "单词": "shower", "释义": "淋浴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3375, "词频": 18, "单词": "threshold", "释义": "门槛", "其他拼写": null, "pos": "noun"}, {"序号": 3376, "词频": 18, "单词": "vocal", "释义": "声音的、声乐作品", "其他拼写": null, "pos": "noun"}, {"序号": 3377, "词频": 18, "单词": "autonomy", "释义": "自治", "其他拼写": null, "pos": "noun"}, {"序号": 3378, "词频": 18, "单词": "cloudy", "释义": "多云的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3379, "词频": 18, "单词": "grief", "释义": "悲痛", "其他拼写": null, "pos": "noun"}, {"序号": 3380, "词频": 18, "单词": "hierarchy", "释义": "等级制度", "其他拼写": null, "pos": "noun"}, {"序号": 3381, "词频": 18, "单词": "probable", "释义": "很可能的", "其他拼写": null, "pos": "noun"}, {"序号": 3382, "词频": 18, "单词": "wooden", "释义": "木制的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3383, "词频": 17, "单词": "comparative", "释义": "比较的、比较级", "其他拼写": null, "pos": "noun"}, {"序号": 3384, "词频": 17, "单词": "cartoon", "释义": "卡通", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3385, "词频": 17, "单词": "medal", "释义": "奖章", "其他拼写": null, "pos": "noun"}, {"序号": 3386, "词频": 17, "单词": "detach", "释义": "分离、派遣", "其他拼写": null, "pos": "verb"}, {"序号": 3387, "词频": 17, "单词": "durable", "释义": "耐用持久的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3388, "词频": 17, "单词": "partial", "释义": "部分的、偏袒的", "其他拼写": null, "pos": "noun"}, {"序号": 3389, "词频": 17, "单词": "predator", "释义": "食肉动物", "其他拼写": null, "pos": "noun"}, {"序号": 3390, "词频": 17, "单词": "cruel", "释义": "残忍的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3391, "词频": 17, "单词": "mend", "释义": "修补、修理", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3392, "词频": 17, "单词": "progressive", "释义": "渐进的、先进的", "其他拼写": null, "pos": "noun"}, {"序号": 3393, "词频": 17, "单词": "ratio", "释义": "比率", "其他拼写": null, "pos": "noun"}, {"序号": 3394, "词频": 17, "单词": "subscribe", "释义": "订阅", "其他拼写": null, "pos": "verb"}, {"序号": 3395, "词频": 17, "单词": "tactic", "释义": "策略", "其他拼写": null, "pos": "noun"}, {"序号": 3396, "词频": 17, "单词": "constrain", "释义": "限制", "其他拼写": null, "pos": "verb"}, {"序号": 3397, "词频": 17, "单词": "dentist", "释义": "牙科医生", "其他拼写": null, "pos": "noun"}, {"序号": 3398, "词频": 17, "单词": "prone", "释义": "俯卧的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3399, "词频": 17, "单词": "refresh", "释义": "提神", "其他拼写": null, "pos": "verb"}, {"序号": 3400, "词频": 17, "单词": "cooperative", "释义": "合作的", "其他拼写": null, "pos": "noun"}, {"序号": 3401, "词频": 17, "单词": "depart", "释义": "离开", "其他拼写": null, "pos": "verb"}, {"序号": 3402, "词频": 17, "单词": "endurance", "释义": "忍耐", "其他拼写": null, "pos": "noun"}, {"序号": 3403, "词频": 17, "单词": "glimpse", "释义": "瞥见", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3404, "词频": 17, "单词": "grandmother", "释义": "（外）祖母", "其他拼写": null, "pos": "noun"}, {"序号": 3405, "词频": 17, "单词": "probe", "释义": "探测、探针", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3406, "词频": 17, "单词": "scrutiny", "释义": "监视", "其他拼写": null, "pos": "noun"}, {"序号": 3407, "词频": 17, "单词": "shortcoming", "释义": "缺点", "其他拼写": null, "pos": "noun"}, {"序号": 3408, "词频": 17, "单词": "subordinate", "释义": "次要的、下级的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3409, "词频": 17, "单词": "drag", "释义": "拉、拽", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3410, "词频": 17, "单词": "expenditure", "释义": "开支", "其他拼写": null, "pos": "noun"}, {"序号": 3411, "词频": 17, "单词": "fantasy", "释义": "幻想", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3412, "词频": 17, "单词": "grey", "释义": "灰色的", "其他拼写": "gray", "pos": "noun_verb"}, {"序号": 3413, "词频": 17, "单词": "insult", "释义": "侮辱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3414, "词频": 17, "单词": "persuasion", "释义": "说服", "其他拼写": null, "pos": "noun"}, {"序号": 3415, "词频": 17, "单词": "plug", "释义": "塞、插头", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3416, "词频": 17, "单词": "revelation", "释义": "启示", "其他拼写": null, "pos": "noun"}, {"序号": 3417, "词频": 17, "单词": "terrify", "释义": "使恐怖、使害怕", "其他拼写": null, "pos": "verb"}, {"序号": 3418, "词频": 17, "单词": "algorithm", "释义": "算法", "其他拼写": null, "pos": "noun"}, {"序号": 3419, "词频": 17, "单词": "boycott", "释义": "拒绝参加", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3420, "词频": 17, "单词": "coincide", "释义": "一致", "其他拼写": null, "pos": "verb"}, {"序号": 3421, "词频": 17, "单词": "dealer", "释义": "经销商", "其他拼写": null, "pos": "noun"}, {"序号": 3422, "词频": 17, "单词": "disposal", "释义": "处理", "其他拼写": null, "pos": "noun"}, {"序号": 3423, "词频": 17, "单词": "fever", "释义": "发烧", "其他拼写": null, "pos": "noun"}, {"序号": 3424, "词频": 17, "单词": "forgive", "释义": "原谅", "其他拼写": null, "pos": "verb"}, {"序号": 3425, "词频": 17, "单词": "lawn", "释义": "草坪", "其他拼写": null, "pos": "noun"}, {"序号": 3426, "词频": 17, "单词": "lodge", "释义": "小屋、门房", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3427, "词频": 17, "单词": "nest", "释义": "窝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3428, "词频": 17, "单词": "pill", "释义": "药丸", "其他拼写": null, "pos": "noun"}, {"序号": 3429, "词频": 17, "单词": "spectrum", "释义": "光谱", "其他拼写": null, "pos": "noun"}, {"序号": 3430, "词频": 17, "单词": "turkey", "释义": "火鸡", "其他拼写": null, "pos": "noun"}, {"序号": 3431, "词频": 17, "单词": "bathroom", "释义": "浴室", "其他拼写": null, "pos": "noun"}, {"序号": 3432, "词频": 17, "单词": "chest", "释义": "胸", "其他拼写": null, "pos": "noun"}, {"序号": 3433, "词频": 17, "单词": "foolish", "释义": "愚蠢的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3434, "词频": 17, "单词": "frustrate", "释义": "挫败、使灰心", "其他拼写": null, "pos": "verb"}, {"序号": 3435, "词频": 17, "单词": "lamp", "释义": "灯", "其他拼写": null, "pos": "noun"}, {"序号": 3436, "词频": 17, "单词": "league", "释义": "联盟", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3437, "词频": 17, "单词": "tablet", "释义": "平板电脑", "其他拼写": null, "pos": "noun"}, {"序号": 3438, "词频": 17, "单词": "affluent", "释义": "富裕的", "其他拼写": null, "pos": "noun"}, {"序号": 3439, "词频": 17, "单词": "cabinet", "释义": "内阁", "其他拼写": null, "pos": "noun"}, {"序号": 3440, "词频": 17, "单词": "collision", "释义": "碰撞", "其他拼写": null, "pos": "noun"}, {"序号": 3441, "词频": 17, "单词": "delicious", "释义": "美味的", "其他拼写": null, "pos": "noun"}, {"序号": 3442, "词频": 17, "单词": "duck", "释义": "鸭", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3443, "词频": 17, "单词": "monument", "释义": "纪念碑", "其他拼写": null, "pos": "noun"}, {"序号": 3444, "词频": 17, "单词": "pear", "释义": "梨树", "其他拼写": null, "pos": "noun"}, {"序号": 3445, "词频": 17, "单词": "spider", "释义": "蜘蛛", "其他拼写": null, "pos": "noun"}, {"序号": 3446, "词频": 17, "单词": "stack", "释义": "堆", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3447, "词频": 17, "单词": "tame", "释义": "驯服的、驯养", "其他拼写": null, "pos": "verb"}, {"序号": 3448, "词频": 17, "单词": "tent", "释义": "帐篷", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3449, "词频": 17, "单词": "tomato", "释义": "西红柿", "其他拼写": null, "pos": "noun"}, {"序号": 3450, "词频": 16, "单词": "helmet", "释义": "头盔", "其他拼写": null, "pos": "noun"}, {"序号": 3451, "词频": 16, "单词": "fantastic", "释义": "奇异的、极好的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3452, "词频": 16, "单词": "metropolitan", "释义": "大都市的", "其他拼写": null, "pos": "noun"}, {"序号": 3453, "词频": 16, "单词": "restraint", "释义": "克制", "其他拼写": null, "pos": "noun"}, {"序号": 3454, "词频": 16, "单词": "accordingly", "释义": "相应地、因此", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3455, "词频": 16, "单词": "drawing", "释义": "绘图", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3456, "词频": 16, "单词": "eighty", "释义": "八十", "其他拼写": null, "pos": "noun"}, {"序号": 3457, "词频": 16, "单词": "hi", "释义": "你好", "其他拼写": null, "pos": "noun"}, {"序号": 3458, "词频": 16, "单词": "inertia", "释义": "惯性", "其他拼写": null, "pos": "noun"}, {"序号": 3459, "词频": 16, "单词": "lately", "释义": "最近", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3460, "词频": 16, "单词": "lump", "释义": "块", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3461, "词频": 16, "单词": "ninety", "释义": "九十", "其他拼写": null, "pos": "noun"}, {"序号": 3462, "词频": 16, "单词": "plentiful", "释义": "丰富的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3463, "词频": 16, "单词": "revolve", "释义": "围绕", "其他拼写": null, "pos": "verb"}, {"序号": 3464, "词频": 16, "单词": "theirs", "释义": "们的", "其他拼写": null, "pos": "other"}, {"序号": 3465, "词频": 16, "单词": "harmony", "释义": "和谐", "其他拼写": null, "pos": "noun"}, {"序号": 3466, "词频": 16, "单词": "breakdown", "释义": "崩溃、故障", "其他拼写": null, "pos": "noun"}, {"序号": 3467, "词频": 16, "单词": "dash", "释义": "猛冲", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3468, "词频": 16, "单词": "flee", "释义": "逃跑", "其他拼写": null, "pos": "verb"}, {"序号": 3469, "词频": 16, "单词": "humorous", "释义": "幽默的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3470, "词频": 16, "单词": "kit", "释义": "装备", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3471, "词频": 16, "单词": "magnify", "释义": "放大", "其他拼写": null, "pos": "verb"}, {"序号": 3472, "词频": 16, "单词": "rubber", "释义": "橡胶", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3473, "词频": 16, "单词": "senate", "释义": "参议院", "其他拼写": null, "pos": "noun"}, {"序号": 3474, "词频": 16, "单词": "sixteen", "释义": "十六", "其他拼写": null, "pos": "noun"}, {"序号": 3475, "词频": 16, "单词": "spin", "释义": "旋转", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3476, "词频": 16, "单词": "tank", "释义": "坦克、水箱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3477, "词频": 16, "单词": "thoughtful", "释义": "深思熟虑的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3478, "词频": 16, "单词": "veteran", "释义": "老兵", "其他拼写": null, "pos": "noun"}, {"序号": 3479, "词频": 16, "单词": "angle", "释义": "角", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3480, "词频": 16, "单词": "brave", "释义": "勇敢的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3481, "词频": 16, "单词": "cafe", "释义": "咖啡馆", "其他拼写": null, "pos": "noun"}, {"序号": 3482, "词频": 16, "单词": "compliment", "释义": "恭维", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3483, "词频": 16, "单词": "crew", "释义": "全体船员", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3484, "词频": 16, "单词": "envy", "释义": "嫉妒", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3485, "词频": 16, "单词": "illuminate", "释义": "照明、说明", "其他拼写": null, "pos": "verb"}, {"序号": 3486, "词频": 16, "单词": "metric", "释义": "度量", "其他拼写": null, "pos": "noun"}, {"序号": 3487, "词频": 16, "单词": "molecule", "释义": "分子", "其他拼写": null, "pos": "noun"}, {"序号": 3488, "词频": 16, "单词": "noisy", "释义": "嘈杂的、吵闹的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3489, "词频": 16, "单词": "particle", "释义": "粒子", "其他拼写": null, "pos": "noun"}, {"序号": 3490, "词频": 16, "单词": "residence", "释义": "住宅", "其他拼写": null, "pos": "noun"}, {"序号": 3491, "词频": 16, "单词": "stain", "释义": "污点、着色", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3492, "词频": 16, "单词": "tangible", "释义": "有形的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3493, "词频": 16, "单词": "chaos", "释义": "混乱", "其他拼写": null, "pos": "noun"}, {"序号": 3494, "词频": 16, "单词": "hardware", "释义": "五金器具", "其他拼写": null, "pos": "noun"}, {"序号": 3495, "词频": 16, "单词": "harness", "释义": "利用", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3496, "词频": 16, "单词": "legend", "释义": "传说", "其他拼写": null, "pos": "noun"}, {"序号": 3497, "词频": 16, "单词": "premise", "释义": "前提", "其他拼写": "premize", "pos": "noun_verb"}, {"序号": 3498, "词频": 16, "单词": "refusal", "释义": "拒绝", "其他拼写": null, "pos": "noun"}, {"序号": 3499, "词频": 16, "单词": "technician", "释义": "技术员", "其他拼写": null, "pos": "noun"}, {"序号": 3500, "词频": 16, "单词": "toss", "释义": "投掷、辗转", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3501, "词频": 16, "单词": "turnover", "释义": "营业额", "其他拼写": null, "pos": "noun"}, {"序号": 3502, "词频": 16, "单词": "ally", "释义": "伙伴、同盟者", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3503, "词频": 16, "单词": "cruise", "释义": "巡航", "其他拼写": "cruize", "pos": "noun_verb"}, {"序号": 3504, "词频": 16, "单词": "deputy", "释义": "副手", "其他拼写": null, "pos": "noun"}, {"序号": 3505, "词频": 16, "单词": "diary", "释义": "日记", "其他拼写": null, "pos": "noun"}, {"序号": 3506, "词频": 16, "单词": "faint", "释义": "微弱的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3507, "词频": 16, "单词": "gram", "释义": "克", "其他拼写": null, "pos": "noun"}, {"序号": 3508, "词频": 16, "单词": "idle", "释义": "无目的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3509, "词频": 16, "单词": "lorry", "释义": "货车", "其他拼写": null, "pos": "noun"}, {"序号": 3510, "词频": 16, "单词": "nut", "释义": "螺母、坚果", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3511, "词频": 16, "单词": "oven", "释义": "烤箱", "其他拼写": null, "pos": "noun"}, {"序号": 3512, "词频": 16, "单词": "overnight", "释义": "过夜", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3513, "词频": 16, "单词": "skyscraper", "释义": "摩天大楼", "其他拼写": null, "pos": "noun"}, {"序号": 3514, "词频": 16, "单词": "summit", "释义": "顶点", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3515, "词频": 16, "单词": "lens", "释义": "镜头", "其他拼写": null, "pos": "noun"}, {"序号": 3516, "词频": 16, "单词": "porter", "释义": "搬运工", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3517, "词频": 16, "单词": "practise", "释义": "练习", "其他拼写": "practice", "pos": "verb"}, {"序号": 3518, "词频": 16, "单词": "swell", "释义": "膨胀、涌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3519, "词频": 16, "单词": "sword", "释义": "剑", "其他拼写": null, "pos": "noun"}, {"序号": 3520, "词频": 16, "单词": "vacant", "释义": "空的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3521, "词频": 16, "单词": "violin", "释义": "小提琴", "其他拼写": null, "pos": "noun"}, {"序号": 3522, "词频": 16, "单词": "weep", "释义": "哭泣", "其他拼写": null, "pos": "verb"}, {"序号": 3523, "词频": 15, "单词": "courtesy", "释义": "礼貌", "其他拼写": "cortesy", "pos": "noun"}, {"序号": 3524, "词频": 15, "单词": "doom", "释义": "厄运、注定", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3525, "词频": 15, "单词": "inhabit", "释义": "栖息", "其他拼写": null, "pos": "verb"}, {"序号": 3526, "词频": 15, "单词": "preferable", "释义": "更好的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3527, "词频": 15, "单词": "sketch", "释义": "素描、草图", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3528, "词频": 15, "单词": "bang", "释义": "巨响、刘海", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3529, "词频": 15, "单词": "chamber", "释义": "室", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3530, "词频": 15, "单词": "enlighten", "释义": "启发", "其他拼写": null, "pos": "verb"}, {"序号": 3531, "词频": 15, "单词": "mixture", "释义": "混合", "其他拼写": null, "pos": "noun"}, {"序号": 3532, "词频": 15, "单词": "pan", "释义": "平底锅", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3533, "词频": 15, "单词": "pearl", "释义": "珍珠", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3534, "词频": 15, "单词": "acre", "释义": "英亩", "其他拼写": null, "pos": "noun"}, {"序号": 3535, "词频": 15, "单词": "conspicuous", "释义": "显著的、显眼的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3536, "词频": 15, "单词": "fragile", "释义": "脆弱的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3537, "词频": 15, "单词": "gigantic", "释义": "巨大的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3538, "词频": 15, "单词": "overturn", "释义": "掀翻、推翻", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3539, "词频": 15, "单词": "propel", "释义": "推进", "其他拼写": null, "pos": "verb"}, {"序号": 3540, "词频": 15, "单词": "sow", "释义": "播种、母猪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3541, "词频": 15, "单词": "stove", "释义": "炉子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3542, "词频": 15, "单词": "vain", "释义": "徒劳的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3543, "词频": 15, "单词": "bold", "释义": "大胆的", "其他拼写": null, "pos": "noun"}, {"序号": 3544, "词频": 15, "单词": "clarity", "释义": "清楚", "其他拼写": null, "pos": "noun"}, {"序号": 3545, "词频": 15, "单词": "dirt", "释义": "污垢、泥土", "其他拼写": null, "pos": "noun"}, {"序号": 3546, "词频": 15, "单词": "disclose", "释义": "揭露、公开", "其他拼写": null, "pos": "verb"}, {"序号": 3547, "词频": 15, "单词": "embody", "释义": "包含", "其他拼写": null, "pos": "verb"}, {"序号": 3548, "词频": 15, "单词": "inject", "释义": "注入", "其他拼写": null, "pos": "verb"}, {"序号": 3549, "词频": 15, "单词": "loom", "释义": "织布机", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3550, "词频": 15, "单词": "spacious", "释义": "宽敞的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3551, "词频": 15, "单词": "astronaut", "释义": "宇航员", "其他拼写": null, "pos": "noun"}, {"序号": 3552, "词频": 15, "单词": "confer", "释义": "商讨", "其他拼写": null, "pos": "verb"}, {"序号": 3553, "词频": 15, "单词": "conviction", "释义": "定罪", "其他拼写": null, "pos": "noun"}, {"序号": 3554, "词频": 15, "单词": "eyesight", "释义": "视力", "其他拼写": null, "pos": "noun"}, {"序号": 3555, "词频": 15, "单词": "fabric", "释义": "织物", "其他拼写": null, "pos": "noun"}, {"序号": 3556, "词频": 15, "单词": "fragment", "释义": "片段", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3557, "词频": 15, "单词": "operational", "释义": "操作的、运作的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3558, "词频": 15, "单词": "telegraph", "释义": "电报", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3559, "词频": 15, "单词": "zoo", "释义": "动物园", "其他拼写": null, "pos": "noun"}, {"序号": 3560, "词频": 15, "单词": "absurd", "释义": "荒唐、可笑的", "其他拼写": null, "pos": "noun"}, {"序号": 3561, "词频": 15, "单词": "anonymous", "释义": "匿名的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3562, "词频": 15, "单词": "cheese", "释义": "奶酪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3563, "词频": 15, "单词": "descendant", "释义": "后裔、后代", "其他拼写": null, "pos": "noun"}, {"序号": 3564, "词频": 15, "单词": "downward", "释义": "向下", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3565, "词频": 15, "单词": "embarrass", "释义": "使尴尬、窘迫", "其他拼写": null, "pos": "verb"}, {"序号": 3566, "词频": 15, "单词": "probability", "释义": "可能性", "其他拼写": null, "pos": "noun"}, {"序号": 3567, "词频": 15, "单词": "scenery", "释义": "风景", "其他拼写": null, "pos": "noun"}, {"序号": 3568, "词频": 15, "单词": "utmost", "释义": "极限、最大限度的", "其他拼写": null, "pos": "noun"}, {"序号": 3569, "词频": 15, "单词": "whichever", "释义": "无论哪一个", "其他拼写": null, "pos": "other"}, {"序号": 3570, "词频": 15, "单词": "bare", "释义": "赤裸的、空的", "其他拼写": null, "pos": "verb"}, {"序号": 3571, "词频": 15, "单词": "confess", "释义": "承认", "其他拼写": null, "pos": "verb"}, {"序号": 3572, "词频": 15, "单词": "coupon", "释义": "息票", "其他拼写": null, "pos": "noun"}, {"序号": 3573, "词频": 15, "单词": "discharge", "释义": "释放", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3574, "词频": 15, "单词": "drain", "释义": "下水道、排出", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3575, "词频": 15, "单词": "garbage", "释义": "垃圾", "其他拼写": null, "pos": "noun"}, {"序号": 3576, "词频": 15, "单词": "handicap", "释义": "障碍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3577, "词频": 15, "单词": "hook", "释义": "钩", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3578, "词频": 15, "单词": "horrible", "释义": "可怕的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3579, "词频": 15, "单词": "mad", "释义": "生气的、着迷的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3580, "词频": 15, "单词": "marathon", "释义": "马拉松", "其他拼写": null, "pos": "noun"}, {"序号": 3581, "词频": 15, "单词": "optional", "释义": "可选的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3582, "词频": 15, "单词": "orientation", "释义": "定位", "其他拼写": null, "pos": "noun"}, {"序号": 3583, "词频": 15, "单词": "pit", "释义": "坑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3584, "词频": 15, "单词": "questionnaire", "释义": "问卷", "其他拼写": null, "pos": "noun"}, {"序号": 3585, "词频": 15, "单词": "stake", "释义": "桩、赌注", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3586, "词频": 15, "单词": "stomach", "释义": "胃", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3587, "词频": 15, "单词": "treaty", "释义": "条约", "其他拼写": null, "pos": "noun"}, {"序号": 3588, "词频": 15, "单词": "virgin", "释义": "处女", "其他拼写": null, "pos": "noun"}, {"序号": 3589, "词频": 15, "单词": "acquaint", "释义": "告知", "其他拼写": null, "pos": "verb"}, {"序号": 3590, "词频": 15, "单词": "ascribe", "释义": "归因于", "其他拼写": null, "pos": "verb"}, {"序号": 3591, "词频": 15, "单词": "awful", "释义": "可怕的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3592, "词频": 15, "单词": "button", "释义": "按钮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3593, "词频": 15, "单词": "cave", "释义": "洞穴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3594, "词频": 15, "单词": "complement", "释义": "相辅相成、补语", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3595, "词频": 15, "单词": "confidential", "释义": "机密的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3596, "词频": 15, "单词": "gear", "释义": "齿轮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3597, "词频": 15, "单词": "installation", "释义": "安装", "其他拼写": "instilment, instillment", "pos": "noun"}, {"序号": 3598, "词频": 15, "单词": "lively", "释义": "活泼的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3599, "词频": 15, "单词": "portable", "释义": "轻便的", "其他拼写": null, "pos": "noun"}, {"序号": 3600, "词频": 15, "单词": "prayer", "释义": "祈祷", "其他拼写": null, "pos": "noun"}, {"序号": 3601, "词频": 15, "单词": "renovate", "释义": "翻新、革新", "其他拼写": null, "pos": "verb"}, {"序号": 3602, "词频": 15, "单词": "swallow", "释义": "吞下、燕子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3603, "词频": 15, "单词": "sweater", "释义": "毛衣", "其他拼写": null, "pos": "noun"}, {"序号": 3604, "词频": 15, "单词": "trash", "释义": "垃圾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3605, "词频": 15, "单词": "whisper", "释义": "低声说、窃窃私语", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3606, "词频": 15, "单词": "abnormal", "释义": "不正常的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3607, "词频": 15, "单词": "bee", "释义": "蜜蜂", "其他拼写": null, "pos": "noun"}, {"序号": 3608, "词频": 15, "单词": "bucket", "释义": "大量、下倾盆大雨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3609, "词频": 15, "单词": "defect", "释义": "缺陷", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3610, "词频": 15, "单词": "detective", "释义": "侦探", "其他拼写": null, "pos": "noun"}, {"序号": 3611, "词频": 15, "单词": "disrupt", "释义": "干扰", "其他拼写": null, "pos": "verb"}, {"序号": 3612, "词频": 15, "单词": "identification", "释义": "识别", "其他拼写": null, "pos": "noun"}, {"序号": 3613, "词频": 15, "单词": "loose", "释义": "松的", "其他拼写": null, "pos": "verb"}, {"序号": 3614, "词频": 15, "单词": "pig", "释义": "猪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3615, "词频": 15, "单词": "pot", "释义": "壶", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3616, "词频": 15, "单词": "poultry", "释义": "家禽", "其他拼写": null, "pos": "noun"}, {"序号": 3617, "词频": 15, "单词": "recipe", "释义": "食谱", "其他拼写": null, "pos": "noun"}, {"序号": 3618, "词频": 15, "单词": "ridiculous", "释义": "荒谬的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3619, "词频": 15, "单词": "slide", "释义": "滑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3620, "词频": 15, "单词": "texture", "释义": "纹理", "其他拼写": null, "pos": "noun"}, {"序号": 3621, "词频": 14, "单词": "embryo", "释义": "胚胎", "其他拼写": null, "pos": "noun"}, {"序号": 3622, "词频": 14, "单词": "vapor", "释义": "蒸汽", "其他拼写": "vapour", "pos": "noun"}, {"序号": 3623, "词频": 14, "单词": "chancellor", "释义": "总理", "其他拼写": null, "pos": "noun"}, {"序号": 3624, "词频": 14, "单词": "deduce", "释义": "推断", "其他拼写": null, "pos": "verb"}, {"序号": 3625, "词频": 14, "单词": "glory", "释义": "荣耀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3626, "词频": 14, "单词": "gum", "释义": "树胶、齿龈", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3627, "词频": 14, "单词": "hijack", "释义": "劫持", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3628, "词频": 14, "单词": "implicit", "释义": "含蓄的、绝对的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3629, "词频": 14, "单词": "renaissance", "释义": "文艺复兴", "其他拼写": null, "pos": "noun"}, {"序号": 3630, "词频": 14, "单词": "wholly", "释义": "完全地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3631, "词频": 14, "单词": "ceiling", "释义": "天花板", "其他拼写": null, "pos": "noun"}, {"序号": 3632, "词频": 14, "单词": "default", "释义": "默认、违约", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3633, "词频": 14, "单词": "duration", "释义": "持续时间", "其他拼写": null, "pos": "noun"}, {"序号": 3634, "词频": 14, "单词": "resent", "释义": "恨", "其他拼写": null, "pos": "verb"}, {"序号": 3635, "词频": 14, "单词": "slack", "释义": "松弛的、淡季、萧条的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3636, "词频": 14, "单词": "unify", "释义": "使成为一体", "其他拼写": null, "pos": "verb"}, {"序号": 3637, "词频": 14, "单词": "upright", "释义": "正直的、垂直", "其他拼写": null, "pos": "noun"}, {"序号": 3638, "词频": 14, "单词": "chew", "释义": "咀嚼", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3639, "词频": 14, "单词": "dense", "释义": "浓密的、密集的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3640, "词频": 14, "单词": "finite", "释义": "有限的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3641, "词频": 14, "单词": "impatient", "释义": "不耐烦的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3642, "词频": 14, "单词": "intuition", "释义": "直觉", "其他拼写": null, "pos": "noun"}, {"序号": 3643, "词频": 14, "单词": "boil", "释义": "煮沸、沸腾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3644, "词频": 14, "单词": "bureaucracy", "释义": "官僚", "其他拼写": null, "pos": "noun"}, {"序号": 3645, "词频": 14, "单词": "comprehend", "释义": "领悟", "其他拼写": null, "pos": "verb"}, {"序号": 3646, "词频": 14, "单词": "framework", "释义": "框架", "其他拼写": null, "pos": "noun"}, {"序号": 3647, "词频": 14, "单词": "hamper", "释义": "妨碍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3648, "词频": 14, "单词": "logic", "释义": "逻辑", "其他拼写": null, "pos": "noun"}, {"序号": 3649, "词频": 14, "单词": "sanction", "释义": "批准、处罚", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3650, "词频": 14, "单词": "snake", "释义": "蛇", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3651, "词频": 14, "单词": "breast", "释义": "乳房", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3652, "词频": 14, "单词": "fiscal", "释义": "财政的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3653, "词频": 14, "单词": "golf", "释义": "高尔夫球", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3654, "词频": 14, "单词": "realm", "释义": "领域", "其他拼写": null, "pos": "noun"}, {"序号": 3655, "词频": 14, "单词": "scarcely", "释义": "几乎不、刚刚", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3656, "词频": 14, "单词": "tragic", "释义": "悲惨的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3657, "词频": 14, "单词": "transplant", "释义": "移植", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3658, "词频": 14, "单词": "archive", "释义": "档案、存档", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3659, "词频": 14, "单词": "corridor", "释义": "走廊", "其他拼写": null, "pos": "noun"}, {"序号": 3660, "词频": 14, "单词": "dispose", "释义": "处理掉、解决", "其他拼写": null, "pos": "verb"}, {"序号": 3661, "词频": 14, "单词": "domain", "释义": "领域", "其他拼写": null, "pos": "noun"}, {"序号": 3662, "词频": 14, "单词": "extravagant", "释义": "奢侈的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3663, "词频": 14, "单词": "flock", "释义": "一群", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3664, "词频": 14, "单词": "hybrid", "释义": "杂种", "其他拼写": null, "pos": "noun"}, {"序号": 3665, "词频": 14, "单词": "infinite", "释义": "无限", "其他拼写": null, "pos": "noun"}, {"序号": 3666, "词频": 14, "单词": "intrinsic", "释义": "内在的、固有的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3667, "词频": 14, "单词": "masterpiece", "释义": "杰作", "其他拼写": null, "pos": "noun"}, {"序号": 3668, "词频": 14, "单词": "vulgar", "释义": "粗俗的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3669, "词频": 14, "单词": "aviation", "释义": "航空", "其他拼写": null, "pos": "noun"}, {"序号": 3670, "词频": 14, "单词": "gentle", "释义": "温和的", "其他拼写": null, "pos": "verb"}, {"序号": 3671, "词频": 14, "单词": "mud", "释义": "泥", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3672, "词频": 14, "单词": "navigation", "释义": "导航", "其他拼写": null, "pos": "noun"}, {"序号": 3673, "词频": 14, "单词": "ribbon", "释义": "缎带", "其他拼写": null, "pos": "noun"}, {"序号": 3674, "词频": 14, "单词": "scandal", "释义": "丑闻", "其他拼写": null, "pos": "noun"}, {"序号": 3675, "词频": 14, "单词": "thread", "释义": "线", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3676, "词频": 14, "单词": "ache", "释义": "疼", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3677, "词频": 14, "单词": "circulate", "释义": "循环、流通", "其他拼写": null, "pos": "verb"}, {"序号": 3678, "词频": 14, "单词": "cough", "释义": "咳", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3679, "词频": 14, "单词": "deck", "释义": "甲板", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3680, "词频": 14, "单词": "diploma", "释义": "文凭", "其他拼写": null, "pos": "noun"}, {"序号": 3681, "词频": 14, "单词": "elephant", "释义": "大象", "其他拼写": null, "pos": "noun"}, {"序号": 3682, "词频": 14, "单词": "feminine", "释义": "女性的", "其他拼写": null, "pos": "noun"}, {"序号": 3683, "词频": 14, "单词": "garage", "释义": "车库", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3684, "词频": 14, "单词": "hut", "释义": "小屋", "其他拼写": null, "pos": "noun"}, {"序号": 3685, "词频": 14, "单词": "imperial", "释义": "帝国的、皇帝", "其他拼写": null, "pos": "noun"}, {"序号": 3686, "词频": 14, "单词": "ministry", "释义": "内阁", "其他拼写": null, "pos": "noun"}, {"序号": 3687, "词频": 14, "单词": "neck", "释义": "脖子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3688, "词频": 14, "单词": "pant", "释义": "裤子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3689, "词频": 14, "单词": "pest", "释义": "害虫", "其他拼写": null, "pos": "noun"}, {"序号": 3690, "词频": 14, "单词": "poster", "释义": "海报", "其他拼写": null, "pos": "noun"}, {"序号": 3691, "词频": 14, "单词": "pronoun", "释义": "代词", "其他拼写": null, "pos": "noun"}, {"序号": 3692, "词频": 14, "单词": "reconcile", "释义": "调和、一致", "其他拼写": null, "pos": "verb"}, {"序号": 3693, "词频": 14, "单词": "tender", "释义": "柔软、投标", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3694, "词频": 13, "单词": "premier", "释义": "总理", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3695, "词频": 13, "单词": "hug", "释义": "拥抱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3696, "词频": 13, "单词": "nasty", "释义": "丑陋的、惹人厌的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3697, "词频": 13, "单词": "ideology", "释义": "意识形态", "其他拼写": null, "pos": "noun"}, {"序号": 3698, "词频": 13, "单词": "laser", "释义": "激光", "其他拼写": null, "pos": "noun"}, {"序号": 3699, "词频": 13, "单词": "legacy", "释义": "遗赠物", "其他拼写": null, "pos": "noun"}, {"序号": 3700, "词频": 13, "单词": "entail", "释义": "意味着", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3701, "词频": 13, "单词": "nail", "释义": "钉、钉子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3702, "词频": 13, "单词": "broker", "释义": "经纪人", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3703, "词频": 13, "单词": "crown", "释义": "王冠", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3704, "词频": 13, "单词": "lever", "释义": "杠杆", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3705, "词频": 13, "单词": "likelihood", "释义": "可能性", "其他拼写": null, "pos": "noun"}, {"序号": 3706, "词频": 13, "单词": "limb", "释义": "肢体", "其他拼写": null, "pos": "noun"}, {"序号": 3707, "词频": 13, "单词": "proclaim", "释义": "表明、声明", "其他拼写": null, "pos": "verb"}, {"序号": 3708, "词频": 13, "单词": "swing", "释义": "摇摆、秋千", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3709, "词频": 13, "单词": "await", "释义": "等候", "其他拼写": null, "pos": "verb"}, {"序号": 3710, "词频": 13, "单词": "comedy", "释义": "喜剧", "其他拼写": null, "pos": "noun"}, {"序号": 3711, "词频": 13, "单词": "condemn", "释义": "谴责", "其他拼写": null, "pos": "verb"}, {"序号": 3712, "词频": 13, "单词": "dust", "释义": "灰尘", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3713, "词频": 13, "单词": "filter", "释义": "过滤", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3714, "词频": 13, "单词": "fluid", "释义": "流体", "其他拼写": null, "pos": "noun"}, {"序号": 3715, "词频": 13, "单词": "incidentally", "释义": "偶然地、附带地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3716, "词频": 13, "单词": "parade", "释义": "游行", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3717, "词频": 13, "单词": "pave", "释义": "铺路", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3718, "词频": 13, "单词": "preliminary", "释义": "初步的", "其他拼写": null, "pos": "noun"}, {"序号": 3719, "词频": 13, "单词": "shield", "释义": "盾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3720, "词频": 13, "单词": "terminate", "释义": "终止", "其他拼写": null, "pos": "verb"}, {"序号": 3721, "词频": 13, "单词": "tow", "释义": "拖", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3722, "词频": 13, "单词": "uneasy", "释义": "不安的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3723, "词频": 13, "单词": "weave", "释义": "编织", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3724, "词频": 13, "单词": "blur", "释义": "模糊", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3725, "词频": 13, "单词": "contemplate", "释义": "沉思、打算", "其他拼写": null, "pos": "verb"}, {"序号": 3726, "词频": 13, "单词": "discriminate", "释义": "区分、辨别", "其他拼写": null, "pos": "verb"}, {"序号": 3727, "词频": 13, "单词": "handsome", "释义": "英俊的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3728, "词频": 13, "单词": "insure", "释义": "确保", "其他拼写": null, "pos": "verb"}, {"序号": 3729, "词频": 13, "单词": "intricate", "释义": "复杂的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3730, "词频": 13, "单词": "kindness", "释义": "善良", "其他拼写": null, "pos": "noun"}, {"序号": 3731, "词频": 13, "单词": "receipt", "释义": "收据", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3732, "词频": 13, "单词": "uncover", "释义": "揭开", "其他拼写": null, "pos": "verb"}, {"序号": 3733, "词频": 13, "单词": "worship", "释义": "崇拜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3734, "词频": 13, "单词": "acid", "释义": "酸", "其他拼写": null, "pos": "noun"}, {"序号": 3735, "词频": 13, "单词": "boot", "释义": "靴子、踢", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3736, "词频": 13, "单词": "extinct", "释义": "灭绝的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3737, "词频": 13, "单词": "hamburger", "释义": "汉堡包", "其他拼写": null, "pos": "noun"}, {"序号": 3738, "词频": 13, "单词": "hawk", "释义": "鹰", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3739, "词频": 13, "单词": "hydrogen", "释义": "氢", "其他拼写": null, "pos": "noun"}, {"序号": 3740, "词频": 13, "单词": "patrol", "释义": "巡逻", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3741, "词频": 13, "单词": "picnic", "释义": "野餐", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3742, "词频": 13, "单词": "repel", "释义": "击退、排斥", "其他拼写": null, "pos": "verb"}, {"序号": 3743, "词频": 13, "单词": "simultaneous", "释义": "同时发生的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3744, "词频": 13, "单词": "sin", "释义": "犯罪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3745, "词频": 13, "单词": "spacecraft", "释义": "宇宙飞船", "其他拼写": null, "pos": "noun"}, {"序号": 3746, "词频": 13, "单词": "splendid", "释义": "辉煌的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3747, "词频": 13, "单词": "spokesman", "释义": "发言人", "其他拼写": null, "pos": "noun"}, {"序号": 3748, "词频": 13, "单词": "spray", "释义": "喷雾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3749, "词频": 13, "单词": "voyage", "释义": "航行", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3750, "词频": 13, "单词": "withstand", "释义": "承受", "其他拼写": null, "pos": "verb"}, {"序号": 3751, "词频": 13, "单词": "beverage", "释义": "饮料", "其他拼写": null, "pos": "noun"}, {"序号": 3752, "词频": 13, "单词": "bulb", "释义": "电灯泡", "其他拼写": null, "pos": "noun"}, {"序号": 3753, "词频": 13, "单词": "erect", "释义": "建立、直立的", "其他拼写": null, "pos": "verb"}, {"序号": 3754, "词频": 13, "单词": "expire", "释义": "期满、终止", "其他拼写": null, "pos": "verb"}, {"序号": 3755, "词频": 13, "单词": "grace", "释义": "优雅", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3756, "词频": 13, "单词": "gulf", "释义": "海湾", "其他拼写": null, "pos": "noun"}, {"序号": 3757, "词频": 13, "单词": "layout", "释义": "布局", "其他拼写": null, "pos": "noun"}, {"序号": 3758, "词频": 13, "单词": "librarian", "释义": "图书管理员", "其他拼写": null, "pos": "noun"}, {"序号": 3759, "词频": 13, "单词": "lover", "释义": "情人", "其他拼写": null, "pos": "noun"}, {"序号": 3760, "词频": 13, "单词": "marital", "释义": "婚姻的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3761, "词频": 13, "单词": "needle", "释义": "针", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3762, "词频": 13, "单词": "precedent", "释义": "先例", "其他拼写": null, "pos": "noun"}, {"序号": 3763, "词频": 13, "单词": "pub", "释义": "酒吧", "其他拼写": null, "pos": "noun"}, {"序号": 3764, "词频": 13, "单词": "reckless", "释义": "鲁莽的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3765, "词频": 13, "单词": "spill", "释义": "泄漏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3766, "词频": 13, "单词": "stair", "释义": "楼梯", "其他拼写": null, "pos": "noun"}, {"序号": 3767, "词频": 13, "单词": "ashamed", "释义": "羞耻的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3768, "词频": 13, "单词": "aunt", "释义": "姑、姨", "其他拼写": null, "pos": "noun"}, {"序号": 3769, "词频": 13, "单词": "bald", "释义": "秃头的、单调的", "其他拼写": null, "pos": "verb"}, {"序号": 3770, "词频": 13, "单词": "bankrupt", "释义": "破产的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3771, "词频": 13, "单词": "choke", "释义": "窒息、抑制", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3772, "词频": 13, "单词": "cumulative", "释义": "累积的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3773, "词频": 13, "单词": "dubious", "释义": "可疑的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3774, "词频": 13, "单词": "eagle", "释义": "鹰", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3775, "词频": 13, "单词": "gently", "释义": "温柔地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3776, "词频": 13, "单词": "integral", "释义": "完整的", "其他拼写": null, "pos": "noun"}, {"序号": 3777, "词频": 13, "单词": "mediate", "释义": "调停", "其他拼写": null, "pos": "verb"}, {"序号": 3778, "词频": 13, "单词": "organise", "释义": "组织", "其他拼写": "organize", "pos": "verb"}, {"序号": 3779, "词频": 13, "单词": "overtake", "释义": "赶上", "其他拼写": null, "pos": "verb"}, {"序号": 3780, "词频": 13, "单词": "pulse", "释义": "脉搏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3781, "词频": 13, "单词": "quantify", "释义": "量化", "其他拼写": null, "pos": "verb"}, {"序号": 3782, "词频": 13, "单词": "respective", "释义": "各自的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3783, "词频": 13, "单词": "riot", "释义": "骚乱、暴乱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3784, "词频": 13, "单词": "situate", "释义": "坐落在、的", "其他拼写": null, "pos": "verb"}, {"序号": 3785, "词频": 13, "单词": "skate", "释义": "滑冰", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3786, "词频": 13, "单词": "specification", "释义": "规格", "其他拼写": null, "pos": "noun"}, {"序号": 3787, "词频": 13, "单词": "sweat", "释义": "汗水", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3788, "词频": 13, "单词": "transit", "释义": "运输", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3789, "词频": 13, "单词": "tumble", "释义": "暴跌、跌倒", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3790, "词频": 12, "单词": "rap", "释义": "说唱音乐、轻敲", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3791, "词频": 12, "单词": "geology", "释义": "地质学", "其他拼写": null, "pos": "noun"}, {"序号": 3792, "词频": 12, "单词": "inference", "释义": "推理", "其他拼写": null, "pos": "noun"}, {"序号": 3793, "词频": 12, "单词": "cocaine", "释义": "可卡因", "其他拼写": null, "pos": "noun"}, {"序号": 3794, "词频": 12, "单词": "graph", "释义": "图表", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3795, "词频": 12, "单词": "monarch", "释义": "君主", "其他拼写": null, "pos": "noun"}, {"序号": 3796, "词频": 12, "单词": "multitude", "释义": "大量、多数", "其他拼写": null, "pos": "noun"}, {"序号": 3797, "词频": 12, "单词": "succession", "释义": "连续", "其他拼写": null, "pos": "noun"}, {"序号": 3798, "词频": 12, "单词": "analogy", "释义": "类比", "其他拼写": null, "pos": "noun"}, {"序号": 3799, "词频": 12, "单词": "despair", "释义": "绝望", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3800, "词频": 12, "单词": "forge", "释义": "伪造、建立", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3801, "词频": 12, "单词": "hitherto", "释义": "迄今", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3802, "词频": 12, "单词": "predecessor", "释义": "前任", "其他拼写": null, "pos": "noun"}, {"序号": 3803, "词频": 12, "单词": "whereby", "释义": "凭借", "其他拼写": null, "pos": "other"}, {"序号": 3804, "词频": 12, "单词": "aboard", "释义": "上船、在船上", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3805, "词频": 12, "单词": "beard", "释义": "胡须", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3806, "词频": 12, "单词": "bypass", "释义": "绕开、旁道", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3807, "词频": 12, "单词": "chemist", "释义": "化学家", "其他拼写": null, "pos": "noun"}, {"序号": 3808, "词频": 12, "单词": "chunk", "释义": "厚块、大片", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3809, "词频": 12, "单词": "drawback", "释义": "缺点", "其他拼写": null, "pos": "noun"}, {"序号": 3810, "词频": 12, "单词": "economical", "释义": "经济的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3811, "词频": 12, "单词": "ink", "释义": "墨水", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3812, "词频": 12, "单词": "medieval", "释义": "中世纪的", "其他拼写": "mediaeval", "pos": "adj_adv"}, {"序号": 3813, "词频": 12, "单词": "nod", "释义": "点头", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3814, "词频": 12, "单词": "simplicity", "释义": "简单", "其他拼写": null, "pos": "noun"}, {"序号": 3815, "词频": 12, "单词": "superstition", "释义": "迷信", "其他拼写": null, "pos": "noun"}, {"序号": 3816, "词频": 12, "单词": "triple", "释义": "三倍的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3817, "词频": 12, "单词": "unfold", "释义": "展开", "其他拼写": null, "pos": "verb"}, {"序号": 3818, "词频": 12, "单词": "accountant", "释义": "会计师", "其他拼写": null, "pos": "noun"}, {"序号": 3819, "词频": 12, "单词": "bunch", "释义": "束、一群", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3820, "词频": 12, "单词": "elder", "释义": "年长的、长者", "其他拼写": null, "pos": "noun"}, {"序号": 3821, "词频": 12, "单词": "erase", "释义": "抹去", "其他拼写": null, "pos": "verb"}, {"序号": 3822, "词频": 12, "单词": "fearful", "释义": "可怕的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3823, "词频": 12, "单词": "glow", "释义": "光辉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3824, "词频": 12, "单词": "holy", "释义": "神圣的", "其他拼写": null, "pos": "noun"}, {"序号": 3825, "词频": 12, "单词": "inclusive", "释义": "在内的、包罗广泛的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3826, "词频": 12, "单词": "jar", "释义": "罐子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3827, "词频": 12, "单词": "outward", "释义": "向外的、向外、在外", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3828, "词频": 12, "单词": "plague", "释义": "瘟疫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3829, "词频": 12, "单词": "refute", "释义": "反驳、驳斥", "其他拼写": null, "pos": "verb"}, {"序号": 3830, "词频": 12, "单词": "spontaneous", "释义": "自然产生的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3831, "词频": 12, "单词": "adhere", "释义": "坚持", "其他拼写": null, "pos": "verb"}, {"序号": 3832, "词频": 12, "单词": "aluminum", "释义": "铝", "其他拼写": "aluminium", "pos": "noun"}, {"序号": 3833, "词频": 12, "单词": "bleed", "释义": "流血", "其他拼写": null, "pos": "verb"}, {"序号": 3834, "词频": 12, "单词": "catalog", "释义": "目录", "其他拼写": "catalogue", "pos": "noun_verb"}, {"序号": 3835, "词频": 12, "单词": "erupt", "释义": "爆发", "其他拼写": null, "pos": "verb"}, {"序号": 3836, "词频": 12, "单词": "explosive", "释义": "炸药", "其他拼写": null, "pos": "noun"}, {"序号": 3837, "词频": 12, "单词": "fluctuate", "释义": "波动", "其他拼写": null, "pos": "verb"}, {"序号": 3838, "词频": 12, "单词": "fur", "释义": "毛皮", "其他拼写": null, "pos": "noun"}, {"序号": 3839, "词频": 12, "单词": "gut", "释义": "内脏、肠子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3840, "词频": 12, "单词": "heal", "释义": "治愈", "其他拼写": null, "pos": "verb"}, {"序号": 3841, "词频": 12, "单词": "irritate", "释义": "激怒", "其他拼写": null, "pos": "verb"}, {"序号": 3842, "词频": 12, "单词": "liberty", "释义": "自由", "其他拼写": null, "pos": "noun"}, {"序号": 3843, "词频": 12, "单词": "parcel", "释义": "包裹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3844, "词频": 12, "单词": "sheep", "释义": "羊", "其他拼写": null, "pos": "noun"}, {"序号": 3845, "词频": 12, "单词": "summon", "释义": "召唤", "其他拼写": null, "pos": "verb"}, {"序号": 3846, "词频": 12, "单词": "terminal", "释义": "终点、末端", "其他拼写": null, "pos": "noun"}, {"序号": 3847, "词频": 12, "单词": "tremble", "释义": "颤抖", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3848, "词频": 12, "单词": "tribute", "释义": "贡品、称赞", "其他拼写": null, "pos": "noun"}, {"序号": 3849, "词频": 12, "单词": "devil", "释义": "魔鬼", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3850, "词频": 12, "单词": "diplomatic", "释义": "外交的、老练的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3851, "词频": 12, "单词": "displace", "释义": "取代", "其他拼写": null, "pos": "verb"}, {"序号": 3852, "词频": 12, "单词": "echo", "释义": "回声", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3853, "词频": 12, "单词": "evoke", "释义": "唤起", "其他拼写": null, "pos": "verb"}, {"序号": 3854, "词频": 12, "单词": "funeral", "释义": "葬礼", "其他拼写": null, "pos": "noun"}, {"序号": 3855, "词频": 12, "单词": "mammal", "释义": "哺乳动物", "其他拼写": null, "pos": "noun"}, {"序号": 3856, "词频": 12, "单词": "midst", "释义": "中间", "其他拼写": null, "pos": "noun"}, {"序号": 3857, "词频": 12, "单词": "offset", "释义": "抵消", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3858, "词频": 12, "单词": "peasant", "释义": "农民", "其他拼写": null, "pos": "noun"}, {"序号": 3859, "词频": 12, "单词": "scold", "释义": "斥责", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3860, "词频": 12, "单词": "slump", "释义": "暴跌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3861, "词频": 12, "单词": "tail", "释义": "尾巴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3862, "词频": 12, "单词": "typewriter", "释义": "打字机", "其他拼写": null, "pos": "noun"}, {"序号": 3863, "词频": 12, "单词": "accent", "释义": "口音", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3864, "词频": 12, "单词": "accordance", "释义": "符合、一致", "其他拼写": null, "pos": "noun"}, {"序号": 3865, "词频": 12, "单词": "anniversary", "释义": "周年纪念", "其他拼写": null, "pos": "noun"}, {"序号": 3866, "词频": 12, "单词": "banana", "释义": "香蕉", "其他拼写": null, "pos": "noun"}, {"序号": 3867, "词频": 12, "单词": "bloom", "释义": "花", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3868, "词频": 12, "单词": "catastrophe", "释义": "大灾难", "其他拼写": null, "pos": "noun"}, {"序号": 3869, "词频": 12, "单词": "certify", "释义": "证明", "其他拼写": null, "pos": "verb"}, {"序号": 3870, "词频": 12, "单词": "collide", "释义": "碰撞", "其他拼写": null, "pos": "verb"}, {"序号": 3871, "词频": 12, "单词": "cord", "释义": "绳索", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3872, "词频": 12, "单词": "denial", "释义": "否认", "其他拼写": null, "pos": "noun"}, {"序号": 3873, "词频": 12, "单词": "dormitory", "释义": "集体宿舍", "其他拼写": null, "pos": "noun"}, {"序号": 3874, "词频": 12, "单词": "lemon", "释义": "柠檬", "其他拼写": null, "pos": "noun"}, {"序号": 3875, "词频": 12, "单词": "ounce", "释义": "盎司", "其他拼写": null, "pos": "noun"}, {"序号": 3876, "词频": 12, "单词": "pedestrian", "释义": "行人", "其他拼写": null, "pos": "noun"}, {"序号": 3877, "词频": 12, "单词": "sail", "释义": "航行、帆", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3878, "词频": 12, "单词": "salad", "释义": "色拉", "其他拼写": null, "pos": "noun"}, {"序号": 3879, "词频": 12, "单词": "scenario", "释义": "场景", "其他拼写": null, "pos": "noun"}, {"序号": 3880, "词频": 12, "单词": "sightseeing", "释义": "游览", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3881, "词频": 12, "单词": "silk", "释义": "丝", "其他拼写": null, "pos": "noun"}, {"序号": 3882, "词频": 12, "单词": "slope", "释义": "斜坡、倾斜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3883, "词频": 12, "单词": "sob", "释义": "呜咽、哭泣", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3884, "词频": 12, "单词": "warfare", "释义": "战争", "其他拼写": null, "pos": "noun"}, {"序号": 3885, "词频": 11, "单词": "juvenile", "释义": "青少年", "其他拼写": null, "pos": "noun"}, {"序号": 3886, "词频": 11, "单词": "pilgrim", "释义": "朝圣者", "其他拼写": null, "pos": "noun"}, {"序号": 3887, "词频": 11, "单词": "stadium", "释义": "体育场", "其他拼写": null, "pos": "noun"}, {"序号": 3888, "词频": 11, "单词": "evade", "释义": "逃避", "其他拼写": null, "pos": "verb"}, {"序号": 3889, "词频": 11, "单词": "saturate", "释义": "使饱和、使充满", "其他拼写": null, "pos": "verb"}, {"序号": 3890, "词频": 11, "单词": "token", "释义": "象征、象征性的", "其他拼写": null, "pos": "noun"}, {"序号": 3891, "词频": 11, "单词": "conscience", "释义": "良心", "其他拼写": null, "pos": "noun"}, {"序号": 3892, "词频": 11, "单词": "continual", "释义": "不断的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3893, "词频": 11, "单词": "diligent", "释义": "勤奋的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3894, "词频": 11, "单词": "exemplify", "释义": "例证", "其他拼写": null, "pos": "verb"}, {"序号": 3895, "词频": 11, "单词": "hail", "释义": "冰雹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3896, "词频": 11, "单词": "numerical", "释义": "数字的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3897, "词频": 11, "单词": "orderly", "释义": "有秩序的、整齐的", "其他拼写": null, "pos": "noun"}, {"序号": 3898, "词频": 11, "单词": "warrant", "释义": "保证、授权", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3899, "词频": 11, "单词": "comprise", "释义": "包含", "其他拼写": "comprize", "pos": "verb"}, {"序号": 3900, "词频": 11, "单词": "dental", "释义": "牙齿的", "其他拼写": null, "pos": "noun"}, {"序号": 3901, "词频": 11, "单词": "flavor", "释义": "风味", "其他拼写": "flavour", "pos": "noun_verb"}, {"序号": 3902, "词频": 11, "单词": "kilogram", "释义": "公斤", "其他拼写": null, "pos": "noun"}, {"序号": 3903, "词频": 11, "单词": "preach", "释义": "说教、讲道", "其他拼写": null, "pos": "verb"}, {"序号": 3904, "词频": 11, "单词": "presently", "释义": "不久、目前", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3905, "词频": 11, "单词": "prose", "释义": "散文", "其他拼写": null, "pos": "noun"}, {"序号": 3906, "词频": 11, "单词": "shark", "释义": "鲨鱼", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3907, "词频": 11, "单词": "thirteen", "释义": "十三", "其他拼写": null, "pos": "noun"}, {"序号": 3908, "词频": 11, "单词": "vertical", "释义": "垂直的", "其他拼写": null, "pos": "noun"}, {"序号": 3909, "词频": 11, "单词": "administer", "释义": "管理", "其他拼写": null, "pos": "verb"}, {"序号": 3910, "词频": 11, "单词": "aspire", "释义": "立志", "其他拼写": null, "pos": "verb"}, {"序号": 3911, "词频": 11, "单词": "attorney", "释义": "律师", "其他拼写": null, "pos": "noun"}, {"序号": 3912, "词频": 11, "单词": "classification", "释义": "分类", "其他拼写": null, "pos": "noun"}, {"序号": 3913, "词频": 11, "单词": "declaration", "释义": "宣告、声明", "其他拼写": null, "pos": "noun"}, {"序号": 3914, "词频": 11, "单词": "editorial", "释义": "社论", "其他拼写": null, "pos": "noun"}, {"序号": 3915, "词频": 11, "单词": "explicit", "释义": "明确的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3916, "词频": 11, "单词": "fruitful", "释义": "富有成效的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3917, "词频": 11, "单词": "meantime", "释义": "同时", "其他拼写": null, "pos": "noun"}, {"序号": 3918, "词频": 11, "单词": "nightmare", "释义": "恶梦", "其他拼写": null, "pos": "noun"}, {"序号": 3919, "词频": 11, "单词": "ornament", "释义": "装饰", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3920, "词频": 11, "单词": "perpetual", "释义": "永久的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3921, "词频": 11, "单词": "pregnant", "释义": "怀孕的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3922, "词频": 11, "单词": "rally", "释义": "集会", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3923, "词频": 11, "单词": "rebel", "释义": "反抗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3924, "词频": 11, "单词": "successive", "释义": "连续的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3925, "词频": 11, "单词": "tin", "释义": "锡", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3926, "词频": 11, "单词": "warehouse", "释义": "仓库", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3927, "词频": 11, "单词": "wit", "释义": "机智、才智", "其他拼写": null, "pos": "noun"}, {"序号": 3928, "词频": 11, "单词": "arithmetic", "释义": "算术", "其他拼写": null, "pos": "noun"}, {"序号": 3929, "词频": 11, "单词": "axis", "释义": "轴", "其他拼写": null, "pos": "noun"}, {"序号": 3930, "词频": 11, "单词": "brisk", "释义": "轻快的、活跃的", "其他拼写": null, "pos": "verb"}, {"序号": 3931, "词频": 11, "单词": "cage", "释义": "笼子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3932, "词频": 11, "单词": "casualty", "释义": "事故", "其他拼写": null, "pos": "noun"}, {"序号": 3933, "词频": 11, "单词": "certainty", "释义": "确定", "其他拼写": null, "pos": "noun"}, {"序号": 3934, "词频": 11, "单词": "clause", "释义": "条款", "其他拼写": null, "pos": "noun"}, {"序号": 3935, "词频": 11, "单词": "curse", "释义": "诅咒", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3936, "词频": 11, "单词": "disguise", "释义": "伪装", "其他拼写": "disguize", "pos": "noun_verb"}, {"序号": 3937, "词频": 11, "单词": "doorway", "释义": "门口", "其他拼写": null, "pos": "noun"}, {"序号": 3938, "词频": 11, "单词": "faithful", "释义": "忠实的", "其他拼写": null, "pos": "noun"}, {"序号": 3939, "词频": 11, "单词": "ghost", "释义": "鬼魂", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3940, "词频": 11, "单词": "greedy", "释义": "贪婪的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3941, "词频": 11, "单词": "illustration", "释义": "插图、说明", "其他拼写": null, "pos": "noun"}, {"序号": 3942, "词频": 11, "单词": "imaginary", "释义": "虚构的", "其他拼写": null, "pos": "noun"}, {"序号": 3943, "词频": 11, "单词": "marginal", "释义": "微小的、边际的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3944, "词频": 11, "单词": "obsession", "释义": "困扰", "其他拼写": null, "pos": "noun"}, {"序号": 3945, "词频": 11, "单词": "offensive", "释义": "冒犯的、进攻性的", "其他拼写": null, "pos": "noun"}, {"序号": 3946, "词频": 11, "单词": "petroleum", "释义": "石油", "其他拼写": null, "pos": "noun"}, {"序号": 3947, "词频": 11, "单词": "ponder", "释义": "考虑", "其他拼写": null, "pos": "verb"}, {"序号": 3948, "词频": 11, "单词": "port", "释义": "港口", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3949, "词频": 11, "单词": "safeguard", "释义": "保护", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3950, "词频": 11, "单词": "signify", "释义": "表示、意味着", "其他拼写": null, "pos": "verb"}, {"序号": 3951, "词频": 11, "单词": "simulate", "释义": "模拟、冒充", "其他拼写": null, "pos": "verb"}, {"序号": 3952, "词频": 11, "单词": "sphere", "释义": "球", "其他拼写": null, "pos": "noun"}, {"序号": 3953, "词频": 11, "单词": "thumb", "释义": "拇指", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3954, "词频": 11, "单词": "transparent", "释义": "透明的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3955, "词频": 11, "单词": "album", "释义": "相册", "其他拼写": null, "pos": "noun"}, {"序号": 3956, "词频": 11, "单词": "analyse", "释义": "分析", "其他拼写": "analyze", "pos": "verb"}, {"序号": 3957, "词频": 11, "单词": "arbitrary", "释义": "任意的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3958, "词频": 11, "单词": "arrogant", "释义": "傲慢的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3959, "词频": 11, "单词": "candle", "释义": "蜡烛", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3960, "词频": 11, "单词": "closet", "释义": "壁橱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3961, "词频": 11, "单词": "duplicate", "释义": "重复", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3962, "词频": 11, "单词": "evaporate", "释义": "蒸发", "其他拼写": null, "pos": "verb"}, {"序号": 3963, "词频": 11, "单词": "ferry", "释义": "渡船", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3964, "词频": 11, "单词": "gossip", "释义": "闲话", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3965, "词频": 11, "单词": "hopeful", "释义": "有希望的", "其他拼写": null, "pos": "noun"}, {"序号": 3966, "词频": 11, "单词": "immerse", "释义": "浸", "其他拼写": null, "pos": "verb"}, {"序号": 3967, "词频": 11, "单词": "impart", "释义": "传授", "其他拼写": null, "pos": "verb"}, {"序号": 3968, "词频": 11, "单词": "intimidate", "释义": "恐吓、威胁", "其他拼写": null, "pos": "verb"}, {"序号": 3969, "词频": 11, "单词": "neat", "释义": "整洁的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3970, "词频": 11, "单词": "omit", "释义": "省略", "其他拼写": null, "pos": "verb"}, {"序号": 3971, "词频": 11, "单词": "prosper", "释义": "成功", "其他拼写": null, "pos": "verb"}, {"序号": 3972, "词频": 11, "单词": "scarce", "释义": "稀少的、罕见的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3973, "词频": 11, "单词": "thunder", "释义": "闪电", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3974, "词频": 11, "单词": "timber", "释义": "木材", "其他拼写": null, "pos": "noun"}, {"序号": 3975, "词频": 11, "单词": "accessory", "释义": "配件", "其他拼写": null, "pos": "noun"}, {"序号": 3976, "词频": 11, "单词": "awe", "释义": "敬畏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3977, "词频": 11, "单词": "bath", "释义": "洗澡", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3978, "词频": 11, "单词": "bully", "释义": "欺负", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3979, "词频": 11, "单词": "carriage", "释义": "运输、四轮马车", "其他拼写": null, "pos": "noun"}, {"序号": 3980, "词频": 11, "单词": "cube", "释义": "立方", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3981, "词频": 11, "单词": "elevator", "释义": "电梯、升降机", "其他拼写": null, "pos": "noun"}, {"序号": 3982, "词频": 11, "单词": "fixture", "释义": "固定装置", "其他拼写": null, "pos": "noun"}, {"序号": 3983, "词频": 11, "单词": "honey", "释义": "蜂蜜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3984, "词频": 11, "单词": "infectious", "释义": "传染的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3985, "词频": 11, "单词": "lamb", "释义": "羔羊", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3986, "词频": 11, "单词": "merchant", "释义": "商人", "其他拼写": null, "pos": "noun"}, {"序号": 3987, "词频": 11, "单词": "pitch", "释义": "球场、投", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3988, "词频": 11, "单词": "polar", "释义": "极性", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3989, "词频": 11, "单词": "reassure", "释义": "再保证", "其他拼写": null, "pos": "verb"}, {"序号": 3990, "词频": 11, "单词": "sand", "释义": "沙", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3991, "词频": 11, "单词": "scrape", "释义": "擦伤、刮掉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3992, "词频": 11, "单词": "sorrow", "释义": "悲伤", "其他拼写": null, "pos": "noun_verb"}, {"序号": 3993, "词频": 11, "单词": "ugly", "释义": "丑陋的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3994, "词频": 11, "单词": "whoever", "释义": "任何人、不管谁", "其他拼写": null, "pos": "other"}, {"序号": 3995, "词频": 10, "单词": "captive", "释义": "俘虏", "其他拼写": null, "pos": "noun"}, {"序号": 3996, "词频": 10, "单词": "cosmic", "释义": "宇宙的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 3997, "词频": 10, "单词": "cucumber", "释义": "黄瓜", "其他拼写": null, "pos": "noun"}, {"序号": 3998, "词频": 10, "单词": "grape", "释义": "葡萄", "其他拼写": null, "pos": "noun"}, {"序号": 3999, "词频": 10, "单词": "eyebrow", "释义": "眉毛", "其他拼写": null, "pos": "noun"}, {"序号": 4000, "词频": 10, "单词": "heroin", "释义": "海洛因", "其他拼写": null, "pos": "noun"}, {"序号": 4001, "词频": 10, "单词": "apparatus", "释义": "装置", "其他拼写": null, "pos": "noun"}, {"序号": 4002, "词频": 10, "单词": "coherent", "释义": "一致的、连贯的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4003, "词频": 10, "单词": "shot", "释义": "开枪、发射、拍摄", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4004, "词频": 10, "单词": "mock", "释义": "嘲笑、模仿", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4005, "词频": 10, "单词": "opening", "释义": "开幕", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4006, "词频": 10, "单词": "tractor", "释义": "牵引车", "其他拼写": null, "pos": "noun"}, {"序号": 4007, "词频": 10, "单词": "deploy", "释义": "部署", "其他拼写": null, "pos": "verb"}, {"序号": 4008, "词频": 10, "单词": "dome", "释义": "圆屋顶", "其他拼写": null, "pos": "noun"}, {"序号": 4009, "词频": 10, "单词": "lottery", "释义": "彩票", "其他拼写": null, "pos": "noun"}, {"序号": 4010, "词频": 10, "单词": "monster", "释义": "怪物", "其他拼写": null, "pos": "noun"}, {"序号": 4011, "词频": 10, "单词": "constituent", "释义": "成分", "其他拼写": null, "pos": "noun"}, {"序号": 4012, "词频": 10, "单词": "eighteen", "释义": "十八", "其他拼写": null, "pos": "noun"}, {"序号": 4013, "词频": 10, "单词": "emigrate", "释义": "移民", "其他拼写": null, "pos": "verb"}, {"序号": 4014, "词频": 10, "单词": "hatred", "释义": "仇恨", "其他拼写": null, "pos": "noun"}, {"序号": 4015, "词频": 10, "单词": "indicative", "释义": "指示的、陈述语气", "其他拼写": null, "pos": "noun"}, {"序号": 4016, "词频": 10, "单词": "lounge", "释义": "休息室", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4017, "词频": 10, "单词": "ore", "释义": "矿", "其他拼写": null, "pos": "noun"}, {"序号": 4018, "词频": 10, "单词": "pastime", "释义": "消遣", "其他拼写": null, "pos": "noun"}, {"序号": 4019, "词频": 10, "单词": "plead", "释义": "恳求", "其他拼写": null, "pos": "verb"}, {"序号": 4020, "词频": 10, "单词": "recur", "释义": "重现", "其他拼写": null, "pos": "verb"}, {"序号": 4021, "词频": 10, "单词": "soak", "释义": "浸", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4022, "词频": 10, "单词": "sunrise", "释义": "日出", "其他拼写": "sunrize", "pos": "noun"}, {"序号": 4023, "词频": 10, "单词": "susceptible", "释义": "易受感染的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4024, "词频": 10, "单词": "agony", "释义": "极度痛苦", "其他拼写": null, "pos": "noun"}, {"序号": 4025, "词频": 10, "单词": "bizarre", "释义": "奇异的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4026, "词频": 10, "单词": "conversely", "释义": "相反地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4027, "词频": 10, "单词": "dedicate", "释义": "致力于", "其他拼写": null, "pos": "verb"}, {"序号": 4028, "词频": 10, "单词": "extinguish", "释义": "扑灭", "其他拼写": null, "pos": "verb"}, {"序号": 4029, "词频": 10, "单词": "fetch", "释义": "取来", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4030, "词频": 10, "单词": "glove", "释义": "手套", "其他拼写": null, "pos": "noun"}, {"序号": 4031, "词频": 10, "单词": "incur", "释义": "招致", "其他拼写": null, "pos": "verb"}, {"序号": 4032, "词频": 10, "单词": "invalid", "释义": "无效的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4033, "词频": 10, "单词": "loosen", "释义": "放松", "其他拼写": null, "pos": "verb"}, {"序号": 4034, "词频": 10, "单词": "orchestra", "释义": "管弦乐队", "其他拼写": null, "pos": "noun"}, {"序号": 4035, "词频": 10, "单词": "pottery", "释义": "陶器", "其他拼写": null, "pos": "noun"}, {"序号": 4036, "词频": 10, "单词": "quantitative", "释义": "定量的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4037, "词频": 10, "单词": "spectacle", "释义": "景象、奇观", "其他拼写": null, "pos": "noun"}, {"序号": 4038, "词频": 10, "单词": "stripe", "释义": "条纹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4039, "词频": 10, "单词": "viewpoint", "释义": "观点", "其他拼写": null, "pos": "noun"}, {"序号": 4040, "词频": 10, "单词": "alternate", "释义": "交替", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4041, "词频": 10, "单词": "attendant", "释义": "服务员", "其他拼写": null, "pos": "noun"}, {"序号": 4042, "词频": 10, "单词": "ballet", "释义": "芭蕾舞", "其他拼写": null, "pos": "noun"}, {"序号": 4043, "词频": 10, "单词": "clash", "释义": "冲突", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4044, "词频": 10, "单词": "comic", "释义": "喜剧演员、滑稽的", "其他拼写": null, "pos": "noun"}, {"序号": 4045, "词频": 10, "单词": "converge", "释义": "会聚、集中", "其他拼写": null, "pos": "verb"}, {"序号": 4046, "词频": 10, "单词": "correspondence", "释义": "通信", "其他拼写": null, "pos": "noun"}, {"序号": 4047, "词频": 10, "单词": "costume", "释义": "服装", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4048, "词频": 10, "单词": "designate", "释义": "指定", "其他拼写": null, "pos": "verb"}, {"序号": 4049, "词频": 10, "单词": "eve", "释义": "前夕", "其他拼写": null, "pos": "noun"}, {"序号": 4050, "词频": 10, "单词": "explode", "释义": "爆炸", "其他拼写": null, "pos": "verb"}, {"序号": 4051, "词频": 10, "单词": "handwriting", "释义": "笔迹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4052, "词频": 10, "单词": "invasion", "释义": "侵略", "其他拼写": null, "pos": "noun"}, {"序号": 4053, "词频": 10, "单词": "jewelry", "释义": "珠宝", "其他拼写": "jewellery", "pos": "noun"}, {"序号": 4054, "词频": 10, "单词": "layoff", "释义": "临时解雇、操作停止", "其他拼写": null, "pos": "noun"}, {"序号": 4055, "词频": 10, "单词": "messenger", "释义": "报信者", "其他拼写": null, "pos": "noun"}, {"序号": 4056, "词频": 10, "单词": "oral", "释义": "口述的", "其他拼写": null, "pos": "noun"}, {"序号": 4057, "词频": 10, "单词": "outbreak", "释义": "爆发", "其他拼写": null, "pos": "noun"}, {"序号": 4058, "词频": 10, "单词": "portrait", "释义": "肖像", "其他拼写": null, "pos": "noun"}, {"序号": 4059, "词频": 10, "单词": "procession", "释义": "队伍", "其他拼写": null, "pos": "noun"}, {"序号": 4060, "词频": 10, "单词": "recognise", "释义": "意识到、认可", "其他拼写": "recognize", "pos": "verb"}, {"序号": 4061, "词频": 10, "单词": "southeast", "释义": "东南", "其他拼写": null, "pos": "noun"}, {"序号": 4062, "词频": 10, "单词": "standpoint", "释义": "立场", "其他拼写": null, "pos": "noun"}, {"序号": 4063, "词频": 10, "单词": "string", "释义": "线、弦、一串", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4064, "词频": 10, "单词": "stroll", "释义": "漫步", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4065, "词频": 10, "单词": "stumble", "释义": "绊倒、蹒跚", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4066, "词频": 10, "单词": "temperament", "释义": "气质", "其他拼写": null, "pos": "noun"}, {"序号": 4067, "词频": 10, "单词": "transistor", "释义": "晶体管", "其他拼写": null, "pos": "noun"}, {"序号": 4068, "词频": 10, "单词": "verse", "释义": "诗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4069, "词频": 10, "单词": "void", "释义": "空白、无效的、空虚", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4070, "词频": 10, "单词": "adverse", "释义": "不利的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4071, "词频": 10, "单词": "amplify", "释义": "扩大", "其他拼写": null, "pos": "verb"}, {"序号": 4072, "词频": 10, "单词": "bacon", "释义": "培根、熏肉", "其他拼写": null, "pos": "noun"}, {"序号": 4073, "词频": 10, "单词": "butterfly", "释义": "蝴蝶", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4074, "词频": 10, "单词": "cargo", "释义": "货物", "其他拼写": null, "pos": "noun"}, {"序号": 4075, "词频": 10, "单词": "chill", "释义": "寒冷、寒冷的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4076, "词频": 10, "单词": "commonplace", "释义": "平凡的、老生常谈", "其他拼写": null, "pos": "noun"}, {"序号": 4077, "词频": 10, "单词": "compact", "释义": "紧凑的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4078, "词频": 10, "单词": "concession", "释义": "让步", "其他拼写": null, "pos": "noun"}, {"序号": 4079, "词频": 10, "单词": "confuse", "释义": "混淆", "其他拼写": null, "pos": "verb"}, {"序号": 4080, "词频": 10, "单词": "convict", "释义": "罪犯", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4081, "词频": 10, "单词": "dwarf", "释义": "侏儒", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4082, "词频": 10, "单词": "embark", "释义": "着手", "其他拼写": null, "pos": "verb"}, {"序号": 4083, "词频": 10, "单词": "embed", "释义": "嵌入", "其他拼写": null, "pos": "verb"}, {"序号": 4084, "词频": 10, "单词": "fuss", "释义": "大惊小怪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4085, "词频": 10, "单词": "namely", "释义": "即", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4086, "词频": 10, "单词": "permeate", "释义": "渗透", "其他拼写": null, "pos": "verb"}, {"序号": 4087, "词频": 10, "单词": "resemblance", "释义": "相似", "其他拼写": null, "pos": "noun"}, {"序号": 4088, "词频": 10, "单词": "sometime", "释义": "改天、来日", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4089, "词频": 10, "单词": "staple", "释义": "主要的、订书钉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4090, "词频": 10, "单词": "suck", "释义": "吸", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4091, "词频": 10, "单词": "terror", "释义": "恐惧", "其他拼写": null, "pos": "noun"}, {"序号": 4092, "词频": 10, "单词": "tonight", "释义": "今晚", "其他拼写": null, "pos": "noun"}, {"序号": 4093, "词频": 10, "单词": "wardrobe", "释义": "衣柜", "其他拼写": null, "pos": "noun"}, {"序号": 4094, "词频": 10, "单词": "wreck", "释义": "残骸、破坏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4095, "词频": 10, "单词": "blouse", "释义": "女衬衫", "其他拼写": null, "pos": "noun"}, {"序号": 4096, "词频": 10, "单词": "bow", "释义": "鞠躬", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4097, "词频": 10, "单词": "cafeteria", "释义": "自助餐厅", "其他拼写": null, "pos": "noun"}, {"序号": 4098, "词频": 10, "单词": "cheek", "释义": "脸颊", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4099, "词频": 10, "单词": "compatible", "释义": "兼容", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4100, "词频": 10, "单词": "courtyard", "释义": "院子", "其他拼写": "cortyard", "pos": "noun"}, {"序号": 4101, "词频": 10, "单词": "descent", "释义": "下降", "其他拼写": null, "pos": "noun"}, {"序号": 4102, "词频": 10, "单词": "dessert", "释义": "甜点", "其他拼写": null, "pos": "noun"}, {"序号": 4103, "词频": 10, "单词": "excursion", "释义": "远足", "其他拼写": null, "pos": "noun"}, {"序号": 4104, "词频": 10, "单词": "expel", "释义": "驱逐", "其他拼写": null, "pos": "verb"}, {"序号": 4105, "词频": 10, "单词": "fax", "释义": "传真", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4106, "词频": 10, "单词": "fisherman", "释义": "渔夫", "其他拼写": null, "pos": "noun"}, {"序号": 4107, "词频": 10, "单词": "fleet", "释义": "舰队", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4108, "词频": 10, "单词": "graphic", "释义": "图表", "其他拼写": null, "pos": "noun"}, {"序号": 4109, "词频": 10, "单词": "haul", "释义": "拖、拉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4110, "词频": 10, "单词": "hell", "释义": "地狱", "其他拼写": null, "pos": "noun"}, {"序号": 4111, "词频": 10, "单词": "ingenious", "释义": "精巧的、有独创性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4112, "词频": 10, "单词": "kiss", "释义": "亲吻", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4113, "词频": 10, "单词": "meditation", "释义": "冥想", "其他拼写": null, "pos": "noun"}, {"序号": 4114, "词频": 10, "单词": "merchandise", "释义": "商品", "其他拼写": "merchandize", "pos": "noun_verb"}, {"序号": 4115, "词频": 10, "单词": "oppress", "释义": "压迫", "其他拼写": null, "pos": "verb"}, {"序号": 4116, "词频": 10, "单词": "repetition", "释义": "重复", "其他拼写": null, "pos": "noun"}, {"序号": 4117, "词频": 10, "单词": "rod", "释义": "杆", "其他拼写": null, "pos": "noun"}, {"序号": 4118, "词频": 10, "单词": "rub", "释义": "擦", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4119, "词频": 10, "单词": "script", "释义": "脚本", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4120, "词频": 10, "单词": "smash", "释义": "粉碎、打碎", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4121, "词频": 10, "单词": "solemn", "释义": "庄严的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4122, "词频": 10, "单词": "solitary", "释义": "孤独的", "其他拼写": null, "pos": "noun"}, {"序号": 4123, "词频": 10, "单词": "successor", "释义": "接班人", "其他拼写": null, "pos": "noun"}, {"序号": 4124, "词频": 10, "单词": "sway", "释义": "影响、摇摆", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4125, "词频": 10, "单词": "testimony", "释义": "证明", "其他拼写": null, "pos": "noun"}, {"序号": 4126, "词频": 10, "单词": "weed", "释义": "杂草", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4127, "词频": 9, "单词": "auction", "释义": "拍卖", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4128, "词频": 9, "单词": "clip", "释义": "修剪、夹子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4129, "词频": 9, "单词": "corrupt", "释义": "腐败", "其他拼写": null, "pos": "verb"}, {"序号": 4130, "词频": 9, "单词": "garment", "释义": "衣服", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4131, "词频": 9, "单词": "colonial", "释义": "殖民地的", "其他拼写": null, "pos": "noun"}, {"序号": 4132, "词频": 9, "单词": "conductor", "释义": "指挥、导体", "其他拼写": null, "pos": "noun"}, {"序号": 4133, "词频": 9, "单词": "cripple", "释义": "跛子、削弱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4134, "词频": 9, "单词": "mandate", "释义": "授权", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4135, "词频": 9, "单词": "microscope", "释义": "显微镜", "其他拼写": null, "pos": "noun"}, {"序号": 4136, "词频": 9, "单词": "reign", "释义": "统治", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4137, "词频": 9, "单词": "verdict", "释义": "裁决", "其他拼写": null, "pos": "noun"}, {"序号": 4138, "词频": 9, "单词": "augment", "释义": "增加", "其他拼写": null, "pos": "verb"}, {"序号": 4139, "词频": 9, "单词": "carve", "释义": "雕刻", "其他拼写": null, "pos": "verb"}, {"序号": 4140, "词频": 9, "单词": "compile", "释义": "编译", "其他拼写": null, "pos": "verb"}, {"序号": 4141, "词频": 9, "单词": "foremost", "释义": "最重要的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4142, "词频": 9, "单词": "gasp", "释义": "喘气、喘息", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4143, "词频": 9, "单词": "hygiene", "释义": "卫生", "其他拼写": null, "pos": "noun"}, {"序号": 4144, "词频": 9, "单词": "negligible", "释义": "微不足道的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4145, "词频": 9, "单词": "penny", "释义": "便士", "其他拼写": null, "pos": "noun"}, {"序号": 4146, "词频": 9, "单词": "soap", "释义": "肥皂", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4147, "词频": 9, "单词": "statesman", "释义": "政治家", "其他拼写": null, "pos": "noun"}, {"序号": 4148, "词频": 9, "单词": "stationary", "释义": "稳定的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4149, "词频": 9, "单词": "tentative", "释义": "暂时的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4150, "词频": 9, "单词": "uphold", "释义": "维护", "其他拼写": null, "pos": "verb"}, {"序号": 4151, "词频": 9, "单词": "agreeable", "释义": "愉快的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4152, "词频": 9, "单词": "anecdote", "释义": "轶事", "其他拼写": null, "pos": "noun"}, {"序号": 4153, "词频": 9, "单词": "discourse", "释义": "讨论、谈话", "其他拼写": "discorse", "pos": "noun_verb"}, {"序号": 4154, "词频": 9, "单词": "dot", "释义": "点缀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4155, "词频": 9, "单词": "flatter", "释义": "奉承", "其他拼写": null, "pos": "verb"}, {"序号": 4156, "词频": 9, "单词": "knot", "释义": "结", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4157, "词频": 9, "单词": "mercy", "释义": "仁慈", "其他拼写": null, "pos": "noun"}, {"序号": 4158, "词频": 9, "单词": "naive", "释义": "天真的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4159, "词频": 9, "单词": "outset", "释义": "开始", "其他拼写": null, "pos": "noun"}, {"序号": 4160, "词频": 9, "单词": "sacred", "释义": "神圣的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4161, "词频": 9, "单词": "sovereign", "释义": "君主、至高无上的", "其他拼写": null, "pos": "noun"}, {"序号": 4162, "词频": 9, "单词": "turbulent", "释义": "动荡的、狂暴的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4163, "词频": 9, "单词": "vicious", "释义": "恶毒的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4164, "词频": 9, "单词": "ample", "释义": "充足的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4165, "词频": 9, "单词": "atom", "释义": "原子", "其他拼写": null, "pos": "noun"}, {"序号": 4166, "词频": 9, "单词": "banquet", "释义": "宴会", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4167, "词频": 9, "单词": "bleak", "释义": "萧瑟的、无希望的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4168, "词频": 9, "单词": "concise", "释义": "简明的", "其他拼写": "concize", "pos": "adj_adv"}, {"序号": 4169, "词频": 9, "单词": "disperse", "释义": "分散", "其他拼写": null, "pos": "verb"}, {"序号": 4170, "词频": 9, "单词": "dividend", "释义": "被除数、股息", "其他拼写": null, "pos": "noun"}, {"序号": 4171, "词频": 9, "单词": "documentary", "释义": "纪录片", "其他拼写": null, "pos": "noun"}, {"序号": 4172, "词频": 9, "单词": "exempt", "释义": "免除", "其他拼写": null, "pos": "verb"}, {"序号": 4173, "词频": 9, "单词": "facet", "释义": "方面", "其他拼写": null, "pos": "noun"}, {"序号": 4174, "词频": 9, "单词": "freight", "释义": "货运", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4175, "词频": 9, "单词": "hover", "释义": "盘旋", "其他拼写": null, "pos": "verb"}, {"序号": 4176, "词频": 9, "单词": "hum", "释义": "哼、嗡嗡声", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4177, "词频": 9, "单词": "impair", "释义": "损害", "其他拼写": null, "pos": "verb"}, {"序号": 4178, "词频": 9, "单词": "levy", "释义": "征收", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4179, "词频": 9, "单词": "mainland", "释义": "洲、大陆", "其他拼写": null, "pos": "noun"}, {"序号": 4180, "词频": 9, "单词": "northeast", "释义": "东北", "其他拼写": null, "pos": "noun"}, {"序号": 4181, "词频": 9, "单词": "notorious", "释义": "臭名昭著的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4182, "词频": 9, "单词": "pamphlet", "释义": "小册子", "其他拼写": null, "pos": "noun"}, {"序号": 4183, "词频": 9, "单词": "periodical", "释义": "期刊", "其他拼写": null, "pos": "noun"}, {"序号": 4184, "词频": 9, "单词": "perish", "释义": "毁灭", "其他拼写": null, "pos": "verb"}, {"序号": 4185, "词频": 9, "单词": "purse", "释义": "钱包", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4186, "词频": 9, "单词": "shallow", "释义": "浅的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4187, "词频": 9, "单词": "signature", "释义": "签署", "其他拼写": null, "pos": "noun"}, {"序号": 4188, "词频": 9, "单词": "solidarity", "释义": "团结", "其他拼写": null, "pos": "noun"}, {"序号": 4189, "词频": 9, "单词": "toil", "释义": "辛苦", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4190, "词频": 9, "单词": "allege", "释义": "宣称", "其他拼写": null, "pos": "verb"}, {"序号": 4191, "词频": 9, "单词": "bud", "释义": "芽", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4192, "词频": 9, "单词": "contrive", "释义": "设计、发明", "其他拼写": null, "pos": "verb"}, {"序号": 4193, "词频": 9, "单词": "credential", "释义": "凭据", "其他拼写": null, "pos": "noun"}, {"序号": 4194, "词频": 9, "单词": "diamond", "释义": "钻石", "其他拼写": null, "pos": "noun"}, {"序号": 4195, "词频": 9, "单词": "envelope", "释义": "信封", "其他拼写": null, "pos": "noun"}, {"序号": 4196, "词频": 9, "单词": "erroneous", "释义": "错误的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4197, "词频": 9, "单词": "knee", "释义": "膝盖", "其他拼写": null, "pos": "noun"}, {"序号": 4198, "词频": 9, "单词": "punch", "释义": "殴打、打洞器、钻孔机", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4199, "词频": 9, "单词": "rectify", "释义": "改正", "其他拼写": null, "pos": "verb"}, {"序号": 4200, "词频": 9, "单词": "robust", "释义": "强健的、粗野的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4201, "词频": 9, "单词": "selfish", "释义": "自私的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4202, "词频": 9, "单词": "shrug", "释义": "耸肩", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4203, "词频": 9, "单词": "tick", "释义": "滴答声、蜱虫、一会儿、打勾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4204, "词频": 9, "单词": "tile", "释义": "瓷砖", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4205, "词频": 9, "单词": "umbrella", "释义": "伞", "其他拼写": null, "pos": "noun"}, {"序号": 4206, "词频": 9, "单词": "verge", "释义": "边缘", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4207, "词频": 9, "单词": "aisle", "释义": "走廊", "其他拼写": null, "pos": "noun"}, {"序号": 4208, "词频": 9, "单词": "badge", "释义": "徽章、象征", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4209, "词频": 9, "单词": "bean", "释义": "豆", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4210, "词频": 9, "单词": "browse", "释义": "浏览", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4211, "词频": 9, "单词": "bump", "释义": "碰撞、肿块", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4212, "词频": 9, "单词": "bundle", "释义": "包、束", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4213, "词频": 9, "单词": "carpenter", "释义": "木匠", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4214, "词频": 9, "单词": "cloth", "释义": "布", "其他拼写": null, "pos": "noun"}, {"序号": 4215, "词频": 9, "单词": "coke", "释义": "焦炭", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4216, "词频": 9, "单词": "custody", "释义": "监护、拘留", "其他拼写": null, "pos": "noun"}, {"序号": 4217, "词频": 9, "单词": "daylight", "释义": "日光", "其他拼写": null, "pos": "noun"}, {"序号": 4218, "词频": 9, "单词": "divine", "释义": "神圣的、绝妙的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4219, "词频": 9, "单词": "eccentric", "释义": "古怪的", "其他拼写": null, "pos": "noun"}, {"序号": 4220, "词频": 9, "单词": "elicit", "释义": "引出", "其他拼写": null, "pos": "verb"}, {"序号": 4221, "词频": 9, "单词": "erode", "释义": "侵蚀", "其他拼写": null, "pos": "verb"}, {"序号": 4222, "词频": 9, "单词": "eternal", "释义": "永恒的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4223, "词频": 9, "单词": "fog", "释义": "雾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4224, "词频": 9, "单词": "foul", "释义": "犯规、肮脏的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4225, "词频": 9, "单词": "fracture", "释义": "断裂", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4226, "词频": 9, "单词": "graze", "释义": "放牧", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4227, "词频": 9, "单词": "handkerchief", "释义": "手帕", "其他拼写": null, "pos": "noun"}, {"序号": 4228, "词频": 9, "单词": "liver", "释义": "肝脏", "其他拼写": null, "pos": "noun"}, {"序号": 4229, "词频": 9, "单词": "marvelous", "释义": "非凡的", "其他拼写": "marvellous", "pos": "adj_adv"}, {"序号": 4230, "词频": 9, "单词": "mentor", "释义": "指导", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4231, "词频": 9, "单词": "miracle", "释义": "奇迹", "其他拼写": null, "pos": "noun"}, {"序号": 4232, "词频": 9, "单词": "nominate", "释义": "提名", "其他拼写": null, "pos": "verb"}, {"序号": 4233, "词频": 9, "单词": "notable", "释义": "显赫的", "其他拼写": null, "pos": "noun"}, {"序号": 4234, "词频": 9, "单词": "obedience", "释义": "服从", "其他拼写": null, "pos": "noun"}, {"序号": 4235, "词频": 9, "单词": "ruler", "释义": "统治者", "其他拼写": null, "pos": "noun"}, {"序号": 4236, "词频": 9, "单词": "spear", "释义": "矛", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4237, "词频": 9, "单词": "sunshine", "释义": "阳光", "其他拼写": null, "pos": "noun"}, {"序号": 4238, "词频": 9, "单词": "surrender", "释义": "投降", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4239, "词频": 9, "单词": "taboo", "释义": "禁忌", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4240, "词频": 9, "单词": "thirst", "释义": "口渴、渴望", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4241, "词频": 9, "单词": "vegetation", "释义": "植物", "其他拼写": null, "pos": "noun"}, {"序号": 4242, "词频": 8, "单词": "astronomy", "释义": "天文学", "其他拼写": null, "pos": "noun"}, {"序号": 4243, "词频": 8, "单词": "chop", "释义": "砍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4244, "词频": 8, "单词": "doctrine", "释义": "学说、教义", "其他拼写": null, "pos": "noun"}, {"序号": 4245, "词频": 8, "单词": "indignation", "释义": "愤怒", "其他拼写": null, "pos": "noun"}, {"序号": 4246, "词频": 8, "单词": "prudent", "释义": "谨慎的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4247, "词频": 8, "单词": "disposition", "释义": "倾向、安排、性情", "其他拼写": null, "pos": "noun"}, {"序号": 4248, "词频": 8, "单词": "perplex", "释义": "使困惑、使复杂化", "其他拼写": null, "pos": "verb"}, {"序号": 4249, "词频": 8, "单词": "anchor", "释义": "锚", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4250, "词频": 8, "单词": "damn", "释义": "谴责、该死的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4251, "词频": 8, "单词": "detector", "释义": "探测器", "其他拼写": null, "pos": "noun"}, {"序号": 4252, "词频": 8, "单词": "earnest", "释义": "认真", "其他拼写": null, "pos": "noun"}, {"序号": 4253, "词频": 8, "单词": "feeble", "释义": "虚弱的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4254, "词频": 8, "单词": "galaxy", "释义": "星系", "其他拼写": null, "pos": "noun"}, {"序号": 4255, "词频": 8, "单词": "hello", "释义": "你好", "其他拼写": null, "pos": "noun"}, {"序号": 4256, "词频": 8, "单词": "irony", "释义": "反讽", "其他拼写": null, "pos": "noun"}, {"序号": 4257, "词频": 8, "单词": "mold", "释义": "模子、模型", "其他拼写": "mould", "pos": "noun_verb"}, {"序号": 4258, "词频": 8, "单词": "prosecute", "释义": "起诉", "其他拼写": null, "pos": "verb"}, {"序号": 4259, "词频": 8, "单词": "savage", "释义": "野蛮人、凶猛的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4260, "词频": 8, "单词": "surveillance", "释义": "监视", "其他拼写": null, "pos": "noun"}, {"序号": 4261, "词频": 8, "单词": "transient", "释义": "短暂的", "其他拼写": null, "pos": "noun"}, {"序号": 4262, "词频": 8, "单词": "abrupt", "释义": "突然的、陡峭的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4263, "词频": 8, "单词": "affiliate", "释义": "使附属、附属机构", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4264, "词频": 8, "单词": "align", "释义": "调整、排列", "其他拼写": null, "pos": "verb"}, {"序号": 4265, "词频": 8, "单词": "assault", "释义": "攻击", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4266, "词频": 8, "单词": "beginning", "释义": "开始", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4267, "词频": 8, "单词": "conjunction", "释义": "结合", "其他拼写": null, "pos": "noun"}, {"序号": 4268, "词频": 8, "单词": "consolidate", "释义": "巩固、统一", "其他拼写": null, "pos": "verb"}, {"序号": 4269, "词频": 8, "单词": "counsel", "释义": "建议", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4270, "词频": 8, "单词": "criticise", "释义": "批评", "其他拼写": "criticize", "pos": "verb"}, {"序号": 4271, "词频": 8, "单词": "genre", "释义": "类型", "其他拼写": null, "pos": "noun"}, {"序号": 4272, "词频": 8, "单词": "hers", "释义": "她的", "其他拼写": null, "pos": "other"}, {"序号": 4273, "词频": 8, "单词": "overhead", "释义": "在头顶上、在空中", "其他拼写": null, "pos": "noun"}, {"序号": 4274, "词频": 8, "单词": "overlap", "释义": "重叠", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4275, "词频": 8, "单词": "regime", "释义": "政权", "其他拼写": null, "pos": "noun"}, {"序号": 4276, "词频": 8, "单词": "soup", "释义": "汤", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4277, "词频": 8, "单词": "terrific", "释义": "极好的、可怕的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4278, "词频": 8, "单词": "unite", "释义": "联合、结合", "其他拼写": null, "pos": "verb"}, {"序号": 4279, "词频": 8, "单词": "acclaim", "释义": "称赞、欢呼", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4280, "词频": 8, "单词": "ambulance", "释义": "救护车", "其他拼写": null, "pos": "noun"}, {"序号": 4281, "词频": 8, "单词": "auxiliary", "释义": "助动词、辅助的", "其他拼写": null, "pos": "noun"}, {"序号": 4282, "词频": 8, "单词": "ballot", "释义": "投票", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4283, "词频": 8, "单词": "candy", "释义": "糖果", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4284, "词频": 8, "单词": "carbohydrate", "释义": "碳水化合物", "其他拼写": null, "pos": "noun"}, {"序号": 4285, "词频": 8, "单词": "cluster", "释义": "群", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4286, "词频": 8, "单词": "coalition", "释义": "联合", "其他拼写": null, "pos": "noun"}, {"序号": 4287, "词频": 8, "单词": "cop", "释义": "警察", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4288, "词频": 8, "单词": "copper", "释义": "铜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4289, "词频": 8, "单词": "couch", "释义": "长沙发、睡椅", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4290, "词频": 8, "单词": "dialect", "释义": "方言", "其他拼写": null, "pos": "noun"}, {"序号": 4291, "词频": 8, "单词": "disturbance", "释义": "扰乱", "其他拼写": null, "pos": "noun"}, {"序号": 4292, "词频": 8, "单词": "empirical", "释义": "经验主义的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4293, "词频": 8, "单词": "fasten", "释义": "系上", "其他拼写": null, "pos": "verb"}, {"序号": 4294, "词频": 8, "单词": "glue", "释义": "胶水", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4295, "词频": 8, "单词": "groan", "释义": "呻吟", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4296, "词频": 8, "单词": "novelty", "释义": "新奇的经验", "其他拼写": null, "pos": "noun"}, {"序号": 4297, "词频": 8, "单词": "pierce", "释义": "穿透", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4298, "词频": 8, "单词": "proficiency", "释义": "熟练", "其他拼写": null, "pos": "noun"}, {"序号": 4299, "词频": 8, "单词": "rumor", "释义": "传闻", "其他拼写": "rumour", "pos": "noun_verb"}, {"序号": 4300, "词频": 8, "单词": "scare", "释义": "恐吓、惊吓", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4301, "词频": 8, "单词": "sober", "释义": "清醒", "其他拼写": null, "pos": "verb"}, {"序号": 4302, "词频": 8, "单词": "stall", "释义": "货摊、失速、拖延", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4303, "词频": 8, "单词": "tomb", "释义": "坟墓", "其他拼写": null, "pos": "noun"}, {"序号": 4304, "词频": 8, "单词": "tropic", "释义": "热带", "其他拼写": null, "pos": "noun"}, {"序号": 4305, "词频": 8, "单词": "underneath", "释义": "在下面", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4306, "词频": 8, "单词": "antique", "释义": "古董", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4307, "词频": 8, "单词": "articulate", "释义": "善于表达的", "其他拼写": null, "pos": "verb"}, {"序号": 4308, "词频": 8, "单词": "bake", "释义": "烤", "其他拼写": null, "pos": "verb"}, {"序号": 4309, "词频": 8, "单词": "blanket", "释义": "毯子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4310, "词频": 8, "单词": "blast", "释义": "爆炸", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4311, "词频": 8, "单词": "bless", "释义": "保佑", "其他拼写": null, "pos": "verb"}, {"序号": 4312, "词频": 8, "单词": "carrot", "释义": "胡萝卜", "其他拼写": null, "pos": "noun"}, {"序号": 4313, "词频": 8, "单词": "characterise", "释义": "以…为特征", "其他拼写": "characterize", "pos": "verb"}, {"序号": 4314, "词频": 8, "单词": "clumsy", "释义": "笨拙的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4315, "词频": 8, "单词": "concede", "释义": "承认", "其他拼写": null, "pos": "verb"}, {"序号": 4316, "词频": 8, "单词": "enclose", "释义": "附上", "其他拼写": null, "pos": "verb"}, {"序号": 4317, "词频": 8, "单词": "envisage", "释义": "想像", "其他拼写": null, "pos": "verb"}, {"序号": 4318, "词频": 8, "单词": "isolate", "释义": "隔离", "其他拼写": null, "pos": "verb"}, {"序号": 4319, "词频": 8, "单词": "oriental", "释义": "东方的", "其他拼写": null, "pos": "noun"}, {"序号": 4320, "词频": 8, "单词": "pasture", "释义": "牧场", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4321, "词频": 8, "单词": "raid", "释义": "袭击", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4322, "词频": 8, "单词": "refuge", "释义": "避难", "其他拼写": null, "pos": "noun"}, {"序号": 4323, "词频": 8, "单词": "resolute", "释义": "坚决的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4324, "词频": 8, "单词": "rug", "释义": "地毯", "其他拼写": null, "pos": "noun"}, {"序号": 4325, "词频": 8, "单词": "sarcastic", "释义": "讽刺的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4326, "词频": 8, "单词": "scrap", "释义": "废品、报废", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4327, "词频": 8, "单词": "shatter", "释义": "粉碎", "其他拼写": null, "pos": "verb"}, {"序号": 4328, "词频": 8, "单词": "trumpet", "释义": "喇叭、鼓吹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4329, "词频": 8, "单词": "aloud", "释义": "大声地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4330, "词频": 8, "单词": "ape", "释义": "猿", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4331, "词频": 8, "单词": "audio", "释义": "音频", "其他拼写": null, "pos": "noun"}, {"序号": 4332, "词频": 8, "单词": "basement", "释义": "地下室", "其他拼写": null, "pos": "noun"}, {"序号": 4333, "词频": 8, "单词": "blend", "释义": "混合", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4334, "词频": 8, "单词": "bound", "释义": "跳跃、界限", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4335, "词频": 8, "单词": "breeze", "释义": "微风、轻松", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4336, "词频": 8, "单词": "cushion", "释义": "垫子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4337, "词频": 8, "单词": "dazzle", "释义": "使眼花", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4338, "词频": 8, "单词": "deplete", "释义": "耗尽", "其他拼写": null, "pos": "verb"}, {"序号": 4339, "词频": 8, "单词": "dial", "释义": "拨号", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4340, "词频": 8, "单词": "discrepancy", "释义": "差异", "其他拼写": null, "pos": "noun"}, {"序号": 4341, "词频": 8, "单词": "disgust", "释义": "厌恶", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4342, "词频": 8, "单词": "donkey", "释义": "驴", "其他拼写": null, "pos": "noun"}, {"序号": 4343, "词频": 8, "单词": "drawer", "释义": "抽屉", "其他拼写": null, "pos": "noun"}, {"序号": 4344, "词频": 8, "单词": "drone", "释义": "无人驾驶飞机", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4345, "词频": 8, "单词": "eject", "释义": "喷射、驱逐", "其他拼写": null, "pos": "verb"}, {"序号": 4346, "词频": 8, "单词": "endow", "释义": "赋予", "其他拼写": null, "pos": "verb"}, {"序号": 4347, "词频": 8, "单词": "erosion", "释义": "侵蚀", "其他拼写": null, "pos": "noun"}, {"序号": 4348, "词频": 8, "单词": "flush", "释义": "冲洗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4349, "词频": 8, "单词": "glitter", "释义": "闪烁", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4350, "词频": 8, "单词": "goodbye", "释义": "再见", "其他拼写": null, "pos": "noun"}, {"序号": 4351, "词频": 8, "单词": "ignite", "释义": "点燃", "其他拼写": null, "pos": "verb"}, {"序号": 4352, "词频": 8, "单词": "industrialise", "释义": "工业化", "其他拼写": "industrialize", "pos": "verb"}, {"序号": 4353, "词频": 8, "单词": "jewel", "释义": "珠宝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4354, "词频": 8, "单词": "kidney", "释义": "肾", "其他拼写": null, "pos": "noun"}, {"序号": 4355, "词频": 8, "单词": "kilometre", "释义": "公里", "其他拼写": "kilometer", "pos": "noun"}, {"序号": 4356, "词频": 8, "单词": "lapse", "释义": "失效、流逝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4357, "词频": 8, "单词": "lease", "释义": "租约", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4358, "词频": 8, "单词": "limp", "释义": "跛行、柔软的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4359, "词频": 8, "单词": "lovely", "释义": "可爱的", "其他拼写": null, "pos": "noun"}, {"序号": 4360, "词频": 8, "单词": "nationality", "释义": "民族", "其他拼写": null, "pos": "noun"}, {"序号": 4361, "词频": 8, "单词": "nominal", "释义": "名义上的", "其他拼写": null, "pos": "noun"}, {"序号": 4362, "词频": 8, "单词": "notify", "释义": "通知", "其他拼写": null, "pos": "verb"}, {"序号": 4363, "词频": 8, "单词": "oak", "释义": "橡木", "其他拼写": null, "pos": "noun"}, {"序号": 4364, "词频": 8, "单词": "pale", "释义": "苍白的、暗淡的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4365, "词频": 8, "单词": "paperback", "释义": "平装书", "其他拼写": null, "pos": "noun"}, {"序号": 4366, "词频": 8, "单词": "pavement", "释义": "路面", "其他拼写": null, "pos": "noun"}, {"序号": 4367, "词频": 8, "单词": "pint", "释义": "品脱", "其他拼写": null, "pos": "noun"}, {"序号": 4368, "词频": 8, "单词": "pope", "释义": "罗马教皇", "其他拼写": null, "pos": "noun"}, {"序号": 4369, "词频": 8, "单词": "rehearse", "释义": "排演、预演", "其他拼写": null, "pos": "verb"}, {"序号": 4370, "词频": 8, "单词": "repay", "释义": "偿还", "其他拼写": null, "pos": "verb"}, {"序号": 4371, "词频": 8, "单词": "sack", "释义": "解雇", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4372, "词频": 8, "单词": "skeleton", "释义": "骨架", "其他拼写": null, "pos": "noun"}, {"序号": 4373, "词频": 8, "单词": "spectacular", "释义": "壮观", "其他拼写": null, "pos": "noun"}, {"序号": 4374, "词频": 8, "单词": "statue", "释义": "雕塑", "其他拼写": null, "pos": "noun"}, {"序号": 4375, "词频": 8, "单词": "stereo", "释义": "立体声", "其他拼写": null, "pos": "noun"}, {"序号": 4376, "词频": 8, "单词": "strand", "释义": "缕", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4377, "词频": 8, "单词": "tangle", "释义": "纠纷、纠缠", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4378, "词频": 8, "单词": "temple", "释义": "庙宇", "其他拼写": null, "pos": "noun"}, {"序号": 4379, "词频": 8, "单词": "transcend", "释义": "超越", "其他拼写": null, "pos": "verb"}, {"序号": 4380, "词频": 8, "单词": "utilise", "释义": "利用", "其他拼写": "utilize", "pos": "verb"}, {"序号": 4381, "词频": 8, "单词": "vegetarian", "释义": "素食者", "其他拼写": null, "pos": "noun"}, {"序号": 4382, "词频": 8, "单词": "weekday", "释义": "工作日", "其他拼写": null, "pos": "noun"}, {"序号": 4383, "词频": 7, "单词": "furnace", "释义": "炉子", "其他拼写": null, "pos": "noun"}, {"序号": 4384, "词频": 7, "单词": "textile", "释义": "纺织品", "其他拼写": null, "pos": "noun"}, {"序号": 4385, "词频": 7, "单词": "canteen", "释义": "食堂", "其他拼写": null, "pos": "noun"}, {"序号": 4386, "词频": 7, "单词": "condense", "释义": "凝结、浓缩", "其他拼写": null, "pos": "verb"}, {"序号": 4387, "词频": 7, "单词": "denote", "释义": "表示", "其他拼写": null, "pos": "verb"}, {"序号": 4388, "词频": 7, "单词": "differentiate", "释义": "区分", "其他拼写": null, "pos": "verb"}, {"序号": 4389, "词频": 7, "单词": "grin", "释义": "咧嘴笑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4390, "词频": 7, "单词": "harbor", "释义": "港口", "其他拼写": "harbour", "pos": "noun_verb"}, {"序号": 4391, "词频": 7, "单词": "haste", "释义": "匆忙", "其他拼写": null, "pos": "noun"}, {"序号": 4392, "词频": 7, "单词": "posture", "释义": "姿势", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4393, "词频": 7, "单词": "radar", "释义": "雷达", "其他拼写": null, "pos": "noun"}, {"序号": 4394, "词频": 7, "单词": "nickname", "释义": "昵称", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4395, "词频": 7, "单词": "preside", "释义": "主持", "其他拼写": null, "pos": "verb"}, {"序号": 4396, "词频": 7, "单词": "rip", "释义": "撕裂、裂缝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4397, "词频": 7, "单词": "toast", "释义": "烤、烤面包", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4398, "词频": 7, "单词": "vacuum", "释义": "真空", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4399, "词频": 7, "单词": "balloon", "释义": "气球", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4400, "词频": 7, "单词": "brochure", "释义": "手册", "其他拼写": null, "pos": "noun"}, {"序号": 4401, "词频": 7, "单词": "directory", "释义": "目录", "其他拼写": null, "pos": "noun"}, {"序号": 4402, "词频": 7, "单词": "doll", "释义": "玩具娃娃", "其他拼写": null, "pos": "noun"}, {"序号": 4403, "词频": 7, "单词": "doze", "释义": "瞌睡", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4404, "词频": 7, "单词": "flap", "释义": "拍打", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4405, "词频": 7, "单词": "flesh", "释义": "肉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4406, "词频": 7, "单词": "fork", "释义": "叉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4407, "词频": 7, "单词": "glare", "释义": "瞪着、怒视", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4408, "词频": 7, "单词": "hasty", "释义": "匆忙的、轻率的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4409, "词频": 7, "单词": "impetus", "释义": "推动力", "其他拼写": null, "pos": "noun"}, {"序号": 4410, "词频": 7, "单词": "lucrative", "释义": "获利的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4411, "词频": 7, "单词": "obedient", "释义": "顺从的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4412, "词频": 7, "单词": "ozone", "释义": "臭氧", "其他拼写": null, "pos": "noun"}, {"序号": 4413, "词频": 7, "单词": "poke", "释义": "戳、刺", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4414, "词频": 7, "单词": "radiate", "释义": "辐射、放射", "其他拼写": null, "pos": "verb"}, {"序号": 4415, "词频": 7, "单词": "rein", "释义": "控制", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4416, "词频": 7, "单词": "rot", "释义": "腐烂", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4417, "词频": 7, "单词": "sigh", "释义": "叹息", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4418, "词频": 7, "单词": "singular", "释义": "非凡的、单数的", "其他拼写": null, "pos": "noun"}, {"序号": 4419, "词频": 7, "单词": "smog", "释义": "烟雾", "其他拼写": null, "pos": "noun"}, {"序号": 4420, "词频": 7, "单词": "snatch", "释义": "抢夺、抓住", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4421, "词频": 7, "单词": "startle", "释义": "吃惊", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4422, "词频": 7, "单词": "upstairs", "释义": "楼上", "其他拼写": null, "pos": "noun"}, {"序号": 4423, "词频": 7, "单词": "aftermath", "释义": "后果", "其他拼写": null, "pos": "noun"}, {"序号": 4424, "词频": 7, "单词": "applaud", "释义": "鼓掌", "其他拼写": null, "pos": "verb"}, {"序号": 4425, "词频": 7, "单词": "appraisal", "释义": "评估", "其他拼写": null, "pos": "noun"}, {"序号": 4426, "词频": 7, "单词": "assurance", "释义": "自信、保险", "其他拼写": null, "pos": "noun"}, {"序号": 4427, "词频": 7, "单词": "barber", "释义": "理发师", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4428, "词频": 7, "单词": "bin", "释义": "垃圾箱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4429, "词频": 7, "单词": "bride", "释义": "新娘", "其他拼写": null, "pos": "noun"}, {"序号": 4430, "词频": 7, "单词": "bullet", "释义": "子弹", "其他拼写": null, "pos": "noun"}, {"序号": 4431, "词频": 7, "单词": "captain", "释义": "船长", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4432, "词频": 7, "单词": "despise", "释义": "轻视", "其他拼写": "despize", "pos": "verb"}, {"序号": 4433, "词频": 7, "单词": "exclaim", "释义": "呼喊", "其他拼写": null, "pos": "verb"}, {"序号": 4434, "词频": 7, "单词": "feat", "释义": "功绩、技艺", "其他拼写": null, "pos": "noun"}, {"序号": 4435, "词频": 7, "单词": "fireman", "释义": "消防队员", "其他拼写": null, "pos": "noun"}, {"序号": 4436, "词频": 7, "单词": "instantaneous", "释义": "瞬间的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4437, "词频": 7, "单词": "intact", "释义": "原封不动的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4438, "词频": 7, "单词": "intrude", "释义": "打扰、侵入", "其他拼写": null, "pos": "verb"}, {"序号": 4439, "词频": 7, "单词": "metaphor", "释义": "隐喻", "其他拼写": null, "pos": "noun"}, {"序号": 4440, "词频": 7, "单词": "moan", "释义": "呻吟、抱怨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4441, "词频": 7, "单词": "muscular", "释义": "肌肉的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4442, "词频": 7, "单词": "nuisance", "释义": "麻烦", "其他拼写": null, "pos": "noun"}, {"序号": 4443, "词频": 7, "单词": "relativity", "释义": "相对论", "其他拼写": null, "pos": "noun"}, {"序号": 4444, "词频": 7, "单词": "removal", "释义": "除去、搬迁", "其他拼写": null, "pos": "noun"}, {"序号": 4445, "词频": 7, "单词": "rifle", "释义": "步枪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4446, "词频": 7, "单词": "sincere", "释义": "真诚的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4447, "词频": 7, "单词": "undo", "释义": "取消", "其他拼写": null, "pos": "verb"}, {"序号": 4448, "词频": 7, "单词": "alienate", "释义": "疏远", "其他拼写": null, "pos": "verb"}, {"序号": 4449, "词频": 7, "单词": "ascend", "释义": "上升", "其他拼写": null, "pos": "verb"}, {"序号": 4450, "词频": 7, "单词": "ascertain", "释义": "确定", "其他拼写": null, "pos": "verb"}, {"序号": 4451, "词频": 7, "单词": "astonish", "释义": "使吃惊", "其他拼写": null, "pos": "verb"}, {"序号": 4452, "词频": 7, "单词": "banner", "释义": "旗帜", "其他拼写": null, "pos": "noun"}, {"序号": 4453, "词频": 7, "单词": "baseball", "释义": "棒球", "其他拼写": null, "pos": "noun"}, {"序号": 4454, "词频": 7, "单词": "bolt", "释义": "螺栓", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4455, "词频": 7, "单词": "bowl", "释义": "碗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4456, "词频": 7, "单词": "congratulation", "释义": "祝贺", "其他拼写": null, "pos": "noun"}, {"序号": 4457, "词频": 7, "单词": "consecutive", "释义": "连续的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4458, "词频": 7, "单词": "console", "释义": "安慰、控制台", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4459, "词频": 7, "单词": "crush", "释义": "压碎", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4460, "词频": 7, "单词": "deaf", "释义": "聋的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4461, "词频": 7, "单词": "dinosaur", "释义": "恐龙", "其他拼写": null, "pos": "noun"}, {"序号": 4462, "词频": 7, "单词": "dread", "释义": "恐惧", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4463, "词频": 7, "单词": "drum", "释义": "鼓", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4464, "词频": 7, "单词": "emperor", "释义": "皇帝", "其他拼写": null, "pos": "noun"}, {"序号": 4465, "词频": 7, "单词": "execute", "释义": "执行", "其他拼写": null, "pos": "verb"}, {"序号": 4466, "词频": 7, "单词": "famine", "释义": "饥荒", "其他拼写": null, "pos": "noun"}, {"序号": 4467, "词频": 7, "单词": "fence", "释义": "栅栏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4468, "词频": 7, "单词": "flame", "释义": "火焰", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4469, "词频": 7, "单词": "fore", "释义": "船头", "其他拼写": null, "pos": "noun"}, {"序号": 4470, "词频": 7, "单词": "hammer", "释义": "锤", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4471, "词频": 7, "单词": "homogeneous", "释义": "同类的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4472, "词频": 7, "单词": "intrigue", "释义": "阴谋", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4473, "词频": 7, "单词": "lap", "释义": "重叠部分、轻拍、舐", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4474, "词频": 7, "单词": "litre", "释义": "公升", "其他拼写": "liter", "pos": "noun"}, {"序号": 4475, "词频": 7, "单词": "lofty", "释义": "高的、崇高的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4476, "词频": 7, "单词": "magnet", "释义": "磁铁", "其他拼写": null, "pos": "noun"}, {"序号": 4477, "词频": 7, "单词": "memorandum", "释义": "备忘录", "其他拼写": null, "pos": "noun"}, {"序号": 4478, "词频": 7, "单词": "mingle", "释义": "交往、混合", "其他拼写": null, "pos": "verb"}, {"序号": 4479, "词频": 7, "单词": "miniature", "释义": "小型的、小规模的", "其他拼写": null, "pos": "noun"}, {"序号": 4480, "词频": 7, "单词": "niece", "释义": "侄女", "其他拼写": null, "pos": "noun"}, {"序号": 4481, "词频": 7, "单词": "nourish", "释义": "滋养", "其他拼写": "norish", "pos": "verb"}, {"序号": 4482, "词频": 7, "单词": "outfit", "释义": "机构、配备", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4483, "词频": 7, "单词": "panda", "释义": "熊猫", "其他拼写": null, "pos": "noun"}, {"序号": 4484, "词频": 7, "单词": "penetrate", "释义": "穿透", "其他拼写": null, "pos": "verb"}, {"序号": 4485, "词频": 7, "单词": "pine", "释义": "松树", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4486, "词频": 7, "单词": "postcard", "释义": "明信片", "其他拼写": null, "pos": "noun"}, {"序号": 4487, "词频": 7, "单词": "quiz", "释义": "小测验", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4488, "词频": 7, "单词": "rag", "释义": "破布", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4489, "词频": 7, "单词": "rebellion", "释义": "叛乱", "其他拼写": null, "pos": "noun"}, {"序号": 4490, "词频": 7, "单词": "refund", "释义": "退款", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4491, "词频": 7, "单词": "resilient", "释义": "有弹力的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4492, "词频": 7, "单词": "roar", "释义": "咆哮、轰鸣", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4493, "词频": 7, "单词": "segregate", "释义": "隔离", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4494, "词频": 7, "单词": "sensation", "释义": "感觉", "其他拼写": "senzation", "pos": "noun"}, {"序号": 4495, "词频": 7, "单词": "sleeve", "释义": "袖子", "其他拼写": null, "pos": "noun"}, {"序号": 4496, "词频": 7, "单词": "slender", "释义": "细长的、苗条的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4497, "词频": 7, "单词": "slippery", "释义": "滑的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4498, "词频": 7, "单词": "sock", "释义": "袜子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4499, "词频": 7, "单词": "sofa", "释义": "沙发", "其他拼写": null, "pos": "noun"}, {"序号": 4500, "词频": 7, "单词": "southwest", "释义": "西南", "其他拼写": null, "pos": "noun"}, {"序号": 4501, "词频": 7, "单词": "swear", "释义": "赌咒、发誓", "其他拼写": null, "pos": "verb"}, {"序号": 4502, "词频": 7, "单词": "swift", "释义": "迅速的、雨燕", "其他拼写": null, "pos": "noun"}, {"序号": 4503, "词频": 7, "单词": "thirsty", "释义": "口渴的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4504, "词频": 6, "单词": "censorship", "释义": "检查制度", "其他拼写": null, "pos": "noun"}, {"序号": 4505, "词频": 6, "单词": "slot", "释义": "槽", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4506, "词频": 6, "单词": "affirm", "释义": "肯定", "其他拼写": null, "pos": "verb"}, {"序号": 4507, "词频": 6, "单词": "assimilate", "释义": "吸收", "其他拼写": null, "pos": "verb"}, {"序号": 4508, "词频": 6, "单词": "frown", "释义": "皱眉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4509, "词频": 6, "单词": "lateral", "释义": "侧面、侧面的", "其他拼写": null, "pos": "noun"}, {"序号": 4510, "词频": 6, "单词": "preface", "释义": "前言", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4511, "词频": 6, "单词": "query", "释义": "疑问、质问", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4512, "词频": 6, "单词": "splash", "释义": "报道、溅泼的量", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4513, "词频": 6, "单词": "stride", "释义": "跨、步伐", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4514, "词频": 6, "单词": "torch", "释义": "火炬", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4515, "词频": 6, "单词": "butcher", "释义": "屠夫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4516, "词频": 6, "单词": "compress", "释义": "压缩", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4517, "词频": 6, "单词": "diffuse", "释义": "弥漫", "其他拼写": null, "pos": "verb"}, {"序号": 4518, "词频": 6, "单词": "discern", "释义": "辨别", "其他拼写": null, "pos": "verb"}, {"序号": 4519, "词频": 6, "单词": "goodness", "释义": "善良", "其他拼写": null, "pos": "noun"}, {"序号": 4520, "词频": 6, "单词": "grieve", "释义": "悲伤", "其他拼写": null, "pos": "verb"}, {"序号": 4521, "词频": 6, "单词": "mute", "释义": "沉默的、哑的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4522, "词频": 6, "单词": "roast", "释义": "烤", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4523, "词频": 6, "单词": "slum", "释义": "贫民窟", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4524, "词频": 6, "单词": "steward", "释义": "管家、管理", "其他拼写": null, "pos": "noun"}, {"序号": 4525, "词频": 6, "单词": "straw", "释义": "稻草", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4526, "词频": 6, "单词": "viable", "释义": "可行的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4527, "词频": 6, "单词": "afterward", "释义": "后来", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4528, "词频": 6, "单词": "angel", "释义": "天使", "其他拼写": null, "pos": "noun"}, {"序号": 4529, "词频": 6, "单词": "blunder", "释义": "大错", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4530, "词频": 6, "单词": "booth", "释义": "电话亭", "其他拼写": null, "pos": "noun"}, {"序号": 4531, "词频": 6, "单词": "cigar", "释义": "雪茄烟", "其他拼写": null, "pos": "noun"}, {"序号": 4532, "词频": 6, "单词": "commend", "释义": "推荐", "其他拼写": null, "pos": "verb"}, {"序号": 4533, "词频": 6, "单词": "commonwealth", "释义": "联邦", "其他拼写": null, "pos": "noun"}, {"序号": 4534, "词频": 6, "单词": "congratulate", "释义": "庆祝、祝贺", "其他拼写": null, "pos": "verb"}, {"序号": 4535, "词频": 6, "单词": "cricket", "释义": "板球、蟋蟀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4536, "词频": 6, "单词": "diversion", "释义": "转移", "其他拼写": null, "pos": "noun"}, {"序号": 4537, "词频": 6, "单词": "ecology", "释义": "生态", "其他拼写": null, "pos": "noun"}, {"序号": 4538, "词频": 6, "单词": "elbow", "释义": "手肘", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4539, "词频": 6, "单词": "equity", "释义": "公平、权益", "其他拼写": null, "pos": "noun"}, {"序号": 4540, "词频": 6, "单词": "guild", "释义": "协会", "其他拼写": null, "pos": "noun"}, {"序号": 4541, "词频": 6, "单词": "instrumental", "释义": "仪器的、有帮助的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4542, "词频": 6, "单词": "keyboard", "释义": "键盘", "其他拼写": null, "pos": "noun"}, {"序号": 4543, "词频": 6, "单词": "latitude", "释义": "纬度", "其他拼写": null, "pos": "noun"}, {"序号": 4544, "词频": 6, "单词": "liquor", "释义": "酒", "其他拼写": null, "pos": "noun"}, {"序号": 4545, "词频": 6, "单词": "manuscript", "释义": "手稿", "其他拼写": null, "pos": "noun"}, {"序号": 4546, "词频": 6, "单词": "plough", "释义": "犁", "其他拼写": "plow", "pos": "noun_verb"}, {"序号": 4547, "词频": 6, "单词": "suite", "释义": "套房", "其他拼写": null, "pos": "noun"}, {"序号": 4548, "词频": 6, "单词": "superb", "释义": "极好的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4549, "词频": 6, "单词": "torture", "释义": "拷问", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4550, "词频": 6, "单词": "workout", "释义": "锻炼", "其他拼写": null, "pos": "noun"}, {"序号": 4551, "词频": 6, "单词": "advent", "释义": "出现", "其他拼写": null, "pos": "noun"}, {"序号": 4552, "词频": 6, "单词": "audit", "释义": "审计", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4553, "词频": 6, "单词": "blaze", "释义": "火焰、燃烧", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4554, "词频": 6, "单词": "brutal", "释义": "野蛮的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4555, "词频": 6, "单词": "bug", "释义": "臭虫、窃听器", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4556, "词频": 6, "单词": "bull", "释义": "公牛", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4557, "词频": 6, "单词": "conspiracy", "释义": "阴谋", "其他拼写": null, "pos": "noun"}, {"序号": 4558, "词频": 6, "单词": "endorse", "释义": "支持", "其他拼写": null, "pos": "verb"}, {"序号": 4559, "词频": 6, "单词": "expend", "释义": "花费", "其他拼写": null, "pos": "verb"}, {"序号": 4560, "词频": 6, "单词": "flour", "释义": "面粉", "其他拼写": "flor", "pos": "noun_verb"}, {"序号": 4561, "词频": 6, "单词": "forthcoming", "释义": "即将到来的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4562, "词频": 6, "单词": "handy", "释义": "方便的", "其他拼写": null, "pos": "noun"}, {"序号": 4563, "词频": 6, "单词": "inventory", "释义": "详细目录、清点", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4564, "词频": 6, "单词": "motel", "释义": "汽车旅馆", "其他拼写": null, "pos": "noun"}, {"序号": 4565, "词频": 6, "单词": "naval", "释义": "海军的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4566, "词频": 6, "单词": "notebook", "释义": "笔记本", "其他拼写": null, "pos": "noun"}, {"序号": 4567, "词频": 6, "单词": "palm", "释义": "棕榈", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4568, "词频": 6, "单词": "relay", "释义": "继电器、接力", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4569, "词频": 6, "单词": "sandwich", "释义": "三明治", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4570, "词频": 6, "单词": "scent", "释义": "气味", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4571, "词频": 6, "单词": "shrewd", "释义": "精明的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4572, "词频": 6, "单词": "specialise", "释义": "专门研究、特定范围", "其他拼写": "specialize", "pos": "verb"}, {"序号": 4573, "词频": 6, "单词": "stance", "释义": "立场", "其他拼写": null, "pos": "noun"}, {"序号": 4574, "词频": 6, "单词": "veto", "释义": "否决", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4575, "词频": 6, "单词": "waist", "释义": "腰", "其他拼写": null, "pos": "noun"}, {"序号": 4576, "词频": 6, "单词": "widow", "释义": "寡妇", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4577, "词频": 6, "单词": "ambassador", "释义": "大使", "其他拼写": null, "pos": "noun"}, {"序号": 4578, "词频": 6, "单词": "avert", "释义": "避免", "其他拼写": null, "pos": "verb"}, {"序号": 4579, "词频": 6, "单词": "bathe", "释义": "沐浴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4580, "词频": 6, "单词": "beloved", "释义": "心爱的", "其他拼写": null, "pos": "noun"}, {"序号": 4581, "词频": 6, "单词": "biscuit", "释义": "饼干", "其他拼写": null, "pos": "noun"}, {"序号": 4582, "词频": 6, "单词": "briefcase", "释义": "公文包", "其他拼写": null, "pos": "noun"}, {"序号": 4583, "词频": 6, "单词": "burglar", "释义": "窃贼", "其他拼写": null, "pos": "noun"}, {"序号": 4584, "词频": 6, "单词": "champagne", "释义": "香槟酒", "其他拼写": null, "pos": "noun"}, {"序号": 4585, "词频": 6, "单词": "conquest", "释义": "征服", "其他拼写": null, "pos": "noun"}, {"序号": 4586, "词频": 6, "单词": "convene", "释义": "召集", "其他拼写": null, "pos": "verb"}, {"序号": 4587, "词频": 6, "单词": "conversion", "释义": "转变", "其他拼写": null, "pos": "noun"}, {"序号": 4588, "词频": 6, "单词": "coward", "释义": "懦夫", "其他拼写": null, "pos": "noun"}, {"序号": 4589, "词频": 6, "单词": "dizzy", "释义": "晕眩的、困惑", "其他拼写": null, "pos": "verb"}, {"序号": 4590, "词频": 6, "单词": "exile", "释义": "流放", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4591, "词频": 6, "单词": "futile", "释义": "无用的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4592, "词频": 6, "单词": "gracious", "释义": "亲切的、仁慈的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4593, "词频": 6, "单词": "hatch", "释义": "孵化", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4594, "词频": 6, "单词": "heap", "释义": "堆", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4595, "词频": 6, "单词": "heave", "释义": "起伏、举、扔", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4596, "词频": 6, "单词": "hike", "释义": "远足", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4597, "词频": 6, "单词": "hollow", "释义": "空的、洞", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4598, "词频": 6, "单词": "huddle", "释义": "拥挤、混乱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4599, "词频": 6, "单词": "inland", "释义": "内陆", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4600, "词频": 6, "单词": "insulate", "释义": "隔离", "其他拼写": null, "pos": "verb"}, {"序号": 4601, "词频": 6, "单词": "intermediate", "释义": "中间体、中等的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4602, "词频": 6, "单词": "invaluable", "释义": "无价的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4603, "词频": 6, "单词": "jargon", "释义": "行话", "其他拼写": null, "pos": "noun"}, {"序号": 4604, "词频": 6, "单词": "jungle", "释义": "丛林", "其他拼写": null, "pos": "noun"}, {"序号": 4605, "词频": 6, "单词": "layman", "释义": "门外汉", "其他拼写": null, "pos": "noun"}, {"序号": 4606, "词频": 6, "单词": "locality", "释义": "地区", "其他拼写": null, "pos": "noun"}, {"序号": 4607, "词频": 6, "单词": "noon", "释义": "中午", "其他拼写": null, "pos": "noun"}, {"序号": 4608, "词频": 6, "单词": "odor", "释义": "气味", "其他拼写": "odour", "pos": "noun"}, {"序号": 4609, "词频": 6, "单词": "okay", "释义": "可以、好的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4610, "词频": 6, "单词": "optical", "释义": "光学的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4611, "词频": 6, "单词": "optimum", "释义": "最佳的", "其他拼写": null, "pos": "noun"}, {"序号": 4612, "词频": 6, "单词": "pact", "释义": "协定", "其他拼写": null, "pos": "noun"}, {"序号": 4613, "词频": 6, "单词": "persevere", "释义": "坚持", "其他拼写": null, "pos": "verb"}, {"序号": 4614, "词频": 6, "单词": "pharmacy", "释义": "药房", "其他拼写": null, "pos": "noun"}, {"序号": 4615, "词频": 6, "单词": "powder", "释义": "粉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4616, "词频": 6, "单词": "predominant", "释义": "主要的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4617, "词频": 6, "单词": "presume", "释义": "假定、推测", "其他拼写": null, "pos": "verb"}, {"序号": 4618, "词频": 6, "单词": "protocol", "释义": "协议", "其他拼写": null, "pos": "noun"}, {"序号": 4619, "词频": 6, "单词": "purple", "释义": "紫色", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4620, "词频": 6, "单词": "rape", "释义": "强奸", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4621, "词频": 6, "单词": "reclaim", "释义": "回收、利用", "其他拼写": null, "pos": "verb"}, {"序号": 4622, "词频": 6, "单词": "repression", "释义": "镇压", "其他拼写": null, "pos": "noun"}, {"序号": 4623, "词频": 6, "单词": "ridge", "释义": "脊", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4624, "词频": 6, "单词": "rust", "释义": "生锈", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4625, "词频": 6, "单词": "sauce", "释义": "酱汁", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4626, "词频": 6, "单词": "sibling", "释义": "兄弟姐妹", "其他拼写": null, "pos": "noun"}, {"序号": 4627, "词频": 6, "单词": "slap", "释义": "掴、侮辱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4628, "词频": 6, "单词": "stale", "释义": "陈腐的、不新鲜的", "其他拼写": null, "pos": "verb"}, {"序号": 4629, "词频": 6, "单词": "strap", "释义": "皮带", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4630, "词频": 6, "单词": "submerge", "释义": "潜入水中、浸没", "其他拼写": null, "pos": "verb"}, {"序号": 4631, "词频": 6, "单词": "supper", "释义": "晚餐", "其他拼写": null, "pos": "noun"}, {"序号": 4632, "词频": 6, "单词": "tilt", "释义": "倾斜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4633, "词频": 6, "单词": "trademark", "释义": "商标", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4634, "词频": 6, "单词": "trim", "释义": "修剪、装饰", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4635, "词频": 6, "单词": "typist", "释义": "打字员", "其他拼写": null, "pos": "noun"}, {"序号": 4636, "词频": 6, "单词": "venue", "释义": "审判地、犯罪地点", "其他拼写": null, "pos": "noun"}, {"序号": 4637, "词频": 6, "单词": "versatile", "释义": "多才多艺的、通用的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4638, "词频": 6, "单词": "yearly", "释义": "每年的", "其他拼写": null, "pos": "noun"}, {"序号": 4639, "词频": 5, "单词": "necklace", "释义": "项链", "其他拼写": null, "pos": "noun"}, {"序号": 4640, "词频": 5, "单词": "thrift", "释义": "节俭", "其他拼写": null, "pos": "noun"}, {"序号": 4641, "词频": 5, "单词": "weary", "释义": "疲倦", "其他拼写": null, "pos": "verb"}, {"序号": 4642, "词频": 5, "单词": "aeroplane", "释义": "飞机", "其他拼写": "airplane", "pos": "noun"}, {"序号": 4643, "词频": 5, "单词": "cement", "释义": "水泥", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4644, "词频": 5, "单词": "inspect", "释义": "检查", "其他拼写": null, "pos": "verb"}, {"序号": 4645, "词频": 5, "单词": "roundabout", "释义": "迂回的", "其他拼写": null, "pos": "noun"}, {"序号": 4646, "词频": 5, "单词": "abide", "释义": "遵守", "其他拼写": null, "pos": "verb"}, {"序号": 4647, "词频": 5, "单词": "ashore", "释义": "上岸", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4648, "词频": 5, "单词": "chimney", "释义": "烟囱", "其他拼写": null, "pos": "noun"}, {"序号": 4649, "词频": 5, "单词": "claw", "释义": "爪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4650, "词频": 5, "单词": "correspondent", "释义": "通讯记者", "其他拼写": null, "pos": "noun"}, {"序号": 4651, "词频": 5, "单词": "crab", "释义": "蟹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4652, "词频": 5, "单词": "ditch", "释义": "沟渠、抛弃", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4653, "词频": 5, "单词": "indignant", "释义": "愤慨的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4654, "词频": 5, "单词": "innumerable", "释义": "无数的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4655, "词频": 5, "单词": "irrespective", "释义": "不考虑的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4656, "词频": 5, "单词": "irrigate", "释义": "灌溉", "其他拼写": null, "pos": "verb"}, {"序号": 4657, "词频": 5, "单词": "magnitude", "释义": "大小", "其他拼写": null, "pos": "noun"}, {"序号": 4658, "词频": 5, "单词": "maid", "释义": "侍女", "其他拼写": null, "pos": "noun"}, {"序号": 4659, "词频": 5, "单词": "memorial", "释义": "纪念碑", "其他拼写": null, "pos": "noun"}, {"序号": 4660, "词频": 5, "单词": "mercury", "释义": "水银", "其他拼写": null, "pos": "noun"}, {"序号": 4661, "词频": 5, "单词": "misunderstand", "释义": "误解", "其他拼写": null, "pos": "verb"}, {"序号": 4662, "词频": 5, "单词": "nucleus", "释义": "核", "其他拼写": null, "pos": "noun"}, {"序号": 4663, "词频": 5, "单词": "pinch", "释义": "捏、一撮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4664, "词频": 5, "单词": "plea", "释义": "恳求、抗辩、借口", "其他拼写": null, "pos": "noun"}, {"序号": 4665, "词频": 5, "单词": "puppet", "释义": "木偶", "其他拼写": null, "pos": "noun"}, {"序号": 4666, "词频": 5, "单词": "republic", "释义": "共和国", "其他拼写": null, "pos": "noun"}, {"序号": 4667, "词频": 5, "单词": "reservoir", "释义": "水库", "其他拼写": null, "pos": "noun"}, {"序号": 4668, "词频": 5, "单词": "screw", "释义": "螺丝、螺钉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4669, "词频": 5, "单词": "stern", "释义": "船尾、严厉的", "其他拼写": null, "pos": "noun"}, {"序号": 4670, "词频": 5, "单词": "stiff", "释义": "硬的", "其他拼写": null, "pos": "noun"}, {"序号": 4671, "词频": 5, "单词": "swamp", "释义": "沼泽", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4672, "词频": 5, "单词": "tease", "释义": "取笑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4673, "词频": 5, "单词": "tray", "释义": "盘", "其他拼写": null, "pos": "noun"}, {"序号": 4674, "词频": 5, "单词": "tug", "释义": "拖船、拖", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4675, "词频": 5, "单词": "ventilate", "释义": "通风", "其他拼写": null, "pos": "verb"}, {"序号": 4676, "词频": 5, "单词": "vocation", "释义": "职业", "其他拼写": null, "pos": "noun"}, {"序号": 4677, "词频": 5, "单词": "zeal", "释义": "热情", "其他拼写": null, "pos": "noun"}, {"序号": 4678, "词频": 5, "单词": "analytic", "释义": "分析的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4679, "词频": 5, "单词": "apt", "释义": "恰当的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4680, "词频": 5, "单词": "benign", "释义": "良性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4681, "词频": 5, "单词": "canoe", "释义": "独木舟", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4682, "词频": 5, "单词": "cassette", "释义": "盒式磁带", "其他拼写": null, "pos": "noun"}, {"序号": 4683, "词频": 5, "单词": "circular", "释义": "圆形的", "其他拼写": null, "pos": "noun"}, {"序号": 4684, "词频": 5, "单词": "crisp", "释义": "脆的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4685, "词频": 5, "单词": "crust", "释义": "外壳", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4686, "词频": 5, "单词": "curl", "释义": "卷曲", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4687, "词频": 5, "单词": "curtain", "释义": "窗帘", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4688, "词频": 5, "单词": "deter", "释义": "阻止", "其他拼写": null, "pos": "verb"}, {"序号": 4689, "词频": 5, "单词": "diagram", "释义": "图表", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4690, "词频": 5, "单词": "epic", "释义": "史诗", "其他拼写": null, "pos": "noun"}, {"序号": 4691, "词频": 5, "单词": "eradicate", "释义": "根除", "其他拼写": null, "pos": "verb"}, {"序号": 4692, "词频": 5, "单词": "fabulous", "释义": "极好的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4693, "词频": 5, "单词": "fascinate", "释义": "吸引住", "其他拼写": null, "pos": "verb"}, {"序号": 4694, "词频": 5, "单词": "fibre", "释义": "纤维", "其他拼写": "fiber", "pos": "noun"}, {"序号": 4695, "词频": 5, "单词": "formidable", "释义": "强大的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4696, "词频": 5, "单词": "hearing", "释义": "听力、听觉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4697, "词频": 5, "单词": "heroic", "释义": "英勇的", "其他拼写": null, "pos": "noun"}, {"序号": 4698, "词频": 5, "单词": "inn", "释义": "客栈", "其他拼写": null, "pos": "noun"}, {"序号": 4699, "词频": 5, "单词": "kin", "释义": "亲属", "其他拼写": null, "pos": "noun"}, {"序号": 4700, "词频": 5, "单词": "murmur", "释义": "低语", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4701, "词频": 5, "单词": "outrage", "释义": "愤怒", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4702, "词频": 5, "单词": "pray", "释义": "祈祷", "其他拼写": null, "pos": "verb"}, {"序号": 4703, "词频": 5, "单词": "propaganda", "释义": "宣传", "其他拼写": null, "pos": "noun"}, {"序号": 4704, "词频": 5, "单词": "rouse", "释义": "唤醒、激起", "其他拼写": null, "pos": "verb"}, {"序号": 4705, "词频": 5, "单词": "satire", "释义": "讽刺", "其他拼写": null, "pos": "noun"}, {"序号": 4706, "词频": 5, "单词": "sneak", "释义": "溜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4707, "词频": 5, "单词": "stalk", "释义": "茎", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4708, "词频": 5, "单词": "symphony", "释义": "交响乐", "其他拼写": null, "pos": "noun"}, {"序号": 4709, "词频": 5, "单词": "tuck", "释义": "卷起、藏起", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4710, "词频": 5, "单词": "whatsoever", "释义": "无论什么", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4711, "词频": 5, "单词": "whip", "释义": "鞭子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4712, "词频": 5, "单词": "wrist", "释义": "手腕", "其他拼写": null, "pos": "noun"}, {"序号": 4713, "词频": 5, "单词": "applause", "释义": "鼓掌", "其他拼写": null, "pos": "noun"}, {"序号": 4714, "词频": 5, "单词": "ash", "释义": "灰", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4715, "词频": 5, "单词": "bail", "释义": "保释", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4716, "词频": 5, "单词": "bench", "释义": "长凳", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4717, "词频": 5, "单词": "better", "释义": "更好的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4718, "词频": 5, "单词": "bolster", "释义": "支持", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4719, "词频": 5, "单词": "bounce", "释义": "反弹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4720, "词频": 5, "单词": "complicate", "释义": "复杂的", "其他拼写": null, "pos": "verb"}, {"序号": 4721, "词频": 5, "单词": "conscientious", "释义": "认真的、负责的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4722, "词频": 5, "单词": "coronavirus", "释义": "冠状病毒", "其他拼写": null, "pos": "other"}, {"序号": 4723, "词频": 5, "单词": "crane", "释义": "起重机", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4724, "词频": 5, "单词": "crystal", "释义": "水晶", "其他拼写": null, "pos": "noun"}, {"序号": 4725, "词频": 5, "单词": "culminate", "释义": "达到高潮、结束", "其他拼写": null, "pos": "verb"}, {"序号": 4726, "词频": 5, "单词": "cupboard", "释义": "碗橱", "其他拼写": null, "pos": "noun"}, {"序号": 4727, "词频": 5, "单词": "dismay", "释义": "沮丧", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4728, "词频": 5, "单词": "evacuate", "释义": "疏散", "其他拼写": null, "pos": "verb"}, {"序号": 4729, "词频": 5, "单词": "feather", "释义": "羽毛", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4730, "词频": 5, "单词": "fertiliser", "释义": "化肥", "其他拼写": "fertilizer", "pos": "noun"}, {"序号": 4731, "词频": 5, "单词": "feudal", "释义": "封建的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4732, "词频": 5, "单词": "fireplace", "释义": "壁炉", "其他拼写": null, "pos": "noun"}, {"序号": 4733, "词频": 5, "单词": "fountain", "释义": "喷泉", "其他拼写": null, "pos": "noun"}, {"序号": 4734, "词频": 5, "单词": "frog", "释义": "蛙", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4735, "词频": 5, "单词": "germ", "释义": "细菌、胚芽", "其他拼写": null, "pos": "noun"}, {"序号": 4736, "词频": 5, "单词": "glide", "释义": "滑翔", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4737, "词频": 5, "单词": "heir", "释义": "继承人", "其他拼写": null, "pos": "noun"}, {"序号": 4738, "词频": 5, "单词": "imminent", "释义": "逼近的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4739, "词频": 5, "单词": "inhibit", "释义": "抑制", "其他拼写": null, "pos": "verb"}, {"序号": 4740, "词频": 5, "单词": "inward", "释义": "内部的、向内、内部", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4741, "词频": 5, "单词": "jazz", "释义": "爵士乐", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4742, "词频": 5, "单词": "junction", "释义": "连接", "其他拼写": null, "pos": "noun"}, {"序号": 4743, "词频": 5, "单词": "kidnap", "释义": "绑架", "其他拼写": null, "pos": "verb"}, {"序号": 4744, "词频": 5, "单词": "loop", "释义": "环", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4745, "词频": 5, "单词": "missionary", "释义": "传教士", "其他拼写": null, "pos": "noun"}, {"序号": 4746, "词频": 5, "单词": "moist", "释义": "潮湿的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4747, "词频": 5, "单词": "naked", "释义": "裸体的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4748, "词频": 5, "单词": "overcoat", "释义": "大衣", "其他拼写": null, "pos": "noun"}, {"序号": 4749, "词频": 5, "单词": "overflow", "释义": "溢出", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4750, "词频": 5, "单词": "pardon", "释义": "原谅", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4751, "词频": 5, "单词": "pity", "释义": "同情", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4752, "词频": 5, "单词": "plagiarism", "释义": "剽窃", "其他拼写": null, "pos": "noun"}, {"序号": 4753, "词频": 5, "单词": "plight", "释义": "困境", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4754, "词频": 5, "单词": "portfolio", "释义": "投资组合、作品集、文件夹", "其他拼写": null, "pos": "noun"}, {"序号": 4755, "词频": 5, "单词": "postman", "释义": "邮递员", "其他拼写": null, "pos": "noun"}, {"序号": 4756, "词频": 5, "单词": "prototype", "释义": "原型", "其他拼写": null, "pos": "noun"}, {"序号": 4757, "词频": 5, "单词": "punctual", "释义": "准时的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4758, "词频": 5, "单词": "redundant", "释义": "解雇的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4759, "词频": 5, "单词": "rotten", "释义": "腐烂的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4760, "词频": 5, "单词": "scarf", "释义": "围巾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4761, "词频": 5, "单词": "shabby", "释义": "破旧的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4762, "词频": 5, "单词": "shave", "释义": "刮、剃", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4763, "词频": 5, "单词": "shipment", "释义": "装运、货物", "其他拼写": null, "pos": "noun"}, {"序号": 4764, "词频": 5, "单词": "sore", "释义": "痛处、疼痛的", "其他拼写": null, "pos": "noun"}, {"序号": 4765, "词频": 5, "单词": "spit", "释义": "吐出、吐口水", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4766, "词频": 5, "单词": "steak", "释义": "牛排", "其他拼写": null, "pos": "noun"}, {"序号": 4767, "词频": 5, "单词": "storey", "释义": "楼层", "其他拼写": "story", "pos": "noun"}, {"序号": 4768, "词频": 5, "单词": "sturdy", "释义": "坚固的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4769, "词频": 5, "单词": "toe", "释义": "脚趾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4770, "词频": 5, "单词": "tumor", "释义": "肿块", "其他拼写": "tumour", "pos": "noun"}, {"序号": 4771, "词频": 5, "单词": "turmoil", "释义": "混乱", "其他拼写": null, "pos": "noun"}, {"序号": 4772, "词频": 5, "单词": "wary", "释义": "机警的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4773, "词频": 5, "单词": "whistle", "释义": "口哨、汽笛", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4774, "词频": 5, "单词": "wolf", "释义": "狼", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4775, "词频": 4, "单词": "geometry", "释义": "几何", "其他拼写": null, "pos": "noun"}, {"序号": 4776, "词频": 4, "单词": "menace", "释义": "威胁", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4777, "词频": 4, "单词": "radius", "释义": "半径", "其他拼写": null, "pos": "noun"}, {"序号": 4778, "词频": 4, "单词": "semiconductor", "释义": "半导体", "其他拼写": null, "pos": "noun"}, {"序号": 4779, "词频": 4, "单词": "statute", "释义": "法规", "其他拼写": null, "pos": "noun"}, {"序号": 4780, "词频": 4, "单词": "barn", "释义": "谷仓", "其他拼写": null, "pos": "noun"}, {"序号": 4781, "词频": 4, "单词": "jurisdiction", "释义": "管辖权", "其他拼写": null, "pos": "noun"}, {"序号": 4782, "词频": 4, "单词": "nitrogen", "释义": "氮", "其他拼写": null, "pos": "noun"}, {"序号": 4783, "词频": 4, "单词": "scorn", "释义": "轻蔑、鄙视", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4784, "词频": 4, "单词": "shove", "释义": "推", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4785, "词频": 4, "单词": "tram", "释义": "有轨电车", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4786, "词频": 4, "单词": "abound", "释义": "充满", "其他拼写": null, "pos": "verb"}, {"序号": 4787, "词频": 4, "单词": "cape", "释义": "披肩、海角", "其他拼写": null, "pos": "noun"}, {"序号": 4788, "词频": 4, "单词": "cherry", "释义": "樱桃", "其他拼写": null, "pos": "noun"}, {"序号": 4789, "词频": 4, "单词": "dock", "释义": "码头", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4790, "词频": 4, "单词": "eminent", "释义": "著名的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4791, "词频": 4, "单词": "ending", "释义": "结局", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4792, "词频": 4, "单词": "epoch", "释义": "时代", "其他拼写": null, "pos": "noun"}, {"序号": 4793, "词频": 4, "单词": "hen", "释义": "母鸡", "其他拼写": null, "pos": "noun"}, {"序号": 4794, "词频": 4, "单词": "intermittent", "释义": "断断续续的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4795, "词频": 4, "单词": "jaw", "释义": "下巴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4796, "词频": 4, "单词": "pepper", "释义": "辣椒", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4797, "词频": 4, "单词": "purify", "释义": "涤罪", "其他拼写": null, "pos": "verb"}, {"序号": 4798, "词频": 4, "单词": "rhetoric", "释义": "修辞", "其他拼写": null, "pos": "noun"}, {"序号": 4799, "词频": 4, "单词": "rope", "释义": "绳索", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4800, "词频": 4, "单词": "sideways", "释义": "侧身地、斜向一边的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4801, "词频": 4, "单词": "swarm", "释义": "群", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4802, "词频": 4, "单词": "symposium", "释义": "讨论会", "其他拼写": null, "pos": "noun"}, {"序号": 4803, "词频": 4, "单词": "thermometer", "释义": "温度计", "其他拼写": null, "pos": "noun"}, {"序号": 4804, "词频": 4, "单词": "withhold", "释义": "保留、扣留", "其他拼写": null, "pos": "verb"}, {"序号": 4805, "词频": 4, "单词": "arrow", "释义": "箭", "其他拼写": null, "pos": "noun"}, {"序号": 4806, "词频": 4, "单词": "baggage", "释义": "行李", "其他拼写": null, "pos": "noun"}, {"序号": 4807, "词频": 4, "单词": "blunt", "释义": "钝的、直率的", "其他拼写": null, "pos": "verb"}, {"序号": 4808, "词频": 4, "单词": "bruise", "释义": "擦伤、挫伤", "其他拼写": "bruize", "pos": "noun_verb"}, {"序号": 4809, "词频": 4, "单词": "buzz", "释义": "嗡嗡声、电话", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4810, "词频": 4, "单词": "cab", "释义": "驾驶室", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4811, "词频": 4, "单词": "calcium", "释义": "钙", "其他拼写": null, "pos": "noun"}, {"序号": 4812, "词频": 4, "单词": "compass", "释义": "指南针", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4813, "词频": 4, "单词": "downstairs", "释义": "楼下", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4814, "词频": 4, "单词": "dye", "释义": "染色、染料", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4815, "词频": 4, "单词": "fuse", "释义": "保险丝、融合", "其他拼写": "fuze", "pos": "noun_verb"}, {"序号": 4816, "词频": 4, "单词": "hostage", "释义": "人质", "其他拼写": null, "pos": "noun"}, {"序号": 4817, "词频": 4, "单词": "jog", "释义": "慢跑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4818, "词频": 4, "单词": "knife", "释义": "刀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4819, "词频": 4, "单词": "loaf", "释义": "块", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4820, "词频": 4, "单词": "lunar", "释义": "月亮的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4821, "词频": 4, "单词": "meadow", "释义": "草地", "其他拼写": null, "pos": "noun"}, {"序号": 4822, "词频": 4, "单词": "packet", "释义": "数据包", "其他拼写": null, "pos": "noun"}, {"序号": 4823, "词频": 4, "单词": "plumber", "释义": "管道工", "其他拼写": null, "pos": "noun"}, {"序号": 4824, "词频": 4, "单词": "psychiatry", "释义": "精神病学", "其他拼写": null, "pos": "noun"}, {"序号": 4825, "词频": 4, "单词": "racket", "释义": "球拍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4826, "词频": 4, "单词": "recite", "释义": "背诵", "其他拼写": null, "pos": "verb"}, {"序号": 4827, "词频": 4, "单词": "retention", "释义": "保存、记忆力", "其他拼写": null, "pos": "noun"}, {"序号": 4828, "词频": 4, "单词": "shorthand", "释义": "速记", "其他拼写": null, "pos": "noun"}, {"序号": 4829, "词频": 4, "单词": "sip", "释义": "抿一口", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4830, "词频": 4, "单词": "stubborn", "释义": "固执的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4831, "词频": 4, "单词": "trolley", "释义": "手推车", "其他拼写": null, "pos": "noun"}, {"序号": 4832, "词频": 4, "单词": "amend", "释义": "修正", "其他拼写": null, "pos": "verb"}, {"序号": 4833, "词频": 4, "单词": "ankle", "释义": "踝", "其他拼写": null, "pos": "noun"}, {"序号": 4834, "词频": 4, "单词": "barren", "释义": "贫瘠的", "其他拼写": null, "pos": "noun"}, {"序号": 4835, "词频": 4, "单词": "basin", "释义": "盆地", "其他拼写": null, "pos": "noun"}, {"序号": 4836, "词频": 4, "单词": "bat", "释义": "蝙蝠", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4837, "词频": 4, "单词": "beast", "释义": "兽", "其他拼写": null, "pos": "noun"}, {"序号": 4838, "词频": 4, "单词": "brass", "释义": "黄铜的", "其他拼写": null, "pos": "noun"}, {"序号": 4839, "词频": 4, "单词": "breach", "释义": "违反", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4840, "词频": 4, "单词": "broom", "释义": "扫帚", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4841, "词频": 4, "单词": "canvas", "释义": "帆布", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4842, "词频": 4, "单词": "cashier", "释义": "出纳员", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4843, "词频": 4, "单词": "chin", "释义": "下巴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4844, "词频": 4, "单词": "chorus", "释义": "合唱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4845, "词频": 4, "单词": "civilisation", "释义": "文明", "其他拼写": "civilization", "pos": "noun"}, {"序号": 4846, "词频": 4, "单词": "clay", "释义": "黏土", "其他拼写": null, "pos": "noun"}, {"序号": 4847, "词频": 4, "单词": "compartment", "释义": "间隔、划分", "其他拼写": null, "pos": "noun"}, {"序号": 4848, "词频": 4, "单词": "compassion", "释义": "同情", "其他拼写": null, "pos": "noun"}, {"序号": 4849, "词频": 4, "单词": "deer", "释义": "鹿", "其他拼写": null, "pos": "noun"}, {"序号": 4850, "词频": 4, "单词": "detain", "释义": "扣留", "其他拼写": null, "pos": "verb"}, {"序号": 4851, "词频": 4, "单词": "deviate", "释义": "偏离", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4852, "词频": 4, "单词": "diameter", "释义": "直径", "其他拼写": null, "pos": "noun"}, {"序号": 4853, "词频": 4, "单词": "discretion", "释义": "谨慎", "其他拼写": null, "pos": "noun"}, {"序号": 4854, "词频": 4, "单词": "ego", "释义": "自我", "其他拼写": null, "pos": "noun"}, {"序号": 4855, "词频": 4, "单词": "eloquent", "释义": "雄辩的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4856, "词频": 4, "单词": "enclosure", "释义": "围墙、附件", "其他拼写": null, "pos": "noun"}, {"序号": 4857, "词频": 4, "单词": "farewell", "释义": "告别", "其他拼写": null, "pos": "noun"}, {"序号": 4858, "词频": 4, "单词": "fling", "释义": "投掷", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4859, "词频": 4, "单词": "fluent", "释义": "流利的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4860, "词频": 4, "单词": "friction", "释义": "摩擦", "其他拼写": null, "pos": "noun"}, {"序号": 4861, "词频": 4, "单词": "frost", "释义": "霜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4862, "词频": 4, "单词": "glacier", "释义": "冰川", "其他拼写": null, "pos": "noun"}, {"序号": 4863, "词频": 4, "单词": "glorious", "释义": "辉煌的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4864, "词频": 4, "单词": "grim", "释义": "可怕的、冷酷的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4865, "词频": 4, "单词": "grocer", "释义": "杂货店", "其他拼写": null, "pos": "noun"}, {"序号": 4866, "词频": 4, "单词": "grope", "释义": "探索", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4867, "词频": 4, "单词": "hinge", "释义": "铰链", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4868, "词频": 4, "单词": "honorable", "释义": "光荣的、可敬的", "其他拼写": "honourable", "pos": "adj_adv"}, {"序号": 4869, "词频": 4, "单词": "horizontal", "释义": "水平的、水平线", "其他拼写": null, "pos": "noun"}, {"序号": 4870, "词频": 4, "单词": "horn", "释义": "喇叭", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4871, "词频": 4, "单词": "humid", "释义": "潮湿的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4872, "词频": 4, "单词": "kneel", "释义": "跪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4873, "词频": 4, "单词": "latent", "释义": "潜在的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4874, "词频": 4, "单词": "leaflet", "释义": "传单", "其他拼写": null, "pos": "noun"}, {"序号": 4875, "词频": 4, "单词": "linear", "释义": "线性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4876, "词频": 4, "单词": "millionaire", "释义": "百万富翁", "其他拼写": null, "pos": "noun"}, {"序号": 4877, "词频": 4, "单词": "minus", "释义": "减去", "其他拼写": null, "pos": "noun"}, {"序号": 4878, "词频": 4, "单词": "nickel", "释义": "镍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4879, "词频": 4, "单词": "noun", "释义": "名词", "其他拼写": null, "pos": "noun"}, {"序号": 4880, "词频": 4, "单词": "orthodox", "释义": "正统的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4881, "词频": 4, "单词": "pad", "释义": "发射台、衬垫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4882, "词频": 4, "单词": "parameter", "释义": "参数", "其他拼写": null, "pos": "noun"}, {"序号": 4883, "词频": 4, "单词": "patron", "释义": "守护神", "其他拼写": null, "pos": "noun"}, {"序号": 4884, "词频": 4, "单词": "petty", "释义": "小的、琐碎的", "其他拼写": null, "pos": "noun"}, {"序号": 4885, "词频": 4, "单词": "pickup", "释义": "加速、小型卡车、拾音器、获得", "其他拼写": null, "pos": "noun"}, {"序号": 4886, "词频": 4, "单词": "pillar", "释义": "支柱", "其他拼写": null, "pos": "noun"}, {"序号": 4887, "词频": 4, "单词": "plural", "释义": "复数", "其他拼写": null, "pos": "noun"}, {"序号": 4888, "词频": 4, "单词": "porch", "释义": "门廊", "其他拼写": null, "pos": "noun"}, {"序号": 4889, "词频": 4, "单词": "preclude", "释义": "阻止", "其他拼写": null, "pos": "verb"}, {"序号": 4890, "词频": 4, "单词": "pretext", "释义": "借口", "其他拼写": null, "pos": "noun"}, {"序号": 4891, "词频": 4, "单词": "rabbit", "释义": "兔子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4892, "词频": 4, "单词": "rack", "释义": "行李架", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4893, "词频": 4, "单词": "rash", "释义": "疹子、轻率的", "其他拼写": null, "pos": "noun"}, {"序号": 4894, "词频": 4, "单词": "remnant", "释义": "残余", "其他拼写": null, "pos": "noun"}, {"序号": 4895, "词频": 4, "单词": "reproach", "释义": "责备", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4896, "词频": 4, "单词": "restless", "释义": "不安宁的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4897, "词频": 4, "单词": "revolt", "释义": "反抗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4898, "词频": 4, "单词": "ripe", "释义": "熟的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4899, "词频": 4, "单词": "robe", "释义": "长袍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4900, "词频": 4, "单词": "sailor", "释义": "水手", "其他拼写": null, "pos": "noun"}, {"序号": 4901, "词频": 4, "单词": "saint", "释义": "圣人", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4902, "词频": 4, "单词": "sceptical", "释义": "怀疑的", "其他拼写": "skeptical", "pos": "adj_adv"}, {"序号": 4903, "词频": 4, "单词": "seventeen", "释义": "十七", "其他拼写": null, "pos": "noun"}, {"序号": 4904, "词频": 4, "单词": "shiver", "释义": "发抖、哆嗦", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4905, "词频": 4, "单词": "smuggle", "释义": "走私", "其他拼写": null, "pos": "verb"}, {"序号": 4906, "词频": 4, "单词": "sneeze", "释义": "喷嚏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4907, "词频": 4, "单词": "sour", "释义": "酸的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4908, "词频": 4, "单词": "specimen", "释义": "标本", "其他拼写": null, "pos": "noun"}, {"序号": 4909, "词频": 4, "单词": "spoon", "释义": "勺子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4910, "词频": 4, "单词": "stagnant", "释义": "停滞的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4911, "词频": 4, "单词": "stitch", "释义": "针脚、缝补", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4912, "词频": 4, "单词": "stoop", "释义": "弯腰", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4913, "词频": 4, "单词": "submarine", "释义": "潜水艇", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4914, "词频": 4, "单词": "subtract", "释义": "减去", "其他拼写": null, "pos": "verb"}, {"序号": 4915, "词频": 4, "单词": "suffice", "释义": "足够", "其他拼写": null, "pos": "verb"}, {"序号": 4916, "词频": 4, "单词": "thrust", "释义": "推力", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4917, "词频": 4, "单词": "torment", "释义": "折磨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4918, "词频": 4, "单词": "torrent", "释义": "激流", "其他拼写": null, "pos": "noun"}, {"序号": 4919, "词频": 4, "单词": "trunk", "释义": "树干", "其他拼写": null, "pos": "noun"}, {"序号": 4920, "词频": 4, "单词": "vicinity", "释义": "邻近", "其他拼写": null, "pos": "noun"}, {"序号": 4921, "词频": 4, "单词": "violet", "释义": "紫色、紫罗兰", "其他拼写": null, "pos": "noun"}, {"序号": 4922, "词频": 4, "单词": "wagon", "释义": "货车", "其他拼写": null, "pos": "noun"}, {"序号": 4923, "词频": 4, "单词": "yawn", "释义": "呵欠", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4924, "词频": 3, "单词": "fume", "释义": "烟", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4925, "词频": 3, "单词": "parachute", "释义": "降落伞", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4926, "词频": 3, "单词": "superfluous", "释义": "多余的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4927, "词频": 3, "单词": "turbine", "释义": "涡轮", "其他拼写": null, "pos": "noun"}, {"序号": 4928, "词频": 3, "单词": "aerial", "释义": "天线", "其他拼写": "erial", "pos": "noun"}, {"序号": 4929, "词频": 3, "单词": "brow", "释义": "眉毛", "其他拼写": null, "pos": "noun"}, {"序号": 4930, "词频": 3, "单词": "defer", "释义": "推迟", "其他拼写": null, "pos": "verb"}, {"序号": 4931, "词频": 3, "单词": "flare", "释义": "爆发、闪光", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4932, "词频": 3, "单词": "humiliate", "释义": "使丢脸", "其他拼写": null, "pos": "verb"}, {"序号": 4933, "词频": 3, "单词": "jealous", "释义": "嫉妒的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4934, "词频": 3, "单词": "massacre", "释义": "大屠杀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4935, "词频": 3, "单词": "monotonous", "释义": "单调的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4936, "词频": 3, "单词": "rejoice", "释义": "高兴", "其他拼写": null, "pos": "verb"}, {"序号": 4937, "词频": 3, "单词": "sly", "释义": "狡猾的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4938, "词频": 3, "单词": "speciality", "释义": "专长", "其他拼写": null, "pos": "noun"}, {"序号": 4939, "词频": 3, "单词": "strawberry", "释义": "草莓", "其他拼写": null, "pos": "noun"}, {"序号": 4940, "词频": 3, "单词": "synthesis", "释义": "合成", "其他拼写": null, "pos": "noun"}, {"序号": 4941, "词频": 3, "单词": "throne", "释义": "王位", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4942, "词频": 3, "单词": "vanity", "释义": "虚荣心", "其他拼写": null, "pos": "noun"}, {"序号": 4943, "词频": 3, "单词": "velocity", "释义": "速度", "其他拼写": null, "pos": "noun"}, {"序号": 4944, "词频": 3, "单词": "wedge", "释义": "楔子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4945, "词频": 3, "单词": "allegiance", "释义": "效忠", "其他拼写": null, "pos": "noun"}, {"序号": 4946, "词频": 3, "单词": "bronze", "释义": "青铜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4947, "词频": 3, "单词": "chalk", "释义": "粉笔", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4948, "词频": 3, "单词": "commemorate", "释义": "纪念", "其他拼写": null, "pos": "verb"}, {"序号": 4949, "词频": 3, "单词": "dumb", "释义": "愚蠢的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4950, "词频": 3, "单词": "elapse", "释义": "逝去", "其他拼写": null, "pos": "verb"}, {"序号": 4951, "词频": 3, "单词": "generator", "释义": "发电机", "其他拼写": null, "pos": "noun"}, {"序号": 4952, "词频": 3, "单词": "ham", "释义": "火腿", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4953, "词频": 3, "单词": "hedge", "释义": "树篱、篱笆", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4954, "词频": 3, "单词": "idiom", "释义": "成语", "其他拼写": null, "pos": "noun"}, {"序号": 4955, "词频": 3, "单词": "moisture", "释义": "水分", "其他拼写": null, "pos": "noun"}, {"序号": 4956, "词频": 3, "单词": "mortal", "释义": "凡人、致命的", "其他拼写": null, "pos": "noun"}, {"序号": 4957, "词频": 3, "单词": "orphan", "释义": "孤儿", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4958, "词频": 3, "单词": "overhaul", "释义": "彻底检查、革新", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4959, "词频": 3, "单词": "plateau", "释义": "高原", "其他拼写": null, "pos": "noun"}, {"序号": 4960, "词频": 3, "单词": "pork", "释义": "猪肉", "其他拼写": null, "pos": "noun"}, {"序号": 4961, "词频": 3, "单词": "propagate", "释义": "传播", "其他拼写": null, "pos": "verb"}, {"序号": 4962, "词频": 3, "单词": "puff", "释义": "粉扑、膨胀、一阵", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4963, "词频": 3, "单词": "reciprocal", "释义": "互惠、相互", "其他拼写": null, "pos": "noun"}, {"序号": 4964, "词频": 3, "单词": "retrospect", "释义": "回顾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4965, "词频": 3, "单词": "rib", "释义": "肋骨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4966, "词频": 3, "单词": "tan", "释义": "棕褐色、晒黑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4967, "词频": 3, "单词": "aggregate", "释义": "集料", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4968, "词频": 3, "单词": "anyhow", "释义": "无论如何", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4969, "词频": 3, "单词": "arch", "释义": "拱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4970, "词频": 3, "单词": "avail", "释义": "利益、有利于", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4971, "词频": 3, "单词": "balcony", "释义": "阳台", "其他拼写": null, "pos": "noun"}, {"序号": 4972, "词频": 3, "单词": "barbecue", "释义": "烧烤", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4973, "词频": 3, "单词": "belly", "释义": "腹部", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4974, "词频": 3, "单词": "benevolent", "释义": "仁慈的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4975, "词频": 3, "单词": "beware", "释义": "小心", "其他拼写": null, "pos": "verb"}, {"序号": 4976, "词频": 3, "单词": "blush", "释义": "脸红", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4977, "词频": 3, "单词": "born", "释义": "出生的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4978, "词频": 3, "单词": "bulletin", "释义": "公报", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4979, "词频": 3, "单词": "centimetre", "释义": "厘米", "其他拼写": "centimeter", "pos": "noun"}, {"序号": 4980, "词频": 3, "单词": "circus", "释义": "马戏团", "其他拼写": null, "pos": "noun"}, {"序号": 4981, "词频": 3, "单词": "clasp", "释义": "钩、扣子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4982, "词频": 3, "单词": "climax", "释义": "高潮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4983, "词频": 3, "单词": "commence", "释义": "开始", "其他拼写": null, "pos": "verb"}, {"序号": 4984, "词频": 3, "单词": "decree", "释义": "法令、颁布", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4985, "词频": 3, "单词": "dilute", "释义": "稀释", "其他拼写": null, "pos": "verb"}, {"序号": 4986, "词频": 3, "单词": "disappoint", "释义": "失望", "其他拼写": null, "pos": "verb"}, {"序号": 4987, "词频": 3, "单词": "discreet", "释义": "谨慎的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4988, "词频": 3, "单词": "dissipate", "释义": "消散", "其他拼写": null, "pos": "verb"}, {"序号": 4989, "词频": 3, "单词": "dynasty", "释义": "王朝", "其他拼写": null, "pos": "noun"}, {"序号": 4990, "词频": 3, "单词": "edible", "释义": "可食用的、食品", "其他拼写": null, "pos": "noun"}, {"序号": 4991, "词频": 3, "单词": "elastic", "释义": "有弹性的", "其他拼写": null, "pos": "noun"}, {"序号": 4992, "词频": 3, "单词": "escalate", "释义": "升级", "其他拼写": null, "pos": "verb"}, {"序号": 4993, "词频": 3, "单词": "escort", "释义": "护送", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4994, "词频": 3, "单词": "exceedingly", "释义": "极度地、非常", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4995, "词频": 3, "单词": "excite", "释义": "刺激、激起", "其他拼写": null, "pos": "verb"}, {"序号": 4996, "词频": 3, "单词": "exquisite", "释义": "精致的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 4997, "词频": 3, "单词": "fairy", "释义": "仙女", "其他拼写": null, "pos": "noun"}, {"序号": 4998, "词频": 3, "单词": "feast", "释义": "宴会", "其他拼写": null, "pos": "noun_verb"}, {"序号": 4999, "词频": 3, "单词": "fist", "释义": "拳头", "其他拼写": null, "pos": "noun"}, {"序号": 5000, "词频": 3, "单词": "fortnight", "释义": "两星期", "其他拼写": null, "pos": "noun"}, {"序号": 5001, "词频": 3, "单词": "furious", "释义": "狂怒的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5002, "词频": 3, "单词": "gauge", "释义": "测量", "其他拼写": "gage", "pos": "noun_verb"}, {"序号": 5003, "词频": 3, "单词": "gorgeous", "释义": "华丽的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5004, "词频": 3, "单词": "greeting", "释义": "问候", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5005, "词频": 3, "单词": "grind", "释义": "磨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5006, "词频": 3, "单词": "guitar", "释义": "吉他", "其他拼写": null, "pos": "noun"}, {"序号": 5007, "词频": 3, "单词": "handbook", "释义": "手册", "其他拼写": null, "pos": "noun"}, {"序号": 5008, "词频": 3, "单词": "headmaster", "释义": "校长", "其他拼写": null, "pos": "noun"}, {"序号": 5009, "词频": 3, "单词": "herald", "释义": "先驱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5010, "词频": 3, "单词": "herb", "释义": "药草", "其他拼写": null, "pos": "noun"}, {"序号": 5011, "词频": 3, "单词": "hoist", "释义": "升起、起重机", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5012, "词频": 3, "单词": "hose", "释义": "水管", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5013, "词频": 3, "单词": "humidity", "释义": "湿度", "其他拼写": null, "pos": "noun"}, {"序号": 5014, "词频": 3, "单词": "hurl", "释义": "用力投掷、丢下", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5015, "词频": 3, "单词": "icon", "释义": "偶像、图标", "其他拼写": null, "pos": "noun"}, {"序号": 5016, "词频": 3, "单词": "intelligible", "释义": "可理解的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5017, "词频": 3, "单词": "lad", "释义": "小伙子", "其他拼写": null, "pos": "noun"}, {"序号": 5018, "词频": 3, "单词": "liner", "释义": "班轮", "其他拼写": null, "pos": "noun"}, {"序号": 5019, "词频": 3, "单词": "locker", "释义": "储物柜", "其他拼写": null, "pos": "noun"}, {"序号": 5020, "词频": 3, "单词": "lubricate", "释义": "润滑", "其他拼写": null, "pos": "verb"}, {"序号": 5021, "词频": 3, "单词": "marble", "释义": "大理石", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5022, "词频": 3, "单词": "mat", "释义": "垫子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5023, "词频": 3, "单词": "me", "释义": "我", "其他拼写": null, "pos": "noun"}, {"序号": 5024, "词频": 3, "单词": "melody", "释义": "旋律", "其他拼写": null, "pos": "noun"}, {"序号": 5025, "词频": 3, "单词": "merry", "释义": "愉快的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5026, "词频": 3, "单词": "nineteen", "释义": "十九", "其他拼写": null, "pos": "noun"}, {"序号": 5027, "词频": 3, "单词": "notwithstanding", "释义": "尽管", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5028, "词频": 3, "单词": "onion", "释义": "洋葱", "其他拼写": null, "pos": "noun"}, {"序号": 5029, "词频": 3, "单词": "orchard", "释义": "果园", "其他拼写": null, "pos": "noun"}, {"序号": 5030, "词频": 3, "单词": "oval", "释义": "椭圆", "其他拼写": null, "pos": "noun"}, {"序号": 5031, "词频": 3, "单词": "overthrow", "释义": "推翻", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5032, "词频": 3, "单词": "owl", "释义": "猫头鹰", "其他拼写": null, "pos": "noun"}, {"序号": 5033, "词频": 3, "单词": "paradigm", "释义": "范例", "其他拼写": null, "pos": "noun"}, {"序号": 5034, "词频": 3, "单词": "paste", "释义": "粘贴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5035, "词频": 3, "单词": "peach", "释义": "桃子、桃树", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5036, "词频": 3, "单词": "pedal", "释义": "踏板", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5037, "词频": 3, "单词": "pendulum", "释义": "钟摆", "其他拼写": null, "pos": "noun"}, {"序号": 5038, "词频": 3, "单词": "peninsula", "释义": "半岛", "其他拼写": null, "pos": "noun"}, {"序号": 5039, "词频": 3, "单词": "petition", "释义": "请愿", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5040, "词频": 3, "单词": "pirate", "释义": "海盗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5041, "词频": 3, "单词": "plantation", "释义": "种植园", "其他拼写": null, "pos": "noun"}, {"序号": 5042, "词频": 3, "单词": "pond", "释义": "池塘", "其他拼写": null, "pos": "noun"}, {"序号": 5043, "词频": 3, "单词": "postage", "释义": "邮费", "其他拼写": null, "pos": "noun"}, {"序号": 5044, "词频": 3, "单词": "recede", "释义": "后退", "其他拼写": null, "pos": "verb"}, {"序号": 5045, "词频": 3, "单词": "reed", "释义": "芦苇", "其他拼写": null, "pos": "noun"}, {"序号": 5046, "词频": 3, "单词": "saddle", "释义": "鞍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5047, "词频": 3, "单词": "salvation", "释义": "拯救", "其他拼写": null, "pos": "noun"}, {"序号": 5048, "词频": 3, "单词": "saucer", "释义": "碟子", "其他拼写": null, "pos": "noun"}, {"序号": 5049, "词频": 3, "单词": "sausage", "释义": "香肠", "其他拼写": null, "pos": "noun"}, {"序号": 5050, "词频": 3, "单词": "scar", "释义": "疤痕", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5051, "词频": 3, "单词": "scramble", "释义": "争夺", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5052, "词频": 3, "单词": "shaft", "释义": "轴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5053, "词频": 3, "单词": "shear", "释义": "剪", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5054, "词频": 3, "单词": "skilful", "释义": "熟练的、巧妙的", "其他拼写": "skillful", "pos": "adj_adv"}, {"序号": 5055, "词频": 3, "单词": "slam", "释义": "满贯", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5056, "词频": 3, "单词": "solo", "释义": "独奏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5057, "词频": 3, "单词": "spade", "释义": "铁锹、铲", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5058, "词频": 3, "单词": "sparkle", "释义": "闪耀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5059, "词频": 3, "单词": "stagnate", "释义": "停滞不前", "其他拼写": null, "pos": "verb"}, {"序号": 5060, "词频": 3, "单词": "stun", "释义": "震惊", "其他拼写": null, "pos": "verb"}, {"序号": 5061, "词频": 3, "单词": "tariff", "释义": "关税", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5062, "词频": 3, "单词": "thermal", "释义": "热量的、热的", "其他拼写": null, "pos": "noun"}, {"序号": 5063, "词频": 3, "单词": "timid", "释义": "胆怯的", "其他拼写": null, "pos": "noun"}, {"序号": 5064, "词频": 3, "单词": "twinkle", "释义": "闪烁", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5065, "词频": 3, "单词": "unload", "释义": "卸下、卸货", "其他拼写": null, "pos": "verb"}, {"序号": 5066, "词频": 3, "单词": "veil", "释义": "面纱", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5067, "词频": 3, "单词": "volleyball", "释义": "排球", "其他拼写": null, "pos": "noun"}, {"序号": 5068, "词频": 3, "单词": "warranty", "释义": "保修期", "其他拼写": null, "pos": "noun"}, {"序号": 5069, "词频": 3, "单词": "waterproof", "释义": "防水材料", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5070, "词频": 3, "单词": "whisky", "释义": "威士忌酒", "其他拼写": "whiskey", "pos": "noun"}, {"序号": 5071, "词频": 3, "单词": "wholesome", "释义": "有益健康的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5072, "词频": 2, "单词": "amaze", "释义": "吃惊、惊讶", "其他拼写": null, "pos": "verb"}, {"序号": 5073, "词频": 2, "单词": "bait", "释义": "饵", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5074, "词频": 2, "单词": "coil", "释义": "圈、线圈", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5075, "词频": 2, "单词": "enquiry", "释义": "咨询", "其他拼写": null, "pos": "noun"}, {"序号": 5076, "词频": 2, "单词": "hypocrisy", "释义": "伪善", "其他拼写": null, "pos": "noun"}, {"序号": 5077, "词频": 2, "单词": "interface", "释义": "接口", "其他拼写": null, "pos": "noun"}, {"序号": 5078, "词频": 2, "单词": "invert", "释义": "颠倒、反转", "其他拼写": null, "pos": "verb"}, {"序号": 5079, "词频": 2, "单词": "lumber", "释义": "木材", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5080, "词频": 2, "单词": "madam", "释义": "夫人", "其他拼写": null, "pos": "noun"}, {"序号": 5081, "词频": 2, "单词": "adjective", "释义": "形容词", "其他拼写": null, "pos": "noun"}, {"序号": 5082, "词频": 2, "单词": "alloy", "释义": "合金", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5083, "词频": 2, "单词": "bearing", "释义": "轴承", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5084, "词频": 2, "单词": "bewilder", "释义": "使迷惑", "其他拼写": null, "pos": "verb"}, {"序号": 5085, "词频": 2, "单词": "bloody", "释义": "血腥的", "其他拼写": null, "pos": "verb"}, {"序号": 5086, "词频": 2, "单词": "centigrade", "释义": "百分度的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5087, "词频": 2, "单词": "choir", "释义": "唱诗班", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5088, "词频": 2, "单词": "clap", "释义": "击掌、拍手", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5089, "词频": 2, "单词": "cloak", "释义": "隐匿、外衣、遮掩", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5090, "词频": 2, "单词": "comb", "释义": "梳子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5091, "词频": 2, "单词": "debut", "释义": "初次登场", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5092, "词频": 2, "单词": "dwelling", "释义": "住宅", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5093, "词频": 2, "单词": "harden", "释义": "硬化", "其他拼写": null, "pos": "verb"}, {"序号": 5094, "词频": 2, "单词": "inhale", "释义": "吸入", "其他拼写": null, "pos": "verb"}, {"序号": 5095, "词频": 2, "单词": "mourn", "释义": "哀悼", "其他拼写": "morn", "pos": "verb"}, {"序号": 5096, "词频": 2, "单词": "necessitate", "释义": "迫使", "其他拼写": null, "pos": "verb"}, {"序号": 5097, "词频": 2, "单词": "obstruct", "释义": "妨碍", "其他拼写": null, "pos": "verb"}, {"序号": 5098, "词频": 2, "单词": "oxide", "释义": "氧化物", "其他拼写": null, "pos": "noun"}, {"序号": 5099, "词频": 2, "单词": "panorama", "释义": "全景", "其他拼写": null, "pos": "noun"}, {"序号": 5100, "词频": 2, "单词": "rake", "释义": "耙子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5101, "词频": 2, "单词": "repertoire", "释义": "全部节目", "其他拼写": null, "pos": "noun"}, {"序号": 5102, "词频": 2, "单词": "rose", "释义": "玫瑰", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5103, "词频": 2, "单词": "spiral", "释义": "螺旋", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5104, "词频": 2, "单词": "staircase", "释义": "楼梯", "其他拼写": null, "pos": "noun"}, {"序号": 5105, "词频": 2, "单词": "triangle", "释义": "三角形", "其他拼写": null, "pos": "noun"}, {"序号": 5106, "词频": 2, "单词": "adjacent", "释义": "邻近的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5107, "词频": 2, "单词": "antenna", "释义": "天线", "其他拼写": null, "pos": "noun"}, {"序号": 5108, "词频": 2, "单词": "approximate", "释义": "接近", "其他拼写": null, "pos": "verb"}, {"序号": 5109, "词频": 2, "单词": "arena", "释义": "竞技场", "其他拼写": null, "pos": "noun"}, {"序号": 5110, "词频": 2, "单词": "artery", "释义": "动脉", "其他拼写": null, "pos": "noun"}, {"序号": 5111, "词频": 2, "单词": "auditorium", "释义": "礼堂", "其他拼写": null, "pos": "noun"}, {"序号": 5112, "词频": 2, "单词": "autumn", "释义": "秋天", "其他拼写": null, "pos": "noun"}, {"序号": 5113, "词频": 2, "单词": "bandage", "释义": "绷带", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5114, "词频": 2, "单词": "bark", "释义": "树皮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5115, "词频": 2, "单词": "best", "释义": "最、最好的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5116, "词频": 2, "单词": "bibliography", "释义": "参考书目", "其他拼写": null, "pos": "noun"}, {"序号": 5117, "词频": 2, "单词": "blossom", "释义": "花", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5118, "词频": 2, "单词": "camel", "释义": "骆驼", "其他拼写": null, "pos": "noun"}, {"序号": 5119, "词频": 2, "单词": "cannon", "释义": "大炮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5120, "词频": 2, "单词": "capsule", "释义": "胶囊", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5121, "词频": 2, "单词": "cardinal", "释义": "基本的", "其他拼写": null, "pos": "noun"}, {"序号": 5122, "词频": 2, "单词": "clergy", "释义": "神职人员", "其他拼写": null, "pos": "noun"}, {"序号": 5123, "词频": 2, "单词": "clutch", "释义": "抓住、离合器", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5124, "词频": 2, "单词": "cohesive", "释义": "团结的、粘性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5125, "词频": 2, "单词": "configuration", "释义": "构造", "其他拼写": null, "pos": "noun"}, {"序号": 5126, "词频": 2, "单词": "contagious", "释义": "传染性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5127, "词频": 2, "单词": "crow", "释义": "乌鸦", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5128, "词频": 2, "单词": "damp", "释义": "潮湿", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5129, "词频": 2, "单词": "denounce", "释义": "谴责", "其他拼写": null, "pos": "verb"}, {"序号": 5130, "词频": 2, "单词": "deplore", "释义": "谴责", "其他拼写": null, "pos": "verb"}, {"序号": 5131, "词频": 2, "单词": "depress", "释义": "降低", "其他拼写": null, "pos": "verb"}, {"序号": 5132, "词频": 2, "单词": "disc", "释义": "圆盘", "其他拼写": null, "pos": "noun"}, {"序号": 5133, "词频": 2, "单词": "distil", "释义": "蒸馏", "其他拼写": "distill", "pos": "verb"}, {"序号": 5134, "词频": 2, "单词": "dragon", "释义": "龙", "其他拼写": null, "pos": "noun"}, {"序号": 5135, "词频": 2, "单词": "dusk", "释义": "黄昏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5136, "词频": 2, "单词": "emphasise", "释义": "着重", "其他拼写": "emphasize", "pos": "verb"}, {"序号": 5137, "词频": 2, "单词": "exterior", "释义": "外部", "其他拼写": null, "pos": "noun"}, {"序号": 5138, "词频": 2, "单词": "fabricate", "释义": "制造", "其他拼写": null, "pos": "verb"}, {"序号": 5139, "词频": 2, "单词": "fellowship", "释义": "奖学金、友谊", "其他拼写": null, "pos": "noun"}, {"序号": 5140, "词频": 2, "单词": "foam", "释义": "泡沫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5141, "词频": 2, "单词": "footstep", "释义": "脚步", "其他拼写": null, "pos": "noun"}, {"序号": 5142, "词频": 2, "单词": "freelance", "释义": "自由职业者", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5143, "词频": 2, "单词": "goat", "释义": "山羊", "其他拼写": null, "pos": "noun"}, {"序号": 5144, "词频": 2, "单词": "goose", "释义": "鹅", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5145, "词频": 2, "单词": "gown", "释义": "长袍", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5146, "词频": 2, "单词": "gymnasium", "释义": "体育馆", "其他拼写": null, "pos": "noun"}, {"序号": 5147, "词频": 2, "单词": "hay", "释义": "干草", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5148, "词频": 2, "单词": "intersection", "释义": "十字路口", "其他拼写": null, "pos": "noun"}, {"序号": 5149, "词频": 2, "单词": "inverse", "释义": "相反的、倒数", "其他拼写": null, "pos": "noun"}, {"序号": 5150, "词频": 2, "单词": "isle", "释义": "岛", "其他拼写": null, "pos": "noun"}, {"序号": 5151, "词频": 2, "单词": "jolly", "释义": "非常、快乐的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5152, "词频": 2, "单词": "judicial", "释义": "公正的、司法的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5153, "词频": 2, "单词": "lace", "释义": "花边", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5154, "词频": 2, "单词": "lavatory", "释义": "厕所", "其他拼写": null, "pos": "noun"}, {"序号": 5155, "词频": 2, "单词": "lick", "释义": "舔", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5156, "词频": 2, "单词": "maiden", "释义": "少女", "其他拼写": null, "pos": "noun"}, {"序号": 5157, "词频": 2, "单词": "malignant", "释义": "恶性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5158, "词频": 2, "单词": "missile", "释义": "导弹", "其他拼写": null, "pos": "noun"}, {"序号": 5159, "词频": 2, "单词": "module", "释义": "模块", "其他拼写": null, "pos": "noun"}, {"序号": 5160, "词频": 2, "单词": "numb", "释义": "麻木的", "其他拼写": null, "pos": "verb"}, {"序号": 5161, "词频": 2, "单词": "nylon", "释义": "尼龙", "其他拼写": null, "pos": "noun"}, {"序号": 5162, "词频": 2, "单词": "obstruction", "释义": "障碍", "其他拼写": null, "pos": "noun"}, {"序号": 5163, "词频": 2, "单词": "opaque", "释义": "不透明的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5164, "词频": 2, "单词": "outing", "释义": "郊游", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5165, "词频": 2, "单词": "ox", "释义": "牛", "其他拼写": null, "pos": "noun"}, {"序号": 5166, "词频": 2, "单词": "pathetic", "释义": "可怜的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5167, "词频": 2, "单词": "patriotic", "释义": "爱国的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5168, "词频": 2, "单词": "pebble", "释义": "鹅卵石", "其他拼写": null, "pos": "noun"}, {"序号": 5169, "词频": 2, "单词": "peel", "释义": "果皮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5170, "词频": 2, "单词": "perfume", "释义": "香水", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5171, "词频": 2, "单词": "pneumonia", "释义": "肺炎", "其他拼写": null, "pos": "noun"}, {"序号": 5172, "词频": 2, "单词": "recollect", "释义": "回忆", "其他拼写": null, "pos": "verb"}, {"序号": 5173, "词频": 2, "单词": "retort", "释义": "反驳", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5174, "词频": 2, "单词": "royalty", "释义": "版税", "其他拼写": null, "pos": "noun"}, {"序号": 5175, "词频": 2, "单词": "saw", "释义": "锯", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5176, "词频": 2, "单词": "scout", "释义": "侦察", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5177, "词频": 2, "单词": "sew", "释义": "缝", "其他拼写": null, "pos": "verb"}, {"序号": 5178, "词频": 2, "单词": "shampoo", "释义": "洗头", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5179, "词频": 2, "单词": "shepherd", "释义": "牧羊", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5180, "词频": 2, "单词": "siren", "释义": "警报器、汽笛", "其他拼写": null, "pos": "noun"}, {"序号": 5181, "词频": 2, "单词": "skull", "释义": "头骨", "其他拼写": null, "pos": "noun"}, {"序号": 5182, "词频": 2, "单词": "slaughter", "释义": "屠杀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5183, "词频": 2, "单词": "sophomore", "释义": "第二年的", "其他拼写": null, "pos": "noun"}, {"序号": 5184, "词频": 2, "单词": "spicy", "释义": "辛辣的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5185, "词频": 2, "单词": "stab", "释义": "刺、刺伤", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5186, "词频": 2, "单词": "stationery", "释义": "文具", "其他拼写": null, "pos": "noun"}, {"序号": 5187, "词频": 2, "单词": "stipulate", "释义": "规定", "其他拼写": null, "pos": "verb"}, {"序号": 5188, "词频": 2, "单词": "sunset", "释义": "日落", "其他拼写": null, "pos": "noun"}, {"序号": 5189, "词频": 2, "单词": "thereafter", "释义": "其后", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5190, "词频": 2, "单词": "trench", "释义": "沟", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5191, "词频": 2, "单词": "ultraviolet", "释义": "紫外线", "其他拼写": null, "pos": "noun"}, {"序号": 5192, "词频": 2, "单词": "unanimous", "释义": "全体一致的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5193, "词频": 2, "单词": "voltage", "释义": "电压", "其他拼写": null, "pos": "noun"}, {"序号": 5194, "词频": 2, "单词": "width", "释义": "宽度", "其他拼写": null, "pos": "noun"}, {"序号": 5195, "词频": 2, "单词": "zip", "释义": "拉链、尖啸声", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5196, "词频": 1, "单词": "abdomen", "释义": "腹部", "其他拼写": null, "pos": "noun"}, {"序号": 5197, "词频": 1, "单词": "agitate", "释义": "煽动、晃动", "其他拼写": null, "pos": "verb"}, {"序号": 5198, "词频": 1, "单词": "amiable", "释义": "亲切的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5199, "词频": 1, "单词": "bribe", "释义": "贿赂", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5200, "词频": 1, "单词": "composite", "释义": "复合材料", "其他拼写": null, "pos": "noun"}, {"序号": 5201, "词频": 1, "单词": "comrade", "释义": "同志", "其他拼写": null, "pos": "noun"}, {"序号": 5202, "词频": 1, "单词": "contingent", "释义": "代表团", "其他拼写": null, "pos": "noun"}, {"序号": 5203, "词频": 1, "单词": "culprit", "释义": "罪犯", "其他拼写": null, "pos": "noun"}, {"序号": 5204, "词频": 1, "单词": "giggle", "释义": "咯咯地笑", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5205, "词频": 1, "单词": "interim", "释义": "临时的", "其他拼写": null, "pos": "noun"}, {"序号": 5206, "词频": 1, "单词": "lame", "释义": "痛的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5207, "词频": 1, "单词": "minimise", "释义": "尽量减少", "其他拼写": "minimize", "pos": "verb"}, {"序号": 5208, "词频": 1, "单词": "paddle", "释义": "桨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5209, "词频": 1, "单词": "pea", "释义": "豌豆", "其他拼写": null, "pos": "noun"}, {"序号": 5210, "词频": 1, "单词": "physiology", "释义": "生理学", "其他拼写": null, "pos": "noun"}, {"序号": 5211, "词频": 1, "单词": "plaster", "释义": "石膏", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5212, "词频": 1, "单词": "preposition", "释义": "介词", "其他拼写": null, "pos": "noun"}, {"序号": 5213, "词频": 1, "单词": "radioactive", "释义": "放射性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5214, "词频": 1, "单词": "ruthless", "释义": "无情的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5215, "词频": 1, "单词": "watt", "释义": "瓦特", "其他拼写": null, "pos": "noun"}, {"序号": 5216, "词频": 1, "单词": "adore", "释义": "热爱、爱慕", "其他拼写": null, "pos": "verb"}, {"序号": 5217, "词频": 1, "单词": "esthetic", "释义": "美学", "其他拼写": "aesthetic, esthetical, aesthetical", "pos": "noun"}, {"序号": 5218, "词频": 1, "单词": "anguish", "释义": "痛苦", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5219, "词频": 1, "单词": "appal", "释义": "吓坏、惊骇", "其他拼写": "appall", "pos": "verb"}, {"序号": 5220, "词频": 1, "单词": "appendix", "释义": "附录", "其他拼写": null, "pos": "noun"}, {"序号": 5221, "词频": 1, "单词": "assassinate", "释义": "暗杀", "其他拼写": null, "pos": "verb"}, {"序号": 5222, "词频": 1, "单词": "ax", "释义": "斧子、削减", "其他拼写": "axe", "pos": "noun_verb"}, {"序号": 5223, "词频": 1, "单词": "badminton", "释义": "羽毛球", "其他拼写": null, "pos": "noun"}, {"序号": 5224, "词频": 1, "单词": "batch", "释义": "一批", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5225, "词频": 1, "单词": "blackboard", "释义": "黑板", "其他拼写": null, "pos": "noun"}, {"序号": 5226, "词频": 1, "单词": "blade", "释义": "叶片", "其他拼写": null, "pos": "noun"}, {"序号": 5227, "词频": 1, "单词": "brevity", "释义": "简洁", "其他拼写": null, "pos": "noun"}, {"序号": 5228, "词频": 1, "单词": "buffet", "释义": "自助餐", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5229, "词频": 1, "单词": "cellar", "释义": "地窖", "其他拼写": null, "pos": "noun"}, {"序号": 5230, "词频": 1, "单词": "cemetery", "释义": "墓地", "其他拼写": null, "pos": "noun"}, {"序号": 5231, "词频": 1, "单词": "coarse", "释义": "粗糙的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5232, "词频": 1, "单词": "comet", "释义": "彗星", "其他拼写": null, "pos": "noun"}, {"序号": 5233, "词频": 1, "单词": "cordial", "释义": "热忱的、诚恳的", "其他拼写": null, "pos": "noun"}, {"序号": 5234, "词频": 1, "单词": "cosy", "释义": "相互勾结的、亲切友好的", "其他拼写": "cozy", "pos": "noun"}, {"序号": 5235, "词频": 1, "单词": "darling", "释义": "亲爱的", "其他拼写": null, "pos": "noun"}, {"序号": 5236, "词频": 1, "单词": "deduct", "释义": "扣除", "其他拼写": null, "pos": "verb"}, {"序号": 5237, "词频": 1, "单词": "degenerate", "释义": "退化", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5238, "词频": 1, "单词": "dew", "释义": "露水", "其他拼写": null, "pos": "noun"}, {"序号": 5239, "词频": 1, "单词": "discrete", "释义": "不连续的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5240, "词频": 1, "单词": "drip", "释义": "滴", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5241, "词频": 1, "单词": "eclipse", "释义": "丧失、形成日或月食", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5242, "词频": 1, "单词": "electrician", "释义": "电工", "其他拼写": null, "pos": "noun"}, {"序号": 5243, "词频": 1, "单词": "electron", "释义": "电子", "其他拼写": null, "pos": "noun"}, {"序号": 5244, "词频": 1, "单词": "encyclopedia", "释义": "百科全书", "其他拼写": "encyclopaedia", "pos": "noun"}, {"序号": 5245, "词频": 1, "单词": "enquire", "释义": "询问", "其他拼写": null, "pos": "verb"}, {"序号": 5246, "词频": 1, "单词": "equator", "释义": "赤道", "其他拼写": null, "pos": "noun"}, {"序号": 5247, "词频": 1, "单词": "forehead", "释义": "前额", "其他拼写": null, "pos": "noun"}, {"序号": 5248, "词频": 1, "单词": "fright", "释义": "惊恐", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5249, "词频": 1, "单词": "fringe", "释义": "边缘", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5250, "词频": 1, "单词": "gang", "释义": "一伙", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5251, "词频": 1, "单词": "garlic", "释义": "大蒜", "其他拼写": null, "pos": "noun"}, {"序号": 5252, "词频": 1, "单词": "generalise", "释义": "概括", "其他拼写": "generalize", "pos": "verb"}, {"序号": 5253, "词频": 1, "单词": "graceful", "释义": "优雅的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5254, "词频": 1, "单词": "harassment", "释义": "骚扰", "其他拼写": null, "pos": "noun"}, {"序号": 5255, "词频": 1, "单词": "henceforth", "释义": "今后", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5256, "词频": 1, "单词": "idiot", "释义": "白痴", "其他拼写": null, "pos": "noun"}, {"序号": 5257, "词频": 1, "单词": "inaugurate", "释义": "开创、开始", "其他拼写": null, "pos": "verb"}, {"序号": 5258, "词频": 1, "单词": "intercourse", "释义": "性交", "其他拼写": "intercorse", "pos": "noun"}, {"序号": 5259, "词频": 1, "单词": "ivory", "释义": "象牙", "其他拼写": null, "pos": "noun"}, {"序号": 5260, "词频": 1, "单词": "kettle", "释义": "水壶", "其他拼写": null, "pos": "noun"}, {"序号": 5261, "词频": 1, "单词": "kite", "释义": "风筝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5262, "词频": 1, "单词": "knob", "释义": "旋钮", "其他拼写": null, "pos": "noun"}, {"序号": 5263, "词频": 1, "单词": "lantern", "释义": "灯笼", "其他拼写": null, "pos": "noun"}, {"序号": 5264, "词频": 1, "单词": "lid", "释义": "盖子", "其他拼写": null, "pos": "noun"}, {"序号": 5265, "词频": 1, "单词": "longitude", "释义": "经度", "其他拼写": null, "pos": "noun"}, {"序号": 5266, "词频": 1, "单词": "lyric", "释义": "抒情诗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5267, "词频": 1, "单词": "manoeuvre", "释义": "操纵、策略", "其他拼写": "maneuver", "pos": "noun_verb"}, {"序号": 5268, "词频": 1, "单词": "melon", "释义": "甜瓜", "其他拼写": null, "pos": "noun"}, {"序号": 5269, "词频": 1, "单词": "microphone", "释义": "麦克风", "其他拼写": null, "pos": "noun"}, {"序号": 5270, "词频": 1, "单词": "militant", "释义": "激进分子", "其他拼写": null, "pos": "noun"}, {"序号": 5271, "词频": 1, "单词": "mist", "释义": "雾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5272, "词频": 1, "单词": "mosaic", "释义": "马赛克", "其他拼写": null, "pos": "noun"}, {"序号": 5273, "词频": 1, "单词": "mosquito", "释义": "蚊子", "其他拼写": null, "pos": "noun"}, {"序号": 5274, "词频": 1, "单词": "mushroom", "释义": "蘑菇", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5275, "词频": 1, "单词": "mutter", "释义": "咕哝、抱怨", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5276, "词频": 1, "单词": "napkin", "释义": "餐巾", "其他拼写": null, "pos": "noun"}, {"序号": 5277, "词频": 1, "单词": "nephew", "释义": "侄子", "其他拼写": null, "pos": "noun"}, {"序号": 5278, "词频": 1, "单词": "noodle", "释义": "面条", "其他拼写": null, "pos": "noun"}, {"序号": 5279, "词频": 1, "单词": "nostalgic", "释义": "怀旧的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5280, "词频": 1, "单词": "oath", "释义": "誓言", "其他拼写": null, "pos": "noun"}, {"序号": 5281, "词频": 1, "单词": "obsolete", "释义": "过时的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5282, "词频": 1, "单词": "overhear", "释义": "偷听", "其他拼写": null, "pos": "verb"}, {"序号": 5283, "词频": 1, "单词": "paralyse", "释义": "瘫痪", "其他拼写": "paralyze", "pos": "verb"}, {"序号": 5284, "词频": 1, "单词": "passerby", "释义": "过路人", "其他拼写": null, "pos": "noun"}, {"序号": 5285, "词频": 1, "单词": "paw", "释义": "爪子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5286, "词频": 1, "单词": "peanut", "释义": "花生", "其他拼写": null, "pos": "noun"}, {"序号": 5287, "词频": 1, "单词": "pillow", "释义": "枕、枕头", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5288, "词频": 1, "单词": "porcelain", "释义": "瓷", "其他拼写": null, "pos": "noun"}, {"序号": 5289, "词频": 1, "单词": "radiant", "释义": "辐射的、发光的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5290, "词频": 1, "单词": "redeem", "释义": "赎回", "其他拼写": null, "pos": "verb"}, {"序号": 5291, "词频": 1, "单词": "reel", "释义": "卷", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5292, "词频": 1, "单词": "relish", "释义": "喜欢、享受", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5293, "词频": 1, "单词": "remainder", "释义": "剩余物、廉价出售", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5294, "词频": 1, "单词": "riddle", "释义": "谜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5295, "词频": 1, "单词": "salient", "释义": "突出的、显著的", "其他拼写": null, "pos": "noun"}, {"序号": 5296, "词频": 1, "单词": "sane", "释义": "心智健全的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5297, "词频": 1, "单词": "seam", "释义": "缝", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5298, "词频": 1, "单词": "shutter", "释义": "快门", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5299, "词频": 1, "单词": "siege", "释义": "围攻", "其他拼写": null, "pos": "noun"}, {"序号": 5300, "词频": 1, "单词": "slipper", "释义": "拖鞋", "其他拼写": null, "pos": "noun"}, {"序号": 5301, "词频": 1, "单词": "snobbish", "释义": "势利的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5302, "词频": 1, "单词": "sprout", "释义": "芽", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5303, "词频": 1, "单词": "stagger", "释义": "蹒跚", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5304, "词频": 1, "单词": "static", "释义": "静态的、静电", "其他拼写": null, "pos": "noun"}, {"序号": 5305, "词频": 1, "单词": "stool", "释义": "凳子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5306, "词频": 1, "单词": "streamline", "释义": "简化", "其他拼写": null, "pos": "verb"}, {"序号": 5307, "词频": 1, "单词": "summarise", "释义": "概括", "其他拼写": "summarize", "pos": "verb"}, {"序号": 5308, "词频": 1, "单词": "supersonic", "释义": "超声波", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5309, "词频": 1, "单词": "swan", "释义": "天鹅", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5310, "词频": 1, "单词": "symmetry", "释义": "匀称", "其他拼写": null, "pos": "noun"}, {"序号": 5311, "词频": 1, "单词": "tempo", "释义": "节奏", "其他拼写": null, "pos": "noun"}, {"序号": 5312, "词频": 1, "单词": "temporal", "释义": "暂时的", "其他拼写": null, "pos": "noun"}, {"序号": 5313, "词频": 1, "单词": "tiresome", "释义": "讨厌的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5314, "词频": 1, "单词": "trifle", "释义": "琐事、浪费", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5315, "词频": 1, "单词": "tub", "释义": "浴盆、桶", "其他拼写": null, "pos": "noun"}, {"序号": 5316, "词频": 1, "单词": "understanding", "释义": "理解", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5317, "词频": 1, "单词": "valve", "释义": "阀门", "其他拼写": null, "pos": "noun"}, {"序号": 5318, "词频": 1, "单词": "variance", "释义": "变化", "其他拼写": null, "pos": "noun"}, {"序号": 5319, "词频": 1, "单词": "vase", "释义": "花瓶", "其他拼写": null, "pos": "noun"}, {"序号": 5320, "词频": 1, "单词": "vest", "释义": "背心", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5321, "词频": 1, "单词": "vibrate", "释义": "颤动", "其他拼写": null, "pos": "verb"}, {"序号": 5322, "词频": 1, "单词": "volatile", "释义": "不稳定的、挥发物", "其他拼写": null, "pos": "noun"}, {"序号": 5323, "词频": 1, "单词": "volt", "释义": "伏特", "其他拼写": null, "pos": "noun"}, {"序号": 5324, "词频": 1, "单词": "waterfall", "释义": "瀑布", "其他拼写": null, "pos": "noun"}, {"序号": 5325, "词频": 1, "单词": "wax", "释义": "蜡", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5326, "词频": 1, "单词": "whirl", "释义": "旋转、回旋", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5327, "词频": 1, "单词": "witch", "释义": "女巫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5328, "词频": 1, "单词": "wool", "释义": "羊毛", "其他拼写": null, "pos": "noun"}, {"序号": 5329, "词频": 1, "单词": "wrench", "释义": "猛扭、痛苦", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5330, "词频": 1, "单词": "wrinkle", "释义": "皱纹", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5331, "词频": 0, "单词": "according to", "释义": "据所说、根据", "其他拼写": null, "pos": "prep_conj"}, {"序号": 5332, "词频": 0, "单词": "accustom", "释义": "习惯", "其他拼写": null, "pos": "verb"}, {"序号": 5333, "词频": 0, "单词": "adverb", "释义": "副词", "其他拼写": null, "pos": "noun"}, {"序号": 5334, "词频": 0, "单词": "air conditioning", "释义": "空调", "其他拼写": null, "pos": "noun"}, {"序号": 5335, "词频": 0, "单词": "albeit", "释义": "虽然", "其他拼写": null, "pos": "other"}, {"序号": 5336, "词频": 0, "单词": "analog", "释义": "模拟的", "其他拼写": "analogue", "pos": "noun"}, {"序号": 5337, "词频": 0, "单词": "apologise", "释义": "道歉", "其他拼写": "apologize", "pos": "verb"}, {"序号": 5338, "词频": 0, "单词": "April", "释义": "四月", "其他拼写": null, "pos": "noun"}, {"序号": 5339, "词频": 0, "单词": "archeology", "释义": "考古学", "其他拼写": "archaeology", "pos": "noun"}, {"序号": 5340, "词频": 0, "单词": "artefact", "释义": "人工制品", "其他拼写": "artifact", "pos": "noun"}, {"序号": 5341, "词频": 0, "单词": "August", "释义": "八月", "其他拼写": null, "pos": "noun"}, {"序号": 5342, "词频": 0, "单词": "aural", "释义": "听觉的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5343, "词频": 0, "单词": "Bible", "释义": "圣经", "其他拼写": null, "pos": "noun"}, {"序号": 5344, "词频": 0, "单词": "botany", "释义": "植物", "其他拼写": null, "pos": "noun"}, {"序号": 5345, "词频": 0, "单词": "bowel", "释义": "肠", "其他拼写": null, "pos": "noun"}, {"序号": 5346, "词频": 0, "单词": "bowling", "释义": "保龄球", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5347, "词频": 0, "单词": "brace", "释义": "支撑、支架", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5348, "词频": 0, "单词": "brandy", "释义": "白兰地酒", "其他拼写": null, "pos": "noun"}, {"序号": 5349, "词频": 0, "单词": "buffer", "释义": "缓冲", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5350, "词频": 0, "单词": "cabbage", "释义": "卷心菜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5351, "词频": 0, "单词": "Catholic", "释义": "天主教徒、天主教的", "其他拼写": null, "pos": "noun"}, {"序号": 5352, "词频": 0, "单词": "Christ", "释义": "基督", "其他拼写": null, "pos": "noun"}, {"序号": 5353, "词频": 0, "单词": "Christian", "释义": "基督徒", "其他拼写": null, "pos": "noun"}, {"序号": 5354, "词频": 0, "单词": "Christmas", "释义": "圣诞节", "其他拼写": null, "pos": "noun"}, {"序号": 5355, "词频": 0, "单词": "cigaret", "释义": "香烟", "其他拼写": "cigarette", "pos": "noun"}, {"序号": 5356, "词频": 0, "单词": "civilise", "释义": "使文明", "其他拼写": "civilize", "pos": "verb"}, {"序号": 5357, "词频": 0, "单词": "clockwise", "释义": "顺时针方向地", "其他拼写": "clockwize", "pos": "adj_adv"}, {"序号": 5358, "词频": 0, "单词": "clothes", "释义": "衣服", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5359, "词频": 0, "单词": "cock", "释义": "公鸡", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5360, "词频": 0, "单词": "colonel", "释义": "上校", "其他拼写": null, "pos": "noun"}, {"序号": 5361, "词频": 0, "单词": "communism", "释义": "共产主义", "其他拼写": null, "pos": "noun"}, {"序号": 5362, "词频": 0, "单词": "concurrent", "释义": "同时发生的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5363, "词频": 0, "单词": "corrode", "释义": "腐蚀", "其他拼写": null, "pos": "verb"}, {"序号": 5364, "词频": 0, "单词": "cradle", "释义": "摇篮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5365, "词频": 0, "单词": "cunning", "释义": "狡猾的", "其他拼写": null, "pos": "noun"}, {"序号": 5366, "词频": 0, "单词": "cylinder", "释义": "汽缸、圆筒", "其他拼写": null, "pos": "noun"}, {"序号": 5367, "词频": 0, "单词": "data", "释义": "数据", "其他拼写": null, "pos": "noun"}, {"序号": 5368, "词频": 0, "单词": "daunting", "释义": "令人畏惧的", "其他拼写": null, "pos": "verb"}, {"序号": 5369, "词频": 0, "单词": "deceit", "释义": "欺骗", "其他拼写": null, "pos": "noun"}, {"序号": 5370, "词频": 0, "单词": "December", "释义": "十二月", "其他拼写": null, "pos": "noun"}, {"序号": 5371, "词频": 0, "单词": "decimal", "释义": "小数", "其他拼写": null, "pos": "noun"}, {"序号": 5372, "词频": 0, "单词": "desolate", "释义": "荒凉的", "其他拼写": null, "pos": "verb"}, {"序号": 5373, "词频": 0, "单词": "despatch", "释义": "派遣", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5374, "词频": 0, "单词": "dialog", "释义": "对话", "其他拼写": "dialogue", "pos": "noun"}, {"序号": 5375, "词频": 0, "单词": "dove", "释义": "鸽子", "其他拼写": "dive", "pos": "noun_verb"}, {"序号": 5376, "词频": 0, "单词": "Easter", "释义": "复活节", "其他拼写": null, "pos": "noun"}, {"序号": 5377, "词频": 0, "单词": "ebb", "释义": "退潮、落潮", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5378, "词频": 0, "单词": "economics", "释义": "经济学", "其他拼写": null, "pos": "noun"}, {"序号": 5379, "词频": 0, "单词": "embassy", "释义": "大使馆", "其他拼写": null, "pos": "noun"}, {"序号": 5380, "词频": 0, "单词": "fable", "释义": "寓言", "其他拼写": null, "pos": "noun"}, {"序号": 5381, "词频": 0, "单词": "farther", "释义": "更远的、更远地", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5382, "词频": 0, "单词": "February", "释义": "二月", "其他拼写": null, "pos": "noun"}, {"序号": 5383, "词频": 0, "单词": "following", "释义": "下列的、接着的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5384, "词频": 0, "单词": "fragrant", "释义": "馥郁的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5385, "词频": 0, "单词": "franchise", "释义": "特权、选举权", "其他拼写": "franchize", "pos": "noun_verb"}, {"序号": 5386, "词频": 0, "单词": "Friday", "释义": "星期五", "其他拼写": null, "pos": "noun"}, {"序号": 5387, "词频": 0, "单词": "further", "释义": "更远的、促进", "其他拼写": null, "pos": "verb"}, {"序号": 5388, "词频": 0, "单词": "gaol", "释义": "监狱", "其他拼写": "jail", "pos": "noun_verb"}, {"序号": 5389, "词频": 0, "单词": "gay", "释义": "同性恋的", "其他拼写": null, "pos": "noun"}, {"序号": 5390, "词频": 0, "单词": "glamor", "释义": "魅力", "其他拼写": "glamour", "pos": "noun"}, {"序号": 5391, "词频": 0, "单词": "goods", "释义": "货物", "其他拼写": null, "pos": "noun"}, {"序号": 5392, "词频": 0, "单词": "grease", "释义": "油脂", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5393, "词频": 0, "单词": "grown-up", "释义": "成年人", "其他拼写": null, "pos": "other"}, {"序号": 5394, "词频": 0, "单词": "headquarters", "释义": "总部、司令部", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5395, "词频": 0, "单词": "him", "释义": "他", "其他拼写": null, "pos": "other"}, {"序号": 5396, "词频": 0, "单词": "horsepower", "释义": "马力", "其他拼写": null, "pos": "noun"}, {"序号": 5397, "词频": 0, "单词": "hound", "释义": "猎狗", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5398, "词频": 0, "单词": "howl", "释义": "嚎叫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5399, "词频": 0, "单词": "hysterical", "释义": "歇斯底里的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5400, "词频": 0, "单词": "ice cream", "释义": "冰淇淋", "其他拼写": null, "pos": "noun"}, {"序号": 5401, "词频": 0, "单词": "inflict", "释义": "使遭受、折磨", "其他拼写": null, "pos": "verb"}, {"序号": 5402, "词频": 0, "单词": "influenza", "释义": "流行性感冒", "其他拼写": null, "pos": "noun"}, {"序号": 5403, "词频": 0, "单词": "infrared", "释义": "红外线的", "其他拼写": null, "pos": "noun"}, {"序号": 5404, "词频": 0, "单词": "instalment", "释义": "分期付款", "其他拼写": "installment", "pos": "noun"}, {"序号": 5405, "词频": 0, "单词": "Internet", "释义": "因特网", "其他拼写": null, "pos": "noun"}, {"序号": 5406, "词频": 0, "单词": "invoke", "释义": "请求、援引", "其他拼写": null, "pos": "verb"}, {"序号": 5407, "词频": 0, "单词": "January", "释义": "一月", "其他拼写": null, "pos": "noun"}, {"序号": 5408, "词频": 0, "单词": "jug", "释义": "罐", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5409, "词频": 0, "单词": "July", "释义": "七月", "其他拼写": null, "pos": "noun"}, {"序号": 5410, "词频": 0, "单词": "June", "释义": "六月", "其他拼写": null, "pos": "noun"}, {"序号": 5411, "词频": 0, "单词": "lash", "释义": "鞭打、抨击、睫毛", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5412, "词频": 0, "单词": "Latin", "释义": "拉丁语、拉丁语的", "其他拼写": null, "pos": "noun"}, {"序号": 5413, "词频": 0, "单词": "leading", "释义": "主要的、领导的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5414, "词频": 0, "单词": "left", "释义": "左边、向左", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5415, "词频": 0, "单词": "linen", "释义": "亚麻布", "其他拼写": null, "pos": "noun"}, {"序号": 5416, "词频": 0, "单词": "living", "释义": "生活", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5417, "词频": 0, "单词": "living room", "释义": "客厅", "其他拼写": null, "pos": "noun"}, {"序号": 5418, "词频": 0, "单词": "locomotive", "释义": "机车", "其他拼写": null, "pos": "noun"}, {"序号": 5419, "词频": 0, "单词": "magistrate", "释义": "地方法官", "其他拼写": null, "pos": "noun"}, {"序号": 5420, "词频": 0, "单词": "majesty", "释义": "威严", "其他拼写": null, "pos": "noun"}, {"序号": 5421, "词频": 0, "单词": "March", "释义": "三月", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5422, "词频": 0, "单词": "married", "释义": "已婚的、婚姻的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5423, "词频": 0, "单词": "Marxist", "释义": "马克思主义的", "其他拼写": null, "pos": "noun"}, {"序号": 5424, "词频": 0, "单词": "mathematics", "释义": "数学", "其他拼写": null, "pos": "noun"}, {"序号": 5425, "词频": 0, "单词": "May", "释义": "五月", "其他拼写": null, "pos": "noun"}, {"序号": 5426, "词频": 0, "单词": "means", "释义": "手段", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5427, "词频": 0, "单词": "media", "释义": "传播媒介", "其他拼写": null, "pos": "noun"}, {"序号": 5428, "词频": 0, "单词": "millimetre", "释义": "毫米", "其他拼写": "millimeter", "pos": "noun"}, {"序号": 5429, "词频": 0, "单词": "mischief", "释义": "恶作剧", "其他拼写": null, "pos": "noun"}, {"序号": 5430, "词频": 0, "单词": "missing", "释义": "失踪的", "其他拼写": null, "pos": "verb"}, {"序号": 5431, "词频": 0, "单词": "mistress", "释义": "情妇", "其他拼写": null, "pos": "noun"}, {"序号": 5432, "词频": 0, "单词": "mob", "释义": "暴民", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5433, "词频": 0, "单词": "mobilise", "释义": "动员", "其他拼写": "mobilize", "pos": "verb"}, {"序号": 5434, "词频": 0, "单词": "modernisation", "释义": "现代化", "其他拼写": "modernization", "pos": "noun"}, {"序号": 5435, "词频": 0, "单词": "Monday", "释义": "星期一", "其他拼写": null, "pos": "noun"}, {"序号": 5436, "词频": 0, "单词": "mug", "释义": "杯", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5437, "词频": 0, "单词": "naughty", "释义": "淘气的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5438, "词频": 0, "单词": "normalisation", "释义": "正常化", "其他拼写": "normalization", "pos": "noun"}, {"序号": 5439, "词频": 0, "单词": "northwest", "释义": "西北", "其他拼写": null, "pos": "noun"}, {"序号": 5440, "词频": 0, "单词": "November", "释义": "十一月", "其他拼写": null, "pos": "noun"}, {"序号": 5441, "词频": 0, "单词": "oar", "释义": "桨", "其他拼写": null, "pos": "noun"}, {"序号": 5442, "词频": 0, "单词": "o'clock", "释义": "点钟", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5443, "词频": 0, "单词": "October", "释义": "十月", "其他拼写": null, "pos": "noun"}, {"序号": 5444, "词频": 0, "单词": "odds", "释义": "可能性", "其他拼写": null, "pos": "noun"}, {"序号": 5445, "词频": 0, "单词": "ought to", "释义": "应该", "其他拼写": null, "pos": "verb"}, {"序号": 5446, "词频": 0, "单词": "outskirts", "释义": "郊区", "其他拼写": null, "pos": "noun"}, {"序号": 5447, "词频": 0, "单词": "overt", "释义": "公开的、明显的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5448, "词频": 0, "单词": "owing to", "释义": "由于", "其他拼写": null, "pos": "prep_conj"}, {"序号": 5449, "词频": 0, "单词": "pants", "释义": "气喘吁吁", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5450, "词频": 0, "单词": "parasite", "释义": "寄生虫", "其他拼写": null, "pos": "noun"}, {"序号": 5451, "词频": 0, "单词": "peep", "释义": "偷看、窥视", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5452, "词频": 0, "单词": "persecute", "释义": "迫害", "其他拼写": null, "pos": "verb"}, {"序号": 5453, "词频": 0, "单词": "physics", "释义": "物理学", "其他拼写": null, "pos": "noun"}, {"序号": 5454, "词频": 0, "单词": "pistol", "释义": "手枪", "其他拼写": null, "pos": "noun"}, {"序号": 5455, "词频": 0, "单词": "plaintiff", "释义": "原告", "其他拼写": null, "pos": "noun"}, {"序号": 5456, "词频": 0, "单词": "politics", "释义": "政治、政治学", "其他拼写": null, "pos": "noun"}, {"序号": 5457, "词频": 0, "单词": "preceding", "释义": "在前的", "其他拼写": null, "pos": "verb"}, {"序号": 5458, "词频": 0, "单词": "proceedings", "释义": "诉讼", "其他拼写": null, "pos": "noun"}, {"序号": 5459, "词频": 0, "单词": "projector", "释义": "放映机", "其他拼写": null, "pos": "noun"}, {"序号": 5460, "词频": 0, "单词": "promising", "释义": "有前途的", "其他拼写": "promizing", "pos": "verb"}, {"序号": 5461, "词频": 0, "单词": "prophet", "释义": "先知", "其他拼写": null, "pos": "noun"}, {"序号": 5462, "词频": 0, "单词": "provided", "释义": "提供的", "其他拼写": null, "pos": "verb"}, {"序号": 5463, "词频": 0, "单词": "proximate", "释义": "最接近的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5464, "词频": 0, "单词": "qualitative", "释义": "质的、定性的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5465, "词频": 0, "单词": "quarantine", "释义": "检疫", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5466, "词频": 0, "单词": "quart", "释义": "夸脱", "其他拼写": null, "pos": "noun"}, {"序号": 5467, "词频": 0, "单词": "queer", "释义": "奇怪的、古怪的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5468, "词频": 0, "单词": "quilt", "释义": "被子", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5469, "词频": 0, "单词": "quiver", "释义": "颤抖", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5470, "词频": 0, "单词": "razor", "释义": "剃刀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5471, "词频": 0, "单词": "rectangle", "释义": "矩形", "其他拼写": null, "pos": "noun"}, {"序号": 5472, "词频": 0, "单词": "regarding", "释义": "关于", "其他拼写": null, "pos": "verb"}, {"序号": 5473, "词频": 0, "单词": "remains", "释义": "遗体", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5474, "词频": 0, "单词": "reptile", "释义": "爬行动物", "其他拼写": null, "pos": "noun"}, {"序号": 5475, "词频": 0, "单词": "resultant", "释义": "结果", "其他拼写": null, "pos": "noun"}, {"序号": 5476, "词频": 0, "单词": "rim", "释义": "边", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5477, "词频": 0, "单词": "salute", "释义": "致敬、敬礼", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5478, "词频": 0, "单词": "Saturday", "释义": "星期六", "其他拼写": null, "pos": "noun"}, {"序号": 5479, "词频": 0, "单词": "scissors", "释义": "剪刀", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5480, "词频": 0, "单词": "September", "释义": "九月", "其他拼写": null, "pos": "noun"}, {"序号": 5481, "词频": 0, "单词": "serial", "释义": "序列", "其他拼写": null, "pos": "noun"}, {"序号": 5482, "词频": 0, "单词": "sniff", "释义": "嗅、闻", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5483, "词频": 0, "单词": "so-called", "释义": "所谓的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5484, "词频": 0, "单词": "socialism", "释义": "社会主义", "其他拼写": null, "pos": "noun"}, {"序号": 5485, "词频": 0, "单词": "soluble", "释义": "可解决的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5486, "词频": 0, "单词": "species", "释义": "种类", "其他拼写": null, "pos": "noun"}, {"序号": 5487, "词频": 0, "单词": "spine", "释义": "脊柱", "其他拼写": null, "pos": "noun"}, {"序号": 5488, "词频": 0, "单词": "sponge", "释义": "海绵", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5489, "词频": 0, "单词": "sprinkle", "释义": "洒", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5490, "词频": 0, "单词": "squirrel", "释义": "松鼠", "其他拼写": null, "pos": "noun"}, {"序号": 5491, "词频": 0, "单词": "statistics", "释义": "统计", "其他拼写": null, "pos": "noun"}, {"序号": 5492, "词频": 0, "单词": "sting", "释义": "刺", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5493, "词频": 0, "单词": "stocking", "释义": "长筒袜", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5494, "词频": 0, "单词": "strenuous", "释义": "繁重的、费力的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5495, "词频": 0, "单词": "strife", "释义": "冲突", "其他拼写": null, "pos": "noun"}, {"序号": 5496, "词频": 0, "单词": "striking", "释义": "显著的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5497, "词频": 0, "单词": "sulphur", "释义": "硫", "其他拼写": "sulfur", "pos": "noun_verb"}, {"序号": 5498, "词频": 0, "单词": "Sunday", "释义": "星期日", "其他拼写": null, "pos": "noun"}, {"序号": 5499, "词频": 0, "单词": "surroundings", "释义": "环境", "其他拼写": null, "pos": "noun"}, {"序号": 5500, "词频": 0, "单词": "sympathise", "释义": "同情", "其他拼写": "sympathize", "pos": "verb"}, {"序号": 5501, "词频": 0, "单词": "tanker", "释义": "油轮", "其他拼写": null, "pos": "noun"}, {"序号": 5502, "词频": 0, "单词": "Thanksgiving", "释义": "感恩节", "其他拼写": null, "pos": "noun"}, {"序号": 5503, "词频": 0, "单词": "them", "释义": "他们", "其他拼写": null, "pos": "other"}, {"序号": 5504, "词频": 0, "单词": "thigh", "释义": "大腿", "其他拼写": null, "pos": "noun"}, {"序号": 5505, "词频": 0, "单词": "thorn", "释义": "刺", "其他拼写": null, "pos": "noun"}, {"序号": 5506, "词频": 0, "单词": "Thursday", "释义": "星期四", "其他拼写": null, "pos": "noun"}, {"序号": 5507, "词频": 0, "单词": "topic", "释义": "话题", "其他拼写": null, "pos": "noun"}, {"序号": 5508, "词频": 0, "单词": "towel", "释义": "毛巾", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5509, "词频": 0, "单词": "trousers", "释义": "裤子", "其他拼写": null, "pos": "noun"}, {"序号": 5510, "词频": 0, "单词": "Tuesday", "释义": "星期二", "其他拼写": null, "pos": "noun"}, {"序号": 5511, "词频": 0, "单词": "typhoon", "释义": "台风", "其他拼写": null, "pos": "noun"}, {"序号": 5512, "词频": 0, "单词": "underlying", "释义": "潜在的", "其他拼写": null, "pos": "verb"}, {"序号": 5513, "词频": 0, "单词": "up-to-date", "释义": "最新的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5514, "词频": 0, "单词": "us", "释义": "我们", "其他拼写": null, "pos": "noun"}, {"序号": 5515, "词频": 0, "单词": "used", "释义": "二手的", "其他拼写": null, "pos": "verb"}, {"序号": 5516, "词频": 0, "单词": "vein", "释义": "静脉", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5517, "词频": 0, "单词": "velvet", "释义": "天鹅绒", "其他拼写": null, "pos": "noun"}, {"序号": 5518, "词频": 0, "单词": "vinegar", "释义": "醋", "其他拼写": null, "pos": "noun"}, {"序号": 5519, "词频": 0, "单词": "waken", "释义": "醒来、唤醒", "其他拼写": null, "pos": "verb"}, {"序号": 5520, "词频": 0, "单词": "Wednesday", "释义": "星期三", "其他拼写": null, "pos": "noun"}, {"序号": 5521, "词频": 0, "单词": "well-known", "释义": "众所周知的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5522, "词频": 0, "单词": "wicked", "释义": "邪恶的", "其他拼写": null, "pos": "adj_adv"}, {"序号": 5523, "词频": 0, "单词": "wink", "释义": "眨眼", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5524, "词频": 0, "单词": "worse", "释义": "更坏、更坏的", "其他拼写": null, "pos": "noun"}, {"序号": 5525, "词频": 0, "单词": "worst", "释义": "最坏、最坏的", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5526, "词频": 0, "单词": "X-ray", "释义": "X射线", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5527, "词频": 0, "单词": "yours", "释义": "你的", "其他拼写": null, "pos": "other"}, {"序号": 5528, "词频": 0, "单词": "yourselves", "释义": "你们自己", "其他拼写": null, "pos": "other"}, {"序号": 5529, "词频": 0, "单词": "zigzag", "释义": "曲折、之字形", "其他拼写": null, "pos": "noun_verb"}, {"序号": 5530, "词频": 0, "单词": "zoom", "释义": "飞驰、急剧上涨", "其他拼写": null, "pos": "noun_verb"}]};
\ No newline at end of file
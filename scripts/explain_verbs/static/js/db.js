@@ -128,13 +128,15 @@ const DB = {
     /**
      * Save explanation to cache
      */
-    async saveToCache(mode, queryKey, content, imageUrl = null) {
+    async saveToCache(mode, queryKey, content, imageUrl = null, contentHtml = null) {
         try {
             await db.explanations.put({
                 mode,
                 query_key: queryKey,
                 content,
                 image_url: imageUrl,
+                // Server-rendered HTML of `content`; dropped whenever content is rewritten
+                content_html: contentHtml,
                 created_at: new Date().toISOString()
             });
         } catch (error) {
@@ -6,6 +6,9 @@
 const LocalAPI = {
     verbsData: null,
     legacyData: null,
+    legacyIndex: null, // Shard index of a sharded legacy build (legacy/index.json)
+    legacyShardLoads: new Map(), // shard number -> load promise
+    legacyRanks: null,
     originalFetch: null,
     DATA_VERSION: 5, // Increment this to force re-import of verbs and legacy data
 
@@ -31,6 +34,122 @@ const LocalAPI = {
         return null;
     },
 
+    /**
+     * Expand the columnar word list (window.NETEM_FULL_LIST_COLUMNS / netem_full_list.columns.json,
+     * see scripts/explain_verbs/word_columns.py) into the shape of netem_full_list.json:
+     * { "5530考研词汇词频排序表": [{ 序号, 词频, 单词, 释义, 其他拼写, pos }, ...] }
+     */
+    decodeWordColumns(columns) {
+        if (columns.version !== 1) throw new Error(`Unsupported word list columns version: ${columns.version}`);
+        const count = columns.count;
+        const sequence = Array.isArray(columns.sequence) ? columns.sequence : null;
+        const start = sequence ? 0 : columns.sequence.start;
+        let frequency = columns.frequency;
+        if (!frequency && columns.frequency_u32) {
+            const bytes = Uint8Array.from(atob(columns.frequency_u32), c => c.charCodeAt(0));
+            const view = new DataView(bytes.buffer);
+            frequency = new Array(count);
+            for (let i = 0; i < count; i++) frequency[i] = view.getUint32(i * 4, true);
+        }
+        const variants = new Map();
+        columns.variant.index.forEach((row, i) => variants.set(row, columns.variant.value[i]));
+        const POS_CODES = '0123456789abcdefghijklmnopqrstuvwxyz';
+        const posValues = columns.pos.values;
+        const codes = columns.pos.codes;
+
+        const list = new Array(count);
+        for (let i = 0; i < count; i++) {
+            list[i] = {
+                "序号": sequence ? sequence[i] : start + i,
+                "词频": frequency[i],
+                "单词": columns.word[i],
+                "释义": columns.definition[i],
+                "其他拼写": variants.has(i) ? variants.get(i) : null,
+                "pos": posValues[POS_CODES.indexOf(codes[i])]
+            };
+        }
+        return { [columns.list]: list };
+    },
+
+    /**
+     * Full word list, decoded from whichever form is available:
+     * inline columnar JS > netem_full_list.columns.json > netem_full_list.json
+     */
+    async loadFullList() {
+        if (window.NETEM_FULL_LIST_COLUMNS) return this.decodeWordColumns(window.NETEM_FULL_LIST_COLUMNS);
+        for (const filename of ['netem_full_list.columns.json', 'netem_full_list.json']) {
+            const response = await this.fetchResource(filename);
+            if (response) {
+                const data = await response.json();
+                return data.format === 'netem-columns' ? this.decodeWordColumns(data) : data;
+            }
+        }
+        return null;
+    },
+
+    /**
+     * Shard of the legacy data that holds a word (see scripts/explain_verbs/legacy_shards.py):
+     * shards cover ranges of the word's 序号, and words outside the list live in the last one
+     */
+    legacyShardFor(word) {
+        const shards = this.legacyIndex.shards;
+        if (!this.legacyRanks && this.verbsData && this.verbsData.length) {
+            this.legacyRanks = new Map();
+            for (const v of this.verbsData) {
+                const rank = parseInt(v['序号'] || v.sequence || 0);
+                for (const spelling of [v['单词'] || v.word, v['其他拼写'] || v.alternative_spelling]) {
+                    const key = (spelling || '').trim().toLowerCase();
+                    if (key && rank && !(this.legacyRanks.get(key) <= rank)) this.legacyRanks.set(key, rank);
+                }
+            }
+        }
+        let key = word.toLowerCase();
+        if (key.endsWith(':verb')) key = key.substring(0, key.length - 5);
+        const rank = this.legacyRanks ? this.legacyRanks.get(key) : undefined;
+        if (!rank) return shards.length - 1;
+        const i = shards.findIndex(shard => shard.ranks[1] === null || rank <= shard.ranks[1]);
+        return i === -1 ? shards.length - 1 : i;
+    },
+
+    /**
+     * Fetch one legacy shard and merge it into legacyData (once; concurrent callers share the load)
+     */
+    loadLegacyShard(i) {
+        if (!this.legacyIndex || !this.legacyIndex.shards[i]) return Promise.resolve();
+        if (!this.legacyShardLoads.has(i)) {
+            const load = (async () => {
+                const resp = await this.fetchResource(this.legacyIndex.shards[i].file);
+                if (!resp) throw new Error(`legacy shard ${i} not found`);
+                const shard = await resp.json();
+                this.legacyData = Object.assign(this.legacyData || {}, shard);
+                console.log(`LocalAPI: Loaded legacy shard ${i} (${Object.keys(shard).length} records).`);
+            })().catch(e => {
+                this.legacyShardLoads.delete(i);
+                console.warn(`LocalAPI: Failed to load legacy shard ${i}`, e);
+            });
+            this.legacyShardLoads.set(i, load);
+        }
+        return this.legacyShardLoads.get(i);
+    },
+
+    async ensureLegacyFor(word) {
+        if (this.legacyIndex) await this.loadLegacyShard(this.legacyShardFor(word));
+    },
+
+    async loadAllLegacy() {
+        if (this.legacyIndex) await Promise.all(this.legacyIndex.shards.map((_, i) => this.loadLegacyShard(i)));
+    },
+
+    /**
+     * Use a sharded legacy build: eagerData holds the index's eager (high-frequency) shards
+     */
+    useLegacyIndex(index, eagerData) {
+        this.legacyIndex = index;
+        this.legacyData = eagerData || {};
+        for (let i = 0; i < (index.eager || 0); i++) this.legacyShardLoads.set(i, Promise.resolve());
+        console.log(`LocalAPI: Loaded ${Object.keys(this.legacyData).length} of ${index.total} legacy records (${index.shards.length - (index.eager || 0)} shards on demand).`);
+    },
+
     /**
      * Initialize the local API by loading data
      */
@@ -45,10 +164,24 @@ const LocalAPI = {
             await this.syncFromBackend();
 
             // Load legacy data for fallback
-            // Priority: Window Global (Inline JS) > Fetch Resource
-            if (window.NETEM_LEGACY_DATA) {
+            // Priority: Sharded inline JS > Window Global (Inline JS) > Shard index > Fetch Resource
+            let legacyIndexResp = null;
+            if (window.NETEM_LEGACY_INDEX) {
+                this.useLegacyIndex(window.NETEM_LEGACY_INDEX, window.NETEM_LEGACY_DATA);
+            } else if (window.NETEM_LEGACY_DATA) {
                 this.legacyData = window.NETEM_LEGACY_DATA;
                 console.log(`LocalAPI: Loaded ${Object.keys(this.legacyData).length} legacy records from inline JS.`);
+            } else if ((legacyIndexResp = await this.fetchResource('legacy/index.json'))) {
+                try {
+                    const index = await legacyIndexResp.json();
+                    this.useLegacyIndex(index, {});
+                    await Promise.all(index.shards.slice(0, index.eager || 0).map((_, i) => {
+                        this.legacyShardLoads.delete(i);
+                        return this.loadLegacyShard(i);
+                    }));
+                } catch (indexErr) {
+                    console.error("LocalAPI: JSON parse error for legacy/index.json", indexErr);
+                }
             } else {
                 const legacyResp = await this.fetchResource('legacy_data.json');
                 if (legacyResp) {
@@ -168,19 +301,11 @@ const LocalAPI = {
                             
                             let rawData = null;
                             
-                            // Priority: Window Global (Inline JS) > Fetch Resource
-                            if (window.NETEM_FULL_LIST) {
-                                console.log("LocalAPI: Using inline NETEM_FULL_LIST.");
-                                rawData = window.NETEM_FULL_LIST;
-                            } else {
-                                try {
-                                    const response = await this.fetchResource('netem_full_list.json');
-                                    if (response) {
-                                        rawData = await response.json();
-                                    }
-                                } catch (fetchErr) {
-                                    console.error("LocalAPI: Failed to fetch netem_full_list", fetchErr);
-                                }
+                            // Priority: Window Global (Inline JS, columnar first) > Fetch Resource
+                            try {
+                                rawData = await this.loadFullList();
+                            } catch (fetchErr) {
+                                console.error("LocalAPI: Failed to load netem_full_list", fetchErr);
                             }
 
                             if (rawData) {
@@ -246,14 +371,9 @@ const LocalAPI = {
 
                 if (!loadedFromDb) {
                     // Fallback to inline JS or fetch
-                    if (window.NETEM_FULL_LIST) {
-                        this.verbsData = window.NETEM_FULL_LIST["5530考研词汇词频排序表"] || [];
-                    } else {
-                        const response = await this.fetchResource('netem_full_list.json');
-                        if (response) {
-                            const rawData = await response.json();
-                            this.verbsData = rawData["5530考研词汇词频排序表"] || [];
-                        }
+                    const rawData = await this.loadFullList();
+                    if (rawData) {
+                        this.verbsData = rawData["5530考研词汇词频排序表"] || [];
                     }
                 }
             }
@@ -269,17 +389,27 @@ const LocalAPI = {
         const fetchFn = this.originalFetch || window.fetch;
         try {
             console.log("LocalAPI: Checking for data sync from backend...");
-            const response = await fetchFn('/api/sync/all_explanations');
+            // Server-rendered HTML roughly doubles the payload, so the full sync only pulls it when
+            // settings.sync_html is on. Otherwise a card gets it with its next backend lookup
+            // (include_html) and renders its Markdown until then.
+            const settings = JSON.parse(localStorage.getItem('app_settings') || '{}');
+            const withHtml = settings.sync_html === true || settings.sync_html === 'true';
+            const response = await fetchFn('/api/sync/all_explanations' + (withHtml ? '?html=1' : ''));
             if (response.ok) {
                 const data = await response.json();
                 if (data && Array.isArray(data) && data.length > 0) {
                     console.log(`LocalAPI: Syncing ${data.length} records from backend...`);
+                    // HTML fetched earlier stays valid while the content it was rendered from is unchanged
+                    const existing = withHtml ? [] : await window.db.explanations.bulkGet(data.map(item => [item.mode, item.query_key]));
                     // Prepare data for bulkPut
-                    const records = data.map(item => ({
+                    const records = data.map((item, i) => ({
                         mode: item.mode,
                         query_key: item.query_key,
                         content: item.content,
                         image_url: item.image_url,
+                        content_html: withHtml
+                            ? item.content_html || null
+                            : (existing[i] && existing[i].content === item.content ? existing[i].content_html || null : null),
                         created_at: item.created_at || new Date().toISOString()
                     }));
                     await window.db.explanations.bulkPut(records);
@@ -396,15 +526,10 @@ const LocalAPI = {
                         
                         // 2. Fallback to JSON if DB failed or empty
                         if (!this.verbsData || this.verbsData.length === 0) {
-                             if (window.NETEM_FULL_LIST) {
-                                this.verbsData = window.NETEM_FULL_LIST["5530考研词汇词频排序表"] || [];
-                            } else {
-                                const response = await this.fetchResource('netem_full_list.json');
-                                if (response) {
-                                    const rawData = await response.json();
-                                    this.verbsData = rawData["5530考研词汇词频排序表"] || [];
-                                }
-                            }
+                             const rawData = await this.loadFullList();
+                             if (rawData) {
+                                 this.verbsData = rawData["5530考研词汇词频排序表"] || [];
+                             }
                         }
                     } catch (e) {
                         console.error("Failed to load verbs data in handle:", e);
@@ -495,6 +620,9 @@ const LocalAPI = {
                 const allProgress = await window.db.learning_progress.toArray();
                 const allCheckins = await window.db.checkins.toArray();
                 
+                // Sharded builds: filtering needs every shard, not just the eager ones
+                await this.loadAllLegacy();
+
                 // Filter out legacy data (from default library) to reduce export size
                 const filteredExplanations = allExplanations.filter(exp => {
                     // Only filter 'single' word explanations
@@ -714,6 +842,7 @@ const LocalAPI = {
         if (mode === 'single') {
             const results = [];
             const images = {};
+            const htmls = {};
             
             for (const verb of verbList) {
                 // Use original case as key, fallback to lowercase if not found?
@@ -733,7 +862,7 @@ const LocalAPI = {
                             const response = await this.originalFetch('/api/explain', {
                                 method: 'POST',
                                 headers: { 'Content-Type': 'application/json' },
-                                body: JSON.stringify({ verbs: verb, mode: 'single', refresh: false })
+                                body: JSON.stringify({ verbs: verb, mode: 'single', refresh: false, include_html: true })
                             });
                             if (response.ok) {
                                 const backendResult = await response.json();
@@ -741,14 +870,16 @@ const LocalAPI = {
                                     // Extract first content and first image
                                     const content = backendResult.result;
                                     const imageUrl = backendResult.images ? Object.values(backendResult.images)[0] : null;
+                                    const contentHtml = backendResult.html ? (Object.values(backendResult.html)[0] || null) : null;
                                     
                                     cachedData = {
                                         content: content,
-                                        image_url: imageUrl
+                                        image_url: imageUrl,
+                                        content_html: contentHtml
                                     };
                                     
                                     // Save to IndexedDB so it's there next time
-                                    await DB.saveToCache('single', key, content, imageUrl);
+                                    await DB.saveToCache('single', key, content, imageUrl, contentHtml);
                                     console.log(`LocalAPI: Saved backend result for ${verb} to IndexedDB.`);
                                 }
                             }
@@ -758,6 +889,10 @@ const LocalAPI = {
                     }
 
                     // Fallback to memory-loaded legacy data if still not found
+                    // (sharded builds fetch the shard for this word's frequency rank first)
+                    if (!cachedData && this.legacyIndex) {
+                        await this.ensureLegacyFor(key);
+                    }
                     if (!cachedData && this.legacyData && this.legacyData[key]) {
                         console.log(`LocalAPI: Found ${verb} in legacy fallback data.`);
                         cachedData = {
@@ -839,16 +974,21 @@ const LocalAPI = {
                     // Case B: We already had content but no image_url in cache
                     console.log(`LocalAPI: Updating cache with image URL for ${verb}`);
                     // Use existing content if any, otherwise save with null content (to be filled later by analyzeVerbs)
-                    await DB.saveToCache('single', key, content, imageUrl);
+                    await DB.saveToCache('single', key, content, imageUrl, cachedData?.content_html || null);
                 }
                 
                 results.push(content);
                 if (imageUrl) images[verb] = imageUrl;
+                // Pre-rendered HTML is only valid for the cached text it was rendered from
+                if (cachedData && cachedData.content_html && content === cachedData.content) {
+                    htmls[verb] = cachedData.content_html;
+                }
             }
             
             return {
                 result: results.join('\n\n---\n\n'),
-                images: images
+                images: images,
+                html: htmls
             };
         } else {
             // mode === 'list'
@@ -0,0 +1,246 @@
+"""
+Incremental dev -> dist sync (sync_from_dev.py) and its read-only check mode (compare_builds.py).
+
+The mirrored set is the dev template, the static subfolders and the top-level data files
+(plus their content-hashed copies from asset_build.py). For every file a manifest keeps
+(size, mtime_ns, sha256), on both sides, in dist/.sync-manifest.json. A file whose size and
+mtime match its manifest row is not re-read, so a sync where nothing changed only stats the
+tree. Files that do need hashing are hashed in a thread pool (hashlib releases the GIL on
+large buffers; big files are mmapped). Changed files are copied to a temp name and renamed
+into place, and files in the mirrored folders that no longer exist in dev are deleted.
+
+    python sync_engine.py            # sync, print the diff
+    python sync_engine.py --check    # compare only, write nothing (exit 1 on differences)
+"""
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    from asset_build import HASH_LENGTH
+except ImportError:
+    from scripts.explain_verbs.asset_build import HASH_LENGTH
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+DEV_ROOT = os.path.join(REPO_ROOT, "scripts", "explain_verbs")
+DEV_STATIC = os.path.join(DEV_ROOT, "static")
+DIST_ROOT = os.path.join(REPO_ROOT, "dist")
+DIST_STATIC = os.path.join(DIST_ROOT, "static")
+MANIFEST_PATH = os.path.join(DIST_ROOT, ".sync-manifest.json")
+
+SUBFOLDERS = ["js", "css", "img", "lib", "legacy"]
+DATA_FILES = ["legacy_data.json", "netem_full_list.json", "netem_full_list.columns.json", "manifest.json", "sw.js", "asset-manifest.json"]
+# Hashed copies of the data files (and their .gz/.br) next to them in static/
+HASHED_DATA_RE = re.compile(r"^[\w.-]+\.[0-9a-f]{%d}\.\w+(\.gz|\.br)?$" % HASH_LENGTH)
+BUFFER_SIZE = 1 << 20
+MMAP_THRESHOLD = 4 << 20
+TEMP_SUFFIX = ".sync-tmp"
+
+
+class Tree(NamedTuple):
+    """A mirrored folder: files under src for which include(rel) holds are copied to dst."""
+    src: str
+    dst: str
+    include: Callable[[str], bool]
+    recursive: bool = True
+
+
+class Change(NamedTuple):
+    action: str  # "added", "updated", "deleted", "unchanged"
+    path: str    # destination path relative to the repo root
+    size: int
+
+
+def default_plan() -> Tuple[List[Tuple[str, str]], List[Tree]]:
+    """(single files, mirrored trees) of the dev -> dist sync."""
+    files = [
+        (os.path.join(DEV_ROOT, "templates", "index.html"), os.path.join(DIST_ROOT, "index.html")),
+        # sw.js also sits at the dist root for scope reasons
+        (os.path.join(DEV_STATIC, "sw.js"), os.path.join(DIST_ROOT, "sw.js")),
+    ]
+    trees = [Tree(os.path.join(DEV_STATIC, folder), os.path.join(DIST_STATIC, folder), lambda rel: True) for folder in SUBFOLDERS]
+    trees.append(Tree(DEV_STATIC, DIST_STATIC, lambda rel: rel in DATA_FILES or bool(HASHED_DATA_RE.match(rel)), recursive=False))
+    return files, trees
+
+
+def _walk(root: str, include: Callable[[str], bool], recursive: bool) -> Dict[str, os.stat_result]:
+    found: Dict[str, os.stat_result] = {}
+    if not os.path.isdir(root):
+        return found
+    stack = [""]
+    while stack:
+        rel_dir = stack.pop()
+        with os.scandir(os.path.join(root, rel_dir)) as entries:
+            for entry in entries:
+                rel = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(rel)
+                elif entry.is_file() and not entry.name.endswith(TEMP_SUFFIX) and include(rel.replace(os.sep, "/")):
+                    found[rel] = entry.stat()
+    return found
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+        else:
+            for block in iter(lambda: f.read(BUFFER_SIZE), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+class SyncEngine:
+    def __init__(self, manifest_path: str = MANIFEST_PATH, root: str = REPO_ROOT, workers: Optional[int] = None):
+        self.manifest_path = manifest_path
+        self.root = root
+        self.workers = workers or min(8, (os.cpu_count() or 1) + 1)
+        self.manifest: Dict[str, List] = {}
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, "r", encoding="utf-8") as f:
+                    self.manifest = json.load(f).get("files", {})
+            except (OSError, ValueError):
+                self.manifest = {}
+        self.hashed = 0
+
+    def _key(self, path: str) -> str:
+        return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    def _hashes(self, stats: Dict[str, os.stat_result]) -> Dict[str, str]:
+        """sha256 per path, from the manifest when size and mtime are unchanged."""
+        result, pending = {}, []
+        for path, st in stats.items():
+            cached = self.manifest.get(self._key(path))
+            if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                result[path] = cached[2]
+            else:
+                pending.append(path)
+        if pending:
+            self.hashed += len(pending)
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for path, digest in zip(pending, pool.map(file_sha256, pending)):
+                    result[path] = digest
+        for path, st in stats.items():
+            self.manifest[self._key(path)] = [st.st_size, st.st_mtime_ns, result[path]]
+        return result
+
+    def _pairs(self, files, trees) -> Tuple[List[Tuple[str, str]], List[str]]:
+        """(source, destination) pairs to mirror, and orphaned destination files."""
+        pairs, orphans = [], []
+        for src, dst in files:
+            if os.path.isfile(src):
+                pairs.append((src, dst))
+        for tree in trees:
+            sources = _walk(tree.src, tree.include, tree.recursive)
+            targets = _walk(tree.dst, tree.include, tree.recursive)
+            pairs.extend((os.path.join(tree.src, rel), os.path.join(tree.dst, rel)) for rel in sorted(sources))
+            orphans.extend(os.path.join(tree.dst, rel) for rel in sorted(targets) if rel not in sources)
+        return pairs, orphans
+
+    def run(self, files=None, trees=None, check: bool = False) -> List[Change]:
+        """Sync (or with check=True only compare) the plan; returns one Change per file."""
+        if files is None or trees is None:
+            default_files, default_trees = default_plan()
+            files = default_files if files is None else files
+            trees = default_trees if trees is None else trees
+        pairs, orphans = self._pairs(files, trees)
+
+        stats = {}
+        for src, dst in pairs:
+            stats[src] = os.stat(src)
+            if os.path.exists(dst):
+                stats[dst] = os.stat(dst)
+        # Same size + same mtime on both sides as recorded: no hashing at all
+        digests = self._hashes(stats)
+
+        changes: List[Change] = []
+        for src, dst in pairs:
+            size = stats[src].st_size
+            if dst not in stats:
+                action = "added"
+            elif stats[dst].st_size == size and digests[dst] == digests[src]:
+                action = "unchanged"
+            else:
+                action = "updated"
+            if action != "unchanged" and not check:
+                self._copy(src, dst)
+                st = os.stat(dst)
+                self.manifest[self._key(dst)] = [st.st_size, st.st_mtime_ns, digests[src]]
+            changes.append(Change(action, self._key(dst), size))
+        for path in orphans:
+            size = os.path.getsize(path)
+            if not check:
+                os.remove(path)
+                self.manifest.pop(self._key(path), None)
+            changes.append(Change("deleted", self._key(path), size))
+
+        if not check:
+            self._save_manifest()
+        return changes
+
+    @staticmethod
+    def _copy(src: str, dst: str):
+        """Copy to a temp name next to dst and rename over it, so readers never see half a file."""
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        tmp = dst + TEMP_SUFFIX
+        shutil.copy2(src, tmp)
+        os.replace(tmp, dst)
+
+    def _save_manifest(self):
+        live = {key: row for key, row in self.manifest.items() if os.path.exists(os.path.join(self.root, key))}
+        tmp = self.manifest_path + TEMP_SUFFIX
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "files": live}, f, indent=0, sort_keys=True)
+        os.replace(tmp, self.manifest_path)
+
+
+def print_report(changes: List[Change], elapsed: float, hashed: int, check: bool = False, verbose: bool = False):
+    labels = {
+        "added": "❌ [MISSING IN DIST]" if check else "➕ [ADDED]  ",
+        "updated": "❌ [DIFF]   " if check else "✏️ [UPDATED]",
+        "deleted": "❌ [ONLY IN DIST]" if check else "🗑️ [DELETED]",
+        "unchanged": "✅ [MATCH]  ",
+    }
+    for change in changes:
+        if change.action != "unchanged" or verbose:
+            print(f"{labels[change.action]} {change.path} ({change.size} bytes)")
+    counts = {action: sum(1 for c in changes if c.action == action) for action in labels}
+    moved = sum(c.size for c in changes if c.action in ("added", "updated"))
+    verb = "Compared" if check else "Synced"
+    print(f"{verb} {len(changes)} files in {elapsed * 1000:.1f} ms: "
+          f"{counts['added']} added, {counts['updated']} updated, {counts['deleted']} deleted, {counts['unchanged']} unchanged"
+          f" ({moved} bytes {'differ' if check else 'copied'}, {hashed} files hashed)")
+
+
+def main(argv=None, check: bool = False) -> int:
+    parser = argparse.ArgumentParser(description="Incremental dev -> dist sync.")
+    parser.add_argument("--check", action="store_true", default=check, help="Only compare dev and dist; write nothing")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Also list unchanged files")
+    parser.add_argument("--rehash", action="store_true", help="Ignore the manifest and hash every file")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    engine = SyncEngine()
+    if args.rehash:
+        engine.manifest = {}
+    changes = engine.run(check=args.check)
+    print_report(changes, time.perf_counter() - start, engine.hashed, args.check, args.verbose)
+    return 1 if args.check and any(c.action != "unchanged" for c in changes) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+import gzip
+import os
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from asset_build import finalize, load_manifest, publish
+
+
+def test_publish_writes_hashed_compressed_copy_and_prunes_old_ones():
+    with tempfile.TemporaryDirectory() as tmp:
+        first = publish(tmp, "js/data_full_list_columns.js", b"window.NETEM_FULL_LIST_COLUMNS = {};")
+        hashed = os.path.join(tmp, first["file"])
+        assert first["file"].startswith("js/data_full_list_columns.") and first["file"].endswith(".js")
+        with open(os.path.join(tmp, "js", "data_full_list_columns.js"), "rb") as f:
+            assert f.read() == b"window.NETEM_FULL_LIST_COLUMNS = {};"
+        with gzip.open(hashed + ".gz") as f:
+            assert f.read() == b"window.NETEM_FULL_LIST_COLUMNS = {};"
+
+        # Same content: same name, nothing rewritten
+        mtime = os.path.getmtime(hashed)
+        assert publish(tmp, "js/data_full_list_columns.js", b"window.NETEM_FULL_LIST_COLUMNS = {};") == first
+        assert os.path.getmtime(hashed) == mtime
+
+        second = publish(tmp, "js/data_full_list_columns.js", b"window.NETEM_FULL_LIST_COLUMNS = {\"a\": 1};")
+        assert second["file"] != first["file"]
+        assert not os.path.exists(hashed) and not os.path.exists(hashed + ".gz")
+        assert sorted(os.listdir(os.path.join(tmp, "js"))) == sorted(
+            ["data_full_list_columns.js", os.path.basename(second["file"])] + [os.path.basename(second["file"]) + s for s in ((".gz", ".br") if "br" in second else (".gz",))]
+        )
+        assert load_manifest(tmp)["assets"] == {"js/data_full_list_columns.js": second}
+
+
+def test_finalize_rewrites_html_and_stamps_service_worker():
+    with tempfile.TemporaryDirectory() as tmp:
+        html = os.path.join(tmp, "index.html")
+        sw = os.path.join(tmp, "sw.js")
+        with open(html, "w", encoding="utf-8") as f:
+            f.write('<script src="static/js/data_full_list_columns.js" defer></script>\n<script src="static/js/db.js"></script>')
+        with open(sw, "w", encoding="utf-8") as f:
+            f.write("const ASSET_MANIFEST_VERSION = '';\n")
+
+        static = os.path.join(tmp, "static")
+        entry = publish(static, "js/data_full_list_columns.js", b"one")
+        manifest = finalize(static, [html], [sw])
+        entry = publish(static, "js/data_full_list_columns.js", b"two")
+        manifest = finalize(static, [html], [sw])
+
+        with open(html, encoding="utf-8") as f:
+            assert f.read() == f'<script src="static/{entry["file"]}" defer></script>\n<script src="static/js/db.js"></script>'
+        with open(sw, encoding="utf-8") as f:
+            assert f.read() == f"const ASSET_MANIFEST_VERSION = '{manifest['version']}';\n"
+
+
+def test_app_renders_hashed_names_when_serving():
+    import shutil
+    from fastapi.testclient import TestClient
+    import app
+
+    with tempfile.TemporaryDirectory() as tmp:
+        shutil.copy(os.path.join(app.static_dir, "sw.js"), os.path.join(tmp, "sw.js"))
+        saved = app.static_dir
+        app.static_dir = tmp
+        try:
+            client = TestClient(app.app)
+            # No manifest yet: plain names, empty version
+            assert 'src="static/js/data_full_list_columns.js"' in client.get("/").text
+            assert "const ASSET_MANIFEST_VERSION = '';" in client.get("/sw.js").text
+
+            entry = publish(tmp, "js/data_full_list_columns.js", b"window.NETEM_FULL_LIST_COLUMNS = {};")
+            publish(tmp, "netem_full_list.json", b"{}", precache=False)
+            manifest = load_manifest(tmp)
+            assert f'src="static/{entry["file"]}"' in client.get("/").text
+            assert f"const ASSET_MANIFEST_VERSION = '{manifest['version']}';" in client.get("/sw.js").text
+            assert manifest["assets"]["netem_full_list.json"]["precache"] is False
+        finally:
+            app.static_dir = saved
+        # Nothing tracked was rewritten
+        with open(os.path.join(saved, "sw.js"), encoding="utf-8") as f:
+            assert "const ASSET_MANIFEST_VERSION = '';" in f.read()
@@ -0,0 +1,110 @@
+import os
+import sys
+import json
+import sqlite3
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from batch_requests import build_request, write_request_file, read_results, ingest_results, split_custom_id
+from prompt_registry import get_system_prompt, prompt_hash
+from markdown_utils import clean_markdown
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+RESULTS_FIXTURE = os.path.join(FIXTURES_DIR, "batch_results.jsonl")
+
+
+def make_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE explanations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            mode TEXT NOT NULL,
+            query_key TEXT NOT NULL,
+            content TEXT NOT NULL,
+            image_url TEXT,
+            image_dicebear TEXT,
+            image_pollinations TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(mode, query_key)
+        )
+    ''')
+    conn.commit()
+    return conn
+
+
+def test_request_uses_pos_prompt():
+    req = build_request(" Abandon ", "verb", "gpt-4o")
+    assert req["custom_id"] == "single:abandon#" + prompt_hash("verb")
+    assert req["url"] == "/v1/chat/completions"
+    assert req["body"]["model"] == "gpt-4o"
+    assert req["body"]["messages"][0]["content"] == get_system_prompt("verb")
+    assert req["body"]["messages"][1]["content"] == "请解析\"Abandon\""
+
+    assert build_request("of", "prep_conj", "m")["body"]["messages"][0]["content"] == get_system_prompt("prep_conj")
+    assert build_request("idea", "noun", "m")["body"]["messages"][0]["content"] == get_system_prompt("noun")
+
+
+def test_request_id_uses_the_cache_key():
+    # Inflections and variant spellings are ingested under the list entry, as online generation stores them
+    req = build_request("Went", "verb", "m")
+    assert split_custom_id(req["custom_id"])[1] == "go"
+    assert req["body"]["messages"][1]["content"] == "请解析\"Went\""
+    assert split_custom_id(build_request("colours", "noun", "m")["custom_id"])[1] == "color"
+
+
+def test_write_request_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "requests.jsonl")
+        count = write_request_file(path, [("run", "verb"), ("quick", "adj_adv")], "gpt-4o-mini")
+        with open(path, encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+    assert count == 2
+    assert [line["custom_id"].split("#")[0] for line in lines] == ["single:run", "single:quick"]
+    assert lines[1]["body"]["messages"][0]["content"] == get_system_prompt("adj_adv")
+
+
+def test_read_results_fixture():
+    results = list(read_results(RESULTS_FIXTURE))
+    assert [r[0] for r in results] == ["single:abandon#3f1c9a0b7d2e4c51", "single:run", "single:borrow", "single:lend"]
+    assert results[0][1] is not None and results[0][2] is None
+    assert results[2][1] is None and "rate_limit" in results[2][2]
+    assert results[3][2] == "HTTP 500"
+    assert results[0][3] == "gpt-4o-mini-2024-07-18"
+    assert split_custom_id("compare:a,b") == ("compare", "a,b", None)
+    assert split_custom_id("run") == ("single", "run", None)
+    assert split_custom_id("single:run#abc123") == ("single", "run", "abc123")
+
+
+def test_ingest_results_fixture():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_db(os.path.join(tmp, "verbs.db"))
+        # Existing row keeps its pollinations image when the ingest adds a DiceBear one
+        conn.execute("INSERT INTO explanations (mode, query_key, content, image_url, image_pollinations) VALUES ('single', 'run', 'old', 'https://image.pollinations.ai/x', 'https://image.pollinations.ai/x')")
+        conn.commit()
+
+        stats = ingest_results(conn, RESULTS_FIXTURE, image_url_for=lambda k: f"https://api.dicebear.com/9.x/icons/svg?seed={k}")
+        rows = {r[0]: r[1:] for r in conn.execute("SELECT query_key, content, image_dicebear, image_pollinations, prompt_hash, model FROM explanations")}
+        conn.close()
+
+    assert stats["saved"] == 2
+    assert stats["failed_ids"] == ["single:borrow", "single:lend"]
+
+    raw = next(r[1] for r in read_results(RESULTS_FIXTURE) if r[0].startswith("single:abandon"))
+    assert rows["abandon"][0] == clean_markdown(raw)
+    assert "```" not in rows["abandon"][0]
+    assert not rows["run"][0].startswith("以下是解析")
+    assert rows["run"][1].endswith("seed=run")
+    assert rows["run"][2] == "https://image.pollinations.ai/x"
+    # Provenance comes from the custom_id hash and the response body's model
+    assert rows["abandon"][3:] == ("3f1c9a0b7d2e4c51", "gpt-4o-mini-2024-07-18")
+    assert rows["run"][3:] == (None, None)
+
+
+if __name__ == "__main__":
+    test_request_uses_pos_prompt()
+    test_write_request_file()
+    test_read_results_fixture()
+    test_ingest_results_fixture()
+    print("All batch request tests passed.")
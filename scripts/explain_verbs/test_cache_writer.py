@@ -0,0 +1,88 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from cache_writer import CacheWriter
+
+
+def make_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE explanations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            mode TEXT NOT NULL,
+            query_key TEXT NOT NULL,
+            content TEXT NOT NULL,
+            image_url TEXT,
+            image_dicebear TEXT,
+            image_pollinations TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(mode, query_key)
+        )
+    ''')
+    conn.commit()
+    return conn
+
+
+def stored(db_path):
+    conn = sqlite3.connect(db_path)
+    try:
+        return {row[0]: row[1] for row in conn.execute("SELECT query_key, content FROM explanations")}
+    finally:
+        conn.close()
+
+
+def test_batches_and_flush_on_close():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "verbs.db")
+        make_db(db_path).close()
+        batches = []
+        writer = CacheWriter(db_path, batch_size=2, flush_interval=60,
+                             after_write=lambda conn, rows: batches.append([row[1] for row in rows]))
+        with writer:
+            for word in ("a", "b", "c", "d", "e"):
+                writer.put("single", word, f"content {word}", prompt_hash="h1", model="m")
+        # Two full batches, then the remainder on close; after_write sees each batch
+        assert batches == [["a", "b"], ["c", "d"], ["e"]]
+        assert (writer.written, writer.commits, writer.failed) == (5, 3, 0)
+        assert stored(db_path) == {word: f"content {word}" for word in "abcde"}
+        try:
+            writer.put("single", "f", "late")
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("put() after close")
+
+
+def test_flush_interval_commits_a_partial_batch():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "verbs.db")
+        make_db(db_path).close()
+        with CacheWriter(db_path, batch_size=100, flush_interval=0.05) as writer:
+            writer.put("single", "a", "content a")
+            deadline = time.monotonic() + 5
+            while writer.written == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert writer.written == 1 and stored(db_path) == {"a": "content a"}
+
+
+def test_failed_batch_is_rolled_back_and_writer_continues():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "verbs.db")
+        make_db(db_path).close()
+
+        def after_write(conn, rows):
+            if any(row[1] == "bad" for row in rows):
+                raise ValueError("boom")
+
+        with CacheWriter(db_path, batch_size=2, flush_interval=60, after_write=after_write) as writer:
+            for word in ("ok", "bad", "later"):
+                writer.put("single", word, f"content {word}")
+        # The failing group is rolled back and retried row by row: only "bad" is lost
+        assert (writer.written, writer.failed, writer.commits) == (2, 1, 2)
+        assert stored(db_path) == {"ok": "content ok", "later": "content later"}
@@ -0,0 +1,94 @@
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import content_codec
+from cache_writer import ensure_generation_columns, write_explanations
+from html_render import render_html
+from section_store import backfill_sections, fetch_sections
+from test_batch_requests import make_db
+from test_quality import COMPLETE
+
+
+def test_rows_round_trip_through_dictionary():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_db(os.path.join(tmp, "verbs.db"))
+        ensure_generation_columns(conn)
+        write_explanations(conn, [("single", "abandon", COMPLETE, None)])
+        # No dictionary yet: stored as plain text
+        assert conn.execute("SELECT content FROM explanations").fetchone()[0] == COMPLETE
+
+        version = content_codec.train(conn)
+        assert content_codec.recode_all(conn, version) == 1
+        stored = conn.execute("SELECT content FROM explanations").fetchone()[0]
+        assert content_codec.is_compressed(stored) and len(stored) < len(COMPLETE.encode("utf-8"))
+        assert content_codec.decode(conn, stored) == COMPLETE
+        html = conn.execute("SELECT content_html FROM explanations").fetchone()[0]
+        assert html is None or content_codec.decode(conn, html) == render_html(COMPLETE)
+
+        # Writers compress once a dictionary exists, and readers see text
+        other = COMPLETE.replace("abandon", "abolish")
+        write_explanations(conn, [("single", "abolish", other, None)])
+        stored = conn.execute("SELECT content FROM explanations WHERE query_key = 'abolish'").fetchone()[0]
+        assert content_codec.is_compressed(stored)
+        conn.execute("DELETE FROM explanation_sections")
+        assert backfill_sections(conn) == 2
+        assert fetch_sections(conn, "single", ["abolish"], ["title"])["abolish"]["title"].startswith("### abolish")
+
+        assert content_codec.recode_all(conn, None) == 2
+        assert conn.execute("SELECT content FROM explanations WHERE query_key = 'abolish'").fetchone()[0] == other
+        conn.close()
+
+
+def test_trained_dictionary_fits_zlib_window():
+    dictionary = content_codec.train_dictionary([COMPLETE] * 3, size=256)
+    assert 0 < len(dictionary) <= 256
+    assert "- **词源**".encode("utf-8") in dictionary
+
+
+def test_replaced_database_file_uses_its_own_dictionary():
+    with tempfile.TemporaryDirectory() as tmp:
+        live, backup = os.path.join(tmp, "verbs.db"), os.path.join(tmp, "backup.db")
+        # Different templates, so the two v1 dictionaries differ
+        texts = {live: COMPLETE, backup: "### abandon\n- **备份模板**：另一套完全不同的写法。\n" * 5}
+        for path, text in texts.items():
+            conn = make_db(path)
+            ensure_generation_columns(conn)
+            write_explanations(conn, [("single", word, text.replace("abandon", word), None) for word in ("abandon", "abolish", "absorb")])
+            assert content_codec.recode_all(conn, content_codec.train(conn)) == 3
+            conn.close()
+
+        conn = sqlite3.connect(live)
+        assert content_codec.decode(conn, conn.execute("SELECT content FROM explanations WHERE query_key = 'abandon'").fetchone()[0]) == COMPLETE
+        conn.close()
+
+        # Same path and dictionary version, another dictionary: what /api/import does
+        shutil.copy2(backup, live)
+        content_codec.clear_dictionary_cache()
+        conn = sqlite3.connect(live)
+        stored = conn.execute("SELECT content FROM explanations WHERE query_key = 'abandon'").fetchone()[0]
+        assert content_codec.decode(conn, stored) == texts[backup]
+        conn.close()
+
+
+def test_dictionary_versions_are_not_reused_after_migration():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_db(os.path.join(tmp, "verbs.db"))
+        # The schema app.init_db used to create, without AUTOINCREMENT
+        conn.execute("CREATE TABLE compression_dicts (version INTEGER PRIMARY KEY, dictionary BLOB NOT NULL, sample_rows INTEGER, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+        conn.executemany("INSERT INTO compression_dicts (version, dictionary) VALUES (?, ?)", [(1, b"one"), (2, b"two")])
+        conn.commit()
+        content_codec.ensure_dict_table(conn)
+        assert "AUTOINCREMENT" in conn.execute("SELECT sql FROM sqlite_master WHERE name = 'compression_dicts'").fetchone()[0]
+        assert content_codec.get_dictionary(conn, 2) == b"two"
+
+        conn.execute("DELETE FROM compression_dicts WHERE version = 2")
+        conn.commit()
+        assert content_codec.store_dictionary(conn, b"three") == 3
+        content_codec.clear_dictionary_cache()
+        conn.close()
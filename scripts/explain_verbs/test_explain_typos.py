@@ -0,0 +1,52 @@
+import os
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+
+import app
+
+GENERATED = "### abandon\n\n#### 一言蔽之\n松手。"
+
+
+def explain(tmp, body, calls):
+    """POST /api/explain against a fresh database in tmp, with generation recorded instead of called."""
+    saved = (app.DB_PATH, app.get_client, app.explain_verb)
+    app.DB_PATH = os.path.join(tmp, "verbs.db")
+    app.get_client = lambda **kwargs: object()
+    app.explain_verb = lambda client, prompt, **kwargs: calls.append(prompt) or GENERATED
+    try:
+        app.init_db()
+        return TestClient(app.app).post("/api/explain", json=body)
+    finally:
+        app.DB_PATH, app.get_client, app.explain_verb = saved
+
+
+def test_strict_cache_typo_returns_candidates_without_content():
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+        response = explain(tmp, {"verbs": "abandn", "mode": "single", "strict_cache": True}, calls)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["content"] is None and data["result"] is None
+        assert "abandon" in [candidate["word"] for candidate in data["did_you_mean"]["abandn"]]
+        assert calls == []
+
+
+def test_typo_with_candidates_is_not_generated():
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+        response = explain(tmp, {"verbs": "abandn", "mode": "single"}, calls)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["content"] is None and "abandn" in data["did_you_mean"]
+        assert calls == []
+
+        # Listed words next to the typo are still generated
+        response = explain(tmp, {"verbs": "abandn, abandon", "mode": "single"}, calls)
+        data = response.json()
+        assert data["result"] == GENERATED and "abandn" in data["did_you_mean"]
+        assert calls == ['请解析"abandon"']
@@ -0,0 +1,106 @@
+import os
+import re
+import sqlite3
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import content_codec
+import html_render
+from cache_writer import ensure_generation_columns, write_explanations
+
+SAMPLE = """### abandon（放弃）
+
+#### 视觉本源
+- **词源**：来自古法语 à bandon，“交由他人处置”。
+
+#### 逻辑演化
+- **路径**：松手 -> 放弃控制 -> 放弃计划
+
+#### 地道场景
+1. **灾难**：They abandoned the ship.
+   - *映射*：松开与船的联系。
+
+#### 一言蔽之
+它是一只彻底松开的手。"""
+
+SECTION_KEYS = ["title", "视觉本源", "逻辑演化", "地道场景", "一言蔽之"]
+
+
+def make_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE explanations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            mode TEXT NOT NULL,
+            query_key TEXT NOT NULL,
+            content TEXT NOT NULL,
+            image_url TEXT,
+            image_dicebear TEXT,
+            image_pollinations TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(mode, query_key)
+        )
+    ''')
+    conn.commit()
+    return conn
+
+
+def section_keys(rendered):
+    return re.findall(r'<section data-section="([^"]*)">', rendered)
+
+
+def test_sections_are_wrapped_with_their_keys():
+    rendered = html_render.render_html(SAMPLE)
+    if not html_render.HTML_AVAILABLE:
+        assert rendered is None
+        return
+    assert section_keys(rendered) == SECTION_KEYS
+    assert rendered.count("</section>") == len(SECTION_KEYS)
+    assert rendered.startswith('<section data-section="title"><h3>abandon（放弃）</h3></section>')
+    # As on the client (index.html fixups before marked), "- *映射*" starts its own list after the numbered item
+    assert re.search(r"<li><strong>灾难</strong>：They abandoned the ship.</li>\s*</ol>\s*<ul>\s*<li><em>映射</em>", rendered)
+    assert html_render.render_html("") is None
+
+
+def test_card_fixups_match_the_client():
+    fixed = html_render.card_fixups("**视觉本源：**\n-** 词源 **：来自 * *古法语**\n## # abandon\nagreed**with**me")
+    assert fixed == ("#### 视觉本源\n\n- <strong> 词源</strong>：来自 <strong>古法语</strong>\n"
+                     "### abandon\nagreed <strong> with </strong> me")
+
+
+def test_section_keys_are_escaped():
+    if not html_render.HTML_AVAILABLE:
+        return
+    rendered = html_render.render_html('### abandon\n\n#### "A" & <B>\n- text')
+    assert section_keys(rendered) == ["title", "&quot;A&quot; &amp; &lt;B&gt;"]
+
+
+def test_backfill_renders_missing_rows():
+    if not html_render.HTML_AVAILABLE:
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_db(os.path.join(tmp, "verbs.db"))
+        ensure_generation_columns(conn)
+        words = ("abandon", "abolish", "absorb")
+        write_explanations(conn, [("single", word, SAMPLE.replace("abandon", word), None) for word in words])
+        # Compressed rows are rendered from their decoded text
+        content_codec.recode_all(conn, content_codec.train(conn))
+        conn.execute("UPDATE explanations SET content_html = NULL WHERE query_key != 'absorb'")
+        conn.execute("UPDATE explanations SET content_html = 'kept' WHERE query_key = 'absorb'")
+        conn.commit()
+
+        assert html_render.backfill_html(conn, chunk_size=1) == 2
+        rows = {key: content_codec.decode(conn, value) for key, value in conn.execute("SELECT query_key, content_html FROM explanations")}
+        assert rows["absorb"] == "kept"
+        # Stored with the same dictionary as content
+        assert content_codec.is_compressed(conn.execute("SELECT content_html FROM explanations WHERE query_key = 'abandon'").fetchone()[0])
+        assert rows["abolish"] == html_render.render_html(SAMPLE.replace("abandon", "abolish"))
+        assert section_keys(rows["abandon"]) == SECTION_KEYS
+
+        assert html_render.backfill_html(conn) == 0
+        assert html_render.backfill_html(conn, force=True) == 3
+        assert conn.execute("SELECT content_html FROM explanations WHERE query_key = 'absorb'").fetchone()[0] != "kept"
+        conn.close()
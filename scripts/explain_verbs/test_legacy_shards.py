@@ -0,0 +1,53 @@
+import json
+import os
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from asset_build import load_manifest
+from legacy_shards import split, word_ranks, write_shards
+
+ITEMS = [
+    {"序号": 1, "单词": "the", "其他拼写": None},
+    {"序号": 2, "单词": "colour", "其他拼写": "color"},
+    {"序号": 3, "单词": "zoom", "其他拼写": None},
+]
+LEGACY = {
+    "zoom": {"content": "Z"},
+    "color:verb": {"content": "C"},
+    "the": {"content": "T"},
+    "unlisted": {"content": "U"},
+}
+
+
+def test_split_by_rank():
+    ranks = word_ranks(ITEMS)
+    assert ranks == {"the": 1, "colour": 2, "color": 2, "zoom": 3}
+    shards = split(LEGACY, ranks, bounds=(1, 2))
+    assert [list(shard) for shard in shards] == [["the"], ["color:verb"], ["zoom", "unlisted"]]
+
+
+def test_write_shards_index_and_eager_js():
+    with tempfile.TemporaryDirectory() as tmp:
+        index = write_shards(tmp, LEGACY, word_ranks(ITEMS), bounds=(1, 2), eager=1)
+        assert index["total"] == 4
+        assert [(shard["ranks"], shard["count"]) for shard in index["shards"]] == [([1, 1], 1), ([2, 2], 1), ([3, None], 2)]
+        with open(os.path.join(tmp, index["shards"][2]["file"]), encoding="utf-8") as f:
+            assert json.load(f) == {"zoom": {"content": "Z"}, "unlisted": {"content": "U"}}
+        with open(os.path.join(tmp, "js", "data_legacy_eager.js"), encoding="utf-8") as f:
+            assert f.read().endswith('window.NETEM_LEGACY_DATA = {"the":{"content":"T"}};')
+
+        assets = load_manifest(tmp)["assets"]
+        assert [assets[f"legacy/shard_{i}.json"].get("precache", True) for i in range(3)] == [True, False, False]
+
+        # Fewer bounds: the extra shard is removed from disk and manifest
+        write_shards(tmp, LEGACY, word_ranks(ITEMS), bounds=(1,), eager=1)
+        assets = load_manifest(tmp)["assets"]
+        assert "legacy/shard_2.json" not in assets
+        assert sorted(os.listdir(os.path.join(tmp, "legacy"))) == sorted(
+            [os.path.basename(assets[name]["file"]) + suffix for name in assets if name.startswith("legacy/")
+             for suffix in ("", ".gz", ".br") if suffix != ".br" or "br" in assets[name]]
+            + ["index.json"]
+        )
@@ -0,0 +1,36 @@
+import os
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lexical_features import Features, ensure_features, pos_category
+
+FAKE = {
+    "make": Features(2, 49, 0, 0, "make"),
+    "run": Features(16, 41, 0, 0, "run"),
+    "quick": Features(1, 0, 7, 1, "quick"),
+    "the": Features(0, 0, 0, 0, ""),
+}
+
+
+def test_only_missing_words_are_extracted():
+    calls = []
+
+    def extractor(word):
+        calls.append(word)
+        return FAKE[word]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "features.db")
+        features = ensure_features(["Make ", "run", "the"], path, extractor=extractor)
+        assert sorted(calls) == ["make", "run", "the"]
+        assert features["make"] == FAKE["make"]
+
+        calls.clear()
+        features = ensure_features(["make", "run", "the", "quick"], path, extractor=extractor)
+        assert calls == ["quick"]
+        assert {word: pos_category(f) for word, f in features.items()} == {
+            "make": "noun_verb", "run": "noun_verb", "quick": "noun", "the": "other"}
+        assert pos_category(None) == "other"
@@ -0,0 +1,113 @@
+import os
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import lexicon
+from lexicon import build_lemma_map, build_variant_map, generate_forms, get_key_map, write_lemma_map
+
+WORDS = [
+    {"单词": "go", "词频": 5000, "pos": "verb"},
+    {"单词": "study", "词频": 3000, "pos": "noun_verb"},
+    {"单词": "analysis", "词频": 800, "pos": "noun"},
+    {"单词": "stop", "词频": 700, "pos": "noun_verb"},
+    {"单词": "big", "词频": 600, "pos": "adj_adv"},
+    {"单词": "leave", "词频": 500, "pos": "noun_verb"},
+    {"单词": "leaf", "词频": 100, "pos": "noun"},
+    {"单词": "stops", "词频": 1, "pos": "noun"},
+]
+
+
+def test_regular_and_irregular_forms():
+    assert {"studies", "studied", "studying"} <= generate_forms("study", "noun_verb")
+    assert {"stopped", "stopping", "stops"} <= generate_forms("stop", "verb")
+    assert {"bigger", "biggest"} <= generate_forms("big", "adj_adv")
+    assert {"went", "gone", "goes", "going"} <= generate_forms("go", "verb")
+    assert generate_forms("analysis", "noun") == {"analyses"}
+
+
+def test_map_prefers_listed_words_and_frequency():
+    lemmas = build_lemma_map(WORDS, use_wordnet=False)
+    forms = {form: lemma for lemma, joined in lemmas.items() for form in joined}
+    assert forms["went"] == "go" and forms["studies"] == "study" and forms["analyses"] == "analysis"
+    # "leaves" could be leaf or leave: the more frequent entry wins
+    assert forms["leaves"] == "leave"
+    # A form that is itself a list word stays its own entry
+    assert "stops" not in forms
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lemma_map.json")
+        write_lemma_map(lemmas, path)
+        assert get_key_map(path)["studying"] == "study"
+
+
+def test_shipped_map_normalizes_keys():
+    assert lexicon.normalize_key(" Went ") == "go"
+    assert lexicon.normalize_key("abandon") == "abandon"
+    assert lexicon.lemmatize("unknownword") is None
+
+
+def test_variant_spellings_follow_their_entry():
+    items = WORDS + [
+        {"单词": "colour", "词频": 400, "pos": "noun_verb", "其他拼写": "color"},
+        {"单词": "centre", "词频": 300, "pos": "noun", "其他拼写": "center"},
+        {"单词": "check", "词频": 900, "pos": "noun_verb", "其他拼写": "cheque"},
+        {"单词": "cheque", "词频": 50, "pos": "noun", "其他拼写": "check"},
+        {"单词": "analyse", "词频": 200, "pos": "verb", "其他拼写": "analyze"},
+    ]
+    lemmas = build_lemma_map(items, use_wordnet=False)
+    groups = [["colors", "colours", "", "", "colors"], ["analyzes", "analyses", "analyzes"]]
+    variants = build_variant_map(items, lemmas, groups)
+    assert variants["colour"] == ["color", "colors"]
+    assert variants["centre"] == ["center"]
+    # "analyses" belongs to analysis, but "analyzes" is a form of analyse's own 其他拼写 "analyze"
+    assert variants["analyse"] == ["analyze", "analyzes"]
+    assert "analysis" not in variants
+    # Two list words naming each other stay separate entries
+    assert "check" not in variants and "cheque" not in variants
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lemma_map.json")
+        write_lemma_map(lemmas, path, variants=variants)
+        key_map = get_key_map(path)
+        assert key_map["colors"] == "colour" and key_map["colours"] == "colour" and key_map["went"] == "go"
+
+
+def test_shipped_map_has_variants():
+    assert lexicon.normalize_key("Center") == "centre"
+    assert lexicon.normalize_key("programme") == "program"
+    assert lexicon.normalize_key("analyzes") == lexicon.normalize_key("analyzed") == "analyse"
+
+
+def test_comparatives_only_for_gradable_adjectives():
+    assert {"happier", "happiest"} <= generate_forms("happy", "adj_adv", "快乐的")
+    assert {"bigger", "biggest"} <= generate_forms("big", "adj_adv", "大")
+    # Adverbs, prepositions, determiners and long adjectives have no -er/-est
+    for word, definition in [("aboard", "上船、在船上"), ("across", "穿过"), ("both", "两者"),
+                             ("chronic", "慢性的、长期的"), ("eastern", "东部的"), ("only", "仅仅")]:
+        assert not any(form.endswith(("er", "est")) for form in generate_forms(word, "adj_adv", definition)), word
+    # One syllable doubles the consonant, and only then
+    assert "biger" not in generate_forms("big", "adj_adv") and "stoped" not in generate_forms("stop", "verb")
+
+
+def test_derived_words_keep_their_own_key():
+    items = [
+        {"单词": "eastern", "词频": 400, "pos": "adj_adv", "释义": "东部的"},
+        {"单词": "house", "词频": 900, "pos": "noun_verb", "释义": "房子"},
+        {"单词": "rag", "词频": 50, "pos": "noun_verb", "释义": "破布"},
+        {"单词": "time", "词频": 3000, "pos": "noun_verb", "释义": "时间"},
+    ]
+    forms = {form: lemma for lemma, joined in build_lemma_map(items, use_wordnet=False).items() for form in joined}
+    for word in ("easterner", "housing", "ragged", "timing"):
+        assert word not in forms, word
+    assert forms["houses"] == "house" and forms["timed"] == "time"
+
+
+def test_shipped_map_has_no_false_comparatives_or_derived_words():
+    key_map = get_key_map()
+    for word in ("aboarder", "acrossest", "bothest", "chroniccer", "easterner", "ragged", "dogged",
+                 "lining", "timing", "wording", "housing"):
+        assert word not in key_map, word
+    assert lexicon.normalize_key("happier") == "happy"
@@ -0,0 +1,39 @@
+import os
+import sys
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from markdown_utils import clean_markdown, clean_markdown_bulk, is_clean
+from test_quality import COMPLETE
+
+
+def test_section_headings_are_normalized():
+    assert clean_markdown("### t\n## # # 三维理解\n正文") == "### t\n#### 三维理解\n正文"
+    assert clean_markdown("### t\n* *本质动作：**\n正文") == "### t\n#### 本质动作\n正文"
+    assert clean_markdown("### t\n**视觉本源**\n正文") == "### t\n#### 视觉本源\n正文"
+    # Only whole lines are headings
+    assert clean_markdown("### t\n- **视觉本源**：正文") == "### t\n- **视觉本源**：正文"
+
+
+def test_old_header_damage_is_repaired():
+    assert clean_markdown("## # abandon（放弃）\n\n### # 视觉本源\n- x") == "### abandon（放弃）\n\n#### 视觉本源\n- x"
+
+
+def test_rules_bold_and_lists():
+    assert clean_markdown("### t\n---\n-item\n**a** and **b**\n** x **") == "### t\n---\n- item\n**a** and **b**\n**x**"
+
+
+def test_wrapper_filler_and_blank_lines():
+    raw = "好的，解析如下：\n```markdown\n###abandon\n\n\n\n#### 视觉本源\n```"
+    assert clean_markdown(raw) == "### abandon\n\n#### 视觉本源"
+    assert clean_markdown("```markdown\n### t\n\n\n\nx\n```") == "### t\n\nx"
+
+
+def test_clean_content_takes_fast_path_and_is_stable():
+    assert is_clean(COMPLETE)
+    assert clean_markdown(COMPLETE + "\n") == COMPLETE
+    messy = COMPLETE.replace("#### ", "**", 2).replace("- **", "-**") + "\n\n\n"
+    assert not is_clean(messy)
+    once = clean_markdown_bulk([messy])[0]
+    assert once == clean_markdown(once) and is_clean(once)
@@ -0,0 +1,75 @@
+import json
+import os
+import sys
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from packed_generation import make_groups, packed_prompt_hash, parse_packed_response
+from prompt_registry import prompt_hash
+
+
+def entry(word):
+    return f"# {word}\n\n## 核心含义\n{word} 的完整解析，" + "内容足够长以通过校验。" * 8
+
+
+def test_reordered_and_missing_words():
+    raw = json.dumps({"borrow": entry("borrow"), "abandon": entry("abandon")}, ensure_ascii=False)
+    results, failed = parse_packed_response(raw, ["abandon", "absorb", "borrow"])
+    assert list(results) == ["abandon", "borrow"]
+    assert results["abandon"] == entry("abandon").strip()
+    assert results["borrow"] == entry("borrow").strip()
+    assert failed == ["absorb"]
+
+
+def test_keys_match_case_insensitively_and_results_use_input_spelling():
+    raw = json.dumps({" Abandon ": entry("abandon")}, ensure_ascii=False)
+    results, failed = parse_packed_response(raw, ["abandon"])
+    assert results == {"abandon": entry("abandon").strip()}
+    assert failed == []
+
+
+def test_code_fence_and_leading_prose_are_stripped():
+    body = json.dumps({"abandon": entry("abandon")}, ensure_ascii=False)
+    for raw in (f"```json\n{body}\n```", f"以下是解析结果：\n{body}\n"):
+        results, failed = parse_packed_response(raw, ["abandon"])
+        assert list(results) == ["abandon"]
+        assert failed == []
+
+
+def test_unparseable_answer_fails_every_word():
+    words = ["abandon", "borrow"]
+    for raw in ("", None, "{not json", json.dumps([entry("abandon")]), "Error calling API: timeout"):
+        assert parse_packed_response(raw, words) == ({}, words)
+
+
+def test_short_or_mismatched_entries_fail_validation():
+    raw = json.dumps({
+        "abandon": "# abandon\n(略)",
+        "borrow": entry("lend"),
+        "absorb": {"text": entry("absorb")},
+        "accept": entry("accept").replace("#", ""),
+    }, ensure_ascii=False)
+    results, failed = parse_packed_response(raw, ["abandon", "borrow", "absorb", "accept"])
+    assert results == {}
+    assert failed == ["abandon", "borrow", "absorb", "accept"]
+
+
+def test_make_groups_by_pos_in_list_order():
+    items = [{"单词": w, "pos": pos} for w, pos in [
+        ("a", "v"), ("b", "n"), ("c", "v"), ("d", "v"), ("e", "n"), ("f", None)]]
+    groups = make_groups(items, 2)
+    assert [[item["单词"] for item in group] for group in groups] == [["a", "c"], ["b", "e"], ["d"], ["f"]]
+    assert [[item["单词"] for item in group] for group in make_groups(items, 1)] == [[w] for w in "abcdef"]
+
+
+def test_make_groups_uses_pos_of():
+    items = [{"单词": w} for w in "abc"]
+    groups = make_groups(items, 3, pos_of=lambda item: "v" if item["单词"] != "b" else "n")
+    assert [[item["单词"] for item in group] for group in groups] == [["a", "c"], ["b"]]
+
+
+def test_packed_rows_have_their_own_prompt_hash():
+    assert packed_prompt_hash("verb") != prompt_hash("verb")
+    assert packed_prompt_hash("verb") != packed_prompt_hash("noun")
+    assert packed_prompt_hash("verb") == packed_prompt_hash(None)
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from provider_pool import ROUND_ROBIN, WEIGHTED, ProviderPool, ProviderSlot, is_rate_limit_error
+
+
+def slots(*weights):
+    return [ProviderSlot(f"key{i}", f"sk-{i}", weight=weight) for i, weight in enumerate(weights)]
+
+
+def test_round_robin_cycles_and_skips_cooling_slots():
+    pool = ProviderPool(slots(1, 1, 1), strategy=ROUND_ROBIN)
+    picked = []
+    for _ in range(4):
+        slot = pool.acquire()
+        picked.append(slot.name)
+        pool.release(slot, ok=True)
+    assert picked == ["key0", "key1", "key2", "key0"]
+
+    # A rate-limited slot cools down and loses half its weight
+    slot = pool.acquire()
+    assert slot.name == "key1"
+    pool.release(slot, ok=False, rate_limited=True)
+    assert slot.cooldown_until > time.monotonic() and slot.effective_weight == 0.5 and slot.rate_limited == 1
+    names = []
+    for _ in range(3):
+        other = pool.acquire()
+        names.append(other.name)
+        pool.release(other, ok=True)
+    assert "key1" not in names
+
+
+def test_weighted_prefers_headroom_per_weight():
+    pool = ProviderPool(slots(3, 1), strategy=WEIGHTED)
+    held = [pool.acquire() for _ in range(4)]
+    # (in_flight + 1) / weight: the weight-3 key takes three of the first four requests
+    assert [slot.name for slot in held].count("key0") == 3
+    for slot in held:
+        pool.release(slot, ok=True)
+    assert all(slot.in_flight == 0 for slot in pool.slots)
+
+
+def test_successes_restore_weight_and_settings_pool():
+    slot = slots(2)[0]
+    pool = ProviderPool([slot], strategy=WEIGHTED)
+    pool.release(pool.acquire(), ok=False, rate_limited=True)
+    assert slot.effective_weight == 1.0 and slot.limit_streak == 1
+    slot.cooldown_until = 0
+    for _ in range(20):
+        pool.release(pool.acquire(), ok=True)
+    assert slot.effective_weight == 2.0 and slot.limit_streak == 0
+
+    class Settings:
+        openai_api_key = "sk-main"
+        openai_base_url = ""
+        openai_model = "m"
+        providers = [{"api_key": "sk-main"}, {"api_key": "sk-extra", "weight": 2, "name": "extra"}]
+
+    built = ProviderPool.from_settings(Settings)
+    assert [s.api_key for s in built.slots] == ["sk-main", "sk-extra"] and built.slots[1].weight == 2.0
+    assert is_rate_limit_error("Error code: 429 - Too Many Requests") and not is_rate_limit_error("timeout")
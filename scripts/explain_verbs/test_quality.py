@@ -0,0 +1,63 @@
+import os
+import sys
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from quality import expected_sections, is_truncated, score_content, needs_full_regeneration, splice_sections
+
+COMPLETE = """### abandon（放弃）
+
+#### 视觉本源
+- **词源**：来自古法语 à bandon，“交由他人处置”。
+- **画面**：一只手松开缰绳。
+
+#### 逻辑演化
+- **路径**：松手 -> 放弃控制 -> 放弃计划
+- **核心**：不再掌控。
+
+#### 动作维度
+- **特征**：彻底、单向。
+- **辨析**：比 give up 更决绝。
+
+#### 地道场景
+1. **灾难**：They abandoned the ship.
+   - *映射*：松开与船的联系。
+
+#### 一言蔽之
+它是一只彻底松开的手。"""
+
+
+def test_sections_come_from_prompt():
+    names, optional = expected_sections("noun")
+    assert names[0] == "视觉本源" and names[-1] == "一言蔽之"
+    assert "认知差异" in names
+    assert optional == ("词性转换",)
+
+
+def test_complete_row_passes():
+    report = score_content(COMPLETE, "verb")
+    assert report["ok"] and report["score"] == 1.0
+
+
+def test_missing_section_is_patched_in_order():
+    broken = COMPLETE.replace("#### 逻辑演化\n- **路径**：松手 -> 放弃控制 -> 放弃计划\n- **核心**：不再掌控。\n\n", "")
+    report = score_content(broken, "verb")
+    assert report["missing"] == ["逻辑演化"] and not needs_full_regeneration(report)
+
+    patched = splice_sections(broken, "#### 逻辑演化\n- **路径**：松手 -> 放弃\n", report["missing"], "verb")
+    assert score_content(patched, "verb")["ok"]
+    assert patched.index("#### 视觉本源") < patched.index("#### 逻辑演化") < patched.index("#### 动作维度")
+
+
+def test_truncated_row_needs_regeneration():
+    report = score_content(COMPLETE[:COMPLETE.index("它是")] + "它是一只**彻底", "verb")
+    assert report["truncated"] and needs_full_regeneration(report)
+
+
+def test_only_an_unclosed_ending_counts_as_truncated():
+    # A literal "**" inside the text is not a cut-off
+    assert not is_truncated(COMPLETE.replace("比 give up", "比 a**b 和 give up"))
+    assert is_truncated(COMPLETE + "\n- **补充")
+    assert is_truncated(COMPLETE + "\n\n#### 词性转换")
+    assert is_truncated(COMPLETE + "\n```markdown\n- x")
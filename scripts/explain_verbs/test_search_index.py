@@ -0,0 +1,160 @@
+import json
+import os
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import search_index
+from cache_writer import ensure_generation_columns, write_explanations
+from section_store import clear_sections
+from test_batch_requests import make_db
+from test_quality import COMPLETE
+
+WORDS = [
+    {"单词": "abandon", "释义": "放弃、抛弃", "词频": 900},
+    {"单词": "abolish", "释义": "废除", "词频": 300},
+    {"单词": "quit", "释义": "放弃、离开", "词频": 500},
+]
+
+
+def make_search_db(tmp):
+    conn = make_db(os.path.join(tmp, "verbs.db"))
+    ensure_generation_columns(conn)
+    assert search_index.ensure_search_tables(conn)
+    search_index.sync_definitions(conn, WORDS)
+    write_explanations(conn, [("single", "abandon", COMPLETE, None)])
+    return conn
+
+
+def test_triggers_keep_index_in_sync():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_search_db(tmp)
+        found = search_index.search(conn, "交由他人处置")
+        assert [r["query_key"] for r in found["results"]] == ["abandon"]
+        assert found["results"][0]["section"] == "视觉本源"
+        assert "<mark>交由他人处置</mark>" in found["results"][0]["snippet"]
+
+        # Rewriting the explanation replaces its indexed sections
+        write_explanations(conn, [("single", "abandon", "### abandon\n\n#### 一言蔽之\n放手。", None)])
+        assert search_index.search(conn, "交由他人处置")["results"] == []
+        assert search_index.sync_definitions(conn, WORDS) == 0
+        conn.close()
+
+
+def test_definitions_short_terms_and_pages():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_search_db(tmp)
+        # Two characters: below trigram length, answered by the CJK pair index
+        found = search_index.search(conn, "放弃", page_size=1)
+        assert found["has_more"] and [r["query_key"] for r in found["results"]] == ["abandon"]
+        second = search_index.search(conn, "放弃", page=2, page_size=1)
+        assert [r["query_key"] for r in second["results"]] == ["quit"]
+        assert second["results"][0]["cached"] is False and "<mark>放弃</mark>" in second["results"][0]["definition"]
+
+        assert [r["query_key"] for r in search_index.search(conn, "废除")["results"]] == ["abolish"]
+        assert search_index.search(conn, '"abol')["results"] == []
+        conn.close()
+
+
+def test_inflected_terms_match_their_lemma():
+    lemmas = {"abandoned": "abandon"}.get
+    assert search_index.match_expression("abandoned ship", lemmas) == '("abandoned" OR "abandon") "ship"'
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_search_db(tmp)
+        assert search_index.search(conn, "abandons")["results"] == []
+        found = search_index.search(conn, "abandons", lemmatize={"abandons": "abandon"}.get)
+        assert [r["query_key"] for r in found["results"]] == ["abandon"]
+        conn.close()
+
+
+def test_definitions_resync_only_when_word_list_changes():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_search_db(tmp)
+        path = os.path.join(tmp, "words.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"words": WORDS}, f, ensure_ascii=False)
+        # First sync records the hash (rows are already there from make_search_db)
+        assert search_index.sync_definitions_file(conn, path) == 0
+        assert search_index.sync_definitions_file(conn, path) is None
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"words": WORDS + [{"单词": "absorb", "释义": "吸收", "词频": 100}]}, f, ensure_ascii=False)
+        assert search_index.sync_definitions_file(conn, path) == 1
+        assert [r["query_key"] for r in search_index.search(conn, "吸收")["results"]] == ["absorb"]
+        assert search_index.sync_definitions_file(conn, path, force=True) == 0
+        conn.close()
+
+
+def test_old_sections_table_is_migrated_to_explicit_ids():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_db(os.path.join(tmp, "verbs.db"))
+        conn.execute('''
+            CREATE TABLE explanation_sections (
+                mode TEXT NOT NULL, query_key TEXT NOT NULL, section TEXT NOT NULL,
+                position INTEGER NOT NULL, content TEXT NOT NULL,
+                PRIMARY KEY (mode, query_key, section)
+            )
+        ''')
+        conn.execute("CREATE VIRTUAL TABLE explanation_fts USING fts5(mode UNINDEXED, query_key UNINDEXED, section UNINDEXED, content, "
+                     "content='explanation_sections', tokenize='trigram')")
+        conn.executemany("INSERT INTO explanation_sections (rowid, mode, query_key, section, position, content) VALUES (?, 'single', ?, 'title', 0, ?)",
+                         [(5, "abandon", "### abandon 交由他人处置"), (9, "abolish", "### abolish 彻底废除")])
+        conn.execute("INSERT INTO explanation_fts (explanation_fts) VALUES ('rebuild')")
+        conn.commit()
+
+        assert search_index.ensure_search_tables(conn)
+        assert dict(conn.execute("SELECT query_key, id FROM explanation_sections")) == {"abandon": 5, "abolish": 9}
+        assert "content_rowid='id'" in conn.execute("SELECT sql FROM sqlite_master WHERE name = 'explanation_fts'").fetchone()[0]
+        assert [r["query_key"] for r in search_index.search(conn, "交由他人处置")["results"]] == ["abandon"]
+
+        # Triggers are back, and ids survive a VACUUM
+        ensure_generation_columns(conn)
+        write_explanations(conn, [("single", "abolish", "### abolish\n\n#### 一言蔽之\n取消一项制度。", None)])
+        conn.execute("DELETE FROM explanation_sections WHERE query_key = 'abandon'")
+        conn.commit()
+        conn.execute("VACUUM")
+        assert search_index.search(conn, "交由他人处置")["results"] == []
+        assert search_index.search(conn, "彻底废除")["results"] == []
+        found = search_index.search(conn, "取消一项制度")
+        assert [(r["query_key"], r["section"]) for r in found["results"]] == [("abolish", "一言蔽之")]
+        conn.execute("INSERT INTO explanation_fts (explanation_fts) VALUES ('integrity-check')")
+        conn.close()
+
+
+def test_short_cjk_terms_use_the_pair_index():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_search_db(tmp)
+        write_explanations(conn, [("single", "abolish", "### abolish\n\n#### 一言蔽之\n彻底废除一项制度。", None)])
+        assert search_index.cjk_match_expression("放弃 ship") == '"放弃"'
+        assert search_index.cjk_match_expression("放弃 up") is None
+
+        found = search_index.search(conn, "废除")
+        assert [(r["query_key"], r["section"], r["cached"]) for r in found["results"]][0] == ("abolish", "一言蔽之", True)
+        assert "<mark>废除</mark>" in found["results"][0]["snippet"]
+        # Combined with a trigram term, both must match the same section
+        found = search_index.search(conn, "废除 一项制度")
+        assert [r["query_key"] for r in found["results"] if r["cached"]] == ["abolish"]
+        assert search_index.search(conn, "废除 交由他人处置")["results"] == []
+
+        # Rewrites and deletes keep the contentless index in step
+        write_explanations(conn, [("single", "abolish", "### abolish\n\n#### 一言蔽之\n取消。", None)])
+        assert [r["query_key"] for r in search_index.search(conn, "废除")["results"] if r["cached"]] == []
+        assert [r["query_key"] for r in search_index.search(conn, "取消")["results"]] == ["abolish"]
+        clear_sections(conn)
+        conn.commit()
+        assert search_index.search(conn, "取消")["results"] == []
+        conn.execute("INSERT INTO explanation_cjk (explanation_cjk) VALUES ('integrity-check')")
+        conn.close()
+
+
+def test_pair_index_is_built_for_existing_search_tables():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_search_db(tmp)
+        conn.execute("DROP TABLE explanation_cjk")
+        conn.commit()
+        assert search_index.ensure_search_tables(conn)
+        found = search_index.search(conn, "处置")
+        assert [r["query_key"] for r in found["results"]] == ["abandon"]
+        conn.close()
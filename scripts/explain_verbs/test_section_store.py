@@ -0,0 +1,66 @@
+import os
+import sys
+import sqlite3
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from cache_writer import ensure_generation_columns, write_explanations
+from section_store import backfill_sections, fetch_sections, project, parse_sections_param
+from test_batch_requests import make_db
+from test_quality import COMPLETE
+
+
+def test_sections_written_with_explanation():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_db(os.path.join(tmp, "verbs.db"))
+        ensure_generation_columns(conn)
+        write_explanations(conn, [("single", "abandon", COMPLETE, None)])
+
+        sections = fetch_sections(conn, "single", ["abandon", "missing"], parse_sections_param("一言蔽之, title"))
+        assert list(sections) == ["abandon"]
+        assert sections["abandon"] == {"title": "### abandon（放弃）", "一言蔽之": "#### 一言蔽之\n它是一只彻底松开的手。"}
+
+        # Rewriting the explanation replaces its sections
+        write_explanations(conn, [("single", "abandon", "### abandon\n\n#### 一言蔽之\n放手。", None)])
+        assert fetch_sections(conn, "single", ["abandon"], ["视觉本源", "一言蔽之"]) == {"abandon": {"一言蔽之": "#### 一言蔽之\n放手。"}}
+        conn.close()
+
+
+def test_backfill_only_splits_missing_rows():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_db(os.path.join(tmp, "verbs.db"))
+        conn.execute("INSERT INTO explanations (mode, query_key, content) VALUES ('single', 'abandon', ?)", (COMPLETE,))
+        conn.commit()
+        assert backfill_sections(conn) == 1
+        assert backfill_sections(conn) == 0
+        stored = fetch_sections(conn, "single", ["abandon"], ["地道场景"])["abandon"]
+        assert stored == project(COMPLETE, ["地道场景"])
+        conn.close()
+
+
+def test_projected_sync_does_not_write():
+    from fastapi.testclient import TestClient
+    import app
+
+    with tempfile.TemporaryDirectory() as tmp:
+        saved = app.DB_PATH
+        app.DB_PATH = os.path.join(tmp, "verbs.db")
+        try:
+            app.init_db()
+            conn = sqlite3.connect(app.DB_PATH)
+            conn.execute("INSERT INTO explanations (mode, query_key, content) VALUES ('single', 'abandon', ?)", (COMPLETE,))
+            conn.commit()
+            client = TestClient(app.app)
+
+            # Rows without sections are skipped rather than split by the GET
+            assert client.get("/api/sync/all_explanations", params={"sections": "一言蔽之"}).json() == []
+            assert conn.execute("SELECT COUNT(*) FROM explanation_sections").fetchone()[0] == 0
+
+            backfill_sections(conn)
+            items = client.get("/api/sync/all_explanations", params={"sections": "一言蔽之"}).json()
+            assert [(item["query_key"], list(item["sections"])) for item in items] == [("abandon", ["一言蔽之"])]
+            conn.close()
+        finally:
+            app.DB_PATH = saved
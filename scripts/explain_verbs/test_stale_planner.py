@@ -0,0 +1,126 @@
+import os
+import sqlite3
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import stale_planner
+from cache_writer import ensure_generation_columns
+from packed_generation import packed_prompt_hash
+from prompt_registry import prompt_hash
+
+ITEMS = [
+    {"单词": "abandon", "pos": "verb", "词频": 10},
+    {"单词": "Borrow ", "pos": "verb", "词频": 30},
+    {"单词": "cabin", "pos": "noun", "词频": 20},
+    {"单词": "dawn", "pos": "noun", "词频": 40},
+    {"单词": "eager", "pos": "adj", "词频": 50},
+    {"单词": "fable", "pos": "noun", "词频": 60},
+]
+
+
+def make_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE explanations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            mode TEXT NOT NULL,
+            query_key TEXT NOT NULL,
+            content TEXT NOT NULL,
+            image_url TEXT,
+            image_dicebear TEXT,
+            image_pollinations TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(mode, query_key)
+        )
+    ''')
+    conn.commit()
+    return conn
+
+
+def resolve_pos(item):
+    return item.get("pos")
+
+
+def make_cache(tmp):
+    conn = make_db(os.path.join(tmp, "verbs.db"))
+    ensure_generation_columns(conn)
+    rows = [
+        ("abandon", prompt_hash("verb"), "gpt-4o"),   # current
+        ("borrow", prompt_hash("noun"), "gpt-4o"),    # written with another POS prompt
+        ("cabin", prompt_hash("noun"), "gpt-4o-mini"),  # current prompt, older model
+        ("dawn", None, None),                         # predates provenance
+        ("eager", prompt_hash("adj"), None),          # model unknown
+    ]
+    conn.executemany("INSERT INTO explanations (mode, query_key, content, prompt_hash, model) VALUES ('single', ?, 'x', ?, ?)", rows)
+    conn.execute("INSERT INTO explanations (mode, query_key, content, prompt_hash) VALUES ('sentence', 'fable', 'x', 'old')")
+    conn.commit()
+    return conn
+
+
+def test_selects_prompt_and_model_mismatches():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_cache(tmp)
+        try:
+            stale = stale_planner.plan_stale(conn, ITEMS, resolve_pos)
+            assert [(item["单词"], reason) for item, reason in stale] == [("Borrow ", stale_planner.PROMPT_CHANGED)]
+
+            stale = stale_planner.plan_stale(conn, ITEMS, resolve_pos, model="gpt-4o", include_unversioned=True)
+            assert [(item["单词"], reason) for item, reason in stale] == [
+                ("dawn", stale_planner.UNVERSIONED),
+                ("Borrow ", stale_planner.PROMPT_CHANGED),
+                ("cabin", stale_planner.MODEL_CHANGED),
+            ]
+        finally:
+            conn.close()
+
+
+def test_stamped_rows_are_current():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_cache(tmp)
+        try:
+            assert stale_planner.stamp_unversioned(conn, ITEMS, resolve_pos, model="gpt-4o") == 1
+            assert stale_planner.load_provenance(conn)["dawn"] == (prompt_hash("noun"), "gpt-4o")
+            stale = stale_planner.plan_stale(conn, ITEMS, resolve_pos, include_unversioned=True)
+            assert [item["单词"] for item, _ in stale] == ["Borrow "]
+        finally:
+            conn.close()
+
+
+def test_items_are_matched_on_the_cache_key():
+    # Inflected or variant list words find the row stored under their normalized key
+    items = [{"单词": "Went", "pos": "verb", "词频": 10}, {"单词": "colours", "pos": "noun", "词频": 20}]
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_db(os.path.join(tmp, "verbs.db"))
+        ensure_generation_columns(conn)
+        conn.execute("INSERT INTO explanations (mode, query_key, content, prompt_hash) VALUES ('single', 'go', 'x', ?)", (prompt_hash("noun"),))
+        conn.execute("INSERT INTO explanations (mode, query_key, content) VALUES ('single', 'color', 'x')")
+        conn.commit()
+        try:
+            stale = stale_planner.plan_stale(conn, items, resolve_pos)
+            assert [(item["单词"], reason) for item, reason in stale] == [("Went", stale_planner.PROMPT_CHANGED)]
+            assert stale_planner.stamp_unversioned(conn, items, resolve_pos) == 1
+            assert stale_planner.load_provenance(conn)["color"] == (prompt_hash("noun"), None)
+        finally:
+            conn.close()
+
+
+def test_packed_rows_are_told_apart():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = make_cache(tmp)
+        conn.execute("UPDATE explanations SET prompt_hash = ? WHERE query_key = 'abandon'", (packed_prompt_hash("verb"),))
+        conn.execute("UPDATE explanations SET prompt_hash = ? WHERE query_key = 'eager'", (packed_prompt_hash("noun"),))
+        conn.commit()
+        try:
+            # Current packed output is up to date; packed output from another POS prompt is not
+            stale = stale_planner.plan_stale(conn, ITEMS, resolve_pos)
+            assert [(item["单词"], reason) for item, reason in stale] == [
+                ("eager", stale_planner.PROMPT_CHANGED),
+                ("Borrow ", stale_planner.PROMPT_CHANGED),
+            ]
+            stale = stale_planner.plan_stale(conn, ITEMS, resolve_pos, include_packed=True)
+            assert [(item["单词"], reason) for item, reason in stale][-1] == ("abandon", stale_planner.PACKED)
+        finally:
+            conn.close()
@@ -0,0 +1,54 @@
+import os
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sync_engine import SyncEngine, Tree
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def actions(changes):
+    return {change.path: change.action for change in changes if change.action != "unchanged"}
+
+
+def test_incremental_sync_and_check():
+    with tempfile.TemporaryDirectory() as root:
+        src, dst = os.path.join(root, "dev"), os.path.join(root, "dist")
+        write(os.path.join(src, "js", "a.js"), "a")
+        write(os.path.join(src, "lib", "deep", "b.css"), "b")
+        write(os.path.join(src, "index.html"), "<html>")
+        write(os.path.join(dst, "js", "orphan.js"), "old")
+        files = [(os.path.join(src, "index.html"), os.path.join(dst, "index.html"))]
+        trees = [Tree(os.path.join(src, folder), os.path.join(dst, folder), lambda rel: True) for folder in ("js", "lib")]
+        manifest = os.path.join(dst, ".sync-manifest.json")
+
+        def engine():
+            return SyncEngine(manifest_path=manifest, root=root)
+
+        # Check mode reports but writes nothing
+        assert actions(engine().run(files, trees, check=True)) == {
+            "dist/index.html": "added", "dist/js/a.js": "added", "dist/lib/deep/b.css": "added", "dist/js/orphan.js": "deleted"}
+        assert not os.path.exists(os.path.join(dst, "index.html")) and not os.path.exists(manifest)
+
+        assert len(actions(engine().run(files, trees))) == 4
+        assert not os.path.exists(os.path.join(dst, "js", "orphan.js"))
+        with open(os.path.join(dst, "lib", "deep", "b.css"), encoding="utf-8") as f:
+            assert f.read() == "b"
+
+        # Nothing changed: no copies and no hashing
+        again = engine()
+        assert actions(again.run(files, trees)) == {}
+        assert again.hashed == 0
+
+        write(os.path.join(src, "js", "a.js"), "a2")
+        again = engine()
+        assert actions(again.run(files, trees)) == {"dist/js/a.js": "updated"}
+        assert again.hashed == 1
+        assert actions(engine().run(files, trees, check=True)) == {}
@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from vocabulary_db import LIST_KEY, connect, count, is_current, load_items, load_sql_topics, lookup
+
+ITEMS = [
+    {"序号": 1, "词频": 10, "单词": "make", "释义": "做", "其他拼写": None, "pos": "verb"},
+    {"序号": 2, "词频": 30, "单词": "colour", "释义": "颜色", "其他拼写": "color", "pos": "noun_verb"},
+    {"序号": 3, "词频": 20, "单词": "May", "释义": "五月", "其他拼写": None, "pos": "noun"},
+    {"序号": 4, "词频": 40, "单词": "may", "释义": "可能", "其他拼写": None, "pos": "other"},
+]
+
+
+def write_words(path, items):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({LIST_KEY: items}, f, ensure_ascii=False)
+
+
+def test_views_lookup_and_rebuild():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path, json_path = os.path.join(tmp, "vocabulary.db"), os.path.join(tmp, "words.json")
+        write_words(json_path, ITEMS)
+        assert not is_current(db_path, json_path)
+
+        with connect(db_path, json_path) as conn:
+            assert load_items(conn=conn) == ITEMS
+            # Views are ordered by frequency
+            assert [item["单词"] for item in load_items("verbs", conn=conn)] == ["colour", "make"]
+            assert count("nouns", conn) == 2
+            assert lookup("COLOR", conn)["单词"] == "colour"
+            assert lookup("may", conn)["序号"] == 3
+            assert lookup("missing", conn) is None
+        assert is_current(db_path, json_path)
+
+        # Touching the JSON without changing it keeps the database, and doesn't write it
+        with open(db_path, "rb") as f:
+            built = f.read()
+        os.utime(json_path, ns=(0, 0))
+        assert is_current(db_path, json_path)
+        connect(db_path, json_path).close()
+        with open(db_path, "rb") as f:
+            assert f.read() == built
+        # Editing it rebuilds
+        write_words(json_path, ITEMS + [{"序号": 5, "词频": 1, "单词": "do", "pos": "verb"}])
+        assert not is_current(db_path, json_path)
+        with connect(db_path, json_path) as conn:
+            assert [item["单词"] for item in load_items("verbs", conn=conn)] == ["colour", "make", "do"]
+
+
+def test_sql_topics():
+    with tempfile.TemporaryDirectory() as tmp:
+        sql_path = os.path.join(tmp, "dump.sql")
+        with open(sql_path, "w", encoding="utf-8") as f:
+            f.write("INSERT INTO `netem_full_list` VALUES (2, 54093, 'be', '是、存在', NULL, 'describing things');\n")
+            f.write("INSERT INTO `netem_full_list` VALUES (3, 10, 'it''s', 'x', NULL, NULL);\n")
+            f.write("INSERT INTO `netem_full_list` VALUES (4, 10, 'o', 'x', NULL, 'people\\'s lives');\n")
+        assert load_sql_topics(sql_path) == {2: "describing things", 4: "people's lives"}
@@ -0,0 +1,47 @@
+import json
+import os
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from word_columns import decode, dumps, encode, load_word_data, source_hash
+
+ITEMS = [
+    {"序号": 1, "词频": 86015, "单词": "the", "释义": "这个、这些", "其他拼写": None, "pos": "other"},
+    {"序号": 2, "词频": 512, "单词": "colour", "释义": "颜色", "其他拼写": "color", "pos": "noun_verb"},
+    {"序号": 3, "词频": 0, "单词": "zoom", "释义": "飞驰", "其他拼写": None, "pos": "noun_verb"},
+]
+
+
+def test_round_trip():
+    columns = encode(ITEMS)
+    assert columns["sequence"] == {"start": 1}
+    assert columns["pos"] == {"values": ["other", "noun_verb"], "codes": "011"}
+    assert columns["variant"] == {"index": [1], "value": ["color"]}
+    assert decode(json.loads(dumps(columns))) == ITEMS
+
+    shuffled = [ITEMS[2], ITEMS[0]]
+    columns = encode(shuffled, binary_frequency=True)
+    assert columns["sequence"] == [3, 1] and "frequency" not in columns
+    assert decode(json.loads(dumps(columns))) == shuffled
+
+
+def test_load_prefers_columns_built_from_current_json():
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "netem_full_list.json")
+        columns_path = os.path.join(tmp, "netem_full_list.columns.json")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump({"list": ITEMS}, f, ensure_ascii=False)
+        with open(json_path, "rb") as f:
+            source = source_hash(f.read())
+
+        # Built from other content: ignored
+        with open(columns_path, "w", encoding="utf-8") as f:
+            f.write(dumps(encode(ITEMS[:1], "list", source="stale")))
+        assert load_word_data(json_path) == {"list": ITEMS}
+
+        with open(columns_path, "w", encoding="utf-8") as f:
+            f.write(dumps(encode(ITEMS[:1], "list", source=source)))
+        assert load_word_data(json_path) == {"list": ITEMS[:1]}
@@ -0,0 +1,56 @@
+import os
+import sys
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from word_index import BKTree, PrefixIndex, did_you_mean, levenshtein
+
+WORDS = [
+    {"单词": "centre", "释义": "中心", "词频": 782, "其他拼写": "center"},
+    {"单词": "century", "释义": "世纪", "词频": 577, "其他拼写": None},
+    {"单词": "cent", "释义": "分", "词频": 128, "其他拼写": None},
+    {"单词": "program", "释义": "项目", "词频": 603, "其他拼写": "programme"},
+    {"单词": "ice cream", "释义": "冰淇淋", "词频": 10, "其他拼写": None},
+]
+
+
+def test_prefix_ranked_by_frequency_with_variants():
+    index = PrefixIndex(WORDS)
+    assert [s["word"] for s in index.suggest("Cent")] == ["centre", "century", "cent"]
+    # Only the variant matches: the canonical word is suggested
+    assert index.suggest("center") == [{"word": "centre", "frequency": 782, "definition": "中心", "variant": "center"}]
+    assert [s["variant"] for s in index.suggest("program")] == [None]
+    assert [s["word"] for s in index.suggest("ice c")] == ["ice cream"]
+
+
+def test_limits_and_memo():
+    index = PrefixIndex(WORDS)
+    assert index.suggest("") == [] and index.suggest("x") == []
+    assert len(index.suggest("c", limit=2)) == 2
+    first = index.suggest("c", limit=2)
+    first[0]["cached"] = True
+    # Memoized results are handed out as copies
+    assert index.suggest("c", limit=2) == [{k: v for k, v in first[0].items() if k != "cached"}, first[1]]
+
+
+def test_bk_tree_did_you_mean():
+    items = WORDS + [
+        {"单词": "abandon", "释义": "放弃", "词频": 91},
+        {"单词": "abundant", "释义": "丰富的", "词频": 35},
+        {"单词": "cat", "释义": "猫", "词频": 20},
+    ]
+    tree = BKTree(items)
+    assert [(c["word"], c["distance"]) for c in tree.search("abandan")] == [("abandon", 1), ("abundant", 2)]
+    # The variant spelling leads to the canonical word
+    assert tree.search("centr", 1)[0] == {"word": "centre", "distance": 1, "frequency": 782, "spelling": "centre"}
+    assert did_you_mean(tree, "abandon") == []
+    assert [c["word"] for c in did_you_mean(tree, "abandan")] == ["abandon"]
+    assert did_you_mean(tree, "cxx") == [] and [c["word"] for c in did_you_mean(tree, "cax")] == ["cat"]
+    assert [c["word"] for c in did_you_mean(tree, "programm")] == ["program"]
+
+
+def test_levenshtein():
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("", "abc") == 3 and levenshtein("abc", "") == 3
+    assert levenshtein("flaw", "lawn") == 2
@@ -0,0 +1,78 @@
+import os
+import sqlite3
+import sys
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from word_query import WordQueryEngine, ensure_state_triggers, set_bits
+
+ITEMS = [
+    {"序号": 1, "词频": 50, "单词": "make", "pos": "verb"},
+    {"序号": 2, "词频": 90, "单词": "Time", "pos": "noun"},
+    {"序号": 3, "词频": 70, "单词": "run", "pos": "noun_verb"},
+    {"序号": 4, "词频": 10, "单词": "about", "pos": "other"},
+]
+
+
+def words(page):
+    return [item["单词"] for item in page]
+
+
+def test_set_bits_pages():
+    bitmap = 0b1011010
+    assert set_bits(bitmap, 0, 2) == [1, 3]
+    assert set_bits(bitmap, 2, 10) == [4, 6]
+    assert set_bits(bitmap, 4, 10) == []
+
+
+def test_filters_and_sorts():
+    engine = WordQueryEngine(ITEMS, pos_of=lambda item: "prep_conj" if item["单词"] == "about" else item["pos"])
+    assert engine.query("", "rank", 0, 10) == (4, ITEMS)
+    assert words(engine.query("", "-frequency", 0, 2)[1]) == ["about", "make"]
+    assert words(engine.query("pos:verb|pos:noun_verb", "frequency", 0, 10)[1]) == ["run", "make"]
+    assert words(engine.query("pos:prep_conj", "alpha", 0, 10)[1]) == ["about"]
+
+    engine.set_state(cached=["run"], mastered=["time"], learning=["make", "run"], excluded=["About"],
+                     reviews=[("make", "2024-01-01T00:00:00"), ("run", "2030-01-01T00:00:00")])
+    assert words(engine.query("!cached,!excluded", "alpha", 0, 10)[1]) == ["make", "Time"]
+    assert words(engine.query("new", "rank", 0, 10)[1]) == ["about"]
+    assert words(engine.query("due", "rank", 0, 10, now="2025-01-01T00:00:00")[1]) == ["make"]
+    assert words(engine.query("due", "rank", 0, 10, now="2031-01-01T00:00:00")[1]) == ["make", "run"]
+    assert engine.query("mastered|excluded", "rank", 1, 1) == (2, [ITEMS[3]])
+    for bad in ("bogus", "pos"):
+        try:
+            engine.query(bad)
+        except ValueError:
+            continue
+        raise AssertionError(bad)
+
+
+def test_refresh_follows_trigger_version():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE explanations (id INTEGER PRIMARY KEY, mode TEXT, query_key TEXT, image_url TEXT)")
+    conn.execute("CREATE TABLE learning_progress (verb TEXT PRIMARY KEY, status TEXT, next_review TEXT)")
+    conn.execute("CREATE TABLE excluded_verbs (verb TEXT PRIMARY KEY)")
+    ensure_state_triggers(conn)
+    engine = WordQueryEngine(ITEMS)
+    assert engine.refresh(conn) and not engine.refresh(conn)
+    assert engine.query("cached")[0] == 0
+
+    conn.execute("INSERT INTO explanations (mode, query_key) VALUES ('single', 'make')")
+    conn.execute("INSERT INTO excluded_verbs (verb) VALUES ('run')")
+    assert engine.refresh(conn)
+    assert words(engine.query("cached")[1]) == ["make"]
+    assert engine.images == {"make": None}
+    conn.execute("UPDATE explanations SET image_url = 'x.png'")
+    assert engine.refresh(conn) and engine.images == {"make": "x.png"}
+    assert words(engine.query("!excluded")[1]) == ["make", "Time", "about"]
+
+
+def test_keyset_pages_survive_state_changes():
+    engine = WordQueryEngine(ITEMS)
+    total, page, more = engine.page("!cached", "frequency", limit=2)
+    assert (total, words(page), more) == (4, ["Time", "run"], True)
+    # "Time" gets cached between requests: an offset would now skip "make", the cursor doesn't
+    engine.set_state(cached=["time"])
+    total, page, more = engine.page("!cached", "frequency", limit=2, after=page[-1]["序号"])
+    assert (total, words(page), more) == (3, ["make", "about"], False)
@@ -0,0 +1,34 @@
+import json
+import os
+import sys
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from word_records import FIELDS, WordRecords
+
+ITEMS = [
+    {"序号": 1, "词频": 50, "单词": "About", "释义": "关于", "其他拼写": None, "pos": "other"},
+    {"序号": 2, "词频": 30, "单词": "make", "释义": "做", "其他拼写": None, "pos": "verb"},
+]
+
+
+def test_render_composes_records_and_overlay():
+    records = WordRecords(ITEMS, pos_of=lambda item: "prep_conj" if item["单词"] == "About" else item["pos"])
+    images = records.generated_images(("dicebear",), lambda key: f"gen/{key}")
+    assert records.generated_images(("dicebear",), lambda key: 1 / 0) is images
+
+    rendered = json.loads(records.render([1, 0], list(FIELDS), {"about": "stored.png", "make": None}, images))
+    assert rendered == [
+        dict(ITEMS[1], has_cache=True, image_url="gen/make"),
+        dict(ITEMS[0], pos="prep_conj", has_cache=True, image_url="stored.png"),
+    ]
+    assert json.loads(records.render([0], ["单词", "has_cache"], {})) == [{"单词": "About", "has_cache": False}]
+    # Source items and records are untouched
+    assert ITEMS[0]["pos"] == "other" and records.record(0)["pos"] == "prep_conj"
+    try:
+        records.record(0)["pos"] = "x"
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("records are read-only")
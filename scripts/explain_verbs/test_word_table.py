@@ -0,0 +1,42 @@
+import json
+import os
+import sys
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from word_query import WordQueryEngine
+from word_records import FIELDS, WordRecords
+from word_table import WordTable, compact
+
+ITEMS = [
+    {"序号": 1, "词频": 50, "单词": "About", "释义": "关于", "其他拼写": None, "pos": "other"},
+    {"序号": 2, "词频": 30, "单词": "colour", "释义": "颜色；色彩", "其他拼写": "color", "pos": "noun_verb"},
+    {"序号": 3, "词频": 90, "单词": "make", "释义": "做", "其他拼写": None, "pos": None},
+]
+
+
+def test_table_reads_like_the_list():
+    table = WordTable(ITEMS)
+    assert len(table) == 3 and table.to_items() == ITEMS
+    assert list(table) == ITEMS and table[-1] == ITEMS[2] and table[1:] == ITEMS[1:]
+    row = table[1]
+    assert row["释义"] == "颜色；色彩" and row.get("其他拼写") == "color" and row.get("missing") is None
+    assert "pos" in row and dict(row) == ITEMS[1]
+    try:
+        table[3]
+    except IndexError:
+        pass
+    else:
+        raise AssertionError("index past the end")
+    assert compact({"list": ITEMS})["list"].to_items() == ITEMS
+
+
+def test_engine_and_records_over_a_table():
+    table = WordTable(ITEMS)
+    engine, plain = WordQueryEngine(table), WordQueryEngine(ITEMS)
+    assert engine.items is table and engine.tag == plain.tag
+    assert engine.query("", "frequency") == plain.query("", "frequency")
+    rendered = WordRecords(table).render([2, 1], list(FIELDS), {"colour": "c.png"})
+    assert rendered == WordRecords(ITEMS).render([2, 1], list(FIELDS), {"colour": "c.png"})
+    assert json.loads(rendered)[1]["image_url"] == "c.png"
@@ -0,0 +1,65 @@
+import os
+import sqlite3
+import sys
+import tempfile
+
+# Add current dir to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import work_leases
+
+
+def make_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute('''
+        CREATE TABLE explanations (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            mode TEXT NOT NULL,
+            query_key TEXT NOT NULL,
+            content TEXT NOT NULL,
+            image_url TEXT,
+            image_dicebear TEXT,
+            image_pollinations TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(mode, query_key)
+        )
+    ''')
+    conn.commit()
+    return conn
+
+
+def open_db(tmp):
+    conn = make_db(os.path.join(tmp, "verbs.db"))
+    work_leases.ensure_lease_table(conn)
+    return conn
+
+
+def test_claims_are_exclusive_and_skip_cached_words():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = open_db(tmp)
+        conn.execute("INSERT INTO explanations (mode, query_key, content) VALUES ('single', 'b', 'cached')")
+        conn.commit()
+        keys = ["a", "b", "c", "d"]
+        claimed, pos = work_leases.claim(conn, "w1", "run", keys, 0, 2)
+        assert claimed == ["a", "c"] and pos == 3
+        # Another worker gets what is left
+        other = sqlite3.connect(os.path.join(tmp, "verbs.db"))
+        assert work_leases.claim(other, "w2", "run", keys, 0, 10) == (["d"], 4)
+        other.close()
+        conn.close()
+
+
+def test_expired_leases_are_reclaimed_and_done_ones_are_not():
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = open_db(tmp)
+        assert work_leases.claim(conn, "w1", "run", ["a", "b"], 0, 10, ttl=-1) == (["a", "b"], 2)
+        work_leases.mark_done(conn, "run", ["a"])
+        conn.commit()
+        # b's lease expired (its owner crashed): w2 takes it over; a is finished in this run
+        assert work_leases.claim(conn, "w2", "run", ["a", "b"], 0, 10) == (["b"], 2)
+        # A new run forgets finished leases from older ones
+        work_leases.release(conn, "w2", ["b"])
+        assert work_leases.claim(conn, "w3", "run2", ["a", "b"], 0, 10, skip_cached=False) == (["a", "b"], 2)
+        owners = dict(conn.execute("SELECT query_key, owner FROM generation_leases"))
+        assert owners == {"a": "w3", "b": "w3"}
+        conn.close()
@@ -2,6 +2,11 @@ import sqlite3
 import os
 from datetime import datetime
 
+try:
+    from vocabulary_db import load_items
+except ImportError:
+    from scripts.explain_verbs.vocabulary_db import load_items
+
 DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "verbs.db")
 
 def verify_data():
@@ -29,10 +34,7 @@ def verify_data():
     
     # List one word that might be the extra one (if any)
     # Check verbs NOT in the 100-150 range
-    with open(VERBS_JSON_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-        all_verbs_list = data.get("5530考研词汇词频排序表", [])
-        test_verbs_set = set(v['单词'].lower() for v in all_verbs_list[100:150])
+    test_verbs_set = set(v['单词'].lower() for v in load_items(limit=50, offset=100))
     
     c.execute("SELECT verb, status, next_review FROM learning_progress")
     all_db_verbs = c.fetchall()
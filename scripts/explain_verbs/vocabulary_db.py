@@ -0,0 +1,295 @@
+"""
+vocabulary.db: the word list (netem_full_list.json) as an indexed SQLite store.
+
+    words(rank, word, word_lower, frequency, definition, variant, pos, topic)
+        rank = 序号 (PRIMARY KEY), word = 单词, frequency = 词频, definition = 释义,
+        variant = 其他拼写; topic comes from netem_full_list.sql when it is imported
+    indexes on word_lower, lower(variant), frequency, (pos, frequency)
+    views: verbs, nouns, adj_adv, function_words, variants (derived sets, frequency order)
+    meta: source size / mtime / sha256 of the JSON it was built from
+
+The JSON stays the source of truth: connect() rebuilds the database when the JSON changed
+(size or mtime differ and the sha256 does too), so tools can always query it instead of
+re-parsing 890 KB of JSON. Derived lists such as netem_verbs.json are views here;
+export_view() writes one out in the old {name: [items]} JSON shape when a file is needed.
+
+    python vocabulary_db.py --build [--sql ../../netem_full_list.sql]
+    python vocabulary_db.py --stats
+    python vocabulary_db.py --export-view verbs ../../netem_verbs.json
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(BASE_DIR, "../.."))
+DEFAULT_DB_PATH = os.path.join(REPO_ROOT, "vocabulary.db")
+DEFAULT_WORDS_PATH = os.path.join(REPO_ROOT, "netem_full_list.json")
+DEFAULT_SQL_PATH = os.path.join(REPO_ROOT, "netem_full_list.sql")
+LIST_KEY = "5530考研词汇词频排序表"
+SCHEMA_VERSION = "1"
+
+SCHEMA = """
+CREATE TABLE words (
+    rank INTEGER PRIMARY KEY,
+    word TEXT NOT NULL,
+    word_lower TEXT NOT NULL,
+    frequency INTEGER NOT NULL DEFAULT 0,
+    definition TEXT,
+    variant TEXT,
+    pos TEXT NOT NULL DEFAULT 'other',
+    topic TEXT
+);
+CREATE INDEX idx_words_word_lower ON words(word_lower);
+CREATE INDEX idx_words_variant ON words(lower(variant)) WHERE variant IS NOT NULL;
+CREATE INDEX idx_words_frequency ON words(frequency DESC, rank);
+CREATE INDEX idx_words_pos ON words(pos, frequency DESC, rank);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# Derived word sets; each one replaces what used to be a separate JSON file
+VIEWS = {
+    # netem_verbs.json ("5530考研词汇词频排序表 (Verbs Only)")
+    "verbs": "pos IN ('verb', 'noun_verb')",
+    "nouns": "pos IN ('noun', 'noun_verb')",
+    "adj_adv": "pos = 'adj_adv'",
+    "function_words": "pos IN ('prep_conj', 'other')",
+    "variants": "variant IS NOT NULL",
+}
+VIEW_TITLES = {"verbs": f"{LIST_KEY} (Verbs Only)"}
+COLUMNS = "rank, word, word_lower, frequency, definition, variant, pos, topic"
+
+
+def _source_stat(json_path: str) -> Dict[str, str]:
+    st = os.stat(json_path)
+    return {"source_size": str(st.st_size), "source_mtime_ns": str(st.st_mtime_ns)}
+
+
+def _sha256(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _load_json_items(json_path: str) -> List[Dict[str, Any]]:
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    key = LIST_KEY if LIST_KEY in data else next(iter(data))
+    return data[key]
+
+
+_SQL_ROW_RE = re.compile(r"^INSERT INTO `netem_full_list` VALUES \((\d+), .*, (NULL|'(?:[^'\\]|\\.)*')\);$")
+
+
+def load_sql_topics(sql_path: str) -> Dict[int, str]:
+    """id -> topic from the MySQL dump (netem_full_list.sql); rows without a topic are skipped."""
+    topics: Dict[int, str] = {}
+    with open(sql_path, "r", encoding="utf-8") as f:
+        for line in f:
+            match = _SQL_ROW_RE.match(line.strip())
+            if match and match.group(2) != "NULL":
+                topics[int(match.group(1))] = re.sub(r"\\(.)", r"\1", match.group(2)[1:-1])
+    return topics
+
+
+def build(db_path: str = DEFAULT_DB_PATH, json_path: str = DEFAULT_WORDS_PATH, sql_path: Optional[str] = None) -> int:
+    """(Re)build the database from the JSON into a temp file, then swap it in. Returns the word count."""
+    items = _load_json_items(json_path)
+    topics = load_sql_topics(sql_path) if sql_path and os.path.exists(sql_path) else {}
+    tmp_path = db_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        rows = []
+        for position, item in enumerate(items, 1):
+            word = (item.get('单词') or "").strip()
+            if not word:
+                continue
+            rank = item.get('序号') or position
+            rows.append((rank, word, word.lower(), item.get('词频') or 0, item.get('释义'),
+                         (item.get('其他拼写') or "").strip() or None, item.get('pos') or "other", topics.get(rank)))
+        conn.executemany(f"INSERT INTO words ({COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        for name, condition in VIEWS.items():
+            conn.execute(f"CREATE VIEW {name} AS SELECT * FROM words WHERE {condition} ORDER BY frequency DESC, rank")
+        meta = _source_stat(json_path)
+        meta.update({
+            "schema_version": SCHEMA_VERSION,
+            "source_sha256": _sha256(json_path),
+            "list_key": LIST_KEY,
+            "topics_from": os.path.basename(sql_path) if topics else "",
+            "built_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        })
+        conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", meta.items())
+        conn.commit()
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, db_path)
+    return len(rows)
+
+
+def _meta(conn: sqlite3.Connection) -> Dict[str, str]:
+    try:
+        return dict(conn.execute("SELECT key, value FROM meta").fetchall())
+    except sqlite3.DatabaseError:
+        return {}
+
+
+# (db file, its stat, JSON stat) already confirmed by sha256 in this process; kept in memory so
+# the tracked vocabulary.db is never written just because a checkout moved the JSON's mtime
+_verified: set = set()
+
+
+def is_current(db_path: str = DEFAULT_DB_PATH, json_path: str = DEFAULT_WORDS_PATH) -> bool:
+    """
+    True if db_path was built from the current json_path. Size + mtime is the fast path;
+    if only the mtime moved (a fresh checkout), the sha256 decides. The database is only
+    read here: a rebuild is the one thing that writes it.
+    """
+    if not os.path.exists(db_path) or os.path.getsize(db_path) == 0:
+        return False
+    if not os.path.exists(json_path):
+        return True
+    stat = _source_stat(json_path)
+    db_stat = os.stat(db_path)
+    verified = (os.path.abspath(db_path), db_stat.st_size, db_stat.st_mtime_ns, tuple(sorted(stat.items())))
+    if verified in _verified:
+        return True
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        meta = _meta(conn)
+    finally:
+        conn.close()
+    if meta.get("schema_version") != SCHEMA_VERSION:
+        return False
+    if not all(meta.get(key) == value for key, value in stat.items()) and meta.get("source_sha256") != _sha256(json_path):
+        return False
+    _verified.add(verified)
+    return True
+
+
+def connect(db_path: str = DEFAULT_DB_PATH, json_path: str = DEFAULT_WORDS_PATH) -> sqlite3.Connection:
+    """Connection to an up-to-date vocabulary.db, rebuilding it from the JSON when needed."""
+    if not is_current(db_path, json_path):
+        # Topics from the MySQL dump only belong to the word list it was dumped from
+        default_sql = json_path == DEFAULT_WORDS_PATH and os.path.exists(DEFAULT_SQL_PATH)
+        build(db_path, json_path, DEFAULT_SQL_PATH if default_sql else None)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def to_item(row: sqlite3.Row) -> Dict[str, Any]:
+    """A words row in the netem_full_list.json item shape."""
+    return {
+        '序号': row['rank'],
+        '词频': row['frequency'],
+        '单词': row['word'],
+        '释义': row['definition'],
+        '其他拼写': row['variant'],
+        'pos': row['pos']
+    }
+
+
+def _relation(view: str) -> str:
+    if view != "words" and view not in VIEWS:
+        raise ValueError(f"Unknown view: {view} (expected words or one of {', '.join(VIEWS)})")
+    return view
+
+
+def load_items(view: str = "words", limit: Optional[int] = None, offset: int = 0,
+               conn: Optional[sqlite3.Connection] = None) -> List[Dict[str, Any]]:
+    """Items of a table/view in the JSON item shape: words by rank, views by frequency."""
+    relation = _relation(view)
+    order = " ORDER BY rank" if relation == "words" else ""
+    own = conn is None
+    conn = conn or connect()
+    try:
+        rows = conn.execute(f"SELECT {COLUMNS} FROM {relation}{order} LIMIT ? OFFSET ?", (-1 if limit is None else limit, offset)).fetchall()
+        return [to_item(row) for row in rows]
+    finally:
+        if own:
+            conn.close()
+
+
+def count(view: str = "words", conn: Optional[sqlite3.Connection] = None) -> int:
+    relation = _relation(view)
+    own = conn is None
+    conn = conn or connect()
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {relation}").fetchone()[0]
+    finally:
+        if own:
+            conn.close()
+
+
+def load_word_data(view: str = "words") -> Dict[str, List[Dict[str, Any]]]:
+    """Like json.load(netem_full_list.json): {list name: [items]}."""
+    return {VIEW_TITLES.get(view, LIST_KEY): load_items(view)}
+
+
+def lookup(word: str, conn: Optional[sqlite3.Connection] = None) -> Optional[Dict[str, Any]]:
+    """The entry for a spelling or 其他拼写 variant (case-insensitive), best-ranked first."""
+    key = word.strip().lower()
+    own = conn is None
+    conn = conn or connect()
+    try:
+        row = conn.execute(
+            f"SELECT {COLUMNS} FROM words WHERE word_lower = ? ORDER BY rank LIMIT 1", (key,)
+        ).fetchone() or conn.execute(
+            f"SELECT {COLUMNS} FROM words WHERE lower(variant) = ? AND variant IS NOT NULL ORDER BY rank LIMIT 1", (key,)
+        ).fetchone()
+        return to_item(row) if row else None
+    finally:
+        if own:
+            conn.close()
+
+
+def export_view(view: str, path: str) -> int:
+    """Write a view as {title: [items]} JSON (the old derived-file format). Returns the item count."""
+    data = load_word_data(view)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return len(next(iter(data.values())))
+
+
+def stats(conn: sqlite3.Connection):
+    meta = _meta(conn)
+    print(f"vocabulary.db built {meta.get('built_at')} from sha256 {meta.get('source_sha256', '')[:12]}"
+          f"{' + ' + meta['topics_from'] if meta.get('topics_from') else ''}")
+    print(f"words: {count('words', conn)}")
+    for name in VIEWS:
+        print(f"  view {name}: {count(name, conn)}")
+    for pos, n in conn.execute("SELECT pos, COUNT(*) FROM words GROUP BY pos ORDER BY COUNT(*) DESC"):
+        print(f"  pos {pos}: {n}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build and query vocabulary.db from netem_full_list.json.")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    parser.add_argument("--words", default=DEFAULT_WORDS_PATH)
+    parser.add_argument("--build", action="store_true", help="Rebuild the database from the JSON")
+    parser.add_argument("--sql", nargs="?", const=DEFAULT_SQL_PATH, help="Also import topics from the MySQL dump")
+    parser.add_argument("--stats", action="store_true", help="Print counts per view and POS")
+    parser.add_argument("--export-view", nargs=2, metavar=("VIEW", "PATH"), help="Write a view as JSON")
+    args = parser.parse_args()
+
+    if args.build:
+        start = time.perf_counter()
+        n = build(args.db, args.words, args.sql)
+        print(f"Built {args.db}: {n} words in {(time.perf_counter() - start) * 1000:.0f} ms")
+    if args.stats:
+        with connect(args.db, args.words) as conn:
+            stats(conn)
+    if args.export_view:
+        view, path = args.export_view
+        print(f"Wrote {export_view(view, path)} {view} to {path}")
+    if not (args.build or args.stats or args.export_view):
+        parser.print_help()
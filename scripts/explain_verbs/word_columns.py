@@ -0,0 +1,218 @@
+"""
+Columnar encoding of the word list (netem_full_list.json).
+
+The list is 5530 objects that all repeat the keys 序号/词频/单词/释义/其他拼写/pos. The
+columnar form stores one array per field instead:
+
+    {
+      "format": "netem-columns", "version": 1,
+      "list": "5530考研词汇词频排序表", "count": 5530,
+      "source": "<sha256 prefix of the netem_full_list.json it was built from>",
+      "sequence": {"start": 1},              # 序号, when it is 1..count (else a plain array)
+      "frequency": [86015, 54093, ...],      # 词频, or "frequency_u32": base64 of little-endian uint32
+      "word": ["the", "be", ...],            # 单词
+      "definition": ["这个、这些", ...],      # 释义
+      "variant": {"index": [...], "value": [...]},   # 其他拼写, sparse (only 154 words have one)
+      "pos": {"values": ["other", "noun_verb", ...], "codes": "01..."}   # one character per word
+    }
+
+decode() turns it back into the exact list of dicts, so callers keep working on 单词/词频/...
+The build (update_full_list_js.py) publishes it as netem_full_list.columns.json and as
+js/data_full_list_columns.js (window.NETEM_FULL_LIST_COLUMNS); the frontend decoder is
+decodeWordColumns() in static/js/local_api.js.
+
+    python word_columns.py --bench            # size and parse time against the current JSON
+"""
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+import os
+import struct
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+FORMAT = "netem-columns"
+VERSION = 1
+LIST_KEY = "5530考研词汇词频排序表"
+POS_CODES = "0123456789abcdefghijklmnopqrstuvwxyz"
+JS_GLOBAL = "NETEM_FULL_LIST_COLUMNS"
+DEFAULT_WORDS_PATH = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../netem_full_list.json"))
+
+
+def source_hash(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def encode(items: List[Dict[str, Any]], list_key: str = LIST_KEY, binary_frequency: bool = False, source: Optional[str] = None) -> Dict[str, Any]:
+    sequence = [item.get('序号') for item in items]
+    frequency = [item.get('词频') or 0 for item in items]
+    pos_values: List[str] = []
+    pos_index: Dict[str, int] = {}
+    codes = []
+    variant_index, variant_value = [], []
+    for i, item in enumerate(items):
+        pos = item.get('pos') or "other"
+        if pos not in pos_index:
+            if len(pos_values) == len(POS_CODES):
+                raise ValueError(f"More than {len(POS_CODES)} distinct pos values")
+            pos_index[pos] = len(pos_values)
+            pos_values.append(pos)
+        codes.append(POS_CODES[pos_index[pos]])
+        if item.get('其他拼写'):
+            variant_index.append(i)
+            variant_value.append(item['其他拼写'])
+
+    columns: Dict[str, Any] = {"format": FORMAT, "version": VERSION, "list": list_key, "count": len(items)}
+    if source:
+        columns["source"] = source
+    if sequence and sequence == list(range(sequence[0], sequence[0] + len(items))):
+        columns["sequence"] = {"start": sequence[0]}
+    else:
+        columns["sequence"] = sequence
+    if binary_frequency:
+        columns["frequency_u32"] = base64.b64encode(struct.pack(f"<{len(frequency)}I", *frequency)).decode("ascii")
+    else:
+        columns["frequency"] = frequency
+    columns["word"] = [item.get('单词') for item in items]
+    columns["definition"] = [item.get('释义') for item in items]
+    columns["variant"] = {"index": variant_index, "value": variant_value}
+    columns["pos"] = {"values": pos_values, "codes": "".join(codes)}
+    return columns
+
+
+def is_columnar(data: Dict[str, Any]) -> bool:
+    return isinstance(data, dict) and data.get("format") == FORMAT
+
+
+def decode(columns: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """The word list as the original list of 序号/词频/单词/释义/其他拼写/pos dicts."""
+    if columns.get("version") != VERSION:
+        raise ValueError(f"Unsupported {FORMAT} version: {columns.get('version')}")
+    count = columns["count"]
+    sequence = columns["sequence"]
+    if isinstance(sequence, dict):
+        sequence = range(sequence["start"], sequence["start"] + count)
+    if "frequency_u32" in columns:
+        frequency = struct.unpack(f"<{count}I", base64.b64decode(columns["frequency_u32"]))
+    else:
+        frequency = columns["frequency"]
+    variants = dict(zip(columns["variant"]["index"], columns["variant"]["value"]))
+    pos_values = columns["pos"]["values"]
+    pos = [pos_values[POS_CODES.index(code)] for code in columns["pos"]["codes"]]
+    return [{
+        '序号': sequence[i],
+        '词频': frequency[i],
+        '单词': word,
+        '释义': definition,
+        '其他拼写': variants.get(i),
+        'pos': pos[i]
+    } for i, (word, definition) in enumerate(zip(columns["word"], columns["definition"]))]
+
+
+def to_list_data(data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Either format as the {list name: [items]} dict that netem_full_list.json holds."""
+    if is_columnar(data):
+        return {data["list"]: decode(data)}
+    return data
+
+
+def dumps(columns: Dict[str, Any]) -> str:
+    return json.dumps(columns, ensure_ascii=False, separators=(",", ":"))
+
+
+def render_js(columns: Dict[str, Any]) -> str:
+    return f"window.{JS_GLOBAL} = {dumps(columns)};"
+
+
+def columns_path_for(json_path: str) -> str:
+    root, ext = os.path.splitext(json_path)
+    return f"{root}.columns{ext}"
+
+
+def load_word_data(json_path: str, columns_path: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Load the word list, preferring the columnar file when it was built from the current
+    json_path (its "source" hash matches); otherwise the JSON itself is parsed.
+    """
+    columns_path = columns_path or columns_path_for(json_path)
+    raw = None
+    if os.path.exists(json_path):
+        with open(json_path, "rb") as f:
+            raw = f.read()
+    if os.path.exists(columns_path):
+        with open(columns_path, "r", encoding="utf-8") as f:
+            columns = json.load(f)
+        if is_columnar(columns) and (raw is None or columns.get("source") == source_hash(raw)):
+            return to_list_data(columns)
+    if raw is None:
+        raise FileNotFoundError(json_path)
+    return to_list_data(json.loads(raw))
+
+
+def _sizes(text: str) -> str:
+    data = text.encode("utf-8")
+    sizes = [f"{len(data) / 1024:7.1f} KB", f"gzip {len(gzip.compress(data, 9)) / 1024:6.1f} KB"]
+    if brotli is not None:
+        sizes.append(f"br {len(brotli.compress(data, quality=11)) / 1024:6.1f} KB")
+    return "  ".join(sizes)
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(path: str = DEFAULT_WORDS_PATH, repeat: int = 20):
+    with open(path, "r", encoding="utf-8") as f:
+        original = f.read()
+    data = json.loads(original)
+    list_key = next(iter(data))
+    items = data[list_key]
+    variants = {
+        "current JSON (indented)": original,
+        "data_full_list.js payload": json.dumps(data, ensure_ascii=False),
+        "columnar": dumps(encode(items, list_key)),
+        "columnar + binary frequency": dumps(encode(items, list_key, binary_frequency=True)),
+    }
+    print(f"{len(items)} words from {path}")
+    for label, text in variants.items():
+        parse = _best(lambda: json.loads(text), repeat)
+        line = f"{label:<28} {_sizes(text)}  json.loads {parse * 1000:6.2f} ms"
+        if label.startswith("columnar"):
+            parsed = json.loads(text)
+            assert decode(parsed) == items
+            line += f"  + decode {_best(lambda: decode(parsed), repeat) * 1000:6.2f} ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Columnar encoding of the word list.")
+    parser.add_argument("--words", default=DEFAULT_WORDS_PATH)
+    parser.add_argument("--bench", action="store_true", help="Compare size and parse time with the current JSON")
+    parser.add_argument("--write", help="Write the columnar JSON to this path")
+    parser.add_argument("--binary-frequency", action="store_true", help="Store 词频 as base64 little-endian uint32")
+    args = parser.parse_args()
+
+    if args.write:
+        with open(args.words, "rb") as f:
+            raw = f.read()
+        data = json.loads(raw)
+        list_key = next(iter(data))
+        with open(args.write, "w", encoding="utf-8") as f:
+            f.write(dumps(encode(data[list_key], list_key, args.binary_frequency, source_hash(raw))))
+        print(f"Wrote {args.write}")
+    if args.bench:
+        bench(args.words)
+    if not (args.bench or args.write):
+        parser.print_help()
@@ -0,0 +1,300 @@
+"""
+In-memory lookup structures over the word list (netem_full_list.json).
+
+PrefixIndex: autocomplete over every 单词 and its 其他拼写 variant, ranked by 词频.
+A sorted array of lowercase terms is searched with bisect, so a prefix maps to one
+contiguous slice; short prefixes (which match hundreds of words) are memoized.
+
+BKTree: "did you mean" for misspelled input. A metric tree over the same spellings
+under Levenshtein distance; the triangle inequality prunes every subtree whose edge
+distance is outside [d - k, d + k], so only a small part of the list is compared.
+
+    python word_index.py --bench
+    python word_index.py --suggest ab
+    python word_index.py --correct abandan
+"""
+import argparse
+import bisect
+import heapq
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    from search_index import load_word_list
+except ImportError:
+    from scripts.explain_verbs.search_index import load_word_list
+
+DEFAULT_WORDS_PATH = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../netem_full_list.json"))
+MAX_SUGGESTIONS = 50
+# Prefixes up to this length get their ranked results cached
+MEMO_PREFIX_LEN = 2
+
+
+class PrefixIndex:
+    def __init__(self, items: Sequence[Dict[str, Any]]):
+        entries = []
+        for item in items:
+            word = (item.get('单词') or "").strip()
+            if not word:
+                continue
+            frequency = item.get('词频') or 0
+            entries.append((word.lower(), word, frequency, None))
+            variant = (item.get('其他拼写') or "").strip()
+            if variant and variant.lower() != word.lower():
+                entries.append((variant.lower(), word, frequency, variant))
+        entries.sort()
+        self._terms = [entry[0] for entry in entries]
+        self._entries = entries
+        self._info = {item['单词'].strip(): item for item in items if item.get('单词')}
+        self._memo: Dict[tuple, List[Dict[str, Any]]] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _range(self, prefix: str):
+        lo = bisect.bisect_left(self._terms, prefix)
+        hi = bisect.bisect_left(self._terms, prefix + "\uffff", lo)
+        return lo, hi
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Words whose spelling or variant starts with prefix, most frequent first."""
+        prefix = (prefix or "").strip().lower()
+        limit = max(1, min(limit, MAX_SUGGESTIONS))
+        if not prefix:
+            return []
+        memo_key = (prefix, limit)
+        if len(prefix) <= MEMO_PREFIX_LEN and memo_key in self._memo:
+            return [dict(entry) for entry in self._memo[memo_key]]
+
+        lo, hi = self._range(prefix)
+        best: Dict[str, tuple] = {}
+        # A word matched by both spellings is listed once, preferring its own spelling
+        for term, word, frequency, variant in self._entries[lo:hi]:
+            if word not in best or best[word][3] is not None:
+                best[word] = (term, word, frequency, variant)
+        top = heapq.nsmallest(limit, best.values(), key=lambda entry: (-entry[2], entry[0]))
+        result = [{
+            "word": word,
+            "frequency": frequency,
+            "definition": self._info[word].get('释义'),
+            "variant": variant
+        } for _, word, frequency, variant in top]
+
+        if len(prefix) <= MEMO_PREFIX_LEN:
+            self._memo[memo_key] = [dict(entry) for entry in result]
+        return result
+
+
+def _pattern_masks(pattern: str) -> Dict[str, int]:
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _distance(pattern: str, masks: Dict[str, int], text: str) -> int:
+    """Levenshtein distance with Myers' bit-parallel algorithm: one pass over text, pattern as bit masks."""
+    m = len(pattern)
+    if not m:
+        return len(text)
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    positive, negative, score = full, 0, m
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | negative
+        xh = ((((eq & positive) + positive) & full) ^ positive) | eq
+        horizontal_positive = (negative | ~(xh | positive)) & full
+        horizontal_negative = positive & xh
+        if horizontal_positive & high:
+            score += 1
+        elif horizontal_negative & high:
+            score -= 1
+        horizontal_positive = ((horizontal_positive << 1) | 1) & full
+        horizontal_negative = (horizontal_negative << 1) & full
+        positive = (horizontal_negative | ~(xv | horizontal_positive)) & full
+        negative = horizontal_positive & xv
+    return score
+
+
+def levenshtein(a: str, b: str) -> int:
+    return _distance(a, _pattern_masks(a), b)
+
+
+class BKTree:
+    """Burkhard-Keller tree over lowercase spellings; each node is [term, {distance: child}]."""
+
+    def __init__(self, items: Sequence[Dict[str, Any]]):
+        self._root = None
+        self._words: Dict[str, tuple] = {}
+        self.size = 0
+        for item in sorted(items, key=lambda item: -(item.get('词频') or 0)):
+            word = (item.get('单词') or "").strip()
+            if not word:
+                continue
+            for spelling in (word, (item.get('其他拼写') or "").strip()):
+                term = spelling.lower()
+                if term and term not in self._words:
+                    self._words[term] = (word, item.get('词频') or 0)
+                    self._add(term)
+
+    def _add(self, term: str):
+        self.size += 1
+        if self._root is None:
+            self._root = [term, {}]
+            return
+        masks = _pattern_masks(term)
+        node = self._root
+        while True:
+            distance = _distance(term, masks, node[0])
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [term, {}]
+                return
+            node = child
+
+    def __contains__(self, term: str):
+        return term.strip().lower() in self._words
+
+    def search(self, term: str, max_distance: int = 2) -> List[Dict[str, Any]]:
+        """Spellings within max_distance, closest first, then most frequent; one entry per word."""
+        term = term.strip().lower()
+        if self._root is None or not term:
+            return []
+        masks = _pattern_masks(term)
+        found: Dict[str, tuple] = {}
+        stack = [self._root]
+        while stack:
+            node_term, children = stack.pop()
+            distance = _distance(term, masks, node_term)
+            if distance <= max_distance:
+                word, frequency = self._words[node_term]
+                if word not in found or distance < found[word][0]:
+                    found[word] = (distance, -frequency, word, node_term)
+            low, high = distance - max_distance, distance + max_distance
+            stack.extend(child for edge, child in children.items() if low <= edge <= high)
+        return [{
+            "word": word,
+            "distance": distance,
+            "frequency": -negative_frequency,
+            "spelling": spelling
+        } for distance, negative_frequency, word, spelling in sorted(found.values())]
+
+
+def did_you_mean(tree: BKTree, term: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    Correction candidates for a word that is not in the list: distance 1 first, then 2.
+    Words of up to 4 letters only get distance 1, since two edits make almost anything match.
+    """
+    term = term.strip().lower()
+    if not term or term in tree:
+        return []
+    candidates = tree.search(term, 1)
+    if not candidates and len(term) > 4:
+        candidates = tree.search(term, 2)
+    return candidates[:limit]
+
+
+_lock = threading.Lock()
+_indexes: Dict[tuple, tuple] = {}
+
+
+def _shared(kind, path: str, items: Optional[Sequence[Dict[str, Any]]]):
+    mtime = os.path.getmtime(path) if os.path.exists(path) else 0
+    with _lock:
+        cached = _indexes.get((kind, path))
+        if cached and cached[0] == mtime:
+            return cached[1]
+        index = kind(items if items is not None else (load_word_list(path) if mtime else []))
+        _indexes[(kind, path)] = (mtime, index)
+        return index
+
+
+def get_prefix_index(path: str = DEFAULT_WORDS_PATH, items: Optional[Sequence[Dict[str, Any]]] = None) -> PrefixIndex:
+    """Shared index for the word list at path, rebuilt when the file changes."""
+    return _shared(PrefixIndex, path, items)
+
+
+def get_bk_tree(path: str = DEFAULT_WORDS_PATH, items: Optional[Sequence[Dict[str, Any]]] = None) -> BKTree:
+    """Shared BK-tree for the word list at path, rebuilt when the file changes."""
+    return _shared(BKTree, path, items)
+
+
+def bench(index: PrefixIndex, repeat: int = 5):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = [entry[0] for entry in index._entries]
+    sets = {
+        "1 char": list(letters),
+        "2 chars": [a + b for a in letters for b in letters],
+        "3 chars": sorted({w[:3] for w in words if len(w) >= 3}),
+        "full word": words[::5],
+    }
+    for label, prefixes in sets.items():
+        index._memo.clear()
+        start = time.perf_counter()
+        for prefix in prefixes:
+            index.suggest(prefix)
+        cold = (time.perf_counter() - start) / len(prefixes)
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for prefix in prefixes:
+                index.suggest(prefix)
+            best = min(best, (time.perf_counter() - start) / len(prefixes))
+        print(f"{label:<10} {len(prefixes):>5} prefixes  cold {cold * 1e6:7.1f} us  warm {best * 1e6:7.1f} us per lookup")
+
+
+def bench_typos(tree: BKTree, samples: int = 300):
+    """BK-tree lookups for one- and two-edit typos against a brute-force scan."""
+    rng = random.Random(0)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    terms = [term for term in tree._words if term.isalpha() and len(term) > 3]
+
+    def typo(term, edits):
+        for _ in range(edits):
+            i = rng.randrange(len(term))
+            term = term[:i] + rng.choice(letters) + term[i + 1:]
+        return term
+
+    for max_distance in (1, 2):
+        queries = [typo(rng.choice(terms), max_distance) for _ in range(samples)]
+        start = time.perf_counter()
+        hits = sum(bool(tree.search(query, max_distance)) for query in queries)
+        tree_time = (time.perf_counter() - start) / samples
+        start = time.perf_counter()
+        for query in queries[:50]:
+            masks = _pattern_masks(query)
+            [term for term in tree._words if _distance(query, masks, term) <= max_distance]
+        scan_time = (time.perf_counter() - start) / 50
+        print(f"distance <= {max_distance}: BK-tree {tree_time * 1000:6.2f} ms, linear scan {scan_time * 1000:6.2f} ms per lookup, {hits}/{samples} with candidates")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Autocomplete over the word list.")
+    parser.add_argument("--words", default=DEFAULT_WORDS_PATH)
+    parser.add_argument("--suggest", help="Print suggestions for a prefix")
+    parser.add_argument("--correct", help="Print did-you-mean candidates for a word")
+    parser.add_argument("--bench", action="store_true", help="Time prefix lookups and typo correction")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = get_prefix_index(args.words)
+    print(f"Indexed {len(index)} spellings in {(time.perf_counter() - start) * 1000:.1f} ms")
+    if args.suggest:
+        for entry in index.suggest(args.suggest):
+            variant = f" ({entry['variant']})" if entry['variant'] else ""
+            print(f"{entry['word']}{variant}  {entry['frequency']}  {entry['definition']}")
+    if args.correct:
+        for entry in get_bk_tree(args.words).search(args.correct):
+            print(f"{entry['word']}  distance {entry['distance']}  {entry['frequency']}")
+    if args.bench:
+        bench(index)
+        start = time.perf_counter()
+        tree = get_bk_tree(args.words)
+        print(f"BK-tree over {tree.size} spellings built in {(time.perf_counter() - start) * 1000:.1f} ms")
+        bench_typos(tree)
+    if not (args.suggest or args.correct or args.bench):
+        parser.print_help()
@@ -0,0 +1,388 @@
+"""
+Filter / sort engine over the word list for /api/verbs (bitmaps + precomputed sort orders).
+
+Every sort order ("rank", "frequency", "alpha", each reversible with a leading "-") is a
+permutation of the word list computed once. In each order, an attribute is a Python int
+used as a bitmap: bit i is set when the i-th word of that order has the attribute.
+
+    pos:<value>   effective POS (app.py's overrides applied), e.g. pos:verb
+    cached        a single-mode explanation exists (explanations.query_key)
+    learning      in learning_progress and not mastered
+    mastered      learning_progress.status = 'mastered'
+    due           not mastered and next_review <= now
+    excluded      in excluded_verbs
+    new           not in learning_progress
+
+A filter is a comma-separated AND of terms; a term is a '|'-separated OR of atoms, each
+optionally negated with '!':
+
+    filter=pos:verb|pos:noun_verb,!cached,!excluded   sort=frequency
+
+so a query is a handful of &, |, ~ on 5530-bit ints, a popcount for the total and a scan of
+the lowest set bits for the page. The database-backed bitmaps are reloaded only when the
+counter that triggers on explanations / learning_progress / excluded_verbs bump has moved
+(any writer, including batch_worker.py); "due" is re-derived from sorted next_review times.
+
+    python word_query.py --bench
+"""
+import argparse
+import bisect
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from array import array
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+SORTS = {
+    "rank": lambda item: item.get('序号') or 0,
+    "frequency": lambda item: (-(item.get('词频') or 0), item.get('序号') or 0),
+    "alpha": lambda item: ((item.get('单词') or "").strip().lower(), item.get('序号') or 0),
+}
+DEFAULT_SORT = "rank"
+STATE_FLAGS = ("cached", "learning", "mastered", "excluded")
+
+_STATE_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS word_state_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+    "INSERT OR IGNORE INTO word_state_version (id, version) VALUES (1, 0)",
+]
+# (trigger name suffix, event) per table; explanations only matter for membership and image_url
+_STATE_TRIGGERS = {
+    "explanations": (("insert", "INSERT"), ("delete", "DELETE"), ("image", "UPDATE OF image_url")),
+    "learning_progress": (("insert", "INSERT"), ("update", "UPDATE"), ("delete", "DELETE")),
+    "excluded_verbs": (("insert", "INSERT"), ("update", "UPDATE"), ("delete", "DELETE")),
+}
+
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:
+    def _popcount(x: int) -> int:
+        return bin(x).count("1")
+
+
+def ensure_state_triggers(conn: sqlite3.Connection):
+    """Version counter bumped by every write that can change a word's state bitmaps."""
+    for statement in _STATE_SCHEMA:
+        conn.execute(statement)
+    for table, events in _STATE_TRIGGERS.items():
+        for suffix, event in events:
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_word_state_{suffix} AFTER {event} ON {table} BEGIN
+                    UPDATE word_state_version SET version = version + 1 WHERE id = 1;
+                END
+            ''')
+
+
+def state_version(conn: sqlite3.Connection) -> Optional[int]:
+    try:
+        row = conn.execute("SELECT version FROM word_state_version WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return row[0] if row else None
+
+
+class Order:
+    """One sort order: the permutation and, per word index, its bit position (uint32 arrays)."""
+    __slots__ = ("order", "position", "bitmaps")
+
+    def __init__(self, order: Sequence[int]):
+        self.order = array('I', order)
+        self.position = array('I', bytes(4 * len(order)))
+        for bit, index in enumerate(order):
+            self.position[index] = bit
+        self.bitmaps: Dict[Any, int] = {}
+
+    def bitmap(self, indices) -> int:
+        bits = bytearray((len(self.order) + 7) // 8)
+        position = self.position
+        for index in indices:
+            bit = position[index]
+            bits[bit >> 3] |= 1 << (bit & 7)
+        return int.from_bytes(bits, "little")
+
+
+def set_bits(bitmap: int, offset: int, limit: int) -> List[int]:
+    """Positions of the set bits number offset .. offset+limit-1 (lowest first)."""
+    if offset:
+        if offset >= _popcount(bitmap):
+            return []
+        # Smallest prefix holding offset + 1 set bits; its top bit is where the page starts
+        lo, hi = 0, bitmap.bit_length()
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _popcount(bitmap & ((1 << mid) - 1)) > offset:
+                hi = mid
+            else:
+                lo = mid + 1
+        start = lo - 1
+    else:
+        start = 0
+    rest = bitmap >> start
+    found = []
+    while rest and len(found) < limit:
+        low = rest & -rest
+        bit = low.bit_length() - 1
+        found.append(start + bit)
+        rest >>= bit + 1
+        start += bit + 1
+    return found
+
+
+class WordState(NamedTuple):
+    """
+    Database-backed word state, replaced as a whole on refresh: a request that took one
+    snapshot filters and renders against it even if another request refreshes meanwhile.
+    """
+    generation: int
+    version: Optional[int]
+    flags: Dict[str, List[int]]
+    # Overlay for word_records: query_key -> image_url of every cached single explanation
+    images: Dict[str, Optional[str]]
+    due_times: List[str]
+    due_indices: List[int]
+
+
+class WordQueryEngine:
+    def __init__(self, items: Sequence[Dict[str, Any]], pos_of: Optional[Callable[[Dict[str, Any]], str]] = None):
+        # The list the engine was built from (callers rebuild when it is replaced)
+        self.source = items
+        # Not copied: a word_table.WordTable stays compact (any sequence of mappings works)
+        self.items = items
+        self.size = len(self.items)
+        self.all = (1 << self.size) - 1
+        # Content hash of the list: part of /api/verbs ETags, and cursors name a 序号 in it
+        self.tag = hashlib.sha256(json.dumps([dict(item) for item in self.items], ensure_ascii=False,
+                                             sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        # word -> its index (a tuple of indices for the few words listed more than once)
+        self.keys: Dict[str, Union[int, Tuple[int, ...]]] = {}
+        # 序号 -> index, kept only where 序号 isn't index + 1 (see rank_index)
+        self.by_rank: Dict[int, int] = {}
+        for index, item in enumerate(self.items):
+            # Interned: word_records.WordRecords keys the same words and shares these strings
+            key = sys.intern((item.get('单词') or "").strip().lower())
+            known = self.keys.get(key)
+            self.keys[key] = index if known is None else (known if isinstance(known, tuple) else (known,)) + (index,)
+            rank = item.get('序号')
+            if rank != index + 1:
+                self.by_rank.setdefault(rank, index)
+        pos_of = pos_of or (lambda item: item.get('pos') or "other")
+        pos: Dict[str, List[int]] = {}
+        for index, item in enumerate(self.items):
+            pos.setdefault(pos_of(item), []).append(index)
+        self.pos: Dict[str, array] = {value: array('I', indices) for value, indices in pos.items()}
+        base = list(range(self.size))
+        self.orders: Dict[str, Order] = {}
+        for name, key in SORTS.items():
+            ordered = sorted(base, key=lambda index: key(self.items[index]))
+            self.orders[name] = Order(ordered)
+            self.orders["-" + name] = Order(ordered[::-1])
+        self.state = WordState(0, None, {flag: [] for flag in STATE_FLAGS}, {}, [], [])
+
+    @property
+    def version(self) -> Optional[int]:
+        return self.state.version
+
+    @property
+    def images(self) -> Dict[str, Optional[str]]:
+        return self.state.images
+
+    def _indices(self, words) -> List[int]:
+        found = []
+        for word in words:
+            index = self.keys.get((word or "").strip().lower())
+            if isinstance(index, tuple):
+                found.extend(index)
+            elif index is not None:
+                found.append(index)
+        return found
+
+    def rank_index(self, rank: int) -> Optional[int]:
+        """List index of the word with this 序号 (unique in vocabulary.db)."""
+        index = self.by_rank.get(rank)
+        if index is None and isinstance(rank, int) and 0 < rank <= self.size and self.items[rank - 1].get('序号') == rank:
+            index = rank - 1
+        return index
+
+    def set_state(self, cached=(), learning=(), mastered=(), excluded=(), reviews=(), images=None,
+                  version: Optional[int] = None):
+        """
+        Word state from plain lists; reviews are (word, next_review) of words that can fall due,
+        images the stored image_url per cached key. Swaps in a new WordState.
+        """
+        schedule = sorted((next_review or "", index) for word, next_review in reviews for index in self._indices([word]))
+        self.state = WordState(
+            generation=self.state.generation + 1,
+            version=version,
+            flags={
+                "cached": self._indices(cached),
+                "learning": self._indices(learning),
+                "mastered": self._indices(mastered),
+                "excluded": self._indices(excluded),
+            },
+            images=dict(images) if images is not None else {(word or "").strip().lower(): None for word in cached},
+            due_times=[when for when, _ in schedule],
+            due_indices=[index for _, index in schedule],
+        )
+
+    def refresh(self, conn: sqlite3.Connection) -> bool:
+        """Reload the state bitmaps if the database changed since the last load; True if reloaded."""
+        version = state_version(conn)
+        if version is not None and version == self.version:
+            return False
+        c = conn.cursor()
+        images = dict(c.execute("SELECT query_key, image_url FROM explanations WHERE mode='single'").fetchall())
+        progress = c.execute("SELECT verb, status, next_review FROM learning_progress").fetchall()
+        excluded = [row[0] for row in c.execute("SELECT verb FROM excluded_verbs")]
+        self.set_state(
+            cached=list(images),
+            images=images,
+            learning=[verb for verb, status, _ in progress if status != 'mastered'],
+            mastered=[verb for verb, status, _ in progress if status == 'mastered'],
+            excluded=excluded,
+            reviews=[(verb, next_review) for verb, status, next_review in progress if status != 'mastered'],
+            version=version,
+        )
+        return True
+
+    def _state_bitmap(self, order: Order, key: tuple, state: WordState, indices) -> int:
+        # State bitmaps are cached per generation; older generations are dropped on the first miss
+        key = (state.generation,) + key
+        bitmap = order.bitmaps.get(key)
+        if bitmap is None:
+            bitmap = order.bitmap(indices)
+            kept = {k: v for k, v in order.bitmaps.items() if k[0] in ("pos", state.generation)}
+            kept[key] = bitmap
+            order.bitmaps = kept
+        return bitmap
+
+    def _atom(self, order: Order, atom: str, state: WordState, due_count: int) -> int:
+        if atom == "all":
+            return self.all
+        if atom.startswith("pos:"):
+            key = ("pos", atom[4:])
+            if key not in order.bitmaps:
+                order.bitmaps[key] = order.bitmap(self.pos.get(atom[4:], ()))
+            return order.bitmaps[key]
+        if atom in state.flags:
+            return self._state_bitmap(order, (atom,), state, state.flags[atom])
+        if atom == "new":
+            return self.all & ~(self._atom(order, "learning", state, due_count) | self._atom(order, "mastered", state, due_count))
+        if atom == "due":
+            # Valid until the next review time passes: keyed by how many reviews are due
+            return self._state_bitmap(order, ("due", due_count), state, state.due_indices[:due_count])
+        raise ValueError(f"Unknown filter term: {atom}")
+
+    def due_count(self, now: Optional[str] = None, state: Optional[WordState] = None) -> int:
+        """How many reviews are due at now; "due" results only change when this does."""
+        return bisect.bisect_right((state or self.state).due_times, now or datetime.now().isoformat())
+
+    def order(self, sort: str = DEFAULT_SORT) -> Order:
+        order = self.orders.get(sort or DEFAULT_SORT)
+        if order is None:
+            raise ValueError(f"Unknown sort: {sort} (expected one of {', '.join(sorted(self.orders))})")
+        return order
+
+    def matching(self, filter_expr: str = "", sort: str = DEFAULT_SORT, now: Optional[str] = None,
+                 state: Optional[WordState] = None) -> Tuple[Order, int]:
+        """(order, bitmap of matching words in that order) for a filter expression."""
+        order = self.order(sort)
+        state = state or self.state
+        due_count = self.due_count(now, state)
+        result = self.all
+        for term in filter(None, (part.strip() for part in (filter_expr or "").split(","))):
+            alternatives = 0
+            for atom in filter(None, (part.strip() for part in term.split("|"))):
+                negate = atom.startswith("!")
+                bitmap = self._atom(order, atom.lstrip("!").strip().lower(), state, due_count)
+                alternatives |= (self.all & ~bitmap) if negate else bitmap
+            result &= alternatives
+        return order, result
+
+    def page_indices(self, filter_expr: str = "", sort: str = DEFAULT_SORT, offset: int = 0, limit: int = 50,
+                     after: Optional[int] = None, now: Optional[str] = None,
+                     state: Optional[WordState] = None) -> Tuple[int, List[int], bool]:
+        """
+        (total matches, list indices of one page, whether more follow). With after (a 序号, the
+        keyset cursor) the page starts behind that word in the sort order instead of at offset,
+        so words that change state between requests don't shift the pages.
+        """
+        order, bitmap = self.matching(filter_expr, sort, now, state)
+        total = _popcount(bitmap)
+        rest = bitmap
+        if after is not None:
+            index = self.rank_index(after)
+            if index is None:
+                raise ValueError(f"Unknown cursor position: {after}")
+            rest &= ~((1 << (order.position[index] + 1)) - 1)
+        bits = set_bits(rest, max(0, offset), max(0, limit))
+        more = bool(bits) and bool(rest >> (bits[-1] + 1))
+        return total, [order.order[bit] for bit in bits], more
+
+    def page(self, filter_expr: str = "", sort: str = DEFAULT_SORT, offset: int = 0, limit: int = 50,
+             after: Optional[int] = None, now: Optional[str] = None) -> Tuple[int, List[Dict[str, Any]], bool]:
+        """page_indices() with the items themselves."""
+        total, indices, more = self.page_indices(filter_expr, sort, offset, limit, after, now)
+        return total, [self.items[index] for index in indices], more
+
+    def query(self, filter_expr: str = "", sort: str = DEFAULT_SORT, offset: int = 0, limit: int = 50,
+              now: Optional[str] = None) -> Tuple[int, List[Dict[str, Any]]]:
+        """(total matches, the items of one page)."""
+        total, items, _ = self.page(filter_expr, sort, offset, limit, now=now)
+        return total, items
+
+
+def bench(engine: WordQueryEngine, queries: Sequence[Tuple[str, str]], repeat: int = 1000):
+    """Per-query timings against a linear scan + sort of the same list (POS-only filters)."""
+    for filter_expr, sort in queries:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            total, page = engine.query(filter_expr, sort, 0, 50)
+        elapsed = (time.perf_counter() - start) / repeat * 1e6
+        start = time.perf_counter()
+        for _ in range(max(1, repeat // 20)):
+            terms = [term.split("|") for term in filter_expr.split(",") if term]
+            pos = {index: (item.get('pos') or "other") for index, item in enumerate(engine.items)}
+            matches = [index for index in range(engine.size)
+                       if all(any(("pos:" + pos[index]) == atom for atom in alts) for alts in terms)]
+            sorted(matches, key=lambda index: SORTS[sort.lstrip("-")](engine.items[index]), reverse=sort.startswith("-"))[:50]
+        scan = (time.perf_counter() - start) / max(1, repeat // 20) * 1e6
+        print(f"filter={filter_expr or '-':<32} sort={sort:<11} {total:>5} matches  {elapsed:8.1f} µs  (scan + sort {scan:8.1f} µs)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bitmap filter / sort engine over the word list.")
+    parser.add_argument("--bench", action="store_true", help="Time some filter/sort combinations")
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--sort", default=DEFAULT_SORT)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    try:
+        from vocabulary_db import load_items
+    except ImportError:
+        from scripts.explain_verbs.vocabulary_db import load_items
+    start = time.perf_counter()
+    engine = WordQueryEngine(load_items())
+    print(f"Engine over {engine.size} words built in {(time.perf_counter() - start) * 1000:.1f} ms")
+    db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "verbs.db")
+    if os.path.exists(db_path):
+        conn = sqlite3.connect(db_path)
+        engine.refresh(conn)
+        conn.close()
+
+    if args.bench:
+        bench(engine, [("", "rank"), ("pos:verb|pos:noun_verb", "-frequency"), ("pos:noun", "alpha"),
+                       ("pos:adj_adv|pos:other", "-rank")])
+    else:
+        total, page = engine.query(args.filter, args.sort, 0, args.limit)
+        print(f"{total} matches")
+        for item in page:
+            print(f"  {item['序号']:>5} {item['单词']:<20} {item['词频']:>6} {item.get('pos')}")
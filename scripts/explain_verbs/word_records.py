@@ -0,0 +1,121 @@
+"""
+Immutable, precomputed word records for /api/verbs, composed with a per-request state overlay.
+
+Built once per loaded word list:
+
+    pos           per word, the pos with app.py's KNOWN_* overrides applied; record(i) is the
+                  item as a read-only mapping with that pos, built on demand (no per-word copies
+                  are kept, so a compact word_table.WordTable source stays compact)
+    fragments     per requested field set, each record's static fields pre-serialized as JSON
+                  ('"序号":1,"词频":86015,...'), built on first use
+    image urls    per image setting (provider, key, model), the generated fallback URL of every
+                  word, built on first use
+
+Fragments and URLs are kept as word_table.TextColumn (one UTF-8 blob per column, not 5530
+str objects) and decoded per rendered record.
+
+What changes between requests (which words have a cached explanation, and its image_url) is
+not written into the records: it comes in as an overlay mapping {query_key: image_url}, here
+WordQueryEngine.state.images. A page is rendered by joining those strings, with no dict copies and no
+per-item json.dumps; nothing shared is mutated, so concurrent requests can't race.
+"""
+import json
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    from word_table import TextColumn
+except ImportError:
+    from scripts.explain_verbs.word_table import TextColumn
+
+STATIC_FIELDS = ('序号', '词频', '单词', '释义', '其他拼写', 'pos')
+DYNAMIC_FIELDS = ('has_cache', 'image_url')
+FIELDS = STATIC_FIELDS + DYNAMIC_FIELDS
+_MISSING = object()
+MAX_FIELD_SETS = 16
+
+
+# Same output as Starlette's JSONResponse (one encoder: json.dumps with options builds one per call)
+_json: Callable[[Any], str] = json.JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode
+
+
+class WordRecords:
+    def __init__(self, items: Sequence[Dict[str, Any]], pos_of: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None):
+        # The list the records were built from (callers rebuild when it is replaced)
+        self.source = items
+        pos_of = pos_of or (lambda item: item.get('pos'))
+        self.pos: Tuple[Optional[str], ...] = tuple(pos_of(item) for item in items)
+        # Interned, so these are the same strings as WordQueryEngine.keys
+        self.keys: Tuple[Optional[str], ...] = tuple(
+            sys.intern(item['单词'].strip().lower()) if '单词' in item else None for item in items)
+        self._fragments: Dict[Tuple[str, ...], TextColumn] = {}
+        self._images: Dict[Hashable, TextColumn] = {}
+
+    def record(self, index: int) -> Mapping[str, Any]:
+        """The item at index with the static fields only and pos resolved, read-only."""
+        item = self.source[index]
+        record = {field: item[field] for field in STATIC_FIELDS if field in item}
+        pos = self.pos[index]
+        if pos is not None or 'pos' in item:
+            record['pos'] = pos
+        return MappingProxyType(record)
+
+    def fragments(self, fields: Sequence[str]) -> TextColumn:
+        """Per record, its static fields (in the order asked for) as JSON object members."""
+        wanted = tuple(field for field in fields if field in STATIC_FIELDS)
+        cached = self._fragments.get(wanted)
+        if cached is None:
+            cached = TextColumn(
+                ",".join(f"{_json(field)}:{_json(record[field])}" for field in wanted if field in record)
+                for record in map(self.record, range(len(self.source))))
+            # fields= comes from clients: bound the number of field sets kept
+            if len(self._fragments) >= MAX_FIELD_SETS:
+                self._fragments.clear()
+            self._fragments[wanted] = cached
+        return cached
+
+    def generated_images(self, setting: Hashable, image_url: Callable[[str], str]) -> TextColumn:
+        """
+        Per record, the generated image URL under one image setting (image_url(key) computes it),
+        already JSON-encoded.
+        """
+        cached = self._images.get(setting)
+        if cached is None:
+            cached = TextColumn(_json(image_url(key) if key is not None else None) for key in self.keys)
+            # Settings change rarely; keep only the current and the previous one
+            if len(self._images) > 1:
+                self._images.clear()
+            self._images[setting] = cached
+        return cached
+
+    def render(self, indices: Iterable[int], fields: Sequence[str], overlay: Mapping[str, Optional[str]],
+               images: Optional[TextColumn] = None) -> str:
+        """
+        JSON array of the records at indices, with the fields asked for. overlay maps the
+        query_key of every cached word to its stored image_url; images are the generated
+        fallbacks (generated_images), needed when image_url is asked for.
+        """
+        static = self.fragments(fields)
+        # Joined as UTF-8 slices of the columns and decoded once
+        blob, offsets = static.blob, static.offsets
+        keys = self.keys
+        dynamic = [field for field in fields if field in DYNAMIC_FIELDS]
+        parts: List[bytes] = []
+        for index in indices:
+            members = blob[offsets[index]:offsets[index + 1]]
+            if dynamic:
+                stored = overlay.get(keys[index], _MISSING) if keys[index] is not None else _MISSING
+                extra = []
+                for field in dynamic:
+                    if field == 'has_cache':
+                        extra.append(b'"has_cache":false' if stored is _MISSING else b'"has_cache":true')
+                    elif stored is not _MISSING and stored:
+                        extra.append(b'"image_url":' + _json(stored).encode("utf-8"))
+                    elif images:
+                        extra.append(b'"image_url":' + images.blob[images.offsets[index]:images.offsets[index + 1]])
+                    else:
+                        extra.append(b'"image_url":null')
+                members = b",".join([members] + extra) if members else b",".join(extra)
+            parts.append(b"{" + members + b"}")
+        return (b"[" + b",".join(parts) + b"]").decode("utf-8")
@@ -0,0 +1,212 @@
+"""
+Compact in-memory word list: the loaded list as a handful of columns instead of 5530 dicts.
+
+json.load (and vocabulary_db.load_items) gives one dict per word, each with its own hash
+table and its own int / str objects: about 2.7 MB of small objects in every worker process.
+WordTable keeps the same data as
+
+    序号, 词频      array('i') columns
+    单词, 释义      one UTF-8 bytes blob per column + array('I') offsets
+    其他拼写        sparse {index: str} (only 154 words have one)
+    pos            one byte per word indexing a tuple of the distinct values
+
+and behaves like the list it replaces: len(), iteration, table[i] and slices give read-only
+row mappings (WordRow) with ['单词'] / .get('pos') / dict(row). Values are decoded on access.
+
+Sharing across forked workers: CPython writes into every object it touches (reference
+counts), so a page holding a dict or a str stops being shared as soon as a worker reads it.
+A blob or an array is one object whose contents are never written, so the pages stay shared
+between workers that fork after loading (app.preload_verbs_data, gunicorn --preload).
+
+    python word_table.py --memory      # tracemalloc: raw json.load list vs WordTable
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+FIELDS = ('序号', '词频', '单词', '释义', '其他拼写', 'pos')
+DEFAULT_WORDS_PATH = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../netem_full_list.json"))
+
+
+class TextColumn:
+    """Strings (or None) packed into one UTF-8 blob; decoded on access."""
+    __slots__ = ("blob", "offsets", "nulls")
+
+    def __init__(self, values: Iterable[Optional[str]]):
+        parts: List[bytes] = []
+        offsets = array('I', [0])
+        nulls = []
+        end = 0
+        for index, value in enumerate(values):
+            if value is None:
+                nulls.append(index)
+            else:
+                data = value.encode("utf-8")
+                parts.append(data)
+                end += len(data)
+            offsets.append(end)
+        self.blob = b"".join(parts)
+        self.offsets = offsets
+        self.nulls = frozenset(nulls)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if self.nulls and index in self.nulls:
+            return None
+        offsets = self.offsets
+        return self.blob[offsets[index]:offsets[index + 1]].decode("utf-8")
+
+
+class WordTable(Sequence):
+    """The word list as columns; a drop-in for the list of dicts wherever items are only read."""
+
+    def __init__(self, items: Iterable[Mapping[str, Any]]):
+        items = list(items)
+        self.ranks = array('i', (item.get('序号') or 0 for item in items))
+        self.frequencies = array('i', (item.get('词频') or 0 for item in items))
+        self.words = TextColumn(item.get('单词') for item in items)
+        self.definitions = TextColumn(item.get('释义') for item in items)
+        self.variants: Dict[int, str] = {
+            index: sys.intern(item['其他拼写']) for index, item in enumerate(items) if item.get('其他拼写')}
+        values: Dict[Optional[str], int] = {}
+        codes = bytearray()
+        for item in items:
+            codes.append(values.setdefault(item.get('pos'), len(values)))
+        self.pos_values: Tuple[Optional[str], ...] = tuple(values)
+        self.pos_codes = bytes(codes)
+
+    def __len__(self) -> int:
+        return len(self.ranks)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [WordRow(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("word index out of range")
+        return WordRow(self, index)
+
+    def __iter__(self) -> Iterator["WordRow"]:
+        for index in range(len(self)):
+            yield WordRow(self, index)
+
+    def value(self, index: int, field: str) -> Any:
+        if field == '单词':
+            return self.words[index]
+        if field == '序号':
+            return self.ranks[index]
+        if field == '词频':
+            return self.frequencies[index]
+        if field == 'pos':
+            return self.pos_values[self.pos_codes[index]]
+        if field == '释义':
+            return self.definitions[index]
+        if field == '其他拼写':
+            return self.variants.get(index)
+        raise KeyError(field)
+
+    def to_items(self) -> List[Dict[str, Any]]:
+        """The list of dicts again (for writers that mutate or re-serialize the list)."""
+        return [dict(row) for row in self]
+
+
+class WordRow(Mapping):
+    """One word of a WordTable, read-only; compares equal to the dict it was built from."""
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: WordTable, index: int):
+        self.table = table
+        self.index = index
+
+    def __getitem__(self, field: str) -> Any:
+        return self.table.value(self.index, field)
+
+    def __contains__(self, field) -> bool:
+        return field in FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __repr__(self) -> str:
+        return f"WordRow({dict(self)!r})"
+
+
+def compact(data: Mapping[str, Sequence[Mapping[str, Any]]]) -> Dict[str, WordTable]:
+    """{list name: items} (load_word_data's shape) with every list as a WordTable."""
+    return {key: items if isinstance(items, WordTable) else WordTable(items) for key, items in data.items()}
+
+
+def _traced(build) -> Tuple[Any, int]:
+    """(result of build(), bytes it still holds once built), measured with tracemalloc."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = build()
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    held = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return result, held
+
+
+def memory_report(path: str = DEFAULT_WORDS_PATH):
+    """
+    Bytes held by the list as json.load returns it and as a WordTable; then by what /api/verbs
+    keeps per worker on top of each (WordQueryEngine, WordRecords and the default fragments).
+    """
+    try:
+        from word_query import WordQueryEngine
+        from word_records import FIELDS as RECORD_FIELDS, WordRecords
+    except ImportError:
+        from scripts.explain_verbs.word_query import WordQueryEngine
+        from scripts.explain_verbs.word_records import FIELDS as RECORD_FIELDS, WordRecords
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    def load():
+        data = json.loads(raw)
+        return data[next(iter(data))]
+
+    def view(items):
+        records = WordRecords(items)
+        records.fragments(RECORD_FIELDS)
+        return items, WordQueryEngine(items), records
+
+    items, raw_size = _traced(load)
+    table, table_size = _traced(lambda: WordTable(load()))
+    assert table.to_items() == items
+    count = len(items)
+    del items, table
+    _, raw_view = _traced(lambda: view(load()))
+    _, table_view = _traced(lambda: view(WordTable(load())))
+    print(f"{count} words from {path}")
+    print(f"  json.load list of dicts          {raw_size / 1024:8.1f} KB")
+    print(f"  WordTable                        {table_size / 1024:8.1f} KB  ({table_size / raw_size:.0%})")
+    print(f"  list of dicts + engine + records {raw_view / 1024:8.1f} KB")
+    print(f"  WordTable + engine + records     {table_view / 1024:8.1f} KB  ({table_view / raw_view:.0%})")
+    return raw_size, table_size
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compact in-memory word list.")
+    parser.add_argument("--words", default=DEFAULT_WORDS_PATH)
+    parser.add_argument("--memory", action="store_true", help="Compare the memory held by the raw list and a WordTable")
+    args = parser.parse_args()
+
+    if args.memory:
+        memory_report(args.words)
+    else:
+        parser.print_help()
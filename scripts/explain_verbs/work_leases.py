@@ -0,0 +1,70 @@
+import sqlite3
+import time
+from typing import List, Sequence, Tuple
+
+# Seconds a claimed word stays reserved before another process may take it over
+LEASE_TTL = 900
+
+
+def ensure_lease_table(conn: sqlite3.Connection):
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS generation_leases (
+            query_key TEXT PRIMARY KEY,
+            owner TEXT NOT NULL,
+            run_id TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            done INTEGER DEFAULT 0
+        )
+    ''')
+    conn.commit()
+
+
+def claim(conn: sqlite3.Connection, owner: str, run_id: str, keys: Sequence[str], start: int, limit: int,
+          skip_cached: bool = True, ttl: float = LEASE_TTL) -> Tuple[List[str], int]:
+    """
+    Reserves up to `limit` keys from keys[start:] for `owner`.
+
+    A key is claimable when nobody holds a live lease on it, it was not already finished
+    in this run, and (with skip_cached) it has no cached explanation yet. Returns the
+    claimed keys and the index to resume scanning from.
+    """
+    now = time.time()
+    claimed = []
+    pos = start
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # Reclaim work from crashed processes and forget finished work from older runs
+        conn.execute("DELETE FROM generation_leases WHERE done=0 AND expires_at < ?", (now,))
+        conn.execute("DELETE FROM generation_leases WHERE done=1 AND run_id != ?", (run_id,))
+
+        if skip_cached:
+            sql = """
+                INSERT OR IGNORE INTO generation_leases (query_key, owner, run_id, expires_at)
+                SELECT ?, ?, ?, ?
+                WHERE NOT EXISTS (SELECT 1 FROM explanations WHERE mode='single' AND query_key=?)
+            """
+        else:
+            sql = "INSERT OR IGNORE INTO generation_leases (query_key, owner, run_id, expires_at) VALUES (?, ?, ?, ?)"
+
+        while pos < len(keys) and len(claimed) < limit:
+            key = keys[pos]
+            params = (key, owner, run_id, now + ttl, key) if skip_cached else (key, owner, run_id, now + ttl)
+            if conn.execute(sql, params).rowcount == 1:
+                claimed.append(key)
+            pos += 1
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return claimed, pos
+
+
+def mark_done(conn: sqlite3.Connection, run_id: str, keys: Sequence[str]):
+    """Marks leases finished without committing, so it can share the caller's write transaction."""
+    conn.executemany("UPDATE generation_leases SET done=1 WHERE query_key=? AND run_id=?", [(k, run_id) for k in keys])
+
+
+def release(conn: sqlite3.Connection, owner: str, keys: Sequence[str]):
+    """Gives unfinished keys back, e.g. when a process is interrupted."""
+    conn.executemany("DELETE FROM generation_leases WHERE query_key=? AND owner=? AND done=0", [(k, owner) for k in keys])
+    conn.commit()
@@ -1,58 +1,47 @@
-import os
+import argparse
 import json
-import nltk
-from nltk.corpus import wordnet as wn
-
-# Ensure wordnet is downloaded
-try:
-    # Check if 'wordnet' resource is available
-    nltk.data.find('corpora/wordnet.zip')
-except LookupError:
-    nltk.download('wordnet')
-    nltk.download('omw-1.4')
-
-def is_verb(word):
-    """Check if a word is primarily a verb using WordNet."""
-    synsets = wn.synsets(word, pos=wn.VERB)
-    return len(synsets) > 0
+import os
+import sys
 
-def main():
-    # Get the directory of the current script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    # Construct path relative to script directory
-    # Script is in scripts/generate-doc/
-    # JSON is in root/netem_full_list.json
-    input_file = os.path.join(script_dir, '../../netem_full_list.json')
-    output_file = os.path.join(script_dir, '../../netem_verbs.json')
+# The verbs list is the `verbs` view of vocabulary.db (pos verb / noun_verb, by frequency).
+# netem_verbs.json is no longer kept in the repo; this writes it out for tools that still want a file.
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(script_dir, '../explain_verbs'))
 
-    try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except FileNotFoundError:
-        print(f"Error: File {input_file} not found.")
-        return
+from vocabulary_db import LIST_KEY, count, export_view, load_items
 
-    # Extract the list of words
-    # The JSON structure is {"5530考研词汇词频排序表": [...]}
-    key = list(data.keys())[0]
-    word_list = data[key]
+def is_verb(word, features):
+    """Check if a word has WordNet verb senses (lexical feature cache)."""
+    entry = features.get(word.strip().lower())
+    return bool(entry and entry.verb)
 
-    verbs = []
-    for item in word_list:
-        word = item.get('单词', '').lower()
-        if word and is_verb(word):
-            verbs.append(item)
+def export_wordnet_verbs(output_file):
+    """The original filter: every word with a WordNet verb synset, regardless of its pos column."""
+    from lexical_features import ensure_features
 
-    # Sort by frequency (descending)
-    # The original list is sorted by frequency, but let's ensure it.
+    word_list = load_items()
+    features = ensure_features(item['单词'] for item in word_list)
+    verbs = [item for item in word_list if is_verb(item['单词'], features)]
     verbs.sort(key=lambda x: x.get('词频', 0), reverse=True)
-
-    # Save to JSON
-    output_data = {f"{key} (Verbs Only)": verbs}
     with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+        json.dump({f"{LIST_KEY} (Verbs Only)": verbs}, f, ensure_ascii=False, indent=2)
+    return len(verbs)
+
+def main():
+    parser = argparse.ArgumentParser(description="Write netem_verbs.json from vocabulary.db.")
+    parser.add_argument('--wordnet', action='store_true', help="Select words with WordNet verb senses instead of the verbs view")
+    args = parser.parse_args()
+
+    # Script is in scripts/generate-doc/, output goes to root/netem_verbs.json
+    output_file = os.path.join(script_dir, '../../netem_verbs.json')
+
+    try:
+        n = export_wordnet_verbs(output_file) if args.wordnet else export_view('verbs', output_file)
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        return
 
-    print(f"Filtered {len(verbs)} verbs from {len(word_list)} words.")
+    print(f"Filtered {n} verbs from {count('words')} words.")
     print(f"Saved to {output_file}")
 
 if __name__ == "__main__":
@@ -1,13 +1,13 @@
 import json
 import os
 
+from scripts.explain_verbs.asset_build import PRECACHED_DATA_ASSETS, STATIC_DEV, STATIC_TARGETS, brotli, describe, publish, unpublish
+from scripts.explain_verbs import word_columns
+
 # Define source and target paths
 # We use the Dev static file as the source of truth
 SOURCE_JSON = os.path.join("scripts", "explain_verbs", "static", "netem_full_list.json")
 
-# Targets for the JS wrapper file
-TARGET_JS_DEV = os.path.join("scripts", "explain_verbs", "static", "js", "data_full_list.js")
-TARGET_JS_DIST = os.path.join("dist", "static", "js", "data_full_list.js")
 
 def main():
     print(f"Reading source: {SOURCE_JSON}")
@@ -16,24 +16,33 @@ def main():
         return
 
     try:
-        with open(SOURCE_JSON, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        # Create JS content
-        # window.NETEM_FULL_LIST = { ... }
-        js_content = f"window.NETEM_FULL_LIST = {json.dumps(data, ensure_ascii=False)};"
-        
-        targets = [TARGET_JS_DEV, TARGET_JS_DIST]
-        
-        for target in targets:
+        with open(SOURCE_JSON, 'rb') as f:
+            raw = f.read()
+        data = json.loads(raw)
+
+        # Columnar form (parallel arrays, see word_columns.py): what index.html loads
+        list_key = next(iter(data))
+        columns = word_columns.encode(data[list_key], list_key, source=word_columns.source_hash(raw))
+        columns_json = word_columns.dumps(columns).encode('utf-8')
+        columns_js = word_columns.render_js(columns).encode('utf-8')
+        if brotli is None:
+            print("Note: brotli not installed, writing gzip siblings only")
+
+        for static_dir in STATIC_TARGETS:
             try:
-                os.makedirs(os.path.dirname(target), exist_ok=True)
-                with open(target, 'w', encoding='utf-8') as f:
-                    f.write(js_content)
-                print(f"✅ Generated: {target} ({len(js_content)} bytes)")
+                # Plain name + content-hashed copy + .gz/.br, recorded in asset-manifest.json.
+                # js/data_full_list.js (the list as inline JSON) is superseded by the columnar JS
+                unpublish(static_dir, "js/data_full_list.js")
+                # The dev copy is the source itself, so it is hashed as-is and never rewritten.
+                # Only the columnar JS index.html loads is precached; the JSON forms are LocalAPI fallbacks
+                entry = publish(static_dir, "netem_full_list.json", raw, keep_plain=static_dir != STATIC_DEV, precache=False)
+                print(f"✅ Generated: {os.path.join(static_dir, 'netem_full_list.json')} -> {describe(entry)}")
+                for logical, content in (("netem_full_list.columns.json", columns_json), ("js/data_full_list_columns.js", columns_js)):
+                    entry = publish(static_dir, logical, content, precache=logical in PRECACHED_DATA_ASSETS)
+                    print(f"✅ Generated: {os.path.join(static_dir, logical)} -> {describe(entry)}")
             except Exception as e:
-                print(f"❌ Failed to write {target}: {e}")
-                
+                print(f"❌ Failed to write {static_dir}: {e}")
+
     except Exception as e:
         print(f"Error processing full list: {e}")
 